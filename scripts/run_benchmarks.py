@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Run the load-test benchmark suite against the in-process Bedrock stub.
+
+Measures throughput, p50/p99 latency, peak thread count and peak memory of
+LLMManager.converse, ParallelLLMManager.converse_parallel and LLMManager.converse_stream
+at several concurrency levels, without AWS credentials or network access. The stub
+simulates lognormal latency and a small throttling rate, seeded for reproducibility.
+
+    python scripts/run_benchmarks.py --output benchmarks/0.9.0.json
+    python scripts/run_benchmarks.py --output current.json --baseline benchmarks/0.9.0.json
+
+Exit code 0 = no regressions beyond the tolerance; 1 = at least one regression.
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+from bestehorn_llmmanager.bedrock.testing import (
+    BenchmarkReport,
+    LatencyDistribution,
+    LoadBenchmark,
+    StubBedrockConfig,
+    StubRegionBehavior,
+    default_scenarios,
+)
+
+
+def build_config(latency_ms: float, throttle_rate: float, seed: int) -> StubBedrockConfig:
+    """Build the stub configuration used for benchmark runs."""
+    return StubBedrockConfig(
+        default_behavior=StubRegionBehavior(
+            latency=LatencyDistribution.lognormal(median_ms=latency_ms, sigma=0.4),
+            throttle_rate=throttle_rate,
+        ),
+        stream_chunk_latency=LatencyDistribution.fixed(value_ms=latency_ms / 20),
+        seed=seed,
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the suite, save the report and compare it with a baseline."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--output", type=Path, required=True, help="JSON report to write")
+    parser.add_argument("--baseline", type=Path, help="Report to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="Allowed degradation")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--requests", type=int, default=200, help="Requests per scenario")
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="Median stub latency")
+    parser.add_argument("--throttle-rate", type=float, default=0.02)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--no-memory", action="store_true", help="Skip tracemalloc")
+    args = parser.parse_args(argv)
+
+    # Injected throttling is expected; keep retry warnings out of the report output
+    logging.getLogger("bestehorn_llmmanager").setLevel(logging.ERROR)
+
+    benchmark = LoadBenchmark(
+        config=build_config(
+            latency_ms=args.latency_ms, throttle_rate=args.throttle_rate, seed=args.seed
+        ),
+        track_memory=not args.no_memory,
+    )
+    report = benchmark.run(
+        scenarios=default_scenarios(concurrency_levels=args.concurrency, requests=args.requests)
+    )
+    report.save(path=args.output)
+
+    for result in report.results:
+        print(
+            f"{result.scenario:<16} {result.throughput_rps:9.1f} rps  "
+            f"p50 {result.latency_p50_ms:8.1f} ms  p99 {result.latency_p99_ms:8.1f} ms  "
+            f"threads {result.peak_thread_count:4d}  mem {result.peak_memory_bytes / 1024:8.0f} KiB"
+        )
+
+    if args.baseline is None:
+        return 0
+
+    regressions = report.compare(
+        baseline=BenchmarkReport.load(path=args.baseline), tolerance=args.tolerance
+    )
+    for regression in regressions:
+        print(
+            f"REGRESSION {regression.scenario} {regression.metric}: "
+            f"{regression.baseline:.1f} -> {regression.current:.1f} "
+            f"({regression.relative_change:+.0%})"
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
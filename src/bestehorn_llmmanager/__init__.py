@@ -37,6 +37,13 @@ For detailed documentation, see the documentation in the docs/ directory.
 
 # Region utilities
 from .bedrock.discovery import BedrockRegionDiscovery
+
+# Request-path instrumentation (spans and metrics)
+from .bedrock.instrumentation import (
+    InstrumentationListener,
+    register_instrumentation_listener,
+    unregister_instrumentation_listener,
+)
 from .bedrock.models.aws_regions import AWSRegions, get_all_regions
 
 # Prompt-cache typed reference + cache-point factory (issue #39)
@@ -61,10 +68,13 @@ from .bedrock.models.reasoning_content import ReasoningContent
 # Structured output (outputConfig.textFormat json_schema) helper
 from .bedrock.models.structured_output import build_json_schema_output_config
 
-# Tool use (function calling) typed request object
-from .bedrock.models.tool_use import ToolUse
+# Tool use (function calling) typed request object and tool-loop results
+from .bedrock.models.tool_use import ToolCallResult, ToolLoopResult, ToolUse
 from .bedrock.tracking.parameter_compatibility_tracker import ParameterCompatibilityTracker
 
+# Multi-turn conversations with rolling prompt caching
+from .conversation_session import ConversationSession
+
 # Package metadata
 from .llm_manager import LLMManager
 
@@ -87,6 +97,9 @@ from .message_builder_enums import (
 )
 from .parallel_llm_manager import ParallelLLMManager
 
+# Tool-use loop with concurrent tool execution
+from .tool_loop import run_tool_loop
+
 __author__ = "LLMManager Development Team"
 __description__ = "AWS Bedrock Converse API Management Library with MessageBuilder"
 __license__ = "MIT"
@@ -108,6 +121,7 @@ __all__ = [
     # Core classes
     "LLMManager",
     "ParallelLLMManager",
+    "ConversationSession",
     # Configuration
     "Boto3Config",
     # MessageBuilder components
@@ -128,6 +142,9 @@ __all__ = [
     "ResponseContentType",
     # Tool use (function calling)
     "ToolUse",
+    "run_tool_loop",
+    "ToolLoopResult",
+    "ToolCallResult",
     # Reasoning / extended thinking
     "ReasoningContent",
     # Document citations
@@ -145,4 +162,8 @@ __all__ = [
     "ModelSpecificConfig",
     # Advanced: Parameter compatibility tracking
     "ParameterCompatibilityTracker",
+    # Instrumentation
+    "InstrumentationListener",
+    "register_instrumentation_listener",
+    "unregister_instrumentation_listener",
 ]
@@ -0,0 +1,17 @@
+"""
+Batch module for LLM Manager system.
+Provides resumable, checkpointed execution of JSONL request files.
+"""
+
+from .batch_checkpoint import BatchCheckpoint
+from .batch_constants import BatchConfig, BatchFields
+from .batch_structures import BatchProgress
+from .jsonl_batch_runner import JSONLBatchRunner
+
+__all__ = [
+    "JSONLBatchRunner",
+    "BatchCheckpoint",
+    "BatchProgress",
+    "BatchConfig",
+    "BatchFields",
+]
@@ -0,0 +1,186 @@
+"""
+Checkpoint of completed requests for resumable batch runs.
+
+The checkpoint is an append-only text file with one ``<status>\\t<request_id>`` line per
+finished request. It holds only IDs, so it stays small even when the output file holds
+gigabytes of responses, and it is loaded into memory once when a run resumes.
+"""
+
+import logging
+import os
+from pathlib import Path
+from typing import Dict, Optional, TextIO, Union
+
+from ..bedrock.exceptions.batch_exceptions import BatchCheckpointError
+from .batch_constants import BatchConfig, BatchErrorMessages, BatchLogMessages, CheckpointStatus
+from .jsonl_files import truncate_incomplete_tail
+
+
+class BatchCheckpoint:
+    """
+    Append-only record of the requests a batch run has finished.
+
+    Entries are flushed to the OS after every write, so they survive a crash of the
+    process. Forcing them to stable storage is left to the caller via :meth:`sync`,
+    because the results an entry refers to must be synced first. A crash in the middle
+    of a write leaves at most one partial line, which is discarded on the next load.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """
+        Initialize the checkpoint.
+
+        Args:
+            path: Path of the checkpoint file (created on first write)
+        """
+        self._logger = logging.getLogger(__name__)
+        self._path = Path(path)
+        self._statuses: Dict[str, str] = {}
+        self._handle: Optional[TextIO] = None
+
+    @property
+    def path(self) -> Path:
+        """Path of the checkpoint file."""
+        return self._path
+
+    def load(self) -> int:
+        """
+        Load existing checkpoint entries from disk.
+
+        A later entry for the same request ID overrides an earlier one, so a request
+        that failed and succeeded on a resumed run counts as succeeded.
+
+        Returns:
+            Number of distinct requests recorded in the checkpoint
+
+        Raises:
+            BatchCheckpointError: If the checkpoint file cannot be read
+        """
+        try:
+            removed = truncate_incomplete_tail(path=self._path)
+            if removed:
+                self._logger.warning(
+                    BatchLogMessages.PARTIAL_LINE_TRUNCATED.format(
+                        byte_count=removed, path=self._path
+                    )
+                )
+
+            if self._path.exists():
+                with open(self._path, encoding=BatchConfig.FILE_ENCODING) as handle:
+                    for line in handle:
+                        status, separator, request_id = line.rstrip("\n").partition(
+                            CheckpointStatus.SEPARATOR
+                        )
+                        if separator and request_id:
+                            self._statuses[request_id] = status
+        except OSError as e:
+            raise BatchCheckpointError(
+                message=BatchErrorMessages.CHECKPOINT_READ_FAILED.format(error=str(e)),
+                checkpoint_path=str(self._path),
+            ) from e
+
+        return len(self._statuses)
+
+    def is_finished(self, request_id: str, include_failed: bool = True) -> bool:
+        """
+        Check whether a request needs no further execution.
+
+        Args:
+            request_id: ID of the request
+            include_failed: Whether requests that finished with a failure count as finished
+
+        Returns:
+            True if the request should be skipped
+        """
+        status = self._statuses.get(request_id)
+        if status is None:
+            return False
+        return include_failed or status == CheckpointStatus.SUCCEEDED
+
+    def contains(self, request_id: str) -> bool:
+        """
+        Check whether the checkpoint has any entry for a request.
+
+        Args:
+            request_id: ID of the request
+
+        Returns:
+            True if the request has been recorded
+        """
+        return request_id in self._statuses
+
+    def record(self, request_id: str, success: bool) -> None:
+        """
+        Append the outcome of a finished request.
+
+        Args:
+            request_id: ID of the finished request
+            success: Whether the request succeeded
+
+        Raises:
+            BatchCheckpointError: If the entry cannot be written
+        """
+        status = CheckpointStatus.SUCCEEDED if success else CheckpointStatus.FAILED
+        try:
+            if self._handle is None:
+                self._path.parent.mkdir(parents=True, exist_ok=True)
+                self._handle = open(self._path, "a", encoding=BatchConfig.FILE_ENCODING)
+            self._handle.write(f"{status}{CheckpointStatus.SEPARATOR}{request_id}\n")
+            self._handle.flush()
+        except OSError as e:
+            raise BatchCheckpointError(
+                message=BatchErrorMessages.CHECKPOINT_WRITE_FAILED.format(error=str(e)),
+                checkpoint_path=str(self._path),
+            ) from e
+
+        self._statuses[request_id] = status
+
+    def sync(self) -> None:
+        """
+        Force written entries to stable storage.
+
+        Raises:
+            BatchCheckpointError: If the entries cannot be synced
+        """
+        if self._handle is None:
+            return
+        try:
+            os.fsync(self._handle.fileno())
+        except OSError as e:
+            raise BatchCheckpointError(
+                message=BatchErrorMessages.CHECKPOINT_WRITE_FAILED.format(error=str(e)),
+                checkpoint_path=str(self._path),
+            ) from e
+
+    def close(self) -> None:
+        """Sync and close the checkpoint file."""
+        if self._handle is not None:
+            self.sync()
+            self._handle.close()
+            self._handle = None
+
+    def get_succeeded_count(self) -> int:
+        """
+        Get the number of requests recorded as succeeded.
+
+        Returns:
+            Number of succeeded requests
+        """
+        return sum(1 for status in self._statuses.values() if status == CheckpointStatus.SUCCEEDED)
+
+    def get_failed_count(self) -> int:
+        """
+        Get the number of requests whose latest entry is a failure.
+
+        Returns:
+            Number of failed requests
+        """
+        return len(self._statuses) - self.get_succeeded_count()
+
+    def __len__(self) -> int:
+        """Return the number of distinct recorded requests."""
+        return len(self._statuses)
+
+    def __repr__(self) -> str:
+        """Return string representation of the checkpoint."""
+        return f"BatchCheckpoint(path='{self._path}', entries={len(self._statuses)})"
@@ -0,0 +1,68 @@
+"""
+Constants for JSONL batch processing in LLM Manager system.
+Defines record field names, checkpoint format, defaults and log messages.
+"""
+
+from typing import Final
+
+
+class BatchFields:
+    """Field names of the JSONL output records."""
+
+    REQUEST_ID: Final[str] = "request_id"
+    LINE_NUMBER: Final[str] = "line_number"
+    RESPONSE: Final[str] = "response"
+
+
+class CheckpointStatus:
+    """Status markers stored per request in the checkpoint file."""
+
+    SUCCEEDED: Final[str] = "S"
+    FAILED: Final[str] = "F"
+    SEPARATOR: Final[str] = "\t"
+
+
+class BatchConfig:
+    """Default configuration values for batch processing."""
+
+    CHECKPOINT_SUFFIX: Final[str] = ".checkpoint"
+    GENERATED_REQUEST_ID_PREFIX: Final[str] = "line-"
+    DEFAULT_PROGRESS_INTERVAL_SECONDS: Final[float] = 30.0
+    DEFAULT_FSYNC_EVERY: Final[int] = 100
+    FILE_ENCODING: Final[str] = "utf-8"
+    TAIL_READ_BYTES: Final[int] = 1024 * 1024
+
+
+class BatchLogMessages:
+    """Logging message constants for batch processing."""
+
+    BATCH_STARTED: Final[str] = (
+        "Starting batch run: input={input_path}, output={output_path}, "
+        "already completed={completed}"
+    )
+    BATCH_PROGRESS: Final[str] = (
+        "Batch progress: {completed} completed ({succeeded} ok, {failed} failed), "
+        "{skipped} skipped, {throughput:.2f} req/s, ETA {eta}"
+    )
+    BATCH_COMPLETED: Final[str] = (
+        "Batch run completed: {completed} completed ({succeeded} ok, {failed} failed), "
+        "{skipped} skipped in {elapsed:.1f}s"
+    )
+    PARTIAL_LINE_TRUNCATED: Final[str] = (
+        "Truncated incomplete trailing record ({byte_count} bytes) from {path}"
+    )
+    OUTPUT_RECORD_RECOVERED: Final[str] = (
+        "Recovered checkpoint entry for request '{request_id}' from output file"
+    )
+
+
+class BatchErrorMessages:
+    """Error message constants for batch processing."""
+
+    INVALID_JSON: Final[str] = "Invalid JSON on line {line_number}: {error}"
+    INVALID_RECORD: Final[str] = "Invalid request record on line {line_number}: {error}"
+    NOT_AN_OBJECT: Final[str] = "Line {line_number} is not a JSON object"
+    CHECKPOINT_READ_FAILED: Final[str] = "Failed to read checkpoint file: {error}"
+    CHECKPOINT_WRITE_FAILED: Final[str] = "Failed to write checkpoint file: {error}"
+    INPUT_NOT_FOUND: Final[str] = "Batch input file not found: {path}"
+    SAME_INPUT_AND_OUTPUT: Final[str] = "Batch input and output must be different files"
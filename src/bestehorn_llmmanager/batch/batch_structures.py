@@ -0,0 +1,79 @@
+"""
+Data structures for JSONL batch processing.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+
+@dataclass
+class BatchProgress:
+    """
+    Progress of a batch run.
+
+    Attributes:
+        completed: Requests finished in this run (succeeded + failed)
+        succeeded: Requests that succeeded in this run
+        failed: Requests that failed in this run after all retries
+        skipped: Input records skipped because the checkpoint marks them finished
+        elapsed_seconds: Wall-clock time since the run started
+        remaining_estimate: Estimated requests still to execute, if the input was counted
+    """
+
+    completed: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    skipped: int = 0
+    elapsed_seconds: float = 0.0
+    remaining_estimate: Optional[int] = None
+
+    @property
+    def throughput_per_second(self) -> float:
+        """Requests completed per second in this run."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.completed / self.elapsed_seconds
+
+    @property
+    def eta_seconds(self) -> Optional[float]:
+        """Estimated seconds until the run completes, or None if unknown."""
+        if self.remaining_estimate is None:
+            return None
+        if self.remaining_estimate == 0:
+            return 0.0
+        throughput = self.throughput_per_second
+        if throughput <= 0:
+            return None
+        return self.remaining_estimate / throughput
+
+    def format_eta(self) -> str:
+        """
+        Format the ETA as ``H:MM:SS``.
+
+        Returns:
+            Formatted ETA, or "unknown" if it cannot be estimated
+        """
+        eta = self.eta_seconds
+        if eta is None:
+            return "unknown"
+        minutes, seconds = divmod(int(eta), 60)
+        hours, minutes = divmod(minutes, 60)
+        return f"{hours}:{minutes:02d}:{seconds:02d}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to dictionary for serialization.
+
+        Returns:
+            Dictionary representation of the progress
+        """
+        return {
+            "completed": self.completed,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "skipped": self.skipped,
+            "elapsed_seconds": self.elapsed_seconds,
+            "remaining_estimate": self.remaining_estimate,
+            "throughput_per_second": self.throughput_per_second,
+            "eta_seconds": self.eta_seconds,
+        }
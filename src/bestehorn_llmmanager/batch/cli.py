@@ -0,0 +1,130 @@
+"""
+Command-line interface for resumable JSONL batch runs.
+
+Usage:
+    bestehorn-llmmanager-batch requests.jsonl responses.jsonl \\
+        --model "Claude 3 Haiku" --region us-east-1 --region us-west-2
+
+    python -m bestehorn_llmmanager.batch ...  (equivalent)
+
+Re-running the same command after a crash or interrupt resumes from the checkpoint.
+Exit status is 0 when every request succeeded, 1 when some requests failed and 2 when
+the run could not complete.
+"""
+
+import argparse
+import logging
+import sys
+from typing import List, Optional
+
+from ..bedrock.exceptions.llm_manager_exceptions import LLMManagerError
+from ..bedrock.models.parallel_structures import ParallelProcessingConfig
+from ..parallel_llm_manager import ParallelLLMManager
+from .batch_constants import BatchConfig
+from .jsonl_batch_runner import JSONLBatchRunner
+
+EXIT_SUCCESS = 0
+EXIT_REQUEST_FAILURES = 1
+EXIT_ERROR = 2
+
+
+def build_argument_parser() -> argparse.ArgumentParser:
+    """
+    Build the argument parser of the batch CLI.
+
+    Returns:
+        Configured ArgumentParser
+    """
+    parser = argparse.ArgumentParser(
+        prog="bestehorn-llmmanager-batch",
+        description="Execute a JSONL file of Bedrock Converse requests with checkpointing.",
+    )
+    parser.add_argument("input", help="JSONL file of BedrockConverseRequest records")
+    parser.add_argument("output", help="JSONL file results are appended to")
+    parser.add_argument(
+        "--model", dest="models", action="append", required=True, help="Model name (repeatable)"
+    )
+    parser.add_argument(
+        "--region", dest="regions", action="append", required=True, help="AWS region (repeatable)"
+    )
+    parser.add_argument("--checkpoint", help="Checkpoint file (default: <output>.checkpoint)")
+    parser.add_argument(
+        "--max-concurrent", type=int, default=None, help="Maximum concurrent requests"
+    )
+    parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        default=None,
+        help="Maximum requests executing or awaiting retry (default: --max-concurrent)",
+    )
+    parser.add_argument(
+        "--target-regions", type=int, default=None, help="Target regions per request"
+    )
+    parser.add_argument(
+        "--retry-failed",
+        action="store_true",
+        help="Execute requests that failed in an earlier run again",
+    )
+    parser.add_argument(
+        "--progress-interval",
+        type=float,
+        default=BatchConfig.DEFAULT_PROGRESS_INTERVAL_SECONDS,
+        help="Seconds between progress reports",
+    )
+    parser.add_argument(
+        "--fsync-every",
+        type=int,
+        default=BatchConfig.DEFAULT_FSYNC_EVERY,
+        help="Results between fsync calls on output and checkpoint",
+    )
+    parser.add_argument("--log-level", default="INFO", help="Logging level (default: INFO)")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the batch CLI.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+
+    Returns:
+        Process exit status
+    """
+    args = build_argument_parser().parse_args(argv)
+    logging.basicConfig(
+        level=args.log_level.upper(), format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+    )
+
+    try:
+        parallel_config = (
+            ParallelProcessingConfig(max_concurrent_requests=args.max_concurrent)
+            if args.max_concurrent is not None
+            else None
+        )
+        parallel_manager = ParallelLLMManager(
+            models=args.models,
+            regions=args.regions,
+            parallel_config=parallel_config,
+            log_level=args.log_level.upper(),
+        )
+        runner = JSONLBatchRunner(
+            parallel_manager=parallel_manager,
+            input_path=args.input,
+            output_path=args.output,
+            checkpoint_path=args.checkpoint,
+            retry_failed=args.retry_failed,
+            max_in_flight=args.max_in_flight,
+            target_regions_per_request=args.target_regions,
+            progress_interval_seconds=args.progress_interval,
+            fsync_every=args.fsync_every,
+        )
+        progress = runner.run()
+    except LLMManagerError as e:
+        print(f"Batch run failed: {e}", file=sys.stderr)
+        return EXIT_ERROR
+    except KeyboardInterrupt:
+        print("Batch run interrupted; re-run the same command to resume.", file=sys.stderr)
+        return EXIT_ERROR
+
+    return EXIT_REQUEST_FAILURES if progress.failed else EXIT_SUCCESS
@@ -0,0 +1,437 @@
+"""
+Resumable JSONL batch runner for ParallelLLMManager.
+
+Streams ``BedrockConverseRequest`` records from a JSONL input file through
+``ParallelLLMManager.converse_parallel_iter`` and appends each result to a JSONL output
+file as soon as it completes. A compact checkpoint of finished request IDs lets a crashed
+or interrupted run resume without re-executing (and paying for) finished requests.
+"""
+
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, TextIO, Union
+
+from ..bedrock.exceptions.batch_exceptions import BatchInputError, BatchProcessingError
+from ..bedrock.models.bedrock_response import BedrockResponse
+from ..bedrock.models.llm_manager_structures import ResponseValidationConfig
+from ..bedrock.models.model_specific_structures import ModelSpecificConfig
+from ..bedrock.models.parallel_constants import ParallelProcessingFields
+from ..bedrock.models.parallel_structures import BedrockConverseRequest
+from ..parallel_llm_manager import ParallelLLMManager
+from .batch_checkpoint import BatchCheckpoint
+from .batch_constants import BatchConfig, BatchErrorMessages, BatchFields, BatchLogMessages
+from .batch_structures import BatchProgress
+from .jsonl_files import read_last_line, truncate_incomplete_tail
+
+
+class JSONLBatchRunner:
+    """
+    Execute a JSONL file of requests with checkpointing and progress reporting.
+
+    Input: one JSON object per line in the format of ``BedrockConverseRequest.to_dict()``.
+    Records without a ``request_id`` get the deterministic ID ``line-<line number>`` so
+    that resumed runs recognize them. Blank lines are ignored.
+
+    Output: one JSON object per finished request, appended in completion order::
+
+        {"request_id": ..., "line_number": ..., "response": BedrockResponse.to_dict()}
+
+    Each result is written to the output before its checkpoint entry, and both files are
+    fsync'ed together every ``fsync_every`` results, so a finished request is never lost
+    and is re-executed at most once after a crash. Failed requests are recorded too;
+    pass ``retry_failed=True`` to execute them again on a resumed run (their new result
+    is appended, so the last record per request ID wins).
+
+    Example:
+        >>> manager = ParallelLLMManager(models=["Claude 3 Haiku"], regions=["us-east-1"])
+        >>> runner = JSONLBatchRunner(
+        ...     parallel_manager=manager,
+        ...     input_path="requests.jsonl",
+        ...     output_path="responses.jsonl",
+        ... )
+        >>> progress = runner.run()
+        >>> print(progress.succeeded, progress.failed)
+    """
+
+    def __init__(
+        self,
+        parallel_manager: ParallelLLMManager,
+        input_path: Union[str, Path],
+        output_path: Union[str, Path],
+        checkpoint_path: Optional[Union[str, Path]] = None,
+        retry_failed: bool = False,
+        max_in_flight: Optional[int] = None,
+        target_regions_per_request: Optional[int] = None,
+        response_validation_config: Optional[ResponseValidationConfig] = None,
+        model_specific_config: Optional[ModelSpecificConfig] = None,
+        progress_interval_seconds: float = BatchConfig.DEFAULT_PROGRESS_INTERVAL_SECONDS,
+        progress_callback: Optional[Callable[[BatchProgress], None]] = None,
+        fsync_every: int = BatchConfig.DEFAULT_FSYNC_EVERY,
+        count_input_records: bool = True,
+    ) -> None:
+        """
+        Initialize the batch runner.
+
+        Args:
+            parallel_manager: ParallelLLMManager used to execute the requests
+            input_path: JSONL file of request records
+            output_path: JSONL file results are appended to
+            checkpoint_path: Checkpoint file (defaults to output path + ".checkpoint")
+            retry_failed: Whether requests that failed in an earlier run are executed again
+            max_in_flight: Maximum requests executing or awaiting retry at once
+            target_regions_per_request: Target number of regions per request
+            response_validation_config: Optional validation configuration for responses
+            model_specific_config: Optional model-specific configuration for all requests
+            progress_interval_seconds: Seconds between progress reports
+            progress_callback: Optional callable receiving each progress report
+            fsync_every: Number of results between fsync calls on output and checkpoint
+            count_input_records: Whether to count input records up front to estimate an ETA
+
+        Raises:
+            BatchProcessingError: If the configuration is invalid
+        """
+        self._input_path = Path(input_path)
+        self._output_path = Path(output_path)
+        if self._input_path.resolve() == self._output_path.resolve():
+            raise BatchProcessingError(message=BatchErrorMessages.SAME_INPUT_AND_OUTPUT)
+        if fsync_every <= 0:
+            raise BatchProcessingError(message=f"fsync_every must be positive, got: {fsync_every}")
+
+        self._logger = logging.getLogger(__name__)
+        self._parallel_manager = parallel_manager
+        self._checkpoint = BatchCheckpoint(
+            path=(
+                Path(checkpoint_path)
+                if checkpoint_path is not None
+                else Path(f"{self._output_path}{BatchConfig.CHECKPOINT_SUFFIX}")
+            )
+        )
+        self._retry_failed = retry_failed
+        self._max_in_flight = max_in_flight
+        self._target_regions_per_request = target_regions_per_request
+        self._response_validation_config = response_validation_config
+        self._model_specific_config = model_specific_config
+        self._progress_interval_seconds = progress_interval_seconds
+        self._progress_callback = progress_callback
+        self._fsync_every = fsync_every
+        self._count_input_records = count_input_records
+
+        # Line numbers of requests handed to the manager and not yet finished.
+        self._pending_line_numbers: Dict[str, int] = {}
+
+    def get_checkpoint(self) -> BatchCheckpoint:
+        """
+        Get the checkpoint used by this runner.
+
+        Returns:
+            BatchCheckpoint instance
+        """
+        return self._checkpoint
+
+    def run(self) -> BatchProgress:
+        """
+        Execute all unfinished requests of the input file.
+
+        Returns:
+            Final BatchProgress of this run
+
+        Raises:
+            BatchInputError: If an input record is invalid (raised when it is reached)
+            BatchProcessingError: If the input file is missing or files cannot be written
+            ParallelExecutionError: If the manager's failure handling strategy stops execution
+        """
+        if not self._input_path.exists():
+            raise BatchProcessingError(
+                message=BatchErrorMessages.INPUT_NOT_FOUND.format(path=self._input_path)
+            )
+
+        self._recover_files()
+        previously_finished = (
+            len(self._checkpoint)
+            if not self._retry_failed
+            else self._checkpoint.get_succeeded_count()
+        )
+        total_records = self._count_records() if self._count_input_records else None
+
+        progress = BatchProgress()
+        self._logger.info(
+            BatchLogMessages.BATCH_STARTED.format(
+                input_path=self._input_path,
+                output_path=self._output_path,
+                completed=previously_finished,
+            )
+        )
+
+        start_time = time.monotonic()
+        last_report = start_time
+        stream = self._parallel_manager.converse_parallel_iter(
+            requests=self._iter_requests(progress=progress),
+            target_regions_per_request=self._target_regions_per_request,
+            response_validation_config=self._response_validation_config,
+            model_specific_config=self._model_specific_config,
+            max_in_flight=self._max_in_flight,
+        )
+
+        output = self._open_output()
+        try:
+            for request_id, response in stream:
+                self._write_result(output=output, request_id=request_id, response=response)
+                self._checkpoint.record(request_id=request_id, success=response.success)
+
+                progress.completed += 1
+                if response.success:
+                    progress.succeeded += 1
+                else:
+                    progress.failed += 1
+                if progress.completed % self._fsync_every == 0:
+                    self._sync(output=output)
+
+                now = time.monotonic()
+                if now - last_report >= self._progress_interval_seconds:
+                    self._update_timing(
+                        progress=progress,
+                        elapsed=now - start_time,
+                        total_records=total_records,
+                        previously_finished=previously_finished,
+                    )
+                    self._report_progress(progress=progress)
+                    last_report = now
+        finally:
+            stream.close()
+            try:
+                self._sync(output=output)
+            finally:
+                output.close()
+                self._checkpoint.close()
+
+        self._update_timing(
+            progress=progress,
+            elapsed=time.monotonic() - start_time,
+            total_records=total_records,
+            previously_finished=previously_finished,
+        )
+        if self._progress_callback is not None:
+            self._progress_callback(progress)
+        self._logger.info(
+            BatchLogMessages.BATCH_COMPLETED.format(
+                completed=progress.completed,
+                succeeded=progress.succeeded,
+                failed=progress.failed,
+                skipped=progress.skipped,
+                elapsed=progress.elapsed_seconds,
+            )
+        )
+        return progress
+
+    def _recover_files(self) -> None:
+        """
+        Bring output and checkpoint into a consistent state after a crash.
+
+        Removes partially written trailing records, loads the checkpoint, and records the
+        last output result in the checkpoint if the process died between writing the
+        result and its checkpoint entry.
+        """
+        removed = truncate_incomplete_tail(path=self._output_path)
+        if removed:
+            self._logger.warning(
+                BatchLogMessages.PARTIAL_LINE_TRUNCATED.format(
+                    byte_count=removed, path=self._output_path
+                )
+            )
+
+        self._checkpoint.load()
+
+        last_line = read_last_line(path=self._output_path)
+        if last_line is None:
+            return
+        try:
+            record = json.loads(last_line)
+            request_id = record[BatchFields.REQUEST_ID]
+            success = bool(record[BatchFields.RESPONSE].get("success", False))
+        except (ValueError, KeyError, TypeError, AttributeError):
+            return
+
+        if not self._checkpoint.contains(request_id=request_id):
+            self._checkpoint.record(request_id=request_id, success=success)
+            self._checkpoint.sync()
+            self._logger.info(
+                BatchLogMessages.OUTPUT_RECORD_RECOVERED.format(request_id=request_id)
+            )
+
+    def _count_records(self) -> int:
+        """
+        Count non-blank input records.
+
+        Returns:
+            Number of non-blank lines in the input file
+        """
+        with open(self._input_path, "rb") as handle:
+            return sum(1 for line in handle if line.strip())
+
+    def _iter_requests(self, progress: BatchProgress) -> Iterator[BedrockConverseRequest]:
+        """
+        Lazily parse input records, skipping requests the checkpoint marks finished.
+
+        Args:
+            progress: Progress whose skipped counter is updated
+
+        Yields:
+            BedrockConverseRequest objects still to execute
+
+        Raises:
+            BatchInputError: If a record is not valid JSON or not a valid request
+        """
+        with open(self._input_path, encoding=BatchConfig.FILE_ENCODING) as handle:
+            for line_number, line in enumerate(handle, start=1):
+                if not line.strip():
+                    continue
+
+                data = self._parse_record(line=line, line_number=line_number)
+                request_id = data.get(ParallelProcessingFields.REQUEST_ID)
+                if request_id is None:
+                    request_id = f"{BatchConfig.GENERATED_REQUEST_ID_PREFIX}{line_number}"
+                request_id = str(request_id)
+
+                if self._checkpoint.is_finished(
+                    request_id=request_id, include_failed=not self._retry_failed
+                ):
+                    progress.skipped += 1
+                    continue
+
+                data[ParallelProcessingFields.REQUEST_ID] = request_id
+                try:
+                    request = BedrockConverseRequest.from_dict(data=data)
+                except (KeyError, TypeError, ValueError) as e:
+                    raise BatchInputError(
+                        message=BatchErrorMessages.INVALID_RECORD.format(
+                            line_number=line_number, error=repr(e)
+                        ),
+                        file_path=str(self._input_path),
+                        line_number=line_number,
+                    ) from e
+
+                self._pending_line_numbers[request_id] = line_number
+                yield request
+
+    def _parse_record(self, line: str, line_number: int) -> Dict[str, Any]:
+        """
+        Parse one input line into a record dictionary.
+
+        Args:
+            line: Raw input line
+            line_number: 1-based line number
+
+        Returns:
+            Parsed record
+
+        Raises:
+            BatchInputError: If the line is not a JSON object
+        """
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise BatchInputError(
+                message=BatchErrorMessages.INVALID_JSON.format(line_number=line_number, error=e),
+                file_path=str(self._input_path),
+                line_number=line_number,
+            ) from e
+
+        if not isinstance(data, dict):
+            raise BatchInputError(
+                message=BatchErrorMessages.NOT_AN_OBJECT.format(line_number=line_number),
+                file_path=str(self._input_path),
+                line_number=line_number,
+            )
+        return data
+
+    def _open_output(self) -> TextIO:
+        """
+        Open the output file for appending.
+
+        Returns:
+            Text handle positioned at the end of the output file
+
+        Raises:
+            BatchProcessingError: If the file cannot be opened
+        """
+        try:
+            self._output_path.parent.mkdir(parents=True, exist_ok=True)
+            return open(self._output_path, "a", encoding=BatchConfig.FILE_ENCODING)
+        except OSError as e:
+            raise BatchProcessingError(
+                message=f"Failed to open batch output file: {e}",
+                details={"output_path": str(self._output_path)},
+            ) from e
+
+    def _write_result(self, output: TextIO, request_id: str, response: BedrockResponse) -> None:
+        """
+        Append one result record to the output and flush it to the OS.
+
+        Args:
+            output: Output file handle
+            request_id: ID of the finished request
+            response: Final response of the request
+        """
+        record = {
+            BatchFields.REQUEST_ID: request_id,
+            BatchFields.LINE_NUMBER: self._pending_line_numbers.pop(request_id, None),
+            BatchFields.RESPONSE: response.to_dict(),
+        }
+        output.write(json.dumps(obj=record, ensure_ascii=False, default=str) + "\n")
+        output.flush()
+
+    def _sync(self, output: TextIO) -> None:
+        """
+        Force results and then their checkpoint entries to stable storage.
+
+        Args:
+            output: Output file handle
+        """
+        output.flush()
+        os.fsync(output.fileno())
+        self._checkpoint.sync()
+
+    def _update_timing(
+        self,
+        progress: BatchProgress,
+        elapsed: float,
+        total_records: Optional[int],
+        previously_finished: int,
+    ) -> None:
+        """
+        Update elapsed time and remaining estimate of the progress.
+
+        Args:
+            progress: Progress to update
+            elapsed: Seconds since the run started
+            total_records: Number of input records, if counted
+            previously_finished: Requests finished before this run started
+        """
+        progress.elapsed_seconds = elapsed
+        if total_records is not None:
+            progress.remaining_estimate = max(
+                total_records - previously_finished - progress.completed, 0
+            )
+
+    def _report_progress(self, progress: BatchProgress) -> None:
+        """
+        Log a progress report and pass it to the progress callback.
+
+        Args:
+            progress: Current progress
+        """
+        self._logger.info(
+            BatchLogMessages.BATCH_PROGRESS.format(
+                completed=progress.completed,
+                succeeded=progress.succeeded,
+                failed=progress.failed,
+                skipped=progress.skipped,
+                throughput=progress.throughput_per_second,
+                eta=progress.format_eta(),
+            )
+        )
+        if self._progress_callback is not None:
+            self._progress_callback(progress)
@@ -0,0 +1,94 @@
+"""
+Crash-recovery helpers for append-only JSONL files.
+
+A process killed while appending to a JSONL file can leave a partially written last
+record. These helpers detect and remove such a tail and read the last complete record
+without scanning the whole file.
+"""
+
+import os
+from pathlib import Path
+from typing import Optional
+
+from .batch_constants import BatchConfig
+
+
+def truncate_incomplete_tail(path: Path) -> int:
+    """
+    Remove a trailing record that is not terminated by a newline.
+
+    Args:
+        path: Path of the append-only file
+
+    Returns:
+        Number of bytes removed (0 if the file is absent, empty or complete)
+    """
+    if not path.exists():
+        return 0
+
+    size = path.stat().st_size
+    if size == 0:
+        return 0
+
+    with open(path, "rb+") as handle:
+        handle.seek(size - 1)
+        if handle.read(1) == b"\n":
+            return 0
+
+        # Walk back in blocks until the last newline is found.
+        position = size
+        keep = 0
+        while position > 0:
+            block_start = max(0, position - BatchConfig.TAIL_READ_BYTES)
+            handle.seek(block_start)
+            block = handle.read(position - block_start)
+            newline_index = block.rfind(b"\n")
+            if newline_index != -1:
+                keep = block_start + newline_index + 1
+                break
+            position = block_start
+
+        handle.truncate(keep)
+        handle.flush()
+        os.fsync(handle.fileno())
+
+    return size - keep
+
+
+def read_last_line(path: Path) -> Optional[str]:
+    """
+    Read the last complete line of a file without reading the whole file.
+
+    Args:
+        path: Path of the file
+
+    Returns:
+        Last newline-terminated line without its terminator, or None if there is none
+    """
+    if not path.exists():
+        return None
+
+    size = path.stat().st_size
+    if size == 0:
+        return None
+
+    with open(path, "rb") as handle:
+        handle.seek(size - 1)
+        if handle.read(1) != b"\n":
+            return None
+
+        chunks = []
+        position = size - 1
+        while position > 0:
+            block_start = max(0, position - BatchConfig.TAIL_READ_BYTES)
+            handle.seek(block_start)
+            block = handle.read(position - block_start)
+            newline_index = block.rfind(b"\n")
+            if newline_index != -1:
+                chunks.append(block[newline_index + 1 :])
+                break
+            chunks.append(block)
+            position = block_start
+
+    line = b"".join(reversed(chunks))
+    return line.decode(BatchConfig.FILE_ENCODING) if line.strip() else None
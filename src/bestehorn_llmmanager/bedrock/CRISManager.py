@@ -260,9 +260,15 @@ class CRISManager:
         """
         self._logger.info("Refreshing CRIS data via HTML parsing")
 
-        # Step 1: Download documentation if needed
+        # Step 1: Download documentation if needed; unchanged documentation reuses the JSON
         if force_download or not self._is_html_file_recent():
-            self._download_documentation()
+            if not self._download_documentation():
+                cached_catalog = self.load_cached_data()
+                if cached_catalog is not None:
+                    self._logger.info(
+                        CRISLogMessages.CATALOG_REUSED.format(file_path=self.json_output_path)
+                    )
+                    return cached_catalog
 
         # Step 2: Parse the HTML documentation
         models_dict = self._parse_documentation()
@@ -272,6 +278,8 @@ class CRISManager:
 
         # Step 4: Save to JSON
         self._save_catalog_to_json(catalog=catalog)
+        # Only now may a 304 reuse the JSON for this download
+        self._downloader.save_validators(output_path=self.html_output_path)
 
         # Step 5: Cache and return
         self._cached_catalog = catalog
@@ -458,19 +466,25 @@ class CRISManager:
         model_info = self._cached_catalog.cris_models[model_name]
         return model_info.get_destinations_for_source(source_region=source_region)
 
-    def _download_documentation(self) -> None:
+    def _download_documentation(self) -> bool:
         """
         Download the HTML documentation from AWS.
 
+        Returns:
+            True if new documentation was saved, False if the saved copy is unchanged
+
         Raises:
             NetworkError: If download fails
             FileSystemError: If file operations fail
         """
         self._logger.info(CRISLogMessages.DOWNLOAD_STARTED)
-        self._downloader.download(url=self.documentation_url, output_path=self.html_output_path)
+        modified = self._downloader.download(
+            url=self.documentation_url, output_path=self.html_output_path, defer_validators=True
+        )
         self._logger.info(
             CRISLogMessages.DOWNLOAD_COMPLETED.format(file_path=self.html_output_path)
         )
+        return modified
 
     def _parse_documentation(self) -> Dict[str, CRISModelInfo]:
         """
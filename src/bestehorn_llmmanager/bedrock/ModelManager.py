@@ -56,7 +56,7 @@ from typing import Dict, Optional
 
 from .downloaders.base_downloader import FileSystemError, NetworkError
 from .downloaders.html_downloader import HTMLDocumentationDownloader
-from .models.constants import FilePaths, URLs
+from .models.constants import FilePaths, LogMessages, URLs
 from .models.data_structures import BedrockModelInfo, ModelCatalog
 from .parsers.base_parser import ParsingError
 from .parsers.enhanced_bedrock_parser import EnhancedBedrockHTMLParser
@@ -164,6 +164,10 @@ class ModelManager:
         4. Saves the data to JSON format
         5. Returns the parsed catalog
 
+        The download is conditional on the validators of the previous download; if the
+        documentation is unchanged, the previously saved JSON catalog is reused without
+        parsing the HTML again.
+
         Args:
             force_download: If True, always download fresh data. If False, use existing
                           HTML file if it exists and is recent (less than 1 hour old)
@@ -177,7 +181,13 @@ class ModelManager:
         try:
             # Step 1: Download documentation if needed
             if force_download or not self._is_html_file_recent():
-                self._download_documentation()
+                if not self._download_documentation():
+                    cached_catalog = self.load_cached_data()
+                    if cached_catalog is not None:
+                        self._logger.info(
+                            LogMessages.CATALOG_REUSED.format(file_path=self.json_output_path)
+                        )
+                        return cached_catalog
 
             # Step 2: Parse the HTML documentation
             models_dict = self._parse_documentation()
@@ -187,6 +197,8 @@ class ModelManager:
 
             # Step 4: Save to JSON
             self._save_catalog_to_json(catalog=catalog)
+            # Only now may a 304 reuse the JSON for this download
+            self._downloader.save_validators(output_path=self.html_output_path)
 
             # Step 5: Cache and return
             self._cached_catalog = catalog
@@ -208,12 +220,11 @@ class ModelManager:
             return None
 
         try:
-            # Load data from file - in production, this would reconstruct the ModelCatalog
-            self._serializer.load_from_file(input_path=self.json_output_path)
-            # Here you would reconstruct the ModelCatalog from the JSON data
-            # This is a simplified version - in production you'd want proper deserialization
+            data = self._serializer.load_from_file(input_path=self.json_output_path)
+            catalog = ModelCatalog.from_dict(data=data)
+            self._cached_catalog = catalog
             self._logger.info(f"Loaded cached data from {self.json_output_path}")
-            return None  # Placeholder - would return reconstructed catalog
+            return catalog
         except Exception as e:
             self._logger.warning(f"Failed to load cached data: {str(e)}")
             return None
@@ -284,15 +295,20 @@ class ModelManager:
 
         return self._cached_catalog.model_count
 
-    def _download_documentation(self) -> None:
+    def _download_documentation(self) -> bool:
         """
         Download the HTML documentation from AWS.
 
+        Returns:
+            True if new documentation was saved, False if the saved copy is unchanged
+
         Raises:
             NetworkError: If download fails
             FileSystemError: If file operations fail
         """
-        self._downloader.download(url=self.documentation_url, output_path=self.html_output_path)
+        return self._downloader.download(
+            url=self.documentation_url, output_path=self.html_output_path, defer_validators=True
+        )
 
     def _parse_documentation(self) -> Dict[str, BedrockModelInfo]:
         """
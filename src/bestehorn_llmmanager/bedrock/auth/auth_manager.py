@@ -10,6 +10,8 @@ import boto3
 from botocore.exceptions import ClientError, NoCredentialsError, ProfileNotFound
 
 from ..exceptions.llm_manager_exceptions import AuthenticationError
+from ..instrumentation.instrumentation_registry import instrument_span
+from ..models.instrumentation_constants import InstrumentationAttributes, InstrumentationSpanNames
 from ..models.llm_manager_constants import LLMManagerErrorMessages, LLMManagerLogMessages
 from ..models.llm_manager_structures import AuthConfig, AuthenticationType, Boto3Config
 
@@ -276,62 +278,96 @@ class AuthManager:
         Returns:
             Bedrock runtime client
 
+        Raises:
+            AuthenticationError: If client creation fails
+        """
+        with instrument_span(
+            name=InstrumentationSpanNames.CLIENT_ACQUISITION,
+            attributes={InstrumentationAttributes.REGION: region},
+        ):
+            try:
+                session = self.get_session(region=region)
+                client = session.client(
+                    "bedrock-runtime",
+                    region_name=region,
+                    config=self._botocore_config,
+                )
+
+                # Test that we can access Bedrock in this region
+                self._test_bedrock_access(client=client, region=region)
+
+                return client
+
+            except Exception as e:
+                if isinstance(e, AuthenticationError):
+                    raise
+                raise AuthenticationError(
+                    message=f"Failed to create Bedrock client: {str(e)}",
+                    auth_type=self._auth_config.auth_type.value,
+                    region=region,
+                ) from e
+
+    def get_bedrock_control_client(self, region: str) -> Any:
+        """
+        Get a Bedrock control plane client for the specified region.
+
+        This is different from get_bedrock_client() which returns a bedrock-runtime
+        client. The control plane client is used for management operations like
+        ListInferenceProfiles, GetInferenceProfile, and other API operations.
+
+        Args:
+            region: AWS region for the client
+
+        Returns:
+            Bedrock control plane client
+
         Raises:
             AuthenticationError: If client creation fails
         """
         try:
             session = self.get_session(region=region)
             client = session.client(
-                "bedrock-runtime",
+                "bedrock",
                 region_name=region,
                 config=self._botocore_config,
             )
-
-            # Test that we can access Bedrock in this region
-            self._test_bedrock_access(client=client, region=region)
-
             return client
 
         except Exception as e:
             if isinstance(e, AuthenticationError):
                 raise
             raise AuthenticationError(
-                message=f"Failed to create Bedrock client: {str(e)}",
+                message=f"Failed to create Bedrock control plane client: {str(e)}",
                 auth_type=self._auth_config.auth_type.value,
                 region=region,
             ) from e
 
-    def get_bedrock_control_client(self, region: str) -> Any:
+    def get_s3_client(self, region: str) -> Any:
         """
-        Get a Bedrock control plane client for the specified region.
-
-        This is different from get_bedrock_client() which returns a bedrock-runtime
-        client. The control plane client is used for management operations like
-        ListInferenceProfiles, GetInferenceProfile, and other API operations.
+        Get an S3 client for the specified region.
 
         Args:
             region: AWS region for the client
 
         Returns:
-            Bedrock control plane client
+            S3 client
 
         Raises:
             AuthenticationError: If client creation fails
         """
         try:
             session = self.get_session(region=region)
-            client = session.client(
-                "bedrock",
+            return session.client(
+                "s3",
                 region_name=region,
                 config=self._botocore_config,
             )
-            return client
 
         except Exception as e:
             if isinstance(e, AuthenticationError):
                 raise
             raise AuthenticationError(
-                message=f"Failed to create Bedrock control plane client: {str(e)}",
+                message=f"Failed to create S3 client: {str(e)}",
                 auth_type=self._auth_config.auth_type.value,
                 region=region,
             ) from e
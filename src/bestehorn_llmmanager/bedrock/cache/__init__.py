@@ -5,5 +5,6 @@ This module provides caching capabilities for Amazon Bedrock's Converse API.
 """
 
 from .cache_point_manager import CachePointManager
+from .token_estimator import TokenEstimator
 
-__all__ = ["CachePointManager"]
+__all__ = ["CachePointManager", "TokenEstimator"]
@@ -15,6 +15,7 @@ from ..models.cache_structures import (
     CacheStrategy,
 )
 from ..models.llm_manager_constants import ConverseAPIFields
+from .token_estimator import TokenEstimator
 
 
 class CachePointManager:
@@ -25,14 +26,19 @@ class CachePointManager:
     based on the configured strategy to maximize cache efficiency.
     """
 
-    def __init__(self, cache_config: CacheConfig) -> None:
+    def __init__(
+        self, cache_config: CacheConfig, token_estimator: Optional[TokenEstimator] = None
+    ) -> None:
         """
         Initialize the cache point manager.
 
         Args:
             cache_config: Cache configuration
+            token_estimator: Estimator used to size content blocks. If None, a new
+                uncalibrated TokenEstimator is used.
         """
         self._config = cache_config
+        self._token_estimator = token_estimator or TokenEstimator()
         self._logger = logging.getLogger(__name__)
         self._availability_tracker = CacheAvailabilityTracker(
             blacklist_duration_minutes=cache_config.blacklist_duration_minutes
@@ -49,7 +55,8 @@ class CachePointManager:
 
         Args:
             messages: List of message dictionaries
-            model: Optional model identifier for availability checking
+            model: Optional model identifier for availability checking and token
+                estimate calibration
             region: Optional region for availability checking
 
         Returns:
@@ -70,17 +77,20 @@ class CachePointManager:
         # Process each message
         processed_messages = []
         for message in messages:
-            processed_message = self._process_message(message)
+            processed_message = self._process_message(message, model=model)
             processed_messages.append(processed_message)
 
         return processed_messages
 
-    def _process_message(self, message: Dict[str, Any]) -> Dict[str, Any]:
+    def _process_message(
+        self, message: Dict[str, Any], model: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Process a single message to inject cache points.
 
         Args:
             message: Message dictionary
+            model: Optional model identifier for token estimate calibration
 
         Returns:
             Message with cache points injected
@@ -97,11 +107,11 @@ class CachePointManager:
 
         # Apply strategy-specific injection
         if self._config.strategy == CacheStrategy.CONSERVATIVE:
-            modified_content = self._inject_conservative(content_blocks)
+            modified_content = self._inject_conservative(content_blocks, model=model)
         elif self._config.strategy == CacheStrategy.AGGRESSIVE:
-            modified_content = self._inject_aggressive(content_blocks)
+            modified_content = self._inject_aggressive(content_blocks, model=model)
         else:  # CacheStrategy.CUSTOM
-            modified_content = self._inject_custom(content_blocks)
+            modified_content = self._inject_custom(content_blocks, model=model)
 
         # Create a new message with modified content
         return {**message, ConverseAPIFields.CONTENT: modified_content}
@@ -110,12 +120,15 @@ class CachePointManager:
         """Check if content blocks already contain cache points."""
         return any(ConverseAPIFields.CACHE_POINT in block for block in content_blocks)
 
-    def _inject_conservative(self, content_blocks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _inject_conservative(
+        self, content_blocks: List[Dict[str, Any]], model: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
         """
         Conservative strategy: Single cache point after substantial shared content.
 
         Args:
             content_blocks: List of content blocks
+            model: Optional model identifier for token estimate calibration
 
         Returns:
             Content blocks with cache point injected
@@ -125,14 +138,14 @@ class CachePointManager:
         optimal_position = -1
 
         for i, block in enumerate(content_blocks):
-            block_tokens = self._estimate_block_tokens(block)
+            block_tokens = self._estimate_block_tokens(block, model=model)
             estimated_tokens += block_tokens
 
             # Place cache point after we've accumulated enough tokens
             if estimated_tokens >= self._config.cache_point_threshold and optimal_position == -1:
                 # Look ahead to see if there's more cacheable content
                 remaining_tokens = sum(
-                    self._estimate_block_tokens(content_blocks[j])
+                    self._estimate_block_tokens(content_blocks[j], model=model)
                     for j in range(i + 1, len(content_blocks))
                 )
 
@@ -163,12 +176,15 @@ class CachePointManager:
 
         return content_blocks
 
-    def _inject_aggressive(self, content_blocks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _inject_aggressive(
+        self, content_blocks: List[Dict[str, Any]], model: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
         """
         Aggressive strategy: Multiple cache points for granular control.
 
         Args:
             content_blocks: List of content blocks
+            model: Optional model identifier for token estimate calibration
 
         Returns:
             Content blocks with multiple cache points injected
@@ -179,26 +195,29 @@ class CachePointManager:
 
         for i, block in enumerate(content_blocks):
             modified_blocks.append(block)
-            block_tokens = self._estimate_block_tokens(block)
+            block_tokens = self._estimate_block_tokens(block, model=model)
             accumulated_tokens += block_tokens
 
             # Add cache point after significant content blocks
             if (
                 accumulated_tokens >= cache_threshold
                 and i < len(content_blocks) - 1  # Not the last block
-                and self._is_cacheable_block(block)
+                and self._is_cacheable_block(block, model=model)
             ):
                 modified_blocks.append(self._create_cache_point_block())
                 accumulated_tokens = 0  # Reset counter
 
         return modified_blocks
 
-    def _inject_custom(self, content_blocks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _inject_custom(
+        self, content_blocks: List[Dict[str, Any]], model: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
         """
         Custom strategy: Apply user-defined rules.
 
         Args:
             content_blocks: List of content blocks
+            model: Optional model identifier for token estimate calibration
 
         Returns:
             Content blocks with cache points based on custom rules
@@ -207,7 +226,7 @@ class CachePointManager:
 
         # Default to conservative if no rules specified
         if not rules:
-            return self._inject_conservative(content_blocks)
+            return self._inject_conservative(content_blocks, model=model)
 
         modified_blocks = []
         accumulated_tokens = 0
@@ -218,7 +237,7 @@ class CachePointManager:
 
         for i, block in enumerate(content_blocks):
             modified_blocks.append(block)
-            block_tokens = self._estimate_block_tokens(block)
+            block_tokens = self._estimate_block_tokens(block, model=model)
             accumulated_tokens += block_tokens
 
             # Check if we should add cache point
@@ -238,42 +257,26 @@ class CachePointManager:
 
         return modified_blocks
 
-    def _estimate_block_tokens(self, block: Dict[str, Any]) -> int:
+    def _estimate_block_tokens(self, block: Dict[str, Any], model: Optional[str] = None) -> int:
         """
         Estimate the number of tokens in a content block.
 
         Args:
             block: Content block
+            model: Optional model identifier for token estimate calibration
 
         Returns:
             Estimated token count
         """
-        # Text blocks: rough estimate of 4 characters per token
-        if ConverseAPIFields.TEXT in block:
-            text = block[ConverseAPIFields.TEXT]
-            return len(text) // 4
-
-        # Image blocks: fixed estimate
-        elif ConverseAPIFields.IMAGE in block:
-            return 450  # Approximate tokens for an image
+        return self._token_estimator.estimate_block_tokens(block=block, model=model)
 
-        # Document blocks: higher estimate
-        elif ConverseAPIFields.DOCUMENT in block:
-            return 1000  # Approximate tokens for a document
-
-        # Video blocks: very high estimate
-        elif ConverseAPIFields.VIDEO in block:
-            return 2000  # Approximate tokens for a video
-
-        # Other blocks: minimal tokens
-        return 10
-
-    def _is_cacheable_block(self, block: Dict[str, Any]) -> bool:
+    def _is_cacheable_block(self, block: Dict[str, Any], model: Optional[str] = None) -> bool:
         """
         Determine if a block is worth caching.
 
         Args:
             block: Content block
+            model: Optional model identifier for token estimate calibration
 
         Returns:
             True if block should be followed by a cache point
@@ -284,7 +287,7 @@ class CachePointManager:
 
         # Long text blocks are cacheable
         if ConverseAPIFields.TEXT in block:
-            tokens = self._estimate_block_tokens(block)
+            tokens = self._estimate_block_tokens(block, model=model)
             return tokens >= self._config.cache_point_threshold
 
         return False
@@ -411,6 +414,10 @@ class CachePointManager:
 
         return cleaned_messages
 
+    def get_token_estimator(self) -> TokenEstimator:
+        """Get the token estimator used to size content blocks."""
+        return self._token_estimator
+
     def get_availability_tracker(self) -> CacheAvailabilityTracker:
         """Get the cache availability tracker instance."""
         return self._availability_tracker
@@ -0,0 +1,352 @@
+"""
+Token estimation for cache point placement and request budgeting.
+
+Estimates the input tokens of Converse content blocks from their content (text length,
+image pixel dimensions, PDF page count) and corrects the estimates per model family with
+a scale learned from the token usage Bedrock reports for completed requests.
+"""
+
+import hashlib
+import json
+import math
+import re
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from ...util.file_type_detector import FileTypeDetector
+from ..models.cache_structures import TokenCalibration
+from ..models.llm_manager_constants import ConverseAPIFields
+from ..models.token_estimation_constants import (
+    ModelFamilies,
+    TokenCalibrationDefaults,
+    TokenEstimationDefaults,
+)
+
+if TYPE_CHECKING:
+    from ..models.bedrock_response import BedrockResponse
+
+# Page objects of a PDF ("/Type /Page", but not the "/Type /Pages" tree nodes)
+_PDF_PAGE_PATTERN = re.compile(rb"/Type\s*/Page(?![a-zA-Z])")
+
+
+class TokenEstimator:
+    """
+    Estimates input tokens of Converse content with per-model-family calibration.
+
+    Heuristic estimates are computed per content block: text by character count, images
+    by pixel dimensions parsed from their header bytes, PDFs by page count, other
+    documents by size. Estimates of binary content are memoized by content hash, so
+    the same image or document attached to many requests is inspected once.
+
+    Each model family has a calibration scale, learned from responses via
+    record_response(): the ratio of the input tokens Bedrock reports (including cache
+    reads and writes) to the heuristic estimate of the request. The class is
+    thread-safe.
+    """
+
+    def __init__(
+        self,
+        chars_per_token: float = TokenEstimationDefaults.CHARS_PER_TOKEN,
+        memo_max_entries: int = TokenEstimationDefaults.MEMO_MAX_ENTRIES,
+    ) -> None:
+        """
+        Initialize the token estimator.
+
+        Args:
+            chars_per_token: Characters per token of the text heuristic
+            memo_max_entries: Maximum number of memoized binary-content estimates
+
+        Raises:
+            ValueError: If a parameter is not positive
+        """
+        if chars_per_token <= 0:
+            raise ValueError(f"chars_per_token must be positive, got: {chars_per_token}")
+        if memo_max_entries <= 0:
+            raise ValueError(f"memo_max_entries must be positive, got: {memo_max_entries}")
+
+        self._chars_per_token = chars_per_token
+        self._memo_max_entries = memo_max_entries
+        self._memo: "OrderedDict[Tuple[str, str, bytes], int]" = OrderedDict()
+        self._calibrations: Dict[str, TokenCalibration] = {}
+        self._lock = threading.Lock()
+        self._detector = FileTypeDetector()
+
+    @staticmethod
+    def get_model_family(model: Optional[str]) -> str:
+        """
+        Map a model name, model ID or inference profile ID to its model family.
+
+        Args:
+            model: Model name or ID (e.g. "Claude 3 Haiku" or
+                "us.anthropic.claude-3-haiku-20240307-v1:0")
+
+        Returns:
+            Model family, ModelFamilies.DEFAULT if unknown
+        """
+        if not model:
+            return ModelFamilies.DEFAULT
+        normalized = model.lower()
+        for family, keywords in ModelFamilies.KEYWORDS:
+            if any(keyword in normalized for keyword in keywords):
+                return family
+        return ModelFamilies.DEFAULT
+
+    def estimate_block_tokens(self, block: Dict[str, Any], model: Optional[str] = None) -> int:
+        """
+        Estimate the input tokens of one content block.
+
+        Args:
+            block: Converse content block
+            model: Model name or ID whose calibration is applied (None: uncalibrated
+                unless the default family has been calibrated)
+
+        Returns:
+            Estimated token count
+        """
+        raw_tokens = self._estimate_raw_block_tokens(block=block)
+        return int(raw_tokens * self._get_scale(family=self.get_model_family(model=model)))
+
+    def estimate_request_tokens(
+        self,
+        messages: List[Dict[str, Any]],
+        system: Optional[List[Dict[str, Any]]] = None,
+        tool_config: Optional[Dict[str, Any]] = None,
+        model: Optional[str] = None,
+    ) -> int:
+        """
+        Estimate the input tokens of a Converse request, e.g. for budgeting.
+
+        Args:
+            messages: Conversation messages
+            system: System content blocks
+            tool_config: Tool configuration
+            model: Model name or ID whose calibration is applied
+
+        Returns:
+            Estimated input token count
+        """
+        raw_tokens = self._estimate_raw_request_tokens(
+            messages=messages, system=system, tool_config=tool_config
+        )
+        return int(raw_tokens * self._get_scale(family=self.get_model_family(model=model)))
+
+    def record_response(
+        self,
+        response: "BedrockResponse",
+        messages: List[Dict[str, Any]],
+        system: Optional[List[Dict[str, Any]]] = None,
+        tool_config: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Learn the calibration of the response's model family from its token usage.
+
+        Args:
+            response: Successful response of the request
+            messages: Messages the request was sent with
+            system: System content blocks the request was sent with
+            tool_config: Tool configuration the request was sent with
+        """
+        if not response.success or response.get_usage() is None:
+            return
+        observed_tokens = (
+            response.get_input_tokens()
+            + response.get_cache_read_tokens()
+            + response.get_cache_write_tokens()
+        )
+        self.record_observation(
+            model=response.model_used,
+            estimated_tokens=self._estimate_raw_request_tokens(
+                messages=messages, system=system, tool_config=tool_config
+            ),
+            observed_tokens=observed_tokens,
+        )
+
+    def record_observation(
+        self, model: Optional[str], estimated_tokens: int, observed_tokens: int
+    ) -> None:
+        """
+        Update a model family's calibration with one observation.
+
+        Args:
+            model: Model name or ID the request ran on
+            estimated_tokens: Uncalibrated heuristic estimate of the request
+            observed_tokens: Input tokens reported by Bedrock (including cache reads and
+                writes)
+        """
+        if estimated_tokens < TokenCalibrationDefaults.MIN_ESTIMATED_TOKENS or observed_tokens <= 0:
+            return
+
+        ratio = min(
+            max(observed_tokens / estimated_tokens, TokenCalibrationDefaults.MIN_RATIO),
+            TokenCalibrationDefaults.MAX_RATIO,
+        )
+        family = self.get_model_family(model=model)
+        with self._lock:
+            calibration = self._calibrations.setdefault(
+                family, TokenCalibration(model_family=family)
+            )
+            calibration.sample_count += 1
+            weight = max(1.0 / calibration.sample_count, TokenCalibrationDefaults.MIN_SMOOTHING)
+            calibration.scale += weight * (ratio - calibration.scale)
+
+    def get_calibration(self, model: Optional[str]) -> TokenCalibration:
+        """
+        Get the calibration of a model's family.
+
+        Args:
+            model: Model name or ID
+
+        Returns:
+            Copy of the calibration (scale 1.0 if nothing was learned yet)
+        """
+        family = self.get_model_family(model=model)
+        with self._lock:
+            calibration = self._calibrations.get(family)
+            if calibration is None:
+                return TokenCalibration(model_family=family)
+            return TokenCalibration(
+                model_family=family,
+                scale=calibration.scale,
+                sample_count=calibration.sample_count,
+            )
+
+    def get_calibrations(self) -> Dict[str, TokenCalibration]:
+        """
+        Get all learned calibrations.
+
+        Returns:
+            Dictionary mapping model families to copies of their calibrations
+        """
+        with self._lock:
+            return {
+                family: TokenCalibration(
+                    model_family=family,
+                    scale=calibration.scale,
+                    sample_count=calibration.sample_count,
+                )
+                for family, calibration in self._calibrations.items()
+            }
+
+    def _get_scale(self, family: str) -> float:
+        """Get the calibration scale of a model family."""
+        calibration = self._calibrations.get(family)
+        return calibration.scale if calibration is not None else 1.0
+
+    def _estimate_raw_request_tokens(
+        self,
+        messages: List[Dict[str, Any]],
+        system: Optional[List[Dict[str, Any]]],
+        tool_config: Optional[Dict[str, Any]],
+    ) -> int:
+        """Estimate the uncalibrated input tokens of a request."""
+        tokens = 0
+        for message in messages:
+            for block in message.get(ConverseAPIFields.CONTENT, []):
+                tokens += self._estimate_raw_block_tokens(block=block)
+        for block in system or []:
+            tokens += self._estimate_raw_block_tokens(block=block)
+        if tool_config:
+            tokens += self._estimate_json_tokens(value=tool_config)
+        return tokens
+
+    def _estimate_raw_block_tokens(self, block: Dict[str, Any]) -> int:
+        """Estimate the uncalibrated tokens of one content block."""
+        if ConverseAPIFields.TEXT in block:
+            return int(len(block[ConverseAPIFields.TEXT]) / self._chars_per_token)
+
+        if ConverseAPIFields.IMAGE in block:
+            return self._estimate_media_tokens(
+                kind=ConverseAPIFields.IMAGE,
+                media=block[ConverseAPIFields.IMAGE],
+                fallback=TokenEstimationDefaults.IMAGE_TOKENS,
+            )
+
+        if ConverseAPIFields.DOCUMENT in block:
+            return self._estimate_media_tokens(
+                kind=ConverseAPIFields.DOCUMENT,
+                media=block[ConverseAPIFields.DOCUMENT],
+                fallback=TokenEstimationDefaults.DOCUMENT_TOKENS,
+            )
+
+        if ConverseAPIFields.VIDEO in block:
+            return TokenEstimationDefaults.VIDEO_TOKENS
+
+        if ConverseAPIFields.TOOL_USE in block or ConverseAPIFields.TOOL_RESULT in block:
+            return self._estimate_json_tokens(value=block)
+
+        return TokenEstimationDefaults.OTHER_BLOCK_TOKENS
+
+    def _estimate_media_tokens(self, kind: str, media: Dict[str, Any], fallback: int) -> int:
+        """
+        Estimate an image or document block, memoized by content hash.
+
+        Args:
+            kind: Block type (image or document)
+            media: Block payload with ``format`` and ``source``
+            fallback: Estimate used when the content cannot be inspected
+
+        Returns:
+            Estimated token count
+        """
+        content = (media.get(ConverseAPIFields.SOURCE) or {}).get(ConverseAPIFields.BYTES)
+        if not isinstance(content, (bytes, bytearray)):
+            return fallback
+
+        content_format = str(media.get(ConverseAPIFields.FORMAT, ""))
+        key = (
+            kind,
+            content_format,
+            hashlib.blake2b(content, digest_size=TokenEstimationDefaults.HASH_DIGEST_SIZE).digest(),
+        )
+        with self._lock:
+            cached = self._memo.get(key)
+            if cached is not None:
+                self._memo.move_to_end(key)
+                return cached
+
+        if kind == ConverseAPIFields.IMAGE:
+            tokens = self._estimate_image_tokens(content=bytes(content), fallback=fallback)
+        else:
+            tokens = self._estimate_document_tokens(
+                content=bytes(content), content_format=content_format, fallback=fallback
+            )
+
+        with self._lock:
+            self._memo[key] = tokens
+            if len(self._memo) > self._memo_max_entries:
+                self._memo.popitem(last=False)
+        return tokens
+
+    def _estimate_image_tokens(self, content: bytes, fallback: int) -> int:
+        """Estimate image tokens from pixel dimensions after service-side downscaling."""
+        dimensions = self._detector.detect_image_dimensions(content=content)
+        if dimensions is None or dimensions[0] <= 0 or dimensions[1] <= 0:
+            return fallback
+
+        width, height = dimensions
+        scale = min(
+            1.0,
+            TokenEstimationDefaults.IMAGE_MAX_EDGE_PIXELS / max(width, height),
+            math.sqrt(TokenEstimationDefaults.IMAGE_MAX_PIXELS / (width * height)),
+        )
+        pixels = (width * scale) * (height * scale)
+        return max(
+            TokenEstimationDefaults.IMAGE_MIN_TOKENS,
+            math.ceil(pixels / TokenEstimationDefaults.IMAGE_PIXELS_PER_TOKEN),
+        )
+
+    def _estimate_document_tokens(self, content: bytes, content_format: str, fallback: int) -> int:
+        """Estimate document tokens from page count (PDF) or text volume."""
+        if content_format == "pdf":
+            pages = len(_PDF_PAGE_PATTERN.findall(content))
+            return pages * TokenEstimationDefaults.PDF_TOKENS_PER_PAGE if pages else fallback
+
+        if content_format in TokenEstimationDefaults.TEXT_DOCUMENT_FORMATS:
+            return int(len(content) / self._chars_per_token)
+
+        return fallback
+
+    def _estimate_json_tokens(self, value: Any) -> int:
+        """Estimate tokens of structured content from its JSON length."""
+        return int(len(json.dumps(value, default=str)) / self._chars_per_token)
@@ -8,13 +8,18 @@ streamlined implementation.
 """
 
 import logging
+import threading
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Set
 
 from ..auth.auth_manager import AuthManager
 from ..exceptions.llm_manager_exceptions import CatalogUnavailableError
+from ..instrumentation.instrumentation_registry import instrument_span
+from ..models.aws_regions import get_commercial_regions
 from ..models.catalog_constants import CatalogDefaults, CatalogErrorMessages, CatalogLogMessages
-from ..models.catalog_structures import CacheMode, CatalogMetadata, UnifiedCatalog
+from ..models.catalog_structures import CacheMode, CatalogMetadata, CatalogSource, UnifiedCatalog
+from ..models.instrumentation_constants import InstrumentationAttributes, InstrumentationSpanNames
 from ..models.unified_structures import ModelAccessInfo, UnifiedModelInfo
 from .api_fetcher import BedrockAPIFetcher
 from .bundled_loader import BundledDataLoader
@@ -38,6 +43,7 @@ class BedrockModelCatalog:
         - Single unified cache file
         - Lambda-friendly design
         - Parallel multi-region API fetching
+        - Region-scoped fetching with lazy loading of further regions
 
     Initialization Strategy:
         1. Try: Load from cache (if enabled & valid)
@@ -57,6 +63,10 @@ class BedrockModelCatalog:
         ...     cache_mode=CacheMode.FILE,
         ...     cache_directory="/tmp/bedrock_cache"
         ... )
+        >>>
+        >>> # Fetch two regions; eu-west-1 is fetched when first queried
+        >>> catalog = BedrockModelCatalog(regions=["us-east-1", "us-west-2"])
+        >>> catalog.is_model_available("Claude 3 Haiku", "eu-west-1")
     """
 
     def __init__(
@@ -71,6 +81,7 @@ class BedrockModelCatalog:
         max_retries: int = CatalogDefaults.DEFAULT_MAX_RETRIES,
         fallback_to_bundled: bool = CatalogDefaults.DEFAULT_FALLBACK_TO_BUNDLED,
         enable_fuzzy_matching: Optional[bool] = None,
+        regions: Optional[List[str]] = None,
     ) -> None:
         """
         Initialize the Bedrock model catalog.
@@ -89,6 +100,9 @@ class BedrockModelCatalog:
                          the default is sized for a fan-out cold-start burst.
             fallback_to_bundled: Use bundled data if API fails
             enable_fuzzy_matching: Enable fuzzy matching in model-CRIS correlation
+            regions: Regions to fetch when the catalog is loaded from the APIs. Other
+                     regions are fetched and merged in the first time a query names
+                     them. If None, all commercial regions are fetched up front.
 
         Raises:
             ValueError: If configuration parameters are invalid
@@ -108,6 +122,7 @@ class BedrockModelCatalog:
         self._cache_mode = cache_mode
         self._force_refresh = force_refresh
         self._fallback_to_bundled = fallback_to_bundled
+        self._regions = list(regions) if regions else None
 
         # Initialize AuthManager
         self._auth_manager = auth_manager or AuthManager()
@@ -136,6 +151,11 @@ class BedrockModelCatalog:
         # Lazy-initialized name resolver
         self._name_resolver: Optional[ModelNameResolver] = None
 
+        # Regions fetched after the initial load (successfully or not), so that a
+        # region is fetched at most once per loaded catalog
+        self._lazy_fetched_regions: Set[str] = set()
+        self._region_lock = threading.Lock()
+
         self._logger.info(CatalogLogMessages.CATALOG_INIT_STARTED.format(mode=cache_mode.value))
 
     def _validate_configuration(
@@ -230,9 +250,27 @@ class BedrockModelCatalog:
             self._logger.debug("Returning in-memory cached catalog")
             return self._catalog
 
+        with instrument_span(name=InstrumentationSpanNames.CATALOG_LOAD) as span:
+            catalog = self._load_catalog()
+            span.set_attribute(
+                key=InstrumentationAttributes.SOURCE, value=catalog.metadata.source.value
+            )
+        return catalog
+
+    def _load_catalog(self) -> UnifiedCatalog:
+        """
+        Load the catalog from cache, API or bundled data, in that order.
+
+        Returns:
+            UnifiedCatalog with model and CRIS data
+
+        Raises:
+            CatalogUnavailableError: If all data sources fail
+        """
         cache_error: Optional[str] = None
         api_error: Optional[str] = None
         bundled_error: Optional[str] = None
+        self._lazy_fetched_regions = set()
 
         # Step 1: Try cache (if enabled and not force_refresh)
         if not self._force_refresh and self._cache_mode != CacheMode.NONE:
@@ -246,6 +284,11 @@ class BedrockModelCatalog:
                             count=catalog.model_count,
                         )
                     )
+                    # The cache may have been written by a catalog scoped to other regions;
+                    # an unscoped catalog promises all commercial regions up front
+                    catalog = self._ensure_regions_loaded(
+                        regions=self._regions or get_commercial_regions()
+                    )
                     return catalog
                 else:
                     cache_error = "Cache miss or invalid"
@@ -259,7 +302,7 @@ class BedrockModelCatalog:
         # Step 2: Try API fetch
         try:
             self._logger.info("Attempting to fetch catalog from AWS APIs")
-            raw_data = self._api_fetcher.fetch_all_data()
+            raw_data = self._api_fetcher.fetch_all_data(regions=self._regions)
 
             # Transform raw data to unified catalog
             catalog = self._transformer.transform_api_data(raw_data=raw_data)
@@ -324,6 +367,103 @@ class BedrockModelCatalog:
         self._logger.error(CatalogLogMessages.ERROR_ALL_SOURCES_FAILED)
         raise CatalogUnavailableError(message=error_msg)
 
+    def _get_unloaded_regions(self, catalog: UnifiedCatalog, regions: List[str]) -> List[str]:
+        """
+        Get the regions that can still be fetched and merged into a catalog.
+
+        A region is unloaded if it is a commercial region or one of the configured
+        regions, was not queried for the catalog and was not fetched lazily before. A
+        region recorded as failed in the catalog metadata (possibly by another process,
+        through the cache) is skipped until CatalogDefaults.FAILED_REGION_RETRY_HOURS
+        have passed since the failed attempt.
+
+        Args:
+            catalog: Loaded catalog
+            regions: Regions to check
+
+        Returns:
+            Unloaded regions, in the given order
+        """
+        if catalog.metadata.source == CatalogSource.BUNDLED:
+            return []
+
+        loadable = set(get_commercial_regions()).union(self._regions or [])
+        queried = set(catalog.metadata.api_regions_queried)
+        retry_after = datetime.now() - timedelta(hours=CatalogDefaults.FAILED_REGION_RETRY_HOURS)
+        recently_failed = {
+            region
+            for region, failed_at in catalog.metadata.api_regions_failed.items()
+            if failed_at > retry_after
+        }
+        return [
+            region
+            for region in dict.fromkeys(regions)
+            if region in loadable
+            and region not in queried
+            and region not in recently_failed
+            and region not in self._lazy_fetched_regions
+        ]
+
+    def _ensure_regions_loaded(self, regions: List[str]) -> UnifiedCatalog:
+        """
+        Ensure the catalog holds the data of the given regions.
+
+        Unloaded regions are fetched from the APIs, transformed and merged into the
+        in-memory catalog, which is saved to the cache again. Regions that fail to load
+        are logged and recorded as failed in the catalog metadata, so neither this
+        catalog nor a later warm load fetches them again before the retry interval.
+
+        Args:
+            regions: Regions a query needs
+
+        Returns:
+            UnifiedCatalog including the data of the given regions where available
+
+        Raises:
+            CatalogUnavailableError: If catalog cannot be loaded
+        """
+        catalog = self.ensure_catalog_available()
+        if not self._get_unloaded_regions(catalog=catalog, regions=regions):
+            return catalog
+
+        with self._region_lock:
+            catalog = self.ensure_catalog_available()
+            missing = self._get_unloaded_regions(catalog=catalog, regions=regions)
+            if not missing:
+                return catalog
+            self._lazy_fetched_regions.update(missing)
+
+            self._logger.info(CatalogLogMessages.REGIONS_LOADING.format(regions=missing))
+            try:
+                raw_data = self._api_fetcher.fetch_all_data(regions=missing)
+                additional = self._transformer.transform_api_data(raw_data=raw_data)
+            except Exception as e:
+                self._logger.warning(
+                    CatalogLogMessages.REGIONS_LOAD_FAILED.format(regions=missing, error=str(e))
+                )
+                catalog = catalog.with_failed_regions(regions=missing, failed_at=datetime.now())
+                self._replace_catalog(catalog=catalog)
+                return catalog
+
+            catalog = catalog.merge(other=additional)
+            self._replace_catalog(catalog=catalog)
+            self._logger.info(
+                CatalogLogMessages.REGIONS_LOADED.format(regions=missing, count=catalog.model_count)
+            )
+            return catalog
+
+    def _replace_catalog(self, catalog: UnifiedCatalog) -> None:
+        """
+        Replace the in-memory catalog and save it to the cache.
+
+        Args:
+            catalog: Catalog extended with additional regions
+        """
+        if self._cache_mode != CacheMode.NONE:
+            self._cache_manager.save_cache(catalog=catalog)
+        self._catalog = catalog
+        self._name_resolver = None
+
     def get_model_info(
         self,
         model_name: str,
@@ -347,7 +487,8 @@ class BedrockModelCatalog:
         Args:
             model_name: Model name or ID to query (supports aliases)
             region: AWS region to check availability. If None, returns info
-                   for any region where model is available.
+                   for any region where model is available. A region that is not
+                   loaded yet is fetched first.
 
         Returns:
             ModelAccessInfo if model is available, None otherwise
@@ -362,8 +503,11 @@ class BedrockModelCatalog:
             )
         )
 
-        # Ensure catalog is available
-        catalog = self.ensure_catalog_available()
+        # Ensure catalog is available, including the queried region
+        if region:
+            catalog = self._ensure_regions_loaded(regions=[region])
+        else:
+            catalog = self.ensure_catalog_available()
 
         # Resolve model name using name resolver
         resolver = self._get_name_resolver()
@@ -416,7 +560,7 @@ class BedrockModelCatalog:
 
         Args:
             model_name: Model name or ID to check (supports aliases)
-            region: AWS region to check
+            region: AWS region to check (fetched first if not loaded yet)
 
         Returns:
             True if model is available in region, False otherwise
@@ -424,8 +568,8 @@ class BedrockModelCatalog:
         Raises:
             CatalogUnavailableError: If catalog cannot be loaded
         """
-        # Ensure catalog is available
-        catalog = self.ensure_catalog_available()
+        # Ensure catalog is available, including the queried region
+        catalog = self._ensure_regions_loaded(regions=[region])
 
         # Resolve model name using name resolver
         resolver = self._get_name_resolver()
@@ -456,7 +600,7 @@ class BedrockModelCatalog:
         List models with optional filtering.
 
         Args:
-            region: Filter by AWS region availability
+            region: Filter by AWS region availability (fetched first if not loaded yet)
             provider: Filter by model provider (e.g., "Anthropic", "Amazon")
             streaming_only: Only include streaming-capable models
 
@@ -473,8 +617,11 @@ class BedrockModelCatalog:
         }
         self._logger.debug(CatalogLogMessages.QUERY_LIST_MODELS.format(filters=filters))
 
-        # Ensure catalog is available
-        catalog = self.ensure_catalog_available()
+        # Ensure catalog is available, including the filtered region
+        if region:
+            catalog = self._ensure_regions_loaded(regions=[region])
+        else:
+            catalog = self.ensure_catalog_available()
 
         # Apply filters
         return catalog.filter_models(
@@ -118,6 +118,7 @@ class CatalogTransformer:
                 api_regions_queried=raw_data.successful_regions,
                 bundled_data_version=None,
                 cache_file_path=None,
+                api_regions_failed={region: timestamp for region in raw_data.failed_regions},
             )
 
             # Create final unified catalog
@@ -8,7 +8,7 @@ import logging
 from typing import Dict, List, Optional, Set, Tuple
 
 from ..models.access_method import ModelAccessInfo
-from ..models.cris_constants import CRISGlobalConstants
+from ..models.cris_constants import CRISGlobalConstants, CRISRegionPrefixes
 from ..models.cris_structures import CRISCatalog, CRISModelInfo
 from ..models.data_structures import BedrockModelInfo, ModelCatalog
 from ..models.unified_constants import (
@@ -26,6 +26,24 @@ class ModelCRISCorrelationError(Exception):
     pass
 
 
+@dataclasses.dataclass(frozen=True)
+class CRISNameIndex:
+    """
+    Reverse indexes from model names to CRIS model names, built once per correlation.
+
+    Every list is ordered Global variants first and otherwise in catalog order, so its
+    first entry is the preferred match.
+
+    Attributes:
+        by_standard_name: Standard model name to CRIS names
+        by_normalized_name: Lowercased normalized CRIS name to CRIS names (empty if fuzzy
+            matching is disabled)
+    """
+
+    by_standard_name: Dict[str, List[str]]
+    by_normalized_name: Dict[str, List[str]]
+
+
 class ModelCRISCorrelator:
     """
     Correlates and merges regular Bedrock model data with CRIS data.
@@ -126,6 +144,9 @@ class ModelCRISCorrelator:
             cris_to_standard_mapping = self._create_model_name_mapping(
                 cris_models=cris_catalog.cris_models
             )
+            cris_name_index = self._build_cris_name_index(
+                cris_models=cris_catalog.cris_models, name_mapping=cris_to_standard_mapping
+            )
 
             # CRITICAL FIX: Create synthetic base models for CRIS-only models
             # This ensures models like Claude Haiku 4.5 have a base entry to correlate with
@@ -152,6 +173,7 @@ class ModelCRISCorrelator:
                         model_name=model_name,
                         cris_models=cris_catalog.cris_models,
                         name_mapping=cris_to_standard_mapping,
+                        cris_name_index=cris_name_index,
                     )
 
                     # Create unified model
@@ -314,8 +336,49 @@ class ModelCRISCorrelator:
 
         return normalized.strip()
 
+    def _build_cris_name_index(
+        self, cris_models: Dict[str, CRISModelInfo], name_mapping: Dict[str, str]
+    ) -> CRISNameIndex:
+        """
+        Build the reverse indexes used to match models with CRIS models.
+
+        Each CRIS name is normalized at most once, so matching all models costs
+        O(models + CRIS models) instead of scanning every CRIS name for every model.
+
+        Args:
+            cris_models: Dictionary of CRIS models
+            name_mapping: CRIS name to standard name mapping
+
+        Returns:
+            CRISNameIndex for the CRIS models
+        """
+        by_standard_name: Dict[str, List[str]] = {}
+        for cris_name, standard_name in name_mapping.items():
+            by_standard_name.setdefault(standard_name, []).append(cris_name)
+
+        by_normalized_name: Dict[str, List[str]] = {}
+        if self._fuzzy_matching_enabled:
+            for cris_name in cris_models:
+                normalized_cris = self._normalize_model_name(model_name=cris_name).lower()
+                by_normalized_name.setdefault(normalized_cris, []).append(cris_name)
+
+        for index in (by_standard_name, by_normalized_name):
+            for cris_names in index.values():
+                # Stable sort: Global variants first, catalog order otherwise
+                cris_names.sort(
+                    key=lambda name: not name.startswith(CRISRegionPrefixes.GLOBAL_PREFIX)
+                )
+
+        return CRISNameIndex(
+            by_standard_name=by_standard_name, by_normalized_name=by_normalized_name
+        )
+
     def _find_matching_cris_model(
-        self, model_name: str, cris_models: Dict[str, CRISModelInfo], name_mapping: Dict[str, str]
+        self,
+        model_name: str,
+        cris_models: Dict[str, CRISModelInfo],
+        name_mapping: Dict[str, str],
+        cris_name_index: Optional[CRISNameIndex] = None,
     ) -> Tuple[Optional[CRISModelInfo], str]:
         """
         Find a matching CRIS model for a regular model.
@@ -328,53 +391,41 @@ class ModelCRISCorrelator:
             model_name: Name of the regular model
             cris_models: Dictionary of CRIS models
             name_mapping: CRIS name to standard name mapping
+            cris_name_index: Indexes built from cris_models and name_mapping (built on
+                demand if None)
 
         Returns:
             Tuple of (Matching CRISModelInfo if found, match type)
             Match type can be "exact", "fuzzy", or None if no match
         """
-        # Step 1: Check for Global variant first (PRIORITY FIX)
-        # Look for "Global [model_name]" pattern in CRIS models
-        for cris_name, standard_name in name_mapping.items():
-            if standard_name == model_name and cris_name.startswith("Global "):
+        if cris_name_index is None:
+            cris_name_index = self._build_cris_name_index(
+                cris_models=cris_models, name_mapping=name_mapping
+            )
+
+        # Step 1: Direct match on the standard name, Global variant first (PRIORITY FIX)
+        exact_matches = cris_name_index.by_standard_name.get(model_name)
+        if exact_matches:
+            cris_name = exact_matches[0]
+            if cris_name.startswith(CRISRegionPrefixes.GLOBAL_PREFIX):
                 self._logger.info(
                     f"Matched model '{model_name}' with Global CRIS variant '{cris_name}'"
                 )
-                return cris_models[cris_name], "exact"
-
-        # Step 2: Direct match in explicit mappings (regional variants)
-        for cris_name, standard_name in name_mapping.items():
-            if standard_name == model_name:
-                return cris_models[cris_name], "exact"
+            return cris_models[cris_name], "exact"
 
-        # Step 3: Fuzzy matching (only if enabled and all other options exhausted)
+        # Step 2: Fuzzy matching (only if enabled and all other options exhausted)
         if self._fuzzy_matching_enabled:
             normalized_target = self._normalize_model_name(model_name=model_name).lower()
-
-            # First try to match Global variants with fuzzy matching
-            for cris_name, cris_model in cris_models.items():
-                if cris_name.startswith("Global "):
-                    normalized_cris = self._normalize_model_name(model_name=cris_name).lower()
-                    if normalized_cris == normalized_target:
-                        # Log fuzzy match warning
-                        self._logger.warning(
-                            UnifiedLogMessages.FUZZY_MATCH_APPLIED.format(
-                                regular_model=model_name, cris_model=cris_name
-                            )
-                        )
-                        return cris_model, "fuzzy"
-
-            # Then try regional variants
-            for cris_name, cris_model in cris_models.items():
-                normalized_cris = self._normalize_model_name(model_name=cris_name).lower()
-                if normalized_cris == normalized_target:
-                    # Log fuzzy match warning
-                    self._logger.warning(
-                        UnifiedLogMessages.FUZZY_MATCH_APPLIED.format(
-                            regular_model=model_name, cris_model=cris_name
-                        )
+            fuzzy_matches = cris_name_index.by_normalized_name.get(normalized_target)
+            if fuzzy_matches:
+                cris_name = fuzzy_matches[0]
+                # Log fuzzy match warning
+                self._logger.warning(
+                    UnifiedLogMessages.FUZZY_MATCH_APPLIED.format(
+                        regular_model=model_name, cris_model=cris_name
                     )
-                    return cris_model, "fuzzy"
+                )
+                return cris_models[cris_name], "fuzzy"
         else:
             # Log that fuzzy matching is disabled
             self._logger.debug(
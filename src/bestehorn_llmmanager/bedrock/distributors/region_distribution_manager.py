@@ -86,6 +86,53 @@ class RegionDistributionManager:
 
         return assignments
 
+    def assign_request(
+        self,
+        request: BedrockConverseRequest,
+        available_regions: List[str],
+        target_regions_per_request: int,
+    ) -> RegionAssignment:
+        """
+        Assign regions to a single request of a streamed batch.
+
+        Unlike :meth:`distribute_requests`, load tracking is not reset on each call, so
+        consecutive calls continue the round-robin / least-loaded sequence exactly as if
+        the requests had been distributed together. Call :meth:`reset_load_tracking`
+        before starting a new stream.
+
+        Args:
+            request: Request to assign
+            available_regions: List of available AWS regions
+            target_regions_per_request: Target number of regions for the request
+
+        Returns:
+            RegionAssignment for the request
+
+        Raises:
+            ParallelConfigurationError: If configuration parameters are invalid
+            RegionDistributionError: If region distribution fails
+        """
+        self._validate_distribution_parameters(
+            requests=[request],
+            available_regions=available_regions,
+            target_regions_per_request=target_regions_per_request,
+        )
+
+        for region in available_regions:
+            self._region_assignment_counter.setdefault(region, 0)
+
+        assigned_regions = self._assign_regions_for_request(
+            request=request,
+            available_regions=available_regions,
+            target_regions_per_request=target_regions_per_request,
+        )
+
+        return RegionAssignment(
+            request_id=request.request_id or "unknown",
+            assigned_regions=assigned_regions,
+            priority=request.priority,
+        )
+
     def _validate_distribution_parameters(
         self,
         requests: List[BedrockConverseRequest],
@@ -177,7 +224,7 @@ class RegionDistributionManager:
             assignment = RegionAssignment(
                 request_id=request.request_id or "unknown",
                 assigned_regions=assigned_regions,
-                priority=0,  # Default priority, can be enhanced later
+                priority=request.priority,
             )
             assignments.append(assignment)
 
@@ -405,7 +452,7 @@ class RegionDistributionManager:
         return RegionAssignment(
             request_id=request.request_id or "unknown",
             assigned_regions=assigned_regions,
-            priority=0,
+            priority=request.priority,
         )
 
     def get_load_balancing_strategy(self) -> LoadBalancingStrategy:
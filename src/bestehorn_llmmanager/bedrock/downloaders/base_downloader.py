@@ -14,7 +14,7 @@ class DocumentationDownloader(Protocol):
     Provides type hints for dependency injection and testing.
     """
 
-    def download(self, url: str, output_path: Path) -> None:
+    def download(self, url: str, output_path: Path) -> bool:
         """
         Download documentation from the specified URL to the output path.
 
@@ -22,6 +22,9 @@ class DocumentationDownloader(Protocol):
             url: The URL to download documentation from
             output_path: The local file path to save the downloaded content
 
+        Returns:
+            True if new content was saved, False if the saved file is still current
+
         Raises:
             NetworkError: If there are network connectivity issues
             FileSystemError: If there are file system access issues
@@ -36,7 +39,7 @@ class BaseDocumentationDownloader(ABC):
     """
 
     @abstractmethod
-    def download(self, url: str, output_path: Path) -> None:
+    def download(self, url: str, output_path: Path) -> bool:
         """
         Download documentation from the specified URL to the output path.
 
@@ -44,6 +47,9 @@ class BaseDocumentationDownloader(ABC):
             url: The URL to download documentation from
             output_path: The local file path to save the downloaded content
 
+        Returns:
+            True if new content was saved, False if the saved file is still current
+
         Raises:
             NetworkError: If there are network connectivity issues
             FileSystemError: If there are file system access issues
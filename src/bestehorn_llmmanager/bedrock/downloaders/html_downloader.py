@@ -3,14 +3,16 @@ HTTP-based HTML documentation downloader.
 Concrete implementation for downloading HTML documentation from web URLs.
 """
 
+import json
 import logging
+import os
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 import requests
 from requests.exceptions import ConnectionError, RequestException, Timeout
 
-from ..models.constants import LogMessages
+from ..models.constants import FilePaths, HTTPHeaders, LogMessages
 from .base_downloader import BaseDocumentationDownloader, FileSystemError, NetworkError
 
 
@@ -18,6 +20,14 @@ class HTMLDocumentationDownloader(BaseDocumentationDownloader):
     """
     HTTP-based downloader for HTML documentation.
     Downloads documentation from web URLs using the requests library.
+
+    Requests go through one pooled session. The ETag and Last-Modified headers of a
+    download are saved next to the HTML file, and the next download of the same file
+    is a conditional request; a 304 Not Modified response keeps the saved file.
+
+    Callers that derive further files from the download (such as a parsed JSON
+    catalog) pass ``defer_validators=True`` and call save_validators() once those files
+    are written, so a 304 never vouches for a download whose processing failed.
     """
 
     def __init__(
@@ -34,15 +44,26 @@ class HTMLDocumentationDownloader(BaseDocumentationDownloader):
         self._timeout = timeout
         self._verify_ssl = verify_ssl
         self._user_agent = user_agent or self._get_default_user_agent()
+        self._session = requests.Session()
+        self._pending_validators: Dict[Path, Dict[str, str]] = {}
         self._logger = logging.getLogger(__name__)
 
-    def download(self, url: str, output_path: Path) -> None:
+    def download(self, url: str, output_path: Path, defer_validators: bool = False) -> bool:
         """
         Download HTML documentation from the specified URL.
 
+        If output_path was downloaded before, the request is conditional on the saved
+        validators, and an unchanged document is not transferred again.
+
         Args:
             url: The URL to download documentation from
             output_path: The local file path to save the downloaded content
+            defer_validators: Keep the validators of new content in memory until
+                save_validators() is called; the previous validators are removed
+                before the new content is written
+
+        Returns:
+            True if new content was saved, False if the saved file is still current
 
         Raises:
             NetworkError: If there are network connectivity issues
@@ -55,10 +76,26 @@ class HTMLDocumentationDownloader(BaseDocumentationDownloader):
         self._logger.info(LogMessages.DOWNLOAD_STARTED)
 
         try:
-            response = self._make_request(url=url)
+            response = self._make_request(
+                url=url, extra_headers=self._load_validators(output_path=output_path)
+            )
+            if response.status_code == HTTPHeaders.STATUS_NOT_MODIFIED:
+                # Refresh the modification time so that age checks see a current file
+                os.utime(output_path)
+                self._logger.info(LogMessages.DOWNLOAD_NOT_MODIFIED.format(file_path=output_path))
+                return False
+
+            validators = self._get_response_validators(response=response)
+            if defer_validators:
+                self._get_validators_path(output_path=output_path).unlink(missing_ok=True)
             self._save_content(content=response.text, output_path=output_path)
+            if defer_validators:
+                self._pending_validators[output_path] = validators
+            else:
+                self._save_validators(validators=validators, output_path=output_path)
 
             self._logger.info(LogMessages.DOWNLOAD_COMPLETED.format(file_path=output_path))
+            return True
 
         except RequestException as e:
             error_msg = LogMessages.NETWORK_ERROR.format(error=str(e))
@@ -69,15 +106,18 @@ class HTMLDocumentationDownloader(BaseDocumentationDownloader):
             self._logger.error(error_msg)
             raise FileSystemError(error_msg) from e
 
-    def _make_request(self, url: str) -> requests.Response:
+    def _make_request(
+        self, url: str, extra_headers: Optional[Dict[str, str]] = None
+    ) -> requests.Response:
         """
         Make HTTP request to download content.
 
         Args:
             url: The URL to request
+            extra_headers: Additional headers, e.g. conditional request headers
 
         Returns:
-            HTTP response object
+            HTTP response object (status 304 if a conditional request found no change)
 
         Raises:
             RequestException: If the HTTP request fails
@@ -89,9 +129,10 @@ class HTMLDocumentationDownloader(BaseDocumentationDownloader):
             "Accept-Encoding": "gzip, deflate",
             "Connection": "keep-alive",
         }
+        headers.update(extra_headers or {})
 
         try:
-            response = requests.get(
+            response = self._session.get(
                 url=url,
                 headers=headers,
                 timeout=self._timeout,
@@ -123,6 +164,112 @@ class HTMLDocumentationDownloader(BaseDocumentationDownloader):
         except OSError as e:
             raise OSError(f"Failed to save content to {output_path}: {str(e)}") from e
 
+    def _get_validators_path(self, output_path: Path) -> Path:
+        """
+        Get the path of the validators file saved next to a downloaded file.
+
+        Args:
+            output_path: The downloaded file path
+
+        Returns:
+            Path of the validators file
+        """
+        return output_path.with_name(output_path.name + FilePaths.VALIDATORS_SUFFIX)
+
+    def _load_validators(self, output_path: Path) -> Dict[str, str]:
+        """
+        Build conditional request headers from the validators of a previous download.
+
+        Args:
+            output_path: The downloaded file path
+
+        Returns:
+            If-None-Match and If-Modified-Since headers, empty if output_path or its
+            validators are missing or unreadable
+        """
+        validators_path = self._get_validators_path(output_path=output_path)
+        if not output_path.exists() or not validators_path.exists():
+            return {}
+
+        try:
+            with open(validators_path, "r", encoding="utf-8") as file:
+                validators = json.load(file)
+        except (OSError, ValueError) as e:
+            self._logger.debug(f"Ignoring unreadable validators {validators_path}: {str(e)}")
+            return {}
+
+        headers: Dict[str, str] = {}
+        if isinstance(validators.get(HTTPHeaders.ETAG), str):
+            headers[HTTPHeaders.IF_NONE_MATCH] = validators[HTTPHeaders.ETAG]
+        if isinstance(validators.get(HTTPHeaders.LAST_MODIFIED), str):
+            headers[HTTPHeaders.IF_MODIFIED_SINCE] = validators[HTTPHeaders.LAST_MODIFIED]
+        return headers
+
+    def save_validators(self, output_path: Path) -> None:
+        """
+        Save the validators of a download made with ``defer_validators=True``.
+
+        Does nothing if output_path has no deferred validators.
+
+        Args:
+            output_path: The downloaded file path
+
+        Raises:
+            FileSystemError: If the validators file cannot be written
+        """
+        validators = self._pending_validators.pop(output_path, None)
+        if validators is None:
+            return
+        try:
+            self._save_validators(validators=validators, output_path=output_path)
+        except OSError as e:
+            error_msg = LogMessages.FILE_ERROR.format(error=str(e))
+            self._logger.error(error_msg)
+            raise FileSystemError(error_msg) from e
+
+    def _get_response_validators(self, response: requests.Response) -> Dict[str, str]:
+        """
+        Get the ETag and Last-Modified headers of a response.
+
+        Args:
+            response: The response whose content is saved
+
+        Returns:
+            Validators by header name
+        """
+        validators: Dict[str, str] = {}
+        for name in (HTTPHeaders.ETAG, HTTPHeaders.LAST_MODIFIED):
+            value = response.headers.get(name)
+            if isinstance(value, str):
+                validators[name] = value
+        return validators
+
+    def _save_validators(self, validators: Dict[str, str], output_path: Path) -> None:
+        """
+        Save validators next to the downloaded file.
+
+        A stale validators file is removed if there are no validators.
+
+        Args:
+            validators: Validators by header name
+            output_path: The downloaded file path
+
+        Raises:
+            OSError: If file operations fail
+        """
+        validators_path = self._get_validators_path(output_path=output_path)
+
+        if not validators:
+            validators_path.unlink(missing_ok=True)
+            return
+
+        with open(validators_path, "w", encoding="utf-8") as file:
+            json.dump(validators, file)
+
+    def close(self) -> None:
+        """Close the pooled HTTP session."""
+        self._session.close()
+
     def _get_default_user_agent(self) -> str:
         """
         Get the default user agent string.
@@ -10,6 +10,7 @@ from .llm_manager_exceptions import (
     LLMManagerError,
     ModelAccessError,
     ProfileRequirementError,
+    RateLimitExceededError,
     RequestValidationError,
     RetryExhaustedError,
     StreamingError,
@@ -22,6 +23,7 @@ __all__ = [
     "ModelAccessError",
     "ProfileRequirementError",
     "RetryExhaustedError",
+    "RateLimitExceededError",
     "RequestValidationError",
     "StreamingError",
     "ContentError",
@@ -0,0 +1,60 @@
+"""
+Exception classes for file-driven batch processing in LLM Manager system.
+Provides specialized exceptions for batch input, output and checkpoint failures.
+"""
+
+from typing import Any, Dict, Optional
+
+from .llm_manager_exceptions import LLMManagerError
+
+
+class BatchProcessingError(LLMManagerError):
+    """Base exception for batch processing errors."""
+
+    def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
+        super().__init__(message=message, details=details)
+
+
+class BatchInputError(BatchProcessingError):
+    """
+    Exception raised when a batch input record cannot be parsed.
+
+    Carries the file and line number of the offending record so a multi-gigabyte
+    input file can be fixed without searching for the bad line.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        file_path: Optional[str] = None,
+        line_number: Optional[int] = None,
+        details: Optional[Dict[str, Any]] = None,
+    ):
+        self.file_path = file_path
+        self.line_number = line_number
+
+        if details is None:
+            details = {}
+        if file_path is not None:
+            details["file_path"] = file_path
+        if line_number is not None:
+            details["line_number"] = line_number
+
+        super().__init__(message=message, details=details if details else None)
+
+
+class BatchCheckpointError(BatchProcessingError):
+    """Exception raised when a batch checkpoint cannot be read or written."""
+
+    def __init__(
+        self,
+        message: str,
+        checkpoint_path: Optional[str] = None,
+        details: Optional[Dict[str, Any]] = None,
+    ):
+        self.checkpoint_path = checkpoint_path
+
+        if details is None and checkpoint_path is not None:
+            details = {"checkpoint_path": checkpoint_path}
+
+        super().__init__(message=message, details=details)
@@ -25,6 +25,7 @@ class ExceptionDetailFields:
     CONTENT_TYPE: Final[str] = "content_type"
     CONTENT_SIZE: Final[str] = "content_size"
     MAX_ALLOWED_SIZE: Final[str] = "max_allowed_size"
+    WAIT_SECONDS: Final[str] = "wait_seconds"
 
 
 class LLMManagerError(Exception):
@@ -272,6 +273,42 @@ class RetryExhaustedError(LLMManagerError):
         return None
 
 
+class RateLimitExceededError(LLMManagerError):
+    """Raised when a call would wait longer than allowed for client-side rate limit quota."""
+
+    model_id: Optional[str]
+    region: Optional[str]
+    wait_seconds: Optional[float]
+
+    def __init__(
+        self,
+        message: str,
+        model_id: Optional[str] = None,
+        region: Optional[str] = None,
+        wait_seconds: Optional[float] = None,
+    ) -> None:
+        """
+        Initialize rate limit exceeded error.
+
+        Args:
+            message: Error message
+            model_id: Model or inference profile ID whose quota was exhausted
+            region: AWS region whose quota was exhausted
+            wait_seconds: Time the call would have had to wait for quota
+        """
+        details: Dict[str, Any] = {}
+        if model_id:
+            details[ExceptionDetailFields.MODEL_ID] = model_id
+        if region:
+            details[ExceptionDetailFields.REGION] = region
+        if wait_seconds is not None:
+            details[ExceptionDetailFields.WAIT_SECONDS] = wait_seconds
+        super().__init__(message=message, details=details or None)
+        self.model_id = model_id
+        self.region = region
+        self.wait_seconds = wait_seconds
+
+
 class RequestValidationError(LLMManagerError):
     """Raised when request validation fails."""
 
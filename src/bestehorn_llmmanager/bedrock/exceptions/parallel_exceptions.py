@@ -330,3 +330,38 @@ class RequestValidationError(ParallelProcessingError):
             Number of validation errors
         """
         return len(self.validation_errors)
+
+
+class BatchInferenceError(ParallelProcessingError):
+    """
+    Exception raised when a Bedrock batch inference job cannot be submitted or tracked.
+
+    Failures of individual records, or of a job that ran and ended unsuccessfully, are
+    reported as failed BedrockResponse objects instead.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        job_arn: Optional[str] = None,
+        details: Optional[Dict[str, Any]] = None,
+    ):
+        self.job_arn = job_arn
+
+        if details is None and job_arn is not None:
+            details = {"job_arn": job_arn}
+
+        super().__init__(message=message, details=details)
+
+
+class BatchInferenceUnsupportedRequestError(BatchInferenceError):
+    """
+    Exception raised when a request cannot be expressed as a batch inference record.
+
+    Raised before any job is submitted, so callers can fall back to on-demand execution.
+    """
+
+    def __init__(self, message: str, request_id: Optional[str] = None):
+        self.request_id = request_id
+        details = {"request_id": request_id} if request_id is not None else None
+        super().__init__(message=message, details=details)
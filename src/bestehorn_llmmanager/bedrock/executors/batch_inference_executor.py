@@ -0,0 +1,488 @@
+"""
+Bedrock batch inference executor for LLM Manager system.
+Packs requests into model invocation jobs, tracks the jobs and maps their output back
+to BedrockResponse objects keyed by request ID.
+"""
+
+import json
+import logging
+import math
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..exceptions.parallel_exceptions import (
+    BatchInferenceError,
+    BatchInferenceUnsupportedRequestError,
+)
+from ..models.batch_inference_constants import (
+    BatchInferenceDefaults,
+    BatchInferenceErrorMessages,
+    BatchInferenceFields,
+    BatchInferenceLogMessages,
+    BatchJobStatus,
+)
+from ..models.batch_inference_structures import BatchInferenceConfig, BatchInferenceJobInfo
+from ..models.bedrock_response import BedrockResponse
+from ..models.parallel_structures import BedrockConverseRequest
+from .batch_record_formatter import AnthropicBatchRecordFormatter
+
+# A job's records: (record ID, request ID, model input)
+_JobRecords = List[Tuple[str, str, Dict[str, Any]]]
+
+
+def parse_s3_uri(uri: str) -> Tuple[str, str]:
+    """
+    Split an S3 URI into bucket and key prefix.
+
+    Args:
+        uri: URI of the form ``s3://bucket/prefix``
+
+    Returns:
+        Tuple of bucket name and key prefix without leading/trailing slashes
+
+    Raises:
+        BatchInferenceError: If the URI is not a valid S3 URI
+    """
+    if not uri.startswith("s3://"):
+        raise BatchInferenceError(
+            message=BatchInferenceErrorMessages.INVALID_S3_URI.format(uri=uri)
+        )
+    bucket, _, prefix = uri[len("s3://") :].partition("/")
+    if not bucket:
+        raise BatchInferenceError(
+            message=BatchInferenceErrorMessages.INVALID_S3_URI.format(uri=uri)
+        )
+    return bucket, prefix.strip("/")
+
+
+class BatchInferenceExecutor:
+    """
+    Executes requests as Bedrock model invocation jobs.
+
+    All records are formatted before anything is uploaded, so a request that cannot be
+    expressed as a batch record fails the call without side effects. Requests are split
+    evenly across as few jobs as ``max_records_per_job`` allows; each job's input file is
+    uploaded to ``<s3_input_uri>/<job_name>/input.jsonl`` and its output is written by
+    Bedrock under ``<s3_output_uri>/<job_name>/``. Jobs are polled with exponential
+    backoff until they all reach a terminal status.
+    """
+
+    def __init__(
+        self,
+        config: BatchInferenceConfig,
+        bedrock_client: Any,
+        s3_client: Any,
+        region: str,
+        record_formatter: Optional[AnthropicBatchRecordFormatter] = None,
+        sleep_func: Callable[[float], None] = time.sleep,
+        clock_func: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the batch inference executor.
+
+        Args:
+            config: Batch inference configuration
+            bedrock_client: Bedrock control plane client (or a compatible stub)
+            s3_client: S3 client (or a compatible stub)
+            region: Region the jobs are submitted in
+            record_formatter: Formatter translating requests into model input
+            sleep_func: Function used to wait between status polls
+            clock_func: Monotonic clock used for the wait timeout
+        """
+        self._logger = logging.getLogger(__name__)
+        self._config = config
+        self._bedrock_client = bedrock_client
+        self._s3_client = s3_client
+        self._region = region
+        self._formatter = record_formatter or AnthropicBatchRecordFormatter()
+        self._sleep = sleep_func
+        self._clock = clock_func
+        self._last_jobs: List[BatchInferenceJobInfo] = []
+
+    def get_job_count(self, request_count: int) -> int:
+        """
+        Get the number of jobs a batch of requests is split into.
+
+        Args:
+            request_count: Number of requests
+
+        Returns:
+            Number of jobs
+        """
+        return max(1, math.ceil(request_count / self._config.max_records_per_job))
+
+    def execute_requests(
+        self, requests: List[BedrockConverseRequest], model_id: str
+    ) -> Dict[str, BedrockResponse]:
+        """
+        Execute requests as batch inference jobs and wait for their results.
+
+        Args:
+            requests: Requests to execute (request IDs must be set and unique)
+            model_id: Model or inference profile ID the jobs run against
+
+        Returns:
+            Dictionary mapping request IDs to responses
+
+        Raises:
+            BatchInferenceUnsupportedRequestError: If the record formatter does not
+                support the model or a request cannot be formatted
+            BatchInferenceError: If a job cannot be submitted, polled or read, or does
+                not finish within ``max_wait_seconds``
+        """
+        if not self._formatter.supports_model_id(model_id=model_id):
+            raise BatchInferenceUnsupportedRequestError(
+                message=BatchInferenceErrorMessages.UNSUPPORTED_MODEL.format(model_id=model_id)
+            )
+        records: _JobRecords = [
+            (f"{index:011d}", request.request_id or "", self._formatter.to_model_input(request))
+            for index, request in enumerate(requests, start=1)
+        ]
+
+        job_count = self.get_job_count(request_count=len(records))
+        job_size = math.ceil(len(records) / job_count)
+        self._logger.info(
+            BatchInferenceLogMessages.ROUTED_TO_BATCH.format(
+                request_count=len(records), job_count=job_count
+            )
+        )
+
+        self._last_jobs = []
+        jobs: List[Tuple[BatchInferenceJobInfo, _JobRecords]] = []
+        run_id = f"{datetime.now():%Y%m%d%H%M%S}-{uuid.uuid4().hex[:8]}"
+        for job_index in range(job_count):
+            job_records = records[job_index * job_size : (job_index + 1) * job_size]
+            job_name = f"{self._config.job_name_prefix}-{run_id}-{job_index}"
+            job = self._submit_job(job_name=job_name, records=job_records, model_id=model_id)
+            self._last_jobs.append(job)
+            jobs.append((job, job_records))
+
+        self._wait_for_jobs(jobs=[job for job, _ in jobs])
+
+        responses: Dict[str, BedrockResponse] = {}
+        for job, job_records in jobs:
+            responses.update(
+                self._collect_job_results(job=job, records=job_records, model_id=model_id)
+            )
+        return responses
+
+    def get_last_jobs(self) -> List[BatchInferenceJobInfo]:
+        """
+        Get the jobs submitted by the most recent execute_requests() call.
+
+        Returns:
+            List of job information objects
+        """
+        return list(self._last_jobs)
+
+    def _submit_job(
+        self, job_name: str, records: _JobRecords, model_id: str
+    ) -> BatchInferenceJobInfo:
+        """
+        Upload a job's input file and create the model invocation job.
+
+        Args:
+            job_name: Name of the job
+            records: Records of the job
+            model_id: Model or inference profile ID
+
+        Returns:
+            Information about the submitted job
+
+        Raises:
+            BatchInferenceError: If the upload or the submission fails
+        """
+        input_bucket, input_prefix = parse_s3_uri(uri=self._config.s3_input_uri)
+        output_bucket, output_prefix = parse_s3_uri(uri=self._config.s3_output_uri)
+        input_key = "/".join(
+            part
+            for part in (input_prefix, job_name, BatchInferenceDefaults.INPUT_FILE_NAME)
+            if part
+        )
+        output_uri = (
+            "s3://"
+            + "/".join(part for part in (output_bucket, output_prefix, job_name) if part)
+            + "/"
+        )
+        input_uri = f"s3://{input_bucket}/{input_key}"
+
+        body = "\n".join(
+            json.dumps(
+                {
+                    BatchInferenceFields.RECORD_ID: record_id,
+                    BatchInferenceFields.MODEL_INPUT: model_input,
+                }
+            )
+            for record_id, _, model_input in records
+        )
+
+        try:
+            self._s3_client.put_object(
+                **{
+                    BatchInferenceFields.BUCKET: input_bucket,
+                    BatchInferenceFields.KEY: input_key,
+                    BatchInferenceFields.BODY: (body + "\n").encode("utf-8"),
+                }
+            )
+            result = self._bedrock_client.create_model_invocation_job(
+                **{
+                    BatchInferenceFields.JOB_NAME: job_name,
+                    BatchInferenceFields.ROLE_ARN: self._config.role_arn,
+                    BatchInferenceFields.MODEL_ID: model_id,
+                    BatchInferenceFields.INPUT_DATA_CONFIG: {
+                        BatchInferenceFields.S3_INPUT_DATA_CONFIG: {
+                            BatchInferenceFields.S3_URI: input_uri
+                        }
+                    },
+                    BatchInferenceFields.OUTPUT_DATA_CONFIG: {
+                        BatchInferenceFields.S3_OUTPUT_DATA_CONFIG: {
+                            BatchInferenceFields.S3_URI: output_uri
+                        }
+                    },
+                    BatchInferenceFields.TIMEOUT_DURATION_IN_HOURS: self._config.job_timeout_hours,
+                }
+            )
+        except Exception as e:
+            raise BatchInferenceError(
+                message=BatchInferenceErrorMessages.SUBMISSION_FAILED.format(
+                    job_name=job_name, error=str(e)
+                )
+            ) from e
+
+        job = BatchInferenceJobInfo(
+            job_name=job_name,
+            job_arn=result[BatchInferenceFields.JOB_ARN],
+            input_uri=input_uri,
+            output_uri=output_uri,
+            record_count=len(records),
+            status=BatchJobStatus.SUBMITTED,
+            submitted_at=datetime.now(),
+        )
+        self._logger.info(
+            BatchInferenceLogMessages.JOB_SUBMITTED.format(job_name=job_name, job_arn=job.job_arn)
+        )
+        return job
+
+    def _wait_for_jobs(self, jobs: List[BatchInferenceJobInfo]) -> None:
+        """
+        Poll jobs with exponential backoff until all of them reach a terminal status.
+
+        Args:
+            jobs: Jobs to wait for (updated in place)
+
+        Raises:
+            BatchInferenceError: If polling fails or the wait times out
+        """
+        deadline = (
+            self._clock() + self._config.max_wait_seconds
+            if self._config.max_wait_seconds is not None
+            else None
+        )
+        delay = self._config.poll_initial_delay_seconds
+
+        while True:
+            pending = [job for job in jobs if job.status not in BatchJobStatus.TERMINAL]
+            if not pending:
+                return
+
+            if deadline is not None:
+                remaining = deadline - self._clock()
+                if remaining <= 0:
+                    raise BatchInferenceError(
+                        message=BatchInferenceErrorMessages.WAIT_TIMEOUT.format(
+                            job_arn=pending[0].job_arn,
+                            timeout_seconds=self._config.max_wait_seconds,
+                        ),
+                        job_arn=pending[0].job_arn,
+                    )
+                self._sleep(min(delay, remaining))
+            else:
+                self._sleep(delay)
+            delay = min(
+                delay * self._config.poll_backoff_multiplier, self._config.poll_max_delay_seconds
+            )
+
+            for job in pending:
+                self._poll_job(job=job)
+
+    def _poll_job(self, job: BatchInferenceJobInfo) -> None:
+        """
+        Refresh the status of one job.
+
+        Args:
+            job: Job to poll (updated in place)
+
+        Raises:
+            BatchInferenceError: If the status request fails
+        """
+        try:
+            result = self._bedrock_client.get_model_invocation_job(
+                **{BatchInferenceFields.JOB_IDENTIFIER: job.job_arn}
+            )
+        except Exception as e:
+            raise BatchInferenceError(
+                message=BatchInferenceErrorMessages.POLL_FAILED.format(
+                    job_arn=job.job_arn, error=str(e)
+                ),
+                job_arn=job.job_arn,
+            ) from e
+
+        job.status = result.get(BatchInferenceFields.STATUS)
+        job.message = result.get(BatchInferenceFields.MESSAGE)
+        self._logger.debug(
+            BatchInferenceLogMessages.JOB_STATUS.format(job_arn=job.job_arn, status=job.status)
+        )
+        if job.status in BatchJobStatus.TERMINAL:
+            job.finished_at = datetime.now()
+            self._logger.info(
+                BatchInferenceLogMessages.JOB_FINISHED.format(
+                    job_arn=job.job_arn, status=job.status
+                )
+            )
+
+    def _collect_job_results(
+        self, job: BatchInferenceJobInfo, records: _JobRecords, model_id: str
+    ) -> Dict[str, BedrockResponse]:
+        """
+        Map a finished job's output records to responses.
+
+        Args:
+            job: Finished job
+            records: Records the job was submitted with
+            model_id: Model or inference profile ID the job ran against
+
+        Returns:
+            Dictionary mapping request IDs to responses
+        """
+        outputs: Dict[str, Dict[str, Any]] = {}
+        if job.status in BatchJobStatus.WITH_OUTPUT:
+            outputs = self._read_job_output(job=job)
+
+        duration_ms = None
+        if job.submitted_at is not None and job.finished_at is not None:
+            duration_ms = (job.finished_at - job.submitted_at).total_seconds() * 1000
+
+        responses: Dict[str, BedrockResponse] = {}
+        for record_id, request_id, _ in records:
+            output = outputs.get(record_id)
+            if output is None:
+                if job.status in BatchJobStatus.WITH_OUTPUT:
+                    warning = BatchInferenceErrorMessages.RECORD_MISSING.format(job_arn=job.job_arn)
+                else:
+                    warning = BatchInferenceErrorMessages.JOB_NOT_SUCCESSFUL.format(
+                        job_arn=job.job_arn, status=job.status
+                    )
+                responses[request_id] = self._create_failed_response(
+                    warning=warning, model_id=model_id, duration_ms=duration_ms
+                )
+            elif BatchInferenceFields.MODEL_OUTPUT in output:
+                responses[request_id] = BedrockResponse(
+                    success=True,
+                    response_data=self._formatter.to_response_data(
+                        model_output=output[BatchInferenceFields.MODEL_OUTPUT]
+                    ),
+                    model_used=model_id,
+                    region_used=self._region,
+                    access_method_used=BatchInferenceDefaults.ACCESS_METHOD_NAME,
+                    total_duration_ms=duration_ms,
+                )
+            else:
+                error = output.get(BatchInferenceFields.ERROR) or {}
+                responses[request_id] = self._create_failed_response(
+                    warning=BatchInferenceErrorMessages.RECORD_FAILED.format(
+                        error_code=error.get(BatchInferenceFields.ERROR_CODE),
+                        error_message=error.get(BatchInferenceFields.ERROR_MESSAGE),
+                    ),
+                    model_id=model_id,
+                    duration_ms=duration_ms,
+                )
+        return responses
+
+    def _read_job_output(self, job: BatchInferenceJobInfo) -> Dict[str, Dict[str, Any]]:
+        """
+        Read all output records of a job.
+
+        Args:
+            job: Finished job
+
+        Returns:
+            Dictionary mapping record IDs to output records
+
+        Raises:
+            BatchInferenceError: If the output cannot be listed or read
+        """
+        bucket, prefix = parse_s3_uri(uri=job.output_uri)
+        outputs: Dict[str, Dict[str, Any]] = {}
+        try:
+            for key in self._list_keys(bucket=bucket, prefix=prefix + "/"):
+                if not key.endswith(BatchInferenceDefaults.OUTPUT_FILE_SUFFIX):
+                    continue
+                body = self._s3_client.get_object(
+                    **{BatchInferenceFields.BUCKET: bucket, BatchInferenceFields.KEY: key}
+                )[BatchInferenceFields.BODY]
+                for line in body.iter_lines():
+                    if not line.strip():
+                        continue
+                    record = json.loads(line)
+                    outputs[record.get(BatchInferenceFields.RECORD_ID)] = record
+        except Exception as e:
+            raise BatchInferenceError(
+                message=BatchInferenceErrorMessages.OUTPUT_READ_FAILED.format(
+                    job_arn=job.job_arn, error=str(e)
+                ),
+                job_arn=job.job_arn,
+            ) from e
+        return outputs
+
+    def _list_keys(self, bucket: str, prefix: str) -> List[str]:
+        """
+        List all object keys under a prefix, following continuation tokens.
+
+        Args:
+            bucket: Bucket name
+            prefix: Key prefix
+
+        Returns:
+            List of object keys
+        """
+        keys: List[str] = []
+        request: Dict[str, Any] = {
+            BatchInferenceFields.BUCKET: bucket,
+            BatchInferenceFields.PREFIX: prefix,
+        }
+        while True:
+            page = self._s3_client.list_objects_v2(**request)
+            keys.extend(
+                item[BatchInferenceFields.KEY]
+                for item in page.get(BatchInferenceFields.CONTENTS, [])
+            )
+            if not page.get(BatchInferenceFields.IS_TRUNCATED):
+                return keys
+            request[BatchInferenceFields.CONTINUATION_TOKEN] = page[
+                BatchInferenceFields.NEXT_CONTINUATION_TOKEN
+            ]
+
+    def _create_failed_response(
+        self, warning: str, model_id: str, duration_ms: Optional[float]
+    ) -> BedrockResponse:
+        """
+        Create a failed response for a batch inference record.
+
+        Args:
+            warning: Failure description
+            model_id: Model or inference profile ID the job ran against
+            duration_ms: Job duration
+
+        Returns:
+            Failed BedrockResponse
+        """
+        return BedrockResponse(
+            success=False,
+            model_used=model_id,
+            region_used=self._region,
+            access_method_used=BatchInferenceDefaults.ACCESS_METHOD_NAME,
+            total_duration_ms=duration_ms,
+            warnings=[warning],
+        )
@@ -0,0 +1,327 @@
+"""
+Conversion between Converse requests/responses and batch inference records.
+
+Bedrock model invocation jobs take the model-native InvokeModel body as ``modelInput``
+and return the model-native response as ``modelOutput``. This module translates the
+Converse-shaped ``BedrockConverseRequest`` into the Anthropic Messages body used by
+Claude models and maps the output back to a Converse-shaped ``response_data`` so that
+``BedrockResponse`` accessors work unchanged.
+"""
+
+import base64
+import json
+from typing import Any, Dict, List, Optional
+
+from ..exceptions.parallel_exceptions import BatchInferenceUnsupportedRequestError
+from ..models.batch_inference_constants import (
+    AnthropicBatchFields,
+    BatchInferenceDefaults,
+    BatchInferenceErrorMessages,
+    BatchInferenceFields,
+)
+from ..models.llm_manager_constants import ConverseAPIFields
+from ..models.parallel_structures import BedrockConverseRequest
+
+
+class AnthropicBatchRecordFormatter:
+    """
+    Formats batch inference records for Anthropic Claude models.
+
+    Supports text, image, tool use and tool result content blocks, system prompts,
+    inference configuration, tool configuration and additional model request fields
+    (merged into the body, e.g. ``top_k`` or ``thinking``). Requests with other content
+    blocks (documents, video, guard content, cache points) raise
+    BatchInferenceUnsupportedRequestError and should be sent on-demand instead.
+    """
+
+    _IMAGE_MEDIA_TYPES: Dict[str, str] = {
+        "png": "image/png",
+        "jpeg": "image/jpeg",
+        "jpg": "image/jpeg",
+        "gif": "image/gif",
+        "webp": "image/webp",
+    }
+
+    _STOP_REASONS: Dict[str, str] = {
+        "end_turn": "end_turn",
+        "max_tokens": "max_tokens",
+        "stop_sequence": "stop_sequence",
+        "tool_use": "tool_use",
+        "refusal": "content_filtered",
+    }
+
+    def supports_model_id(self, model_id: str) -> bool:
+        """
+        Check whether jobs against a model can take the records of this formatter.
+
+        Args:
+            model_id: Model ID, inference profile ID or ARN the jobs run against
+
+        Returns:
+            True for Anthropic Claude models
+        """
+        return AnthropicBatchFields.MODEL_ID_MARKER in model_id.lower()
+
+    def to_model_input(self, request: BedrockConverseRequest) -> Dict[str, Any]:
+        """
+        Build the Anthropic Messages body for a request.
+
+        Args:
+            request: Request to format
+
+        Returns:
+            Model input dictionary
+
+        Raises:
+            BatchInferenceUnsupportedRequestError: If the request contains unsupported content
+        """
+        request_id = request.request_id or ""
+        body: Dict[str, Any] = {
+            AnthropicBatchFields.ANTHROPIC_VERSION: AnthropicBatchFields.ANTHROPIC_VERSION_VALUE,
+            AnthropicBatchFields.MAX_TOKENS: BatchInferenceDefaults.DEFAULT_MAX_TOKENS,
+            AnthropicBatchFields.MESSAGES: [
+                {
+                    AnthropicBatchFields.ROLE: message[ConverseAPIFields.ROLE],
+                    AnthropicBatchFields.CONTENT: self._convert_blocks(
+                        blocks=message.get(ConverseAPIFields.CONTENT, []),
+                        request_id=request_id,
+                    ),
+                }
+                for message in request.messages
+            ],
+        }
+
+        if request.system:
+            body[AnthropicBatchFields.SYSTEM] = self._convert_blocks(
+                blocks=request.system, request_id=request_id
+            )
+
+        inference_config = request.inference_config or {}
+        for converse_key, anthropic_key in (
+            (ConverseAPIFields.MAX_TOKENS, AnthropicBatchFields.MAX_TOKENS),
+            (ConverseAPIFields.TEMPERATURE, AnthropicBatchFields.TEMPERATURE),
+            (ConverseAPIFields.TOP_P, AnthropicBatchFields.TOP_P),
+            (ConverseAPIFields.STOP_SEQUENCES, AnthropicBatchFields.STOP_SEQUENCES),
+        ):
+            if converse_key in inference_config:
+                body[anthropic_key] = inference_config[converse_key]
+
+        if request.tool_config:
+            body.update(self._convert_tool_config(tool_config=request.tool_config))
+
+        if request.additional_model_request_fields:
+            body.update(request.additional_model_request_fields)
+
+        return body
+
+    def to_response_data(self, model_output: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Map an Anthropic Messages response to Converse-shaped response data.
+
+        Args:
+            model_output: ``modelOutput`` of a batch inference output record
+
+        Returns:
+            Dictionary shaped like a Converse API response
+        """
+        content: List[Dict[str, Any]] = []
+        for block in model_output.get(AnthropicBatchFields.CONTENT, []):
+            block_type = block.get(AnthropicBatchFields.TYPE)
+            if block_type == AnthropicBatchFields.TEXT:
+                content.append({ConverseAPIFields.TEXT: block.get(AnthropicBatchFields.TEXT, "")})
+            elif block_type == AnthropicBatchFields.TOOL_USE:
+                content.append(
+                    {
+                        ConverseAPIFields.TOOL_USE: {
+                            ConverseAPIFields.TOOL_USE_ID: block.get(AnthropicBatchFields.ID),
+                            ConverseAPIFields.TOOL_NAME: block.get(AnthropicBatchFields.NAME),
+                            ConverseAPIFields.TOOL_INPUT: block.get(AnthropicBatchFields.INPUT),
+                        }
+                    }
+                )
+            elif block_type == AnthropicBatchFields.THINKING:
+                content.append(
+                    {
+                        ConverseAPIFields.REASONING_CONTENT: {
+                            ConverseAPIFields.REASONING_TEXT: {
+                                ConverseAPIFields.TEXT: block.get(AnthropicBatchFields.THINKING),
+                                ConverseAPIFields.REASONING_SIGNATURE: block.get(
+                                    AnthropicBatchFields.SIGNATURE
+                                ),
+                            }
+                        }
+                    }
+                )
+
+        usage = model_output.get(AnthropicBatchFields.USAGE) or {}
+        input_tokens = usage.get(AnthropicBatchFields.INPUT_TOKENS, 0)
+        output_tokens = usage.get(AnthropicBatchFields.OUTPUT_TOKENS, 0)
+        converse_usage = {
+            ConverseAPIFields.INPUT_TOKENS: input_tokens,
+            ConverseAPIFields.OUTPUT_TOKENS: output_tokens,
+            ConverseAPIFields.TOTAL_TOKENS: input_tokens + output_tokens,
+        }
+        if AnthropicBatchFields.CACHE_READ_INPUT_TOKENS in usage:
+            converse_usage[ConverseAPIFields.CACHE_READ_INPUT_TOKENS_COUNT] = usage[
+                AnthropicBatchFields.CACHE_READ_INPUT_TOKENS
+            ]
+        if AnthropicBatchFields.CACHE_CREATION_INPUT_TOKENS in usage:
+            converse_usage[ConverseAPIFields.CACHE_WRITE_INPUT_TOKENS_COUNT] = usage[
+                AnthropicBatchFields.CACHE_CREATION_INPUT_TOKENS
+            ]
+
+        stop_reason = model_output.get(AnthropicBatchFields.STOP_REASON)
+        return {
+            ConverseAPIFields.OUTPUT: {
+                ConverseAPIFields.MESSAGE: {
+                    ConverseAPIFields.ROLE: model_output.get(
+                        AnthropicBatchFields.ROLE, "assistant"
+                    ),
+                    ConverseAPIFields.CONTENT: content,
+                }
+            },
+            ConverseAPIFields.STOP_REASON: self._STOP_REASONS.get(stop_reason or "", stop_reason),
+            ConverseAPIFields.USAGE: converse_usage,
+        }
+
+    def _convert_blocks(
+        self, blocks: List[Dict[str, Any]], request_id: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Convert Converse content blocks to Anthropic content blocks.
+
+        Args:
+            blocks: Converse content blocks
+            request_id: ID of the request, for error messages
+
+        Returns:
+            Anthropic content blocks
+
+        Raises:
+            BatchInferenceUnsupportedRequestError: If a block type is not supported
+        """
+        converted: List[Dict[str, Any]] = []
+        unsupported: List[str] = []
+        for block in blocks:
+            anthropic_block = self._convert_block(block=block)
+            if anthropic_block is None:
+                unsupported.extend(sorted(block.keys()))
+            else:
+                converted.append(anthropic_block)
+
+        if unsupported:
+            raise BatchInferenceUnsupportedRequestError(
+                message=BatchInferenceErrorMessages.UNSUPPORTED_CONTENT_BLOCK.format(
+                    block_types=sorted(set(unsupported)), request_id=request_id
+                ),
+                request_id=request_id,
+            )
+        return converted
+
+    def _convert_block(self, block: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Convert one Converse content block.
+
+        Args:
+            block: Converse content block
+
+        Returns:
+            Anthropic content block, or None if the block type is not supported
+        """
+        if ConverseAPIFields.TEXT in block:
+            return {
+                AnthropicBatchFields.TYPE: AnthropicBatchFields.TEXT,
+                AnthropicBatchFields.TEXT: block[ConverseAPIFields.TEXT],
+            }
+
+        if ConverseAPIFields.IMAGE in block:
+            image = block[ConverseAPIFields.IMAGE]
+            data = image.get(ConverseAPIFields.SOURCE, {}).get(ConverseAPIFields.BYTES)
+            media_type = self._IMAGE_MEDIA_TYPES.get(str(image.get(ConverseAPIFields.FORMAT)))
+            if not isinstance(data, (bytes, bytearray)) or media_type is None:
+                return None
+            return {
+                AnthropicBatchFields.TYPE: AnthropicBatchFields.IMAGE,
+                AnthropicBatchFields.SOURCE: {
+                    AnthropicBatchFields.TYPE: AnthropicBatchFields.BASE64,
+                    AnthropicBatchFields.MEDIA_TYPE: media_type,
+                    AnthropicBatchFields.DATA: base64.b64encode(data).decode("ascii"),
+                },
+            }
+
+        if ConverseAPIFields.TOOL_USE in block:
+            tool_use = block[ConverseAPIFields.TOOL_USE]
+            return {
+                AnthropicBatchFields.TYPE: AnthropicBatchFields.TOOL_USE,
+                AnthropicBatchFields.ID: tool_use.get(ConverseAPIFields.TOOL_USE_ID),
+                AnthropicBatchFields.NAME: tool_use.get(ConverseAPIFields.TOOL_NAME),
+                AnthropicBatchFields.INPUT: tool_use.get(ConverseAPIFields.TOOL_INPUT, {}),
+            }
+
+        if ConverseAPIFields.TOOL_RESULT in block:
+            tool_result = block[ConverseAPIFields.TOOL_RESULT]
+            content: List[Dict[str, Any]] = []
+            for item in tool_result.get(ConverseAPIFields.TOOL_RESULT_CONTENT, []):
+                if ConverseAPIFields.TOOL_RESULT_JSON in item:
+                    content.append(
+                        {
+                            AnthropicBatchFields.TYPE: AnthropicBatchFields.TEXT,
+                            AnthropicBatchFields.TEXT: json.dumps(
+                                item[ConverseAPIFields.TOOL_RESULT_JSON]
+                            ),
+                        }
+                    )
+                else:
+                    converted = self._convert_block(block=item)
+                    if converted is None:
+                        return None
+                    content.append(converted)
+            result: Dict[str, Any] = {
+                AnthropicBatchFields.TYPE: AnthropicBatchFields.TOOL_RESULT,
+                AnthropicBatchFields.TOOL_USE_ID: tool_result.get(ConverseAPIFields.TOOL_USE_ID),
+                AnthropicBatchFields.CONTENT: content,
+            }
+            if tool_result.get(ConverseAPIFields.TOOL_RESULT_STATUS) == "error":
+                result[AnthropicBatchFields.IS_ERROR] = True
+            return result
+
+        return None
+
+    def _convert_tool_config(self, tool_config: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Convert a Converse toolConfig to Anthropic ``tools`` / ``tool_choice``.
+
+        Args:
+            tool_config: Converse tool configuration
+
+        Returns:
+            Dictionary with the Anthropic tool fields
+        """
+        tools = []
+        for tool in tool_config.get(ConverseAPIFields.TOOLS, []):
+            spec = tool.get(BatchInferenceFields.TOOL_SPEC)
+            if spec is None:
+                # Cache points and other non-spec entries have no Anthropic equivalent.
+                continue
+            tools.append(
+                {
+                    AnthropicBatchFields.NAME: spec.get(ConverseAPIFields.NAME),
+                    AnthropicBatchFields.DESCRIPTION: spec.get(
+                        AnthropicBatchFields.DESCRIPTION, ""
+                    ),
+                    AnthropicBatchFields.INPUT_SCHEMA: spec.get(
+                        BatchInferenceFields.INPUT_SCHEMA, {}
+                    ).get(ConverseAPIFields.TOOL_RESULT_JSON, {}),
+                }
+            )
+
+        result: Dict[str, Any] = {AnthropicBatchFields.TOOLS: tools}
+        tool_choice = tool_config.get(BatchInferenceFields.TOOL_CHOICE) or {}
+        # Converse tool choices {"auto": {}}, {"any": {}} and {"tool": {"name": ...}} map
+        # one-to-one onto Anthropic's {"type": ...}.
+        for choice_type, choice_value in tool_choice.items():
+            anthropic_choice = {AnthropicBatchFields.TYPE: choice_type}
+            if isinstance(choice_value, dict) and ConverseAPIFields.NAME in choice_value:
+                anthropic_choice[AnthropicBatchFields.NAME] = choice_value[ConverseAPIFields.NAME]
+            result[AnthropicBatchFields.TOOL_CHOICE] = anthropic_choice
+        return result
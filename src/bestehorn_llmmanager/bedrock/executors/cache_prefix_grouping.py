@@ -0,0 +1,85 @@
+"""
+Grouping of parallel requests by their cacheable prompt prefix.
+
+Bedrock caches a prompt prefix per region once a request with a cache point completes.
+Requests of a batch that share a prefix and start together all miss the cache and each
+write the prefix. The functions here find such groups so the executor can send one
+"primer" request per group first and release the rest of the group to the primer's
+region once the prefix is cached there.
+"""
+
+import hashlib
+from typing import Any, Dict, Iterator, List, Mapping
+
+from ...util.canonical_json import canonical_json_dumps
+from ..models.llm_manager_constants import ConverseAPIFields
+from ..models.parallel_structures import BedrockConverseRequest
+
+
+def _prompt_blocks(request: BedrockConverseRequest) -> Iterator[Any]:
+    """Yield the blocks of a request in prompt-cache order: tools, system, messages."""
+    tool_config = request.tool_config or {}
+    yield from tool_config.get(ConverseAPIFields.TOOLS) or []
+    yield from request.system or []
+    for message in request.messages:
+        yield {ConverseAPIFields.ROLE: message.get(ConverseAPIFields.ROLE)}
+        yield from message.get(ConverseAPIFields.CONTENT) or []
+
+
+def compute_cache_prefix_keys(request: BedrockConverseRequest) -> List[str]:
+    """
+    Compute the prefix key of every cache point of a request.
+
+    The key of a cache point is a SHA-256 hash of the canonical JSON form of all tools,
+    system blocks and message blocks (with their roles) before it, so two requests share
+    a key only if their prompts are identical up to that cache point.
+
+    Args:
+        request: Request to inspect
+
+    Returns:
+        Hex digests of the prefixes ending at each cache point, shortest first
+        (empty if the request has no cache points)
+    """
+    digest = hashlib.sha256()
+    keys: List[str] = []
+    for block in _prompt_blocks(request=request):
+        if isinstance(block, dict) and ConverseAPIFields.CACHE_POINT in block:
+            keys.append(digest.hexdigest())
+            continue
+        digest.update(canonical_json_dumps(obj=block).encode("utf-8"))
+    return keys
+
+
+def group_requests_by_cache_prefix(
+    requests: Mapping[str, BedrockConverseRequest],
+) -> Dict[str, List[str]]:
+    """
+    Group requests that share a cacheable prompt prefix.
+
+    Each request joins the group of the shortest prefix it shares with another request,
+    so every member shares at least that prefix with the group's first request; members
+    sharing a longer prefix with it read that longer prefix from the cache as well.
+    Requests without cache points or without a shared prefix are not grouped.
+
+    Args:
+        requests: Requests by request ID, in dispatch order
+
+    Returns:
+        Request IDs by prefix key, in dispatch order, for groups of two or more requests
+    """
+    keys_by_request = {
+        request_id: compute_cache_prefix_keys(request=request)
+        for request_id, request in requests.items()
+    }
+    counts: Dict[str, int] = {}
+    for keys in keys_by_request.values():
+        for key in set(keys):
+            counts[key] = counts.get(key, 0) + 1
+
+    groups: Dict[str, List[str]] = {}
+    for request_id, keys in keys_by_request.items():
+        shared = [key for key in keys if counts[key] > 1]
+        if shared:
+            groups.setdefault(shared[0], []).append(request_id)
+    return {key: request_ids for key, request_ids in groups.items() if len(request_ids) > 1}
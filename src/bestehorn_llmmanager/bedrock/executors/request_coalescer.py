@@ -0,0 +1,115 @@
+"""
+Single-flight coalescing of identical in-flight requests.
+
+RequestCoalescer lets concurrent callers with the same request key share one
+execution: the first caller runs the operation, callers arriving while it is in
+flight wait for and receive the same result (or exception). Nothing is cached -
+once the execution finishes, the next caller with that key executes again.
+"""
+
+import hashlib
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Generic, Mapping, TypeVar
+
+from ...util.canonical_json import canonical_json_dumps
+from ..models.parallel_constants import ParallelLogMessages
+
+T = TypeVar("T")
+
+
+def compute_request_key(request_args: Mapping[str, Any]) -> str:
+    """
+    Compute the coalescing key of a request.
+
+    The key is a SHA-256 hash of the canonical JSON form of all arguments, so two
+    requests share a key only if every argument sent to Bedrock is equal. Binary
+    content is hashed; objects without a value representation (e.g. validator
+    functions) only match themselves.
+
+    Args:
+        request_args: Converse arguments (e.g. BedrockConverseRequest.to_converse_args())
+
+    Returns:
+        Hex digest identifying the request content
+    """
+    canonical = canonical_json_dumps(
+        obj={key: value for key, value in request_args.items() if value is not None}
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class RequestCoalescer(Generic[T]):
+    """
+    Thread-safe single-flight group keyed by request content.
+
+    Callers that join an in-flight execution share its result object; treat shared
+    results as read-only.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty group."""
+        self._logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, "Future[T]"] = {}
+        self._executed_count = 0
+        self._coalesced_count = 0
+
+    def execute(self, key: str, operation: Callable[[], T]) -> T:
+        """
+        Run an operation, or join the in-flight execution with the same key.
+
+        Args:
+            key: Request key (see compute_request_key)
+            operation: Executes the request
+
+        Returns:
+            The operation's result, shared with coalesced callers
+
+        Raises:
+            Exception: Whatever the operation raised, re-raised in every coalesced caller
+        """
+        with self._lock:
+            future = self._in_flight.get(key)
+            is_leader = future is None
+            if future is None:
+                future = Future()
+                self._in_flight[key] = future
+                self._executed_count += 1
+            else:
+                self._coalesced_count += 1
+
+        if not is_leader:
+            self._logger.debug(ParallelLogMessages.REQUEST_COALESCED.format(request_key=key[:16]))
+            return future.result()
+
+        try:
+            result = operation()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+    @property
+    def executed_count(self) -> int:
+        """Number of executions started."""
+        with self._lock:
+            return self._executed_count
+
+    @property
+    def coalesced_count(self) -> int:
+        """Number of callers that joined an in-flight execution instead of executing."""
+        with self._lock:
+            return self._coalesced_count
+
+    @property
+    def in_flight_count(self) -> int:
+        """Number of executions currently in flight."""
+        with self._lock:
+            return len(self._in_flight)
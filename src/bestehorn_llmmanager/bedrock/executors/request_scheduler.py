@@ -0,0 +1,75 @@
+"""
+Dispatch queue for thread-based parallel execution.
+
+RequestScheduler orders pending region assignments by request priority, then by
+earliest deadline, so interactive requests mixed into a large batch are dispatched
+ahead of background work. With prioritization disabled it behaves as a FIFO queue.
+"""
+
+import heapq
+import itertools
+import math
+from typing import List, Optional, Tuple
+
+from ..models.parallel_structures import BedrockConverseRequest, RegionAssignment
+
+
+class RequestScheduler:
+    """
+    Priority queue of region assignments awaiting dispatch.
+
+    Ordering (with prioritization enabled):
+    1. Higher BedrockConverseRequest.priority first
+    2. Earlier deadline first (requests without a deadline last)
+    3. Insertion order
+    """
+
+    def __init__(self, prioritize: bool = True) -> None:
+        """
+        Initialize an empty scheduler.
+
+        Args:
+            prioritize: Order by priority and deadline; False keeps insertion (FIFO) order
+        """
+        self._prioritize = prioritize
+        self._heap: List[Tuple[int, float, int, RegionAssignment]] = []
+        self._sequence = itertools.count()
+
+    def push(
+        self, assignment: RegionAssignment, request: Optional[BedrockConverseRequest] = None
+    ) -> None:
+        """
+        Add an assignment to the queue.
+
+        Args:
+            assignment: Region assignment to dispatch
+            request: Request the assignment belongs to; its priority and deadline take
+                precedence over the assignment's priority
+        """
+        priority = assignment.priority
+        deadline = math.inf
+        if request is not None:
+            priority = request.priority
+            if request.deadline is not None:
+                deadline = request.deadline
+
+        if not self._prioritize:
+            priority, deadline = 0, math.inf
+
+        heapq.heappush(self._heap, (-priority, deadline, next(self._sequence), assignment))
+
+    def pop(self) -> RegionAssignment:
+        """
+        Remove and return the next assignment to dispatch.
+
+        Returns:
+            Highest-ranked pending assignment
+
+        Raises:
+            IndexError: If the scheduler is empty
+        """
+        return heapq.heappop(self._heap)[3]
+
+    def __len__(self) -> int:
+        """Return the number of pending assignments."""
+        return len(self._heap)
@@ -3,24 +3,35 @@ Thread-based parallel execution engine for LLM Manager system.
 Handles synchronous execution of requests using ThreadPoolExecutor for concurrency control.
 """
 
-import collections
 import concurrent.futures
+import dataclasses
+import heapq
+import itertools
 import logging
 import math
 import threading
 import time
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, cast
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, cast
 
 from ..exceptions.parallel_exceptions import ParallelExecutionError, RequestTimeoutError
+from ..instrumentation.instrumentation_registry import is_instrumentation_enabled, record_metric
 from ..models.bedrock_response import BedrockResponse
+from ..models.instrumentation_constants import (
+    InstrumentationAttributes,
+    InstrumentationMetricNames,
+)
+from ..models.latency_structures import ParallelLatencyStats
 from ..models.llm_manager_structures import RetryConfig
 from ..models.parallel_constants import ParallelErrorMessages, ParallelLogMessages
 from ..models.parallel_structures import (
     BedrockConverseRequest,
     ParallelProcessingConfig,
+    ParallelStatsAccumulator,
     RegionAssignment,
 )
+from .cache_prefix_grouping import group_requests_by_cache_prefix
+from .request_scheduler import RequestScheduler
 
 
 class ThreadExecutionContext:
@@ -219,6 +230,51 @@ class ThreadParallelExecutor:
             priority=previous_assignment.priority,
         )
 
+    def _hold_cache_prefix_groups(
+        self,
+        assignments: List[RegionAssignment],
+        request_map: Dict[str, BedrockConverseRequest],
+    ) -> Dict[str, List[RegionAssignment]]:
+        """
+        Pick a primer request for every group of requests sharing a cache prefix.
+
+        The highest-priority (then first) request of each group is the primer; the
+        other members are held until it completes.
+
+        Args:
+            assignments: Region assignments in dispatch order
+            request_map: Dictionary mapping request_id to BedrockConverseRequest
+
+        Returns:
+            Held member assignments by primer request ID (empty unless cache-aware
+            scheduling is enabled)
+        """
+        if not self._config.enable_cache_aware_scheduling:
+            return {}
+
+        assignment_map = {assignment.request_id: assignment for assignment in assignments}
+        groups = group_requests_by_cache_prefix(
+            requests={
+                assignment.request_id: request_map[assignment.request_id]
+                for assignment in assignments
+                if assignment.request_id in request_map
+            }
+        )
+        held: Dict[str, List[RegionAssignment]] = {}
+        for request_ids in groups.values():
+            members = [assignment_map[request_id] for request_id in request_ids]
+            primer = max(members, key=lambda assignment: assignment.priority)
+            held[primer.request_id] = [member for member in members if member is not primer]
+
+        if held:
+            self._logger.info(
+                ParallelLogMessages.CACHE_PREFIX_GROUPS.format(
+                    held_count=sum(len(members) for members in held.values()),
+                    group_count=len(held),
+                )
+            )
+        return held
+
     def execute_requests_parallel(
         self,
         assignments: List[RegionAssignment],
@@ -226,6 +282,7 @@ class ThreadParallelExecutor:
         execute_single_request_func: Callable,
         retry_config: Optional[RetryConfig] = None,
         available_regions: Optional[List[str]] = None,
+        latency_stats: Optional[ParallelLatencyStats] = None,
     ) -> Dict[str, BedrockResponse]:
         """
         Execute multiple requests in parallel using ThreadPoolExecutor with automatic retry.
@@ -236,6 +293,8 @@ class ThreadParallelExecutor:
             execute_single_request_func: Function to execute a single request
             retry_config: Configuration for retry behavior (optional)
             available_regions: List of all available regions for redistribution (optional)
+            latency_stats: Optional statistics receiving the queue wait of every dispatch
+                and the peak number of requests executing at once
 
         Returns:
             Dictionary mapping request_id to BedrockResponse
@@ -254,6 +313,7 @@ class ThreadParallelExecutor:
                 execute_single_request_func=execute_single_request_func,
                 retry_config=retry_config,
                 available_regions=available_regions,
+                latency_stats=latency_stats,
             )
 
             self._log_execution_completion(responses=responses)
@@ -300,13 +360,20 @@ class ThreadParallelExecutor:
         execute_single_request_func: Callable,
         retry_config: Optional[RetryConfig] = None,
         available_regions: Optional[List[str]] = None,
+        latency_stats: Optional[ParallelLatencyStats] = None,
     ) -> Dict[str, BedrockResponse]:
         """
         Execute requests using ThreadPoolExecutor with retry queue and exponential backoff.
 
         This method implements a retry queue pattern that processes requests iteratively.
         Failed requests are automatically retried with exponential backoff if retry is
-        enabled and the request hasn't exceeded its retry limit.
+        enabled and the request hasn't exceeded its retry limit. Pending requests are
+        dispatched by priority and earliest deadline when request prioritization is
+        enabled; requests whose deadline passed while queued are not dispatched.
+
+        With cache-aware scheduling, requests sharing a cacheable prompt prefix are held
+        until the primer request of their group has a final response, then queued with
+        the primer's region as their preferred region.
 
         Args:
             assignments: List of region assignments
@@ -314,6 +381,8 @@ class ThreadParallelExecutor:
             execute_single_request_func: Function to execute single request
             retry_config: Configuration for retry behavior (optional)
             available_regions: List of all available regions for redistribution (optional)
+            latency_stats: Optional statistics receiving queue waits and the peak number of
+                requests executing at once
 
         Returns:
             Dictionary of responses
@@ -325,40 +394,44 @@ class ThreadParallelExecutor:
             )
         )
 
-        # Initialize retry queue with all initial assignments
-        retry_queue = collections.deque(assignments)
+        # Initialize dispatch queue with all initial assignments except held group members
+        held_assignments = self._hold_cache_prefix_groups(
+            assignments=assignments, request_map=request_map
+        )
+        held_ids = {
+            member.request_id for members in held_assignments.values() for member in members
+        }
+        retry_queue = RequestScheduler(prioritize=self._config.enable_request_prioritization)
+        for assignment in assignments:
+            if assignment.request_id not in held_ids:
+                retry_queue.push(
+                    assignment=assignment, request=request_map.get(assignment.request_id)
+                )
         responses: Dict[str, BedrockResponse] = {}
 
-        # Get retry configuration parameters with safe defaults
-        if retry_config is None:
-            enable_retry = self._config.enable_automatic_retry
-            max_retries = (
-                self._config.max_retries_per_request
-                if self._config.max_retries_per_request is not None
-                else 3
-            )
-            retry_delay = 1.0
-            backoff_multiplier = 2.0
-        else:
-            enable_retry = (
-                retry_config.enable_retry if hasattr(retry_config, "enable_retry") else True
-            )
-            max_retries = (
-                retry_config.max_retries
-                if hasattr(retry_config, "max_retries") and retry_config.max_retries is not None
-                else 3
-            )
-            retry_delay = (
-                retry_config.retry_delay
-                if hasattr(retry_config, "retry_delay") and retry_config.retry_delay is not None
-                else 1.0
-            )
-            backoff_multiplier = (
-                retry_config.backoff_multiplier
-                if hasattr(retry_config, "backoff_multiplier")
-                and retry_config.backoff_multiplier is not None
-                else 2.0
+        def finish(request_id: str, response: Optional[BedrockResponse]) -> None:
+            """Store a final response and release the group the request primed."""
+            if response is not None:
+                responses[request_id] = response
+            members = held_assignments.pop(request_id, None)
+            if not members:
+                return
+            region = response.region_used if response is not None and response.success else None
+            self._logger.debug(
+                ParallelLogMessages.CACHE_PREFIX_GROUP_RELEASED.format(
+                    request_id=request_id, member_count=len(members), region=region
+                )
             )
+            for member in members:
+                if region is not None:
+                    member = dataclasses.replace(
+                        member, assigned_regions=[region], preferred_region=region
+                    )
+                retry_queue.push(assignment=member, request=request_map.get(member.request_id))
+
+        enable_retry, max_retries, retry_delay, backoff_multiplier = self._resolve_retry_settings(
+            retry_config=retry_config
+        )
 
         # Track assignments currently being processed
         in_flight_assignments: Dict[str, Dict[str, Any]] = {}
@@ -374,11 +447,19 @@ class ThreadParallelExecutor:
                     retry_queue
                     and len(in_flight_assignments) < self._config.max_concurrent_requests
                 ):
-                    assignment = retry_queue.popleft()
+                    assignment = retry_queue.pop()
                     request = request_map.get(assignment.request_id)
 
                     if request is None:
                         self._logger.warning(f"Request not found for ID: {assignment.request_id}")
+                        finish(request_id=assignment.request_id, response=None)
+                        continue
+
+                    expired_response = self._check_deadline(
+                        request=request, request_id=assignment.request_id
+                    )
+                    if expired_response is not None:
+                        finish(request_id=assignment.request_id, response=expired_response)
                         continue
 
                     # Submit task for this request
@@ -387,6 +468,8 @@ class ThreadParallelExecutor:
                         request=request,
                         assignment=assignment,
                         execute_single_request_func=execute_single_request_func,
+                        submitted_at=time.perf_counter(),
+                        latency_stats=latency_stats,
                     )
 
                     in_flight_assignments[assignment.request_id] = {
@@ -421,88 +504,45 @@ class ThreadParallelExecutor:
                             response = future.result(timeout=1.0)
 
                             # Check if request failed and can be retried
-                            if not response.success and enable_retry:
-                                # Determine max_retries (request-specific or global)
-                                effective_max_retries = (
-                                    request.max_retries
-                                    if request.max_retries is not None
-                                    else max_retries
-                                )
-
-                                if request.can_retry(effective_max_retries):
-                                    # Extract error information from response
-                                    error_message = (
-                                        response.warnings[0]
-                                        if response.warnings
-                                        else "Unknown error"
-                                    )
-                                    exception = Exception(error_message)
-
-                                    # Get region from assignment
-                                    region = (
-                                        assignment.assigned_regions[0]
-                                        if assignment.assigned_regions
-                                        else None
-                                    )
-
-                                    # Record failure in request
-                                    request.record_failure(
-                                        exception=exception,
-                                        model=None,  # Model info not available in response
-                                        region=region,
-                                    )
-
-                                    # Apply exponential backoff
-                                    backoff_delay = retry_delay * (
-                                        backoff_multiplier**request.retry_count
-                                    )
-                                    self._logger.info(
-                                        f"Request {request_id} failed (attempt {request.retry_count}), "
-                                        f"retrying after {backoff_delay:.2f}s delay"
-                                    )
-                                    time.sleep(backoff_delay)
-
-                                    # Redistribute to new region if available
-                                    if available_regions:
-                                        new_assignment = self._redistribute_to_new_region(
-                                            request=request,
-                                            previous_assignment=assignment,
-                                            available_regions=available_regions,
-                                        )
-                                        self._logger.debug(
-                                            f"Redistributed request {request_id} to region: "
-                                            f"{new_assignment.assigned_regions}"
-                                        )
-                                    else:
-                                        # Reuse same assignment if no redistribution available
-                                        new_assignment = assignment
-
-                                    # Add back to retry queue
-                                    retry_queue.append(new_assignment)
-                                    continue  # Don't store response yet, will retry
-                                else:
-                                    self._logger.warning(
-                                        f"Request {request_id} exceeded max retries "
-                                        f"({effective_max_retries}), marking as failed"
-                                    )
+                            retry_plan = self._plan_retry(
+                                request=request,
+                                assignment=assignment,
+                                response=response,
+                                enable_retry=enable_retry,
+                                max_retries=max_retries,
+                                retry_delay=retry_delay,
+                                backoff_multiplier=backoff_multiplier,
+                                available_regions=available_regions,
+                            )
+                            if retry_plan is not None:
+                                new_assignment, backoff_delay = retry_plan
+                                time.sleep(backoff_delay)
+
+                                # Add back to retry queue
+                                retry_queue.push(assignment=new_assignment, request=request)
+                                continue  # Don't store response yet, will retry
 
                             # Store final response (either successful or max retries exceeded)
-                            responses[request_id] = response
+                            finish(request_id=request_id, response=response)
 
                         except concurrent.futures.TimeoutError:
                             self._logger.error(
                                 f"Timeout collecting result for request {request_id}"
                             )
-                            responses[request_id] = self._create_timeout_response(
-                                request_id=request_id
+                            finish(
+                                request_id=request_id,
+                                response=self._create_timeout_response(request_id=request_id),
                             )
 
                         except Exception as e:
                             self._logger.error(
                                 f"Error collecting result for request {request_id}: {e}"
                             )
-                            responses[request_id] = self._create_error_response(
-                                request_id=request_id, error=e
+                            finish(
+                                request_id=request_id,
+                                response=self._create_error_response(
+                                    request_id=request_id, error=e
+                                ),
                             )
 
                     # If no futures completed (shouldn't happen but handle defensively)
@@ -522,6 +562,302 @@ class ThreadParallelExecutor:
 
         return responses
 
+    def _resolve_retry_settings(
+        self, retry_config: Optional[RetryConfig]
+    ) -> Tuple[bool, int, float, float]:
+        """
+        Resolve executor-level retry settings with safe defaults.
+
+        Args:
+            retry_config: Configuration for retry behavior (optional)
+
+        Returns:
+            Tuple of (enable_retry, max_retries, retry_delay, backoff_multiplier)
+        """
+        if retry_config is None:
+            enable_retry = self._config.enable_automatic_retry
+            max_retries = (
+                self._config.max_retries_per_request
+                if self._config.max_retries_per_request is not None
+                else 3
+            )
+            return enable_retry, max_retries, 1.0, 2.0
+
+        enable_retry = retry_config.enable_retry if hasattr(retry_config, "enable_retry") else True
+        max_retries = (
+            retry_config.max_retries
+            if hasattr(retry_config, "max_retries") and retry_config.max_retries is not None
+            else 3
+        )
+        retry_delay = (
+            retry_config.retry_delay
+            if hasattr(retry_config, "retry_delay") and retry_config.retry_delay is not None
+            else 1.0
+        )
+        backoff_multiplier = (
+            retry_config.backoff_multiplier
+            if hasattr(retry_config, "backoff_multiplier")
+            and retry_config.backoff_multiplier is not None
+            else 2.0
+        )
+        return enable_retry, max_retries, retry_delay, backoff_multiplier
+
+    def _plan_retry(
+        self,
+        request: BedrockConverseRequest,
+        assignment: RegionAssignment,
+        response: BedrockResponse,
+        enable_retry: bool,
+        max_retries: int,
+        retry_delay: float,
+        backoff_multiplier: float,
+        available_regions: Optional[List[str]],
+    ) -> Optional[Tuple[RegionAssignment, float]]:
+        """
+        Decide whether a completed request should be retried and how.
+
+        Records the failure on the request and computes the exponential backoff and the
+        new region assignment. The caller is responsible for waiting out the backoff.
+        Retries whose backoff ends at or after the request's deadline are skipped; a retry
+        that starts with time left is attempted with the remaining time as its timeout.
+
+        Args:
+            request: The request that completed
+            assignment: Assignment the request was executed with
+            response: Response the request produced
+            enable_retry: Whether automatic retry is enabled
+            max_retries: Global maximum retries (request-specific override wins)
+            retry_delay: Base retry delay in seconds
+            backoff_multiplier: Exponential backoff multiplier
+            available_regions: All available regions for redistribution (optional)
+
+        Returns:
+            Tuple of (new assignment, backoff delay in seconds) if the request should be
+            retried, None if the response is final
+        """
+        if response.success or not enable_retry:
+            return None
+
+        request_id = assignment.request_id
+        effective_max_retries = (
+            request.max_retries if request.max_retries is not None else max_retries
+        )
+
+        if not request.can_retry(effective_max_retries):
+            self._logger.warning(
+                f"Request {request_id} exceeded max retries "
+                f"({effective_max_retries}), marking as failed"
+            )
+            return None
+
+        # Extract error information from response
+        error_message = response.warnings[0] if response.warnings else "Unknown error"
+        exception = Exception(error_message)
+
+        # Get region from assignment
+        region = assignment.assigned_regions[0] if assignment.assigned_regions else None
+
+        # Record failure in request
+        request.record_failure(
+            exception=exception,
+            model=None,  # Model info not available in response
+            region=region,
+            compact=self._config.compact_responses,
+        )
+
+        # Apply exponential backoff
+        backoff_delay = retry_delay * (backoff_multiplier**request.retry_count)
+        self._logger.info(
+            f"Request {request_id} failed (attempt {request.retry_count}), "
+            f"retrying after {backoff_delay:.2f}s delay"
+        )
+
+        remaining_time = request.get_remaining_time()
+        if remaining_time is not None and remaining_time <= backoff_delay:
+            self._logger.warning(
+                ParallelLogMessages.RETRY_SKIPPED_FOR_DEADLINE.format(
+                    request_id=request_id,
+                    backoff_seconds=backoff_delay,
+                    remaining_seconds=remaining_time,
+                )
+            )
+            return None
+
+        # Redistribute to new region if available
+        if available_regions:
+            new_assignment = self._redistribute_to_new_region(
+                request=request,
+                previous_assignment=assignment,
+                available_regions=available_regions,
+            )
+            self._logger.debug(
+                f"Redistributed request {request_id} to region: {new_assignment.assigned_regions}"
+            )
+        else:
+            # Reuse same assignment if no redistribution available
+            new_assignment = assignment
+
+        return new_assignment, backoff_delay
+
+    def execute_requests_iter(
+        self,
+        request_stream: Iterator[Tuple[RegionAssignment, BedrockConverseRequest]],
+        execute_single_request_func: Callable,
+        retry_config: Optional[RetryConfig] = None,
+        available_regions: Optional[List[str]] = None,
+        max_in_flight: Optional[int] = None,
+        stats: Optional[ParallelStatsAccumulator] = None,
+    ) -> Iterator[Tuple[str, BedrockResponse]]:
+        """
+        Execute a lazily produced stream of requests, yielding results as they complete.
+
+        Requests are pulled from ``request_stream`` only while fewer than
+        ``max_in_flight`` requests are executing or waiting for a retry, so memory stays
+        bounded independent of the stream length. Failed requests are retried with the
+        same policy as :meth:`execute_requests_parallel`, but the backoff is scheduled
+        instead of slept, so other requests keep completing meanwhile.
+
+        Requests whose deadline has passed are answered with a timeout response instead
+        of being dispatched. Closing the returned generator early cancels requests that
+        have not started.
+
+        Args:
+            request_stream: Iterator of (assignment, request) pairs, consumed lazily
+            execute_single_request_func: Function to execute a single request
+            retry_config: Configuration for retry behavior (optional)
+            available_regions: List of all available regions for redistribution (optional)
+            max_in_flight: Maximum requests executing or awaiting retry at once
+                (defaults to max_concurrent_requests)
+            stats: Optional accumulator updated with every final response
+
+        Yields:
+            Tuples of (request_id, final BedrockResponse) in completion order
+        """
+        window = max_in_flight or self._config.max_concurrent_requests
+        enable_retry, max_retries, retry_delay, backoff_multiplier = self._resolve_retry_settings(
+            retry_config=retry_config
+        )
+        wait_timeout = float(self._config.request_timeout_seconds + 10)
+
+        # future -> (current assignment, request, originally assigned regions)
+        in_flight: Dict[
+            concurrent.futures.Future, Tuple[RegionAssignment, BedrockConverseRequest, List[str]]
+        ] = {}
+        # (ready_at, sequence, assignment, request, originally assigned regions)
+        scheduled_retries: List[
+            Tuple[float, int, RegionAssignment, BedrockConverseRequest, List[str]]
+        ] = []
+        sequence = itertools.count()
+        stream_exhausted = False
+        # (request_id, response, originally assigned regions) dropped at their deadline
+        expired: List[Tuple[str, BedrockResponse, List[str]]] = []
+
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self._config.max_concurrent_requests, thread_name_prefix="LLMParallel"
+        )
+
+        def submit(
+            assignment: RegionAssignment,
+            request: BedrockConverseRequest,
+            initial_regions: List[str],
+        ) -> None:
+            expired_response = self._check_deadline(
+                request=request, request_id=assignment.request_id
+            )
+            if expired_response is not None:
+                expired.append((assignment.request_id, expired_response, initial_regions))
+                return
+            future = executor.submit(
+                self._execute_single_request_with_context,
+                request=request,
+                assignment=assignment,
+                execute_single_request_func=execute_single_request_func,
+                submitted_at=time.perf_counter(),
+                latency_stats=stats.latency if stats is not None else None,
+            )
+            in_flight[future] = (assignment, request, initial_regions)
+
+        try:
+            while True:
+                now = time.monotonic()
+                while scheduled_retries and scheduled_retries[0][0] <= now:
+                    _, _, assignment, request, initial_regions = heapq.heappop(scheduled_retries)
+                    submit(assignment=assignment, request=request, initial_regions=initial_regions)
+
+                while not stream_exhausted and len(in_flight) + len(scheduled_retries) < window:
+                    try:
+                        assignment, request = next(request_stream)
+                    except StopIteration:
+                        stream_exhausted = True
+                        break
+                    submit(
+                        assignment=assignment,
+                        request=request,
+                        initial_regions=list(assignment.assigned_regions),
+                    )
+
+                while expired:
+                    request_id, response, initial_regions = expired.pop(0)
+                    if stats is not None:
+                        stats.record_response(response=response, assigned_regions=initial_regions)
+                    yield request_id, response
+
+                if not in_flight and not scheduled_retries:
+                    break
+
+                timeout = wait_timeout
+                if scheduled_retries:
+                    timeout = min(timeout, max(0.0, scheduled_retries[0][0] - now))
+                if not in_flight:
+                    time.sleep(timeout)
+                    continue
+
+                done, _ = concurrent.futures.wait(
+                    in_flight.keys(),
+                    timeout=timeout,
+                    return_when=concurrent.futures.FIRST_COMPLETED,
+                )
+
+                for future in done:
+                    assignment, request, initial_regions = in_flight.pop(future)
+                    request_id = assignment.request_id
+
+                    try:
+                        response = future.result(timeout=1.0)
+                    except Exception as e:
+                        self._logger.error(f"Error collecting result for request {request_id}: {e}")
+                        response = self._create_error_response(request_id=request_id, error=e)
+
+                    retry_plan = self._plan_retry(
+                        request=request,
+                        assignment=assignment,
+                        response=response,
+                        enable_retry=enable_retry,
+                        max_retries=max_retries,
+                        retry_delay=retry_delay,
+                        backoff_multiplier=backoff_multiplier,
+                        available_regions=available_regions,
+                    )
+                    if retry_plan is not None:
+                        new_assignment, backoff_delay = retry_plan
+                        heapq.heappush(
+                            scheduled_retries,
+                            (
+                                time.monotonic() + backoff_delay,
+                                next(sequence),
+                                new_assignment,
+                                request,
+                                initial_regions,
+                            ),
+                        )
+                        continue
+
+                    if stats is not None:
+                        stats.record_response(response=response, assigned_regions=initial_regions)
+                    yield request_id, response
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
     def _submit_execution_tasks(
         self,
         executor: concurrent.futures.ThreadPoolExecutor,
@@ -603,11 +939,47 @@ class ThreadParallelExecutor:
 
         return responses
 
+    def _check_deadline(
+        self, request: BedrockConverseRequest, request_id: str
+    ) -> Optional[BedrockResponse]:
+        """
+        Check whether a request's deadline passed before it could be dispatched.
+
+        Only expired deadlines drop a request. Bedrock latency varies too much to tell
+        in advance that a request with time left cannot finish, so such a request is
+        dispatched with its timeout shortened to the time left (see
+        _execute_request_with_timeout) and fails with a timeout if it does not finish.
+
+        Args:
+            request: Request about to be dispatched
+            request_id: ID of the request
+
+        Returns:
+            Timeout response if the deadline has passed, None if the request may run
+        """
+        remaining_time = request.get_remaining_time()
+        if remaining_time is None or remaining_time > 0:
+            return None
+
+        self._logger.warning(
+            ParallelLogMessages.REQUEST_DEADLINE_EXPIRED.format(
+                request_id=request_id, overdue_seconds=-remaining_time
+            )
+        )
+        return BedrockResponse(
+            success=False,
+            warnings=[
+                ParallelErrorMessages.REQUEST_DEADLINE_EXCEEDED.format(request_id=request_id)
+            ],
+        )
+
     def _execute_single_request_with_context(
         self,
         request: BedrockConverseRequest,
         assignment: RegionAssignment,
         execute_single_request_func: Callable,
+        submitted_at: Optional[float] = None,
+        latency_stats: Optional[ParallelLatencyStats] = None,
     ) -> BedrockResponse:
         """
         Execute a single request with context tracking and timeout.
@@ -616,12 +988,27 @@ class ThreadParallelExecutor:
             request: BedrockConverseRequest to execute
             assignment: Region assignment for the request
             execute_single_request_func: Function to execute the request
+            submitted_at: time.perf_counter() when the request was submitted to the
+                thread pool; reported as queue wait when instrumentation is enabled
+            latency_stats: Optional statistics receiving the queue wait and counting the
+                request as executing while it runs
 
         Returns:
             BedrockResponse with the result
         """
         request_id = assignment.request_id
 
+        if submitted_at is not None:
+            queue_wait_ms = (time.perf_counter() - submitted_at) * 1000
+            if latency_stats is not None:
+                latency_stats.record_queue_wait(wait_ms=queue_wait_ms)
+            if is_instrumentation_enabled():
+                record_metric(
+                    name=InstrumentationMetricNames.QUEUE_WAIT_MS,
+                    value=queue_wait_ms,
+                    attributes={InstrumentationAttributes.REQUEST_ID: request_id},
+                )
+
         # Update context - request is now active
         if self._execution_context:
             self._execution_context.add_active_request(request_id=request_id)
@@ -630,11 +1017,17 @@ class ThreadParallelExecutor:
             self._logger.debug(f"Starting execution for request {request_id}")
 
             # Execute with timeout using threading
-            response = self._execute_request_with_timeout(
-                request=request,
-                assignment=assignment,
-                execute_single_request_func=execute_single_request_func,
-            )
+            if latency_stats is not None:
+                latency_stats.start_execution()
+            try:
+                response = self._execute_request_with_timeout(
+                    request=request,
+                    assignment=assignment,
+                    execute_single_request_func=execute_single_request_func,
+                )
+            finally:
+                if latency_stats is not None:
+                    latency_stats.finish_execution()
 
             # Update context on success
             if self._execution_context:
@@ -664,6 +1057,9 @@ class ThreadParallelExecutor:
         """
         Execute a single request with timeout using threading.
 
+        The timeout is the configured request timeout, shortened to the time left
+        until the request's deadline if it has one.
+
         Args:
             request: BedrockConverseRequest to execute
             assignment: Region assignment for the request
@@ -677,13 +1073,20 @@ class ThreadParallelExecutor:
         """
         # Convert request to converse arguments
         converse_args = request.to_converse_args()
+        if assignment.preferred_region is not None:
+            converse_args["preferred_region"] = assignment.preferred_region
+
+        timeout_seconds: float = self._config.request_timeout_seconds
+        remaining_time = request.get_remaining_time()
+        if remaining_time is not None:
+            timeout_seconds = max(0.0, min(timeout_seconds, remaining_time))
 
         # Execute with timeout using ThreadPoolExecutor
         with concurrent.futures.ThreadPoolExecutor(max_workers=1) as timeout_executor:
             future = timeout_executor.submit(execute_single_request_func, converse_args)
 
             try:
-                response = future.result(timeout=self._config.request_timeout_seconds)
+                response = future.result(timeout=timeout_seconds)
                 return cast(BedrockResponse, response)
 
             except concurrent.futures.TimeoutError as exc:
@@ -697,10 +1100,10 @@ class ThreadParallelExecutor:
                 raise RequestTimeoutError(
                     message=ParallelErrorMessages.REQUEST_TIMEOUT_EXCEEDED.format(
                         request_id=assignment.request_id,
-                        timeout_seconds=self._config.request_timeout_seconds,
+                        timeout_seconds=round(timeout_seconds, 3),
                     ),
                     request_id=assignment.request_id,
-                    timeout_seconds=self._config.request_timeout_seconds,
+                    timeout_seconds=round(timeout_seconds, 3),
                     elapsed_seconds=elapsed_time,
                 ) from exc
 
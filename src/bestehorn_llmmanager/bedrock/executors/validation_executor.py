@@ -0,0 +1,245 @@
+"""
+Off-thread execution of response validation functions.
+
+ValidationExecutor runs the validation function of a ResponseValidationConfig in a
+process pool or a dedicated thread pool instead of on the thread that made the Bedrock
+call. In process mode CPU-heavy validators (JSON-schema checks, regular expressions over
+long outputs) run in other interpreters, so they no longer hold the GIL while the
+threads of converse_parallel send and receive requests; the request thread waits for the
+result without holding it.
+"""
+
+import logging
+import multiprocessing
+import pickle
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from types import TracebackType
+from typing import Any, Dict, Optional, Tuple, Type
+
+from ..exceptions.llm_manager_exceptions import ConfigurationError
+from ..models.bedrock_response import BedrockResponse
+from ..models.llm_manager_constants import ValidationExecutorMessages, ValidationExecutorModes
+from ..models.llm_manager_structures import ResponseValidationFunction, ValidationResult
+
+
+def _snapshot_response(response: BedrockResponse) -> BedrockResponse:
+    """
+    Copy the fields validators read into a response that pickles cheaply.
+
+    Attempts and earlier validation records may hold exceptions and are not needed to
+    judge the response content, so they are left out.
+    """
+    return BedrockResponse(
+        success=response.success,
+        response_data=response.response_data,
+        model_used=response.model_used,
+        region_used=response.region_used,
+        access_method_used=response.access_method_used,
+        inference_profile_used=response.inference_profile_used,
+        inference_profile_id=response.inference_profile_id,
+        total_duration_ms=response.total_duration_ms,
+        api_latency_ms=response.api_latency_ms,
+        warnings=list(response.warnings),
+        parameters_removed=response.parameters_removed,
+    )
+
+
+def _run_pickled_validation(payload: bytes) -> ValidationResult:
+    """Unpickle a validation function and response in the worker process and validate."""
+    validation_function, response = pickle.loads(payload)  # noqa: S301 - pickled by the parent
+    return validation_function(response)  # type: ignore[no-any-return]
+
+
+class ValidationExecutor:
+    """
+    Process or thread pool for response validation functions.
+
+    In ``"process"`` mode the validation function and a copy of the response are pickled
+    and validated in a worker process, so the function must be picklable: a module-level
+    function, a picklable callable object or a ValidatorSpec. The copy carries the
+    response data, model, region and access method but no attempts. In ``"thread"`` mode
+    any callable works; this helps validators that release the GIL (compiled JSON or
+    regex libraries) and bounds how many validations run at once.
+
+    The pool is created on first use and shared by all requests that use this executor.
+    Call :meth:`close` (or use the executor as a context manager) to shut it down.
+    """
+
+    def __init__(
+        self,
+        mode: str = ValidationExecutorModes.PROCESS,
+        max_workers: Optional[int] = None,
+        start_method: str = ValidationExecutorModes.DEFAULT_START_METHOD,
+    ) -> None:
+        """
+        Initialize the validation executor.
+
+        Args:
+            mode: "process" or "thread"
+            max_workers: Number of pool workers; None uses the concurrent.futures default
+            start_method: multiprocessing start method of the process pool
+
+        Raises:
+            ValueError: If mode, max_workers or start_method is invalid
+        """
+        if mode not in ValidationExecutorModes.ALL:
+            raise ValueError(
+                ValidationExecutorMessages.INVALID_MODE.format(
+                    modes=ValidationExecutorModes.ALL, mode=mode
+                )
+            )
+        if max_workers is not None and max_workers <= 0:
+            raise ValueError(
+                ValidationExecutorMessages.INVALID_MAX_WORKERS.format(max_workers=max_workers)
+            )
+        start_methods = multiprocessing.get_all_start_methods()
+        if start_method not in start_methods:
+            raise ValueError(
+                ValidationExecutorMessages.INVALID_START_METHOD.format(
+                    start_methods=start_methods, start_method=start_method
+                )
+            )
+
+        self._logger = logging.getLogger(__name__)
+        self._mode = mode
+        self._max_workers = max_workers
+        self._start_method = start_method
+        self._lock = threading.Lock()
+        self._pool: Optional[Executor] = None
+        self._closed = False
+        # Validators known to pickle, by id; the entry keeps the id from being reused
+        self._checked_validators: Dict[int, ResponseValidationFunction] = {}
+
+    @property
+    def mode(self) -> str:
+        """Execution mode, "process" or "thread"."""
+        return self._mode
+
+    def check_validator(self, validation_function: ResponseValidationFunction) -> None:
+        """
+        Check that a validation function can be sent to the pool.
+
+        Each validator is test-pickled once; later checks of the same object return
+        without pickling it again.
+
+        Args:
+            validation_function: Function that will be passed to validate()
+
+        Raises:
+            ConfigurationError: If the executor runs in process mode and the function
+                cannot be pickled
+        """
+        if self._mode != ValidationExecutorModes.PROCESS:
+            return
+        key = id(validation_function)
+        with self._lock:
+            if self._checked_validators.get(key) is validation_function:
+                return
+
+        try:
+            pickle.dumps(validation_function)
+        except Exception as error:
+            raise ConfigurationError(
+                message=ValidationExecutorMessages.UNPICKLABLE_VALIDATOR.format(
+                    function=validation_function, error=error
+                )
+            ) from error
+
+        with self._lock:
+            if len(self._checked_validators) >= ValidationExecutorModes.MAX_CHECKED_VALIDATORS:
+                # Forget the oldest validator; it is pickled again if it comes back
+                del self._checked_validators[next(iter(self._checked_validators))]
+            self._checked_validators[key] = validation_function
+
+    def validate(
+        self, validation_function: ResponseValidationFunction, response: Any
+    ) -> ValidationResult:
+        """
+        Run a validation function in the pool and wait for its result.
+
+        Args:
+            validation_function: Function that validates the response
+            response: BedrockResponse to validate
+
+        Returns:
+            ValidationResult returned by the validation function
+
+        Raises:
+            Exception: Whatever the validation function raised
+            RuntimeError: If the executor is closed
+        """
+        pool, is_process_pool = self._get_pool()
+        if is_process_pool:
+            payload = pickle.dumps(
+                (validation_function, _snapshot_response(response=response)),
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+            future = pool.submit(_run_pickled_validation, payload)
+        else:
+            future = pool.submit(validation_function, response)
+
+        try:
+            return future.result()
+        except BrokenProcessPool:
+            # A worker died; start a fresh pool for the next validation
+            with self._lock:
+                if self._pool is pool:
+                    self._pool = None
+            pool.shutdown(wait=False)
+            raise
+
+    def close(self, wait: bool = True) -> None:
+        """
+        Shut down the pool.
+
+        Args:
+            wait: Wait for running validations to finish
+        """
+        with self._lock:
+            pool, self._pool = self._pool, None
+            self._closed = True
+        if pool is not None:
+            pool.shutdown(wait=wait)
+
+    def _get_pool(self) -> Tuple[Executor, bool]:
+        """
+        Get the pool, creating it on first use.
+
+        Returns:
+            Tuple of (pool, whether it is a process pool)
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError(ValidationExecutorMessages.EXECUTOR_CLOSED)
+            if self._pool is None:
+                if self._mode == ValidationExecutorModes.PROCESS:
+                    self._pool = ProcessPoolExecutor(
+                        max_workers=self._max_workers,
+                        mp_context=multiprocessing.get_context(self._start_method),
+                    )
+                else:
+                    self._pool = ThreadPoolExecutor(
+                        max_workers=self._max_workers,
+                        thread_name_prefix=ValidationExecutorModes.THREAD_NAME_PREFIX,
+                    )
+                self._logger.debug(f"Started {self._mode} pool for response validation")
+            return self._pool, self._mode == ValidationExecutorModes.PROCESS
+
+    def __enter__(self) -> "ValidationExecutor":
+        """Return the executor for use in a with block."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Shut down the pool when leaving the with block."""
+        self.close()
+
+    def __repr__(self) -> str:
+        """Return string representation of the ValidationExecutor."""
+        return f"ValidationExecutor(mode={self._mode!r}, max_workers={self._max_workers})"
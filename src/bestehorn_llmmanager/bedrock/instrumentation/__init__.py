@@ -0,0 +1,31 @@
+"""
+Instrumentation module for request-path spans and metrics.
+"""
+
+from .instrumentation_registry import (
+    InstrumentationListener,
+    InstrumentationRegistry,
+    instrument_span,
+    instrumented,
+    is_instrumentation_enabled,
+    record_metric,
+    record_span,
+    register_instrumentation_listener,
+    unregister_instrumentation_listener,
+)
+from .opentelemetry_listener import OpenTelemetryListener
+from .recording_listener import InstrumentationRecorder
+
+__all__ = [
+    "InstrumentationListener",
+    "InstrumentationRecorder",
+    "InstrumentationRegistry",
+    "OpenTelemetryListener",
+    "instrument_span",
+    "instrumented",
+    "is_instrumentation_enabled",
+    "record_metric",
+    "record_span",
+    "register_instrumentation_listener",
+    "unregister_instrumentation_listener",
+]
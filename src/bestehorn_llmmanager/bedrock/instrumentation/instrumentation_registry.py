@@ -0,0 +1,454 @@
+"""
+Process-wide registry of instrumentation listeners.
+
+The request path (LLMManager, RetryManager, AuthManager, BedrockModelCatalog, the
+streaming iterators and the parallel executor) reports spans and metrics through
+instrument_span(), record_span() and record_metric(). With no listener registered they
+return immediately without reading clocks or allocating span records.
+"""
+
+import contextvars
+import functools
+import itertools
+import logging
+import threading
+import time
+from types import TracebackType
+from typing import Any, Callable, Dict, Optional, Tuple, Type, TypeVar, Union, cast
+
+from ..models.instrumentation_constants import InstrumentationLogMessages
+from ..models.instrumentation_structures import InstrumentationSpan
+
+logger = logging.getLogger(__name__)
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+# Innermost open span of the current thread / task, used to link child spans
+_current_span: "contextvars.ContextVar[Optional[InstrumentationSpan]]" = contextvars.ContextVar(
+    "bestehorn_llmmanager_current_span", default=None
+)
+
+
+class InstrumentationListener:
+    """
+    Base class for instrumentation listeners.
+
+    Subclasses override the hooks they need; the default implementations do nothing.
+    Hooks are called synchronously on the thread doing the work, so they should be
+    fast and must be thread-safe. Exceptions raised by a hook are logged and ignored.
+    """
+
+    def on_span_start(self, span: InstrumentationSpan) -> None:
+        """
+        Called when a span starts.
+
+        Args:
+            span: The span (duration_ms is None)
+        """
+
+    def on_span_end(self, span: InstrumentationSpan) -> None:
+        """
+        Called when a span ends.
+
+        Args:
+            span: The span with duration_ms and error set
+        """
+
+    def on_metric(self, name: str, value: float, attributes: Dict[str, Any]) -> None:
+        """
+        Called for a metric observation (a histogram sample).
+
+        Args:
+            name: Metric name (see InstrumentationMetricNames)
+            value: Observed value
+            attributes: Metric attributes
+        """
+
+
+class InstrumentationRegistry:
+    """
+    Process-wide registry of instrumentation listeners.
+
+    Uses the singleton pattern so that every component on the request path reports to
+    the same listeners. Registration is thread-safe; emission reads an immutable
+    snapshot of the listeners without locking.
+    """
+
+    _instance: Optional["InstrumentationRegistry"] = None
+    _lock: threading.Lock = threading.Lock()
+    _initialized: bool = False
+
+    def __new__(cls) -> "InstrumentationRegistry":
+        """
+        Create or return singleton instance.
+
+        Returns:
+            Singleton InstrumentationRegistry instance
+        """
+        if cls._instance is None:
+            with cls._lock:
+                # Double-check locking pattern
+                if cls._instance is None:
+                    cls._instance = super(InstrumentationRegistry, cls).__new__(cls)
+                    cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self) -> None:
+        """
+        Initialize registry without listeners.
+
+        Only initializes once due to singleton pattern.
+        """
+        if self._initialized:
+            return
+
+        self._listeners: Tuple[InstrumentationListener, ...] = ()
+        self._span_ids = itertools.count(1)
+        self._initialized = True
+
+    @classmethod
+    def get_instance(cls) -> "InstrumentationRegistry":
+        """
+        Get singleton instance (process-wide).
+
+        Returns:
+            Singleton InstrumentationRegistry instance
+        """
+        return cls()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether at least one listener is registered."""
+        return bool(self._listeners)
+
+    def register_listener(self, listener: InstrumentationListener) -> None:
+        """
+        Register a listener; registering the same listener twice has no effect.
+
+        Args:
+            listener: Listener to register
+        """
+        with self._lock:
+            if listener not in self._listeners:
+                self._listeners = self._listeners + (listener,)
+        logger.debug(InstrumentationLogMessages.LISTENER_REGISTERED.format(listener=listener))
+
+    def unregister_listener(self, listener: InstrumentationListener) -> None:
+        """
+        Unregister a listener; unknown listeners are ignored.
+
+        Args:
+            listener: Listener to unregister
+        """
+        with self._lock:
+            self._listeners = tuple(
+                registered for registered in self._listeners if registered is not listener
+            )
+        logger.debug(InstrumentationLogMessages.LISTENER_UNREGISTERED.format(listener=listener))
+
+    def clear_listeners(self) -> None:
+        """Unregister all listeners."""
+        with self._lock:
+            self._listeners = ()
+
+    def get_listeners(self) -> Tuple[InstrumentationListener, ...]:
+        """
+        Get the registered listeners.
+
+        Returns:
+            Tuple of registered listeners in registration order
+        """
+        return self._listeners
+
+    def span(
+        self, name: str, attributes: Optional[Dict[str, Any]] = None
+    ) -> Union["_ActiveSpan", "_NoOpSpan"]:
+        """
+        Create a span context manager.
+
+        Args:
+            name: Span name
+            attributes: Initial span attributes
+
+        Returns:
+            Context manager yielding an object with set_attribute(); a shared no-op
+            instance when no listener is registered
+        """
+        listeners = self._listeners
+        if not listeners:
+            return _NOOP_SPAN
+        return _ActiveSpan(
+            listeners=listeners,
+            span=InstrumentationSpan(
+                name=name,
+                span_id=next(self._span_ids),
+                attributes=dict(attributes) if attributes else {},
+            ),
+        )
+
+    def record_span(
+        self,
+        name: str,
+        start_time_ns: int,
+        duration_ms: float,
+        attributes: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        """
+        Report a span that has already finished, e.g. one timed by existing bookkeeping.
+
+        The span is a child of the span open on the current thread, if any.
+
+        Args:
+            name: Span name
+            start_time_ns: Wall-clock start time in nanoseconds since the epoch
+            duration_ms: Duration in milliseconds
+            attributes: Span attributes
+            error: Type name of the error that ended the span, if any
+        """
+        listeners = self._listeners
+        if not listeners:
+            return
+        parent = _current_span.get()
+        span = InstrumentationSpan(
+            name=name,
+            span_id=next(self._span_ids),
+            parent_id=parent.span_id if parent is not None else None,
+            start_time_ns=start_time_ns,
+            attributes=dict(attributes) if attributes else {},
+        )
+        for listener in listeners:
+            try:
+                listener.on_span_start(span)
+            except Exception as exc:
+                _log_listener_failure(listener=listener, hook="on_span_start", error=exc)
+        span.duration_ms = duration_ms
+        span.error = error
+        for listener in listeners:
+            try:
+                listener.on_span_end(span)
+            except Exception as exc:
+                _log_listener_failure(listener=listener, hook="on_span_end", error=exc)
+
+    def record_metric(
+        self, name: str, value: float, attributes: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Report a metric observation to all listeners.
+
+        Args:
+            name: Metric name
+            value: Observed value
+            attributes: Metric attributes
+        """
+        listeners = self._listeners
+        if not listeners:
+            return
+        metric_attributes = dict(attributes) if attributes else {}
+        for listener in listeners:
+            try:
+                listener.on_metric(name, value, metric_attributes)
+            except Exception as error:
+                _log_listener_failure(listener=listener, hook="on_metric", error=error)
+
+
+class _NoOpSpan:
+    """Span context manager used when no listener is registered."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NoOpSpan":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        return None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Ignore the attribute."""
+
+
+_NOOP_SPAN = _NoOpSpan()
+
+
+class _ActiveSpan:
+    """Span context manager that times its block and notifies listeners."""
+
+    __slots__ = ("_listeners", "_span", "_start", "_token")
+
+    def __init__(
+        self, listeners: Tuple[InstrumentationListener, ...], span: InstrumentationSpan
+    ) -> None:
+        self._listeners = listeners
+        self._span = span
+        self._start = 0.0
+        self._token: Optional["contextvars.Token[Optional[InstrumentationSpan]]"] = None
+
+    def __enter__(self) -> "_ActiveSpan":
+        parent = _current_span.get()
+        if parent is not None:
+            self._span.parent_id = parent.span_id
+        self._token = _current_span.set(self._span)
+        self._span.start_time_ns = time.time_ns()
+        self._start = time.perf_counter()
+        for listener in self._listeners:
+            try:
+                listener.on_span_start(self._span)
+            except Exception as error:
+                _log_listener_failure(listener=listener, hook="on_span_start", error=error)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self._span.duration_ms = (time.perf_counter() - self._start) * 1000
+        if exc_type is not None:
+            self._span.error = exc_type.__name__
+        if self._token is not None:
+            _current_span.reset(self._token)
+        for listener in self._listeners:
+            try:
+                listener.on_span_end(self._span)
+            except Exception as error:
+                _log_listener_failure(listener=listener, hook="on_span_end", error=error)
+
+    @property
+    def span(self) -> InstrumentationSpan:
+        """The underlying span record."""
+        return self._span
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """
+        Set a span attribute.
+
+        Args:
+            key: Attribute key
+            value: Attribute value
+        """
+        self._span.set_attribute(key=key, value=value)
+
+
+def _log_listener_failure(listener: InstrumentationListener, hook: str, error: Exception) -> None:
+    """Log a listener exception without propagating it into the request path."""
+    logger.warning(
+        InstrumentationLogMessages.LISTENER_FAILED.format(
+            listener=type(listener).__name__, hook=hook, error=error
+        )
+    )
+
+
+def instrument_span(
+    name: str, attributes: Optional[Dict[str, Any]] = None
+) -> Union[_ActiveSpan, _NoOpSpan]:
+    """
+    Create a span context manager on the process-wide registry.
+
+    Args:
+        name: Span name (see InstrumentationSpanNames)
+        attributes: Initial span attributes
+
+    Returns:
+        Span context manager
+    """
+    return InstrumentationRegistry.get_instance().span(name=name, attributes=attributes)
+
+
+def instrumented(name: str) -> Callable[[_F], _F]:
+    """
+    Decorate a function so that each call runs inside a span.
+
+    Args:
+        name: Span name (see InstrumentationSpanNames)
+
+    Returns:
+        Decorator
+    """
+
+    def decorator(func: _F) -> _F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with instrument_span(name=name):
+                return func(*args, **kwargs)
+
+        return cast(_F, wrapper)
+
+    return decorator
+
+
+def record_span(
+    name: str,
+    start_time_ns: int,
+    duration_ms: float,
+    attributes: Optional[Dict[str, Any]] = None,
+    error: Optional[str] = None,
+) -> None:
+    """
+    Report a finished span on the process-wide registry.
+
+    Args:
+        name: Span name (see InstrumentationSpanNames)
+        start_time_ns: Wall-clock start time in nanoseconds since the epoch
+        duration_ms: Duration in milliseconds
+        attributes: Span attributes
+        error: Type name of the error that ended the span, if any
+    """
+    InstrumentationRegistry.get_instance().record_span(
+        name=name,
+        start_time_ns=start_time_ns,
+        duration_ms=duration_ms,
+        attributes=attributes,
+        error=error,
+    )
+
+
+def record_metric(name: str, value: float, attributes: Optional[Dict[str, Any]] = None) -> None:
+    """
+    Report a metric observation on the process-wide registry.
+
+    Args:
+        name: Metric name (see InstrumentationMetricNames)
+        value: Observed value
+        attributes: Metric attributes
+    """
+    InstrumentationRegistry.get_instance().record_metric(
+        name=name, value=value, attributes=attributes
+    )
+
+
+def is_instrumentation_enabled() -> bool:
+    """
+    Check whether any instrumentation listener is registered.
+
+    Callers use this to skip clock reads needed only for metrics.
+
+    Returns:
+        True if at least one listener is registered
+    """
+    return InstrumentationRegistry.get_instance().enabled
+
+
+def register_instrumentation_listener(listener: InstrumentationListener) -> None:
+    """
+    Register a listener on the process-wide registry.
+
+    Args:
+        listener: Listener to register
+    """
+    InstrumentationRegistry.get_instance().register_listener(listener=listener)
+
+
+def unregister_instrumentation_listener(listener: InstrumentationListener) -> None:
+    """
+    Unregister a listener from the process-wide registry.
+
+    Args:
+        listener: Listener to unregister
+    """
+    InstrumentationRegistry.get_instance().unregister_listener(listener=listener)
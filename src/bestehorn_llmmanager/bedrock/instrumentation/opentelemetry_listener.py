@@ -0,0 +1,124 @@
+"""
+OpenTelemetry bridge for instrumentation listeners.
+
+Forwards spans and metrics to an OpenTelemetry tracer and meter supplied by the
+application. The opentelemetry packages are not a dependency of this library: the
+listener only calls the tracer/meter API, and links child spans to their parents when
+opentelemetry-api is importable.
+"""
+
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from ..models.instrumentation_constants import InstrumentationDefaults
+from ..models.instrumentation_structures import InstrumentationSpan
+from .instrumentation_registry import InstrumentationListener
+
+
+def _load_set_span_in_context() -> Optional[Callable[[Any], Any]]:
+    """Get opentelemetry.trace.set_span_in_context if opentelemetry-api is installed."""
+    try:
+        from opentelemetry.trace import set_span_in_context  # type: ignore[import-not-found]
+    except ImportError:
+        return None
+    return set_span_in_context  # type: ignore[no-any-return]
+
+
+class OpenTelemetryListener(InstrumentationListener):
+    """
+    Listener that mirrors spans and metrics into OpenTelemetry.
+
+    Every span becomes an OpenTelemetry span started and ended with the same
+    timestamps; its duration is also recorded in a histogram named
+    ``<span name>.duration_ms``. Metric observations are recorded in histograms of
+    the same name. Spans without a parent inside this library are started in the
+    current OpenTelemetry context, so they nest under the application's spans.
+    """
+
+    def __init__(self, tracer: Optional[Any] = None, meter: Optional[Any] = None) -> None:
+        """
+        Initialize the listener.
+
+        Args:
+            tracer: OpenTelemetry tracer (e.g. ``trace.get_tracer(__name__)``), or None
+                to export metrics only
+            meter: OpenTelemetry meter (e.g. ``metrics.get_meter(__name__)``), or None
+                to export spans only
+
+        Raises:
+            ValueError: If neither tracer nor meter is given
+        """
+        if tracer is None and meter is None:
+            raise ValueError("At least one of tracer or meter is required")
+
+        self._tracer = tracer
+        self._meter = meter
+        self._set_span_in_context = _load_set_span_in_context()
+        self._open_spans: Dict[int, Any] = {}
+        self._histograms: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def on_span_start(self, span: InstrumentationSpan) -> None:
+        """Start the corresponding OpenTelemetry span."""
+        if self._tracer is None:
+            return
+
+        context = None
+        if span.parent_id is not None and self._set_span_in_context is not None:
+            with self._lock:
+                parent = self._open_spans.get(span.parent_id)
+            if parent is not None:
+                context = self._set_span_in_context(parent)
+
+        otel_span = self._tracer.start_span(
+            span.name,
+            context=context,
+            attributes=_to_otel_attributes(attributes=span.attributes),
+            start_time=span.start_time_ns,
+        )
+        with self._lock:
+            self._open_spans[span.span_id] = otel_span
+
+    def on_span_end(self, span: InstrumentationSpan) -> None:
+        """End the corresponding OpenTelemetry span and record its duration."""
+        if self._tracer is not None:
+            with self._lock:
+                otel_span = self._open_spans.pop(span.span_id, None)
+            if otel_span is not None:
+                otel_span.set_attributes(_to_otel_attributes(attributes=span.attributes))
+                if span.error is not None:
+                    otel_span.set_attribute("error.type", span.error)
+                otel_span.end(end_time=span.end_time_ns)
+
+        if span.duration_ms is not None:
+            self._record(
+                name=span.name + InstrumentationDefaults.HISTOGRAM_SUFFIX,
+                value=span.duration_ms,
+                attributes=span.attributes,
+            )
+
+    def on_metric(self, name: str, value: float, attributes: Dict[str, Any]) -> None:
+        """Record a metric observation in its histogram."""
+        self._record(name=name, value=value, attributes=attributes)
+
+    def _record(self, name: str, value: float, attributes: Dict[str, Any]) -> None:
+        """Record a value in the named histogram, creating it on first use."""
+        if self._meter is None:
+            return
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._meter.create_histogram(
+                    name, unit=InstrumentationDefaults.HISTOGRAM_UNIT
+                )
+                self._histograms[name] = histogram
+        histogram.record(value, attributes=_to_otel_attributes(attributes=attributes))
+
+
+def _to_otel_attributes(attributes: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop None values and stringify values OpenTelemetry cannot carry."""
+    return {
+        key: value if isinstance(value, (str, bool, int, float)) else str(value)
+        for key, value in attributes.items()
+        if value is not None
+    }
@@ -0,0 +1,91 @@
+"""
+In-memory instrumentation listener.
+
+Keeps the most recent spans and metric observations, e.g. for tests, debugging or
+periodic export by the application.
+"""
+
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from ..models.instrumentation_constants import InstrumentationDefaults
+from ..models.instrumentation_structures import InstrumentationSpan
+from .instrumentation_registry import InstrumentationListener
+
+
+class InstrumentationRecorder(InstrumentationListener):
+    """
+    Listener that records finished spans and metric observations in memory.
+
+    Both buffers are bounded; the oldest entries are discarded first. Thread-safe.
+    """
+
+    def __init__(self, max_entries: int = InstrumentationDefaults.RECORDER_MAX_ENTRIES) -> None:
+        """
+        Initialize the recorder.
+
+        Args:
+            max_entries: Maximum number of spans and of metric observations kept
+
+        Raises:
+            ValueError: If max_entries is not positive
+        """
+        if max_entries <= 0:
+            raise ValueError(f"max_entries must be positive, got: {max_entries}")
+
+        self._spans: Deque[InstrumentationSpan] = deque(maxlen=max_entries)
+        self._metrics: Deque[Tuple[str, float, Dict[str, Any]]] = deque(maxlen=max_entries)
+        self._lock = threading.Lock()
+
+    def on_span_end(self, span: InstrumentationSpan) -> None:
+        """Record a finished span."""
+        with self._lock:
+            self._spans.append(span)
+
+    def on_metric(self, name: str, value: float, attributes: Dict[str, Any]) -> None:
+        """Record a metric observation."""
+        with self._lock:
+            self._metrics.append((name, value, attributes))
+
+    def get_spans(self, name: Optional[str] = None) -> List[InstrumentationSpan]:
+        """
+        Get recorded spans in completion order.
+
+        Args:
+            name: Only return spans with this name
+
+        Returns:
+            List of finished spans
+        """
+        with self._lock:
+            return [span for span in self._spans if name is None or span.name == name]
+
+    def get_metric_values(self, name: str) -> List[float]:
+        """
+        Get recorded values of a metric in observation order.
+
+        Args:
+            name: Metric name
+
+        Returns:
+            List of observed values
+        """
+        with self._lock:
+            return [value for metric_name, value, _ in self._metrics if metric_name == name]
+
+    def get_metrics(self) -> List[Tuple[str, float, Dict[str, Any]]]:
+        """
+        Get all recorded metric observations.
+
+        Returns:
+            List of (name, value, attributes) tuples in observation order
+        """
+        with self._lock:
+            return list(self._metrics)
+
+    def clear(self) -> None:
+        """Discard all recorded spans and metrics."""
+        with self._lock:
+            self._spans.clear()
+            self._metrics.clear()
@@ -0,0 +1,170 @@
+"""
+Constants for Bedrock batch inference (model invocation jobs) in LLM Manager system.
+Defines record and API field names, job statuses, defaults and messages.
+"""
+
+from typing import Final, FrozenSet
+
+
+class BatchInferenceFields:
+    """Field names of batch inference records and control-plane API calls."""
+
+    # JSONL record fields
+    RECORD_ID: Final[str] = "recordId"
+    MODEL_INPUT: Final[str] = "modelInput"
+    MODEL_OUTPUT: Final[str] = "modelOutput"
+    ERROR: Final[str] = "error"
+    ERROR_CODE: Final[str] = "errorCode"
+    ERROR_MESSAGE: Final[str] = "errorMessage"
+
+    # Converse toolConfig fields translated into the model input
+    TOOL_SPEC: Final[str] = "toolSpec"
+    INPUT_SCHEMA: Final[str] = "inputSchema"
+    TOOL_CHOICE: Final[str] = "toolChoice"
+
+    # CreateModelInvocationJob / GetModelInvocationJob
+    JOB_NAME: Final[str] = "jobName"
+    JOB_ARN: Final[str] = "jobArn"
+    JOB_IDENTIFIER: Final[str] = "jobIdentifier"
+    ROLE_ARN: Final[str] = "roleArn"
+    MODEL_ID: Final[str] = "modelId"
+    INPUT_DATA_CONFIG: Final[str] = "inputDataConfig"
+    OUTPUT_DATA_CONFIG: Final[str] = "outputDataConfig"
+    S3_INPUT_DATA_CONFIG: Final[str] = "s3InputDataConfig"
+    S3_OUTPUT_DATA_CONFIG: Final[str] = "s3OutputDataConfig"
+    S3_URI: Final[str] = "s3Uri"
+    S3_INPUT_FORMAT: Final[str] = "s3InputFormat"
+    TIMEOUT_DURATION_IN_HOURS: Final[str] = "timeoutDurationInHours"
+    STATUS: Final[str] = "status"
+    MESSAGE: Final[str] = "message"
+
+    # S3 API
+    BUCKET: Final[str] = "Bucket"
+    KEY: Final[str] = "Key"
+    BODY: Final[str] = "Body"
+    PREFIX: Final[str] = "Prefix"
+    CONTENTS: Final[str] = "Contents"
+    IS_TRUNCATED: Final[str] = "IsTruncated"
+    CONTINUATION_TOKEN: Final[str] = "ContinuationToken"  # noqa: S105 - AWS API field name
+    NEXT_CONTINUATION_TOKEN: Final[str] = "NextContinuationToken"  # noqa: S105 - AWS API field name
+
+
+class BatchJobStatus:
+    """Model invocation job status values."""
+
+    SUBMITTED: Final[str] = "Submitted"
+    VALIDATING: Final[str] = "Validating"
+    SCHEDULED: Final[str] = "Scheduled"
+    IN_PROGRESS: Final[str] = "InProgress"
+    COMPLETED: Final[str] = "Completed"
+    PARTIALLY_COMPLETED: Final[str] = "PartiallyCompleted"
+    FAILED: Final[str] = "Failed"
+    STOPPING: Final[str] = "Stopping"
+    STOPPED: Final[str] = "Stopped"
+    EXPIRED: Final[str] = "Expired"
+
+    TERMINAL: Final[FrozenSet[str]] = frozenset(
+        {COMPLETED, PARTIALLY_COMPLETED, FAILED, STOPPED, EXPIRED}
+    )
+    WITH_OUTPUT: Final[FrozenSet[str]] = frozenset({COMPLETED, PARTIALLY_COMPLETED})
+
+
+class AnthropicBatchFields:
+    """Field names of the Anthropic Messages request/response body used as model input."""
+
+    ANTHROPIC_VERSION: Final[str] = "anthropic_version"
+    ANTHROPIC_VERSION_VALUE: Final[str] = "bedrock-2023-05-31"
+    # Part of every Anthropic model ID, inference profile ID and foundation model ARN
+    MODEL_ID_MARKER: Final[str] = "anthropic."
+    MAX_TOKENS: Final[str] = "max_tokens"
+    TEMPERATURE: Final[str] = "temperature"
+    TOP_P: Final[str] = "top_p"
+    STOP_SEQUENCES: Final[str] = "stop_sequences"
+    SYSTEM: Final[str] = "system"
+    MESSAGES: Final[str] = "messages"
+    ROLE: Final[str] = "role"
+    CONTENT: Final[str] = "content"
+    TYPE: Final[str] = "type"
+    TEXT: Final[str] = "text"
+    IMAGE: Final[str] = "image"
+    SOURCE: Final[str] = "source"
+    BASE64: Final[str] = "base64"
+    MEDIA_TYPE: Final[str] = "media_type"
+    DATA: Final[str] = "data"
+    TOOL_USE: Final[str] = "tool_use"
+    TOOL_RESULT: Final[str] = "tool_result"
+    TOOL_USE_ID: Final[str] = "tool_use_id"
+    ID: Final[str] = "id"
+    NAME: Final[str] = "name"
+    INPUT: Final[str] = "input"
+    IS_ERROR: Final[str] = "is_error"
+    THINKING: Final[str] = "thinking"
+    SIGNATURE: Final[str] = "signature"
+    TOOLS: Final[str] = "tools"
+    TOOL_CHOICE: Final[str] = "tool_choice"
+    DESCRIPTION: Final[str] = "description"
+    INPUT_SCHEMA: Final[str] = "input_schema"
+    STOP_REASON: Final[str] = "stop_reason"
+    USAGE: Final[str] = "usage"
+    INPUT_TOKENS: Final[str] = "input_tokens"
+    OUTPUT_TOKENS: Final[str] = "output_tokens"
+    CACHE_READ_INPUT_TOKENS: Final[str] = "cache_read_input_tokens"
+    CACHE_CREATION_INPUT_TOKENS: Final[str] = "cache_creation_input_tokens"
+
+
+class BatchInferenceDefaults:
+    """Default configuration values for batch inference."""
+
+    # Bedrock rejects jobs with fewer records than the per-model minimum (100 by default).
+    MIN_BATCH_SIZE: Final[int] = 100
+    MAX_RECORDS_PER_JOB: Final[int] = 50000
+    # Jobs may take up to their timeout (minimum 24h) to complete.
+    MIN_DEADLINE_SECONDS: Final[float] = 24 * 3600.0
+    JOB_TIMEOUT_HOURS: Final[int] = 24
+    POLL_INITIAL_DELAY_SECONDS: Final[float] = 30.0
+    POLL_MAX_DELAY_SECONDS: Final[float] = 300.0
+    POLL_BACKOFF_MULTIPLIER: Final[float] = 1.5
+    JOB_NAME_PREFIX: Final[str] = "llmmanager-batch"
+    DEFAULT_MAX_TOKENS: Final[int] = 4096
+    INPUT_FILE_NAME: Final[str] = "input.jsonl"
+    OUTPUT_FILE_SUFFIX: Final[str] = ".jsonl.out"
+    ACCESS_METHOD_NAME: Final[str] = "batch_inference"
+
+
+class BatchInferenceLogMessages:
+    """Logging message constants for batch inference."""
+
+    ROUTED_TO_BATCH: Final[str] = (
+        "Routing {request_count} requests to Bedrock batch inference ({job_count} job(s))"
+    )
+    JOB_SUBMITTED: Final[str] = "Submitted batch inference job {job_name} ({job_arn})"
+    JOB_STATUS: Final[str] = "Batch inference job {job_arn} status: {status}"
+    JOB_FINISHED: Final[str] = "Batch inference job {job_arn} finished with status {status}"
+
+
+class BatchInferenceErrorMessages:
+    """Error message constants for batch inference."""
+
+    INVALID_S3_URI: Final[str] = "Invalid S3 URI: '{uri}'"
+    UNSUPPORTED_CONTENT_BLOCK: Final[str] = (
+        "Content block type(s) {block_types} are not supported by batch inference "
+        "(request '{request_id}')"
+    )
+    SUBMISSION_FAILED: Final[str] = "Failed to submit batch inference job {job_name}: {error}"
+    POLL_FAILED: Final[str] = "Failed to poll batch inference job {job_arn}: {error}"
+    OUTPUT_READ_FAILED: Final[str] = (
+        "Failed to read output of batch inference job {job_arn}: {error}"
+    )
+    JOB_NOT_SUCCESSFUL: Final[str] = "Batch inference job {job_arn} ended with status {status}"
+    WAIT_TIMEOUT: Final[str] = (
+        "Batch inference job {job_arn} did not finish within {timeout_seconds:.0f}s"
+    )
+    RECORD_MISSING: Final[str] = "No output record for request in batch inference job {job_arn}"
+    RECORD_FAILED: Final[str] = "Batch inference record failed: {error_code}: {error_message}"
+    UNSUPPORTED_MODEL: Final[str] = (
+        "Batch inference records can only be formatted for Anthropic Claude models, "
+        "not for model ID '{model_id}'"
+    )
+    MODEL_NOT_RESOLVED: Final[str] = (
+        "Could not resolve a model ID for batch inference of model '{model}' in region '{region}'"
+    )
@@ -0,0 +1,142 @@
+"""
+Data structures for Bedrock batch inference (model invocation jobs) in LLM Manager system.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, Optional
+
+from .batch_inference_constants import BatchInferenceDefaults
+
+
+class ExecutionBackend(str, Enum):
+    """Backend used to execute a batch of requests."""
+
+    ON_DEMAND = "on_demand"
+    BATCH_INFERENCE = "batch_inference"
+
+
+@dataclass
+class BatchInferenceConfig:
+    """
+    Configuration for executing requests as Bedrock model invocation jobs.
+
+    Batch inference is billed at a discount to on-demand ``converse`` and does not
+    consume on-demand throughput quotas, but jobs run asynchronously and may take up to
+    their timeout to complete. ``ParallelLLMManager`` therefore only routes a call to
+    batch inference when it has at least ``min_batch_size`` requests and neither its
+    deadline nor any request's deadline (if any) is less than ``min_deadline_seconds``
+    away.
+
+    Attributes:
+        role_arn: IAM service role Bedrock assumes to read input and write output
+        s3_input_uri: S3 prefix input files are uploaded under (``s3://bucket/prefix``)
+        s3_output_uri: S3 prefix jobs write their output under
+        region: Region jobs are submitted in (defaults to the manager's first region)
+        model_id: Model or inference profile ID (resolved from the manager's first model
+            if not set); records are formatted for Anthropic Claude models only, so
+            calls for any other model run on-demand
+        min_batch_size: Minimum requests for routing to batch inference
+        max_records_per_job: Maximum records per job; larger batches are split
+        min_deadline_seconds: Minimum deadline for routing to batch inference
+        job_timeout_hours: Job timeout passed to Bedrock
+        poll_initial_delay_seconds: Delay before the first status poll
+        poll_max_delay_seconds: Maximum delay between status polls
+        poll_backoff_multiplier: Growth factor of the delay between polls
+        job_name_prefix: Prefix of generated job names
+        max_wait_seconds: Maximum time to wait for jobs to finish (None waits until the
+            jobs reach a terminal status)
+    """
+
+    role_arn: str
+    s3_input_uri: str
+    s3_output_uri: str
+    region: Optional[str] = None
+    model_id: Optional[str] = None
+    min_batch_size: int = BatchInferenceDefaults.MIN_BATCH_SIZE
+    max_records_per_job: int = BatchInferenceDefaults.MAX_RECORDS_PER_JOB
+    min_deadline_seconds: float = BatchInferenceDefaults.MIN_DEADLINE_SECONDS
+    job_timeout_hours: int = BatchInferenceDefaults.JOB_TIMEOUT_HOURS
+    poll_initial_delay_seconds: float = BatchInferenceDefaults.POLL_INITIAL_DELAY_SECONDS
+    poll_max_delay_seconds: float = BatchInferenceDefaults.POLL_MAX_DELAY_SECONDS
+    poll_backoff_multiplier: float = BatchInferenceDefaults.POLL_BACKOFF_MULTIPLIER
+    job_name_prefix: str = BatchInferenceDefaults.JOB_NAME_PREFIX
+    max_wait_seconds: Optional[float] = None
+
+    def __post_init__(self) -> None:
+        """Validate batch inference configuration."""
+        for name in ("s3_input_uri", "s3_output_uri"):
+            if not getattr(self, name).startswith("s3://"):
+                raise ValueError(f"{name} must be an s3:// URI, got: {getattr(self, name)}")
+        if not self.role_arn:
+            raise ValueError("role_arn must not be empty")
+        if self.min_batch_size < 1:
+            raise ValueError(f"min_batch_size must be positive, got: {self.min_batch_size}")
+        if self.max_records_per_job < self.min_batch_size:
+            raise ValueError(
+                f"max_records_per_job ({self.max_records_per_job}) must not be smaller than "
+                f"min_batch_size ({self.min_batch_size})"
+            )
+        if self.job_timeout_hours <= 0:
+            raise ValueError(f"job_timeout_hours must be positive, got: {self.job_timeout_hours}")
+        if self.poll_initial_delay_seconds < 0 or self.poll_max_delay_seconds < 0:
+            raise ValueError("poll delays must not be negative")
+        if self.poll_backoff_multiplier < 1.0:
+            raise ValueError(
+                f"poll_backoff_multiplier must be at least 1.0, got: {self.poll_backoff_multiplier}"
+            )
+        if self.max_wait_seconds is not None and self.max_wait_seconds <= 0:
+            raise ValueError(f"max_wait_seconds must be positive, got: {self.max_wait_seconds}")
+
+
+@dataclass
+class BatchInferenceJobInfo:
+    """
+    State of one submitted model invocation job.
+
+    Attributes:
+        job_name: Name the job was submitted with
+        job_arn: ARN returned by CreateModelInvocationJob
+        input_uri: S3 URI of the uploaded input file
+        output_uri: S3 prefix the job writes its output under
+        record_count: Number of records in the input file
+        status: Last observed job status
+        message: Last status message reported by Bedrock
+        submitted_at: When the job was submitted
+        finished_at: When a terminal status was observed
+    """
+
+    job_name: str
+    job_arn: str
+    input_uri: str
+    output_uri: str
+    record_count: int
+    status: Optional[str] = None
+    message: Optional[str] = None
+    submitted_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    @property
+    def job_id(self) -> str:
+        """Job ID (last segment of the job ARN), used as output sub-prefix by Bedrock."""
+        return self.job_arn.rsplit("/", 1)[-1]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to dictionary for serialization.
+
+        Returns:
+            Dictionary representation of the job info
+        """
+        return {
+            "job_name": self.job_name,
+            "job_arn": self.job_arn,
+            "input_uri": self.input_uri,
+            "output_uri": self.output_uri,
+            "record_count": self.record_count,
+            "status": self.status,
+            "message": self.message,
+            "submitted_at": self.submitted_at.isoformat() if self.submitted_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+        }
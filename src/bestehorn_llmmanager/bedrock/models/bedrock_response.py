@@ -6,10 +6,11 @@ Provides comprehensive response handling with convenience methods.
 import json
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 from .cache_detail import CacheDetail
 from .citation import Citation
+from .compact_response import CompactError, ResponseSummary
 from .content_block_types import ResponseContentType
 from .llm_manager_constants import ConverseAPIFields
 from .llm_manager_structures import RequestAttempt, ValidationAttempt
@@ -18,7 +19,7 @@ from .stop_reason import StopReasonCategory, StopReasonClassifier
 from .tool_use import ToolUse
 
 
-@dataclass
+@dataclass(slots=True)
 class BedrockResponse:
     """
     Comprehensive response object from LLM Manager operations.
@@ -44,6 +45,8 @@ class BedrockResponse:
         parameters_removed: List of parameter names removed due to incompatibility
         original_additional_fields: Original additionalModelRequestFields before removal
         final_additional_fields: Final additionalModelRequestFields actually used
+        summary: Text, usage, metrics and stop reason kept after compact() dropped
+            response_data
     """
 
     success: bool
@@ -63,6 +66,31 @@ class BedrockResponse:
     parameters_removed: Optional[List[str]] = None
     original_additional_fields: Optional[Dict[str, Any]] = None
     final_additional_fields: Optional[Dict[str, Any]] = None
+    summary: Optional[ResponseSummary] = None
+
+    def compact(self) -> None:
+        """
+        Reduce the memory held by the response.
+
+        Replaces the raw ``response_data`` by a :class:`ResponseSummary` of its text
+        content, usage, metrics and stop reason, and the exceptions recorded by the
+        attempts by traceback-free :class:`CompactError` records. The text, token,
+        metrics and stop reason accessors keep working; other content blocks (tool use,
+        reasoning, images, citations), additional model response fields, performance
+        and service tier information and guardrail traces are no longer available.
+        Compacting is idempotent.
+        """
+        if self.response_data is not None:
+            self.summary = ResponseSummary.from_response_data(response_data=self.response_data)
+            self.response_data = None
+        for attempt in self.attempts:
+            attempt.compact()
+
+    def _get_response_data(self) -> Optional[Dict[str, Any]]:
+        """Get the raw response data, rebuilt from the summary if it was dropped."""
+        if self.response_data is None and self.summary is not None:
+            return self.summary.to_response_data()
+        return self.response_data
 
     def get_content_blocks(self) -> Optional[List[Any]]:
         """
@@ -87,11 +115,12 @@ class BedrockResponse:
         Reference:
             https://docs.aws.amazon.com/bedrock/latest/APIReference/API_runtime_ContentBlock.html
         """
-        if not self.success or not self.response_data:
+        response_data = self._get_response_data()
+        if not self.success or not response_data:
             return None
 
         try:
-            output = self.response_data.get(ConverseAPIFields.OUTPUT, {})
+            output = response_data.get(ConverseAPIFields.OUTPUT, {})
             message = output.get(ConverseAPIFields.MESSAGE, {})
             content_blocks = message.get(ConverseAPIFields.CONTENT, None)
         except (KeyError, TypeError, AttributeError):
@@ -289,11 +318,12 @@ class BedrockResponse:
         Returns:
             Dictionary with usage information, None if not available
         """
-        if not self.success or not self.response_data:
+        response_data = self._get_response_data()
+        if not self.success or not response_data:
             return None
 
         try:
-            usage = self.response_data.get(ConverseAPIFields.USAGE, {})
+            usage = response_data.get(ConverseAPIFields.USAGE, {})
             return {
                 "input_tokens": usage.get(ConverseAPIFields.INPUT_TOKENS, 0),
                 "output_tokens": usage.get(ConverseAPIFields.OUTPUT_TOKENS, 0),
@@ -367,11 +397,12 @@ class BedrockResponse:
             A list of :class:`CacheDetail` (input token count + TTL per segment), empty
             if unavailable.
         """
-        if not self.success or not self.response_data:
+        response_data = self._get_response_data()
+        if not self.success or not response_data:
             return []
 
         try:
-            usage = self.response_data.get(ConverseAPIFields.USAGE, {})
+            usage = response_data.get(ConverseAPIFields.USAGE, {})
             raw_details = usage.get(ConverseAPIFields.CACHE_DETAILS) or []
             return [CacheDetail.from_cache_detail(cache_detail=detail) for detail in raw_details]
         except (KeyError, TypeError, AttributeError):
@@ -384,14 +415,15 @@ class BedrockResponse:
         Returns:
             Dictionary with metrics information, None if not available
         """
-        if not self.success or not self.response_data:
+        response_data = self._get_response_data()
+        if not self.success or not response_data:
             return None
 
         metrics = {}
 
         # API latency from response
         try:
-            response_metrics = self.response_data.get(ConverseAPIFields.METRICS, {})
+            response_metrics = response_data.get(ConverseAPIFields.METRICS, {})
             if ConverseAPIFields.LATENCY_MS in response_metrics:
                 metrics["api_latency_ms"] = response_metrics[ConverseAPIFields.LATENCY_MS]
         except (KeyError, TypeError, AttributeError):
@@ -418,11 +450,12 @@ class BedrockResponse:
         Returns:
             Stop reason string, None if not available
         """
-        if not self.success or not self.response_data:
+        response_data = self._get_response_data()
+        if not self.success or not response_data:
             return None
 
         try:
-            return self.response_data.get(ConverseAPIFields.STOP_REASON)
+            return response_data.get(ConverseAPIFields.STOP_REASON)
         except (KeyError, TypeError, AttributeError):
             return None
 
@@ -449,11 +482,12 @@ class BedrockResponse:
         Returns:
             Dictionary with additional fields, None if not available
         """
-        if not self.success or not self.response_data:
+        response_data = self._get_response_data()
+        if not self.success or not response_data:
             return None
 
         try:
-            return self.response_data.get(ConverseAPIFields.ADDITIONAL_MODEL_RESPONSE_FIELDS)
+            return response_data.get(ConverseAPIFields.ADDITIONAL_MODEL_RESPONSE_FIELDS)
         except (KeyError, TypeError, AttributeError):
             return None
 
@@ -465,10 +499,11 @@ class BedrockResponse:
             The ``performanceConfig`` dict (e.g. ``{"latency": "optimized"}``) if present,
             None otherwise.
         """
-        if not self.success or not self.response_data:
+        response_data = self._get_response_data()
+        if not self.success or not response_data:
             return None
         try:
-            return self.response_data.get(ConverseAPIFields.PERFORMANCE_CONFIG)
+            return response_data.get(ConverseAPIFields.PERFORMANCE_CONFIG)
         except (KeyError, TypeError, AttributeError):
             return None
 
@@ -479,10 +514,11 @@ class BedrockResponse:
         Returns:
             The ``serviceTier`` dict (e.g. ``{"type": "flex"}``) if present, None otherwise.
         """
-        if not self.success or not self.response_data:
+        response_data = self._get_response_data()
+        if not self.success or not response_data:
             return None
         try:
-            return self.response_data.get(ConverseAPIFields.SERVICE_TIER)
+            return response_data.get(ConverseAPIFields.SERVICE_TIER)
         except (KeyError, TypeError, AttributeError):
             return None
 
@@ -499,10 +535,11 @@ class BedrockResponse:
         Returns:
             The ``trace.guardrail`` assessment dict if present, None otherwise.
         """
-        if not self.success or not self.response_data:
+        response_data = self._get_response_data()
+        if not self.success or not response_data:
             return None
         try:
-            trace = self.response_data.get(ConverseAPIFields.TRACE)
+            trace = response_data.get(ConverseAPIFields.TRACE)
             if not isinstance(trace, dict):
                 return None
             return trace.get(ConverseAPIFields.GUARDRAIL)
@@ -796,7 +833,7 @@ class BedrockResponse:
         """
         return {
             "success": self.success,
-            "response_data": self.response_data,
+            "response_data": self._get_response_data(),
             "model_used": self.model_used,
             "region_used": self.region_used,
             "access_method_used": self.access_method_used,
@@ -988,6 +1025,7 @@ class StreamingResponse:
     _stream_iterator: Optional[Any] = field(default=None, init=False, repr=False)
     _stream_completed: bool = field(default=False, init=False, repr=False)
     _start_time: Optional[datetime] = field(default=None, init=False, repr=False)
+    _json_parser: Optional[Any] = field(default=None, init=False, repr=False)
 
     def __post_init__(self) -> None:
         """Initialize the streaming response."""
@@ -1270,6 +1308,66 @@ class StreamingResponse:
         """
         return "".join(self.content_parts)
 
+    def iter_structured_output(self) -> Iterator[Tuple[Union[int, str], Any]]:
+        """
+        Stream a structured (JSON) response member by member as it is generated.
+
+        Drives the underlying stream and incrementally parses the text deltas of a
+        schema-constrained response (see ``build_json_schema_output_config``). Each
+        top-level array element is yielded as ``(index, element)`` and each top-level
+        object field as ``(key, value)`` as soon as it closes, so downstream processing
+        can start before generation finishes. Content already consumed through plain
+        iteration is parsed first, so the two styles can be mixed.
+
+        After the stream ends, :meth:`get_structured_output` returns the assembled
+        document without re-parsing the full text.
+
+        Yields:
+            ``(index, element)`` or ``(key, value)`` tuples in document order
+
+        Raises:
+            StreamingError: If the streamed text is not valid JSON, or the stream
+                completed successfully but the JSON document is incomplete
+        """
+        # Import here to avoid circular imports
+        from ..streaming.incremental_json_parser import IncrementalJSONParser
+
+        if self._json_parser is None:
+            self._json_parser = IncrementalJSONParser()
+            yield from self._json_parser.feed("".join(self.content_parts))
+
+        for chunk in self:
+            yield from self._json_parser.feed(chunk)
+
+        if self.success and not self._json_parser.is_complete():
+            self._json_parser.finish()
+
+    def get_structured_output(self) -> Optional[Any]:
+        """
+        Get the streamed text content as a structured JSON object or array.
+
+        Mirrors :meth:`BedrockResponse.get_structured_output`. When the stream was
+        consumed through :meth:`iter_structured_output`, the incrementally assembled
+        document is returned directly; otherwise the accumulated content is parsed.
+
+        Returns:
+            The parsed JSON object/array; ``None`` if there is no content, the content is
+            not valid JSON, or it is a non-structured scalar
+        """
+        if self._json_parser is not None and self._json_parser.is_complete():
+            parsed = self._json_parser.get_result()
+        else:
+            content = self.get_full_content()
+            if not content:
+                return None
+            try:
+                parsed = json.loads(content)
+            except (ValueError, TypeError):
+                return None
+        if isinstance(parsed, (dict, list)):
+            return parsed
+        return None
+
     def get_guardrail_trace(self) -> Optional[Dict[str, Any]]:
         """
         Get the guardrail trace assessment captured during streaming (issue #38).
@@ -1320,6 +1418,29 @@ class StreamingResponse:
         """
         return [Citation.from_citation(citation=block) for block in self.citation_blocks]
 
+    def compact(self) -> None:
+        """
+        Reduce the memory held by a completed stream.
+
+        Joins the content parts into one, replaces the stream errors by traceback-free
+        :class:`CompactError` records, compacts the request attempt and final response
+        (see :meth:`BedrockResponse.compact`) and releases the event stream. Has no effect
+        while the stream is still being consumed.
+        """
+        if not self._stream_completed:
+            return
+        if len(self.content_parts) > 1:
+            self.content_parts = ["".join(self.content_parts)]
+        self.stream_errors = [
+            CompactError.from_exception(error=error) for error in self.stream_errors
+        ]
+        if self.request_attempt is not None:
+            self.request_attempt.compact()
+        if self.final_response is not None:
+            self.final_response.compact()
+        self._event_stream = None
+        self._stream_iterator = None
+
     def get_content_parts(self) -> List[str]:
         """
         Get individual content parts as received during streaming.
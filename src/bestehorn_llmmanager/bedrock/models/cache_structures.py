@@ -102,6 +102,30 @@ class CachePointInfo:
     is_auto_inserted: bool = False
 
 
+@dataclass
+class TokenCalibration:
+    """
+    Learned correction of token estimates for one model family.
+
+    Attributes:
+        model_family: Model family the calibration applies to
+        scale: Factor applied to heuristic estimates (observed / estimated tokens)
+        sample_count: Number of responses the scale was learned from
+    """
+
+    model_family: str
+    scale: float = 1.0
+    sample_count: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert calibration to dictionary format."""
+        return {
+            "model_family": self.model_family,
+            "scale": self.scale,
+            "sample_count": self.sample_count,
+        }
+
+
 @dataclass
 class CacheMetrics:
     """
@@ -135,6 +159,49 @@ class CacheMetrics:
         }
 
 
+@dataclass
+class ConversationCacheStats:
+    """
+    Prompt-cache usage of a conversation session.
+
+    Attributes:
+        turns: Number of completed turns
+        input_tokens: Input tokens neither read from nor written to the cache
+        output_tokens: Output tokens of all turns
+        cache_read_tokens: Input tokens read from the cache
+        cache_write_tokens: Input tokens written to the cache
+        cache_points: Cache points sent with the last request
+        cached_prefix_tokens: Tokens of the longest conversation prefix known to be cached
+    """
+
+    turns: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+    cache_points: int = 0
+    cached_prefix_tokens: int = 0
+
+    @property
+    def cache_hit_ratio(self) -> float:
+        """Share of all input tokens that were read from the cache."""
+        total = self.input_tokens + self.cache_read_tokens + self.cache_write_tokens
+        return self.cache_read_tokens / total if total else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert statistics to dictionary format."""
+        return {
+            "turns": self.turns,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "cache_read_tokens": self.cache_read_tokens,
+            "cache_write_tokens": self.cache_write_tokens,
+            "cache_points": self.cache_points,
+            "cached_prefix_tokens": self.cached_prefix_tokens,
+            "cache_hit_ratio": self.cache_hit_ratio,
+        }
+
+
 class CacheAvailabilityTracker:
     """
     Tracks which model/region combinations support caching.
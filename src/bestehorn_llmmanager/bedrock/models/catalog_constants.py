@@ -153,6 +153,9 @@ class CatalogDefaults:
 
     # Cache settings
     DEFAULT_CACHE_MAX_AGE_HOURS: Final[float] = 24.0
+    # Regions that failed to load (e.g. not opted in or access denied) are recorded in
+    # the cache and not fetched again by warm loads until this much time has passed
+    FAILED_REGION_RETRY_HOURS: Final[float] = 1.0
     DEFAULT_FORCE_REFRESH: Final[bool] = False
     DEFAULT_FALLBACK_TO_BUNDLED: Final[bool] = True
 
@@ -245,6 +248,9 @@ class CatalogLogMessages:
     API_FETCH_REGION_COMPLETED: Final[str] = "Region {region}: {models} models, {profiles} profiles"
     API_FETCH_REGION_FAILED: Final[str] = "Region {region} failed: {error}"
     API_RETRY_ATTEMPT: Final[str] = "Retrying API call (attempt {attempt}/{max_attempts}): {error}"
+    REGIONS_LOADING: Final[str] = "Loading catalog data for additional regions: {regions}"
+    REGIONS_LOADED: Final[str] = "Merged catalog data for {regions} ({count} models in total)"
+    REGIONS_LOAD_FAILED: Final[str] = "Failed to load catalog data for {regions}: {error}"
 
     # Bundled data messages
     BUNDLED_LOADING: Final[str] = "Loading bundled fallback data"
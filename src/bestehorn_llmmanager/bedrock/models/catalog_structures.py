@@ -5,7 +5,7 @@ This module contains the core data structures for the redesigned model catalog
 that uses API-only data retrieval and supports multiple caching strategies.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
@@ -55,6 +55,8 @@ class CatalogMetadata:
         api_regions_queried: List of AWS regions queried for API data
         bundled_data_version: Version of bundled data if used
         cache_file_path: Path to cache file if FILE mode is used
+        api_regions_failed: Regions whose API query failed, with the time of the last
+            failed attempt
     """
 
     source: CatalogSource
@@ -62,6 +64,7 @@ class CatalogMetadata:
     api_regions_queried: List[str]
     bundled_data_version: Optional[str] = None
     cache_file_path: Optional[Path] = None
+    api_regions_failed: Dict[str, datetime] = field(default_factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -76,6 +79,10 @@ class CatalogMetadata:
             "api_regions_queried": self.api_regions_queried,
             "bundled_data_version": self.bundled_data_version,
             "cache_file_path": str(self.cache_file_path) if self.cache_file_path else None,
+            "api_regions_failed": {
+                region: failed_at.isoformat()
+                for region, failed_at in self.api_regions_failed.items()
+            },
         }
 
     @classmethod
@@ -99,6 +106,10 @@ class CatalogMetadata:
 
             cache_file_path_str = data.get("cache_file_path")
             cache_file_path = Path(cache_file_path_str) if cache_file_path_str else None
+            api_regions_failed = {
+                region: datetime.fromisoformat(failed_at)
+                for region, failed_at in data.get("api_regions_failed", {}).items()
+            }
 
             return cls(
                 source=source,
@@ -106,8 +117,9 @@ class CatalogMetadata:
                 api_regions_queried=api_regions_queried,
                 bundled_data_version=data.get("bundled_data_version"),
                 cache_file_path=cache_file_path,
+                api_regions_failed=api_regions_failed,
             )
-        except (KeyError, ValueError, TypeError) as e:
+        except (KeyError, ValueError, TypeError, AttributeError) as e:
             raise ValueError(f"Invalid catalog metadata structure: {e}") from e
 
 
@@ -242,6 +254,72 @@ class UnifiedCatalog:
         providers = {model_info.provider for model_info in self.models.values()}
         return sorted(list(providers))
 
+    def merge(self, other: "UnifiedCatalog") -> "UnifiedCatalog":
+        """
+        Merge the models of another catalog into a new catalog.
+
+        Used to add regions fetched after the initial load. Region access of models
+        present in both catalogs is combined; entries already in this catalog win.
+
+        Args:
+            other: Catalog with models of additional regions
+
+        Returns:
+            New UnifiedCatalog with the models, queried regions and failed regions of
+            both catalogs; a region queried by either catalog is no longer failed
+        """
+        models = dict(self.models)
+        for model_name, model_info in other.models.items():
+            existing = models.get(model_name)
+            if existing is None:
+                models[model_name] = model_info
+                continue
+            new_access = {
+                region: access_info
+                for region, access_info in model_info.region_access.items()
+                if region not in existing.region_access
+            }
+            if new_access:
+                models[model_name] = replace(
+                    existing, region_access={**existing.region_access, **new_access}
+                )
+
+        queried = list(self.metadata.api_regions_queried)
+        queried.extend(
+            region for region in other.metadata.api_regions_queried if region not in queried
+        )
+        failed = {**self.metadata.api_regions_failed, **other.metadata.api_regions_failed}
+        return UnifiedCatalog(
+            models=models,
+            metadata=replace(
+                self.metadata,
+                api_regions_queried=queried,
+                api_regions_failed={
+                    region: failed_at
+                    for region, failed_at in failed.items()
+                    if region not in queried
+                },
+            ),
+        )
+
+    def with_failed_regions(self, regions: List[str], failed_at: datetime) -> "UnifiedCatalog":
+        """
+        Record regions whose API query failed.
+
+        Args:
+            regions: Regions that failed to load
+            failed_at: Time of the failed attempt
+
+        Returns:
+            New UnifiedCatalog with the regions recorded as failed
+        """
+        failed = dict(self.metadata.api_regions_failed)
+        failed.update((region, failed_at) for region in regions)
+        return UnifiedCatalog(
+            models=self.models,
+            metadata=replace(self.metadata, api_regions_failed=failed),
+        )
+
 
 # Type aliases for better code readability
 CatalogDict = Dict[str, Any]
@@ -0,0 +1,133 @@
+"""
+Compact records kept by compacted responses.
+
+A Converse response carries its full ``response_data`` dict (HTTP metadata, headers,
+every content block) and its attempts keep the live exceptions that were raised, whose
+tracebacks pin the frames, and with them the request payloads, of the failed calls.
+:class:`ResponseSummary` keeps only the text, usage, metrics and stop reason of a
+response, and :class:`CompactError` keeps only the type name and message of an exception.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from .llm_manager_constants import ConverseAPIFields
+
+
+class CompactError(Exception):
+    """
+    Traceback-free stand-in for an exception recorded by a compacted response.
+
+    Holds the type name and message of the original exception; the exception itself,
+    its traceback and its chained exceptions are released.
+
+    Attributes:
+        error_type: Class name of the original exception
+    """
+
+    def __init__(self, error_type: str, message: str) -> None:
+        """
+        Initialize the compact error.
+
+        Args:
+            error_type: Class name of the original exception
+            message: Message of the original exception
+        """
+        super().__init__(message)
+        self.error_type = error_type
+
+    @classmethod
+    def from_exception(cls, error: Exception) -> "CompactError":
+        """
+        Create the compact record of an exception.
+
+        Args:
+            error: Exception to record
+
+        Returns:
+            CompactError with the type name and message of error (error itself if it is
+            already compact)
+        """
+        if isinstance(error, CompactError):
+            return error
+        return cls(error_type=type(error).__name__, message=str(error))
+
+    @property
+    def message(self) -> str:
+        """Message of the original exception."""
+        return str(self)
+
+    def __repr__(self) -> str:
+        """Return string representation of the CompactError."""
+        return f"CompactError(error_type={self.error_type}, message={str(self)!r})"
+
+
+@dataclass(frozen=True, slots=True)
+class ResponseSummary:
+    """
+    The parts of a Converse response kept after its raw ``response_data`` is dropped.
+
+    Attributes:
+        text_blocks: Text of the assistant's text content blocks, in order
+        stop_reason: Reason the model stopped generating
+        usage: Raw ``usage`` object of the response
+        metrics: Raw ``metrics`` object of the response
+    """
+
+    text_blocks: Tuple[str, ...] = ()
+    stop_reason: Optional[str] = None
+    usage: Optional[Dict[str, Any]] = None
+    metrics: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def from_response_data(cls, response_data: Dict[str, Any]) -> "ResponseSummary":
+        """
+        Extract the summary of a raw Converse response.
+
+        Args:
+            response_data: Raw response data from the Bedrock Converse API
+
+        Returns:
+            ResponseSummary of the response
+        """
+        output = response_data.get(ConverseAPIFields.OUTPUT) or {}
+        message = output.get(ConverseAPIFields.MESSAGE) or {}
+        content_blocks = message.get(ConverseAPIFields.CONTENT) or []
+        return cls(
+            text_blocks=tuple(
+                block[ConverseAPIFields.TEXT]
+                for block in content_blocks
+                if isinstance(block, dict) and ConverseAPIFields.TEXT in block
+            ),
+            stop_reason=response_data.get(ConverseAPIFields.STOP_REASON),
+            usage=response_data.get(ConverseAPIFields.USAGE),
+            metrics=response_data.get(ConverseAPIFields.METRICS),
+        )
+
+    def to_response_data(self) -> Dict[str, Any]:
+        """
+        Rebuild a minimal Converse response from the summary.
+
+        The dict is decoded on every call, so the summary itself stays compact; it
+        holds the text content blocks, stop reason, usage and metrics only.
+
+        Returns:
+            Response data in the shape of the Converse API response
+        """
+        response_data: Dict[str, Any] = {
+            ConverseAPIFields.OUTPUT: {
+                ConverseAPIFields.MESSAGE: {
+                    ConverseAPIFields.ROLE: ConverseAPIFields.ROLE_ASSISTANT,
+                    ConverseAPIFields.CONTENT: [
+                        {ConverseAPIFields.TEXT: text} for text in self.text_blocks
+                    ],
+                }
+            }
+        }
+        if self.stop_reason is not None:
+            response_data[ConverseAPIFields.STOP_REASON] = self.stop_reason
+        if self.usage is not None:
+            response_data[ConverseAPIFields.USAGE] = self.usage
+        if self.metrics is not None:
+            response_data[ConverseAPIFields.METRICS] = self.metrics
+        return response_data
@@ -38,6 +38,13 @@ class HTMLTableColumns:
     HYPERPARAMETERS: Final[str] = "Hyperparameters"
 
 
+class HTMLParserFeatures:
+    """BeautifulSoup tree builder names used by the documentation parsers."""
+
+    LXML: Final[str] = "lxml"
+    HTML_PARSER: Final[str] = "html.parser"
+
+
 class BooleanValues:
     """Constants for boolean value conversion."""
 
@@ -59,6 +66,17 @@ class FilePaths:
 
     DEFAULT_HTML_OUTPUT: Final[str] = "docs/FoundationalModels.htm"
     DEFAULT_JSON_OUTPUT: Final[str] = "docs/FoundationalModels.json"
+    VALIDATORS_SUFFIX: Final[str] = ".validators.json"
+
+
+class HTTPHeaders:
+    """HTTP header and status constants for conditional documentation downloads."""
+
+    ETAG: Final[str] = "ETag"
+    LAST_MODIFIED: Final[str] = "Last-Modified"
+    IF_NONE_MATCH: Final[str] = "If-None-Match"
+    IF_MODIFIED_SINCE: Final[str] = "If-Modified-Since"
+    STATUS_NOT_MODIFIED: Final[int] = 304
 
 
 class LogMessages:
@@ -66,6 +84,8 @@ class LogMessages:
 
     DOWNLOAD_STARTED: Final[str] = "Starting download of Bedrock documentation"
     DOWNLOAD_COMPLETED: Final[str] = "Successfully downloaded documentation to {file_path}"
+    DOWNLOAD_NOT_MODIFIED: Final[str] = "Documentation not modified, keeping {file_path}"
+    CATALOG_REUSED: Final[str] = "Documentation unchanged, reusing model data from {file_path}"
     PARSING_STARTED: Final[str] = "Starting HTML parsing"
     PARSING_COMPLETED: Final[str] = "Successfully parsed {model_count} models"
     JSON_EXPORT_STARTED: Final[str] = "Starting JSON export"
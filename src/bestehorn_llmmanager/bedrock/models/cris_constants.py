@@ -109,6 +109,7 @@ class CRISLogMessages:
     JSON_EXPORT_COMPLETED: Final[str] = "Successfully exported CRIS JSON to {file_path}"
     CACHE_LOADED: Final[str] = "Loaded cached CRIS data from {file_path}"
     CACHE_MISS: Final[str] = "No valid cached CRIS data found"
+    CATALOG_REUSED: Final[str] = "CRIS documentation unchanged, reusing data from {file_path}"
     SECTION_PARSED: Final[str] = "Parsed CRIS model: {model_name}"
     SECTION_SKIPPED: Final[str] = "Skipped invalid CRIS section: {section_id}"
     NETWORK_ERROR: Final[str] = "Network error during CRIS download: {error}"
@@ -5,7 +5,7 @@ Contains typed data classes and models for representing Bedrock model informatio
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 from .constants import JSONFields
 
@@ -58,6 +58,35 @@ class BedrockModelInfo:
             JSONFields.INFERENCE_TYPES_SUPPORTED: self.inference_types_supported,
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BedrockModelInfo":
+        """
+        Create BedrockModelInfo from dictionary data (for deserialization).
+
+        Args:
+            data: Dictionary in the format produced by to_dict()
+
+        Returns:
+            BedrockModelInfo instance
+
+        Raises:
+            ValueError: If data structure is invalid
+        """
+        try:
+            return cls(
+                provider=data[JSONFields.PROVIDER],
+                model_id=data[JSONFields.MODEL_ID],
+                regions_supported=list(data[JSONFields.REGIONS_SUPPORTED]),
+                input_modalities=list(data[JSONFields.INPUT_MODALITIES]),
+                output_modalities=list(data[JSONFields.OUTPUT_MODALITIES]),
+                streaming_supported=bool(data[JSONFields.STREAMING_SUPPORTED]),
+                inference_parameters_link=data.get(JSONFields.INFERENCE_PARAMETERS_LINK),
+                hyperparameters_link=data.get(JSONFields.HYPERPARAMETERS_LINK),
+                inference_types_supported=data.get(JSONFields.INFERENCE_TYPES_SUPPORTED),
+            )
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Invalid model data structure: {e}") from e
+
 
 @dataclass(frozen=True)
 class ModelCatalog:
@@ -86,6 +115,35 @@ class ModelCatalog:
             },
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ModelCatalog":
+        """
+        Create ModelCatalog from dictionary data (for deserialization).
+
+        Args:
+            data: Dictionary in the format produced by to_dict()
+
+        Returns:
+            ModelCatalog instance
+
+        Raises:
+            ValueError: If data structure is invalid
+        """
+        try:
+            models_data = data[JSONFields.MODELS]
+            if not isinstance(models_data, dict):
+                raise ValueError("Models data must be a dictionary")
+
+            return cls(
+                retrieval_timestamp=datetime.fromisoformat(data[JSONFields.RETRIEVAL_TIMESTAMP]),
+                models={
+                    model_name: BedrockModelInfo.from_dict(data=model_data)
+                    for model_name, model_data in models_data.items()
+                },
+            )
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Invalid catalog data structure: {e}") from e
+
     @property
     def model_count(self) -> int:
         """Get the total number of models in the catalog."""
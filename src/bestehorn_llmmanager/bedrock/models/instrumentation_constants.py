@@ -0,0 +1,62 @@
+"""
+Constants for request-path instrumentation in LLM Manager system.
+Defines span names, metric names, attribute keys and log messages.
+"""
+
+from typing import Final
+
+
+class InstrumentationSpanNames:
+    """Names of the spans emitted along the request path."""
+
+    CONVERSE: Final[str] = "llm_manager.converse"
+    CONVERSE_STREAM: Final[str] = "llm_manager.converse_stream"
+    TARGET_GENERATION: Final[str] = "llm_manager.target_generation"
+    CLIENT_ACQUISITION: Final[str] = "auth.client_acquisition"
+    API_CALL: Final[str] = "bedrock.api_call"
+    RETRY_ATTEMPT: Final[str] = "retry.attempt"
+    BACKOFF_SLEEP: Final[str] = "retry.backoff_sleep"
+    CATALOG_LOAD: Final[str] = "catalog.load"
+    STREAM_SETUP: Final[str] = "stream.setup"
+
+
+class InstrumentationMetricNames:
+    """Names of the metrics (histogram observations) emitted along the request path."""
+
+    QUEUE_WAIT_MS: Final[str] = "parallel.queue_wait_ms"
+    TIME_TO_FIRST_TOKEN_MS: Final[str] = "stream.time_to_first_token_ms"  # noqa: S105 - metric name, not a secret
+    STREAM_DURATION_MS: Final[str] = "stream.duration_ms"
+    RETRY_ATTEMPTS: Final[str] = "retry.attempts"
+    RATE_LIMIT_WAIT_MS: Final[str] = "rate_limit.wait_ms"
+
+
+class InstrumentationAttributes:
+    """Attribute keys attached to spans and metrics."""
+
+    MODEL: Final[str] = "model"
+    MODEL_ID: Final[str] = "model_id"
+    REGION: Final[str] = "region"
+    OPERATION: Final[str] = "operation"
+    ACCESS_METHOD: Final[str] = "access_method"
+    ATTEMPT_NUMBER: Final[str] = "attempt_number"
+    DELAY_SECONDS: Final[str] = "delay_seconds"
+    TARGET_COUNT: Final[str] = "target_count"
+    REQUEST_ID: Final[str] = "request_id"
+    SUCCESS: Final[str] = "success"
+    SOURCE: Final[str] = "source"
+
+
+class InstrumentationDefaults:
+    """Default values for instrumentation listeners."""
+
+    RECORDER_MAX_ENTRIES: Final[int] = 10000
+    HISTOGRAM_SUFFIX: Final[str] = ".duration_ms"
+    HISTOGRAM_UNIT: Final[str] = "ms"
+
+
+class InstrumentationLogMessages:
+    """Log message templates for instrumentation."""
+
+    LISTENER_FAILED: Final[str] = "Instrumentation listener {listener} failed in {hook}: {error}"
+    LISTENER_REGISTERED: Final[str] = "Registered instrumentation listener {listener}"
+    LISTENER_UNREGISTERED: Final[str] = "Unregistered instrumentation listener {listener}"
@@ -0,0 +1,61 @@
+"""
+Instrumentation data structures for LLM Manager.
+
+This module contains the span record passed to instrumentation listeners.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+
+@dataclass
+class InstrumentationSpan:
+    """
+    A timed operation on the request path.
+
+    Attributes:
+        name: Span name (see InstrumentationSpanNames)
+        span_id: Process-unique span identifier
+        parent_id: Identifier of the enclosing span on the same thread, if any
+        start_time_ns: Wall-clock start time in nanoseconds since the epoch
+        attributes: Span attributes (model, region, attempt number, ...)
+        duration_ms: Duration in milliseconds, None while the span is open
+        error: Type name of the exception that ended the span, if any
+    """
+
+    name: str
+    span_id: int
+    parent_id: Optional[int] = None
+    start_time_ns: int = 0
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    duration_ms: Optional[float] = None
+    error: Optional[str] = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """
+        Set a span attribute.
+
+        Args:
+            key: Attribute key
+            value: Attribute value
+        """
+        self.attributes[key] = value
+
+    @property
+    def end_time_ns(self) -> Optional[int]:
+        """Wall-clock end time in nanoseconds since the epoch, None while open."""
+        if self.duration_ms is None:
+            return None
+        return self.start_time_ns + int(self.duration_ms * 1_000_000)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert span to dictionary format."""
+        return {
+            "name": self.name,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_time_ns": self.start_time_ns,
+            "attributes": dict(self.attributes),
+            "duration_ms": self.duration_ms,
+            "error": self.error,
+        }
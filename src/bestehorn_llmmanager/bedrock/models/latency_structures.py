@@ -0,0 +1,347 @@
+"""
+Latency histograms for parallel execution statistics.
+
+Contains a mergeable log-linear histogram in the style of HdrHistogram and the per-batch
+latency statistics recorded by the parallel executors.
+"""
+
+import math
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+from .bedrock_response import BedrockResponse
+from .parallel_constants import LatencyHistogramConfig, ParallelProcessingFields
+
+
+class LatencyHistogram:
+    """
+    Mergeable latency histogram with bounded relative error.
+
+    Values are recorded in milliseconds and bucketed at microsecond resolution. Values
+    below ``2 ** SUB_BUCKET_BITS`` microseconds get one bucket each; above that, every
+    power-of-two range is split into ``2 ** (SUB_BUCKET_BITS - 1)`` linear sub-buckets,
+    so a percentile is off by less than 1% of its value. Only non-empty buckets are
+    stored, so a histogram covering microseconds to hours holds at most a few thousand
+    counters, and merging two histograms adds their counters.
+
+    Recording is not synchronized; callers sharing a histogram between threads must
+    hold a lock.
+    """
+
+    __slots__ = ("_counts", "count", "total_ms", "min_ms", "max_ms")
+
+    SUB_BUCKET_BITS = LatencyHistogramConfig.SUB_BUCKET_BITS
+    _SUB_BUCKET_COUNT = 1 << SUB_BUCKET_BITS
+    _HALF_SUB_BUCKET_COUNT = _SUB_BUCKET_COUNT >> 1
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        self._counts: Dict[int, int] = {}
+        self.count = 0
+        self.total_ms = 0.0
+        self.min_ms = 0.0
+        self.max_ms = 0.0
+
+    @classmethod
+    def _bucket_index(cls, value_us: int) -> int:
+        """Get the bucket index of a value in microseconds."""
+        if value_us < cls._SUB_BUCKET_COUNT:
+            return value_us
+        shift = value_us.bit_length() - cls.SUB_BUCKET_BITS
+        sub_bucket = value_us >> shift
+        return (
+            cls._SUB_BUCKET_COUNT
+            + (shift - 1) * cls._HALF_SUB_BUCKET_COUNT
+            + (sub_bucket - cls._HALF_SUB_BUCKET_COUNT)
+        )
+
+    @classmethod
+    def _bucket_midpoint_us(cls, index: int) -> float:
+        """Get the midpoint of a bucket in microseconds."""
+        if index < cls._SUB_BUCKET_COUNT:
+            return float(index)
+        offset = index - cls._SUB_BUCKET_COUNT
+        shift = offset // cls._HALF_SUB_BUCKET_COUNT + 1
+        sub_bucket = offset % cls._HALF_SUB_BUCKET_COUNT + cls._HALF_SUB_BUCKET_COUNT
+        return ((sub_bucket << shift) + ((sub_bucket + 1) << shift) - 1) / 2
+
+    def record(self, value_ms: float) -> None:
+        """
+        Record one latency observation.
+
+        Args:
+            value_ms: Latency in milliseconds; negative values are recorded as zero
+        """
+        value_ms = max(0.0, value_ms)
+        index = self._bucket_index(value_us=int(value_ms * 1000))
+        self._counts[index] = self._counts.get(index, 0) + 1
+        if self.count == 0:
+            self.min_ms = self.max_ms = value_ms
+        else:
+            if value_ms < self.min_ms:
+                self.min_ms = value_ms
+            if value_ms > self.max_ms:
+                self.max_ms = value_ms
+        self.count += 1
+        self.total_ms += value_ms
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """
+        Add the observations of another histogram to this one.
+
+        Args:
+            other: Histogram to merge into this one
+        """
+        if other.count == 0:
+            return
+        for index, bucket_count in other._counts.items():
+            self._counts[index] = self._counts.get(index, 0) + bucket_count
+        if self.count == 0:
+            self.min_ms, self.max_ms = other.min_ms, other.max_ms
+        else:
+            self.min_ms = min(self.min_ms, other.min_ms)
+            self.max_ms = max(self.max_ms, other.max_ms)
+        self.count += other.count
+        self.total_ms += other.total_ms
+
+    def copy(self) -> "LatencyHistogram":
+        """
+        Create an independent copy of this histogram.
+
+        Returns:
+            New LatencyHistogram with the same observations
+        """
+        histogram = LatencyHistogram()
+        histogram.merge(other=self)
+        return histogram
+
+    @property
+    def mean_ms(self) -> float:
+        """Exact mean of the recorded values, 0.0 if empty."""
+        return self.total_ms / self.count if self.count else 0.0
+
+    def percentile(self, fraction: float) -> float:
+        """
+        Get a percentile of the recorded values.
+
+        Args:
+            fraction: Percentile as a fraction in [0, 1] (0.99 for p99)
+
+        Returns:
+            Nearest-rank percentile in milliseconds, clamped to the recorded minimum and
+            maximum; 0.0 if the histogram is empty
+
+        Raises:
+            ValueError: If fraction is outside [0, 1]
+        """
+        if not 0.0 <= fraction <= 1.0:
+            raise ValueError(f"fraction must be between 0 and 1, got: {fraction}")
+        if self.count == 0:
+            return 0.0
+
+        # Rounding keeps e.g. 0.9 * 10 from ranking as 9.000000000000002 -> 10
+        rank = max(1, math.ceil(round(fraction * self.count, 9)))
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= rank:
+                value_ms = self._bucket_midpoint_us(index=index) / 1000
+                return min(self.max_ms, max(self.min_ms, value_ms))
+        return self.max_ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Summarize the histogram.
+
+        Returns:
+            Dictionary with count, min, mean, max and the p50/p90/p99/p999 percentiles
+        """
+        summary: Dict[str, Any] = {
+            "count": self.count,
+            "min_ms": self.min_ms,
+            "mean_ms": self.mean_ms,
+            "max_ms": self.max_ms,
+        }
+        for name, fraction in LatencyHistogramConfig.REPORTED_PERCENTILES.items():
+            summary[name] = self.percentile(fraction=fraction)
+        return summary
+
+    def __len__(self) -> int:
+        """Return the number of recorded values."""
+        return self.count
+
+    def __repr__(self) -> str:
+        """Return string representation of the LatencyHistogram."""
+        return (
+            f"LatencyHistogram(count={self.count}, p50={self.percentile(fraction=0.5):.1f}ms, "
+            f"p99={self.percentile(fraction=0.99):.1f}ms, max={self.max_ms:.1f}ms)"
+        )
+
+
+@dataclass
+class ParallelLatencyStats:
+    """
+    Latency distributions and measured concurrency of a parallel batch.
+
+    Request duration and time to first byte are recorded for successful final responses.
+    Converse returns the whole response at once, so the time to first byte is the
+    duration of the successful attempt, without earlier failed attempts and backoff.
+    Queue wait is recorded for every dispatch, including retries, as the time between
+    submission to the worker pool and the start of execution. Peak concurrency counts
+    the requests executing at the same time, from the start to the end of each call.
+
+    Recording is thread-safe. Statistics of several executions, such as the retry rounds
+    of a batch, are combined with :meth:`merge`.
+
+    Attributes:
+        request_duration: Total request durations including retries
+        time_to_first_byte: Time to the first byte of the successful attempt
+        queue_wait: Time dispatched requests waited for a worker
+        peak_concurrency: Highest number of requests measured executing at once
+        duration_by_region: Request durations per region the response came from
+        duration_by_model: Request durations per model that produced the response
+    """
+
+    request_duration: LatencyHistogram = field(default_factory=LatencyHistogram)
+    time_to_first_byte: LatencyHistogram = field(default_factory=LatencyHistogram)
+    queue_wait: LatencyHistogram = field(default_factory=LatencyHistogram)
+    peak_concurrency: int = 0
+    duration_by_region: Dict[str, LatencyHistogram] = field(default_factory=dict)
+    duration_by_model: Dict[str, LatencyHistogram] = field(default_factory=dict)
+    _executing: int = field(default=0, init=False, repr=False, compare=False)
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+
+    def record_response(self, response: BedrockResponse) -> None:
+        """
+        Record the final response of one request.
+
+        Args:
+            response: Final BedrockResponse of the request
+        """
+        duration = response.total_duration_ms
+        if not response.success or not isinstance(duration, (int, float)):
+            return
+        first_byte = self._get_time_to_first_byte(response=response)
+
+        with self._lock:
+            self.request_duration.record(value_ms=duration)
+            if first_byte is not None:
+                self.time_to_first_byte.record(value_ms=first_byte)
+            if response.region_used:
+                self.duration_by_region.setdefault(response.region_used, LatencyHistogram()).record(
+                    value_ms=duration
+                )
+            if response.model_used:
+                self.duration_by_model.setdefault(response.model_used, LatencyHistogram()).record(
+                    value_ms=duration
+                )
+
+    def record_queue_wait(self, wait_ms: float) -> None:
+        """
+        Record the time a dispatched request waited for a worker.
+
+        Args:
+            wait_ms: Queue wait in milliseconds
+        """
+        with self._lock:
+            self.queue_wait.record(value_ms=wait_ms)
+
+    def start_execution(self) -> None:
+        """Record that a request started executing and update the peak concurrency."""
+        with self._lock:
+            self._executing += 1
+            if self._executing > self.peak_concurrency:
+                self.peak_concurrency = self._executing
+
+    def finish_execution(self) -> None:
+        """Record that a request started with start_execution finished executing."""
+        with self._lock:
+            self._executing -= 1
+
+    def record_concurrency(self, in_flight: int) -> None:
+        """
+        Record the number of requests currently in flight.
+
+        Args:
+            in_flight: Number of requests executing at this moment
+        """
+        with self._lock:
+            if in_flight > self.peak_concurrency:
+                self.peak_concurrency = in_flight
+
+    def merge(self, other: "ParallelLatencyStats") -> "ParallelLatencyStats":
+        """
+        Combine these statistics with those of another execution.
+
+        Args:
+            other: Statistics to combine with these
+
+        Returns:
+            New ParallelLatencyStats holding the observations of both; the peak
+            concurrency is the higher of the two peaks
+        """
+        merged = ParallelLatencyStats()
+        for stats in (self, other):
+            with stats._lock:
+                merged.request_duration.merge(other=stats.request_duration)
+                merged.time_to_first_byte.merge(other=stats.time_to_first_byte)
+                merged.queue_wait.merge(other=stats.queue_wait)
+                merged.peak_concurrency = max(merged.peak_concurrency, stats.peak_concurrency)
+                for target, source in (
+                    (merged.duration_by_region, stats.duration_by_region),
+                    (merged.duration_by_model, stats.duration_by_model),
+                ):
+                    for key, histogram in source.items():
+                        target.setdefault(key, LatencyHistogram()).merge(other=histogram)
+        return merged
+
+    def copy(self) -> "ParallelLatencyStats":
+        """
+        Create an independent snapshot of these statistics.
+
+        Returns:
+            New ParallelLatencyStats with the same observations
+        """
+        return self.merge(other=ParallelLatencyStats())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to dictionary for serialization.
+
+        Returns:
+            Dictionary with histogram summaries and the peak concurrency
+        """
+        with self._lock:
+            return {
+                ParallelProcessingFields.REQUEST_DURATION: self.request_duration.to_dict(),
+                ParallelProcessingFields.TIME_TO_FIRST_BYTE: self.time_to_first_byte.to_dict(),
+                ParallelProcessingFields.QUEUE_WAIT: self.queue_wait.to_dict(),
+                ParallelProcessingFields.PEAK_CONCURRENCY: self.peak_concurrency,
+                ParallelProcessingFields.DURATION_BY_REGION: {
+                    region: histogram.to_dict()
+                    for region, histogram in self.duration_by_region.items()
+                },
+                ParallelProcessingFields.DURATION_BY_MODEL: {
+                    model: histogram.to_dict()
+                    for model, histogram in self.duration_by_model.items()
+                },
+            }
+
+    @staticmethod
+    def _get_time_to_first_byte(response: BedrockResponse) -> Optional[float]:
+        """
+        Get the time to first byte of a successful response.
+
+        Args:
+            response: Successful BedrockResponse
+
+        Returns:
+            Time to first byte in milliseconds, None if it cannot be determined
+        """
+        for attempt in reversed(response.attempts):
+            if attempt.success:
+                return attempt.duration_ms
+        return None
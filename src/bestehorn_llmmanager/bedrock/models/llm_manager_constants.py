@@ -380,6 +380,90 @@ class ResponseValidationLogMessages:
     )
 
 
+class ValidationExecutorModes:
+    """Execution modes of ValidationExecutor."""
+
+    PROCESS: Final[str] = "process"
+    THREAD: Final[str] = "thread"
+    ALL: Final[tuple] = (PROCESS, THREAD)
+
+    # Start method of process pools; spawn does not fork the threads of the caller
+    DEFAULT_START_METHOD: Final[str] = "spawn"
+    THREAD_NAME_PREFIX: Final[str] = "llm-validation"
+    # Validators whose picklability check is remembered per executor
+    MAX_CHECKED_VALIDATORS: Final[int] = 256
+
+
+class ValidationExecutorMessages:
+    """Error message constants for ValidationExecutor."""
+
+    INVALID_MODE: Final[str] = "mode must be one of {modes}, got: {mode}"
+    INVALID_MAX_WORKERS: Final[str] = "max_workers must be positive, got: {max_workers}"
+    INVALID_START_METHOD: Final[str] = (
+        "start_method must be one of {start_methods}, got: {start_method}"
+    )
+    EXECUTOR_CLOSED: Final[str] = "ValidationExecutor is closed"
+    UNPICKLABLE_VALIDATOR: Final[str] = (
+        "Validation function {function!r} cannot be sent to a validation process: {error}. "
+        "Use a module-level function or a ValidatorSpec."
+    )
+    INVALID_VALIDATOR_TARGET: Final[str] = (
+        "Validator target must have the form 'module:function', got: {target}"
+    )
+
+
+class ConversationSessionConfig:
+    """Limits and defaults of the rolling prompt cache of ConversationSession."""
+
+    # Bedrock accepts at most four cache points per request
+    MAX_CACHE_POINTS_PER_REQUEST: Final[int] = 4
+    # Prefixes below the model minimum (1,024 tokens for most Claude models) are not cached
+    DEFAULT_MIN_CACHE_TOKENS: Final[int] = 1024
+    # Cache entries expire this long after their last write or read
+    DEFAULT_CACHE_TTL_SECONDS: Final[int] = 300
+    CACHE_TTL_SECONDS: Final[dict] = {"5m": 300, "1h": 3600}
+
+
+class ConversationSessionMessages:
+    """Error and log message constants for ConversationSession."""
+
+    INVALID_MAX_CACHE_POINTS: Final[str] = (
+        "max_cache_points must be between 0 and {limit}, got: {max_cache_points}"
+    )
+    INVALID_MIN_CACHE_TOKENS: Final[str] = (
+        "min_cache_tokens must be non-negative, got: {min_cache_tokens}"
+    )
+    EMPTY_CONTENT: Final[str] = "Message content must not be empty"
+    CACHE_POINT_NOT_WRITTEN: Final[str] = (
+        "Cache point after message {index} (~{prefix_tokens} tokens) was not written"
+    )
+
+
+class ToolLoopConfig:
+    """Defaults of run_tool_loop."""
+
+    # Model calls per loop before it stops without an end_turn
+    DEFAULT_MAX_TURNS: Final[int] = 10
+    DEFAULT_TOOL_TIMEOUT_SECONDS: Final[float] = 60.0
+    THREAD_NAME_PREFIX: Final[str] = "llm-tool"
+
+
+class ToolLoopMessages:
+    """Error and log message constants for run_tool_loop."""
+
+    INVALID_MAX_TURNS: Final[str] = "max_turns must be positive, got: {max_turns}"
+    INVALID_TOOL_TIMEOUT: Final[str] = (
+        "Timeout of tool '{name}' must be positive, got: {timeout_seconds}"
+    )
+    UNKNOWN_TOOL: Final[str] = "Unknown tool '{name}'"
+    TOOL_TIMED_OUT: Final[str] = "Tool '{name}' did not finish within {timeout_seconds}s"
+    TOOL_FAILED: Final[str] = "Tool '{name}' failed: {error}"
+    TOOL_TURN: Final[str] = "Model call {turn} requested {count} tool calls: {names}"
+    MAX_TURNS_REACHED: Final[str] = (
+        "Stopping the tool loop after {max_turns} model calls without an end_turn"
+    )
+
+
 class FeatureAvailability:
     """Feature availability constants for different models and regions."""
 
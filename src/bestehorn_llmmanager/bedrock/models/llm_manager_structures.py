@@ -3,20 +3,27 @@ Data structures for LLM Manager system.
 Contains typed data classes for configuration, requests, and responses.
 """
 
+import importlib
 import json
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Callable, Dict, Final, List, Optional, Union
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Dict, Final, List, Optional, Union
 
 import botocore.config
 
+from .compact_response import CompactError
 from .llm_manager_constants import (
     ConverseAPIFields,
     LLMManagerConfig,
     ResponseValidationConfig as ValidationConstants,
+    ValidationExecutorMessages,
 )
 
+if TYPE_CHECKING:
+    from ..executors.validation_executor import ValidationExecutor
+
 
 class AuthenticationType(Enum):
     """Enumeration of authentication types supported by LLM Manager."""
@@ -233,7 +240,7 @@ class Boto3Config:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class RequestAttempt:
     """
     Information about a single request attempt.
@@ -265,6 +272,11 @@ class RequestAttempt:
             return (self.end_time - self.start_time).total_seconds() * 1000
         return None
 
+    def compact(self) -> None:
+        """Replace the recorded error by a CompactError, releasing its traceback."""
+        if self.error is not None:
+            self.error = CompactError.from_exception(error=self.error)
+
 
 @dataclass
 class BedrockResponse:
@@ -742,20 +754,74 @@ class ValidationResult:
 ResponseValidationFunction = Callable[["BedrockResponse"], ValidationResult]
 
 
+@lru_cache(maxsize=None)
+def _resolve_validator_target(target: str) -> Callable[..., ValidationResult]:
+    """Import the function a ValidatorSpec target names."""
+    module_name, _, qualified_name = target.partition(":")
+    resolved: Any = importlib.import_module(module_name)
+    for attribute in qualified_name.split("."):
+        resolved = getattr(resolved, attribute)
+    return resolved  # type: ignore[no-any-return]
+
+
+@dataclass(frozen=True)
+class ValidatorSpec:
+    """
+    Picklable reference to a response validation function.
+
+    Lambdas, closures and bound methods cannot be sent to a validation process. A
+    ValidatorSpec names a module-level function by import path together with keyword
+    options, so it pickles as plain values and the function is imported again in the
+    worker process. Calling the spec calls ``function(response, **options)``.
+
+    Attributes:
+        target: Import path of the function, "package.module:function"
+        options: Keyword arguments passed to the function after the response
+    """
+
+    target: str
+    options: Dict[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        """Validate the target format."""
+        module_name, _, qualified_name = self.target.partition(":")
+        if not module_name or not qualified_name:
+            raise ValueError(
+                ValidationExecutorMessages.INVALID_VALIDATOR_TARGET.format(target=self.target)
+            )
+
+    def resolve(self) -> Callable[..., ValidationResult]:
+        """
+        Import the validation function.
+
+        Returns:
+            The function named by target (imported once per process)
+        """
+        return _resolve_validator_target(target=self.target)
+
+    def __call__(self, response: "BedrockResponse") -> ValidationResult:
+        """Validate a response with the referenced function."""
+        return self.resolve()(response, **self.options)
+
+
 @dataclass(frozen=True)
 class ResponseValidationConfig:
     """
     Configuration for response validation.
 
     Attributes:
-        response_validation_function: Function that validates BedrockResponse and returns ValidationResult
+        response_validation_function: Function that validates BedrockResponse and returns
+            ValidationResult; a ValidatorSpec when validation runs in a process pool
         response_validation_retries: Number of validation retries (default: 3)
         response_validation_delay: Delay between validation retries in seconds (default: 0.0)
+        validation_executor: Runs the validation function in a process or thread pool
+            instead of on the request thread (default: None, validate inline)
     """
 
     response_validation_function: ResponseValidationFunction
     response_validation_retries: int = ValidationConstants.DEFAULT_VALIDATION_RETRIES
     response_validation_delay: float = ValidationConstants.DEFAULT_VALIDATION_DELAY
+    validation_executor: Optional["ValidationExecutor"] = None
 
     def __post_init__(self) -> None:
         """Validate response validation configuration."""
@@ -3,7 +3,7 @@ Constants for parallel processing functionality in LLM Manager system.
 Contains string constants and configuration values for parallel execution.
 """
 
-from typing import Final
+from typing import Dict, Final
 
 
 class ParallelProcessingFields:
@@ -20,6 +20,8 @@ class ParallelProcessingFields:
     TOOL_CONFIG: Final[str] = "tool_config"
     REQUEST_METADATA: Final[str] = "request_metadata"
     PROMPT_VARIABLES: Final[str] = "prompt_variables"
+    PRIORITY: Final[str] = "priority"
+    DEADLINE: Final[str] = "deadline"
 
     # ParallelResponse fields
     SUCCESS: Final[str] = "success"
@@ -38,6 +40,31 @@ class ParallelProcessingFields:
     MIN_REQUEST_DURATION_MS: Final[str] = "min_request_duration_ms"
     CONCURRENT_EXECUTIONS: Final[str] = "concurrent_executions"
     REGION_DISTRIBUTION: Final[str] = "region_distribution"
+    LATENCY: Final[str] = "latency"
+
+    # ParallelLatencyStats fields
+    REQUEST_DURATION: Final[str] = "request_duration"
+    TIME_TO_FIRST_BYTE: Final[str] = "time_to_first_byte"
+    QUEUE_WAIT: Final[str] = "queue_wait"
+    PEAK_CONCURRENCY: Final[str] = "peak_concurrency"
+    DURATION_BY_REGION: Final[str] = "duration_by_region"
+    DURATION_BY_MODEL: Final[str] = "duration_by_model"
+
+
+class LatencyHistogramConfig:
+    """Configuration constants for latency histograms."""
+
+    # Linear sub-buckets per power of two are 2 ** (SUB_BUCKET_BITS - 1); 8 bits keep the
+    # relative error of a percentile below 1%
+    SUB_BUCKET_BITS: Final[int] = 8
+
+    # Percentiles reported by LatencyHistogram.to_dict()
+    REPORTED_PERCENTILES: Final[Dict[str, float]] = {
+        "p50_ms": 0.5,
+        "p90_ms": 0.9,
+        "p99_ms": 0.99,
+        "p999_ms": 0.999,
+    }
 
 
 class ParallelConfig:
@@ -49,6 +76,8 @@ class ParallelConfig:
     # DEPRECATED: Use auto-calculation based on available regions and max_concurrent_requests
     DEFAULT_TARGET_REGIONS_PER_REQUEST: Final[int] = 5
     DEFAULT_ENABLE_REQUEST_PRIORITIZATION: Final[bool] = True
+    DEFAULT_REQUEST_PRIORITY: Final[int] = 0
+    DEFAULT_ENABLE_CACHE_AWARE_SCHEDULING: Final[bool] = False
 
     # Request ID generation
     REQUEST_ID_PREFIX: Final[str] = "req"
@@ -97,6 +126,29 @@ class ParallelLogMessages:
     )
     PARALLEL_REQUEST_FAILED: Final[str] = "Parallel request '{request_id}' failed: {error}"
 
+    # Request coalescing messages
+    REQUEST_COALESCED: Final[str] = "Joined in-flight execution of identical request {request_key}"
+    DUPLICATE_REQUESTS_COALESCED: Final[str] = (
+        "Coalesced {duplicate_count} identical duplicates of request '{request_id}'"
+    )
+
+    # Scheduling messages
+    REQUEST_DEADLINE_EXPIRED: Final[str] = (
+        "Dropping request '{request_id}': deadline expired {overdue_seconds:.2f}s before dispatch"
+    )
+    RETRY_SKIPPED_FOR_DEADLINE: Final[str] = (
+        "Not retrying request '{request_id}': retry after {backoff_seconds:.2f}s backoff "
+        "would miss its deadline ({remaining_seconds:.2f}s remaining)"
+    )
+    CACHE_PREFIX_GROUPS: Final[str] = (
+        "Holding {held_count} requests until the primer requests of their "
+        "{group_count} shared cache prefixes complete"
+    )
+    CACHE_PREFIX_GROUP_RELEASED: Final[str] = (
+        "Primer request '{request_id}' completed; releasing {member_count} requests "
+        "of its cache-prefix group (preferred region: {region})"
+    )
+
     # Performance messages
     REGION_DISTRIBUTION_STATS: Final[str] = (
         "Region distribution - Total: {total_assignments}, Unique regions: {unique_regions}, Max per region: {max_per_region}"
@@ -144,6 +196,9 @@ class ParallelErrorMessages:
     REQUEST_TIMEOUT_EXCEEDED: Final[str] = (
         "Request '{request_id}' exceeded timeout of {timeout_seconds} seconds"
     )
+    REQUEST_DEADLINE_EXCEEDED: Final[str] = (
+        "Request '{request_id}' timed out: deadline expired before it could be dispatched"
+    )
     ALL_REGIONS_FAILED: Final[str] = "All assigned regions failed for request '{request_id}'"
 
     # Resource errors
@@ -6,24 +6,30 @@ Contains typed data classes for parallel execution configuration, requests, and
 import asyncio
 import hashlib
 import json
+import math
+import operator
 import time
+from array import array
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
 from .bedrock_response import BedrockResponse
 from .cache_structures import CacheMetrics
+from .compact_response import CompactError
+from .latency_structures import ParallelLatencyStats
 from .parallel_constants import ParallelConfig, ParallelProcessingFields
 
 
-@dataclass
+@dataclass(slots=True)
 class FailureEntry:
     """
     Encapsulates failure information for a request attempt.
 
     Stores complete failure context including the actual exception instance,
-    timing information, and the model/region combination that failed.
+    timing information, and the model/region combination that failed. Compact
+    entries hold a CompactError with the type name and message instead.
 
     Attributes:
         attempt_number: Which retry attempt this was (1-based indexing)
@@ -43,6 +49,10 @@ class FailureEntry:
     model: Optional[str] = None
     region: Optional[str] = None
 
+    def compact(self) -> None:
+        """Replace the exception by a CompactError, releasing its traceback."""
+        self.exception = CompactError.from_exception(error=self.exception)
+
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert to dictionary for serialization (excludes exception instance).
@@ -113,6 +123,11 @@ class BedrockConverseRequest:
         retry_count: Number of times this request has been retried
         failure_history: List of failure entries tracking all retry attempts
         max_retries: Per-request override for max retries (if None, uses config default)
+        priority: Scheduling priority (higher is dispatched first when prioritization is enabled)
+        deadline: Absolute time.time() timestamp after which the result is no longer useful;
+            requests still queued at their deadline are dropped instead of dispatched.
+            Only expired deadlines are dropped: a request dispatched with time left runs
+            with its timeout shortened to that time, however little it is
     """
 
     messages: List[Dict[str, Any]]
@@ -129,6 +144,8 @@ class BedrockConverseRequest:
     retry_count: int = field(default=0)
     failure_history: List[FailureEntry] = field(default_factory=list)
     max_retries: Optional[int] = None
+    priority: int = ParallelConfig.DEFAULT_REQUEST_PRIORITY
+    deadline: Optional[float] = None
 
     def __post_init__(self) -> None:
         """Generate request ID if not provided."""
@@ -241,6 +258,8 @@ class BedrockConverseRequest:
             ParallelProcessingFields.TOOL_CONFIG: self.tool_config,
             ParallelProcessingFields.REQUEST_METADATA: self.request_metadata,
             ParallelProcessingFields.PROMPT_VARIABLES: self.prompt_variables,
+            ParallelProcessingFields.PRIORITY: self.priority,
+            ParallelProcessingFields.DEADLINE: self.deadline,
         }
 
     @classmethod
@@ -269,10 +288,18 @@ class BedrockConverseRequest:
             request_metadata=data.get(ParallelProcessingFields.REQUEST_METADATA),
             prompt_variables=data.get(ParallelProcessingFields.PROMPT_VARIABLES),
             request_id=data.get(ParallelProcessingFields.REQUEST_ID),
+            priority=data.get(
+                ParallelProcessingFields.PRIORITY, ParallelConfig.DEFAULT_REQUEST_PRIORITY
+            ),
+            deadline=data.get(ParallelProcessingFields.DEADLINE),
         )
 
     def record_failure(
-        self, exception: Exception, model: Optional[str] = None, region: Optional[str] = None
+        self,
+        exception: Exception,
+        model: Optional[str] = None,
+        region: Optional[str] = None,
+        compact: bool = False,
     ) -> None:
         """
         Record a failure attempt with full context.
@@ -281,6 +308,7 @@ class BedrockConverseRequest:
             exception: The exception that was raised
             model: Model name being used when failure occurred
             region: AWS region where failure occurred
+            compact: Whether to keep a CompactError instead of the exception
         """
         self.retry_count += 1
         failure_entry = FailureEntry(
@@ -292,6 +320,8 @@ class BedrockConverseRequest:
             model=model,
             region=region,
         )
+        if compact:
+            failure_entry.compact()
         self.failure_history.append(failure_entry)
 
     def can_retry(self, max_retries: int) -> bool:
@@ -307,6 +337,20 @@ class BedrockConverseRequest:
         effective_max_retries = self.max_retries if self.max_retries is not None else max_retries
         return self.retry_count < effective_max_retries
 
+    def get_remaining_time(self, now: Optional[float] = None) -> Optional[float]:
+        """
+        Get the time left until the request's deadline.
+
+        Args:
+            now: Current time.time() value (defaults to the current time)
+
+        Returns:
+            Seconds until the deadline (negative once it has passed), None without a deadline
+        """
+        if self.deadline is None:
+            return None
+        return self.deadline - (time.time() if now is None else now)
+
     def get_last_failure(self) -> Optional[FailureEntry]:
         """
         Get the most recent failure entry.
@@ -340,6 +384,10 @@ class ParallelProcessingConfig:
         failure_threshold: Threshold for STOP_ON_THRESHOLD strategy (0.0-1.0)
         enable_automatic_retry: Whether to automatically retry failed requests
         max_retries_per_request: Max retries per request (None uses retry_config.max_retries)
+        compact_responses: Whether to compact each response as it completes, dropping its
+            raw response data and live exceptions (see BedrockResponse.compact)
+        enable_cache_aware_scheduling: Whether requests sharing a cacheable prompt prefix
+            wait for one primer request of their group and then run in its region
     """
 
     max_concurrent_requests: int = ParallelConfig.DEFAULT_MAX_CONCURRENT_REQUESTS
@@ -350,6 +398,8 @@ class ParallelProcessingConfig:
     failure_threshold: float = 0.5
     enable_automatic_retry: bool = True
     max_retries_per_request: Optional[int] = None
+    compact_responses: bool = False
+    enable_cache_aware_scheduling: bool = ParallelConfig.DEFAULT_ENABLE_CACHE_AWARE_SCHEDULING
 
     def __post_init__(self) -> None:
         """Validate parallel processing configuration."""
@@ -381,6 +431,7 @@ class ParallelExecutionStats:
         min_request_duration_ms: Minimum request duration
         concurrent_executions: Peak number of concurrent executions
         region_distribution: Distribution of requests across regions
+        latency: Latency histograms and measured peak concurrency, if recorded
     """
 
     total_requests: int
@@ -391,6 +442,7 @@ class ParallelExecutionStats:
     min_request_duration_ms: float
     concurrent_executions: int
     region_distribution: Dict[str, int] = field(default_factory=dict)
+    latency: Optional[ParallelLatencyStats] = None
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -408,6 +460,7 @@ class ParallelExecutionStats:
             ParallelProcessingFields.MIN_REQUEST_DURATION_MS: self.min_request_duration_ms,
             ParallelProcessingFields.CONCURRENT_EXECUTIONS: self.concurrent_executions,
             ParallelProcessingFields.REGION_DISTRIBUTION: self.region_distribution,
+            ParallelProcessingFields.LATENCY: self.latency.to_dict() if self.latency else None,
         }
 
     @property
@@ -423,6 +476,341 @@ class ParallelExecutionStats:
         return 100.0 - self.success_rate
 
 
+@dataclass
+class ParallelStatsAccumulator:
+    """
+    Incrementally aggregated statistics for streamed parallel execution.
+
+    Builds the same figures as :class:`ParallelExecutionStats` one response at a time,
+    so a stream of results can report aggregate statistics at any point without keeping
+    the individual responses.
+
+    Attributes:
+        total_requests: Number of final responses recorded
+        successful_requests: Number of successful responses recorded
+        failed_requests_count: Number of failed responses recorded
+        duration_sum_ms: Sum of successful request durations
+        duration_count: Number of successful responses that reported a duration
+        max_request_duration_ms: Maximum successful request duration
+        min_request_duration_ms: Minimum successful request duration
+        peak_concurrent_executions: Highest number of requests recorded in flight with
+            record_concurrency; to_stats reports the higher of it and the number the
+            executor measured executing at once (latency.peak_concurrency)
+        region_distribution: Distribution of request assignments across regions
+        latency: Latency histograms of the responses recorded so far
+    """
+
+    total_requests: int = 0
+    successful_requests: int = 0
+    failed_requests_count: int = 0
+    duration_sum_ms: float = 0.0
+    duration_count: int = 0
+    max_request_duration_ms: float = 0.0
+    min_request_duration_ms: float = 0.0
+    peak_concurrent_executions: int = 0
+    region_distribution: Dict[str, int] = field(default_factory=dict)
+    latency: ParallelLatencyStats = field(default_factory=ParallelLatencyStats)
+
+    def record_response(self, response: BedrockResponse, assigned_regions: List[str]) -> None:
+        """
+        Record the final response of one request.
+
+        Args:
+            response: Final BedrockResponse of the request
+            assigned_regions: Regions the request was assigned to
+        """
+        self.total_requests += 1
+        if response.success:
+            self.successful_requests += 1
+            duration = response.total_duration_ms
+            if duration is not None:
+                if self.duration_count == 0:
+                    self.max_request_duration_ms = self.min_request_duration_ms = duration
+                else:
+                    self.max_request_duration_ms = max(self.max_request_duration_ms, duration)
+                    self.min_request_duration_ms = min(self.min_request_duration_ms, duration)
+                self.duration_sum_ms += duration
+                self.duration_count += 1
+        else:
+            self.failed_requests_count += 1
+        self.latency.record_response(response=response)
+
+        for region in assigned_regions:
+            self.region_distribution[region] = self.region_distribution.get(region, 0) + 1
+
+    def record_concurrency(self, in_flight: int) -> None:
+        """
+        Record the number of requests currently in flight.
+
+        Args:
+            in_flight: Number of requests executing at this moment
+        """
+        if in_flight > self.peak_concurrent_executions:
+            self.peak_concurrent_executions = in_flight
+        self.latency.record_concurrency(in_flight=in_flight)
+
+    def to_stats(self) -> ParallelExecutionStats:
+        """
+        Build a ParallelExecutionStats snapshot of the figures recorded so far.
+
+        Returns:
+            ParallelExecutionStats for all responses recorded so far
+        """
+        average = self.duration_sum_ms / self.duration_count if self.duration_count else 0.0
+        return ParallelExecutionStats(
+            total_requests=self.total_requests,
+            successful_requests=self.successful_requests,
+            failed_requests_count=self.failed_requests_count,
+            average_request_duration_ms=average,
+            max_request_duration_ms=self.max_request_duration_ms,
+            min_request_duration_ms=self.min_request_duration_ms,
+            concurrent_executions=max(
+                self.peak_concurrent_executions, self.latency.peak_concurrency
+            ),
+            region_distribution=self.region_distribution.copy(),
+            latency=self.latency.copy(),
+        )
+
+
+class ParallelResponseStream:
+    """
+    Iterator over parallel results delivered as each request completes.
+
+    Returned by :meth:`ParallelLLMManager.converse_parallel_iter`. Iterating yields
+    ``(request_id, BedrockResponse)`` tuples in completion order; responses are not
+    retained, so memory stays bounded by the in-flight window regardless of batch size.
+    Aggregate statistics are available at any time through :meth:`get_execution_stats`.
+    """
+
+    def __init__(
+        self,
+        results: Iterator[Tuple[str, BedrockResponse]],
+        stats: ParallelStatsAccumulator,
+    ) -> None:
+        """
+        Initialize the response stream.
+
+        Args:
+            results: Generator producing (request_id, BedrockResponse) tuples
+            stats: Accumulator updated by the generator as results complete
+        """
+        self._results = results
+        self._stats = stats
+
+    def __iter__(self) -> "ParallelResponseStream":
+        """
+        Return self as iterator.
+
+        Returns:
+            Self for iterator protocol
+        """
+        return self
+
+    def __next__(self) -> Tuple[str, BedrockResponse]:
+        """
+        Get the next completed request.
+
+        Returns:
+            Tuple of (request_id, BedrockResponse)
+
+        Raises:
+            StopIteration: When all requests have completed
+        """
+        return next(self._results)
+
+    def close(self) -> None:
+        """Stop pulling new requests and release the worker threads."""
+        close = getattr(self._results, "close", None)
+        if close is not None:
+            close()
+
+    def get_execution_stats(self) -> ParallelExecutionStats:
+        """
+        Get aggregate statistics for the requests completed so far.
+
+        Returns:
+            ParallelExecutionStats snapshot
+        """
+        return self._stats.to_stats()
+
+    def __repr__(self) -> str:
+        """Return string representation of the ParallelResponseStream."""
+        return (
+            f"ParallelResponseStream(completed={self._stats.total_requests}, "
+            f"successful={self._stats.successful_requests})"
+        )
+
+
+class CategoricalColumn:
+    """
+    Dictionary-encoded column of optional strings.
+
+    Each distinct value is stored once in ``categories``; ``codes`` holds one compact
+    integer per row indexing into it.
+    """
+
+    __slots__ = ("categories", "codes", "_index")
+
+    def __init__(self) -> None:
+        """Initialize an empty column."""
+        self.categories: List[Optional[str]] = []
+        self.codes: "array[int]" = array("I")
+        self._index: Dict[Optional[str], int] = {}
+
+    def append(self, value: Optional[str]) -> None:
+        """
+        Append a value to the column.
+
+        Args:
+            value: Value of the next row
+        """
+        code = self._index.get(value)
+        if code is None:
+            code = self._index[value] = len(self.categories)
+            self.categories.append(value)
+        self.codes.append(code)
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return len(self.codes)
+
+    def __getitem__(self, row: int) -> Optional[str]:
+        """Return the value of one row."""
+        return self.categories[self.codes[row]]
+
+    def value_counts(self) -> Dict[Optional[str], int]:
+        """
+        Count the rows of each distinct value.
+
+        Returns:
+            Dictionary mapping each value to its number of rows, in first-seen order
+        """
+        counts = [0] * len(self.categories)
+        for code in self.codes:
+            counts[code] += 1
+        return dict(zip(self.categories, counts, strict=True))
+
+
+@dataclass(frozen=True)
+class ParallelResponseColumns:
+    """
+    Columnar summary of the responses of a parallel run, built in a single pass.
+
+    Row ``i`` describes ``request_ids[i]``. Numeric columns are ``array`` columns; token
+    columns are zero and ``latency_ms`` is NaN wherever a response is unsuccessful or does
+    not report the value. The analytics of :class:`ParallelResponse` are reductions over
+    these columns.
+
+    Attributes:
+        request_ids: Request IDs in the order of request_responses
+        success: 1 for successful responses, 0 otherwise
+        latency_ms: API latency reported by Bedrock
+        input_tokens: Input tokens of successful responses
+        output_tokens: Output tokens of successful responses
+        total_tokens: Total tokens of successful responses
+        cache_read_tokens: Prompt-cache read tokens of successful responses
+        cache_write_tokens: Prompt-cache write tokens of successful responses
+        regions: Region each response was served from
+        models: Model each response was served by
+        access_methods: Access method of each response
+        profile_used: 1 for responses served through an inference profile
+        profile_ids: Inference profile ID of responses that used a profile, else None
+        has_parameters: 1 for requests with original, final or removed additional fields
+        removed_parameters: Removed parameters by request ID, for requests that had any
+    """
+
+    request_ids: List[str]
+    success: "array[int]"
+    latency_ms: "array[float]"
+    input_tokens: "array[int]"
+    output_tokens: "array[int]"
+    total_tokens: "array[int]"
+    cache_read_tokens: "array[int]"
+    cache_write_tokens: "array[int]"
+    regions: CategoricalColumn
+    models: CategoricalColumn
+    access_methods: CategoricalColumn
+    profile_used: "array[int]"
+    profile_ids: CategoricalColumn
+    has_parameters: "array[int]"
+    removed_parameters: Dict[str, List[str]]
+
+    @classmethod
+    def from_responses(
+        cls, request_responses: Dict[str, BedrockResponse]
+    ) -> "ParallelResponseColumns":
+        """
+        Build the columns with one pass over the responses.
+
+        Args:
+            request_responses: Mapping of request_id to BedrockResponse
+
+        Returns:
+            ParallelResponseColumns with one row per response
+        """
+        columns = cls(
+            request_ids=list(request_responses),
+            success=array("b"),
+            latency_ms=array("d"),
+            input_tokens=array("q"),
+            output_tokens=array("q"),
+            total_tokens=array("q"),
+            cache_read_tokens=array("q"),
+            cache_write_tokens=array("q"),
+            regions=CategoricalColumn(),
+            models=CategoricalColumn(),
+            access_methods=CategoricalColumn(),
+            profile_used=array("b"),
+            profile_ids=CategoricalColumn(),
+            has_parameters=array("b"),
+            removed_parameters={},
+        )
+        token_columns = (
+            ("input_tokens", columns.input_tokens),
+            ("output_tokens", columns.output_tokens),
+            ("total_tokens", columns.total_tokens),
+            ("cache_read_tokens", columns.cache_read_tokens),
+            ("cache_write_tokens", columns.cache_write_tokens),
+        )
+
+        for req_id, response in request_responses.items():
+            columns.success.append(1 if response.success else 0)
+
+            usage = response.get_usage() if response.success else None
+            for key, column in token_columns:
+                column.append(int(usage.get(key, 0)) if usage else 0)
+
+            metrics = response.get_metrics() if response.success else None
+            latency = metrics.get("api_latency_ms") if metrics else None
+            columns.latency_ms.append(math.nan if latency is None else float(latency))
+
+            columns.regions.append(response.region_used)
+            columns.models.append(response.model_used)
+            columns.access_methods.append(response.access_method_used)
+            columns.profile_used.append(1 if response.inference_profile_used else 0)
+            columns.profile_ids.append(
+                response.inference_profile_id if response.inference_profile_used else None
+            )
+
+            if response.parameters_removed:
+                columns.removed_parameters[req_id] = response.parameters_removed
+            columns.has_parameters.append(
+                1
+                if (
+                    response.original_additional_fields
+                    or response.final_additional_fields
+                    or response.parameters_removed
+                )
+                else 0
+            )
+
+        return columns
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return len(self.request_ids)
+
+
 @dataclass
 class ParallelResponse:
     """
@@ -439,6 +827,12 @@ class ParallelResponse:
         failed_request_ids: List of request IDs that failed (excluding timeouts)
         timed_out_request_ids: List of request IDs that timed out
         original_requests: Dictionary mapping request_id to original BedrockConverseRequest
+
+    The aggregate analytics are computed from a :class:`ParallelResponseColumns` summary
+    that is built once and rebuilt when request_responses holds other request IDs or
+    other response objects, e.g. after ``request_responses[request_id] = retried``.
+    Changing the attributes of a response object in place is not detected; call
+    :meth:`invalidate_columns` afterwards.
     """
 
     success: bool
@@ -451,6 +845,44 @@ class ParallelResponse:
     failed_request_ids: List[str] = field(default_factory=list)
     timed_out_request_ids: List[str] = field(default_factory=list)
     original_requests: Dict[str, BedrockConverseRequest] = field(default_factory=dict)
+    _columns: Optional[ParallelResponseColumns] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _columns_ids: Tuple[str, ...] = field(default=(), init=False, repr=False, compare=False)
+    _columns_responses: Tuple[BedrockResponse, ...] = field(
+        default=(), init=False, repr=False, compare=False
+    )
+
+    def get_columns(self) -> ParallelResponseColumns:
+        """
+        Get the columnar summary of all responses.
+
+        The summary is built on first use and reused while request_responses holds the
+        same request IDs mapped to the same response objects; checking this compares
+        identities only and parses no usage data. Call :meth:`invalidate_columns` after
+        changing a response's attributes in place.
+
+        Returns:
+            ParallelResponseColumns for request_responses
+        """
+        request_ids = tuple(self.request_responses)
+        responses = tuple(self.request_responses.values())
+        if (
+            self._columns is None
+            or request_ids != self._columns_ids
+            or not all(map(operator.is_, responses, self._columns_responses))
+        ):
+            self._columns = ParallelResponseColumns.from_responses(
+                request_responses=self.request_responses
+            )
+            # The responses are kept so their identities cannot be reused by new objects
+            self._columns_ids = request_ids
+            self._columns_responses = responses
+        return self._columns
+
+    def invalidate_columns(self) -> None:
+        """Discard the columnar summary so the next analytics call rebuilds it."""
+        self._columns = None
 
     def get_successful_responses(self) -> Dict[str, BedrockResponse]:
         """
@@ -500,8 +932,8 @@ class ParallelResponse:
         if not self.request_responses:
             return 0.0
 
-        successful_count = len(self.get_successful_responses())
-        return (successful_count / len(self.request_responses)) * 100.0
+        columns = self.get_columns()
+        return (sum(columns.success) / len(columns)) * 100.0
 
     def get_total_tokens_used(self) -> Dict[str, int]:
         """
@@ -510,22 +942,15 @@ class ParallelResponse:
         Returns:
             Dictionary with total token usage statistics
         """
-        total_usage = {
-            "input_tokens": 0,
-            "output_tokens": 0,
-            "total_tokens": 0,
-            "cache_read_tokens": 0,
-            "cache_write_tokens": 0,
+        columns = self.get_columns()
+        return {
+            "input_tokens": sum(columns.input_tokens),
+            "output_tokens": sum(columns.output_tokens),
+            "total_tokens": sum(columns.total_tokens),
+            "cache_read_tokens": sum(columns.cache_read_tokens),
+            "cache_write_tokens": sum(columns.cache_write_tokens),
         }
 
-        for response in self.get_successful_responses().values():
-            usage = response.get_usage()
-            if usage:
-                for key in total_usage:
-                    total_usage[key] += usage.get(key, 0)
-
-        return total_usage
-
     def get_cache_metrics(self) -> CacheMetrics:
         """
         Derive aggregate prompt-caching metrics across the batch (issue #29, CR-3).
@@ -548,16 +973,12 @@ class ParallelResponse:
             A :class:`CacheMetrics` with the read-derived hit ratio, hit/miss counts, and
             cache-served token savings for this batch.
         """
-        successful = self.get_successful_responses()
-        total = len(successful)
+        columns = self.get_columns()
+        total = sum(columns.success)
 
-        cache_read_total = 0
-        hits = 0
-        for response in successful.values():
-            read_tokens = response.get_cache_read_tokens()
-            cache_read_total += read_tokens
-            if read_tokens > 0:
-                hits += 1
+        # Unsuccessful rows hold zero cache reads, so they never count as hits
+        cache_read_total = sum(columns.cache_read_tokens)
+        hits = len(columns.cache_read_tokens) - columns.cache_read_tokens.count(0)
 
         misses = total - hits
         hit_ratio = (hits / total) if total else 0.0
@@ -576,16 +997,9 @@ class ParallelResponse:
         Returns:
             Average latency in milliseconds, None if no successful requests
         """
-        successful_responses = self.get_successful_responses()
-        if not successful_responses:
-            return None
-
-        latencies = []
-        for response in successful_responses.values():
-            metrics = response.get_metrics()
-            if metrics and "api_latency_ms" in metrics:
-                latencies.append(metrics["api_latency_ms"])
-
+        latencies = [
+            latency for latency in self.get_columns().latency_ms if not math.isnan(latency)
+        ]
         return sum(latencies) / len(latencies) if latencies else None
 
     def get_failed_by_exception_type(self, exception_type: str) -> Dict[str, BedrockResponse]:
@@ -638,13 +1052,7 @@ class ParallelResponse:
         Returns:
             Dictionary mapping request_id to list of removed parameter names
         """
-        result: Dict[str, List[str]] = {}
-
-        for req_id, response in self.request_responses.items():
-            if response.parameters_removed:
-                result[req_id] = response.parameters_removed
-
-        return result
+        return dict(self.get_columns().removed_parameters)
 
     def get_parameter_compatibility_summary(self) -> Dict[str, Any]:
         """
@@ -669,14 +1077,7 @@ class ParallelResponse:
         sorted_params = sorted(parameter_counts.items(), key=lambda x: x[1], reverse=True)
 
         # Count requests with any parameters (original or removed)
-        requests_with_params = 0
-        for response in self.request_responses.values():
-            if (
-                response.original_additional_fields
-                or response.final_additional_fields
-                or response.parameters_removed
-            ):
-                requests_with_params += 1
+        requests_with_params = sum(self.get_columns().has_parameters)
 
         return {
             "total_requests_with_parameters": requests_with_params,
@@ -699,20 +1100,24 @@ class ParallelResponse:
             - profile_usage_percentage: Percentage of requests using profiles
             - access_method_breakdown: Detailed breakdown by access method
         """
-        total_requests = len(self.request_responses)
+        columns = self.get_columns()
+        total_requests = len(columns)
 
         # Count by access method
-        access_method_counts: Dict[str, int] = {}
-        profile_count = 0
-
-        for response in self.request_responses.values():
-            access_method = response.access_method_used
-            if access_method:
-                access_method_counts[access_method] = access_method_counts.get(access_method, 0) + 1
-
-                # Count profile usage
-                if response.inference_profile_used:
-                    profile_count += 1
+        access_method_counts: Dict[str, int] = {
+            access_method: count
+            for access_method, count in columns.access_methods.value_counts().items()
+            if access_method
+        }
+        # Count profile usage of requests with a known access method
+        known_access_method = [bool(value) for value in columns.access_methods.categories]
+        profile_count = sum(
+            profile_used
+            for code, profile_used in zip(
+                columns.access_methods.codes, columns.profile_used, strict=True
+            )
+            if known_access_method[code]
+        )
 
         # Calculate percentages
         profile_percentage = (profile_count / total_requests * 100) if total_requests > 0 else 0.0
@@ -753,19 +1158,19 @@ class ParallelResponse:
             - profile_ids_used: Set of unique profile IDs used
             - profile_usage_by_request: Mapping of request_id to profile_id
         """
-        requests_using_profiles = []
-        profile_ids_used = set()
+        columns = self.get_columns()
         profile_usage_by_request = {}
 
-        for req_id, response in self.request_responses.items():
-            if response.inference_profile_used and response.inference_profile_id:
-                requests_using_profiles.append(req_id)
-                profile_ids_used.add(response.inference_profile_id)
-                profile_usage_by_request[req_id] = response.inference_profile_id
+        for req_id, code in zip(columns.request_ids, columns.profile_ids.codes, strict=True):
+            profile_id = columns.profile_ids.categories[code]
+            if profile_id:
+                profile_usage_by_request[req_id] = profile_id
 
         return {
-            "requests_using_profiles": requests_using_profiles,
-            "profile_ids_used": list(profile_ids_used),
+            "requests_using_profiles": list(profile_usage_by_request),
+            "profile_ids_used": [
+                profile_id for profile_id in columns.profile_ids.categories if profile_id
+            ],
             "profile_usage_by_request": profile_usage_by_request,
         }
 
@@ -809,17 +1214,21 @@ class RegionAssignment:
         request_id: ID of the request being assigned
         assigned_regions: List of regions assigned to process this request
         priority: Priority level for the request (higher = more priority)
+        preferred_region: Region the request is sent to first, e.g. where its cache
+            prefix was written (None: the manager's region order)
     """
 
     request_id: str
     assigned_regions: List[str]
     priority: int = 0
+    preferred_region: Optional[str] = None
 
     def __repr__(self) -> str:
         """Return string representation of the RegionAssignment."""
         return (
             f"RegionAssignment(id={self.request_id}, "
-            f"regions={self.assigned_regions}, priority={self.priority})"
+            f"regions={self.assigned_regions}, priority={self.priority}, "
+            f"preferred_region={self.preferred_region})"
         )
 
 
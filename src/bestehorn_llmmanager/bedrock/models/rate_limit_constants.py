@@ -0,0 +1,34 @@
+"""
+Constants for client-side rate limiting in LLM Manager system.
+Defines defaults and log messages for RPM/TPM quota enforcement.
+"""
+
+from typing import Final
+
+
+class RateLimitDefaults:
+    """Default values for rate limiting."""
+
+    # Longest a call waits for quota before the target is skipped as rate limited
+    MAX_WAIT_SECONDS: Final[float] = 60.0
+
+    # Output tokens reserved when the request sets no inferenceConfig.maxTokens
+    DEFAULT_OUTPUT_TOKEN_RESERVATION: Final[int] = 1024
+
+    # Quotas are per minute; buckets hold at most one minute of quota
+    WINDOW_SECONDS: Final[float] = 60.0
+
+    # Pattern matching every model ID or region
+    WILDCARD: Final[str] = "*"
+
+
+class RateLimitLogMessages:
+    """Log message templates for rate limiting."""
+
+    WAITING_FOR_QUOTA: Final[str] = (
+        "Rate limit reached for {model_id} in {region}; waiting {wait_seconds:.2f}s for quota"
+    )
+    QUOTA_WAIT_EXCEEDED: Final[str] = (
+        "Rate limit for {model_id} in {region} would require waiting {wait_seconds:.2f}s "
+        "(max {max_wait_seconds:.2f}s)"
+    )
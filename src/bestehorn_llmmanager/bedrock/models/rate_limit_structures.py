@@ -0,0 +1,156 @@
+"""
+Data structures for client-side rate limiting in LLM Manager system.
+
+Bedrock enforces requests-per-minute (RPM) and tokens-per-minute (TPM) quotas per
+model and region. These structures describe the quotas to respect, the permits handed
+out for admitted calls, and the statistics collected per bucket.
+"""
+
+import fnmatch
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from .rate_limit_constants import RateLimitDefaults
+
+
+@dataclass(frozen=True)
+class RateLimitRule:
+    """
+    RPM/TPM quota for the model IDs and regions matching the rule's patterns.
+
+    Patterns use shell-style wildcards (fnmatch). The model ID pattern is matched
+    against the ID actually sent to Bedrock, which identifies the access method: a
+    direct model ID (``anthropic.claude-3-haiku-*``), a regional CRIS profile
+    (``us.anthropic.*``) or a global CRIS profile (``global.*``).
+
+    Attributes:
+        model_id: Pattern for model or inference profile IDs
+        region: Pattern for AWS regions
+        requests_per_minute: Requests per minute (None = unlimited)
+        tokens_per_minute: Input plus output tokens per minute (None = unlimited)
+    """
+
+    model_id: str = RateLimitDefaults.WILDCARD
+    region: str = RateLimitDefaults.WILDCARD
+    requests_per_minute: Optional[float] = None
+    tokens_per_minute: Optional[float] = None
+
+    def __post_init__(self) -> None:
+        """Validate rule limits."""
+        if self.requests_per_minute is not None and self.requests_per_minute <= 0:
+            raise ValueError(
+                f"requests_per_minute must be positive, got: {self.requests_per_minute}"
+            )
+        if self.tokens_per_minute is not None and self.tokens_per_minute <= 0:
+            raise ValueError(f"tokens_per_minute must be positive, got: {self.tokens_per_minute}")
+
+    def matches(self, model_id: str, region: str) -> bool:
+        """
+        Check whether the rule applies to a model ID and region.
+
+        Args:
+            model_id: Model or inference profile ID sent to Bedrock
+            region: AWS region of the call
+
+        Returns:
+            True if both patterns match
+        """
+        return fnmatch.fnmatchcase(model_id, self.model_id) and fnmatch.fnmatchcase(
+            region, self.region
+        )
+
+
+@dataclass(frozen=True)
+class RateLimitConfig:
+    """
+    Configuration for client-side RPM/TPM rate limiting.
+
+    Each (model ID, region) pair gets its own buckets, sized by the first rule in
+    ``rules`` that matches it. Pairs no rule matches are not limited.
+
+    Attributes:
+        rules: Quota rules, most specific first
+        max_wait_seconds: Longest a call waits for quota; calls that would wait longer
+            fail with RateLimitExceededError so the retry logic moves to the next target
+        default_output_tokens: Output tokens reserved for requests without
+            inferenceConfig.maxTokens
+    """
+
+    rules: List[RateLimitRule] = field(default_factory=list)
+    max_wait_seconds: float = RateLimitDefaults.MAX_WAIT_SECONDS
+    default_output_tokens: int = RateLimitDefaults.DEFAULT_OUTPUT_TOKEN_RESERVATION
+
+    def __post_init__(self) -> None:
+        """Validate rate limit configuration."""
+        if self.max_wait_seconds < 0:
+            raise ValueError(f"max_wait_seconds must be non-negative, got: {self.max_wait_seconds}")
+        if self.default_output_tokens < 0:
+            raise ValueError(
+                f"default_output_tokens must be non-negative, got: {self.default_output_tokens}"
+            )
+
+    def find_rule(self, model_id: str, region: str) -> Optional[RateLimitRule]:
+        """
+        Find the rule governing a model ID and region.
+
+        Args:
+            model_id: Model or inference profile ID sent to Bedrock
+            region: AWS region of the call
+
+        Returns:
+            First matching rule, or None if the pair is not limited
+        """
+        return next((rule for rule in self.rules if rule.matches(model_id, region)), None)
+
+
+@dataclass
+class RateLimitPermit:
+    """
+    Admission of one call by the rate limiter.
+
+    Attributes:
+        model_id: Model or inference profile ID the permit was issued for
+        region: AWS region the permit was issued for
+        reserved_tokens: Tokens reserved against the TPM bucket
+        wait_seconds: Time the call waited for quota
+        limited: Whether a rule applied (False permits are no-ops)
+    """
+
+    model_id: str
+    region: str
+    reserved_tokens: int = 0
+    wait_seconds: float = 0.0
+    limited: bool = False
+
+
+@dataclass
+class RateLimitStats:
+    """
+    Statistics of one (model ID, region) bucket pair.
+
+    Attributes:
+        model_id: Model or inference profile ID
+        region: AWS region
+        requests_admitted: Calls admitted
+        tokens_consumed: Reserved tokens, corrected by reconciliation with actual usage
+        total_wait_seconds: Total time calls waited for quota
+        rejected_requests: Calls rejected because the wait would exceed max_wait_seconds
+    """
+
+    model_id: str
+    region: str
+    requests_admitted: int = 0
+    tokens_consumed: int = 0
+    total_wait_seconds: float = 0.0
+    rejected_requests: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert statistics to dictionary format."""
+        return {
+            "model_id": self.model_id,
+            "region": self.region,
+            "requests_admitted": self.requests_admitted,
+            "tokens_consumed": self.tokens_consumed,
+            "total_wait_seconds": self.total_wait_seconds,
+            "rejected_requests": self.rejected_requests,
+        }
@@ -0,0 +1,43 @@
+"""
+Constants for offloading large media payloads to Amazon S3 in LLM Manager system.
+Defines defaults, S3 API field names and log messages.
+"""
+
+from typing import Final, FrozenSet
+
+
+class S3OffloadDefaults:
+    """Default values for S3 media offload."""
+
+    # Inline payloads larger than this are uploaded to S3
+    THRESHOLD_BYTES: Final[int] = 1024 * 1024
+
+    # Media block types whose bytes may be offloaded
+    MEDIA_TYPES: Final[FrozenSet[str]] = frozenset({"image", "document", "video"})
+
+
+class S3OffloadFields:
+    """S3 API field names used by the offloader."""
+
+    BUCKET: Final[str] = "Bucket"
+    KEY: Final[str] = "Key"
+    BODY: Final[str] = "Body"
+    EXPECTED_BUCKET_OWNER: Final[str] = "ExpectedBucketOwner"
+    ERROR: Final[str] = "Error"
+    CODE: Final[str] = "Code"
+
+
+class S3OffloadErrorCodes:
+    """S3 error codes meaning that an object does not exist."""
+
+    NOT_FOUND: Final[FrozenSet[str]] = frozenset({"404", "NoSuchKey", "NotFound"})
+
+
+class S3OffloadLogMessages:
+    """Log message templates for S3 media offload."""
+
+    OBJECT_UPLOADED: Final[str] = "Offloaded {size} byte {media_type} payload to {uri}"
+    OBJECT_EXISTS: Final[str] = "Reusing offloaded {media_type} payload at {uri}"
+    UPLOAD_FAILED: Final[str] = (
+        "Failed to offload {size} byte {media_type} payload to {uri}, sending it inline: {error}"
+    )
@@ -0,0 +1,92 @@
+"""
+Data structures for offloading large media payloads to Amazon S3 in LLM Manager system.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Optional
+
+from .s3_offload_constants import S3OffloadDefaults
+
+
+@dataclass(frozen=True)
+class S3OffloadConfig:
+    """
+    Configuration for uploading large image/document/video bytes to S3.
+
+    Payloads above ``threshold_bytes`` are uploaded once under ``s3_uri``, keyed by
+    their SHA-256 hash, and the content block is rewritten to an ``s3Location``
+    source. The models used must support S3 sources for the offloaded media types,
+    and Bedrock must be able to read the bucket in the regions requests are sent to.
+
+    Attributes:
+        s3_uri: S3 prefix payloads are uploaded under (``s3://bucket/prefix``)
+        threshold_bytes: Payloads larger than this are offloaded
+        region: Region of the S3 client (defaults to the manager's first region)
+        bucket_owner: Optional 12-digit account ID of the bucket owner, sent as
+            ``bucketOwner`` and checked on upload
+        media_types: Content block types to offload ("image", "document", "video")
+    """
+
+    s3_uri: str
+    threshold_bytes: int = S3OffloadDefaults.THRESHOLD_BYTES
+    region: Optional[str] = None
+    bucket_owner: Optional[str] = None
+    media_types: FrozenSet[str] = S3OffloadDefaults.MEDIA_TYPES
+
+    def __post_init__(self) -> None:
+        """Validate S3 offload configuration."""
+        bucket = self.s3_uri[len("s3://") :].partition("/")[0]
+        if not self.s3_uri.startswith("s3://") or not bucket:
+            raise ValueError(f"s3_uri must be an s3://bucket[/prefix] URI, got: {self.s3_uri}")
+        if self.threshold_bytes < 0:
+            raise ValueError(f"threshold_bytes must be non-negative, got: {self.threshold_bytes}")
+        if self.bucket_owner is not None and not (
+            len(self.bucket_owner) == 12 and self.bucket_owner.isdigit()
+        ):
+            raise ValueError(
+                f"bucket_owner must be a 12-digit AWS account ID, got: {self.bucket_owner}"
+            )
+        unknown = set(self.media_types) - S3OffloadDefaults.MEDIA_TYPES
+        if unknown:
+            raise ValueError(f"Unsupported media_types: {sorted(unknown)}")
+
+    @property
+    def bucket(self) -> str:
+        """Bucket name of ``s3_uri``."""
+        return self.s3_uri[len("s3://") :].partition("/")[0]
+
+    @property
+    def key_prefix(self) -> str:
+        """Key prefix of ``s3_uri`` (empty or ending with ``/``)."""
+        prefix = self.s3_uri[len("s3://") :].partition("/")[2].strip("/")
+        return f"{prefix}/" if prefix else ""
+
+
+@dataclass
+class S3OffloadStats:
+    """
+    Statistics of an S3 media offloader.
+
+    Attributes:
+        blocks_offloaded: Content blocks rewritten to an S3 source
+        objects_uploaded: Objects uploaded (each distinct payload at most once)
+        bytes_uploaded: Bytes uploaded
+        bytes_offloaded: Bytes removed from request bodies
+        upload_failures: Payloads sent inline because their upload failed
+    """
+
+    blocks_offloaded: int = 0
+    objects_uploaded: int = 0
+    bytes_uploaded: int = 0
+    bytes_offloaded: int = 0
+    upload_failures: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert statistics to dictionary format."""
+        return {
+            "blocks_offloaded": self.blocks_offloaded,
+            "objects_uploaded": self.objects_uploaded,
+            "bytes_uploaded": self.bytes_uploaded,
+            "bytes_offloaded": self.bytes_offloaded,
+            "upload_failures": self.upload_failures,
+        }
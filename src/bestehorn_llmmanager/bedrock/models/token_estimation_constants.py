@@ -0,0 +1,66 @@
+"""
+Constants for input token estimation in LLM Manager system.
+Defines per-content-type heuristics, calibration bounds and model family keywords.
+"""
+
+from typing import Final, FrozenSet, Tuple
+
+
+class TokenEstimationDefaults:
+    """Heuristics used before calibration data is available."""
+
+    CHARS_PER_TOKEN: Final[float] = 4.0
+
+    # Fallbacks when a block's content cannot be inspected
+    IMAGE_TOKENS: Final[int] = 450
+    DOCUMENT_TOKENS: Final[int] = 1000
+    VIDEO_TOKENS: Final[int] = 2000
+    OTHER_BLOCK_TOKENS: Final[int] = 10
+
+    # Images: roughly one token per 750 pixels after the service downscales the image
+    # so that its long edge is at most IMAGE_MAX_EDGE_PIXELS and its area at most
+    # IMAGE_MAX_PIXELS.
+    IMAGE_PIXELS_PER_TOKEN: Final[float] = 750.0
+    IMAGE_MAX_EDGE_PIXELS: Final[int] = 1568
+    IMAGE_MAX_PIXELS: Final[int] = 1_150_000
+    IMAGE_MIN_TOKENS: Final[int] = 1
+
+    # Documents
+    PDF_TOKENS_PER_PAGE: Final[int] = 1500
+    TEXT_DOCUMENT_FORMATS: Final[FrozenSet[str]] = frozenset({"txt", "md", "csv", "html"})
+
+    # Memoization of binary-content estimates (keyed by content hash)
+    MEMO_MAX_ENTRIES: Final[int] = 1024
+    HASH_DIGEST_SIZE: Final[int] = 16
+
+
+class TokenCalibrationDefaults:
+    """Bounds of the per-model-family calibration learned from response usage."""
+
+    # Requests with fewer estimated tokens are dominated by fixed overhead and skipped
+    MIN_ESTIMATED_TOKENS: Final[int] = 50
+    # Observed/estimated ratios outside this range are clamped
+    MIN_RATIO: Final[float] = 0.25
+    MAX_RATIO: Final[float] = 4.0
+    # The scale is the running mean of the first samples, then an exponential moving
+    # average with this weight
+    MIN_SMOOTHING: Final[float] = 0.1
+
+
+class ModelFamilies:
+    """Model families sharing a tokenizer, matched by keywords in model names and IDs."""
+
+    DEFAULT: Final[str] = "default"
+
+    KEYWORDS: Final[Tuple[Tuple[str, Tuple[str, ...]], ...]] = (
+        ("anthropic", ("anthropic", "claude")),
+        ("amazon", ("amazon", "nova", "titan")),
+        ("meta", ("meta", "llama")),
+        ("mistral", ("mistral", "mixtral", "pixtral")),
+        ("cohere", ("cohere", "command")),
+        ("ai21", ("ai21", "jamba")),
+        ("deepseek", ("deepseek",)),
+        ("openai", ("openai", "gpt-oss")),
+        ("qwen", ("qwen",)),
+        ("writer", ("writer", "palmyra")),
+    )
@@ -9,11 +9,14 @@ Reference: AWS Bedrock Runtime ``ToolUseBlock``
 https://docs.aws.amazon.com/bedrock/latest/APIReference/API_runtime_ToolUseBlock.html
 """
 
-from dataclasses import dataclass
-from typing import Any, Dict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from .llm_manager_constants import ConverseAPIFields
 
+if TYPE_CHECKING:
+    from .bedrock_response import BedrockResponse
+
 
 @dataclass(frozen=True)
 class ToolUse:
@@ -48,3 +51,66 @@ class ToolUse:
             name=tool_use_block.get(ConverseAPIFields.TOOL_NAME, ""),
             input=tool_use_block.get(ConverseAPIFields.TOOL_INPUT, {}) or {},
         )
+
+
+@dataclass(frozen=True)
+class ToolCallResult:
+    """
+    The outcome of one tool call run by :func:`run_tool_loop`.
+
+    Attributes:
+        tool_use_id: ID of the tool request the result answers.
+        name: Name of the tool.
+        content: Tool result sent back to the model (text, JSON object or
+            ToolResultContentBlocks), or the error message if the call failed.
+        success: False if the tool raised, timed out or is unknown.
+        duration_ms: Time from dispatch until the result was available.
+        turn: Number of the model call (starting at 1) that requested the tool.
+    """
+
+    tool_use_id: str
+    name: str
+    content: Any
+    success: bool
+    duration_ms: float
+    turn: int
+
+
+@dataclass
+class ToolLoopResult:
+    """
+    The outcome of a :func:`run_tool_loop` run.
+
+    Attributes:
+        response: Response of the last model call.
+        messages: The conversation, from the caller's messages through the final
+            assistant message.
+        model_calls: Number of converse calls made.
+        tool_calls: Results of all tool calls, in the order the model requested them.
+        completed: True if the model stopped requesting tools; False if the loop
+            stopped at max_turns, leaving the last tool calls unanswered.
+    """
+
+    response: "BedrockResponse"
+    messages: List[Dict[str, Any]]
+    model_calls: int
+    tool_calls: List[ToolCallResult] = field(default_factory=list)
+    completed: bool = True
+
+    def get_failed_tool_calls(self) -> List[ToolCallResult]:
+        """
+        Get the tool calls that raised, timed out or named an unknown tool.
+
+        Returns:
+            The failed tool calls, in request order.
+        """
+        return [call for call in self.tool_calls if not call.success]
+
+    def get_content(self) -> Optional[str]:
+        """
+        Get the text of the final response.
+
+        Returns:
+            The text content of the last model call, or None if it has none.
+        """
+        return self.response.get_content()
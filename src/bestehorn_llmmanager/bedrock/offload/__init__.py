@@ -0,0 +1,12 @@
+"""
+Offload module for moving large media payloads out of request bodies into Amazon S3.
+"""
+
+from ..models.s3_offload_structures import S3OffloadConfig, S3OffloadStats
+from .s3_media_offloader import S3MediaOffloader
+
+__all__ = [
+    "S3MediaOffloader",
+    "S3OffloadConfig",
+    "S3OffloadStats",
+]
@@ -0,0 +1,233 @@
+"""
+Offloading of large media payloads to Amazon S3.
+
+Image, document and video blocks carry their bytes inline in every Converse request,
+so a retry or failover re-sends megabytes. S3MediaOffloader uploads payloads above a
+threshold once, under a key derived from their SHA-256 hash, and rewrites the blocks
+to ``s3Location`` sources; the request body then only carries the URI.
+"""
+
+import hashlib
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Set
+
+from botocore.exceptions import ClientError
+
+from ..executors.request_coalescer import RequestCoalescer
+from ..models.llm_manager_constants import ConverseAPIFields
+from ..models.s3_offload_constants import (
+    S3OffloadErrorCodes,
+    S3OffloadFields,
+    S3OffloadLogMessages,
+)
+from ..models.s3_offload_structures import S3OffloadConfig, S3OffloadStats
+
+_MEDIA_FIELDS = (ConverseAPIFields.IMAGE, ConverseAPIFields.DOCUMENT, ConverseAPIFields.VIDEO)
+
+
+class S3MediaOffloader:
+    """
+    Rewrites oversized inline media payloads to content-addressed S3 objects.
+
+    Each distinct payload is uploaded at most once per offloader: uploaded keys are
+    remembered, an existing object (e.g. from an earlier process) is detected with
+    HeadObject, and concurrent uploads of the same payload are coalesced. If an upload
+    fails, the block is left inline so the request still goes out.
+    """
+
+    def __init__(self, config: S3OffloadConfig, s3_client: Any) -> None:
+        """
+        Initialize the offloader.
+
+        Args:
+            config: Offload configuration
+            s3_client: S3 client (or a compatible stub such as StubS3Client)
+        """
+        self._logger = logging.getLogger(__name__)
+        self._config = config
+        self._s3_client = s3_client
+        self._lock = threading.Lock()
+        self._stored_keys: Set[str] = set()
+        self._uploads: RequestCoalescer[bool] = RequestCoalescer()
+        self._stats = S3OffloadStats()
+
+    def get_config(self) -> S3OffloadConfig:
+        """
+        Get the offload configuration.
+
+        Returns:
+            S3OffloadConfig in use
+        """
+        return self._config
+
+    def get_stats(self) -> S3OffloadStats:
+        """
+        Get offload statistics.
+
+        Returns:
+            Snapshot of the S3OffloadStats
+        """
+        with self._lock:
+            return S3OffloadStats(**self._stats.to_dict())
+
+    def offload_messages(self, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Rewrite oversized media blocks of a conversation to S3 sources.
+
+        The input is not modified; messages without offloaded blocks are reused as is.
+
+        Args:
+            messages: Converse messages
+
+        Returns:
+            Messages with payloads above the threshold replaced by S3 locations
+        """
+        result = []
+        for message in messages:
+            content = message.get(ConverseAPIFields.CONTENT)
+            if not isinstance(content, list):
+                result.append(message)
+                continue
+            blocks = [self.offload_content_block(content_block=block) for block in content]
+            if any(new is not old for new, old in zip(blocks, content, strict=True)):
+                message = {**message, ConverseAPIFields.CONTENT: blocks}
+            result.append(message)
+        return result
+
+    def offload_content_block(self, content_block: Any) -> Any:
+        """
+        Rewrite one content block to an S3 source if its inline payload is too large.
+
+        Args:
+            content_block: Converse content block
+
+        Returns:
+            The rewritten block, or the input block if nothing was offloaded
+        """
+        if not isinstance(content_block, dict):
+            return content_block
+        for media_field in _MEDIA_FIELDS:
+            media = content_block.get(media_field)
+            if not isinstance(media, dict):
+                continue
+            if media_field not in self._config.media_types:
+                return content_block
+            payload = media.get(ConverseAPIFields.SOURCE, {}).get(ConverseAPIFields.BYTES)
+            if not isinstance(payload, (bytes, bytearray)):
+                return content_block
+            if len(payload) <= self._config.threshold_bytes:
+                return content_block
+            s3_location = self._store(
+                payload=bytes(payload),
+                media_type=media_field,
+                extension=str(media.get(ConverseAPIFields.FORMAT, "bin")),
+            )
+            if s3_location is None:
+                return content_block
+            return {
+                media_field: {
+                    **media,
+                    ConverseAPIFields.SOURCE: {ConverseAPIFields.S3_LOCATION: s3_location},
+                }
+            }
+        return content_block
+
+    def _store(self, payload: bytes, media_type: str, extension: str) -> Optional[Dict[str, str]]:
+        """
+        Make sure a payload is stored in S3 and build its ``s3Location``.
+
+        Args:
+            payload: Media bytes
+            media_type: Content block type, for logging
+            extension: Media format, used as the key's extension
+
+        Returns:
+            ``s3Location`` dictionary, or None if the upload failed
+        """
+        key = f"{self._config.key_prefix}{hashlib.sha256(payload).hexdigest()}.{extension}"
+        uri = f"s3://{self._config.bucket}/{key}"
+
+        with self._lock:
+            stored = key in self._stored_keys
+        if not stored:
+            try:
+                uploaded = self._uploads.execute(
+                    key=key, operation=lambda: self._upload_if_missing(key=key, payload=payload)
+                )
+            except Exception as e:
+                self._logger.warning(
+                    S3OffloadLogMessages.UPLOAD_FAILED.format(
+                        size=len(payload), media_type=media_type, uri=uri, error=e
+                    )
+                )
+                with self._lock:
+                    self._stats.upload_failures += 1
+                return None
+            self._logger.debug(
+                (
+                    S3OffloadLogMessages.OBJECT_UPLOADED
+                    if uploaded
+                    else S3OffloadLogMessages.OBJECT_EXISTS
+                ).format(size=len(payload), media_type=media_type, uri=uri)
+            )
+
+        with self._lock:
+            self._stats.blocks_offloaded += 1
+            self._stats.bytes_offloaded += len(payload)
+
+        s3_location = {ConverseAPIFields.URI: uri}
+        if self._config.bucket_owner is not None:
+            s3_location[ConverseAPIFields.BUCKET_OWNER] = self._config.bucket_owner
+        return s3_location
+
+    def _upload_if_missing(self, key: str, payload: bytes) -> bool:
+        """
+        Upload a payload unless an object with its key already exists.
+
+        Args:
+            key: Content-addressed object key
+            payload: Media bytes
+
+        Returns:
+            True if the payload was uploaded, False if the object already existed
+        """
+        request: Dict[str, Any] = {
+            S3OffloadFields.BUCKET: self._config.bucket,
+            S3OffloadFields.KEY: key,
+        }
+        if self._config.bucket_owner is not None:
+            request[S3OffloadFields.EXPECTED_BUCKET_OWNER] = self._config.bucket_owner
+
+        uploaded = not self._object_exists(request=request)
+        if uploaded:
+            self._s3_client.put_object(**request, **{S3OffloadFields.BODY: payload})
+
+        with self._lock:
+            self._stored_keys.add(key)
+            if uploaded:
+                self._stats.objects_uploaded += 1
+                self._stats.bytes_uploaded += len(payload)
+        return uploaded
+
+    def _object_exists(self, request: Dict[str, Any]) -> bool:
+        """
+        Check whether an object exists.
+
+        Args:
+            request: Bucket/key arguments of the object
+
+        Returns:
+            True if HeadObject finds the object
+
+        Raises:
+            ClientError: For errors other than "not found"
+        """
+        try:
+            self._s3_client.head_object(**request)
+        except ClientError as e:
+            code = e.response.get(S3OffloadFields.ERROR, {}).get(S3OffloadFields.CODE)
+            if code in S3OffloadErrorCodes.NOT_FOUND:
+                return False
+            raise
+        return True
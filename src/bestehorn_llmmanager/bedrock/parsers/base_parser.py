@@ -5,11 +5,38 @@ Defines the interface for all parser implementations.
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Dict, Protocol
+from typing import Dict, Optional, Protocol
 
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.builder import builder_registry
+
+from ..models.constants import HTMLParserFeatures
 from ..models.data_structures import BedrockModelInfo
 
 
+def create_soup(markup: str, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    """
+    Build a BeautifulSoup tree with the fastest available tree builder.
+
+    Uses lxml if it is installed and falls back to Python's html.parser otherwise.
+    With parse_only, only the elements matching the strainer (and their descendants)
+    are materialized; the rest of the document is tokenized and discarded.
+
+    Args:
+        markup: HTML document to parse
+        parse_only: Optional strainer restricting the elements kept in the tree
+
+    Returns:
+        Parsed document
+    """
+    features = (
+        HTMLParserFeatures.LXML
+        if builder_registry.lookup(HTMLParserFeatures.LXML) is not None
+        else HTMLParserFeatures.HTML_PARSER
+    )
+    return BeautifulSoup(markup, features, parse_only=parse_only)
+
+
 class DocumentationParser(Protocol):
     """
     Protocol defining the interface for documentation parsers.
@@ -7,12 +7,12 @@ import logging
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 
 from ..models.aws_regions import normalize_region_name
-from ..models.constants import BooleanValues, HTMLTableColumns, LogMessages
+from ..models.constants import BooleanValues, HTMLParserFeatures, HTMLTableColumns, LogMessages
 from ..models.data_structures import BedrockModelInfo
-from .base_parser import BaseDocumentationParser, ParsingError
+from .base_parser import BaseDocumentationParser, ParsingError, create_soup
 
 
 class BedrockHTMLParser(BaseDocumentationParser):
@@ -21,9 +21,16 @@ class BedrockHTMLParser(BaseDocumentationParser):
     Extracts model information from HTML tables in AWS documentation.
     """
 
-    def __init__(self) -> None:
-        """Initialize the Bedrock HTML parser."""
+    def __init__(self, fast_parsing: bool = True) -> None:
+        """
+        Initialize the Bedrock HTML parser.
+
+        Args:
+            fast_parsing: Parse with lxml (if installed) and build only the document's
+                          tables. If False, build the full tree with html.parser.
+        """
         self._logger = logging.getLogger(__name__)
+        self._fast_parsing = fast_parsing
         self._column_indices: Dict[str, int] = {}
         self._parsed_model_names: Set[str] = set()
 
@@ -46,7 +53,10 @@ class BedrockHTMLParser(BaseDocumentationParser):
 
         try:
             content = self._read_file_content(file_path=file_path)
-            soup = BeautifulSoup(content, "html.parser")
+            if self._fast_parsing:
+                soup = create_soup(markup=content, parse_only=SoupStrainer(name="table"))
+            else:
+                soup = BeautifulSoup(content, HTMLParserFeatures.HTML_PARSER)
 
             models = self._extract_models_from_soup(soup=soup)
 
@@ -10,8 +10,9 @@ from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 
+from ..models.constants import HTMLParserFeatures
 from ..models.cris_constants import (
     CRISErrorMessages,
     CRISGlobalConstants,
@@ -22,7 +23,7 @@ from ..models.cris_constants import (
     CRISTableColumns,
 )
 from ..models.cris_structures import CRISInferenceProfile, CRISModelInfo
-from .base_parser import ParsingError
+from .base_parser import ParsingError, create_soup
 
 
 class BaseCRISParser(ABC):
@@ -166,9 +167,16 @@ class CRISHTMLParser(BaseCRISParser):
     and merging them appropriately before creating the final CRISModelInfo objects.
     """
 
-    def __init__(self) -> None:
-        """Initialize the CRIS HTML parser with logging."""
+    def __init__(self, fast_parsing: bool = True) -> None:
+        """
+        Initialize the CRIS HTML parser with logging.
+
+        Args:
+            fast_parsing: Parse with lxml (if installed) and build only the expandable
+                          model sections. If False, build the full tree with html.parser.
+        """
         self._logger = logging.getLogger(__name__)
+        self._fast_parsing = fast_parsing
 
     def parse(self, file_path: Path) -> Dict[str, CRISModelInfo]:
         """
@@ -195,7 +203,14 @@ class CRISHTMLParser(BaseCRISParser):
             with open(file_path, "r", encoding="utf-8") as f:
                 html_content = f.read()
 
-            soup = BeautifulSoup(markup=html_content, features="html.parser")
+            if self._fast_parsing:
+                strainer = SoupStrainer(
+                    name=CRISHTMLSelectors.EXPANDABLE_SECTION,
+                    attrs={CRISHTMLAttributes.VARIANT: "container"},
+                )
+                soup = create_soup(markup=html_content, parse_only=strainer)
+            else:
+                soup = BeautifulSoup(markup=html_content, features=HTMLParserFeatures.HTML_PARSER)
 
             # Find all expandable sections
             expandable_sections = soup.find_all(
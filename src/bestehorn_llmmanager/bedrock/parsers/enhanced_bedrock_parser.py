@@ -22,9 +22,15 @@ class EnhancedBedrockHTMLParser(BedrockHTMLParser):
     asterisk (*) markers indicating CRIS-only availability.
     """
 
-    def __init__(self) -> None:
-        """Initialize the enhanced Bedrock HTML parser."""
-        super().__init__()
+    def __init__(self, fast_parsing: bool = True) -> None:
+        """
+        Initialize the enhanced Bedrock HTML parser.
+
+        Args:
+            fast_parsing: Parse with lxml (if installed) and build only the document's
+                          tables. If False, build the full tree with html.parser.
+        """
+        super().__init__(fast_parsing=fast_parsing)
         self._cris_only_regions_detected = 0
 
     def _extract_regions_from_cell(self, cells: List[Tag], column: str) -> List[str]:
@@ -0,0 +1,20 @@
+"""
+Rate limiting module for client-side RPM/TPM quota enforcement.
+"""
+
+from ..models.rate_limit_structures import (
+    RateLimitConfig,
+    RateLimitPermit,
+    RateLimitRule,
+    RateLimitStats,
+)
+from .rate_limiter import LeakyBucket, RateLimiter
+
+__all__ = [
+    "LeakyBucket",
+    "RateLimitConfig",
+    "RateLimitPermit",
+    "RateLimitRule",
+    "RateLimitStats",
+    "RateLimiter",
+]
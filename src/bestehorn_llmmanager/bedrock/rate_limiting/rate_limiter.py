@@ -0,0 +1,305 @@
+"""
+Client-side RPM/TPM rate limiter for Bedrock calls.
+
+Keeps a requests bucket and a tokens bucket per (model ID, region). A call reserves
+one request and its estimated tokens before it is sent, waiting until both buckets
+have room, and the token reservation is corrected with the usage Bedrock reports
+afterwards. Callers sharing a limiter therefore run at the configured quota instead
+of overshooting it and backing off from ThrottlingException.
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ..exceptions.llm_manager_exceptions import RateLimitExceededError
+from ..instrumentation.instrumentation_registry import record_metric
+from ..models.instrumentation_constants import (
+    InstrumentationAttributes,
+    InstrumentationMetricNames,
+)
+from ..models.rate_limit_constants import RateLimitDefaults, RateLimitLogMessages
+from ..models.rate_limit_structures import (
+    RateLimitConfig,
+    RateLimitPermit,
+    RateLimitRule,
+    RateLimitStats,
+)
+
+
+class LeakyBucket:
+    """
+    Leaky bucket metering units (requests or tokens) against a per-minute quota.
+
+    The bucket drains at ``units_per_minute / 60`` per second and holds at most one
+    minute of quota. Reservations are granted in arrival order: a reservation that
+    does not fit is scheduled for the time it will fit, so concurrent callers queue
+    behind each other instead of polling. Not thread-safe; RateLimiter serializes access.
+    """
+
+    def __init__(self, units_per_minute: float) -> None:
+        """
+        Initialize an empty bucket.
+
+        Args:
+            units_per_minute: Quota per minute
+        """
+        self.capacity = units_per_minute
+        self.drain_per_second = units_per_minute / RateLimitDefaults.WINDOW_SECONDS
+        self._level = 0.0
+        self._updated_at = 0.0
+
+    def available_at(self, amount: float, now: float) -> float:
+        """
+        Get the earliest time at which a reservation of ``amount`` fits.
+
+        Reservations larger than the bucket are admitted once it is empty.
+
+        Args:
+            amount: Units to reserve
+            now: Current clock value
+
+        Returns:
+            Clock value at which the reservation fits (at least ``now``)
+        """
+        overflow = self._level + min(amount, self.capacity) - self.capacity
+        return max(now, self._updated_at + overflow / self.drain_per_second)
+
+    def reserve(self, amount: float, at: float) -> None:
+        """
+        Add a reservation taking effect at clock value ``at``.
+
+        Args:
+            amount: Units to reserve
+            at: Clock value from available_at()
+        """
+        if at > self._updated_at:
+            self._level = max(0.0, self._level - (at - self._updated_at) * self.drain_per_second)
+            self._updated_at = at
+        self._level += amount
+
+    def adjust(self, delta: float) -> None:
+        """
+        Correct the bucket level, e.g. after reconciling a reservation with actual usage.
+
+        Args:
+            delta: Units to add (negative to refund)
+        """
+        self._level = max(0.0, self._level + delta)
+
+
+class RateLimiter:
+    """
+    Thread-safe RPM/TPM limiter keyed by (model ID, region).
+
+    The model ID is the ID sent to Bedrock, so direct access, regional CRIS profiles
+    and global CRIS profiles of the same model have separate buckets.
+    """
+
+    def __init__(
+        self,
+        config: RateLimitConfig,
+        clock: Callable[[], float] = time.monotonic,
+        sleep_func: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """
+        Initialize the rate limiter.
+
+        Args:
+            config: Quota rules and waiting behavior
+            clock: Monotonic clock in seconds (injectable for tests)
+            sleep_func: Sleep function used while waiting for quota (injectable for tests)
+        """
+        self._logger = logging.getLogger(__name__)
+        self._config = config
+        self._clock = clock
+        self._sleep = sleep_func
+        self._lock = threading.Lock()
+        # (model_id, region) -> (rule, requests bucket, tokens bucket) or None if unlimited
+        self._buckets: Dict[
+            Tuple[str, str],
+            Optional[Tuple[RateLimitRule, Optional[LeakyBucket], Optional[LeakyBucket]]],
+        ] = {}
+        self._stats: Dict[Tuple[str, str], RateLimitStats] = {}
+
+    def get_config(self) -> RateLimitConfig:
+        """
+        Get the rate limit configuration.
+
+        Returns:
+            RateLimitConfig in use
+        """
+        return self._config
+
+    def get_rule(self, model_id: str, region: str) -> Optional[RateLimitRule]:
+        """
+        Get the rule limiting a model ID and region.
+
+        Args:
+            model_id: Model or inference profile ID sent to Bedrock
+            region: AWS region of the call
+
+        Returns:
+            Matching RateLimitRule, or None if calls are not limited
+        """
+        with self._lock:
+            entry = self._get_buckets(model_id=model_id, region=region)
+        return entry[0] if entry else None
+
+    def limits_tokens(self, model_id: str, region: str) -> bool:
+        """
+        Check whether calls to a model ID and region need a token estimate.
+
+        Args:
+            model_id: Model or inference profile ID sent to Bedrock
+            region: AWS region of the call
+
+        Returns:
+            True if a tokens-per-minute quota applies
+        """
+        rule = self.get_rule(model_id=model_id, region=region)
+        return rule is not None and rule.tokens_per_minute is not None
+
+    def acquire(self, model_id: str, region: str, tokens: int = 0) -> RateLimitPermit:
+        """
+        Reserve quota for one call, waiting until it is available.
+
+        Args:
+            model_id: Model or inference profile ID sent to Bedrock
+            region: AWS region of the call
+            tokens: Estimated input tokens plus reserved output tokens
+
+        Returns:
+            RateLimitPermit to pass to reconcile() once the actual usage is known
+
+        Raises:
+            RateLimitExceededError: If quota is not available within max_wait_seconds
+        """
+        key = (model_id, region)
+        with self._lock:
+            entry = self._get_buckets(model_id=model_id, region=region)
+            if entry is None:
+                return RateLimitPermit(model_id=model_id, region=region)
+
+            _, request_bucket, token_bucket = entry
+            stats = self._stats[key]
+            now = self._clock()
+            start_at = now
+            if request_bucket is not None:
+                start_at = max(start_at, request_bucket.available_at(amount=1, now=now))
+            if token_bucket is not None:
+                start_at = max(start_at, token_bucket.available_at(amount=tokens, now=now))
+
+            wait_seconds = start_at - now
+            if wait_seconds > self._config.max_wait_seconds:
+                stats.rejected_requests += 1
+                message = RateLimitLogMessages.QUOTA_WAIT_EXCEEDED.format(
+                    model_id=model_id,
+                    region=region,
+                    wait_seconds=wait_seconds,
+                    max_wait_seconds=self._config.max_wait_seconds,
+                )
+                self._logger.debug(message)
+                raise RateLimitExceededError(
+                    message=message, model_id=model_id, region=region, wait_seconds=wait_seconds
+                )
+
+            if request_bucket is not None:
+                request_bucket.reserve(amount=1, at=start_at)
+            reserved_tokens = 0
+            if token_bucket is not None:
+                token_bucket.reserve(amount=tokens, at=start_at)
+                reserved_tokens = tokens
+            stats.requests_admitted += 1
+            stats.tokens_consumed += reserved_tokens
+            stats.total_wait_seconds += wait_seconds
+
+        if wait_seconds > 0:
+            self._logger.debug(
+                RateLimitLogMessages.WAITING_FOR_QUOTA.format(
+                    model_id=model_id, region=region, wait_seconds=wait_seconds
+                )
+            )
+            self._sleep(wait_seconds)
+
+        record_metric(
+            name=InstrumentationMetricNames.RATE_LIMIT_WAIT_MS,
+            value=wait_seconds * 1000,
+            attributes={
+                InstrumentationAttributes.MODEL_ID: model_id,
+                InstrumentationAttributes.REGION: region,
+            },
+        )
+        return RateLimitPermit(
+            model_id=model_id,
+            region=region,
+            reserved_tokens=reserved_tokens,
+            wait_seconds=wait_seconds,
+            limited=True,
+        )
+
+    def reconcile(self, permit: RateLimitPermit, actual_tokens: int) -> None:
+        """
+        Correct a permit's token reservation with the tokens the call actually used.
+
+        Over-reservations (e.g. unused maxTokens) are refunded; under-estimates are
+        charged, delaying later calls accordingly.
+
+        Args:
+            permit: Permit returned by acquire()
+            actual_tokens: Tokens the call used (0 if it failed before using any)
+        """
+        if not permit.limited or permit.reserved_tokens == actual_tokens:
+            return
+
+        key = (permit.model_id, permit.region)
+        with self._lock:
+            entry = self._buckets.get(key)
+            if entry is None or entry[2] is None:
+                return
+            delta = actual_tokens - permit.reserved_tokens
+            entry[2].adjust(delta=delta)
+            self._stats[key].tokens_consumed += delta
+        permit.reserved_tokens = actual_tokens
+
+    def get_stats(self) -> List[RateLimitStats]:
+        """
+        Get statistics of every limited (model ID, region) pair used so far.
+
+        Returns:
+            List of RateLimitStats snapshots
+        """
+        with self._lock:
+            return [
+                RateLimitStats(**stats.to_dict())
+                for key, stats in self._stats.items()
+                if self._buckets.get(key) is not None
+            ]
+
+    def _get_buckets(
+        self, model_id: str, region: str
+    ) -> Optional[Tuple[RateLimitRule, Optional[LeakyBucket], Optional[LeakyBucket]]]:
+        """
+        Get or create the buckets of a model ID and region (lock must be held).
+
+        Args:
+            model_id: Model or inference profile ID
+            region: AWS region
+
+        Returns:
+            Tuple of (rule, requests bucket, tokens bucket), or None if not limited
+        """
+        key = (model_id, region)
+        if key not in self._buckets:
+            rule = self._config.find_rule(model_id=model_id, region=region)
+            if rule is None:
+                self._buckets[key] = None
+            else:
+                self._buckets[key] = (
+                    rule,
+                    LeakyBucket(rule.requests_per_minute) if rule.requests_per_minute else None,
+                    LeakyBucket(rule.tokens_per_minute) if rule.tokens_per_minute else None,
+                )
+                self._stats[key] = RateLimitStats(model_id=model_id, region=region)
+        return self._buckets[key]
@@ -8,13 +8,19 @@ import math
 import random
 import time
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
 from botocore.exceptions import ClientError
 
 from ..exceptions.llm_manager_exceptions import RetryExhaustedError
 from ..filters.content_filter import ContentFilter
+from ..instrumentation.instrumentation_registry import (
+    instrument_span,
+    is_instrumentation_enabled,
+    record_span,
+)
 from ..models.access_method import ModelAccessInfo
+from ..models.instrumentation_constants import InstrumentationAttributes, InstrumentationSpanNames
 from ..models.llm_manager_constants import (
     LLMManagerErrorMessages,
     LLMManagerLogMessages,
@@ -37,6 +43,9 @@ from .access_method_selector import AccessMethodSelector
 from .access_method_structures import AccessMethodPreference
 from .profile_requirement_detector import ProfileRequirementDetector
 
+if TYPE_CHECKING:
+    from ..executors.validation_executor import ValidationExecutor
+
 
 class RetryManager:
     """
@@ -411,12 +420,49 @@ class RetryManager:
         # Cap at maximum delay
         return min(delay, self._config.max_retry_delay)
 
+    def _backoff_sleep(self, delay: float) -> None:
+        """
+        Sleep before the next retry attempt, reported as a backoff span.
+
+        Args:
+            delay: Delay in seconds
+        """
+        with instrument_span(
+            name=InstrumentationSpanNames.BACKOFF_SLEEP,
+            attributes={InstrumentationAttributes.DELAY_SECONDS: delay},
+        ):
+            time.sleep(delay)
+
+    def _record_attempt_span(self, attempt: RequestAttempt) -> None:
+        """
+        Report a finished request attempt as a retry-attempt span.
+
+        Args:
+            attempt: Attempt with start and end time set
+        """
+        if not is_instrumentation_enabled() or attempt.end_time is None:
+            return
+        record_span(
+            name=InstrumentationSpanNames.RETRY_ATTEMPT,
+            start_time_ns=int(attempt.start_time.timestamp() * 1_000_000_000),
+            duration_ms=(attempt.end_time - attempt.start_time).total_seconds() * 1000,
+            attributes={
+                InstrumentationAttributes.MODEL: attempt.model_id,
+                InstrumentationAttributes.REGION: attempt.region,
+                InstrumentationAttributes.ACCESS_METHOD: attempt.access_method,
+                InstrumentationAttributes.ATTEMPT_NUMBER: attempt.attempt_number,
+                InstrumentationAttributes.SUCCESS: attempt.success,
+            },
+            error=type(attempt.error).__name__ if attempt.error is not None else None,
+        )
+
     def generate_retry_targets(
         self,
         models: List[str],
         regions: List[str],
         unified_model_manager: Any,
         failed_combinations: Optional[List[Tuple[str, str]]] = None,
+        preferred_region: Optional[str] = None,
     ) -> List[Tuple[str, str, ModelAccessInfo]]:
         """
         Generate list of model/region combinations to try based on retry strategy.
@@ -428,6 +474,8 @@ class RetryManager:
             regions: List of regions
             unified_model_manager: UnifiedModelManager instance for access info
             failed_combinations: Previously failed (model, region) combinations to skip
+            preferred_region: Region to try first, e.g. where a shared prompt prefix is
+                already cached; the other regions stay as failover targets
 
         Returns:
             List of (model, region, access_info) tuples in retry order
@@ -441,6 +489,9 @@ class RetryManager:
         # depth is preserved and the failed_combinations skip logic below is unaffected.
         # With the default RegionOrder.FIXED this is the caller's original order.
         ordered_regions = self._order_regions(regions)
+        if preferred_region in ordered_regions:
+            ordered_regions.remove(preferred_region)
+            ordered_regions.insert(0, preferred_region)
 
         if self._config.retry_strategy == RetryStrategy.REGION_FIRST:
             # Try all regions for each model before moving to next model
@@ -519,6 +570,37 @@ class RetryManager:
 
         return retry_targets
 
+    def prefer_region(
+        self,
+        retry_targets: List[Tuple[str, str, ModelAccessInfo]],
+        preferred_region: str,
+    ) -> List[Tuple[str, str, ModelAccessInfo]]:
+        """
+        Reorder planned retry targets so a region is tried first.
+
+        Gives the order generate_retry_targets(preferred_region=...) would have planned:
+        with REGION_FIRST the preferred region leads within each model's targets and the
+        models keep their priority; with MODEL_FIRST the preferred region's targets lead
+        the whole plan. Targets keep their planned order otherwise.
+
+        Args:
+            retry_targets: Planned (model, region, access_info) tuples
+            preferred_region: Region to try first
+
+        Returns:
+            The reordered retry targets
+        """
+        if self._config.retry_strategy == RetryStrategy.MODEL_FIRST:
+            return sorted(retry_targets, key=lambda target: target[1] != preferred_region)
+
+        model_positions: Dict[str, int] = {}
+        for model, _, _ in retry_targets:
+            model_positions.setdefault(model, len(model_positions))
+        return sorted(
+            retry_targets,
+            key=lambda target: (model_positions[target[0]], target[1] != preferred_region),
+        )
+
     def execute_with_retry(
         self,
         operation: Callable[..., Any],
@@ -686,6 +768,7 @@ class RetryManager:
                 attempt.end_time = datetime.now()
                 attempt.success = True
                 attempts.append(attempt)
+                self._record_attempt_span(attempt=attempt)
 
                 self._logger.info(
                     LLMManagerLogMessages.REQUEST_SUCCEEDED.format(
@@ -700,6 +783,7 @@ class RetryManager:
                 attempt.error = error
                 attempt.success = False
                 attempts.append(attempt)
+                self._record_attempt_span(attempt=attempt)
 
                 # Use model_id_to_use if available, otherwise use model name
                 display_model_id = model_id_to_use if model_id_to_use else model
@@ -848,7 +932,7 @@ class RetryManager:
                         delay = self.calculate_retry_delay(attempt_num)
                         if delay > 0:
                             self._logger.debug(f"Waiting {delay}s before trying next model")
-                            time.sleep(delay)
+                            self._backoff_sleep(delay=delay)
                     continue
 
                 # If not the last attempt and error is retryable, add delay
@@ -856,7 +940,7 @@ class RetryManager:
                     delay = self.calculate_retry_delay(attempt_num)
                     if delay > 0:
                         self._logger.debug(f"Waiting {delay}s before retry")
-                        time.sleep(delay)
+                        self._backoff_sleep(delay=delay)
 
                 # Continue to next target
                 continue
@@ -1253,6 +1337,7 @@ class RetryManager:
             validation_result, content = self._safe_validate_response(
                 response=response,
                 validation_function=validation_config.response_validation_function,
+                executor=validation_config.validation_executor,
             )
 
             # Create validation attempt record
@@ -1307,7 +1392,10 @@ class RetryManager:
         return False, validation_attempts
 
     def _safe_validate_response(
-        self, response: Any, validation_function: Callable
+        self,
+        response: Any,
+        validation_function: Callable,
+        executor: Optional["ValidationExecutor"] = None,
     ) -> Tuple[ValidationResult, Optional[str]]:
         """
         Safely execute validation function and return result with error info.
@@ -1315,13 +1403,19 @@ class RetryManager:
         Args:
             response: BedrockResponse to validate
             validation_function: Function to validate the response
+            executor: Pool to run the validation function in (None: run it on this thread)
 
         Returns:
             Tuple of (ValidationResult, content_that_failed)
         """
         try:
             content = response.get_content()
-            result = validation_function(response)
+            if executor is not None:
+                result = executor.validate(
+                    validation_function=validation_function, response=response
+                )
+            else:
+                result = validation_function(response)
             return result, content
         except Exception as e:
             self._logger.warning(f"Validation function raised exception: {e}")
@@ -1360,6 +1454,7 @@ class RetryManager:
 
         Raises:
             RetryExhaustedError: If all retry attempts fail
+            ConfigurationError: If the validation executor cannot run the validation function
         """
         # If no validation config, use regular retry logic
         if validation_config is None:
@@ -1370,6 +1465,12 @@ class RetryManager:
                 disabled_features=disabled_features,
             )
 
+        # Fail before calling Bedrock if the validator cannot be sent to its pool
+        if validation_config.validation_executor is not None:
+            validation_config.validation_executor.check_validator(
+                validation_function=validation_config.response_validation_function
+            )
+
         attempts = []
         warnings: List[str] = []
         disabled_features = disabled_features or []
@@ -1450,6 +1551,7 @@ class RetryManager:
                     attempt.end_time = datetime.now()
                     attempt.success = True
                     attempts.append(attempt)
+                    self._record_attempt_span(attempt=attempt)
 
                     # Add validation data to response
                     if isinstance(result, BedrockResponse):
@@ -1485,6 +1587,7 @@ class RetryManager:
                     )
                     attempt.error = Exception(f"Validation failed: {validation_error_msg}")
                     attempts.append(attempt)
+                    self._record_attempt_span(attempt=attempt)
 
                     # Add validation data to response for debugging
                     if isinstance(result, BedrockResponse):
@@ -1502,7 +1605,7 @@ class RetryManager:
                         delay = self.calculate_retry_delay(attempt_num)
                         if delay > 0:
                             self._logger.debug(f"Waiting {delay}s before trying next target")
-                            time.sleep(delay)
+                            self._backoff_sleep(delay=delay)
                     continue
 
             except Exception as error:
@@ -1511,6 +1614,7 @@ class RetryManager:
                 attempt.error = error
                 attempt.success = False
                 attempts.append(attempt)
+                self._record_attempt_span(attempt=attempt)
 
                 self._logger.warning(
                     LLMManagerLogMessages.REQUEST_FAILED.format(
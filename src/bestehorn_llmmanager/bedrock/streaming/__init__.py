@@ -4,6 +4,7 @@ Provides real-time streaming support for AWS Bedrock Converse Stream API.
 """
 
 from .event_handlers import StreamEventHandler
+from .incremental_json_parser import IncrementalJSONParser
 from .stream_processor import StreamProcessor
 from .streaming_constants import StreamingConstants, StreamingEventTypes
 from .streaming_retry_manager import StreamingRetryManager
@@ -11,6 +12,7 @@ from .streaming_retry_manager import StreamingRetryManager
 __all__ = [
     "StreamProcessor",
     "StreamEventHandler",
+    "IncrementalJSONParser",
     "StreamingConstants",
     "StreamingEventTypes",
     "StreamingRetryManager",
@@ -0,0 +1,460 @@
+"""
+Incremental JSON parser for streamed structured output.
+
+Schema-constrained responses (see
+:func:`~bestehorn_llmmanager.bedrock.models.structured_output.build_json_schema_output_config`)
+arrive as text deltas that together form one JSON document. :class:`IncrementalJSONParser`
+consumes those deltas as they arrive and reports every top-level array element or object
+field the moment it closes, so downstream work can start before generation finishes.
+
+Each top-level member is decoded exactly once; the assembled document is built from those
+decoded members, so no re-parse of the full text is needed at the end.
+"""
+
+import json
+import re
+from typing import Any, Dict, Final, List, Optional, Tuple, Union
+
+from ..exceptions.llm_manager_exceptions import StreamingError
+
+# A completed top-level member: (array index, element) or (object key, field value).
+StructuredOutputItem = Tuple[Union[int, str], Any]
+
+
+class IncrementalJSONParserErrorMessages:
+    """Error message templates for incremental JSON parsing."""
+
+    UNEXPECTED_CHARACTER: Final[str] = "Unexpected character {char!r} in streamed JSON"
+    INVALID_MEMBER: Final[str] = "Invalid JSON member in streamed structured output: {error}"
+    TRAILING_DATA: Final[str] = "Unexpected data after the end of the streamed JSON document"
+    INCOMPLETE_DOCUMENT: Final[str] = "Streamed JSON document ended before it was complete"
+    NO_DOCUMENT: Final[str] = "Streamed structured output contained no JSON document"
+
+
+class _ParserState:
+    """Positions of the parser within the top-level JSON document."""
+
+    BEFORE_ROOT: Final[str] = "before_root"
+    EXPECT_KEY: Final[str] = "expect_key"
+    IN_KEY: Final[str] = "in_key"
+    EXPECT_COLON: Final[str] = "expect_colon"
+    EXPECT_VALUE: Final[str] = "expect_value"
+    IN_VALUE: Final[str] = "in_value"
+    AFTER_VALUE: Final[str] = "after_value"
+    IN_SCALAR_ROOT: Final[str] = "in_scalar_root"
+    DONE: Final[str] = "done"
+
+
+class IncrementalJSONParser:
+    """
+    Parse a single JSON document fed in arbitrary text chunks.
+
+    When the root value is an array, each element is reported as ``(index, value)`` as
+    soon as it closes; when it is an object, each field is reported as ``(key, value)``.
+    A scalar root is only available once the document is finished.
+
+    Example:
+        >>> parser = IncrementalJSONParser()
+        >>> parser.feed('[{"id": 1}, {"i')
+        [(0, {'id': 1})]
+        >>> parser.feed('d": 2}]')
+        [(1, {'id': 2})]
+        >>> parser.get_result()
+        [{'id': 1}, {'id': 2}]
+    """
+
+    _WHITESPACE: Final[str] = " \t\r\n"
+    _OPEN_ARRAY: Final[str] = "["
+    _CLOSE_ARRAY: Final[str] = "]"
+    _OPEN_OBJECT: Final[str] = "{"
+    _CLOSE_OBJECT: Final[str] = "}"
+    _QUOTE: Final[str] = '"'
+    _COMMA: Final[str] = ","
+    _COLON: Final[str] = ":"
+
+    # Characters that can change nesting or string state inside a member value.
+    _STRUCTURAL_PATTERN: Final["re.Pattern[str]"] = re.compile(r'["\[\]{}]')
+    # Characters that end a bare scalar (number/true/false/null) member.
+    _SCALAR_END_PATTERN: Final["re.Pattern[str]"] = re.compile(r"[,\]}\s]")
+    # Characters that end or escape inside a JSON string.
+    _STRING_SPECIAL_PATTERN: Final["re.Pattern[str]"] = re.compile(r'["\\]')
+
+    def __init__(self) -> None:
+        """Initialize an empty parser."""
+        self._text: str = ""
+        self._consumed: int = 0
+        self._state: str = _ParserState.BEFORE_ROOT
+        self._root_close: Optional[str] = None
+        self._root: Optional[Union[List[Any], Dict[str, Any]]] = None
+        self._scalar_root: Any = None
+        self._current_key: Optional[str] = None
+        # Scan state for the member currently being read (relative to self._text).
+        self._member_start: int = 0
+        self._scan_pos: int = 0
+        self._depth: int = 0
+        self._in_string: bool = False
+
+    def feed(self, chunk: str) -> List[StructuredOutputItem]:
+        """
+        Consume the next text delta.
+
+        Args:
+            chunk: The next piece of the streamed JSON text
+
+        Returns:
+            The top-level members completed by this chunk, in document order
+
+        Raises:
+            StreamingError: If the accumulated text is not a valid JSON document prefix
+        """
+        if not chunk:
+            return []
+        self._text += chunk
+        completed: List[StructuredOutputItem] = []
+        while self._step(completed=completed):
+            pass
+        self._discard_consumed()
+        return completed
+
+    def finish(self) -> Any:
+        """
+        Signal the end of the stream and return the complete document.
+
+        Returns:
+            The parsed JSON document
+
+        Raises:
+            StreamingError: If the document is missing, incomplete or malformed
+        """
+        if self._state == _ParserState.IN_SCALAR_ROOT:
+            self._scalar_root = self._decode(text=self._text[self._member_start :])
+            self._consumed += len(self._text)
+            self._text = ""
+            self._state = _ParserState.DONE
+        if self._state == _ParserState.BEFORE_ROOT:
+            raise StreamingError(
+                message=IncrementalJSONParserErrorMessages.NO_DOCUMENT,
+                stream_position=self._consumed,
+            )
+        if self._state != _ParserState.DONE:
+            raise StreamingError(
+                message=IncrementalJSONParserErrorMessages.INCOMPLETE_DOCUMENT,
+                stream_position=self._consumed + len(self._text),
+            )
+        return self.get_result()
+
+    def is_complete(self) -> bool:
+        """
+        Check whether the root value has been fully parsed.
+
+        Returns:
+            True once the closing bracket of the root container (or the end of a scalar
+            root after :meth:`finish`) has been seen
+        """
+        return self._state == _ParserState.DONE
+
+    def get_result(self) -> Any:
+        """
+        Get the document assembled so far.
+
+        For container roots this is the partially filled list/dict while streaming and the
+        complete value once :meth:`is_complete` is True.
+
+        Returns:
+            The assembled root value, or None if no root value has started yet
+        """
+        if self._root is not None:
+            return self._root
+        return self._scalar_root
+
+    def _step(self, completed: List[StructuredOutputItem]) -> bool:
+        """
+        Advance the state machine by one token or member.
+
+        Args:
+            completed: Output list that receives any member completed by this step
+
+        Returns:
+            True if progress was made and another step may succeed, False if more input
+            is needed
+        """
+        state = self._state
+        if state == _ParserState.IN_VALUE:
+            return self._scan_member(completed=completed)
+        if state == _ParserState.IN_KEY:
+            return self._scan_key()
+        if state == _ParserState.IN_SCALAR_ROOT:
+            return False
+
+        position = self._skip_whitespace(position=self._scan_pos)
+        self._scan_pos = position
+        if position >= len(self._text):
+            return False
+        char = self._text[position]
+
+        if state == _ParserState.BEFORE_ROOT:
+            return self._start_root(char=char, position=position)
+        if state == _ParserState.DONE:
+            raise StreamingError(
+                message=IncrementalJSONParserErrorMessages.TRAILING_DATA,
+                stream_position=self._consumed + position,
+            )
+        if state == _ParserState.EXPECT_KEY:
+            if char == self._QUOTE:
+                self._begin_member(position=position)
+                self._state = _ParserState.IN_KEY
+                return True
+            if char == self._CLOSE_OBJECT and self._root == {}:
+                return self._close_root(position=position)
+        elif state == _ParserState.EXPECT_COLON:
+            if char == self._COLON:
+                self._scan_pos = position + 1
+                self._state = _ParserState.EXPECT_VALUE
+                return True
+        elif state == _ParserState.EXPECT_VALUE:
+            if char == self._root_close and self._root == []:
+                return self._close_root(position=position)
+            if char not in (self._COMMA, self._CLOSE_ARRAY, self._CLOSE_OBJECT, self._COLON):
+                self._begin_member(position=position)
+                self._state = _ParserState.IN_VALUE
+                return True
+        elif state == _ParserState.AFTER_VALUE:
+            if char == self._COMMA:
+                self._scan_pos = position + 1
+                self._state = (
+                    _ParserState.EXPECT_KEY
+                    if self._root_close == self._CLOSE_OBJECT
+                    else _ParserState.EXPECT_VALUE
+                )
+                return True
+            if char == self._root_close:
+                return self._close_root(position=position)
+
+        raise StreamingError(
+            message=IncrementalJSONParserErrorMessages.UNEXPECTED_CHARACTER.format(char=char),
+            stream_position=self._consumed + position,
+        )
+
+    def _start_root(self, char: str, position: int) -> bool:
+        """
+        Begin the root value at ``position``.
+
+        Args:
+            char: The first non-whitespace character of the document
+            position: Its offset in the buffered text
+
+        Returns:
+            True (the root has started)
+        """
+        self._scan_pos = position + 1
+        if char == self._OPEN_ARRAY:
+            self._root = []
+            self._root_close = self._CLOSE_ARRAY
+            self._state = _ParserState.EXPECT_VALUE
+        elif char == self._OPEN_OBJECT:
+            self._root = {}
+            self._root_close = self._CLOSE_OBJECT
+            self._state = _ParserState.EXPECT_KEY
+        else:
+            # Scalars cannot be split into members; decode them in finish().
+            self._member_start = position
+            self._state = _ParserState.IN_SCALAR_ROOT
+        return True
+
+    def _close_root(self, position: int) -> bool:
+        """
+        Mark the root container closed at ``position``.
+
+        Args:
+            position: Offset of the closing bracket in the buffered text
+
+        Returns:
+            True (the state advanced)
+        """
+        self._scan_pos = position + 1
+        self._state = _ParserState.DONE
+        return True
+
+    def _begin_member(self, position: int) -> None:
+        """
+        Start scanning a key or value member at ``position``.
+
+        Args:
+            position: Offset of the member's first character in the buffered text
+        """
+        self._member_start = position
+        self._scan_pos = position
+        self._depth = 0
+        self._in_string = False
+
+    def _scan_key(self) -> bool:
+        """
+        Scan an object key string until its closing quote.
+
+        Returns:
+            True if the key completed, False if more input is needed
+        """
+        end = self._scan_string(start=max(self._scan_pos, self._member_start + 1))
+        if end is None:
+            return False
+        self._current_key = self._decode(text=self._text[self._member_start : end + 1])
+        self._scan_pos = end + 1
+        self._state = _ParserState.EXPECT_COLON
+        return True
+
+    def _scan_member(self, completed: List[StructuredOutputItem]) -> bool:
+        """
+        Scan the current member value until it closes.
+
+        Containers and strings complete at their closing character; numbers and literals
+        complete at the delimiter that follows them.
+
+        Args:
+            completed: Output list that receives the member once it closes
+
+        Returns:
+            True if the member completed, False if more input is needed
+        """
+        text = self._text
+        first = text[self._member_start]
+
+        if first == self._QUOTE:
+            end = self._scan_string(start=max(self._scan_pos, self._member_start + 1))
+            if end is None:
+                return False
+            self._complete_member(end=end + 1, completed=completed)
+            return True
+
+        if first not in (self._OPEN_ARRAY, self._OPEN_OBJECT):
+            match = self._SCALAR_END_PATTERN.search(text, self._scan_pos)
+            if match is None:
+                self._scan_pos = len(text)
+                return False
+            self._complete_member(end=match.start(), completed=completed)
+            return True
+
+        position = self._scan_pos
+        while True:
+            if self._in_string:
+                end = self._scan_string(start=position)
+                if end is None:
+                    return False
+                self._in_string = False
+                position = end + 1
+                continue
+            match = self._STRUCTURAL_PATTERN.search(text, position)
+            if match is None:
+                self._scan_pos = len(text)
+                return False
+            char = match.group()
+            position = match.end()
+            if char == self._QUOTE:
+                self._in_string = True
+            elif char in (self._OPEN_ARRAY, self._OPEN_OBJECT):
+                self._depth += 1
+            else:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._complete_member(end=position, completed=completed)
+                    return True
+
+    def _scan_string(self, start: int) -> Optional[int]:
+        """
+        Find the closing quote of the string whose body continues at ``start``.
+
+        When the string is not closed yet, the resume offset is stored in
+        ``self._scan_pos`` so the next chunk does not rescan the body (and an escape
+        split across chunks is not mistaken for a closing quote).
+
+        Args:
+            start: Offset inside the string body (just after the opening quote at first)
+
+        Returns:
+            Offset of the closing quote, or None if the string is not closed yet
+        """
+        text = self._text
+        position = start
+        while True:
+            match = self._STRING_SPECIAL_PATTERN.search(text, position)
+            if match is None:
+                self._scan_pos = len(text)
+                return None
+            if match.group() == self._QUOTE:
+                return match.start()
+            if match.start() + 1 >= len(text):
+                # Escape character is the last buffered character; resume at it.
+                self._scan_pos = match.start()
+                return None
+            position = match.start() + 2
+
+    def _complete_member(self, end: int, completed: List[StructuredOutputItem]) -> None:
+        """
+        Decode the member ending at ``end`` and attach it to the root.
+
+        Args:
+            end: Offset just past the member's last character
+            completed: Output list that receives the decoded member
+        """
+        value = self._decode(text=self._text[self._member_start : end])
+        if isinstance(self._root, dict):
+            key = self._current_key if self._current_key is not None else ""
+            self._root[key] = value
+            completed.append((key, value))
+            self._current_key = None
+        elif isinstance(self._root, list):
+            completed.append((len(self._root), value))
+            self._root.append(value)
+        self._scan_pos = end
+        self._state = _ParserState.AFTER_VALUE
+
+    def _decode(self, text: str) -> Any:
+        """
+        Decode a complete JSON fragment.
+
+        Args:
+            text: The JSON text of exactly one value
+
+        Returns:
+            The decoded value
+
+        Raises:
+            StreamingError: If the fragment is not valid JSON
+        """
+        try:
+            return json.loads(text)
+        except ValueError as error:
+            raise StreamingError(
+                message=IncrementalJSONParserErrorMessages.INVALID_MEMBER.format(error=error),
+                stream_position=self._consumed + self._member_start,
+            ) from error
+
+    def _skip_whitespace(self, position: int) -> int:
+        """
+        Advance ``position`` past JSON whitespace.
+
+        Args:
+            position: Starting offset in the buffered text
+
+        Returns:
+            Offset of the next non-whitespace character (or the buffer length)
+        """
+        text = self._text
+        length = len(text)
+        while position < length and text[position] in self._WHITESPACE:
+            position += 1
+        return position
+
+    def _discard_consumed(self) -> None:
+        """Drop buffered text that no pending member still needs."""
+        if self._state in (_ParserState.IN_VALUE, _ParserState.IN_KEY):
+            keep_from = self._member_start
+        elif self._state == _ParserState.IN_SCALAR_ROOT:
+            keep_from = self._member_start
+        else:
+            keep_from = self._scan_pos
+        if keep_from == 0:
+            return
+        self._text = self._text[keep_from:]
+        self._consumed += keep_from
+        self._member_start = max(self._member_start - keep_from, 0)
+        self._scan_pos -= keep_from
@@ -7,7 +7,17 @@ import logging
 from datetime import datetime
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
+from ..instrumentation.instrumentation_registry import (
+    instrument_span,
+    is_instrumentation_enabled,
+    record_metric,
+)
 from ..models.access_method import ModelAccessInfo
+from ..models.instrumentation_constants import (
+    InstrumentationAttributes,
+    InstrumentationMetricNames,
+    InstrumentationSpanNames,
+)
 from .streaming_constants import StreamingConstants, StreamingErrorMessages, StreamingLogMessages
 
 
@@ -142,6 +152,11 @@ class RetryingStreamIterator:
             except StopIteration:
                 # Current stream ended normally
                 self._stream_completed = True
+                if is_instrumentation_enabled():
+                    self._record_stream_metric(
+                        name=InstrumentationMetricNames.STREAM_DURATION_MS,
+                        end_time=datetime.now(),
+                    )
                 raise
 
             except Exception as error:
@@ -186,15 +201,22 @@ class RetryingStreamIterator:
             model=model, access_info=access_info, partial_content=self._partial_content
         )
 
-        # Execute streaming operation
-        aws_response = self._operation(region=region, **prepared_args)
+        with instrument_span(
+            name=InstrumentationSpanNames.STREAM_SETUP,
+            attributes={
+                InstrumentationAttributes.MODEL: model,
+                InstrumentationAttributes.REGION: region,
+            },
+        ):
+            # Execute streaming operation
+            aws_response = self._operation(region=region, **prepared_args)
 
-        # Extract and set up EventStream
-        event_stream = aws_response.get(StreamingConstants.FIELD_STREAM)
-        if not event_stream:
-            raise ValueError(StreamingErrorMessages.NO_STREAM_DATA)
+            # Extract and set up EventStream
+            event_stream = aws_response.get(StreamingConstants.FIELD_STREAM)
+            if not event_stream:
+                raise ValueError(StreamingErrorMessages.NO_STREAM_DATA)
 
-        self._current_stream_iterator = iter(event_stream)
+            self._current_stream_iterator = iter(event_stream)
 
         self._logger.debug(f"Started streaming with {model} in {region}")
 
@@ -275,9 +297,31 @@ class RetryingStreamIterator:
                             current_time = datetime.now()
                             if not self._first_content_time:
                                 self._first_content_time = current_time
+                                if is_instrumentation_enabled():
+                                    self._record_stream_metric(
+                                        name=InstrumentationMetricNames.TIME_TO_FIRST_TOKEN_MS,
+                                        end_time=current_time,
+                                    )
                             self._last_content_time = current_time
                 break
 
+    def _record_stream_metric(self, name: str, end_time: datetime) -> None:
+        """
+        Report the time from stream start to end_time as an instrumentation metric.
+
+        Args:
+            name: Metric name
+            end_time: End of the measured interval
+        """
+        record_metric(
+            name=name,
+            value=(end_time - self._start_time).total_seconds() * 1000,
+            attributes={
+                InstrumentationAttributes.MODEL: self._current_model,
+                InstrumentationAttributes.REGION: self._current_region,
+            },
+        )
+
     def _handle_mid_stream_error(self, error: Exception) -> None:
         """
         Handle a mid-stream error by recording it for tracking.
@@ -2,16 +2,58 @@
 Testing utilities module for bedrock package.
 
 This module provides utilities and configurations for integration testing
-with real AWS Bedrock API endpoints.
+with real AWS Bedrock API endpoints, in-memory stubs of the batch inference
+control-plane calls, and an in-process Bedrock runtime stub with a load-test benchmark
+suite for testing and measuring without AWS.
 """
 
 from .aws_test_client import AWSTestClient
+from .batch_inference_stub import StubBedrockBatchClient, StubS3Client, echo_responder
+from .bedrock_runtime_stub import (
+    LatencyDistribution,
+    StubAuthManager,
+    StubBedrockConfig,
+    StubBedrockControlClient,
+    StubBedrockEnvironment,
+    StubBedrockRuntimeClient,
+    StubBedrockService,
+    StubPromptCacheLookup,
+    StubRegionBehavior,
+)
 from .integration_config import IntegrationTestConfig, IntegrationTestError
 from .integration_markers import IntegrationTestMarkers
+from .load_benchmark import (
+    BenchmarkRegression,
+    BenchmarkReport,
+    BenchmarkResult,
+    BenchmarkScenario,
+    BenchmarkWorkload,
+    LoadBenchmark,
+    default_scenarios,
+)
 
 __all__ = [
     "IntegrationTestConfig",
     "IntegrationTestError",
     "IntegrationTestMarkers",
     "AWSTestClient",
+    "StubBedrockBatchClient",
+    "StubS3Client",
+    "echo_responder",
+    "LatencyDistribution",
+    "StubAuthManager",
+    "StubBedrockConfig",
+    "StubBedrockControlClient",
+    "StubBedrockEnvironment",
+    "StubBedrockRuntimeClient",
+    "StubBedrockService",
+    "StubPromptCacheLookup",
+    "StubRegionBehavior",
+    "BenchmarkRegression",
+    "BenchmarkReport",
+    "BenchmarkResult",
+    "BenchmarkScenario",
+    "BenchmarkWorkload",
+    "LoadBenchmark",
+    "default_scenarios",
 ]
@@ -0,0 +1,229 @@
+"""
+In-memory stubs of the S3 and Bedrock control-plane calls used by batch inference.
+
+The stubs implement just enough of ``put_object`` / ``get_object`` / ``head_object`` /
+``list_objects_v2`` and ``create_model_invocation_job`` /
+``get_model_invocation_job`` to run BatchInferenceExecutor end-to-end without AWS:
+a job "runs" after a configurable number of status polls by passing each input
+record's ``modelInput`` to a responder and writing the results where Bedrock would.
+"""
+
+import io
+import json
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set
+
+from botocore.exceptions import ClientError
+
+from ..models.batch_inference_constants import (
+    AnthropicBatchFields,
+    BatchInferenceFields,
+    BatchJobStatus,
+)
+
+
+class _StubBody:
+    """Minimal stand-in for botocore's StreamingBody."""
+
+    def __init__(self, data: bytes) -> None:
+        self._stream = io.BytesIO(data)
+
+    def read(self) -> bytes:
+        """Read the remaining body."""
+        return self._stream.read()
+
+    def iter_lines(self) -> Iterator[bytes]:
+        """Iterate over the body's lines without line terminators."""
+        for line in self._stream:
+            yield line.rstrip(b"\r\n")
+
+
+def echo_responder(model_input: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Default stub responder: answers with the text of the last user message.
+
+    Args:
+        model_input: Anthropic Messages body of the record
+
+    Returns:
+        Anthropic Messages response body
+    """
+    messages = model_input.get(AnthropicBatchFields.MESSAGES) or [{}]
+    texts = [
+        block.get(AnthropicBatchFields.TEXT, "")
+        for block in messages[-1].get(AnthropicBatchFields.CONTENT, [])
+        if block.get(AnthropicBatchFields.TYPE) == AnthropicBatchFields.TEXT
+    ]
+    text = " ".join(texts)
+    return {
+        AnthropicBatchFields.ROLE: "assistant",
+        AnthropicBatchFields.CONTENT: [
+            {AnthropicBatchFields.TYPE: AnthropicBatchFields.TEXT, AnthropicBatchFields.TEXT: text}
+        ],
+        AnthropicBatchFields.STOP_REASON: "end_turn",
+        AnthropicBatchFields.USAGE: {
+            AnthropicBatchFields.INPUT_TOKENS: len(text.split()),
+            AnthropicBatchFields.OUTPUT_TOKENS: len(text.split()),
+        },
+    }
+
+
+class StubS3Client:
+    """In-memory S3 client supporting the calls used by batch inference and media offload."""
+
+    def __init__(self) -> None:
+        """Initialize an empty object store."""
+        self.objects: Dict[str, Dict[str, bytes]] = {}
+        self.put_count = 0
+
+    def put_object(self, Bucket: str, Key: str, Body: Any, **kwargs: Any) -> Dict[str, Any]:
+        """Store an object (extra arguments such as ExpectedBucketOwner are ignored)."""
+        data = Body if isinstance(Body, bytes) else str(Body).encode("utf-8")
+        self.objects.setdefault(Bucket, {})[Key] = data
+        self.put_count += 1
+        return {}
+
+    def head_object(self, Bucket: str, Key: str, **kwargs: Any) -> Dict[str, Any]:
+        """Return object metadata, raising a 404 ClientError if the object does not exist."""
+        if Key not in self.objects.get(Bucket, {}):
+            raise ClientError(
+                error_response={"Error": {"Code": "404", "Message": "Not Found"}},
+                operation_name="HeadObject",
+            )
+        return {"ContentLength": len(self.objects[Bucket][Key])}
+
+    def get_object(self, Bucket: str, Key: str) -> Dict[str, Any]:
+        """Return an object with a streaming-style body."""
+        try:
+            data = self.objects[Bucket][Key]
+        except KeyError:
+            raise KeyError(f"NoSuchKey: s3://{Bucket}/{Key}") from None
+        return {BatchInferenceFields.BODY: _StubBody(data)}
+
+    def list_objects_v2(
+        self,
+        Bucket: str,
+        Prefix: str = "",
+        ContinuationToken: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """List all objects under a prefix in a single page."""
+        keys = sorted(key for key in self.objects.get(Bucket, {}) if key.startswith(Prefix))
+        return {
+            BatchInferenceFields.CONTENTS: [{BatchInferenceFields.KEY: key} for key in keys],
+            BatchInferenceFields.IS_TRUNCATED: False,
+        }
+
+
+class StubBedrockBatchClient:
+    """
+    In-memory Bedrock control-plane client for model invocation jobs.
+
+    Attributes:
+        jobs: Submitted jobs by ARN (request parameters plus ``status`` and ``polls``)
+    """
+
+    def __init__(
+        self,
+        s3_client: StubS3Client,
+        responder: Callable[[Dict[str, Any]], Dict[str, Any]] = echo_responder,
+        polls_until_complete: int = 1,
+        final_status: str = BatchJobStatus.COMPLETED,
+        failing_record_ids: Optional[Set[str]] = None,
+        dropped_record_ids: Optional[Set[str]] = None,
+    ) -> None:
+        """
+        Initialize the stub client.
+
+        Args:
+            s3_client: Stub S3 client holding job input and output
+            responder: Produces a record's ``modelOutput`` from its ``modelInput``;
+                exceptions become error records
+            polls_until_complete: Number of status polls before a job finishes
+            final_status: Status a job finishes with; output is only written for
+                Completed/PartiallyCompleted
+            failing_record_ids: Record IDs written as error records
+            dropped_record_ids: Record IDs omitted from the output
+        """
+        self._s3_client = s3_client
+        self._responder = responder
+        self._polls_until_complete = polls_until_complete
+        self._final_status = final_status
+        self._failing_record_ids = failing_record_ids or set()
+        self._dropped_record_ids = dropped_record_ids or set()
+        self.jobs: Dict[str, Dict[str, Any]] = {}
+
+    def create_model_invocation_job(self, **kwargs: Any) -> Dict[str, Any]:
+        """Register a job and return its ARN."""
+        job_arn = f"arn:aws:bedrock:stub:000000000000:model-invocation-job/job{len(self.jobs):08d}"
+        self.jobs[job_arn] = dict(kwargs, status=BatchJobStatus.SUBMITTED, polls=0)
+        return {BatchInferenceFields.JOB_ARN: job_arn}
+
+    def get_model_invocation_job(self, jobIdentifier: str) -> Dict[str, Any]:
+        """Return a job's status, running it once enough polls have happened."""
+        job = self.jobs[jobIdentifier]
+        job["polls"] += 1
+        if job["status"] not in BatchJobStatus.TERMINAL:
+            if job["polls"] >= self._polls_until_complete:
+                self._run_job(job_arn=jobIdentifier, job=job)
+            else:
+                job["status"] = BatchJobStatus.IN_PROGRESS
+        return {
+            BatchInferenceFields.JOB_ARN: jobIdentifier,
+            BatchInferenceFields.STATUS: job["status"],
+        }
+
+    def _run_job(self, job_arn: str, job: Dict[str, Any]) -> None:
+        """Execute a job's records and write its output file."""
+        job["status"] = self._final_status
+        if self._final_status not in BatchJobStatus.WITH_OUTPUT:
+            return
+
+        input_uri = job[BatchInferenceFields.INPUT_DATA_CONFIG][
+            BatchInferenceFields.S3_INPUT_DATA_CONFIG
+        ][BatchInferenceFields.S3_URI]
+        output_uri = job[BatchInferenceFields.OUTPUT_DATA_CONFIG][
+            BatchInferenceFields.S3_OUTPUT_DATA_CONFIG
+        ][BatchInferenceFields.S3_URI]
+        input_bucket, _, input_key = input_uri[len("s3://") :].partition("/")
+        output_bucket, _, output_prefix = output_uri[len("s3://") :].partition("/")
+
+        body = self._s3_client.get_object(Bucket=input_bucket, Key=input_key)[
+            BatchInferenceFields.BODY
+        ]
+        output_lines: List[str] = []
+        for line in body.iter_lines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            record_id = record[BatchInferenceFields.RECORD_ID]
+            if record_id in self._dropped_record_ids:
+                continue
+            output = self._execute_record(record=record)
+            output_lines.append(json.dumps(output))
+
+        job_id = job_arn.rsplit("/", 1)[-1]
+        # Bedrock names output files after the input file: input.jsonl -> input.jsonl.out
+        file_name = input_key.rsplit("/", 1)[-1] + ".out"
+        output_key = f"{output_prefix.rstrip('/')}/{job_id}/{file_name}".lstrip("/")
+        self._s3_client.put_object(
+            Bucket=output_bucket, Key=output_key, Body=("\n".join(output_lines) + "\n").encode()
+        )
+
+    def _execute_record(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Produce the output record for one input record."""
+        record_id = record[BatchInferenceFields.RECORD_ID]
+        output: Dict[str, Any] = {
+            BatchInferenceFields.RECORD_ID: record_id,
+            BatchInferenceFields.MODEL_INPUT: record[BatchInferenceFields.MODEL_INPUT],
+        }
+        try:
+            if record_id in self._failing_record_ids:
+                raise ValueError("Stub failure")
+            output[BatchInferenceFields.MODEL_OUTPUT] = self._responder(
+                record[BatchInferenceFields.MODEL_INPUT]
+            )
+        except Exception as e:
+            output[BatchInferenceFields.ERROR] = {
+                BatchInferenceFields.ERROR_CODE: 400,
+                BatchInferenceFields.ERROR_MESSAGE: str(e),
+            }
+        return output
@@ -0,0 +1,704 @@
+"""
+In-process stub of the Bedrock runtime and control-plane APIs.
+
+StubBedrockRuntimeClient implements ``converse`` / ``converse_stream`` and
+StubBedrockControlClient implements ``list_foundation_models`` /
+``list_inference_profiles`` with the response shapes the library consumes. Latency is
+drawn from a configurable distribution and throttling, service failures and
+mid-stream interruptions are injected per region at configurable rates, so retry,
+fan-out and streaming behaviour can be exercised and benchmarked without AWS. Prompt
+caching can be simulated per region, so cache point placement shows up in the cache read
+and write token counts of the responses.
+
+StubBedrockEnvironment wires the stubs into LLMManager and ParallelLLMManager:
+
+    >>> with StubBedrockEnvironment(config=StubBedrockConfig(seed=7)) as env:
+    ...     manager = LLMManager(models=[env.model_name], regions=["us-east-1"])
+    ...     response = manager.converse(messages=[...])
+"""
+
+import hashlib
+import json
+import math
+import random
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
+from unittest.mock import patch
+
+from botocore.exceptions import ClientError
+
+from ..auth.auth_manager import AuthManager
+from ..catalog.bedrock_catalog import BedrockModelCatalog
+from ..catalog.transformer import CatalogTransformer
+from ..models.catalog_constants import CatalogAPIResponseFields
+from ..models.catalog_structures import CacheMode
+from ..models.llm_manager_constants import ConverseAPIFields
+from .batch_inference_stub import StubS3Client
+
+# Model IDs listed by the default stub catalog (on-demand in every region)
+DEFAULT_STUB_MODEL_IDS: Tuple[str, ...] = ("anthropic.claude-3-haiku-20240307-v1:0",)
+
+_THROTTLING_CODE = "ThrottlingException"
+_STREAM_ERROR_CODE = "ModelStreamErrorException"
+
+
+@dataclass(frozen=True)
+class LatencyDistribution:
+    """
+    Distribution of simulated latencies in milliseconds.
+
+    Use the ``fixed``, ``uniform`` and ``lognormal`` constructors.
+
+    Attributes:
+        kind: "fixed", "uniform" or "lognormal"
+        value_ms: Fixed value, lower bound (uniform) or median (lognormal)
+        spread: Upper bound in ms (uniform) or sigma of the underlying normal (lognormal)
+    """
+
+    kind: str = "fixed"
+    value_ms: float = 0.0
+    spread: float = 0.0
+
+    def __post_init__(self) -> None:
+        """Validate the distribution parameters."""
+        if self.kind not in ("fixed", "uniform", "lognormal"):
+            raise ValueError(f"Unknown latency distribution kind: {self.kind}")
+        if self.value_ms < 0 or self.spread < 0:
+            raise ValueError("Latency distribution parameters must be non-negative")
+        if self.kind == "uniform" and self.spread < self.value_ms:
+            raise ValueError(
+                f"Uniform upper bound {self.spread} is below lower bound {self.value_ms}"
+            )
+
+    @classmethod
+    def fixed(cls, value_ms: float) -> "LatencyDistribution":
+        """Constant latency."""
+        return cls(kind="fixed", value_ms=value_ms)
+
+    @classmethod
+    def uniform(cls, low_ms: float, high_ms: float) -> "LatencyDistribution":
+        """Latency uniformly distributed between low_ms and high_ms."""
+        return cls(kind="uniform", value_ms=low_ms, spread=high_ms)
+
+    @classmethod
+    def lognormal(cls, median_ms: float, sigma: float = 0.5) -> "LatencyDistribution":
+        """Long-tailed latency with the given median (typical of real API latency)."""
+        return cls(kind="lognormal", value_ms=median_ms, spread=sigma)
+
+    def sample_ms(self, rng: random.Random) -> float:
+        """
+        Draw one latency.
+
+        Args:
+            rng: Random source
+
+        Returns:
+            Latency in milliseconds
+        """
+        if self.kind == "uniform":
+            return rng.uniform(self.value_ms, self.spread)
+        if self.kind == "lognormal" and self.value_ms > 0:
+            return rng.lognormvariate(math.log(self.value_ms), self.spread)
+        return self.value_ms
+
+
+@dataclass
+class StubRegionBehavior:
+    """
+    Simulated behaviour of one region.
+
+    Attributes:
+        latency: Latency of converse calls and of the first stream event
+        throttle_rate: Probability that a runtime call raises ThrottlingException
+        failure_rate: Probability that a runtime call raises ``failure_code``
+        failure_code: Error code of injected failures
+        stream_interruption_rate: Probability that a stream fails after its first chunk
+        control_plane_error: Error code raised by the list APIs in this region
+            (None: they succeed)
+    """
+
+    latency: LatencyDistribution = field(default_factory=LatencyDistribution)
+    throttle_rate: float = 0.0
+    failure_rate: float = 0.0
+    failure_code: str = "ServiceUnavailableException"
+    stream_interruption_rate: float = 0.0
+    control_plane_error: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        """Validate the rates."""
+        for name in ("throttle_rate", "failure_rate", "stream_interruption_rate"):
+            value = getattr(self, name)
+            if not 0.0 <= value <= 1.0:
+                raise ValueError(f"{name} must be between 0.0 and 1.0, got: {value}")
+
+
+@dataclass
+class StubBedrockConfig:
+    """
+    Configuration of the stub Bedrock service.
+
+    Attributes:
+        default_behavior: Behaviour of regions without an entry in region_behaviors
+        region_behaviors: Per-region behaviour overrides
+        model_ids: Model IDs listed by list_foundation_models
+        responder: Produces the response text, or the response content blocks (e.g.
+            toolUse blocks), from the converse request arguments; defaults to echoing the
+            last user message. Responses with a toolUse block stop with "tool_use", and
+            streams only carry the text blocks
+        stream_chunks: Number of contentBlockDelta events per streamed response
+        stream_chunk_latency: Delay between consecutive stream chunks
+        seed: Seed of the random source, for reproducible runs
+        prompt_cache_min_tokens: Simulate prompt caching per region and model: the
+            prefix before each cache point of at least this many whitespace-separated
+            tokens is cached once a request with it succeeds. None disables the
+            simulation and only the last message is counted as input
+    """
+
+    default_behavior: StubRegionBehavior = field(default_factory=StubRegionBehavior)
+    region_behaviors: Dict[str, StubRegionBehavior] = field(default_factory=dict)
+    model_ids: Tuple[str, ...] = DEFAULT_STUB_MODEL_IDS
+    responder: Optional[Callable[[Dict[str, Any]], Union[str, List[Dict[str, Any]]]]] = None
+    stream_chunks: int = 8
+    stream_chunk_latency: LatencyDistribution = field(default_factory=LatencyDistribution)
+    seed: Optional[int] = None
+    prompt_cache_min_tokens: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        """Validate the configuration."""
+        if not self.model_ids:
+            raise ValueError("model_ids must not be empty")
+        if self.stream_chunks <= 0:
+            raise ValueError(f"stream_chunks must be positive, got: {self.stream_chunks}")
+        if self.prompt_cache_min_tokens is not None and self.prompt_cache_min_tokens < 0:
+            raise ValueError(
+                f"prompt_cache_min_tokens must be non-negative, got: {self.prompt_cache_min_tokens}"
+            )
+
+    def behavior_for(self, region: str) -> StubRegionBehavior:
+        """Get the behaviour of a region."""
+        return self.region_behaviors.get(region, self.default_behavior)
+
+
+def echo_text_responder(request: Dict[str, Any]) -> str:
+    """
+    Default converse responder: the text of the last message, or "ok".
+
+    Args:
+        request: Keyword arguments of the converse call
+
+    Returns:
+        Response text
+    """
+    messages = request.get(ConverseAPIFields.MESSAGES) or [{}]
+    texts = [
+        block[ConverseAPIFields.TEXT]
+        for block in messages[-1].get(ConverseAPIFields.CONTENT, [])
+        if isinstance(block, dict) and ConverseAPIFields.TEXT in block
+    ]
+    return " ".join(texts) or "ok"
+
+
+@dataclass(frozen=True)
+class StubPromptCacheLookup:
+    """
+    Token accounting of one request against the simulated prompt cache.
+
+    Attributes:
+        input_tokens: Tokens neither read from nor written to the cache
+        cache_read_tokens: Tokens of the longest cached prefix
+        cache_write_tokens: Tokens written from the end of that prefix to the last
+            cache point
+        new_keys: Prefixes cached once the request succeeds
+    """
+
+    input_tokens: int
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+    new_keys: Tuple[str, ...] = ()
+
+
+def _prompt_blocks(request: Dict[str, Any]) -> Iterator[Any]:
+    """Yield the blocks of a request in prompt-cache order: tools, system, messages."""
+    tool_config = request.get(ConverseAPIFields.TOOL_CONFIG) or {}
+    yield from tool_config.get(ConverseAPIFields.TOOLS) or []
+    yield from request.get(ConverseAPIFields.SYSTEM) or []
+    for message in request.get(ConverseAPIFields.MESSAGES) or []:
+        yield {ConverseAPIFields.ROLE: message.get(ConverseAPIFields.ROLE)}
+        yield from message.get(ConverseAPIFields.CONTENT) or []
+
+
+def _block_tokens(block: Any) -> int:
+    """Count the whitespace-separated tokens of a block."""
+    if isinstance(block, dict) and ConverseAPIFields.ROLE in block:
+        return 0
+    if isinstance(block, dict) and ConverseAPIFields.TEXT in block:
+        return len(str(block[ConverseAPIFields.TEXT]).split())
+    return len(json.dumps(block, sort_keys=True, default=str).split())
+
+
+class StubBedrockService:
+    """
+    Shared state of the stub service: configuration, random source and call counts.
+
+    Thread-safe. Call counts are keyed by ``(operation, region, outcome)`` where outcome
+    is "success" or the injected error code.
+    """
+
+    def __init__(
+        self,
+        config: Optional[StubBedrockConfig] = None,
+        sleep_func: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """
+        Initialize the service.
+
+        Args:
+            config: Stub configuration; defaults to zero latency and no failures
+            sleep_func: Used to simulate latency (inject a no-op for instant tests)
+        """
+        self.config = config or StubBedrockConfig()
+        self._sleep = sleep_func
+        self._rng = random.Random(self.config.seed)  # noqa: S311 - simulation, not crypto
+        self._lock = threading.Lock()
+        self.call_counts: Counter = Counter()
+        # In-memory S3 shared by every region, e.g. for offloaded media payloads
+        self.s3 = StubS3Client()
+        # Cached prompt prefixes per region, keyed by a hash of model and prefix
+        self._prompt_caches: Dict[str, Set[str]] = {}
+
+    def _random(self) -> float:
+        """Draw a uniform random number under the lock (Random is not thread-safe)."""
+        with self._lock:
+            return self._rng.random()
+
+    def _simulate_latency(self, latency: LatencyDistribution) -> None:
+        """Sleep for a latency drawn from the distribution."""
+        with self._lock:
+            delay_ms = latency.sample_ms(rng=self._rng)
+        if delay_ms > 0:
+            self._sleep(delay_ms / 1000.0)
+
+    def count_call(self, operation: str, region: str, outcome: str) -> None:
+        """Record a call outcome."""
+        with self._lock:
+            self.call_counts[(operation, region, outcome)] += 1
+
+    def begin_call(self, operation: str, region: str) -> StubRegionBehavior:
+        """
+        Simulate the start of a runtime call: latency, then injected errors.
+
+        Args:
+            operation: API operation name
+            region: Region of the client
+
+        Returns:
+            The region's behaviour
+
+        Raises:
+            ClientError: If throttling or a failure is injected
+        """
+        behavior = self.config.behavior_for(region=region)
+        self._simulate_latency(latency=behavior.latency)
+        draw = self._random()
+        if draw < behavior.throttle_rate:
+            self.raise_error(operation=operation, region=region, code=_THROTTLING_CODE)
+        if draw < behavior.throttle_rate + behavior.failure_rate:
+            self.raise_error(operation=operation, region=region, code=behavior.failure_code)
+        self.count_call(operation=operation, region=region, outcome="success")
+        return behavior
+
+    def raise_error(self, operation: str, region: str, code: str) -> None:
+        """
+        Count and raise an injected error.
+
+        Raises:
+            ClientError: Always, with the given error code
+        """
+        self.count_call(operation=operation, region=region, outcome=code)
+        raise ClientError(
+            error_response={"Error": {"Code": code, "Message": f"Stub {code} in {region}"}},
+            operation_name=operation,
+        )
+
+    def respond(self, request: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Produce the response content blocks for a converse request."""
+        responder = self.config.responder or echo_text_responder
+        reply = responder(request)
+        if isinstance(reply, str):
+            return [{ConverseAPIFields.TEXT: reply}]
+        return reply
+
+    def lookup_prompt_cache(
+        self, region: str, request: Dict[str, Any]
+    ) -> Optional[StubPromptCacheLookup]:
+        """
+        Account a request's prompt against the simulated cache of a region.
+
+        Call before the request's latency: prefixes are only cached once a request
+        completes, so concurrent requests with the same prefix all write it.
+
+        Args:
+            region: Region of the client
+            request: Keyword arguments of the converse call
+
+        Returns:
+            Token accounting, or None if prompt caching is not simulated
+        """
+        min_tokens = self.config.prompt_cache_min_tokens
+        if min_tokens is None:
+            return None
+
+        digest = hashlib.sha256(str(request.get(ConverseAPIFields.MODEL_ID)).encode())
+        tokens = 0
+        checkpoints: List[Tuple[str, int]] = []
+        for block in _prompt_blocks(request=request):
+            if isinstance(block, dict) and ConverseAPIFields.CACHE_POINT in block:
+                if tokens >= min_tokens:
+                    checkpoints.append((digest.hexdigest(), tokens))
+                continue
+            digest.update(json.dumps(block, sort_keys=True, default=str).encode())
+            tokens += _block_tokens(block=block)
+
+        with self._lock:
+            cached = self._prompt_caches.get(region, set())
+            read = max((length for key, length in checkpoints if key in cached), default=0)
+            new_keys = tuple(key for key, _ in checkpoints if key not in cached)
+        write = checkpoints[-1][1] - read if new_keys else 0
+        return StubPromptCacheLookup(
+            input_tokens=tokens - read - write,
+            cache_read_tokens=read,
+            cache_write_tokens=write,
+            new_keys=new_keys,
+        )
+
+    def store_prompt_cache(self, region: str, lookup: Optional[StubPromptCacheLookup]) -> None:
+        """Cache the new prefixes of a completed request."""
+        if lookup is None or not lookup.new_keys:
+            return
+        with self._lock:
+            self._prompt_caches.setdefault(region, set()).update(lookup.new_keys)
+
+    def should_interrupt_stream(self, behavior: StubRegionBehavior) -> bool:
+        """Decide whether a stream fails after its first chunk."""
+        return self._random() < behavior.stream_interruption_rate
+
+    def chunk_delay(self) -> None:
+        """Sleep between two stream chunks."""
+        self._simulate_latency(latency=self.config.stream_chunk_latency)
+
+    def get_call_count(
+        self,
+        operation: Optional[str] = None,
+        region: Optional[str] = None,
+        outcome: Optional[str] = None,
+    ) -> int:
+        """
+        Count recorded calls matching the given filters.
+
+        Args:
+            operation: Only count this operation (e.g. "Converse")
+            region: Only count this region
+            outcome: Only count this outcome ("success" or an error code)
+
+        Returns:
+            Number of matching calls
+        """
+        with self._lock:
+            return sum(
+                count
+                for (op, reg, out), count in self.call_counts.items()
+                if (operation is None or op == operation)
+                and (region is None or reg == region)
+                and (outcome is None or out == outcome)
+            )
+
+
+def _content_text(content: List[Dict[str, Any]], text_only: bool = False) -> str:
+    """Join the text of content blocks; other blocks count as their JSON form."""
+    parts = []
+    for block in content:
+        if ConverseAPIFields.TEXT in block:
+            parts.append(str(block[ConverseAPIFields.TEXT]))
+        elif not text_only:
+            parts.append(json.dumps(block, sort_keys=True, default=str))
+    return " ".join(parts)
+
+
+def _stop_reason(content: List[Dict[str, Any]]) -> str:
+    """Stop reason of a response with the given content blocks."""
+    if any(ConverseAPIFields.TOOL_USE in block for block in content):
+        return ConverseAPIFields.STOP_REASON_TOOL_USE
+    return ConverseAPIFields.STOP_REASON_END_TURN
+
+
+def _usage(
+    input_text: str, output_text: str, cache: Optional[StubPromptCacheLookup] = None
+) -> Dict[str, int]:
+    """Build a usage block from whitespace token counts and the prompt-cache lookup."""
+    output_tokens = len(output_text.split())
+    if cache is None:
+        input_tokens = len(input_text.split())
+        return {
+            ConverseAPIFields.INPUT_TOKENS: input_tokens,
+            ConverseAPIFields.OUTPUT_TOKENS: output_tokens,
+            ConverseAPIFields.TOTAL_TOKENS: input_tokens + output_tokens,
+        }
+    return {
+        ConverseAPIFields.INPUT_TOKENS: cache.input_tokens,
+        ConverseAPIFields.OUTPUT_TOKENS: output_tokens,
+        ConverseAPIFields.TOTAL_TOKENS: cache.input_tokens
+        + cache.cache_read_tokens
+        + cache.cache_write_tokens
+        + output_tokens,
+        ConverseAPIFields.CACHE_READ_INPUT_TOKENS_COUNT: cache.cache_read_tokens,
+        ConverseAPIFields.CACHE_WRITE_INPUT_TOKENS_COUNT: cache.cache_write_tokens,
+    }
+
+
+class StubBedrockRuntimeClient:
+    """Stub bedrock-runtime client for one region."""
+
+    def __init__(self, service: StubBedrockService, region: str) -> None:
+        """
+        Initialize the client.
+
+        Args:
+            service: Shared stub service
+            region: Region of the client
+        """
+        self._service = service
+        self.region = region
+
+    def converse(self, **kwargs: Any) -> Dict[str, Any]:
+        """Simulate a Converse call."""
+        start = time.perf_counter()
+        cache = self._service.lookup_prompt_cache(region=self.region, request=kwargs)
+        self._service.begin_call(operation="Converse", region=self.region)
+        content = self._service.respond(request=kwargs)
+        self._service.store_prompt_cache(region=self.region, lookup=cache)
+        return {
+            ConverseAPIFields.OUTPUT: {
+                ConverseAPIFields.MESSAGE: {
+                    ConverseAPIFields.ROLE: ConverseAPIFields.ROLE_ASSISTANT,
+                    ConverseAPIFields.CONTENT: content,
+                }
+            },
+            ConverseAPIFields.STOP_REASON: _stop_reason(content=content),
+            ConverseAPIFields.USAGE: _usage(
+                input_text=echo_text_responder(request=kwargs),
+                output_text=_content_text(content=content),
+                cache=cache,
+            ),
+            ConverseAPIFields.METRICS: {
+                ConverseAPIFields.LATENCY_MS: int((time.perf_counter() - start) * 1000)
+            },
+        }
+
+    def converse_stream(self, **kwargs: Any) -> Dict[str, Any]:
+        """Simulate a ConverseStream call; events are produced lazily while iterating."""
+        cache = self._service.lookup_prompt_cache(region=self.region, request=kwargs)
+        behavior = self._service.begin_call(operation="ConverseStream", region=self.region)
+        text = _content_text(content=self._service.respond(request=kwargs), text_only=True)
+        interrupt = self._service.should_interrupt_stream(behavior=behavior)
+        self._service.store_prompt_cache(region=self.region, lookup=cache)
+        return {
+            ConverseAPIFields.STREAM: self._events(
+                text=text,
+                input_text=echo_text_responder(request=kwargs),
+                interrupt=interrupt,
+                cache=cache,
+            )
+        }
+
+    def _events(
+        self,
+        text: str,
+        input_text: str,
+        interrupt: bool,
+        cache: Optional[StubPromptCacheLookup] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Generate the ConverseStream event sequence for a response text."""
+        start = time.perf_counter()
+        yield {ConverseAPIFields.MESSAGE_START: {ConverseAPIFields.ROLE: "assistant"}}
+        for index, chunk in enumerate(
+            _split_chunks(text=text, count=self._service.config.stream_chunks)
+        ):
+            if index > 0:
+                self._service.chunk_delay()
+                if interrupt:
+                    self._service.raise_error(
+                        operation="ConverseStream", region=self.region, code=_STREAM_ERROR_CODE
+                    )
+            yield {
+                ConverseAPIFields.CONTENT_BLOCK_DELTA: {
+                    ConverseAPIFields.DELTA: {ConverseAPIFields.TEXT: chunk},
+                    ConverseAPIFields.CONTENT_BLOCK_INDEX: 0,
+                }
+            }
+        yield {ConverseAPIFields.CONTENT_BLOCK_STOP: {ConverseAPIFields.CONTENT_BLOCK_INDEX: 0}}
+        yield {
+            ConverseAPIFields.MESSAGE_STOP: {
+                ConverseAPIFields.STOP_REASON: ConverseAPIFields.STOP_REASON_END_TURN
+            }
+        }
+        yield {
+            ConverseAPIFields.METADATA: {
+                ConverseAPIFields.USAGE: _usage(
+                    input_text=input_text, output_text=text, cache=cache
+                ),
+                ConverseAPIFields.METRICS: {
+                    ConverseAPIFields.LATENCY_MS: int((time.perf_counter() - start) * 1000)
+                },
+            }
+        }
+
+
+def _split_chunks(text: str, count: int) -> List[str]:
+    """Split text into at most ``count`` non-empty chunks that concatenate to the text."""
+    size = max(1, math.ceil(len(text) / count))
+    return [text[i : i + size] for i in range(0, len(text), size)] or [""]
+
+
+class StubBedrockControlClient:
+    """Stub bedrock control-plane client for one region."""
+
+    def __init__(self, service: StubBedrockService, region: str) -> None:
+        """
+        Initialize the client.
+
+        Args:
+            service: Shared stub service
+            region: Region of the client
+        """
+        self._service = service
+        self.region = region
+
+    def _check_available(self, operation: str) -> None:
+        """Raise the region's configured control-plane error, if any."""
+        error_code = self._service.config.behavior_for(region=self.region).control_plane_error
+        if error_code is not None:
+            self._service.raise_error(operation=operation, region=self.region, code=error_code)
+        self._service.count_call(operation=operation, region=self.region, outcome="success")
+
+    def list_foundation_models(self, **kwargs: Any) -> Dict[str, Any]:
+        """List the configured models as on-demand text models."""
+        self._check_available(operation="ListFoundationModels")
+        return {
+            CatalogAPIResponseFields.MODEL_SUMMARIES: [
+                {
+                    CatalogAPIResponseFields.MODEL_ID: model_id,
+                    CatalogAPIResponseFields.MODEL_ARN: (
+                        f"arn:aws:bedrock:{self.region}::foundation-model/{model_id}"
+                    ),
+                    CatalogAPIResponseFields.MODEL_NAME: model_id,
+                    CatalogAPIResponseFields.PROVIDER_NAME: model_id.split(".", 1)[0].title(),
+                    CatalogAPIResponseFields.INPUT_MODALITIES: ["TEXT"],
+                    CatalogAPIResponseFields.OUTPUT_MODALITIES: ["TEXT"],
+                    CatalogAPIResponseFields.RESPONSE_STREAMING_SUPPORTED: True,
+                    CatalogAPIResponseFields.INFERENCE_TYPES_SUPPORTED: ["ON_DEMAND"],
+                }
+                for model_id in self._service.config.model_ids
+            ]
+        }
+
+    def list_inference_profiles(self, **kwargs: Any) -> Dict[str, Any]:
+        """List no inference profiles; stub models are reached by direct access."""
+        self._check_available(operation="ListInferenceProfiles")
+        return {CatalogAPIResponseFields.INFERENCE_PROFILE_SUMMARIES: []}
+
+
+class StubAuthManager(AuthManager):
+    """AuthManager that hands out stub clients instead of boto3 clients."""
+
+    def __init__(self, service: StubBedrockService, *args: Any, **kwargs: Any) -> None:
+        """
+        Initialize the manager.
+
+        Args:
+            service: Shared stub service
+            *args: Passed to AuthManager
+            **kwargs: Passed to AuthManager
+        """
+        super().__init__(*args, **kwargs)
+        self._service = service
+
+    def get_bedrock_client(self, region: str) -> Any:
+        """Get a stub bedrock-runtime client for the region."""
+        return StubBedrockRuntimeClient(service=self._service, region=region)
+
+    def get_bedrock_control_client(self, region: str) -> Any:
+        """Get a stub bedrock control-plane client for the region."""
+        return StubBedrockControlClient(service=self._service, region=region)
+
+    def get_s3_client(self, region: str) -> Any:
+        """Get the service's in-memory S3 client."""
+        return self._service.s3
+
+
+class StubBedrockEnvironment:
+    """
+    Context manager that routes LLMManager and ParallelLLMManager to the stub service.
+
+    While active, managers created in the block get a StubAuthManager instead of an
+    AuthManager, and their model catalog is built from the stub's list APIs with
+    caching disabled, so the real catalog cache is neither read nor overwritten.
+
+    Attributes:
+        service: The shared stub service (configuration and call counts)
+    """
+
+    _AUTH_PATCH_TARGETS: Tuple[str, ...] = (
+        "bestehorn_llmmanager.llm_manager.AuthManager",
+        "bestehorn_llmmanager.parallel_llm_manager.AuthManager",
+    )
+    _CATALOG_PATCH_TARGET: str = "bestehorn_llmmanager.llm_manager.BedrockModelCatalog"
+
+    def __init__(
+        self,
+        config: Optional[StubBedrockConfig] = None,
+        sleep_func: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """
+        Initialize the environment.
+
+        Args:
+            config: Stub configuration
+            sleep_func: Used to simulate latency
+        """
+        self.service = StubBedrockService(config=config, sleep_func=sleep_func)
+        self._patchers: List[Any] = []
+
+    @property
+    def model_name(self) -> str:
+        """Catalog name of the first stub model, to pass to LLMManager."""
+        return CatalogTransformer()._extract_model_name(model_id=self.service.config.model_ids[0])
+
+    def create_auth_manager(self, *args: Any, **kwargs: Any) -> StubAuthManager:
+        """Create a StubAuthManager bound to this environment's service."""
+        return StubAuthManager(self.service, *args, **kwargs)
+
+    @staticmethod
+    def create_catalog(*args: Any, **kwargs: Any) -> BedrockModelCatalog:
+        """Create a BedrockModelCatalog that always fetches and never caches."""
+        kwargs.update(cache_mode=CacheMode.NONE, fallback_to_bundled=False)
+        return BedrockModelCatalog(*args, **kwargs)
+
+    def __enter__(self) -> "StubBedrockEnvironment":
+        """Install the patches."""
+        targets: List[Tuple[str, Callable[..., Any]]] = [
+            (target, self.create_auth_manager) for target in self._AUTH_PATCH_TARGETS
+        ]
+        targets.append((self._CATALOG_PATCH_TARGET, self.create_catalog))
+        for target, factory in targets:
+            patcher = patch(target, new=factory)
+            patcher.start()
+            self._patchers.append(patcher)
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Remove the patches."""
+        while self._patchers:
+            self._patchers.pop().stop()
@@ -0,0 +1,493 @@
+"""
+Reproducible load-test benchmarks against the in-process Bedrock stub.
+
+LoadBenchmark runs LLMManager.converse, ParallelLLMManager.converse_parallel and
+LLMManager.converse_stream workloads at configurable concurrency inside a
+StubBedrockEnvironment and measures throughput, p50/p99 latency, peak thread count
+and peak traced memory. Reports are stored as JSON and compared between releases:
+
+    >>> report = LoadBenchmark(config=StubBedrockConfig(seed=1)).run(
+    ...     scenarios=default_scenarios()
+    ... )
+    >>> report.save(path=Path("benchmarks/current.json"))
+    >>> regressions = report.compare(baseline=BenchmarkReport.load(path=baseline_path))
+"""
+
+import json
+import math
+import platform
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ..models.llm_manager_structures import RetryConfig
+from ..models.parallel_structures import BedrockConverseRequest, ParallelProcessingConfig
+from .bedrock_runtime_stub import StubBedrockConfig, StubBedrockEnvironment
+
+
+class BenchmarkWorkload:
+    """Workloads a benchmark scenario can run."""
+
+    CONVERSE = "converse"
+    PARALLEL = "parallel"
+    STREAM = "stream"
+
+    ALL: Tuple[str, ...] = (CONVERSE, PARALLEL, STREAM)
+
+
+# Metrics compared by BenchmarkReport.compare: name -> True if higher is better
+COMPARED_METRICS: Dict[str, bool] = {
+    "throughput_rps": True,
+    "latency_p50_ms": False,
+    "latency_p99_ms": False,
+    "peak_thread_count": False,
+    "peak_memory_bytes": False,
+}
+
+
+@dataclass
+class BenchmarkScenario:
+    """
+    One benchmark run.
+
+    Attributes:
+        name: Unique scenario name, used to match results between reports
+        workload: One of BenchmarkWorkload.ALL
+        concurrency: Number of requests in flight at once
+        requests: Total number of requests
+        prompt: User message sent with every request
+    """
+
+    name: str
+    workload: str
+    concurrency: int
+    requests: int
+    prompt: str = "Summarize the benchmark results."
+
+    def __post_init__(self) -> None:
+        """Validate the scenario."""
+        if self.workload not in BenchmarkWorkload.ALL:
+            raise ValueError(f"Unknown workload: {self.workload}")
+        if self.concurrency <= 0:
+            raise ValueError(f"concurrency must be positive, got: {self.concurrency}")
+        if self.requests <= 0:
+            raise ValueError(f"requests must be positive, got: {self.requests}")
+
+
+@dataclass
+class BenchmarkResult:
+    """
+    Measurements of one scenario.
+
+    Attributes:
+        scenario: Scenario name
+        workload: Workload that was run
+        concurrency: Requests in flight at once
+        requests: Requests issued
+        succeeded: Requests that returned a successful response
+        duration_seconds: Wall-clock time of the run
+        throughput_rps: Successful requests per second
+        latency_p50_ms: Median request latency
+        latency_p99_ms: 99th percentile request latency
+        peak_thread_count: Highest number of live threads observed
+        peak_memory_bytes: Peak traced memory (0 when memory tracking is off)
+        time_to_first_token_p50_ms: Median time to first streamed token (stream only)
+    """
+
+    scenario: str
+    workload: str
+    concurrency: int
+    requests: int
+    succeeded: int
+    duration_seconds: float
+    throughput_rps: float
+    latency_p50_ms: float
+    latency_p99_ms: float
+    peak_thread_count: int
+    peak_memory_bytes: int
+    time_to_first_token_p50_ms: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BenchmarkResult":
+        """Create from a dictionary produced by to_dict."""
+        return cls(**data)
+
+
+@dataclass
+class BenchmarkRegression:
+    """
+    A metric that got worse than its baseline by more than the tolerance.
+
+    Attributes:
+        scenario: Scenario name
+        metric: Metric name
+        baseline: Baseline value
+        current: Current value
+        relative_change: (current - baseline) / baseline
+    """
+
+    scenario: str
+    metric: str
+    baseline: float
+    current: float
+    relative_change: float
+
+
+@dataclass
+class BenchmarkReport:
+    """
+    Results of a benchmark run plus the environment they were measured in.
+
+    Attributes:
+        results: One result per scenario
+        package_version: Version of bestehorn_llmmanager
+        python_version: Python version
+        created_at: ISO timestamp of the run
+    """
+
+    results: List[BenchmarkResult]
+    package_version: str = ""
+    python_version: str = field(default_factory=platform.python_version)
+    created_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            "package_version": self.package_version,
+            "python_version": self.python_version,
+            "created_at": self.created_at,
+            "results": [result.to_dict() for result in self.results],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BenchmarkReport":
+        """Create from a dictionary produced by to_dict."""
+        return cls(
+            results=[BenchmarkResult.from_dict(data=item) for item in data["results"]],
+            package_version=data.get("package_version", ""),
+            python_version=data.get("python_version", ""),
+            created_at=data.get("created_at", ""),
+        )
+
+    def save(self, path: Path) -> None:
+        """
+        Write the report as JSON, creating parent directories.
+
+        Args:
+            path: Output file
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: Path) -> "BenchmarkReport":
+        """
+        Read a report written by save.
+
+        Args:
+            path: Report file
+
+        Returns:
+            The report
+        """
+        return cls.from_dict(data=json.loads(path.read_text(encoding="utf-8")))
+
+    def compare(
+        self, baseline: "BenchmarkReport", tolerance: float = 0.1
+    ) -> List[BenchmarkRegression]:
+        """
+        Find metrics that regressed against a baseline report.
+
+        Scenarios are matched by name; scenarios missing from either report are
+        skipped. A metric regresses when it is worse than the baseline by more than
+        ``tolerance`` (relative), e.g. 10% lower throughput or 10% higher p99.
+
+        Args:
+            baseline: Report to compare against
+            tolerance: Allowed relative degradation
+
+        Returns:
+            Regressions, in scenario order
+
+        Raises:
+            ValueError: If tolerance is negative
+        """
+        if tolerance < 0:
+            raise ValueError(f"tolerance must be non-negative, got: {tolerance}")
+
+        baseline_results = {result.scenario: result for result in baseline.results}
+        regressions: List[BenchmarkRegression] = []
+        for result in self.results:
+            previous = baseline_results.get(result.scenario)
+            if previous is None:
+                continue
+            for metric, higher_is_better in COMPARED_METRICS.items():
+                old = float(getattr(previous, metric))
+                new = float(getattr(result, metric))
+                if old <= 0:
+                    continue
+                change = (new - old) / old
+                if (-change if higher_is_better else change) > tolerance:
+                    regressions.append(
+                        BenchmarkRegression(
+                            scenario=result.scenario,
+                            metric=metric,
+                            baseline=old,
+                            current=new,
+                            relative_change=change,
+                        )
+                    )
+        return regressions
+
+
+def percentile(values: Sequence[float], fraction: float) -> float:
+    """
+    Nearest-rank percentile.
+
+    Args:
+        values: Observations
+        fraction: Percentile as a fraction in [0, 1] (0.99 for p99)
+
+    Returns:
+        The percentile, or 0.0 for no observations
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def default_scenarios(
+    concurrency_levels: Iterable[int] = (1, 8, 32),
+    requests: int = 200,
+    workloads: Iterable[str] = BenchmarkWorkload.ALL,
+) -> List[BenchmarkScenario]:
+    """
+    Build the standard scenario matrix: every workload at every concurrency level.
+
+    Args:
+        concurrency_levels: Concurrency levels to measure
+        requests: Requests per scenario
+        workloads: Workloads to include
+
+    Returns:
+        Scenarios named ``<workload>-c<concurrency>``
+    """
+    return [
+        BenchmarkScenario(
+            name=f"{workload}-c{concurrency}",
+            workload=workload,
+            concurrency=concurrency,
+            requests=requests,
+        )
+        for workload in workloads
+        for concurrency in concurrency_levels
+    ]
+
+
+class _ThreadCountSampler:
+    """Background sampler of the peak live-thread count."""
+
+    def __init__(self, interval_seconds: float = 0.005) -> None:
+        self._interval = interval_seconds
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self.peak = threading.active_count()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            self.peak = max(self.peak, threading.active_count())
+
+    def __enter__(self) -> "_ThreadCountSampler":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, threading.active_count())
+
+
+class LoadBenchmark:
+    """
+    Runs benchmark scenarios against the Bedrock stub.
+
+    Each scenario gets fresh managers inside its own StubBedrockEnvironment seeded
+    from the configuration, so results depend only on the code under test, the
+    stub configuration and the machine.
+    """
+
+    def __init__(
+        self,
+        config: Optional[StubBedrockConfig] = None,
+        regions: Optional[List[str]] = None,
+        retry_config: Optional[RetryConfig] = None,
+        track_memory: bool = True,
+        sleep_func: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """
+        Initialize the benchmark.
+
+        Args:
+            config: Stub configuration (latency, throttling, failures)
+            regions: Regions passed to the managers
+            retry_config: Retry configuration of the managers; defaults to a short
+                retry delay so injected throttling does not dominate the run
+            track_memory: Measure peak memory with tracemalloc (slows execution)
+            sleep_func: Used by the stub to simulate latency
+        """
+        self._config = config or StubBedrockConfig()
+        self._regions = regions or ["us-east-1", "us-west-2", "eu-west-1"]
+        self._retry_config = retry_config or RetryConfig(retry_delay=0.01, max_retry_delay=0.1)
+        self._track_memory = track_memory
+        self._sleep_func = sleep_func
+
+    def run(self, scenarios: Iterable[BenchmarkScenario]) -> BenchmarkReport:
+        """
+        Run scenarios in order.
+
+        Args:
+            scenarios: Scenarios to run
+
+        Returns:
+            Report with one result per scenario
+        """
+        from ... import __version__
+
+        results = [self.run_scenario(scenario=scenario) for scenario in scenarios]
+        return BenchmarkReport(results=results, package_version=__version__)
+
+    def run_scenario(self, scenario: BenchmarkScenario) -> BenchmarkResult:
+        """
+        Run one scenario.
+
+        Args:
+            scenario: Scenario to run
+
+        Returns:
+            Its measurements
+        """
+        runners = {
+            BenchmarkWorkload.CONVERSE: self._run_converse,
+            BenchmarkWorkload.PARALLEL: self._run_parallel,
+            BenchmarkWorkload.STREAM: self._run_stream,
+        }
+        with StubBedrockEnvironment(config=self._config, sleep_func=self._sleep_func) as env:
+            # Manager construction (catalog fetch) is excluded from the measurements
+            manager = self._create_manager(env=env, scenario=scenario)
+            if self._track_memory:
+                tracemalloc.start()
+            try:
+                with _ThreadCountSampler() as sampler:
+                    start = time.perf_counter()
+                    outcomes = runners[scenario.workload](manager=manager, scenario=scenario)
+                    duration = time.perf_counter() - start
+                peak_memory = tracemalloc.get_traced_memory()[1] if self._track_memory else 0
+            finally:
+                if self._track_memory:
+                    tracemalloc.stop()
+
+        latencies = [latency for success, latency, _ in outcomes if success]
+        first_tokens = [ttft for success, _, ttft in outcomes if success and ttft is not None]
+        return BenchmarkResult(
+            scenario=scenario.name,
+            workload=scenario.workload,
+            concurrency=scenario.concurrency,
+            requests=scenario.requests,
+            succeeded=len(latencies),
+            duration_seconds=duration,
+            throughput_rps=len(latencies) / duration if duration > 0 else 0.0,
+            latency_p50_ms=percentile(values=latencies, fraction=0.5),
+            latency_p99_ms=percentile(values=latencies, fraction=0.99),
+            peak_thread_count=sampler.peak,
+            peak_memory_bytes=peak_memory,
+            time_to_first_token_p50_ms=(
+                percentile(values=first_tokens, fraction=0.5) if first_tokens else None
+            ),
+        )
+
+    def _create_manager(self, env: StubBedrockEnvironment, scenario: BenchmarkScenario) -> Any:
+        """Create the manager a scenario's workload runs against."""
+        from ...llm_manager import LLMManager
+        from ...parallel_llm_manager import ParallelLLMManager
+
+        if scenario.workload == BenchmarkWorkload.PARALLEL:
+            return ParallelLLMManager(
+                models=[env.model_name],
+                regions=self._regions,
+                retry_config=self._retry_config,
+                parallel_config=ParallelProcessingConfig(
+                    max_concurrent_requests=scenario.concurrency
+                ),
+            )
+        return LLMManager(
+            models=[env.model_name], regions=self._regions, retry_config=self._retry_config
+        )
+
+    def _messages(self, scenario: BenchmarkScenario) -> List[Dict[str, Any]]:
+        """Build the message list sent by every request."""
+        return [{"role": "user", "content": [{"text": scenario.prompt}]}]
+
+    def _run_converse(
+        self, manager: Any, scenario: BenchmarkScenario
+    ) -> List[Tuple[bool, float, Optional[float]]]:
+        """Issue converse calls from a pool of ``concurrency`` threads."""
+        messages = self._messages(scenario=scenario)
+
+        def call(_: int) -> Tuple[bool, float, Optional[float]]:
+            start = time.perf_counter()
+            try:
+                success = manager.converse(messages=messages).success
+            except Exception:
+                success = False
+            return success, (time.perf_counter() - start) * 1000, None
+
+        with ThreadPoolExecutor(max_workers=scenario.concurrency) as pool:
+            return list(pool.map(call, range(scenario.requests)))
+
+    def _run_parallel(
+        self, manager: Any, scenario: BenchmarkScenario
+    ) -> List[Tuple[bool, float, Optional[float]]]:
+        """Issue all requests through one converse_parallel call."""
+        messages = self._messages(scenario=scenario)
+        requests = [
+            BedrockConverseRequest(messages=messages, request_id=f"bench-{index}")
+            for index in range(scenario.requests)
+        ]
+        response = manager.converse_parallel(requests=requests)
+        return [
+            (result.success, result.total_duration_ms or 0.0, None)
+            for result in response.request_responses.values()
+        ]
+
+    def _run_stream(
+        self, manager: Any, scenario: BenchmarkScenario
+    ) -> List[Tuple[bool, float, Optional[float]]]:
+        """Consume converse_stream responses from a pool of ``concurrency`` threads."""
+        messages = self._messages(scenario=scenario)
+
+        def call(_: int) -> Tuple[bool, float, Optional[float]]:
+            start = time.perf_counter()
+            first_token: Optional[float] = None
+            try:
+                stream = manager.converse_stream(messages=messages)
+                for _chunk in stream:
+                    if first_token is None:
+                        first_token = (time.perf_counter() - start) * 1000
+                success = stream.success
+            except Exception:
+                success = False
+            return success, (time.perf_counter() - start) * 1000, first_token
+
+        with ThreadPoolExecutor(max_workers=scenario.concurrency) as pool:
+            return list(pool.map(call, range(scenario.requests)))
@@ -4,10 +4,11 @@ Handles request ID collision detection and request structure validation.
 """
 
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Set
 
 from ..exceptions.llm_manager_exceptions import RequestValidationError as LLMRequestValidationError
 from ..exceptions.parallel_exceptions import RequestIdCollisionError, RequestValidationError
+from ..executors.request_coalescer import compute_request_key
 from ..models.model_specific_structures import ModelSpecificConfig
 from ..models.parallel_constants import ParallelErrorMessages, ParallelLogMessages
 from ..models.parallel_structures import BedrockConverseRequest
@@ -27,12 +28,20 @@ class RequestValidator:
         """Initialize the request validator."""
         self._logger = logging.getLogger(__name__)
 
-    def validate_request_ids(self, requests: List[BedrockConverseRequest]) -> None:
+    def validate_request_ids(
+        self, requests: List[BedrockConverseRequest], coalesce_duplicates: bool = False
+    ) -> List[BedrockConverseRequest]:
         """
         Validate that all request IDs in the collection are unique.
 
         Args:
             requests: List of BedrockConverseRequest objects to validate
+            coalesce_duplicates: If True, requests sharing an ID whose content is
+                identical (same coalescing key) are collapsed into the first of them
+                instead of being rejected; only conflicting duplicates raise
+
+        Returns:
+            The requests, without coalesced duplicates
 
         Raises:
             RequestValidationError: If the request list is empty
@@ -47,11 +56,59 @@ class RequestValidator:
         # Find duplicates
         duplicates = self._find_duplicate_ids(id_to_requests=id_to_requests)
 
+        if duplicates and coalesce_duplicates:
+            return self._coalesce_identical_duplicates(requests=requests, duplicates=duplicates)
+
         if duplicates:
             self._log_collision_details(duplicates=duplicates)
             raise RequestIdCollisionError(duplicated_ids=duplicates)
 
         self._logger.debug(f"Request ID validation passed for {len(requests)} requests")
+        return requests
+
+    def _coalesce_identical_duplicates(
+        self,
+        requests: List[BedrockConverseRequest],
+        duplicates: Dict[str, List[BedrockConverseRequest]],
+    ) -> List[BedrockConverseRequest]:
+        """
+        Drop duplicates that are identical to the first request with their ID.
+
+        Args:
+            requests: All requests, in order
+            duplicates: Duplicate IDs and their requests
+
+        Returns:
+            Requests with identical duplicates removed
+
+        Raises:
+            RequestIdCollisionError: If any ID is shared by requests with different content
+        """
+        conflicting = {
+            req_id: group
+            for req_id, group in duplicates.items()
+            if len({compute_request_key(request_args=r.to_converse_args()) for r in group}) > 1
+        }
+        if conflicting:
+            self._log_collision_details(duplicates=conflicting)
+            raise RequestIdCollisionError(duplicated_ids=conflicting)
+
+        for req_id, group in duplicates.items():
+            self._logger.info(
+                ParallelLogMessages.DUPLICATE_REQUESTS_COALESCED.format(
+                    duplicate_count=len(group) - 1, request_id=req_id
+                )
+            )
+
+        kept_ids: Set[str] = set()
+        unique_requests: List[BedrockConverseRequest] = []
+        for request in requests:
+            if request.request_id in duplicates:
+                if request.request_id in kept_ids:
+                    continue
+                kept_ids.add(request.request_id)
+            unique_requests.append(request)
+        return unique_requests
 
     def _group_requests_by_id(
         self, requests: List[BedrockConverseRequest]
@@ -143,7 +200,9 @@ class RequestValidator:
             for i, system_msg in enumerate(request.system):
                 if not isinstance(system_msg, dict):
                     validation_errors.append(f"System message {i} must be a dictionary")
-                elif "text" not in system_msg:
+                elif "text" not in system_msg and "cachePoint" not in system_msg:
+                    # Like message content, system prompts may carry caller-placed cache
+                    # points after their text blocks
                     validation_errors.append(f"System message {i} must have 'text' field")
 
         # Validate inference config if present
@@ -260,7 +319,9 @@ class RequestValidator:
 
         return errors
 
-    def validate_batch_requests(self, requests: List[BedrockConverseRequest]) -> None:
+    def validate_batch_requests(
+        self, requests: List[BedrockConverseRequest], coalesce_duplicates: bool = False
+    ) -> List[BedrockConverseRequest]:
         """
         Validate a complete batch of requests.
 
@@ -268,13 +329,20 @@ class RequestValidator:
 
         Args:
             requests: List of BedrockConverseRequest objects to validate
+            coalesce_duplicates: Collapse identical requests sharing an ID instead of
+                rejecting them (see validate_request_ids)
+
+        Returns:
+            The validated requests, without coalesced duplicates
 
         Raises:
             RequestValidationError: If any validation errors are found
             RequestIdCollisionError: If duplicate request IDs are found
         """
         # First validate request IDs for uniqueness
-        self.validate_request_ids(requests=requests)
+        requests = self.validate_request_ids(
+            requests=requests, coalesce_duplicates=coalesce_duplicates
+        )
 
         # Then validate individual request structures
         all_validation_errors = []
@@ -294,6 +362,41 @@ class RequestValidator:
             )
 
         self._logger.info(f"Batch validation completed successfully for {len(requests)} requests")
+        return requests
+
+    def validate_streamed_request(
+        self, request: BedrockConverseRequest, seen_request_ids: Set[str]
+    ) -> None:
+        """
+        Validate one request of a lazily consumed request stream.
+
+        Applies the same ID-uniqueness and structure checks as
+        :meth:`validate_batch_requests`, one request at a time. Only request IDs are
+        remembered between calls, never the requests themselves.
+
+        Args:
+            request: BedrockConverseRequest to validate
+            seen_request_ids: IDs of the requests already accepted from this stream;
+                the request's ID is added on success
+
+        Raises:
+            RequestValidationError: If the request structure is invalid
+            RequestIdCollisionError: If the request ID was already used in this stream
+        """
+        req_id = request.request_id or "unknown"
+        if req_id in seen_request_ids:
+            self._log_collision_details(duplicates={req_id: [request]})
+            raise RequestIdCollisionError(duplicated_ids={req_id: [request]})
+
+        structure_errors = self.validate_request_structure(request=request)
+        if structure_errors:
+            raise RequestValidationError(
+                message=f"Request structure validation failed: {len(structure_errors)} errors found",
+                request_id=req_id,
+                validation_errors=[f"Request {req_id}: {error}" for error in structure_errors],
+            )
+
+        seen_request_ids.add(req_id)
 
     def validate_additional_model_request_fields(
         self, additional_model_request_fields: Any
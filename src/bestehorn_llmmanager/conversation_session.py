@@ -0,0 +1,360 @@
+"""
+Multi-turn conversations with rolling prompt-cache management.
+
+ConversationSession keeps the history of one conversation with an LLMManager and
+places the cache points of every request itself. Each request carries a cache point
+after the new user message, so the conversation so far is written to the prompt cache,
+and keeps the cache points of the most recent prefixes the cache confirmed, so they are
+read back instead of being billed as input again. The session learns what was written
+from the cache write and read token counts of each response.
+
+Only the new turn is inspected per request: earlier messages are neither re-scanned nor
+re-estimated, their token count is taken from the usage Bedrock reported.
+
+Example:
+    >>> session = ConversationSession(manager=manager, system=[{"text": long_prompt}])
+    >>> response = session.send(content="Summarize the document")
+    >>> response = session.send(content="Now list the open questions")
+    >>> session.get_cache_stats().cache_hit_ratio
+"""
+
+import logging
+import time
+from dataclasses import dataclass, replace
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .bedrock.models.bedrock_response import BedrockResponse
+from .bedrock.models.cache_point import build_cache_point
+from .bedrock.models.cache_structures import ConversationCacheStats
+from .bedrock.models.llm_manager_constants import (
+    ConversationSessionConfig,
+    ConversationSessionMessages,
+    ConverseAPIFields,
+)
+from .llm_manager import LLMManager
+from .message_builder_enums import CachePointTTLEnum
+
+
+@dataclass
+class _CacheBoundary:
+    """
+    A user message the session places a cache point after.
+
+    Attributes:
+        message_index: Index of the message in the conversation
+        prefix_tokens: Tokens of the conversation up to and including the message
+        expires_at: Monotonic time the cached prefix expires; None until a response
+            confirms it was written
+    """
+
+    message_index: int
+    prefix_tokens: int
+    expires_at: Optional[float] = None
+
+
+class ConversationSession:
+    """
+    A conversation with an LLMManager that appends turns and manages prompt caching.
+
+    The session sends at most ``max_cache_points`` cache points per request: one after
+    the system prompt if it is long enough to be cached on its own, one after the new user
+    message, and the rest after the most recent user messages whose prefix the cache
+    confirmed and that have not expired. Cache points are only placed after prefixes of at
+    least ``min_cache_tokens`` tokens. The manager's own cache point injection is bypassed
+    for session requests.
+
+    The session is not thread-safe; turns of one conversation are sequential.
+    """
+
+    def __init__(
+        self,
+        manager: LLMManager,
+        system: Optional[List[Dict[str, Any]]] = None,
+        max_cache_points: int = ConversationSessionConfig.MAX_CACHE_POINTS_PER_REQUEST,
+        min_cache_tokens: int = ConversationSessionConfig.DEFAULT_MIN_CACHE_TOKENS,
+        cache_ttl: Optional[Union[str, CachePointTTLEnum]] = None,
+        converse_options: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Initialize the conversation session.
+
+        Args:
+            manager: Manager that sends the requests
+            system: System content blocks sent with every request
+            max_cache_points: Cache points per request; 0 disables prompt caching
+            min_cache_tokens: Minimum prefix tokens for a cache point (the minimum
+                cacheable prefix of the model)
+            cache_ttl: TTL of the cache points ("5m" or "1h"); None uses the default
+            converse_options: Further LLMManager.converse arguments sent with every
+                request, such as inference_config or tool_config
+
+        Raises:
+            ValueError: If max_cache_points or min_cache_tokens is out of range
+            RequestValidationError: If cache_ttl is not a valid cache point TTL
+        """
+        limit = ConversationSessionConfig.MAX_CACHE_POINTS_PER_REQUEST
+        if not 0 <= max_cache_points <= limit:
+            raise ValueError(
+                ConversationSessionMessages.INVALID_MAX_CACHE_POINTS.format(
+                    limit=limit, max_cache_points=max_cache_points
+                )
+            )
+        if min_cache_tokens < 0:
+            raise ValueError(
+                ConversationSessionMessages.INVALID_MIN_CACHE_TOKENS.format(
+                    min_cache_tokens=min_cache_tokens
+                )
+            )
+
+        self._logger = logging.getLogger(__name__)
+        self._manager = manager
+        self._estimator = manager.get_token_estimator()
+        self._min_cache_tokens = min_cache_tokens
+        self._converse_options = dict(converse_options or {})
+        self._cache_point = build_cache_point(ttl=cache_ttl)
+        ttl_value = cache_ttl.value if isinstance(cache_ttl, CachePointTTLEnum) else cache_ttl
+        self._ttl_seconds = ConversationSessionConfig.CACHE_TTL_SECONDS.get(
+            ttl_value, ConversationSessionConfig.DEFAULT_CACHE_TTL_SECONDS
+        )
+
+        # History as the caller sees it, and the same messages as sent, where the
+        # messages of active boundaries are copies ending in a cache point
+        self._messages: List[Dict[str, Any]] = []
+        self._request_messages: List[Dict[str, Any]] = []
+        self._boundaries: List[_CacheBoundary] = []
+        self._model: Optional[str] = None
+        self._stats = ConversationCacheStats()
+
+        self._system = list(system) if system else None
+        self._request_system = self._system
+        # Tokens of the conversation so far; exact from the usage of each response
+        self._known_tokens = self._estimate_tokens(blocks=self._system or [])
+        self._boundary_slots = max_cache_points
+        if self._system and max_cache_points > 0 and self._known_tokens >= min_cache_tokens:
+            self._request_system = self._system + [self._cache_point]
+            self._boundary_slots -= 1
+
+    @property
+    def messages(self) -> List[Dict[str, Any]]:
+        """Messages of the conversation so far, without cache points."""
+        return list(self._messages)
+
+    @property
+    def system(self) -> Optional[List[Dict[str, Any]]]:
+        """System content blocks of the conversation."""
+        return list(self._system) if self._system else None
+
+    def send(
+        self, content: Union[str, List[Dict[str, Any]]], **converse_kwargs: Any
+    ) -> BedrockResponse:
+        """
+        Send a user message and append the assistant's reply to the conversation.
+
+        Args:
+            content: Text of the user message, or its content blocks (e.g. tool results)
+            **converse_kwargs: LLMManager.converse arguments for this turn only; they
+                override the session's converse_options
+
+        Returns:
+            BedrockResponse of the turn
+
+        Raises:
+            ValueError: If the content is empty
+            Exception: Whatever LLMManager.converse raises; the user message is then
+                not added to the conversation
+        """
+        blocks = [{ConverseAPIFields.TEXT: content}] if isinstance(content, str) else list(content)
+        if not blocks or content == "":
+            raise ValueError(ConversationSessionMessages.EMPTY_CONTENT)
+
+        index = len(self._messages)
+        message = {
+            ConverseAPIFields.ROLE: ConverseAPIFields.ROLE_USER,
+            ConverseAPIFields.CONTENT: blocks,
+        }
+        self._messages.append(message)
+        self._request_messages.append(message)
+        boundary, evicted = self._place_boundary(
+            index=index, prefix_tokens=self._known_tokens + self._estimate_tokens(blocks=blocks)
+        )
+        cache_points = len(self._boundaries) + (0 if self._request_system is self._system else 1)
+
+        try:
+            response = self._manager.converse(
+                messages=list(self._request_messages),
+                system=self._request_system,
+                auto_cache_points=False,
+                **{**self._converse_options, **converse_kwargs},
+            )
+        except Exception:
+            self._rollback(index=index, boundary=boundary, evicted=evicted)
+            raise
+
+        if not response.success:
+            self._rollback(index=index, boundary=boundary, evicted=evicted)
+            return response
+
+        self._record_turn(response=response, boundary=boundary, cache_points=cache_points)
+        return response
+
+    def get_cache_stats(self) -> ConversationCacheStats:
+        """
+        Get the prompt-cache statistics of the conversation.
+
+        Returns:
+            Snapshot of the ConversationCacheStats
+        """
+        return replace(self._stats)
+
+    def _place_boundary(
+        self, index: int, prefix_tokens: int
+    ) -> Tuple[Optional[_CacheBoundary], List[_CacheBoundary]]:
+        """
+        Put a cache point after the new user message and drop boundaries over budget.
+
+        Args:
+            index: Index of the new user message
+            prefix_tokens: Estimated tokens of the conversation including the message
+
+        Returns:
+            Tuple of (the new boundary or None, boundaries removed for this request)
+        """
+        if self._boundary_slots == 0 or prefix_tokens < self._min_cache_tokens:
+            return None, []
+
+        now = time.monotonic()
+        evicted: List[_CacheBoundary] = []
+        live: List[_CacheBoundary] = []
+        for old in self._boundaries:
+            expired = old.expires_at is not None and old.expires_at <= now
+            (evicted if expired else live).append(old)
+        # The new boundary takes one slot; keep the most recent confirmed ones
+        overflow = len(live) + 1 - self._boundary_slots
+        if overflow > 0:
+            evicted.extend(live[:overflow])
+            live = live[overflow:]
+        for old in evicted:
+            self._set_cache_point(boundary=old, active=False)
+
+        boundary = _CacheBoundary(message_index=index, prefix_tokens=prefix_tokens)
+        self._boundaries = live + [boundary]
+        self._set_cache_point(boundary=boundary, active=True)
+        return boundary, evicted
+
+    def _rollback(
+        self,
+        index: int,
+        boundary: Optional[_CacheBoundary],
+        evicted: List[_CacheBoundary],
+    ) -> None:
+        """Remove a user message whose request failed and restore the boundaries."""
+        del self._messages[index:]
+        del self._request_messages[index:]
+        if boundary is None:
+            return
+        for old in evicted:
+            self._set_cache_point(boundary=old, active=True)
+        self._boundaries = sorted(
+            [kept for kept in self._boundaries if kept is not boundary] + evicted,
+            key=lambda kept: kept.message_index,
+        )
+
+    def _record_turn(
+        self,
+        response: BedrockResponse,
+        boundary: Optional[_CacheBoundary],
+        cache_points: int,
+    ) -> None:
+        """
+        Confirm cache writes, append the assistant message and update the statistics.
+
+        Args:
+            response: Successful response of the turn
+            boundary: Boundary placed after the turn's user message, if any
+            cache_points: Number of cache points the request was sent with
+        """
+        usage = response.get_usage()
+        reply_blocks = response.get_content_blocks() or []
+        cache_read = response.get_cache_read_tokens()
+        cache_write = response.get_cache_write_tokens()
+        if usage is not None:
+            input_tokens = usage["input_tokens"]
+            output_tokens = usage["output_tokens"]
+            prompt_tokens = input_tokens + cache_read + cache_write
+        else:
+            input_tokens = 0
+            output_tokens = self._estimate_tokens(blocks=reply_blocks)
+            prompt_tokens = boundary.prefix_tokens if boundary else self._known_tokens
+
+        expires_at = time.monotonic() + self._ttl_seconds
+        if cache_read > 0:
+            # A read refreshes the longest cached prefix it covered
+            for old in reversed(self._boundaries):
+                if old is not boundary and old.prefix_tokens <= cache_read:
+                    old.expires_at = expires_at
+                    break
+        if boundary is not None:
+            if usage is not None:
+                # The cache point ends the request, so its prefix is the whole prompt
+                boundary.prefix_tokens = prompt_tokens
+            if cache_write > 0 or cache_read >= boundary.prefix_tokens > 0:
+                boundary.expires_at = expires_at
+            else:
+                self._logger.debug(
+                    ConversationSessionMessages.CACHE_POINT_NOT_WRITTEN.format(
+                        index=boundary.message_index, prefix_tokens=boundary.prefix_tokens
+                    )
+                )
+                self._set_cache_point(boundary=boundary, active=False)
+                self._boundaries.remove(boundary)
+
+        assistant_message = {
+            ConverseAPIFields.ROLE: ConverseAPIFields.ROLE_ASSISTANT,
+            ConverseAPIFields.CONTENT: reply_blocks,
+        }
+        self._messages.append(assistant_message)
+        self._request_messages.append(assistant_message)
+        self._known_tokens = prompt_tokens + output_tokens
+        self._model = response.model_used or self._model
+
+        stats = self._stats
+        stats.turns += 1
+        stats.input_tokens += input_tokens
+        stats.output_tokens += output_tokens
+        stats.cache_read_tokens += cache_read
+        stats.cache_write_tokens += cache_write
+        stats.cache_points = cache_points
+        stats.cached_prefix_tokens = max(
+            [old.prefix_tokens for old in self._boundaries if old.expires_at is not None],
+            default=0,
+        )
+
+    def _set_cache_point(self, boundary: _CacheBoundary, active: bool) -> None:
+        """Send a boundary's message with or without a trailing cache point."""
+        message = self._messages[boundary.message_index]
+        if active:
+            self._request_messages[boundary.message_index] = {
+                **message,
+                ConverseAPIFields.CONTENT: message[ConverseAPIFields.CONTENT] + [self._cache_point],
+            }
+        else:
+            self._request_messages[boundary.message_index] = message
+
+    def _estimate_tokens(self, blocks: List[Dict[str, Any]]) -> int:
+        """Estimate the tokens of content blocks with the manager's calibration."""
+        return sum(
+            self._estimator.estimate_block_tokens(block=block, model=self._model)
+            for block in blocks
+        )
+
+    def __len__(self) -> int:
+        """Return the number of messages in the conversation."""
+        return len(self._messages)
+
+    def __repr__(self) -> str:
+        """Return string representation of the ConversationSession."""
+        return (
+            f"ConversationSession(messages={len(self._messages)}, "
+            f"cache_points={self._stats.cache_points}, "
+            f"cache_hit_ratio={self._stats.cache_hit_ratio:.2f})"
+        )
@@ -7,13 +7,14 @@ with automatic retry logic, authentication handling, and comprehensive response
 
 import dataclasses
 import logging
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union, cast
 
 from .bedrock.auth.auth_manager import AuthManager
 from .bedrock.builders.parameter_builder import ParameterBuilder
-from .bedrock.cache import CachePointManager
+from .bedrock.cache import CachePointManager, TokenEstimator
 from .bedrock.catalog import BedrockModelCatalog
 from .bedrock.exceptions.llm_manager_exceptions import (
     AuthenticationError,
@@ -22,9 +23,21 @@ from .bedrock.exceptions.llm_manager_exceptions import (
     RequestValidationError,
     RetryExhaustedError,
 )
+from .bedrock.executors.request_coalescer import RequestCoalescer, compute_request_key
+from .bedrock.instrumentation.instrumentation_registry import (
+    instrument_span,
+    instrumented,
+    record_metric,
+)
+from .bedrock.models.access_method import ModelAccessInfo
 from .bedrock.models.bedrock_response import BedrockResponse, StreamingResponse
 from .bedrock.models.cache_structures import CacheConfig
 from .bedrock.models.catalog_structures import CacheMode
+from .bedrock.models.instrumentation_constants import (
+    InstrumentationAttributes,
+    InstrumentationMetricNames,
+    InstrumentationSpanNames,
+)
 from .bedrock.models.llm_manager_constants import (
     ContentLimits,
     ConverseAPIFields,
@@ -40,7 +53,12 @@ from .bedrock.models.llm_manager_structures import (
 )
 from .bedrock.models.model_specific_structures import ModelSpecificConfig
 from .bedrock.models.parallel_structures import BedrockConverseRequest
+from .bedrock.models.rate_limit_structures import RateLimitConfig, RateLimitPermit
+from .bedrock.models.s3_offload_structures import S3OffloadConfig
+from .bedrock.offload.s3_media_offloader import S3MediaOffloader
+from .bedrock.rate_limiting.rate_limiter import RateLimiter
 from .bedrock.retry.retry_manager import RetryManager
+from .bedrock.streaming.streaming_constants import StreamingConstants, StreamingEventTypes
 from .bedrock.streaming.streaming_retry_manager import StreamingRetryManager
 from .bedrock.UnifiedModelManager import UnifiedModelManager
 
@@ -101,6 +119,9 @@ class LLMManager:
         region_order: Optional[str] = None,
         access_method_preference: Optional[str] = None,
         global_cris_fraction: Optional[float] = None,
+        coalesce_identical_requests: bool = False,
+        rate_limit_config: Optional[RateLimitConfig] = None,
+        s3_offload_config: Optional[S3OffloadConfig] = None,
     ) -> None:
         """
         Initialize the LLM Manager.
@@ -146,6 +167,20 @@ class LLMManager:
                 approximately this share of calls is routed to the global CRIS profile when
                 available. None (default) disables interleaving. Folded into the effective
                 RetryConfig when provided.
+            coalesce_identical_requests: If True, concurrent converse() calls with
+                identical arguments share one Bedrock call: the first caller executes and
+                the others wait for and receive the same BedrockResponse object (or
+                exception). Completed responses are not cached. Defaults to False.
+            rate_limit_config: Requests-per-minute and tokens-per-minute quotas per model
+                ID and region. Each Bedrock call waits until its request and estimated
+                tokens (input estimate plus maxTokens) fit the quota, and the token
+                reservation is corrected with the reported usage afterwards. None
+                (default) disables client-side rate limiting.
+            s3_offload_config: Uploads image/document/video bytes above a threshold
+                once to S3, keyed by their SHA-256 hash, and sends the blocks as
+                s3Location sources, so requests and their retries stay small. The
+                models used must support S3 sources. None (default) sends all bytes
+                inline.
 
         Raises:
             ConfigurationError: If configuration is invalid (including invalid
@@ -184,12 +219,26 @@ class LLMManager:
         self._retry_manager = RetryManager(retry_config=effective_retry_config)
         self._streaming_retry_manager = StreamingRetryManager(retry_config=effective_retry_config)
         self._parameter_builder = ParameterBuilder()
+        self._request_coalescer: Optional[RequestCoalescer[BedrockResponse]] = (
+            RequestCoalescer() if coalesce_identical_requests else None
+        )
+        self._rate_limiter: Optional[RateLimiter] = (
+            RateLimiter(config=rate_limit_config) if rate_limit_config else None
+        )
+        # Created on first use so that no S3 client is built unless payloads are offloaded
+        self._s3_offload_config = s3_offload_config
+        self._s3_media_offloader: Optional[S3MediaOffloader] = None
+        self._s3_offloader_lock = threading.Lock()
 
         # Initialize cache manager if caching is enabled
         self._cache_config = cache_config or CacheConfig(enabled=False)
+        # Token estimates size cache points and budgets; calibrated from response usage
+        self._token_estimator = TokenEstimator()
         self._cache_point_manager = None
         if self._cache_config.enabled:
-            self._cache_point_manager = CachePointManager(self._cache_config)
+            self._cache_point_manager = CachePointManager(
+                self._cache_config, token_estimator=self._token_estimator
+            )
             self._logger.info(f"Caching enabled with strategy: {self._cache_config.strategy.value}")
 
         # Initialize model catalog (new system or legacy for backward compatibility)
@@ -246,6 +295,7 @@ class LLMManager:
                 cache_directory=catalog_cache_directory,
                 force_refresh=effective_force_refresh,
                 timeout=timeout,
+                regions=self._regions,
             )
 
             # Ensure catalog is available (will trigger initialization strategy)
@@ -614,6 +664,7 @@ class LLMManager:
 
         return " ".join(error_details)
 
+    @instrumented(name=InstrumentationSpanNames.CONVERSE)
     def converse(
         self,
         messages: List[Dict[str, Any]],
@@ -632,6 +683,9 @@ class LLMManager:
         performance_config: Optional[Dict[str, Any]] = None,
         service_tier: Optional[Dict[str, Any]] = None,
         extra_request_fields: Optional[Dict[str, Any]] = None,
+        auto_cache_points: bool = True,
+        preferred_region: Optional[str] = None,
+        retry_targets: Optional[List[Tuple[str, str, ModelAccessInfo]]] = None,
     ) -> BedrockResponse:
         """
         Send a conversation request to available models with retry logic.
@@ -652,6 +706,14 @@ class LLMManager:
             output_config: Structured-output config (outputConfig.textFormat) to constrain
                 the model's output to a JSON schema; build one with
                 ``bedrock.models.structured_output.build_json_schema_output_config``
+            auto_cache_points: Let the manager place cache points when caching is
+                enabled; pass False when the messages already carry the intended cache
+                points (as ConversationSession does)
+            preferred_region: Region to try first, e.g. one that already holds the
+                request's prompt prefix in its cache; the other regions remain
+                failover targets
+            retry_targets: Targets from plan_retry_targets() to use instead of planning
+                them for this call, so a sequence of calls plans once
 
         Returns:
             BedrockResponse with the conversation result
@@ -689,17 +751,66 @@ class LLMManager:
             performance_config=performance_config,
             service_tier=service_tier,
             extra_request_fields=extra_request_fields,
+            auto_cache_points=auto_cache_points,
         )
 
-        # Generate retry targets
-        # Pass the appropriate manager based on which system is active
-        manager_for_retry = self._catalog if self._catalog else self._unified_model_manager
-        retry_targets = self._retry_manager.generate_retry_targets(
-            models=self._models,
-            regions=self._regions,
-            unified_model_manager=manager_for_retry,
+        if self._request_coalescer is not None:
+            # Identical concurrent requests share one execution and its response
+            return self._request_coalescer.execute(
+                key=compute_request_key(
+                    request_args=dict(
+                        request_args, response_validation_config=response_validation_config
+                    )
+                ),
+                operation=lambda: self._execute_converse_request(
+                    request_args=request_args,
+                    response_validation_config=response_validation_config,
+                    request_start=request_start,
+                    preferred_region=preferred_region,
+                    retry_targets=retry_targets,
+                ),
+            )
+
+        return self._execute_converse_request(
+            request_args=request_args,
+            response_validation_config=response_validation_config,
+            request_start=request_start,
+            preferred_region=preferred_region,
+            retry_targets=retry_targets,
         )
 
+    def _execute_converse_request(
+        self,
+        request_args: Dict[str, Any],
+        response_validation_config: Optional[ResponseValidationConfig],
+        request_start: datetime,
+        preferred_region: Optional[str] = None,
+        retry_targets: Optional[List[Tuple[str, str, ModelAccessInfo]]] = None,
+    ) -> BedrockResponse:
+        """
+        Execute a built converse request against the retry targets.
+
+        Args:
+            request_args: Converse API arguments (without modelId)
+            response_validation_config: Configuration for response validation and retry
+            request_start: When the converse call started
+            preferred_region: Region to try first (None keeps the configured order)
+            retry_targets: Previously planned retry targets (None plans them now)
+
+        Returns:
+            BedrockResponse with the conversation result
+
+        Raises:
+            ConfigurationError: If no model/region combination is available
+            RetryExhaustedError: If all retry attempts fail
+        """
+        if retry_targets is None:
+            retry_targets = self.plan_retry_targets(preferred_region=preferred_region)
+        elif preferred_region is not None:
+            retry_targets = self._retry_manager.prefer_region(
+                retry_targets=retry_targets, preferred_region=preferred_region
+            )
+
         if not retry_targets:
             # Build error message with suggestions
             error_parts = ["No valid model/region combinations available."]
@@ -779,9 +890,26 @@ class LLMManager:
                 features_disabled=[],  # Will be populated by retry manager if needed
             )
 
+            self._record_token_usage(response=response, request_args=request_args)
+            record_metric(
+                name=InstrumentationMetricNames.RETRY_ATTEMPTS,
+                value=len(attempts),
+                attributes={
+                    InstrumentationAttributes.MODEL: response.model_used,
+                    InstrumentationAttributes.REGION: response.region_used,
+                    InstrumentationAttributes.SUCCESS: True,
+                },
+            )
+
             return response
 
         except RetryExhaustedError as e:
+            record_metric(
+                name=InstrumentationMetricNames.RETRY_ATTEMPTS,
+                value=e.attempts_made or 0,
+                attributes={InstrumentationAttributes.SUCCESS: False},
+            )
+
             # Create failed response
             total_duration = (datetime.now() - request_start).total_seconds() * 1000
 
@@ -794,6 +922,7 @@ class LLMManager:
 
             raise e
 
+    @instrumented(name=InstrumentationSpanNames.CONVERSE_STREAM)
     def converse_stream(
         self,
         messages: List[Dict[str, Any]],
@@ -877,11 +1006,13 @@ class LLMManager:
         # Generate retry targets using the regular retry manager
         # Pass the appropriate manager based on which system is active
         manager_for_retry = self._catalog if self._catalog else self._unified_model_manager
-        retry_targets = self._retry_manager.generate_retry_targets(
-            models=self._models,
-            regions=self._regions,
-            unified_model_manager=manager_for_retry,
-        )
+        with instrument_span(name=InstrumentationSpanNames.TARGET_GENERATION) as span:
+            retry_targets = self._retry_manager.generate_retry_targets(
+                models=self._models,
+                regions=self._regions,
+                unified_model_manager=manager_for_retry,
+            )
+            span.set_attribute(key=InstrumentationAttributes.TARGET_COUNT, value=len(retry_targets))
 
         if not retry_targets:
             # Build error message with suggestions
@@ -1066,6 +1197,7 @@ class LLMManager:
         service_tier: Optional[Dict[str, Any]] = None,
         extra_request_fields: Optional[Dict[str, Any]] = None,
         stream_processing_mode: Optional[str] = None,
+        auto_cache_points: bool = True,
     ) -> Dict[str, Any]:
         """
         Build the request arguments for the Converse API.
@@ -1082,16 +1214,26 @@ class LLMManager:
             request_metadata: Request metadata
             prompt_variables: Prompt variables
             output_config: Structured-output configuration (outputConfig.textFormat)
+            auto_cache_points: Inject cache points with the CachePointManager when
+                caching is enabled
 
         Returns:
             Dictionary of request arguments for the Converse API
         """
-        # Apply cache point injection if caching is enabled
+        # Move oversized media payloads to S3 before the request is sent (and retried)
         processed_messages = messages
-        if self._cache_point_manager and self._cache_config.enabled:
+        offloader = self.get_s3_media_offloader()
+        if offloader is not None:
+            processed_messages = offloader.offload_messages(messages=processed_messages)
+
+        # Apply cache point injection if caching is enabled
+        if auto_cache_points and self._cache_point_manager and self._cache_config.enabled:
             # Note: Model and region will be determined during retry execution
-            # For now, we inject cache points without model/region validation
-            processed_messages = self._cache_point_manager.inject_cache_points(messages)
+            # For now, we inject cache points without model/region validation; the
+            # first model only selects the token estimate calibration.
+            processed_messages = self._cache_point_manager.inject_cache_points(
+                processed_messages, model=self._models[0] if self._models else None
+            )
 
             # Validate cache configuration
             validation_warnings = self._cache_point_manager.validate_cache_configuration(
@@ -1226,9 +1368,24 @@ class LLMManager:
         # Remove internal parameters that should not be sent to AWS
         converse_args.pop("_model_specific_config", None)
 
+        permit = self._acquire_rate_limit_permit(region=target_region, converse_args=converse_args)
+
         # Execute the converse call with all prepared arguments
-        response = client.converse(**converse_args)
+        try:
+            with instrument_span(
+                name=InstrumentationSpanNames.API_CALL,
+                attributes={
+                    InstrumentationAttributes.OPERATION: "converse",
+                    InstrumentationAttributes.MODEL_ID: converse_args.get("modelId"),
+                    InstrumentationAttributes.REGION: target_region,
+                },
+            ):
+                response = client.converse(**converse_args)
+        except Exception:
+            self._reconcile_rate_limit_permit(permit=permit, response=None)
+            raise
 
+        self._reconcile_rate_limit_permit(permit=permit, response=response)
         return cast(Dict[str, Any], response)
 
     def _execute_converse_stream(
@@ -1277,11 +1434,117 @@ class LLMManager:
         # Remove internal parameters that should not be sent to AWS
         converse_stream_args.pop("_model_specific_config", None)
 
-        # Execute the streaming converse call with all prepared arguments
-        response = client.converse_stream(**converse_stream_args)
+        # Streams report usage in their metadata event; the reservation is reconciled then
+        permit = self._acquire_rate_limit_permit(
+            region=target_region, converse_args=converse_stream_args
+        )
 
+        # Execute the streaming converse call with all prepared arguments
+        try:
+            with instrument_span(
+                name=InstrumentationSpanNames.API_CALL,
+                attributes={
+                    InstrumentationAttributes.OPERATION: "converse_stream",
+                    InstrumentationAttributes.MODEL_ID: converse_stream_args.get("modelId"),
+                    InstrumentationAttributes.REGION: target_region,
+                },
+            ):
+                response = client.converse_stream(**converse_stream_args)
+        except Exception:
+            self._reconcile_rate_limit_permit(permit=permit, response=None)
+            raise
+
+        event_stream = response.get(StreamingConstants.FIELD_STREAM)
+        if permit is not None and permit.limited and event_stream:
+            response = dict(response)
+            response[StreamingConstants.FIELD_STREAM] = self._reconcile_stream_usage(
+                permit=permit, event_stream=event_stream
+            )
         return cast(Dict[str, Any], response)
 
+    def _reconcile_stream_usage(
+        self, permit: RateLimitPermit, event_stream: Iterable[Dict[str, Any]]
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Pass stream events through, reconciling the permit when the usage arrives.
+
+        A stream that ends before its metadata event keeps the full reservation.
+
+        Args:
+            permit: Permit of the streaming call
+            event_stream: EventStream of the converse_stream response
+
+        Yields:
+            The events of the stream, unchanged
+        """
+        for event in event_stream:
+            metadata = event.get(StreamingEventTypes.METADATA.value)
+            if metadata:
+                self._reconcile_rate_limit_permit(permit=permit, response=metadata)
+            yield event
+
+    def _acquire_rate_limit_permit(
+        self, region: str, converse_args: Dict[str, Any]
+    ) -> Optional[RateLimitPermit]:
+        """
+        Wait for rate limit quota for a Bedrock call.
+
+        Args:
+            region: AWS region of the call
+            converse_args: Bedrock API arguments including modelId
+
+        Returns:
+            RateLimitPermit, or None if rate limiting is disabled
+
+        Raises:
+            RateLimitExceededError: If quota is not available within max_wait_seconds
+        """
+        if self._rate_limiter is None:
+            return None
+
+        model_id = str(converse_args.get("modelId", ""))
+        tokens = 0
+        if self._rate_limiter.limits_tokens(model_id=model_id, region=region):
+            inference_config = converse_args.get(ConverseAPIFields.INFERENCE_CONFIG) or {}
+            output_tokens = inference_config.get(
+                ConverseAPIFields.MAX_TOKENS, self._rate_limiter.get_config().default_output_tokens
+            )
+            tokens = (
+                self._token_estimator.estimate_request_tokens(
+                    messages=converse_args.get(ConverseAPIFields.MESSAGES, []),
+                    system=converse_args.get(ConverseAPIFields.SYSTEM),
+                    tool_config=converse_args.get(ConverseAPIFields.TOOL_CONFIG),
+                    model=model_id,
+                )
+                + output_tokens
+            )
+
+        return self._rate_limiter.acquire(model_id=model_id, region=region, tokens=tokens)
+
+    def _reconcile_rate_limit_permit(
+        self, permit: Optional[RateLimitPermit], response: Optional[Dict[str, Any]]
+    ) -> None:
+        """
+        Correct a permit's token reservation with the usage a response reports.
+
+        Args:
+            permit: Permit of the call (None if rate limiting is disabled)
+            response: Bedrock API response, or None if the call failed
+        """
+        if permit is None or self._rate_limiter is None:
+            return
+
+        usage = (response or {}).get(ConverseAPIFields.USAGE) or {}
+        if response is not None and not usage:
+            return  # No usage reported (e.g. stream setup); keep the reservation
+
+        actual_tokens = usage.get(ConverseAPIFields.TOTAL_TOKENS)
+        if actual_tokens is None:
+            actual_tokens = usage.get(ConverseAPIFields.INPUT_TOKENS, 0) + usage.get(
+                ConverseAPIFields.OUTPUT_TOKENS, 0
+            )
+        self._rate_limiter.reconcile(permit=permit, actual_tokens=actual_tokens)
+
     def get_available_models(self) -> List[str]:
         """
         Get list of currently configured models.
@@ -1422,6 +1685,133 @@ class LLMManager:
         except Exception as e:
             raise LLMManagerError(f"Failed to refresh model data: {str(e)}") from e
 
+    def _record_token_usage(self, response: BedrockResponse, request_args: Dict[str, Any]) -> None:
+        """
+        Feed a response's token usage into the token estimator calibration.
+
+        Args:
+            response: Successful response
+            request_args: Converse request arguments the response was produced for
+        """
+        try:
+            self._token_estimator.record_response(
+                response=response,
+                messages=request_args[ConverseAPIFields.MESSAGES],
+                system=request_args.get(ConverseAPIFields.SYSTEM),
+                tool_config=request_args.get(ConverseAPIFields.TOOL_CONFIG),
+            )
+        except Exception as e:
+            self._logger.debug(f"Could not record token usage for calibration: {e}")
+
+    def estimate_input_tokens(
+        self,
+        messages: List[Dict[str, Any]],
+        system: Optional[List[Dict[str, Any]]] = None,
+        tool_config: Optional[Dict[str, Any]] = None,
+        model: Optional[str] = None,
+    ) -> int:
+        """
+        Estimate the input tokens of a request, e.g. for budgeting.
+
+        The estimate uses content-aware heuristics (image dimensions, PDF page counts)
+        scaled by the calibration learned from previous responses of the model's family.
+
+        Args:
+            messages: Conversation messages
+            system: System content blocks
+            tool_config: Tool configuration
+            model: Model name or ID whose calibration is applied (defaults to the first
+                configured model)
+
+        Returns:
+            Estimated input token count
+        """
+        return self._token_estimator.estimate_request_tokens(
+            messages=messages,
+            system=system,
+            tool_config=tool_config,
+            model=model or (self._models[0] if self._models else None),
+        )
+
+    def get_token_estimator(self) -> TokenEstimator:
+        """
+        Get the token estimator used for cache point placement and budgeting.
+
+        Returns:
+            TokenEstimator instance
+        """
+        return self._token_estimator
+
+    def get_request_coalescer(self) -> Optional[RequestCoalescer[BedrockResponse]]:
+        """
+        Get the single-flight group coalescing identical concurrent converse() calls.
+
+        Returns:
+            RequestCoalescer (with executed/coalesced counters), or None if request
+            coalescing is disabled
+        """
+        return self._request_coalescer
+
+    def get_rate_limiter(self) -> Optional[RateLimiter]:
+        """
+        Get the client-side RPM/TPM rate limiter.
+
+        Returns:
+            RateLimiter (with per model ID and region statistics), or None if rate
+            limiting is disabled
+        """
+        return self._rate_limiter
+
+    def get_s3_media_offloader(self) -> Optional[S3MediaOffloader]:
+        """
+        Get the offloader moving large media payloads to S3, creating it on first use.
+
+        Returns:
+            S3MediaOffloader (with upload statistics), or None if S3 offload is disabled
+
+        Raises:
+            AuthenticationError: If the S3 client cannot be created
+        """
+        if self._s3_offload_config is None:
+            return None
+        if self._s3_media_offloader is None:
+            with self._s3_offloader_lock:
+                if self._s3_media_offloader is None:
+                    region = self._s3_offload_config.region or self._regions[0]
+                    self._s3_media_offloader = S3MediaOffloader(
+                        config=self._s3_offload_config,
+                        s3_client=self._auth_manager.get_s3_client(region=region),
+                    )
+        return self._s3_media_offloader
+
+    def plan_retry_targets(
+        self, preferred_region: Optional[str] = None
+    ) -> List[Tuple[str, str, ModelAccessInfo]]:
+        """
+        Plan the model/region combinations a converse call tries, in retry order.
+
+        Planning looks up the access information of every model in every region. Pass
+        the plan to converse(retry_targets=...) to reuse it across a sequence of calls,
+        e.g. the turns of a tool-use loop.
+
+        Args:
+            preferred_region: Region to try first; the other regions stay failover targets
+
+        Returns:
+            List of (model, region, access_info) tuples in retry order
+        """
+        # Pass the appropriate manager based on which system is active
+        manager_for_retry = self._catalog if self._catalog else self._unified_model_manager
+        with instrument_span(name=InstrumentationSpanNames.TARGET_GENERATION) as span:
+            retry_targets = self._retry_manager.generate_retry_targets(
+                models=self._models,
+                regions=self._regions,
+                unified_model_manager=manager_for_retry,
+                preferred_region=preferred_region,
+            )
+            span.set_attribute(key=InstrumentationAttributes.TARGET_COUNT, value=len(retry_targets))
+        return retry_targets
+
     def get_retry_stats(self) -> Dict[str, Any]:
         """
         Get retry configuration statistics.
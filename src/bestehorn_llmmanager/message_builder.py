@@ -6,6 +6,7 @@ validation, and multi-modal support.
 """
 
 import logging
+import stat
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
@@ -27,7 +28,9 @@ from .message_builder_enums import (
     ToolResultStatusEnum,
     VideoFormatEnum,
 )
+from .util.file_content_source import FileContentSource
 from .util.file_type_detector import FileTypeDetector
+from .util.image_preprocessor import ImagePreprocessor
 
 
 class ConverseMessageBuilder:
@@ -44,13 +47,20 @@ class ConverseMessageBuilder:
             .build()
     """
 
-    def __init__(self, role: RolesEnum, cache_config: Optional[CacheConfig] = None) -> None:
+    def __init__(
+        self,
+        role: RolesEnum,
+        cache_config: Optional[CacheConfig] = None,
+        image_preprocessor: Optional[ImagePreprocessor] = None,
+    ) -> None:
         """
         Initialize the message builder with a role and optional cache configuration.
 
         Args:
             role: The role for this message (USER or ASSISTANT)
             cache_config: Optional cache configuration for automatic cache point optimization
+            image_preprocessor: Optional preprocessor that downscales and re-encodes every
+                image added to the message
         """
         self._logger = logging.getLogger(__name__)
 
@@ -62,6 +72,7 @@ class ConverseMessageBuilder:
         self._file_detector = FileTypeDetector()
         self._cache_config = cache_config
         self._cacheable_blocks: List[bool] = []  # Track which blocks are cacheable
+        self._image_preprocessor = image_preprocessor
 
         self._logger.debug(f"Initialized ConverseMessageBuilder with role: {role.value}")
 
@@ -126,9 +137,55 @@ class ConverseMessageBuilder:
                 MessageBuilderErrorMessages.EMPTY_CONTENT.format(content_type="image")
             )
 
+        return self._add_image_content(
+            content=bytes, header=bytes, format=format, filename=filename, cacheable=cacheable
+        )
+
+    def _add_image_content(
+        self,
+        content: Union[bytes, FileContentSource],
+        header: bytes,
+        format: Optional[ImageFormatEnum],
+        filename: Optional[str],
+        cacheable: Optional[bool],
+    ) -> "ConverseMessageBuilder":
+        """
+        Validate and add an image content block holding bytes or a local file source.
+
+        With an image preprocessor, the image is downscaled and re-encoded first (local
+        files are then read here rather than in build()), and the given format is
+        replaced by the preprocessor's output format.
+
+        Args:
+            content: Image bytes, or a FileContentSource that build() materializes
+            header: Leading bytes of the image, used for format detection
+            format: Optional image format (auto-detected if not provided)
+            filename: Optional filename for format detection and logging
+            cacheable: Optional hint for caching
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            RequestValidationError: If image data is invalid or format unsupported
+        """
         self._validate_content_block_limit()
+
+        if self._image_preprocessor is not None:
+            try:
+                preprocessed = self._image_preprocessor.preprocess(content=content)
+            except OSError as e:
+                raise RequestValidationError(
+                    MessageBuilderErrorMessages.LOCAL_FILE_READ_FAILED.format(
+                        content_type="image", path=filename, error=e
+                    )
+                ) from e
+            content = preprocessed.content
+            header = preprocessed.content
+            format = preprocessed.format
+
         self._validate_content_size(
-            content_size=len(bytes),
+            content_size=len(content),
             max_size=MessageBuilderConfig.MAX_IMAGE_SIZE_BYTES,
             content_type="image",
         )
@@ -136,7 +193,7 @@ class ConverseMessageBuilder:
         # Auto-detect format if not provided
         if format is None:
             detection_result = self._file_detector.detect_image_format(
-                content=bytes, filename=filename
+                content=header, filename=filename
             )
 
             if not detection_result.is_successful:
@@ -182,7 +239,7 @@ class ConverseMessageBuilder:
         image_block = {
             ConverseAPIFields.IMAGE: {
                 ConverseAPIFields.FORMAT: format.value,
-                ConverseAPIFields.SOURCE: {ConverseAPIFields.BYTES: bytes},
+                ConverseAPIFields.SOURCE: {ConverseAPIFields.BYTES: content},
             }
         }
 
@@ -191,7 +248,7 @@ class ConverseMessageBuilder:
 
         self._logger.debug(
             MessageBuilderLogMessages.CONTENT_BLOCK_ADDED.format(
-                content_type=f"image ({format.value})", size=len(bytes)
+                content_type=f"image ({format.value})", size=len(content)
             )
         )
 
@@ -206,6 +263,9 @@ class ConverseMessageBuilder:
         """
         Add an image content block from a local file path.
 
+        The file is hashed once and stored by reference; its bytes are read when the
+        message is built (see :meth:`build`).
+
         Args:
             path_to_local_file: Path to the local image file
             format: Optional image format (auto-detected if not provided)
@@ -217,42 +277,17 @@ class ConverseMessageBuilder:
         Raises:
             RequestValidationError: If file cannot be read or is invalid
             FileNotFoundError: If the file does not exist
-            ValueError: If image is too large and cannot be resized
         """
-        file_path = Path(path_to_local_file)
-
-        # Validate file exists
-        if not file_path.exists():
-            raise FileNotFoundError(f"Image file not found: {path_to_local_file}")
-
-        if not file_path.is_file():
-            raise RequestValidationError(f"Path is not a file: {path_to_local_file}")
-
-        # Check file size
-        file_size_mb = file_path.stat().st_size / (1024 * 1024)
-        max_size_bytes = int(max_size_mb * 1024 * 1024)
-
-        if file_size_mb > max_size_mb:
-            self._logger.warning(
-                f"Image {file_path.name} is {file_size_mb:.2f}MB, exceeds limit of {max_size_mb}MB"
-            )
-            raise RequestValidationError(
-                MessageBuilderErrorMessages.CONTENT_SIZE_EXCEEDED.format(
-                    size=file_path.stat().st_size, limit=max_size_bytes, content_type="image"
-                )
-            )
-
-        # Read the file
-        try:
-            with open(file_path, "rb") as image_file:
-                image_bytes = image_file.read()
-        except Exception as e:
-            raise RequestValidationError(
-                f"Failed to read image file {path_to_local_file}: {e}"
-            ) from e
-
-        # Use the existing add_image_bytes method
-        return self.add_image_bytes(bytes=image_bytes, format=format, filename=file_path.name)
+        source = self._open_local_file(
+            path_to_local_file=path_to_local_file, max_size_mb=max_size_mb, content_type="image"
+        )
+        return self._add_image_content(
+            content=source,
+            header=source.header,
+            format=format,
+            filename=source.path.name,
+            cacheable=None,
+        )
 
     def add_document_bytes(
         self,
@@ -288,9 +323,47 @@ class ConverseMessageBuilder:
                 MessageBuilderErrorMessages.EMPTY_CONTENT.format(content_type="document")
             )
 
+        return self._add_document_content(
+            content=bytes,
+            header=bytes,
+            format=format,
+            filename=filename,
+            name=name,
+            citations_enabled=citations_enabled,
+            context=context,
+        )
+
+    def _add_document_content(
+        self,
+        content: Union[bytes, FileContentSource],
+        header: bytes,
+        format: Optional[DocumentFormatEnum],
+        filename: Optional[str],
+        name: Optional[str],
+        citations_enabled: bool,
+        context: Optional[str],
+    ) -> "ConverseMessageBuilder":
+        """
+        Validate and add a document content block holding bytes or a local file source.
+
+        Args:
+            content: Document bytes, or a FileContentSource that build() materializes
+            header: Leading bytes of the document, used for format detection
+            format: Optional document format (auto-detected if not provided)
+            filename: Optional filename for format detection and logging
+            name: Optional document name for the API
+            citations_enabled: Whether to enable document citations
+            context: Optional citation context string
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            RequestValidationError: If document data is invalid or format unsupported
+        """
         self._validate_content_block_limit()
         self._validate_content_size(
-            content_size=len(bytes),
+            content_size=len(content),
             max_size=MessageBuilderConfig.MAX_DOCUMENT_SIZE_BYTES,
             content_type="document",
         )
@@ -298,7 +371,7 @@ class ConverseMessageBuilder:
         # Auto-detect format if not provided
         if format is None:
             detection_result = self._file_detector.detect_document_format(
-                content=bytes, filename=filename
+                content=header, filename=filename
             )
 
             if not detection_result.is_successful:
@@ -346,7 +419,7 @@ class ConverseMessageBuilder:
         document_block: Dict[str, Any] = {
             ConverseAPIFields.DOCUMENT: {
                 ConverseAPIFields.FORMAT: format.value,
-                ConverseAPIFields.SOURCE: {ConverseAPIFields.BYTES: bytes},
+                ConverseAPIFields.SOURCE: {ConverseAPIFields.BYTES: content},
             }
         }
 
@@ -369,7 +442,7 @@ class ConverseMessageBuilder:
 
         self._logger.debug(
             MessageBuilderLogMessages.CONTENT_BLOCK_ADDED.format(
-                content_type=f"document ({format.value})", size=len(bytes)
+                content_type=f"document ({format.value})", size=len(content)
             )
         )
 
@@ -387,6 +460,9 @@ class ConverseMessageBuilder:
         """
         Add a document content block from a local file path.
 
+        The file is hashed once and stored by reference; its bytes are read when the
+        message is built (see :meth:`build`).
+
         Args:
             path_to_local_file: Path to the local document file
             format: Optional document format (auto-detected if not provided)
@@ -403,43 +479,16 @@ class ConverseMessageBuilder:
             RequestValidationError: If file cannot be read or is invalid
             FileNotFoundError: If the file does not exist
         """
-        file_path = Path(path_to_local_file)
-
-        # Validate file exists
-        if not file_path.exists():
-            raise FileNotFoundError(f"Document file not found: {path_to_local_file}")
-
-        if not file_path.is_file():
-            raise RequestValidationError(f"Path is not a file: {path_to_local_file}")
-
-        # Check file size
-        file_size_mb = file_path.stat().st_size / (1024 * 1024)
-        max_size_bytes = int(max_size_mb * 1024 * 1024)
-
-        if file_size_mb > max_size_mb:
-            self._logger.warning(
-                f"Document {file_path.name} is {file_size_mb:.2f}MB, exceeds limit of {max_size_mb}MB"
-            )
-            raise RequestValidationError(
-                MessageBuilderErrorMessages.CONTENT_SIZE_EXCEEDED.format(
-                    size=file_path.stat().st_size, limit=max_size_bytes, content_type="document"
-                )
-            )
-
-        # Read the file
-        try:
-            with open(file_path, "rb") as document_file:
-                document_bytes = document_file.read()
-        except Exception as e:
-            raise RequestValidationError(
-                f"Failed to read document file {path_to_local_file}: {e}"
-            ) from e
-
-        # Use the existing add_document_bytes method
-        return self.add_document_bytes(
-            bytes=document_bytes,
+        source = self._open_local_file(
+            path_to_local_file=path_to_local_file,
+            max_size_mb=max_size_mb,
+            content_type="document",
+        )
+        return self._add_document_content(
+            content=source,
+            header=source.header,
             format=format,
-            filename=file_path.name,
+            filename=source.path.name,
             name=name,
             citations_enabled=citations_enabled,
             context=context,
@@ -467,9 +516,35 @@ class ConverseMessageBuilder:
                 MessageBuilderErrorMessages.EMPTY_CONTENT.format(content_type="video")
             )
 
+        return self._add_video_content(
+            content=bytes, header=bytes, format=format, filename=filename
+        )
+
+    def _add_video_content(
+        self,
+        content: Union[bytes, FileContentSource],
+        header: bytes,
+        format: Optional[VideoFormatEnum],
+        filename: Optional[str],
+    ) -> "ConverseMessageBuilder":
+        """
+        Validate and add a video content block holding bytes or a local file source.
+
+        Args:
+            content: Video bytes, or a FileContentSource that build() materializes
+            header: Leading bytes of the video, used for format detection
+            format: Optional video format (auto-detected if not provided)
+            filename: Optional filename for format detection and logging
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            RequestValidationError: If video data is invalid or format unsupported
+        """
         self._validate_content_block_limit()
         self._validate_content_size(
-            content_size=len(bytes),
+            content_size=len(content),
             max_size=MessageBuilderConfig.MAX_VIDEO_SIZE_BYTES,
             content_type="video",
         )
@@ -477,7 +552,7 @@ class ConverseMessageBuilder:
         # Auto-detect format if not provided
         if format is None:
             detection_result = self._file_detector.detect_video_format(
-                content=bytes, filename=filename
+                content=header, filename=filename
             )
 
             if not detection_result.is_successful:
@@ -523,7 +598,7 @@ class ConverseMessageBuilder:
         video_block = {
             ConverseAPIFields.VIDEO: {
                 ConverseAPIFields.FORMAT: format.value,
-                ConverseAPIFields.SOURCE: {ConverseAPIFields.BYTES: bytes},
+                ConverseAPIFields.SOURCE: {ConverseAPIFields.BYTES: content},
             }
         }
 
@@ -531,7 +606,7 @@ class ConverseMessageBuilder:
 
         self._logger.debug(
             MessageBuilderLogMessages.CONTENT_BLOCK_ADDED.format(
-                content_type=f"video ({format.value})", size=len(bytes)
+                content_type=f"video ({format.value})", size=len(content)
             )
         )
 
@@ -546,6 +621,9 @@ class ConverseMessageBuilder:
         """
         Add a video content block from a local file path.
 
+        The file is hashed once and stored by reference; its bytes are read when the
+        message is built (see :meth:`build`).
+
         Args:
             path_to_local_file: Path to the local video file
             format: Optional video format (auto-detected if not provided)
@@ -558,41 +636,80 @@ class ConverseMessageBuilder:
             RequestValidationError: If file cannot be read or is invalid
             FileNotFoundError: If the file does not exist
         """
+        source = self._open_local_file(
+            path_to_local_file=path_to_local_file, max_size_mb=max_size_mb, content_type="video"
+        )
+        return self._add_video_content(
+            content=source, header=source.header, format=format, filename=source.path.name
+        )
+
+    def _open_local_file(
+        self, path_to_local_file: str, max_size_mb: float, content_type: str
+    ) -> FileContentSource:
+        """
+        Validate a local media file and create its lazily read content source.
+
+        Args:
+            path_to_local_file: Path to the local file
+            max_size_mb: Maximum allowed size in MB
+            content_type: The media type ("image", "document" or "video"), for messages
+
+        Returns:
+            FileContentSource of the file
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+            RequestValidationError: If the path is not a file, is empty, too large or
+                cannot be read
+        """
         file_path = Path(path_to_local_file)
 
-        # Validate file exists
-        if not file_path.exists():
-            raise FileNotFoundError(f"Video file not found: {path_to_local_file}")
+        # A single stat() covers the existence, file type and size checks
+        try:
+            file_stat = file_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f"{content_type.capitalize()} file not found: {path_to_local_file}"
+            ) from None
+        except OSError as e:
+            raise RequestValidationError(
+                MessageBuilderErrorMessages.LOCAL_FILE_READ_FAILED.format(
+                    content_type=content_type, path=path_to_local_file, error=e
+                )
+            ) from e
 
-        if not file_path.is_file():
+        if not stat.S_ISREG(file_stat.st_mode):
             raise RequestValidationError(f"Path is not a file: {path_to_local_file}")
 
         # Check file size
-        file_size_mb = file_path.stat().st_size / (1024 * 1024)
+        file_size_mb = file_stat.st_size / (1024 * 1024)
         max_size_bytes = int(max_size_mb * 1024 * 1024)
 
         if file_size_mb > max_size_mb:
             self._logger.warning(
-                f"Video {file_path.name} is {file_size_mb:.2f}MB, exceeds limit of {max_size_mb}MB"
+                f"{content_type.capitalize()} {file_path.name} is {file_size_mb:.2f}MB, "
+                f"exceeds limit of {max_size_mb}MB"
             )
             raise RequestValidationError(
                 MessageBuilderErrorMessages.CONTENT_SIZE_EXCEEDED.format(
-                    size=file_path.stat().st_size, limit=max_size_bytes, content_type="video"
+                    size=file_stat.st_size, limit=max_size_bytes, content_type=content_type
                 )
             )
 
-        # Read the file
+        if file_stat.st_size == 0:
+            raise RequestValidationError(
+                MessageBuilderErrorMessages.EMPTY_CONTENT.format(content_type=content_type)
+            )
+
         try:
-            with open(file_path, "rb") as video_file:
-                video_bytes = video_file.read()
-        except Exception as e:
+            return FileContentSource.from_file(path=file_path, stat_result=file_stat)
+        except OSError as e:
             raise RequestValidationError(
-                f"Failed to read video file {path_to_local_file}: {e}"
+                MessageBuilderErrorMessages.LOCAL_FILE_READ_FAILED.format(
+                    content_type=content_type, path=path_to_local_file, error=e
+                )
             ) from e
 
-        # Use the existing add_video_bytes method
-        return self.add_video_bytes(bytes=video_bytes, format=format, filename=file_path.name)
-
     def _build_s3_source(
         self, uri: str, bucket_owner: Optional[str], content_type: str
     ) -> Dict[str, Any]:
@@ -1114,6 +1231,10 @@ class ConverseMessageBuilder:
         """
         Build and return the complete message dictionary.
 
+        Content added from local files is read here. Contents are shared through a
+        process-wide content-addressed cache, so messages attaching the same file
+        reference one buffer.
+
         Returns:
             Dictionary compatible with LLMManager.converse() messages parameter
 
@@ -1133,7 +1254,10 @@ class ConverseMessageBuilder:
         # Build the message dictionary
         message = {
             ConverseAPIFields.ROLE: self._role.value,
-            ConverseAPIFields.CONTENT: self._content_blocks.copy(),
+            ConverseAPIFields.CONTENT: [
+                self._materialize_content_block(content_block=block)
+                for block in self._content_blocks
+            ],
         }
 
         self._logger.info(
@@ -1144,6 +1268,47 @@ class ConverseMessageBuilder:
 
         return message
 
+    def _materialize_content_block(self, content_block: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Replace a local file source in a media content block with the file's bytes.
+
+        Args:
+            content_block: Content block as stored by the builder
+
+        Returns:
+            The block itself, or a copy holding bytes if it referenced a local file
+
+        Raises:
+            RequestValidationError: If the file cannot be read or changed since it was added
+        """
+        for media_field in (
+            ConverseAPIFields.IMAGE,
+            ConverseAPIFields.DOCUMENT,
+            ConverseAPIFields.VIDEO,
+        ):
+            media = content_block.get(media_field)
+            if media is None:
+                continue
+            source = media.get(ConverseAPIFields.SOURCE, {})
+            file_source = source.get(ConverseAPIFields.BYTES)
+            if not isinstance(file_source, FileContentSource):
+                return content_block
+            try:
+                content = file_source.read()
+            except OSError as e:
+                raise RequestValidationError(
+                    MessageBuilderErrorMessages.LOCAL_FILE_READ_FAILED.format(
+                        content_type=media_field, path=file_source.path, error=e
+                    )
+                ) from e
+            return {
+                media_field: {
+                    **media,
+                    ConverseAPIFields.SOURCE: {**source, ConverseAPIFields.BYTES: content},
+                }
+            }
+        return content_block
+
     def _validate_content_block_limit(self) -> None:
         """
         Validate that we haven't exceeded the content block limit.
@@ -1241,7 +1406,9 @@ class ConverseMessageBuilder:
 
 # Factory Functions
 def create_message(
-    role: RolesEnum, cache_config: Optional[CacheConfig] = None
+    role: RolesEnum,
+    cache_config: Optional[CacheConfig] = None,
+    image_preprocessor: Optional[ImagePreprocessor] = None,
 ) -> ConverseMessageBuilder:
     """
     Factory function to create a new ConverseMessageBuilder instance.
@@ -1252,6 +1419,7 @@ def create_message(
     Args:
         role: The role for the message (RolesEnum.USER or RolesEnum.ASSISTANT)
         cache_config: Optional cache configuration for automatic cache point optimization
+        image_preprocessor: Optional preprocessor that downscales and re-encodes images
 
     Returns:
         ConverseMessageBuilder instance ready for method chaining
@@ -1288,11 +1456,22 @@ def create_message(
         ...     .add_cache_point()\\
         ...     .add_text(text="Variable question", cacheable=False)\\
         ...     .build()
+
+        Message with downscaled images:
+        >>> from bestehorn_llmmanager.util.image_preprocessor import ImagePreprocessor
+        >>> message = create_message(role=RolesEnum.USER, image_preprocessor=ImagePreprocessor())\\
+        ...     .add_image_bytes(bytes=camera_jpeg)\\
+        ...     .build()
     """
-    return ConverseMessageBuilder(role=role, cache_config=cache_config)
+    return ConverseMessageBuilder(
+        role=role, cache_config=cache_config, image_preprocessor=image_preprocessor
+    )
 
 
-def create_user_message(cache_config: Optional[CacheConfig] = None) -> ConverseMessageBuilder:
+def create_user_message(
+    cache_config: Optional[CacheConfig] = None,
+    image_preprocessor: Optional[ImagePreprocessor] = None,
+) -> ConverseMessageBuilder:
     """
     Convenience factory function to create a user message builder.
 
@@ -1300,6 +1479,7 @@ def create_user_message(cache_config: Optional[CacheConfig] = None) -> ConverseM
 
     Args:
         cache_config: Optional cache configuration for automatic cache point optimization
+        image_preprocessor: Optional preprocessor that downscales and re-encodes images
 
     Returns:
         ConverseMessageBuilder instance with USER role
@@ -1318,10 +1498,15 @@ def create_user_message(cache_config: Optional[CacheConfig] = None) -> ConverseM
         ...     .add_text(text="Question")\\
         ...     .build()
     """
-    return create_message(role=RolesEnum.USER, cache_config=cache_config)
+    return create_message(
+        role=RolesEnum.USER, cache_config=cache_config, image_preprocessor=image_preprocessor
+    )
 
 
-def create_assistant_message(cache_config: Optional[CacheConfig] = None) -> ConverseMessageBuilder:
+def create_assistant_message(
+    cache_config: Optional[CacheConfig] = None,
+    image_preprocessor: Optional[ImagePreprocessor] = None,
+) -> ConverseMessageBuilder:
     """
     Convenience factory function to create an assistant message builder.
 
@@ -1329,6 +1514,7 @@ def create_assistant_message(cache_config: Optional[CacheConfig] = None) -> Conv
 
     Args:
         cache_config: Optional cache configuration for automatic cache point optimization
+        image_preprocessor: Optional preprocessor that downscales and re-encodes images
 
     Returns:
         ConverseMessageBuilder instance with ASSISTANT role
@@ -1338,7 +1524,9 @@ def create_assistant_message(cache_config: Optional[CacheConfig] = None) -> Conv
         ...     .add_text(text="The weather is sunny and warm.")\\
         ...     .build()
     """
-    return create_message(role=RolesEnum.ASSISTANT, cache_config=cache_config)
+    return create_message(
+        role=RolesEnum.ASSISTANT, cache_config=cache_config, image_preprocessor=image_preprocessor
+    )
 
 
 # Alias for backwards compatibility and naming consistency
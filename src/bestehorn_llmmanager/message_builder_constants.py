@@ -3,7 +3,7 @@ Constants for the ConverseMessageBuilder system.
 Contains string constants and configuration values for message building operations.
 """
 
-from typing import Dict, Final, List
+from typing import Dict, Final, List, Tuple
 
 
 class MessageBuilderFields:
@@ -36,6 +36,29 @@ class MessageBuilderConfig:
     EXTENSION_DETECTION_ENABLED: Final[bool] = True
     CONTENT_DETECTION_ENABLED: Final[bool] = True
 
+    # Local file ingestion (add_local_image/document/video)
+    LOCAL_FILE_HEADER_READ_SIZE: Final[int] = 4096  # Bytes kept for format detection
+    FILE_CONTENT_CACHE_MAX_BYTES: Final[int] = 256 * 1024 * 1024  # Materialized file contents
+    FILE_SOURCE_INDEX_MAX_ENTRIES: Final[int] = 1024  # Hashed files remembered by fingerprint
+
+
+class ImagePreprocessingDefaults:
+    """Default settings of the optional image downscale/transcode stage."""
+
+    # Bedrock downscales larger images before tokenizing them, so pixels beyond these
+    # limits cost upload bytes and latency without adding detail
+    MAX_EDGE_PIXELS: Final[int] = 1568
+    MAX_PIXELS: Final[int] = 1_150_000
+    OUTPUT_FORMAT: Final[str] = "webp"
+    QUALITY: Final[int] = 85  # Encoder quality of lossy output formats (1-95)
+    CACHE_MAX_ENTRIES: Final[int] = 256  # Preprocessed images kept per preprocessor
+    # Formats the stage can encode; GIF is accepted as input only
+    OUTPUT_FORMATS: Final[List[str]] = ["jpeg", "png", "webp"]
+    # Formats without an alpha channel, to which transparent images are flattened
+    OPAQUE_FORMATS: Final[List[str]] = ["jpeg"]
+    BACKGROUND_COLOR: Final[Tuple[int, int, int]] = (255, 255, 255)
+    PILLOW_FORMAT_NAMES: Final[Dict[str, str]] = {"jpeg": "JPEG", "png": "PNG", "webp": "WEBP"}
+
 
 class MessageBuilderLogMessages:
     """Logging message constants for message builder operations."""
@@ -67,6 +90,10 @@ class MessageBuilderLogMessages:
     CONTENT_SIZE_WARNING: Final[str] = (
         "Content size ({size} bytes) approaching limit ({limit} bytes) for {content_type}"
     )
+    IMAGE_PREPROCESSED: Final[str] = (
+        "Preprocessed image {original_width}x{original_height} ({original_size} bytes) "
+        "to {width}x{height} {format} ({size} bytes)"
+    )
     CONTENT_BLOCK_LIMIT_WARNING: Final[str] = (
         "Content block count ({count}) approaching limit ({limit})"
     )
@@ -98,6 +125,19 @@ class MessageBuilderErrorMessages:
         "Detection confidence too low ({confidence:.2f}) for {filename}. Minimum required: {min_confidence:.2f}"
     )
 
+    # Local file errors
+    LOCAL_FILE_READ_FAILED: Final[str] = "Failed to read {content_type} file {path}: {error}"
+    LOCAL_FILE_CHANGED: Final[str] = (
+        "File {path} changed after it was added to the message (size or modification time differs)"
+    )
+
+    # Image preprocessing errors
+    IMAGE_PREPROCESSING_FAILED: Final[str] = "Failed to preprocess image: {error}"
+    PILLOW_REQUIRED: Final[str] = (
+        "Image preprocessing requires Pillow. "
+        "Install it with: pip install bestehorn-llmmanager[images]"
+    )
+
     # Build errors
     BUILD_VALIDATION_FAILED: Final[str] = "Message build validation failed: {errors}"
     NO_CONTENT_BLOCKS: Final[str] = "Cannot build message without content blocks"
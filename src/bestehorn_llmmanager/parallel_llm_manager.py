@@ -7,17 +7,24 @@ load balancing, error handling, and comprehensive response aggregation.
 
 import logging
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, Union, cast
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union, cast
 
+from .bedrock.auth.auth_manager import AuthManager
 from .bedrock.distributors.region_distribution_manager import RegionDistributionManager
+from .bedrock.exceptions.llm_manager_exceptions import LLMManagerError
 from .bedrock.exceptions.parallel_exceptions import (
+    BatchInferenceUnsupportedRequestError,
     ParallelConfigurationError,
     ParallelExecutionError,
     ParallelProcessingError,
 )
+from .bedrock.executors.batch_inference_executor import BatchInferenceExecutor
 from .bedrock.executors.thread_parallel_executor import ThreadParallelExecutor
+from .bedrock.models.batch_inference_constants import BatchInferenceErrorMessages
+from .bedrock.models.batch_inference_structures import BatchInferenceConfig, ExecutionBackend
 from .bedrock.models.bedrock_response import BedrockResponse
 from .bedrock.models.cache_structures import CacheConfig
+from .bedrock.models.latency_structures import ParallelLatencyStats
 from .bedrock.models.llm_manager_constants import LLMManagerConfig
 from .bedrock.models.llm_manager_structures import (
     AuthConfig,
@@ -33,8 +40,12 @@ from .bedrock.models.parallel_structures import (
     ParallelExecutionStats,
     ParallelProcessingConfig,
     ParallelResponse,
+    ParallelResponseStream,
+    ParallelStatsAccumulator,
     RegionAssignment,
 )
+from .bedrock.models.rate_limit_structures import RateLimitConfig
+from .bedrock.models.s3_offload_structures import S3OffloadConfig
 from .bedrock.validators.request_validator import RequestValidator
 from .llm_manager import LLMManager
 
@@ -74,6 +85,18 @@ class ParallelLLMManager:
         ...     regions=["us-east-1", "us-west-2"],
         ...     parallel_config=config
         ... )
+
+        Routing large, deadline-tolerant batches to Bedrock batch inference:
+        >>> parallel_manager = ParallelLLMManager(
+        ...     models=["Claude 3 Haiku"],
+        ...     regions=["us-east-1"],
+        ...     batch_inference_config=BatchInferenceConfig(
+        ...         role_arn="arn:aws:iam::123456789012:role/BedrockBatch",
+        ...         s3_input_uri="s3://my-bucket/batch-input",
+        ...         s3_output_uri="s3://my-bucket/batch-output",
+        ...     ),
+        ... )
+        >>> response = parallel_manager.converse_parallel(requests=many_requests)
     """
 
     def __init__(
@@ -95,6 +118,11 @@ class ParallelLLMManager:
         access_method_preference: Optional[str] = None,
         global_cris_fraction: Optional[float] = None,
         cache_config: Optional[CacheConfig] = None,
+        batch_inference_config: Optional[BatchInferenceConfig] = None,
+        batch_inference_executor: Optional[BatchInferenceExecutor] = None,
+        coalesce_identical_requests: bool = False,
+        rate_limit_config: Optional[RateLimitConfig] = None,
+        s3_offload_config: Optional[S3OffloadConfig] = None,
     ) -> None:
         """
         Initialize the Parallel LLM Manager.
@@ -138,6 +166,26 @@ class ParallelLLMManager:
                 parallel path is byte-identical to before. To enable, pass
                 CacheConfig(enabled=True, ...) and build messages with cacheable blocks /
                 an explicit cache point at the end of the stable prefix.
+            batch_inference_config: Bedrock batch inference configuration. When set,
+                converse_parallel() sends calls with at least
+                ``min_batch_size`` requests and a deadline of at least
+                ``min_deadline_seconds`` (or none) as model invocation jobs instead of
+                on-demand requests. None (default) disables batch inference.
+            batch_inference_executor: Executor used for batch inference. If None, one is
+                created on first use with S3 and Bedrock clients for the configured region.
+            coalesce_identical_requests: If True, identical requests share one Bedrock
+                call: converse_parallel() collapses requests that repeat an ID with
+                identical content instead of raising RequestIdCollisionError, and
+                identical requests in flight at the same time (whatever their IDs) are
+                executed once by the underlying LLMManager. Defaults to False.
+            rate_limit_config: Requests-per-minute and tokens-per-minute quotas per model
+                ID and region, enforced by the underlying LLMManager for every call the
+                worker threads make, so a batch runs at the configured quota instead of
+                being throttled. None (default) disables client-side rate limiting.
+            s3_offload_config: Uploads media payloads above a threshold once to S3 and
+                sends them as s3Location sources, so requests attaching the same large
+                file upload it once and retries do not re-send it. None (default) sends
+                all bytes inline.
 
         Raises:
             ParallelConfigurationError: If configuration is invalid
@@ -152,6 +200,16 @@ class ParallelLLMManager:
         self._regions = regions.copy()
         self._retry_config = retry_config
         self._parallel_config = parallel_config or ParallelProcessingConfig()
+        self._auth_config = auth_config
+        self._boto3_config = boto3_config
+        self._batch_inference_config = batch_inference_config
+        self._batch_inference_executor = batch_inference_executor
+        self._coalesce_identical_requests = coalesce_identical_requests
+        if batch_inference_executor is not None and batch_inference_config is None:
+            raise ParallelConfigurationError(
+                message="batch_inference_executor requires batch_inference_config",
+                invalid_parameter="batch_inference_executor",
+            )
 
         # Initialize core LLMManager for single request execution
         self._llm_manager = LLMManager(
@@ -171,6 +229,9 @@ class ParallelLLMManager:
             access_method_preference=access_method_preference,
             global_cris_fraction=global_cris_fraction,
             cache_config=cache_config,
+            coalesce_identical_requests=coalesce_identical_requests,
+            rate_limit_config=rate_limit_config,
+            s3_offload_config=s3_offload_config,
         )
 
         # Initialize parallel processing components
@@ -270,15 +331,22 @@ class ParallelLLMManager:
         target_regions_per_request: Optional[int] = None,
         response_validation_config: Optional[ResponseValidationConfig] = None,
         model_specific_config: Optional[ModelSpecificConfig] = None,
+        deadline_seconds: Optional[float] = None,
     ) -> ParallelResponse:
         """
         Execute multiple conversation requests in parallel across regions.
 
+        If batch inference is configured and select_execution_backend() picks it, the
+        requests run as Bedrock model invocation jobs instead and this call blocks until
+        the jobs finish.
+
         Args:
             requests: List of BedrockConverseRequest objects to process
             target_regions_per_request: Target number of regions to assign per request
             response_validation_config: Optional validation configuration for responses
             model_specific_config: Optional model-specific configuration to apply to all requests
+            deadline_seconds: Time the caller can wait for the results; used to decide
+                whether batch inference is acceptable (None means no deadline)
 
         Returns:
             ParallelResponse with aggregated results
@@ -291,7 +359,27 @@ class ParallelLLMManager:
 
         try:
             # Step 1: Validate requests
-            self._request_validator.validate_batch_requests(requests=requests)
+            if self._coalesce_identical_requests:
+                requests = self._request_validator.validate_batch_requests(
+                    requests=requests, coalesce_duplicates=True
+                )
+            else:
+                self._request_validator.validate_batch_requests(requests=requests)
+
+            backend = self.select_execution_backend(
+                request_count=len(requests),
+                deadline_seconds=deadline_seconds,
+                requests=requests,
+                response_validation_config=response_validation_config,
+                model_specific_config=model_specific_config,
+            )
+            if backend == ExecutionBackend.BATCH_INFERENCE:
+                try:
+                    return self._converse_batch_inference(
+                        requests=requests, execution_start=execution_start
+                    )
+                except BatchInferenceUnsupportedRequestError as e:
+                    self._logger.warning(f"Falling back to on-demand execution: {e.message}")
 
             # Step 1.5: Auto-calculate target_regions_per_request if not provided
             calculated_target_regions = target_regions_per_request
@@ -312,6 +400,7 @@ class ParallelLLMManager:
             }
 
             # Step 4: Execute requests in parallel with retry support
+            latency_stats = ParallelLatencyStats()
             execution_responses = self._parallel_executor.execute_requests_parallel(
                 assignments=assignments,
                 request_map=request_map,
@@ -321,6 +410,7 @@ class ParallelLLMManager:
                 ),
                 retry_config=self._retry_config,
                 available_regions=self._regions,
+                latency_stats=latency_stats,
             )
 
             # Step 5: Calculate execution statistics
@@ -329,6 +419,7 @@ class ParallelLLMManager:
                 responses=execution_responses,
                 assignments=assignments,
                 total_duration_ms=total_duration,
+                latency_stats=latency_stats,
             )
 
             # Step 6: Create aggregated response with original requests
@@ -354,6 +445,316 @@ class ParallelLLMManager:
                     details={"total_duration_ms": total_duration},
                 ) from e
 
+    def select_execution_backend(
+        self,
+        request_count: int,
+        deadline_seconds: Optional[float] = None,
+        response_validation_config: Optional[ResponseValidationConfig] = None,
+        model_specific_config: Optional[ModelSpecificConfig] = None,
+        requests: Optional[List[BedrockConverseRequest]] = None,
+    ) -> ExecutionBackend:
+        """
+        Select the backend converse_parallel() uses for a call.
+
+        Batch inference is chosen only when it is configured, the call has at least
+        ``min_batch_size`` requests, neither its deadline nor the deadline of any of its
+        requests is less than ``min_deadline_seconds`` away, and it needs neither
+        response validation nor model-specific configuration (both require on-demand
+        retries).
+
+        Args:
+            request_count: Number of requests in the call
+            deadline_seconds: Time the caller can wait for the results
+            response_validation_config: Response validation configuration of the call
+            model_specific_config: Model-specific configuration of the call
+            requests: Requests of the call, whose deadlines are checked as well
+
+        Returns:
+            Selected execution backend
+        """
+        config = self._batch_inference_config
+        if config is None:
+            return ExecutionBackend.ON_DEMAND
+
+        remaining_times = [
+            remaining
+            for remaining in (request.get_remaining_time() for request in requests or [])
+            if remaining is not None
+        ]
+        if deadline_seconds is not None:
+            remaining_times.append(deadline_seconds)
+
+        if (
+            request_count < config.min_batch_size
+            or (remaining_times and min(remaining_times) < config.min_deadline_seconds)
+            or response_validation_config is not None
+            or model_specific_config is not None
+        ):
+            return ExecutionBackend.ON_DEMAND
+        return ExecutionBackend.BATCH_INFERENCE
+
+    def _converse_batch_inference(
+        self, requests: List[BedrockConverseRequest], execution_start: datetime
+    ) -> ParallelResponse:
+        """
+        Execute validated requests as batch inference jobs.
+
+        Args:
+            requests: Validated requests
+            execution_start: Start time of the converse_parallel() call
+
+        Returns:
+            ParallelResponse with aggregated results
+
+        Raises:
+            BatchInferenceUnsupportedRequestError: If a request cannot be sent as a batch
+                record (nothing has been submitted yet)
+            BatchInferenceError: If a job cannot be submitted, polled or read
+            ParallelExecutionError: If failure strategy conditions are met
+        """
+        executor = self._get_batch_inference_executor()
+        region = self._get_batch_inference_region()
+        responses = executor.execute_requests(
+            requests=requests, model_id=self._resolve_batch_model_id(region=region)
+        )
+        if self._parallel_config.compact_responses:
+            for response in responses.values():
+                response.compact()
+
+        request_map = {request.request_id: request for request in requests if request.request_id}
+        assignments = [
+            RegionAssignment(request_id=request_id, assigned_regions=[region])
+            for request_id in request_map
+        ]
+        total_duration = (datetime.now() - execution_start).total_seconds() * 1000
+        execution_stats = self._calculate_execution_stats(
+            responses=responses, assignments=assignments, total_duration_ms=total_duration
+        )
+        parallel_response = self._create_parallel_response(
+            responses=responses,
+            execution_stats=execution_stats,
+            total_duration_ms=total_duration,
+            original_requests=request_map,
+        )
+        self._handle_failure_strategy(parallel_response=parallel_response)
+        return parallel_response
+
+    def _get_batch_inference_region(self) -> str:
+        """Get the region batch inference jobs are submitted in."""
+        config = cast(BatchInferenceConfig, self._batch_inference_config)
+        return config.region or self._regions[0]
+
+    def _get_batch_inference_executor(self) -> BatchInferenceExecutor:
+        """
+        Get the batch inference executor, creating it with AWS clients on first use.
+
+        Returns:
+            Batch inference executor
+        """
+        if self._batch_inference_executor is None:
+            config = cast(BatchInferenceConfig, self._batch_inference_config)
+            region = self._get_batch_inference_region()
+            auth_manager = AuthManager(
+                auth_config=self._auth_config, boto3_config=self._boto3_config
+            )
+            self._batch_inference_executor = BatchInferenceExecutor(
+                config=config,
+                bedrock_client=auth_manager.get_bedrock_control_client(region=region),
+                s3_client=auth_manager.get_session(region=region).client("s3", region_name=region),
+                region=region,
+            )
+        return self._batch_inference_executor
+
+    def _resolve_batch_model_id(self, region: str) -> str:
+        """
+        Resolve the model or inference profile ID batch jobs run against.
+
+        Uses ``BatchInferenceConfig.model_id`` if set, otherwise the first configured
+        model's direct model ID in the batch region, falling back to its regional
+        inference profile.
+
+        Args:
+            region: Region the jobs are submitted in
+
+        Returns:
+            Model or inference profile ID
+
+        Raises:
+            ParallelConfigurationError: If no ID can be resolved
+        """
+        config = cast(BatchInferenceConfig, self._batch_inference_config)
+        if config.model_id:
+            return config.model_id
+
+        model = self._models[0]
+        access_info = self._llm_manager.get_model_access_info(model_name=model, region=region)
+        if access_info:
+            if "direct" in access_info.get("access_methods", []) and access_info.get("model_id"):
+                return str(access_info["model_id"])
+            if access_info.get("regional_cris_profile_id"):
+                return str(access_info["regional_cris_profile_id"])
+
+        raise ParallelConfigurationError(
+            message=BatchInferenceErrorMessages.MODEL_NOT_RESOLVED.format(
+                model=model, region=region
+            ),
+            invalid_parameter="batch_inference_config.model_id",
+        )
+
+    def converse_parallel_iter(
+        self,
+        requests: Iterable[BedrockConverseRequest],
+        target_regions_per_request: Optional[int] = None,
+        response_validation_config: Optional[ResponseValidationConfig] = None,
+        model_specific_config: Optional[ModelSpecificConfig] = None,
+        max_in_flight: Optional[int] = None,
+    ) -> ParallelResponseStream:
+        """
+        Execute a stream of conversation requests, yielding each result as it completes.
+
+        The streaming counterpart of :meth:`converse_parallel` for large offline jobs.
+        Requests are pulled lazily from ``requests`` (which may be a generator), at most
+        ``max_in_flight`` of them are executing or awaiting retry at any time, and every
+        ``(request_id, BedrockResponse)`` is handed to the caller as soon as it is final
+        and then released. Memory therefore stays bounded by the in-flight window rather
+        than the batch size; only the request IDs seen so far are kept, to detect ID
+        collisions.
+
+        Each request is validated when it is pulled, so a malformed request raises from
+        the iteration at that point rather than before any work starts. Failure handling
+        strategies apply as results arrive: with STOP_ON_FIRST_FAILURE the iteration
+        raises after yielding the first failed response; with STOP_ON_THRESHOLD the
+        failure rate is checked once the stream is exhausted.
+
+        Args:
+            requests: Iterable of BedrockConverseRequest objects, consumed lazily
+            target_regions_per_request: Target number of regions to assign per request
+            response_validation_config: Optional validation configuration for responses
+            model_specific_config: Optional model-specific configuration to apply to all requests
+            max_in_flight: Maximum requests executing or awaiting retry at once.
+                Defaults to ``max_concurrent_requests``.
+
+        Returns:
+            ParallelResponseStream yielding ``(request_id, BedrockResponse)`` tuples in
+            completion order; its ``get_execution_stats()`` reports aggregate statistics
+            for the results delivered so far
+
+        Raises:
+            ParallelConfigurationError: If max_in_flight is not positive
+
+        Example:
+            >>> stream = parallel_manager.converse_parallel_iter(requests=read_requests())
+            >>> for request_id, response in stream:
+            ...     store(request_id, response.get_content())
+            >>> print(stream.get_execution_stats().success_rate)
+        """
+        if max_in_flight is not None and max_in_flight <= 0:
+            raise ParallelConfigurationError(
+                message=f"max_in_flight must be positive, got: {max_in_flight}",
+                invalid_parameter="max_in_flight",
+                provided_value=max_in_flight,
+            )
+
+        stats = ParallelStatsAccumulator()
+        results = self._iterate_parallel_results(
+            requests=requests,
+            target_regions_per_request=target_regions_per_request,
+            response_validation_config=response_validation_config,
+            model_specific_config=model_specific_config,
+            max_in_flight=max_in_flight,
+            stats=stats,
+        )
+        return ParallelResponseStream(results=results, stats=stats)
+
+    def _iterate_parallel_results(
+        self,
+        requests: Iterable[BedrockConverseRequest],
+        target_regions_per_request: Optional[int],
+        response_validation_config: Optional[ResponseValidationConfig],
+        model_specific_config: Optional[ModelSpecificConfig],
+        max_in_flight: Optional[int],
+        stats: ParallelStatsAccumulator,
+    ) -> Iterator[Tuple[str, BedrockResponse]]:
+        """
+        Generate results for :meth:`converse_parallel_iter`.
+
+        Args:
+            requests: Iterable of requests, consumed lazily
+            target_regions_per_request: Target number of regions to assign per request
+            response_validation_config: Optional validation configuration for responses
+            model_specific_config: Optional model-specific configuration
+            max_in_flight: Maximum requests executing or awaiting retry at once
+            stats: Accumulator updated as results complete
+
+        Yields:
+            Tuples of (request_id, BedrockResponse) in completion order
+
+        Raises:
+            ParallelProcessingError: If parallel processing fails
+            ParallelExecutionError: If the failure handling strategy stops execution
+        """
+        calculated_target_regions = target_regions_per_request
+        if calculated_target_regions is None:
+            calculated_target_regions = self._calculate_optimal_target_regions()
+            self._log_target_regions_adjustment(calculated_target_regions)
+
+        self._region_distributor.reset_load_tracking()
+        seen_request_ids: Set[str] = set()
+
+        def assigned_requests() -> Iterator[Tuple[RegionAssignment, BedrockConverseRequest]]:
+            for request in requests:
+                self._request_validator.validate_streamed_request(
+                    request=request, seen_request_ids=seen_request_ids
+                )
+                assignment = self._region_distributor.assign_request(
+                    request=request,
+                    available_regions=self._regions,
+                    target_regions_per_request=calculated_target_regions,
+                )
+                yield assignment, request
+
+        strategy = self._parallel_config.failure_handling_strategy
+        try:
+            for request_id, response in self._parallel_executor.execute_requests_iter(
+                request_stream=assigned_requests(),
+                execute_single_request_func=self._create_single_request_executor(
+                    response_validation_config=response_validation_config,
+                    model_specific_config=model_specific_config,
+                ),
+                retry_config=self._retry_config,
+                available_regions=self._regions,
+                max_in_flight=max_in_flight,
+                stats=stats,
+            ):
+                yield request_id, response
+
+                if (
+                    not response.success
+                    and strategy == FailureHandlingStrategy.STOP_ON_FIRST_FAILURE
+                ):
+                    raise ParallelExecutionError(
+                        message="Parallel execution stopped due to first failure",
+                        failed_requests=[request_id],
+                        total_requests=stats.total_requests,
+                    )
+        except LLMManagerError:
+            # Library errors, including those raised by a request iterable, pass through.
+            raise
+        except Exception as e:
+            raise ParallelProcessingError(
+                message=f"Parallel processing failed: {str(e)}",
+                details={"completed_requests": stats.total_requests},
+            ) from e
+
+        if strategy == FailureHandlingStrategy.STOP_ON_THRESHOLD and stats.total_requests:
+            failure_rate = stats.failed_requests_count / stats.total_requests
+            if failure_rate > self._parallel_config.failure_threshold:
+                raise ParallelExecutionError(
+                    message=f"Parallel execution stopped due to failure rate {failure_rate:.1%} exceeding threshold {self._parallel_config.failure_threshold:.1%}",
+                    failed_requests=[],
+                    total_requests=stats.total_requests,
+                )
+
     def _create_single_request_executor(
         self,
         response_validation_config: Optional[ResponseValidationConfig] = None,
@@ -376,9 +777,12 @@ class ParallelLLMManager:
             if model_specific_config is not None and "model_specific_config" not in converse_args:
                 converse_args["model_specific_config"] = model_specific_config
 
-            return self._llm_manager.converse(
+            response = self._llm_manager.converse(
                 response_validation_config=response_validation_config, **converse_args
             )
+            if self._parallel_config.compact_responses:
+                response.compact()
+            return response
 
         return execute_single_request
 
@@ -387,6 +791,7 @@ class ParallelLLMManager:
         responses: Dict[str, "BedrockResponse"],
         assignments: List["RegionAssignment"],
         total_duration_ms: float,
+        latency_stats: Optional[ParallelLatencyStats] = None,
     ) -> ParallelExecutionStats:
         """
         Calculate execution statistics from responses.
@@ -395,6 +800,9 @@ class ParallelLLMManager:
             responses: Dictionary of responses
             assignments: List of region assignments
             total_duration_ms: Total execution duration
+            latency_stats: Queue waits and peak concurrency recorded by the executor; the
+                response latencies are added to it. Without it, the peak concurrency is
+                estimated from max_concurrent_requests.
 
         Returns:
             ParallelExecutionStats object
@@ -421,8 +829,16 @@ class ParallelLLMManager:
             for region in assignment.assigned_regions:
                 region_distribution[region] = region_distribution.get(region, 0) + 1
 
-        # Calculate peak concurrent executions
-        concurrent_executions = min(len(responses), self._parallel_config.max_concurrent_requests)
+        # Record latency histograms and use the measured peak concurrency if available
+        if latency_stats is not None:
+            concurrent_executions = latency_stats.peak_concurrency
+        else:
+            latency_stats = ParallelLatencyStats()
+            concurrent_executions = min(
+                len(responses), self._parallel_config.max_concurrent_requests
+            )
+        for response in responses.values():
+            latency_stats.record_response(response=response)
 
         return ParallelExecutionStats(
             total_requests=len(responses),
@@ -433,6 +849,7 @@ class ParallelLLMManager:
             min_request_duration_ms=min_duration,
             concurrent_executions=concurrent_executions,
             region_distribution=region_distribution,
+            latency=latency_stats,
         )
 
     def _create_parallel_response(
@@ -754,6 +1171,18 @@ class ParallelLLMManager:
             ) in retry_response.parallel_execution_stats.region_distribution.items():
                 merged_region_dist[region] = merged_region_dist.get(region, 0) + count
 
+        # Merge latency histograms of both rounds
+        previous_stats = previous_response.parallel_execution_stats
+        retry_stats = retry_response.parallel_execution_stats
+        previous_latency = previous_stats.latency if previous_stats else None
+        retry_latency = retry_stats.latency if retry_stats else None
+        if previous_latency is not None and retry_latency is not None:
+            merged_latency: Optional[ParallelLatencyStats] = previous_latency.merge(
+                other=retry_latency
+            )
+        else:
+            merged_latency = previous_latency or retry_latency
+
         merged_stats = ParallelExecutionStats(
             total_requests=len(merged_responses),
             successful_requests=successful_count,
@@ -774,6 +1203,7 @@ class ParallelLLMManager:
                 ),
             ),
             region_distribution=merged_region_dist,
+            latency=merged_latency,
         )
 
         # Determine overall success
@@ -0,0 +1,267 @@
+"""
+Tool-use (function calling) loop with concurrent tool execution.
+
+run_tool_loop sends a conversation to an LLMManager, runs the tools the model requests
+and sends their results back until the model stops requesting tools. All tool calls of
+one assistant turn run at the same time, so a turn with several tool calls takes as
+long as its slowest tool instead of the sum of all of them. Every call has a timeout;
+tools that fail or time out are reported to the model as error results.
+
+The retry targets are planned once per loop and every follow-up call prefers the
+region that answered the previous one, so the turns of one loop stay on the region
+holding the conversation's prompt cache while keeping the other regions for failover.
+
+Example:
+    >>> result = run_tool_loop(
+    ...     manager=manager,
+    ...     messages=[create_user_message().add_text("Weather in Paris?").build()],
+    ...     tools={"get_weather": lambda tool_input: fetch_weather(tool_input["city"])},
+    ...     tool_config=tool_config,
+    ... )
+    >>> result.get_content()
+"""
+
+import asyncio
+import inspect
+import logging
+import time
+from concurrent.futures import (
+    Executor,
+    Future,
+    ThreadPoolExecutor,
+    TimeoutError as FutureTimeoutError,
+)
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+from .bedrock.models.llm_manager_constants import (
+    ConverseAPIFields,
+    ToolLoopConfig,
+    ToolLoopMessages,
+)
+from .bedrock.models.tool_use import ToolCallResult, ToolLoopResult, ToolUse
+from .llm_manager import LLMManager
+from .message_builder import create_user_message
+from .message_builder_enums import ToolResultStatusEnum
+
+ToolFunction = Callable[[Dict[str, Any]], Any]
+
+_logger = logging.getLogger(__name__)
+
+
+def _call_tool(tool: ToolFunction, tool_input: Dict[str, Any]) -> Any:
+    """Call a tool with its input; coroutine functions run in their own event loop."""
+    if inspect.iscoroutinefunction(tool):
+        return asyncio.run(tool(tool_input))
+    return tool(tool_input)
+
+
+def _to_tool_result_content(value: Any) -> Any:
+    """Convert a tool's return value into content add_tool_result accepts."""
+    if isinstance(value, str) and value.strip():
+        return value
+    if isinstance(value, (dict, list)) and value:
+        return value
+    if value is None or isinstance(value, (bool, int, float, str, dict, list)):
+        return {"result": value}
+    return str(value)
+
+
+def _run_tool_calls(
+    tool_uses: List[ToolUse],
+    tools: Mapping[str, ToolFunction],
+    executor: Executor,
+    timeouts: Dict[str, float],
+    turn: int,
+) -> List[ToolCallResult]:
+    """
+    Run the tool calls of one assistant turn concurrently.
+
+    Args:
+        tool_uses: Tool calls the model requested
+        tools: Tool functions by name
+        executor: Executor the calls are submitted to
+        timeouts: Timeout of every tool call in seconds, by tool use ID
+        turn: Number of the model call that requested the tools
+
+    Returns:
+        Results in the order of tool_uses
+    """
+    start = time.perf_counter()
+    futures: Dict[str, Future] = {}
+    for tool_use in tool_uses:
+        tool = tools.get(tool_use.name)
+        if tool is not None:
+            futures[tool_use.tool_use_id] = executor.submit(_call_tool, tool, tool_use.input)
+
+    results: List[ToolCallResult] = []
+    for tool_use in tool_uses:
+        future = futures.get(tool_use.tool_use_id)
+        success = False
+        if future is None:
+            content: Any = ToolLoopMessages.UNKNOWN_TOOL.format(name=tool_use.name)
+        else:
+            timeout_seconds = timeouts[tool_use.tool_use_id]
+            remaining = max(0.0, start + timeout_seconds - time.perf_counter())
+            try:
+                content = _to_tool_result_content(value=future.result(timeout=remaining))
+                success = True
+            except FutureTimeoutError:
+                future.cancel()
+                content = ToolLoopMessages.TOOL_TIMED_OUT.format(
+                    name=tool_use.name, timeout_seconds=timeout_seconds
+                )
+            except Exception as error:
+                content = ToolLoopMessages.TOOL_FAILED.format(name=tool_use.name, error=error)
+        if not success:
+            _logger.warning(content)
+        results.append(
+            ToolCallResult(
+                tool_use_id=tool_use.tool_use_id,
+                name=tool_use.name,
+                content=content,
+                success=success,
+                duration_ms=(time.perf_counter() - start) * 1000,
+                turn=turn,
+            )
+        )
+    return results
+
+
+def _build_tool_result_message(results: List[ToolCallResult]) -> Dict[str, Any]:
+    """Build the user message carrying the results of one turn's tool calls."""
+    builder = create_user_message()
+    for result in results:
+        builder.add_tool_result(
+            tool_use_id=result.tool_use_id,
+            content=result.content,
+            status=ToolResultStatusEnum.SUCCESS if result.success else ToolResultStatusEnum.ERROR,
+        )
+    return builder.build()
+
+
+def run_tool_loop(
+    manager: LLMManager,
+    messages: List[Dict[str, Any]],
+    tools: Mapping[str, ToolFunction],
+    tool_config: Dict[str, Any],
+    executor: Optional[Executor] = None,
+    system: Optional[List[Dict[str, Any]]] = None,
+    max_turns: int = ToolLoopConfig.DEFAULT_MAX_TURNS,
+    tool_timeout_seconds: float = ToolLoopConfig.DEFAULT_TOOL_TIMEOUT_SECONDS,
+    tool_timeouts: Optional[Mapping[str, float]] = None,
+    **converse_kwargs: Any,
+) -> ToolLoopResult:
+    """
+    Converse with a model, running the tools it requests until it stops requesting them.
+
+    Each tool function is called with the parsed input of the tool call (a dict) and
+    returns the result: a string, a JSON object, a list of ToolResultContentBlocks, or
+    any other value, which is sent as ``{"result": value}`` (or its string form if it
+    is not a JSON value). Coroutine functions are run with asyncio.run on the worker
+    thread. Exceptions, timeouts and unknown tool names become error results the model
+    sees, so it can recover.
+
+    A timed-out tool cannot be interrupted: its thread keeps running in the background,
+    but the loop does not wait for it.
+
+    Args:
+        manager: LLMManager to converse with
+        messages: Conversation so far, ending with a user message; not modified
+        tools: Tool functions by tool name
+        tool_config: Converse tool configuration declaring the tools to the model
+        executor: Executor running the tool calls; None runs the calls of each turn on
+            a thread pool with one thread per call. A shared executor with fewer
+            workers queues calls, and the queued time counts towards their timeouts
+        system: System prompt
+        max_turns: Maximum number of model calls
+        tool_timeout_seconds: Timeout of each tool call, measured from its dispatch
+        tool_timeouts: Timeouts by tool name, overriding tool_timeout_seconds
+        **converse_kwargs: Further arguments of LLMManager.converse (e.g.
+            inference_config)
+
+    Returns:
+        ToolLoopResult with the final response, the full conversation and the tool
+        call results
+
+    Raises:
+        ValueError: If max_turns or a timeout is not positive
+        RetryExhaustedError: If a model call fails on all retry targets
+    """
+    if max_turns <= 0:
+        raise ValueError(ToolLoopMessages.INVALID_MAX_TURNS.format(max_turns=max_turns))
+    timeouts_by_name = dict(tool_timeouts or {})
+    for name, timeout_seconds in [("default", tool_timeout_seconds), *timeouts_by_name.items()]:
+        if timeout_seconds <= 0:
+            raise ValueError(
+                ToolLoopMessages.INVALID_TOOL_TIMEOUT.format(
+                    name=name, timeout_seconds=timeout_seconds
+                )
+            )
+
+    conversation = list(messages)
+    tool_calls: List[ToolCallResult] = []
+    retry_targets = manager.plan_retry_targets()
+    preferred_region: Optional[str] = None
+    turn = 0
+
+    while True:
+        turn += 1
+        response = manager.converse(
+            messages=list(conversation),
+            system=system,
+            tool_config=tool_config,
+            retry_targets=retry_targets,
+            preferred_region=preferred_region,
+            **converse_kwargs,
+        )
+        preferred_region = response.region_used
+        conversation.append(
+            {
+                ConverseAPIFields.ROLE: ConverseAPIFields.ROLE_ASSISTANT,
+                ConverseAPIFields.CONTENT: response.get_content_blocks() or [],
+            }
+        )
+
+        tool_uses = response.get_tool_uses()
+        requests_tools = (
+            response.get_stop_reason() == ConverseAPIFields.STOP_REASON_TOOL_USE and bool(tool_uses)
+        )
+        if not requests_tools or turn == max_turns:
+            if requests_tools:
+                _logger.warning(ToolLoopMessages.MAX_TURNS_REACHED.format(max_turns=max_turns))
+            return ToolLoopResult(
+                response=response,
+                messages=conversation,
+                model_calls=turn,
+                tool_calls=tool_calls,
+                completed=not requests_tools,
+            )
+
+        _logger.debug(
+            ToolLoopMessages.TOOL_TURN.format(
+                turn=turn,
+                count=len(tool_uses),
+                names=", ".join(tool_use.name for tool_use in tool_uses),
+            )
+        )
+        timeouts = {
+            tool_use.tool_use_id: timeouts_by_name.get(tool_use.name, tool_timeout_seconds)
+            for tool_use in tool_uses
+        }
+        turn_executor = executor or ThreadPoolExecutor(
+            max_workers=len(tool_uses), thread_name_prefix=ToolLoopConfig.THREAD_NAME_PREFIX
+        )
+        try:
+            results = _run_tool_calls(
+                tool_uses=tool_uses,
+                tools=tools,
+                executor=turn_executor,
+                timeouts=timeouts,
+                turn=turn,
+            )
+        finally:
+            if executor is None:
+                # Do not wait for timed-out tools
+                turn_executor.shutdown(wait=False)
+        tool_calls.extend(results)
+        conversation.append(_build_tool_result_message(results=results))
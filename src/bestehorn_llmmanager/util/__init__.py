@@ -5,7 +5,10 @@ This package contains general-purpose utilities that can be used across
 different components of the LLMManager system.
 """
 
+from .canonical_json import canonical_json_dumps, canonicalize_json_value
+from .file_content_source import FileContentCache, FileContentSource
 from .file_type_detector import DetectionResult, FileTypeDetector
+from .image_preprocessor import ImagePreprocessingConfig, ImagePreprocessor, PreprocessedImage
 from .streaming_display import (
     StreamingDisplayFormatter,
     display_recovery_information,
@@ -16,8 +19,15 @@ from .streaming_display import (
 __all__ = [
     "FileTypeDetector",
     "DetectionResult",
+    "FileContentSource",
+    "FileContentCache",
+    "ImagePreprocessor",
+    "ImagePreprocessingConfig",
+    "PreprocessedImage",
     "StreamingDisplayFormatter",
     "display_streaming_response",
     "display_streaming_summary",
     "display_recovery_information",
+    "canonical_json_dumps",
+    "canonicalize_json_value",
 ]
@@ -0,0 +1,52 @@
+"""
+Canonical JSON form of request content.
+
+Request keys (single-flight coalescing, cache-prefix grouping) hash the JSON form of
+Converse arguments. The canonical form sorts dictionary keys and replaces values json
+cannot serialize with stable stand-ins, so equal content always gives equal text.
+"""
+
+import dataclasses
+import hashlib
+import json
+from enum import Enum
+from typing import Any
+
+
+def canonicalize_json_value(value: Any) -> Any:
+    """
+    Convert a value json cannot serialize into a stable, hashable stand-in.
+
+    Used as the ``default`` hook of json.dumps. Binary content is replaced by its
+    SHA-256 hash, enums by their values, dataclasses by their fields and sets by their
+    sorted items; other objects (e.g. callables) only match themselves.
+
+    Args:
+        value: Value json.dumps cannot serialize
+
+    Returns:
+        JSON-serializable stand-in for the value
+    """
+    if isinstance(value, (bytes, bytearray)):
+        return f"<bytes_hash:{hashlib.sha256(value).hexdigest()}>"
+    if isinstance(value, Enum):
+        return value.value
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {field.name: getattr(value, field.name) for field in dataclasses.fields(value)}
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=repr)
+    # Callables and other opaque objects only match themselves
+    return f"<{type(value).__qualname__}@{id(value):x}>"
+
+
+def canonical_json_dumps(obj: Any) -> str:
+    """
+    Serialize a value to its canonical JSON form.
+
+    Args:
+        obj: Value to serialize
+
+    Returns:
+        JSON text with sorted keys and canonical stand-ins for non-JSON values
+    """
+    return json.dumps(obj=obj, sort_keys=True, ensure_ascii=False, default=canonicalize_json_value)
@@ -0,0 +1,306 @@
+"""
+Lazily read local file content for ConverseMessageBuilder.
+
+Reading media files eagerly costs one full copy per attachment, and attaching the
+same file to many requests multiplies that. A FileContentSource instead records the
+file's fingerprint, SHA-256 digest and header: the digest is computed once through a
+memory map (the file is never copied onto the Python heap to hash it), and the bytes
+are only materialized when a message is built. Materialized contents live in a
+process-wide content-addressed cache, so every message attaching the same file
+shares one buffer.
+"""
+
+import hashlib
+import mmap
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+from ..bedrock.exceptions.llm_manager_exceptions import RequestValidationError
+from ..message_builder_constants import MessageBuilderConfig, MessageBuilderErrorMessages
+
+# (resolved path, device, inode, size, modification time in ns)
+_Fingerprint = Tuple[str, int, int, int, int]
+
+
+class FileContentSource:
+    """
+    Reference to the content of a local file, read on demand.
+
+    Attributes:
+        path: Path of the file
+        size: File size in bytes when the source was created
+        digest: Hex SHA-256 digest of the content
+        header: Leading bytes of the file, for format detection
+    """
+
+    def __init__(self, path: Path, size: int, mtime_ns: int, digest: str, header: bytes) -> None:
+        """
+        Initialize the source. Use FileContentSource.from_file() to create sources.
+
+        Args:
+            path: Path of the file
+            size: File size in bytes
+            mtime_ns: Modification time in nanoseconds, used to detect later changes
+            digest: Hex SHA-256 digest of the content
+            header: Leading bytes of the file
+        """
+        self.path = path
+        self.size = size
+        self.digest = digest
+        self.header = header
+        self._mtime_ns = mtime_ns
+
+    @classmethod
+    def from_file(cls, path: Path, stat_result: os.stat_result) -> "FileContentSource":
+        """
+        Create the source of a regular file, hashing it unless it was hashed before.
+
+        Args:
+            path: Path of the file
+            stat_result: Result of stat() on the file
+
+        Returns:
+            FileContentSource for the file (shared with earlier calls for an unchanged file)
+
+        Raises:
+            OSError: If the file cannot be opened or mapped
+        """
+        return FileContentCache.get_instance().get_source(path=path, stat_result=stat_result)
+
+    def read(self) -> bytes:
+        """
+        Get the file content, shared with every other source of the same content.
+
+        Returns:
+            File content
+
+        Raises:
+            OSError: If the file cannot be read
+            RequestValidationError: If the file changed since the source was created
+        """
+        return FileContentCache.get_instance().get_content(
+            digest=self.digest, loader=self._load_content
+        )
+
+    def _load_content(self) -> bytes:
+        """
+        Read the file, checking that it is unchanged.
+
+        The content is cached under the digest, so a same-size rewrite that keeps the
+        modification time (within the file system's granularity, or through an
+        mtime-preserving copy) must not slip through: the bytes read are hashed and
+        compared with the digest as well.
+
+        Returns:
+            File content
+
+        Raises:
+            RequestValidationError: If the file's size, modification time or content
+                changed since the source was created
+        """
+        with open(self.path, "rb") as file:
+            stat_result = os.fstat(file.fileno())
+            if stat_result.st_size != self.size or stat_result.st_mtime_ns != self._mtime_ns:
+                raise RequestValidationError(
+                    MessageBuilderErrorMessages.LOCAL_FILE_CHANGED.format(path=self.path)
+                )
+            content = file.read()
+        if hashlib.sha256(content).hexdigest() != self.digest:
+            raise RequestValidationError(
+                MessageBuilderErrorMessages.LOCAL_FILE_CHANGED.format(path=self.path)
+            )
+        return content
+
+    def __len__(self) -> int:
+        """Get the content size in bytes."""
+        return self.size
+
+    def __repr__(self) -> str:
+        """Detailed string representation of the source."""
+        return (
+            f"FileContentSource(path={str(self.path)!r}, size={self.size}, "
+            f"digest={self.digest[:12]})"
+        )
+
+
+class FileContentCache:
+    """
+    Process-wide cache behind FileContentSource.
+
+    Keeps two LRU maps: file fingerprints to sources (so re-attaching an unchanged file
+    skips hashing) and SHA-256 digests to materialized contents, bounded by total size.
+    Uses the singleton pattern so that all builders share it; access is thread-safe.
+    """
+
+    _instance: Optional["FileContentCache"] = None
+    _instance_lock: threading.Lock = threading.Lock()
+
+    def __init__(
+        self,
+        max_bytes: int = MessageBuilderConfig.FILE_CONTENT_CACHE_MAX_BYTES,
+        max_sources: int = MessageBuilderConfig.FILE_SOURCE_INDEX_MAX_ENTRIES,
+    ) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_bytes: Maximum total size of cached contents
+            max_sources: Maximum number of remembered file fingerprints
+        """
+        self._lock = threading.Lock()
+        self._max_bytes = max_bytes
+        self._max_sources = max_sources
+        self._sources: "OrderedDict[_Fingerprint, FileContentSource]" = OrderedDict()
+        self._contents: "OrderedDict[str, bytes]" = OrderedDict()
+        self._cached_bytes = 0
+        self._hits = 0
+        self._misses = 0
+
+    @classmethod
+    def get_instance(cls) -> "FileContentCache":
+        """
+        Get the process-wide cache.
+
+        Returns:
+            The FileContentCache singleton
+        """
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def set_max_bytes(self, max_bytes: int) -> None:
+        """
+        Change the content size budget, evicting contents beyond it.
+
+        Args:
+            max_bytes: Maximum total size of cached contents (0 disables caching)
+        """
+        with self._lock:
+            self._max_bytes = max_bytes
+            self._evict()
+
+    def get_source(self, path: Path, stat_result: os.stat_result) -> FileContentSource:
+        """
+        Get the source of a file, hashing it on first use.
+
+        Args:
+            path: Path of the file
+            stat_result: Result of stat() on the file
+
+        Returns:
+            FileContentSource of the file
+        """
+        fingerprint: _Fingerprint = (
+            str(path.resolve()),
+            stat_result.st_dev,
+            stat_result.st_ino,
+            stat_result.st_size,
+            stat_result.st_mtime_ns,
+        )
+        with self._lock:
+            source = self._sources.get(fingerprint)
+            if source is not None:
+                self._sources.move_to_end(fingerprint)
+                return source
+
+        digest, header = _hash_file(path=path, size=stat_result.st_size)
+        source = FileContentSource(
+            path=path,
+            size=stat_result.st_size,
+            mtime_ns=stat_result.st_mtime_ns,
+            digest=digest,
+            header=header,
+        )
+        with self._lock:
+            self._sources[fingerprint] = source
+            while len(self._sources) > self._max_sources:
+                self._sources.popitem(last=False)
+        return source
+
+    def get_content(self, digest: str, loader: Callable[[], bytes]) -> bytes:
+        """
+        Get cached content by digest, loading it on a miss.
+
+        Args:
+            digest: Hex SHA-256 digest of the content
+            loader: Function reading the content
+
+        Returns:
+            Content, shared with all other callers asking for the same digest
+        """
+        with self._lock:
+            content = self._contents.get(digest)
+            if content is not None:
+                self._contents.move_to_end(digest)
+                self._hits += 1
+                return content
+
+        content = loader()
+        with self._lock:
+            # Another thread may have loaded the same content meanwhile; share its buffer
+            existing = self._contents.get(digest)
+            if existing is not None:
+                self._hits += 1
+                return existing
+            self._misses += 1
+            if len(content) <= self._max_bytes:
+                self._contents[digest] = content
+                self._cached_bytes += len(content)
+                self._evict()
+        return content
+
+    def clear(self) -> None:
+        """Remove all cached sources and contents and reset the statistics."""
+        with self._lock:
+            self._sources.clear()
+            self._contents.clear()
+            self._cached_bytes = 0
+            self._hits = 0
+            self._misses = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with cached contents, their total size, sources, hits and misses
+        """
+        with self._lock:
+            return {
+                "contents": len(self._contents),
+                "cached_bytes": self._cached_bytes,
+                "sources": len(self._sources),
+                "hits": self._hits,
+                "misses": self._misses,
+            }
+
+    def _evict(self) -> None:
+        """Evict least recently used contents beyond the size budget (lock must be held)."""
+        while self._cached_bytes > self._max_bytes and self._contents:
+            _, evicted = self._contents.popitem(last=False)
+            self._cached_bytes -= len(evicted)
+
+
+def _hash_file(path: Path, size: int) -> Tuple[str, bytes]:
+    """
+    Hash a file through a memory map and read its header.
+
+    Args:
+        path: Path of the file
+        size: File size in bytes
+
+    Returns:
+        Tuple of (hex SHA-256 digest, header bytes)
+    """
+    with open(path, "rb") as file:
+        if size == 0:
+            return hashlib.sha256().hexdigest(), b""
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            digest = hashlib.sha256(mapped).hexdigest()
+            header = mapped[: MessageBuilderConfig.LOCAL_FILE_HEADER_READ_SIZE]
+    return digest, header
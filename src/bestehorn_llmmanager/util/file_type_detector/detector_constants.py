@@ -52,6 +52,14 @@ class MagicBytesConstants:
     MKV_SIGNATURE: Final[bytes] = b"\x1a\x45\xdf\xa3"
 
 
+class ContentCategories:
+    """Content categories distinguished by file type detection."""
+
+    IMAGE: Final[str] = "image"
+    DOCUMENT: Final[str] = "document"
+    VIDEO: Final[str] = "video"
+
+
 class FileExtensionConstants:
     """File extension mappings for different content types."""
 
@@ -114,6 +122,15 @@ class DetectionConstants:
     # Magic bytes reading configuration
     MAGIC_BYTES_READ_SIZE: Final[int] = 64
     ZIP_HEADER_READ_SIZE: Final[int] = 1024  # For Office format detection
+    VIDEO_SIGNATURE_WINDOW: Final[int] = 32  # MP4/MOV boxes are searched, not prefix-matched
+
+    # Minimum content size for content detection per category
+    MIN_CONTENT_SIZES: Final[Dict[str, int]] = {"image": 8, "document": 4, "video": 12}
+
+    # Memoized detection results, keyed by (category, header digest, extension). The
+    # header spans every byte content detection can inspect (ZIP_HEADER_READ_SIZE).
+    RESULT_MEMO_MAX_ENTRIES: Final[int] = 1024
+    HEADER_DIGEST_SIZE: Final[int] = 16
 
     # Content type priorities (higher = more reliable)
     CONTENT_TYPE_PRIORITIES: Final[Dict[str, int]] = {
@@ -123,6 +140,42 @@ class DetectionConstants:
     }
 
 
+class ImageDimensionConstants:
+    """Constants for reading image dimensions from header bytes."""
+
+    # JPEG start-of-frame markers (baseline, progressive, lossless, ...); DHT (0xC4),
+    # JPG (0xC8) and DAC (0xCC) share the range but carry no frame header.
+    JPEG_SOF_MARKERS: Final[Set[int]] = {
+        0xC0,
+        0xC1,
+        0xC2,
+        0xC3,
+        0xC5,
+        0xC6,
+        0xC7,
+        0xC9,
+        0xCA,
+        0xCB,
+        0xCD,
+        0xCE,
+        0xCF,
+    }
+    # Markers without a length field (TEM, RSTn, SOI, EOI)
+    JPEG_STANDALONE_MARKERS: Final[Set[int]] = {
+        0x01,
+        0xD0,
+        0xD1,
+        0xD2,
+        0xD3,
+        0xD4,
+        0xD5,
+        0xD6,
+        0xD7,
+        0xD8,
+        0xD9,
+    }
+
+
 class DetectorLogMessages:
     """Logging message constants for detector operations."""
 
@@ -3,20 +3,45 @@ Main file type detector implementation.
 Provides comprehensive file type detection using multiple strategies.
 """
 
+import hashlib
 import logging
+import threading
+from collections import OrderedDict
+from dataclasses import replace
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 from ...message_builder_constants import SupportedFormats
 from ...message_builder_enums import DetectionMethodEnum
 from .base_detector import BaseDetector, DetectionResult
 from .detector_constants import (
+    ContentCategories,
     DetectionConstants,
     DetectorErrorMessages,
     DetectorLogMessages,
     FileExtensionConstants,
     MagicBytesConstants,
 )
+from .image_dimensions import parse_image_dimensions
+from .signature_trie import DEFAULT_SIGNATURE_TRIE, MagicSignature
+
+# (category, header digest, lower-case filename extension)
+_MemoKey = Tuple[str, bytes, str]
+
+_CATEGORY_FORMATS: Dict[str, Tuple[List[str], Dict[str, str]]] = {
+    ContentCategories.IMAGE: (
+        SupportedFormats.IMAGE_FORMATS,
+        FileExtensionConstants.IMAGE_EXTENSIONS,
+    ),
+    ContentCategories.DOCUMENT: (
+        SupportedFormats.DOCUMENT_FORMATS,
+        FileExtensionConstants.DOCUMENT_EXTENSIONS,
+    ),
+    ContentCategories.VIDEO: (
+        SupportedFormats.VIDEO_FORMATS,
+        FileExtensionConstants.VIDEO_EXTENSIONS,
+    ),
+}
 
 
 class FileTypeDetector(BaseDetector):
@@ -25,13 +50,25 @@ class FileTypeDetector(BaseDetector):
 
     Uses a combination of extension-based and content-based detection
     to provide accurate file type identification with confidence scoring.
+    Content is matched against all magic signatures in one pass (see
+    SignatureTrie), and successful results are memoized process-wide by header
+    digest and filename extension.
     """
 
+    _memo: "OrderedDict[_MemoKey, DetectionResult]" = OrderedDict()
+    _memo_lock: threading.Lock = threading.Lock()
+
     def __init__(self) -> None:
         """Initialize the file type detector."""
         super().__init__()
         self._logger = logging.getLogger(__name__)
 
+    @classmethod
+    def clear_detection_cache(cls) -> None:
+        """Remove all memoized detection results."""
+        with cls._memo_lock:
+            cls._memo.clear()
+
     def detect_image_format(
         self, content: bytes, filename: Optional[str] = None
     ) -> DetectionResult:
@@ -45,44 +82,23 @@ class FileTypeDetector(BaseDetector):
         Returns:
             DetectionResult with detected format and confidence
         """
-        safe_filename = self._get_safe_filename(filename=filename)
-
-        if not self._validate_content(content=content):
-            return self._create_error_result(
-                error_message=DetectorErrorMessages.CONTENT_READ_ERROR.format(
-                    error="Invalid content"
-                ),
-                filename=filename,
-                detection_method=DetectionMethodEnum.CONTENT,
-            )
-
-        self._logger.debug(DetectorLogMessages.DETECTION_STARTED.format(filename=safe_filename))
-
-        # Try extension detection first (fast)
-        extension_result = self._detect_by_extension(
-            filename=filename,
-            supported_formats=SupportedFormats.IMAGE_FORMATS,
-            extension_map=FileExtensionConstants.IMAGE_EXTENSIONS,
+        return self._detect_format(
+            content=content, filename=filename, category=ContentCategories.IMAGE
         )
 
-        # Try content detection (accurate)
-        content_result = self._detect_image_by_content(content=content, filename=filename)
-
-        # Combine results
-        final_result = self._combine_detection_results(
-            extension_result=extension_result, content_result=content_result, filename=filename
-        )
+    def detect_image_dimensions(self, content: bytes) -> Optional[Tuple[int, int]]:
+        """
+        Read the pixel dimensions of an image from its header bytes.
 
-        self._logger.info(
-            DetectorLogMessages.DETECTION_COMPLETED.format(
-                filename=safe_filename,
-                format=final_result.detected_format,
-                method=final_result.detection_method.value,
-                confidence=final_result.confidence,
-            )
-        )
+        Args:
+            content: Raw image content bytes (PNG, JPEG, GIF or WEBP)
 
-        return final_result
+        Returns:
+            Tuple of (width, height), or None if they cannot be determined
+        """
+        if not self._validate_content(content=content):
+            return None
+        return parse_image_dimensions(content=content)
 
     def detect_document_format(
         self, content: bytes, filename: Optional[str] = None
@@ -97,45 +113,10 @@ class FileTypeDetector(BaseDetector):
         Returns:
             DetectionResult with detected format and confidence
         """
-        safe_filename = self._get_safe_filename(filename=filename)
-
-        if not self._validate_content(content=content):
-            return self._create_error_result(
-                error_message=DetectorErrorMessages.CONTENT_READ_ERROR.format(
-                    error="Invalid content"
-                ),
-                filename=filename,
-                detection_method=DetectionMethodEnum.CONTENT,
-            )
-
-        self._logger.debug(DetectorLogMessages.DETECTION_STARTED.format(filename=safe_filename))
-
-        # Try extension detection first
-        extension_result = self._detect_by_extension(
-            filename=filename,
-            supported_formats=SupportedFormats.DOCUMENT_FORMATS,
-            extension_map=FileExtensionConstants.DOCUMENT_EXTENSIONS,
-        )
-
-        # Try content detection
-        content_result = self._detect_document_by_content(content=content, filename=filename)
-
-        # Combine results
-        final_result = self._combine_detection_results(
-            extension_result=extension_result, content_result=content_result, filename=filename
-        )
-
-        self._logger.info(
-            DetectorLogMessages.DETECTION_COMPLETED.format(
-                filename=safe_filename,
-                format=final_result.detected_format,
-                method=final_result.detection_method.value,
-                confidence=final_result.confidence,
-            )
+        return self._detect_format(
+            content=content, filename=filename, category=ContentCategories.DOCUMENT
         )
 
-        return final_result
-
     def detect_video_format(
         self, content: bytes, filename: Optional[str] = None
     ) -> DetectionResult:
@@ -146,6 +127,24 @@ class FileTypeDetector(BaseDetector):
             content: Raw video content bytes
             filename: Optional filename for extension-based detection
 
+        Returns:
+            DetectionResult with detected format and confidence
+        """
+        return self._detect_format(
+            content=content, filename=filename, category=ContentCategories.VIDEO
+        )
+
+    def _detect_format(
+        self, content: bytes, filename: Optional[str], category: str
+    ) -> DetectionResult:
+        """
+        Detect the format of a content category, using memoized results where possible.
+
+        Args:
+            content: Raw content bytes
+            filename: Optional filename for extension-based detection
+            category: Content category (see ContentCategories)
+
         Returns:
             DetectionResult with detected format and confidence
         """
@@ -160,31 +159,60 @@ class FileTypeDetector(BaseDetector):
                 detection_method=DetectionMethodEnum.CONTENT,
             )
 
-        self._logger.debug(DetectorLogMessages.DETECTION_STARTED.format(filename=safe_filename))
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(DetectorLogMessages.DETECTION_STARTED.format(filename=safe_filename))
 
-        # Try extension detection first
-        extension_result = self._detect_by_extension(
-            filename=filename,
-            supported_formats=SupportedFormats.VIDEO_FORMATS,
-            extension_map=FileExtensionConstants.VIDEO_EXTENSIONS,
+        memo_key: _MemoKey = (
+            category,
+            hashlib.blake2b(
+                content[: DetectionConstants.ZIP_HEADER_READ_SIZE],
+                digest_size=DetectionConstants.HEADER_DIGEST_SIZE,
+            ).digest(),
+            Path(filename).suffix.lower() if filename else "",
         )
+        with self._memo_lock:
+            final_result = self._memo.get(memo_key)
+            if final_result is not None:
+                self._memo.move_to_end(memo_key)
 
-        # Try content detection
-        content_result = self._detect_video_by_content(content=content, filename=filename)
+        if final_result is None:
+            supported_formats, extension_map = _CATEGORY_FORMATS[category]
 
-        # Combine results
-        final_result = self._combine_detection_results(
-            extension_result=extension_result, content_result=content_result, filename=filename
-        )
+            # Try extension detection first (fast)
+            extension_result = self._detect_by_extension(
+                filename=filename,
+                supported_formats=supported_formats,
+                extension_map=extension_map,
+            )
 
-        self._logger.info(
-            DetectorLogMessages.DETECTION_COMPLETED.format(
-                filename=safe_filename,
-                format=final_result.detected_format,
-                method=final_result.detection_method.value,
-                confidence=final_result.confidence,
+            # Try content detection (accurate)
+            content_result = self._detect_by_content(
+                content=content, filename=filename, category=category
+            )
+
+            # Combine results
+            final_result = self._combine_detection_results(
+                extension_result=extension_result,
+                content_result=content_result,
+                filename=filename,
+            )
+            if final_result.is_successful:
+                with self._memo_lock:
+                    self._memo[memo_key] = final_result
+                    while len(self._memo) > DetectionConstants.RESULT_MEMO_MAX_ENTRIES:
+                        self._memo.popitem(last=False)
+        elif final_result.filename != filename:
+            final_result = replace(final_result, filename=filename)
+
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info(
+                DetectorLogMessages.DETECTION_COMPLETED.format(
+                    filename=safe_filename,
+                    format=final_result.detected_format,
+                    method=final_result.detection_method.value,
+                    confidence=final_result.confidence,
+                )
             )
-        )
 
         return final_result
 
@@ -211,17 +239,18 @@ class FileTypeDetector(BaseDetector):
         if not extension:
             return None
 
-        safe_filename = self._get_safe_filename(filename=filename)
-
         if extension in extension_map:
             detected_format = extension_map[extension]
 
             if detected_format in supported_formats:
-                self._logger.debug(
-                    DetectorLogMessages.EXTENSION_DETECTION.format(
-                        filename=safe_filename, extension=extension, format=detected_format
+                if self._logger.isEnabledFor(logging.DEBUG):
+                    self._logger.debug(
+                        DetectorLogMessages.EXTENSION_DETECTION.format(
+                            filename=self._get_safe_filename(filename=filename),
+                            extension=extension,
+                            format=detected_format,
+                        )
                     )
-                )
 
                 return self._create_success_result(
                     detected_format=detected_format,
@@ -236,10 +265,10 @@ class FileTypeDetector(BaseDetector):
                         format=detected_format, content_type="extension"
                     )
                 )
-        else:
+        elif self._logger.isEnabledFor(logging.DEBUG):
             self._logger.debug(
                 DetectorLogMessages.UNSUPPORTED_EXTENSION.format(
-                    extension=extension, filename=safe_filename
+                    extension=extension, filename=self._get_safe_filename(filename=filename)
                 )
             )
 
@@ -258,75 +287,9 @@ class FileTypeDetector(BaseDetector):
         Returns:
             DetectionResult if format is detected, None otherwise
         """
-        if len(content) < 8:  # Minimum bytes needed for image detection
-            return None
-
-        safe_filename = self._get_safe_filename(filename=filename)
-        header = content[: DetectionConstants.MAGIC_BYTES_READ_SIZE]
-
-        # Check JPEG signatures
-        for jpeg_sig in MagicBytesConstants.JPEG_SIGNATURES:
-            if header.startswith(jpeg_sig):
-                self._logger.debug(
-                    DetectorLogMessages.CONTENT_DETECTION.format(
-                        filename=safe_filename, format="jpeg"
-                    )
-                )
-                return self._create_success_result(
-                    detected_format="jpeg",
-                    confidence=DetectionConstants.HIGH_CONFIDENCE,
-                    detection_method=DetectionMethodEnum.CONTENT,
-                    filename=filename,
-                    metadata={"magic_bytes": jpeg_sig.hex()},
-                )
-
-        # Check PNG signature
-        if header.startswith(MagicBytesConstants.PNG_SIGNATURE):
-            self._logger.debug(
-                DetectorLogMessages.CONTENT_DETECTION.format(filename=safe_filename, format="png")
-            )
-            return self._create_success_result(
-                detected_format="png",
-                confidence=DetectionConstants.HIGH_CONFIDENCE,
-                detection_method=DetectionMethodEnum.CONTENT,
-                filename=filename,
-                metadata={"magic_bytes": MagicBytesConstants.PNG_SIGNATURE.hex()},
-            )
-
-        # Check GIF signatures
-        for gif_sig in MagicBytesConstants.GIF_SIGNATURES:
-            if header.startswith(gif_sig):
-                self._logger.debug(
-                    DetectorLogMessages.CONTENT_DETECTION.format(
-                        filename=safe_filename, format="gif"
-                    )
-                )
-                return self._create_success_result(
-                    detected_format="gif",
-                    confidence=DetectionConstants.HIGH_CONFIDENCE,
-                    detection_method=DetectionMethodEnum.CONTENT,
-                    filename=filename,
-                    metadata={"magic_bytes": gif_sig.hex()},
-                )
-
-        # Check WEBP signature (RIFF + WEBP)
-        if (
-            header.startswith(MagicBytesConstants.WEBP_SIGNATURE)
-            and len(content) >= 12
-            and MagicBytesConstants.WEBP_FORMAT_SIGNATURE in content[:12]
-        ):
-            self._logger.debug(
-                DetectorLogMessages.CONTENT_DETECTION.format(filename=safe_filename, format="webp")
-            )
-            return self._create_success_result(
-                detected_format="webp",
-                confidence=DetectionConstants.HIGH_CONFIDENCE,
-                detection_method=DetectionMethodEnum.CONTENT,
-                filename=filename,
-                metadata={"magic_bytes": header[:12].hex()},
-            )
-
-        return None
+        return self._detect_by_content(
+            content=content, filename=filename, category=ContentCategories.IMAGE
+        )
 
     def _detect_document_by_content(
         self, content: bytes, filename: Optional[str] = None
@@ -336,90 +299,14 @@ class FileTypeDetector(BaseDetector):
 
         Args:
             content: Raw document content bytes
-            filename: Optional filename for logging
+            filename: Optional filename for DOC/XLS disambiguation and logging
 
         Returns:
             DetectionResult if format is detected, None otherwise
         """
-        if len(content) < 4:
-            return None
-
-        safe_filename = self._get_safe_filename(filename=filename)
-        header = content[: DetectionConstants.MAGIC_BYTES_READ_SIZE]
-
-        # Check PDF signature
-        if header.startswith(MagicBytesConstants.PDF_SIGNATURE):
-            self._logger.debug(
-                DetectorLogMessages.CONTENT_DETECTION.format(filename=safe_filename, format="pdf")
-            )
-            return self._create_success_result(
-                detected_format="pdf",
-                confidence=DetectionConstants.HIGH_CONFIDENCE,
-                detection_method=DetectionMethodEnum.CONTENT,
-                filename=filename,
-                metadata={"magic_bytes": MagicBytesConstants.PDF_SIGNATURE.hex()},
-            )
-
-        # Check ZIP-based Office formats
-        if header.startswith(MagicBytesConstants.ZIP_SIGNATURE):
-            if len(content) >= DetectionConstants.ZIP_HEADER_READ_SIZE:
-                zip_content = content[: DetectionConstants.ZIP_HEADER_READ_SIZE]
-
-                # Check for DOCX
-                if MagicBytesConstants.DOCX_CONTENT_TYPES in zip_content:
-                    return self._create_success_result(
-                        detected_format="docx",
-                        confidence=DetectionConstants.HIGH_CONFIDENCE,
-                        detection_method=DetectionMethodEnum.CONTENT,
-                        filename=filename,
-                        metadata={"magic_bytes": MagicBytesConstants.ZIP_SIGNATURE.hex()},
-                    )
-
-                # Check for XLSX
-                if MagicBytesConstants.XLSX_CONTENT_TYPES in zip_content:
-                    return self._create_success_result(
-                        detected_format="xlsx",
-                        confidence=DetectionConstants.HIGH_CONFIDENCE,
-                        detection_method=DetectionMethodEnum.CONTENT,
-                        filename=filename,
-                        metadata={"magic_bytes": MagicBytesConstants.ZIP_SIGNATURE.hex()},
-                    )
-
-        # Check legacy Office formats
-        if header.startswith(MagicBytesConstants.DOC_SIGNATURE):
-            # This signature is shared by DOC and XLS - use extension if available
-            if filename:
-                file_path = Path(filename)
-                extension = file_path.suffix.lower()
-                if extension == ".doc":
-                    detected_format = "doc"
-                elif extension == ".xls":
-                    detected_format = "xls"
-                else:
-                    detected_format = "doc"  # Default to DOC
-            else:
-                detected_format = "doc"
-
-            return self._create_success_result(
-                detected_format=detected_format,
-                confidence=DetectionConstants.MEDIUM_CONFIDENCE,
-                detection_method=DetectionMethodEnum.CONTENT,
-                filename=filename,
-                metadata={"magic_bytes": MagicBytesConstants.DOC_SIGNATURE.hex()},
-            )
-
-        # Check HTML signatures
-        for html_sig in MagicBytesConstants.HTML_SIGNATURES:
-            if html_sig in header:
-                return self._create_success_result(
-                    detected_format="html",
-                    confidence=DetectionConstants.HIGH_CONFIDENCE,
-                    detection_method=DetectionMethodEnum.CONTENT,
-                    filename=filename,
-                    metadata={"magic_bytes": html_sig.hex()},
-                )
-
-        return None
+        return self._detect_by_content(
+            content=content, filename=filename, category=ContentCategories.DOCUMENT
+        )
 
     def _detect_video_by_content(
         self, content: bytes, filename: Optional[str] = None
@@ -427,68 +314,106 @@ class FileTypeDetector(BaseDetector):
         """
         Detect video format by analyzing content magic bytes.
 
+        AVI is intentionally not detected: Bedrock does not accept "avi" as a video
+        format (issue #33), so AVI content falls through to "unsupported format".
+
         Args:
             content: Raw video content bytes
-            filename: Optional filename for logging
+            filename: Optional filename for WEBM/MKV disambiguation and logging
 
         Returns:
             DetectionResult if format is detected, None otherwise
         """
-        if len(content) < 12:
+        return self._detect_by_content(
+            content=content, filename=filename, category=ContentCategories.VIDEO
+        )
+
+    def _detect_by_content(
+        self, content: bytes, filename: Optional[str], category: str
+    ) -> Optional[DetectionResult]:
+        """
+        Detect the format of a content category from its magic bytes.
+
+        Args:
+            content: Raw content bytes
+            filename: Optional filename for disambiguation and logging
+            category: Content category (see ContentCategories)
+
+        Returns:
+            DetectionResult of the first matching signature, None if none matches
+        """
+        if len(content) < DetectionConstants.MIN_CONTENT_SIZES[category]:
             return None
 
-        safe_filename = self._get_safe_filename(filename=filename)
-        header = content[: DetectionConstants.MAGIC_BYTES_READ_SIZE]
+        for signature in DEFAULT_SIGNATURE_TRIE.match(content=content).get(category, []):
+            detected_format = self._resolve_signature(
+                signature=signature, content=content, filename=filename
+            )
+            if detected_format is None:
+                continue
 
-        # Check MP4 signatures
-        for mp4_sig in MagicBytesConstants.MP4_SIGNATURES:
-            if mp4_sig in content[:32]:  # Check first 32 bytes for MP4 signature
+            if self._logger.isEnabledFor(logging.DEBUG):
                 self._logger.debug(
                     DetectorLogMessages.CONTENT_DETECTION.format(
-                        filename=safe_filename, format="mp4"
+                        filename=self._get_safe_filename(filename=filename),
+                        format=detected_format,
                     )
                 )
-                return self._create_success_result(
-                    detected_format="mp4",
-                    confidence=DetectionConstants.HIGH_CONFIDENCE,
-                    detection_method=DetectionMethodEnum.CONTENT,
-                    filename=filename,
-                    metadata={"magic_bytes": mp4_sig.hex()},
-                )
-
-        # Check MOV signature
-        if MagicBytesConstants.MOV_SIGNATURE in content[:32]:
+            magic_bytes = (
+                content[:12]
+                if signature.signature == MagicBytesConstants.WEBP_SIGNATURE
+                else signature.signature
+            )
             return self._create_success_result(
-                detected_format="mov",
-                confidence=DetectionConstants.HIGH_CONFIDENCE,
+                detected_format=detected_format,
+                confidence=signature.confidence,
                 detection_method=DetectionMethodEnum.CONTENT,
                 filename=filename,
-                metadata={"magic_bytes": MagicBytesConstants.MOV_SIGNATURE.hex()},
+                metadata={"magic_bytes": magic_bytes.hex()},
             )
 
-        # NOTE: AVI is intentionally NOT detected. Bedrock does not accept "avi" as a
-        # video format (issue #33), so detecting it would only produce a request the API
-        # rejects. AVI content therefore falls through to "unsupported format".
+        return None
 
-        # Check WEBM/MKV signature (same signature, differentiate by extension if available)
-        if header.startswith(MagicBytesConstants.WEBM_SIGNATURE):
-            detected_format = "webm"  # Default to WEBM
+    def _resolve_signature(
+        self, signature: MagicSignature, content: bytes, filename: Optional[str]
+    ) -> Optional[str]:
+        """
+        Determine the format of a signature match, checking container formats.
 
-            if filename:
-                file_path = Path(filename)
-                extension = file_path.suffix.lower()
-                if extension == ".mkv":
-                    detected_format = "mkv"
+        Args:
+            signature: Matching signature
+            content: Raw content bytes
+            filename: Optional filename for disambiguating shared signatures
 
-            return self._create_success_result(
-                detected_format=detected_format,
-                confidence=DetectionConstants.MEDIUM_CONFIDENCE,
-                detection_method=DetectionMethodEnum.CONTENT,
-                filename=filename,
-                metadata={"magic_bytes": MagicBytesConstants.WEBM_SIGNATURE.hex()},
-            )
+        Returns:
+            Detected format, or None if the match does not identify a supported format
+        """
+        if signature.signature == MagicBytesConstants.WEBP_SIGNATURE:
+            # RIFF container; only WEBP is an image format
+            if len(content) >= 12 and MagicBytesConstants.WEBP_FORMAT_SIGNATURE in content[:12]:
+                return signature.format
+            return None
 
-        return None
+        if signature.signature == MagicBytesConstants.ZIP_SIGNATURE:
+            # ZIP-based Office formats
+            if len(content) < DetectionConstants.ZIP_HEADER_READ_SIZE:
+                return None
+            zip_content = content[: DetectionConstants.ZIP_HEADER_READ_SIZE]
+            if MagicBytesConstants.DOCX_CONTENT_TYPES in zip_content:
+                return "docx"
+            if MagicBytesConstants.XLSX_CONTENT_TYPES in zip_content:
+                return "xlsx"
+            return None
+
+        extension = Path(filename).suffix.lower() if filename else ""
+        if signature.signature == MagicBytesConstants.DOC_SIGNATURE:
+            # Shared by DOC and XLS - use extension if available
+            return "xls" if extension == ".xls" else "doc"
+        if signature.signature == MagicBytesConstants.WEBM_SIGNATURE:
+            # Shared by WEBM and MKV - use extension if available
+            return "mkv" if extension == ".mkv" else "webm"
+
+        return signature.format
 
     def _combine_detection_results(
         self,
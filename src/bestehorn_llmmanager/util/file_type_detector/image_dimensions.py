@@ -0,0 +1,92 @@
+"""
+Image dimension parsing from header bytes.
+
+Reads width and height from the headers of the image formats Bedrock accepts (PNG,
+JPEG, GIF, WEBP) without decoding the image.
+"""
+
+import struct
+from typing import Optional, Tuple
+
+from .detector_constants import ImageDimensionConstants, MagicBytesConstants
+
+
+def parse_image_dimensions(content: bytes) -> Optional[Tuple[int, int]]:
+    """
+    Parse the pixel dimensions of an image from its header.
+
+    Args:
+        content: Raw image content bytes
+
+    Returns:
+        Tuple of (width, height), or None if the format is not recognized or the
+        header is truncated
+    """
+    try:
+        if content.startswith(MagicBytesConstants.PNG_SIGNATURE):
+            return _parse_png(content=content)
+        if any(content.startswith(signature) for signature in MagicBytesConstants.GIF_SIGNATURES):
+            return _parse_gif(content=content)
+        if content.startswith(b"\xff\xd8"):
+            return _parse_jpeg(content=content)
+        if (
+            content.startswith(MagicBytesConstants.WEBP_SIGNATURE)
+            and content[8:12] == MagicBytesConstants.WEBP_FORMAT_SIGNATURE
+        ):
+            return _parse_webp(content=content)
+    except struct.error:
+        return None
+    return None
+
+
+def _parse_png(content: bytes) -> Optional[Tuple[int, int]]:
+    """Read dimensions from the PNG IHDR chunk."""
+    if content[12:16] != b"IHDR":
+        return None
+    width, height = struct.unpack(">II", content[16:24])
+    return width, height
+
+
+def _parse_gif(content: bytes) -> Optional[Tuple[int, int]]:
+    """Read dimensions from the GIF logical screen descriptor."""
+    width, height = struct.unpack("<HH", content[6:10])
+    return width, height
+
+
+def _parse_jpeg(content: bytes) -> Optional[Tuple[int, int]]:
+    """Walk JPEG marker segments up to the first start-of-frame marker."""
+    offset = 2
+    length = len(content)
+    while offset + 4 <= length:
+        if content[offset] != 0xFF:
+            return None
+        marker = content[offset + 1]
+        if marker == 0xFF:
+            # Fill byte before a marker
+            offset += 1
+            continue
+        if marker in ImageDimensionConstants.JPEG_STANDALONE_MARKERS:
+            offset += 2
+            continue
+        (segment_length,) = struct.unpack(">H", content[offset + 2 : offset + 4])
+        if marker in ImageDimensionConstants.JPEG_SOF_MARKERS:
+            height, width = struct.unpack(">HH", content[offset + 5 : offset + 9])
+            return width, height
+        offset += 2 + segment_length
+    return None
+
+
+def _parse_webp(content: bytes) -> Optional[Tuple[int, int]]:
+    """Read dimensions from the first WEBP chunk (VP8, VP8L or VP8X)."""
+    chunk = content[12:16]
+    if chunk == b"VP8 ":
+        width, height = struct.unpack("<HH", content[26:30])
+        return width & 0x3FFF, height & 0x3FFF
+    if chunk == b"VP8L":
+        (bits,) = struct.unpack("<I", content[21:25])
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    if chunk == b"VP8X":
+        width = int.from_bytes(content[24:27], "little") + 1
+        height = int.from_bytes(content[27:30], "little") + 1
+        return width, height
+    return None
@@ -0,0 +1,229 @@
+"""
+Precompiled magic byte signature matching.
+
+Compiles the MagicBytesConstants signatures once into a byte-prefix trie (signatures
+anchored at the start of the content) and a single regular expression (signatures that
+may appear anywhere within a leading window, such as MP4 boxes and HTML tags). One pass
+over the header then yields every matching signature with its content category and
+format, instead of one ``startswith`` scan per signature and category.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+
+from .detector_constants import ContentCategories, DetectionConstants, MagicBytesConstants
+
+
+@dataclass(frozen=True)
+class MagicSignature:
+    """
+    Magic byte signature of a file format.
+
+    Attributes:
+        category: Content category (see ContentCategories)
+        format: Format the signature identifies
+        signature: Signature bytes
+        confidence: Confidence of a match
+        order: Precedence within the category; lower values win
+        window: Leading bytes searched for the signature, or 0 if it must be a prefix
+    """
+
+    category: str
+    format: str
+    signature: bytes
+    confidence: float
+    order: int
+    window: int = 0
+
+
+class _TrieNode:
+    """Node of the signature trie."""
+
+    __slots__ = ("children", "signatures")
+
+    def __init__(self) -> None:
+        self.children: Dict[int, "_TrieNode"] = {}
+        self.signatures: List[MagicSignature] = []
+
+
+class SignatureTrie:
+    """
+    Matches content headers against a fixed set of magic byte signatures.
+
+    Instances are immutable after construction and can be shared between threads.
+    """
+
+    def __init__(self, signatures: Iterable[MagicSignature]) -> None:
+        """
+        Compile the signatures.
+
+        Args:
+            signatures: Signatures to match
+        """
+        self._root = _TrieNode()
+        self._prefix_length = 0
+        self._windowed: Dict[bytes, List[MagicSignature]] = {}
+        self._window_length = 0
+
+        for signature in signatures:
+            if signature.window:
+                self._windowed.setdefault(signature.signature, []).append(signature)
+                self._window_length = max(self._window_length, signature.window)
+                continue
+            node = self._root
+            for byte in signature.signature:
+                node = node.children.setdefault(byte, _TrieNode())
+            node.signatures.append(signature)
+            self._prefix_length = max(self._prefix_length, len(signature.signature))
+
+        self._window_pattern: Optional["re.Pattern[bytes]"] = None
+        if self._windowed:
+            self._window_pattern = re.compile(
+                b"|".join(re.escape(signature) for signature in self._windowed)
+            )
+
+    def match(self, content: bytes) -> Dict[str, List[MagicSignature]]:
+        """
+        Find all signatures matching the content.
+
+        Args:
+            content: Content bytes (only the leading bytes are inspected)
+
+        Returns:
+            Matching signatures per content category, ordered by precedence
+        """
+        matches: Dict[str, List[MagicSignature]] = {}
+
+        node = self._root
+        for byte in content[: self._prefix_length]:
+            child = node.children.get(byte)
+            if child is None:
+                break
+            node = child
+            for signature in node.signatures:
+                matches.setdefault(signature.category, []).append(signature)
+
+        if self._window_pattern is not None:
+            for found in self._window_pattern.finditer(content[: self._window_length]):
+                for signature in self._windowed[found.group()]:
+                    if found.end() <= signature.window:
+                        matches.setdefault(signature.category, []).append(signature)
+
+        for category_matches in matches.values():
+            category_matches.sort(key=lambda signature: signature.order)
+        return matches
+
+
+def _default_signatures() -> List[MagicSignature]:
+    """Build the signature table from MagicBytesConstants, in detection precedence order."""
+    high = DetectionConstants.HIGH_CONFIDENCE
+    medium = DetectionConstants.MEDIUM_CONFIDENCE
+    image = ContentCategories.IMAGE
+    document = ContentCategories.DOCUMENT
+    video = ContentCategories.VIDEO
+
+    signatures = [
+        MagicSignature(category=image, format="jpeg", signature=s, confidence=high, order=0)
+        for s in MagicBytesConstants.JPEG_SIGNATURES
+    ]
+    signatures.append(
+        MagicSignature(
+            category=image,
+            format="png",
+            signature=MagicBytesConstants.PNG_SIGNATURE,
+            confidence=high,
+            order=1,
+        )
+    )
+    signatures.extend(
+        MagicSignature(category=image, format="gif", signature=s, confidence=high, order=2)
+        for s in MagicBytesConstants.GIF_SIGNATURES
+    )
+    # RIFF container: WEBP only if the form type says so (checked by the detector)
+    signatures.append(
+        MagicSignature(
+            category=image,
+            format="webp",
+            signature=MagicBytesConstants.WEBP_SIGNATURE,
+            confidence=high,
+            order=3,
+        )
+    )
+
+    signatures.append(
+        MagicSignature(
+            category=document,
+            format="pdf",
+            signature=MagicBytesConstants.PDF_SIGNATURE,
+            confidence=high,
+            order=0,
+        )
+    )
+    # ZIP container: DOCX or XLSX depending on its entries (checked by the detector)
+    signatures.append(
+        MagicSignature(
+            category=document,
+            format="zip",
+            signature=MagicBytesConstants.ZIP_SIGNATURE,
+            confidence=high,
+            order=1,
+        )
+    )
+    # OLE compound file, shared by DOC and XLS (disambiguated by extension)
+    signatures.append(
+        MagicSignature(
+            category=document,
+            format="doc",
+            signature=MagicBytesConstants.DOC_SIGNATURE,
+            confidence=medium,
+            order=2,
+        )
+    )
+    signatures.extend(
+        MagicSignature(
+            category=document,
+            format="html",
+            signature=s,
+            confidence=high,
+            order=3,
+            window=DetectionConstants.MAGIC_BYTES_READ_SIZE,
+        )
+        for s in MagicBytesConstants.HTML_SIGNATURES
+    )
+
+    signatures.extend(
+        MagicSignature(
+            category=video,
+            format="mp4",
+            signature=s,
+            confidence=high,
+            order=0,
+            window=DetectionConstants.VIDEO_SIGNATURE_WINDOW,
+        )
+        for s in MagicBytesConstants.MP4_SIGNATURES
+    )
+    signatures.append(
+        MagicSignature(
+            category=video,
+            format="mov",
+            signature=MagicBytesConstants.MOV_SIGNATURE,
+            confidence=high,
+            order=1,
+            window=DetectionConstants.VIDEO_SIGNATURE_WINDOW,
+        )
+    )
+    # EBML header, shared by WEBM and MKV (disambiguated by extension)
+    signatures.append(
+        MagicSignature(
+            category=video,
+            format="webm",
+            signature=MagicBytesConstants.WEBM_SIGNATURE,
+            confidence=medium,
+            order=2,
+        )
+    )
+    return signatures
+
+
+DEFAULT_SIGNATURE_TRIE = SignatureTrie(signatures=_default_signatures())
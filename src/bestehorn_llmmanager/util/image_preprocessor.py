@@ -0,0 +1,349 @@
+"""
+Optional downscale/transcode stage for images sent to Bedrock.
+
+Bedrock bills images by resolution and downscales anything larger than about 1.15
+megapixels before tokenizing it, so sending camera-sized images only costs upload bytes
+and latency. ImagePreprocessor resizes images to a maximum edge and pixel count,
+applies the EXIF orientation, drops metadata (EXIF, ICC profiles, comments) and
+re-encodes to an efficient format. Results are cached by content hash per preprocessor,
+and batches are transformed in a process pool.
+
+Requires Pillow (``pip install bestehorn-llmmanager[images]``).
+"""
+
+import hashlib
+import io
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Union
+
+from ..bedrock.exceptions.llm_manager_exceptions import RequestValidationError
+from ..message_builder_constants import (
+    ImagePreprocessingDefaults,
+    MessageBuilderErrorMessages,
+    MessageBuilderLogMessages,
+)
+from ..message_builder_enums import ImageFormatEnum
+from .file_content_source import FileContentSource
+
+ImageInput = Union[bytes, FileContentSource]
+
+
+@dataclass(frozen=True)
+class ImagePreprocessingConfig:
+    """
+    Settings of an ImagePreprocessor.
+
+    Attributes:
+        max_edge_pixels: Maximum length of the longer image edge
+        max_pixels: Maximum image area; images are shrunk further to stay below it
+        output_format: Format images are re-encoded to
+        quality: Encoder quality of lossy formats (JPEG, WEBP), 1-95
+        cache_max_entries: Maximum number of cached results (0 disables caching)
+    """
+
+    max_edge_pixels: int = ImagePreprocessingDefaults.MAX_EDGE_PIXELS
+    max_pixels: int = ImagePreprocessingDefaults.MAX_PIXELS
+    output_format: ImageFormatEnum = ImageFormatEnum(ImagePreprocessingDefaults.OUTPUT_FORMAT)
+    quality: int = ImagePreprocessingDefaults.QUALITY
+    cache_max_entries: int = ImagePreprocessingDefaults.CACHE_MAX_ENTRIES
+
+    def __post_init__(self) -> None:
+        """Validate configuration after initialization."""
+        if self.max_edge_pixels <= 0:
+            raise ValueError(f"max_edge_pixels must be positive, got {self.max_edge_pixels}")
+        if self.max_pixels <= 0:
+            raise ValueError(f"max_pixels must be positive, got {self.max_pixels}")
+        if self.output_format.value not in ImagePreprocessingDefaults.OUTPUT_FORMATS:
+            raise ValueError(
+                f"output_format must be one of {ImagePreprocessingDefaults.OUTPUT_FORMATS}, "
+                f"got {self.output_format.value}"
+            )
+        if not 1 <= self.quality <= 95:
+            raise ValueError(f"quality must be between 1 and 95, got {self.quality}")
+        if self.cache_max_entries < 0:
+            raise ValueError(
+                f"cache_max_entries must be non-negative, got {self.cache_max_entries}"
+            )
+
+
+@dataclass(frozen=True)
+class PreprocessedImage:
+    """
+    Result of preprocessing an image.
+
+    Attributes:
+        content: Encoded image bytes
+        format: Format of content
+        width: Width in pixels
+        height: Height in pixels
+        original_width: Width of the input image
+        original_height: Height of the input image
+        original_size: Size of the input image in bytes
+    """
+
+    content: bytes
+    format: ImageFormatEnum
+    width: int
+    height: int
+    original_width: int
+    original_height: int
+    original_size: int
+
+    @property
+    def size(self) -> int:
+        """Size of the encoded image in bytes."""
+        return len(self.content)
+
+
+class ImagePreprocessor:
+    """
+    Resizes, strips and re-encodes images, caching results by content hash.
+
+    Preprocessing is idempotent: a result is also cached under its own hash, so passing
+    an already preprocessed image returns it unchanged. The class is thread-safe.
+
+    Example:
+        >>> preprocessor = ImagePreprocessor()
+        >>> message = create_user_message(image_preprocessor=preprocessor)\\
+        ...     .add_image_bytes(bytes=camera_jpeg)\\
+        ...     .build()
+    """
+
+    def __init__(self, config: Optional[ImagePreprocessingConfig] = None) -> None:
+        """
+        Initialize the preprocessor.
+
+        Args:
+            config: Preprocessing settings (defaults: 1568 px edge, 1.15 MP, WEBP)
+
+        Raises:
+            ImportError: If Pillow is not installed
+        """
+        _load_pillow()
+        self._logger = logging.getLogger(__name__)
+        self._config = config or ImagePreprocessingConfig()
+        self._lock = threading.Lock()
+        self._cache: "OrderedDict[str, PreprocessedImage]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def get_config(self) -> ImagePreprocessingConfig:
+        """
+        Get the preprocessing settings.
+
+        Returns:
+            ImagePreprocessingConfig in use
+        """
+        return self._config
+
+    def preprocess(self, content: ImageInput) -> PreprocessedImage:
+        """
+        Preprocess one image in the calling thread.
+
+        Args:
+            content: Image bytes, or the FileContentSource of a local image
+
+        Returns:
+            PreprocessedImage
+
+        Raises:
+            RequestValidationError: If the content is not a decodable image
+        """
+        digest = _content_digest(content=content)
+        cached = self._get_cached(digest=digest)
+        if cached is not None:
+            return cached
+
+        data = content.read() if isinstance(content, FileContentSource) else content
+        result = _transform_image(content=data, config=self._config)
+        self._store(digest=digest, result=result)
+        return result
+
+    def preprocess_batch(
+        self, contents: Sequence[ImageInput], max_workers: Optional[int] = None
+    ) -> List[PreprocessedImage]:
+        """
+        Preprocess several images, transforming cache misses in a process pool.
+
+        Identical images in the batch are transformed once.
+
+        Args:
+            contents: Image bytes or FileContentSources
+            max_workers: Maximum number of worker processes (default: CPU count)
+
+        Returns:
+            PreprocessedImages in the order of contents
+
+        Raises:
+            RequestValidationError: If any content is not a decodable image
+        """
+        digests = [_content_digest(content=content) for content in contents]
+        results: Dict[str, PreprocessedImage] = {}
+        pending: Dict[str, bytes] = {}
+        for digest, content in zip(digests, contents, strict=True):
+            if digest in results or digest in pending:
+                continue
+            cached = self._get_cached(digest=digest)
+            if cached is not None:
+                results[digest] = cached
+            else:
+                pending[digest] = (
+                    content.read() if isinstance(content, FileContentSource) else content
+                )
+
+        if len(pending) == 1:
+            digest, data = next(iter(pending.items()))
+            results[digest] = _transform_image(content=data, config=self._config)
+        elif pending:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    digest: executor.submit(_transform_image, data, self._config)
+                    for digest, data in pending.items()
+                }
+                for digest, future in futures.items():
+                    results[digest] = future.result()
+
+        for digest in pending:
+            self._store(digest=digest, result=results[digest])
+        return [results[digest] for digest in digests]
+
+    def clear_cache(self) -> None:
+        """Remove all cached results and reset the statistics."""
+        with self._lock:
+            self._cache.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with the number of cached results, hits and misses
+        """
+        with self._lock:
+            return {"entries": len(self._cache), "hits": self._hits, "misses": self._misses}
+
+    def _get_cached(self, digest: str) -> Optional[PreprocessedImage]:
+        """Look up a cached result by input digest, counting hits and misses."""
+        with self._lock:
+            result = self._cache.get(digest)
+            if result is None:
+                self._misses += 1
+                return None
+            self._cache.move_to_end(digest)
+            self._hits += 1
+            return result
+
+    def _store(self, digest: str, result: PreprocessedImage) -> None:
+        """Cache a result under its input digest and its own digest."""
+        self._logger.debug(
+            MessageBuilderLogMessages.IMAGE_PREPROCESSED.format(
+                original_width=result.original_width,
+                original_height=result.original_height,
+                original_size=result.original_size,
+                width=result.width,
+                height=result.height,
+                format=result.format.value,
+                size=result.size,
+            )
+        )
+        with self._lock:
+            for key in (digest, hashlib.sha256(result.content).hexdigest()):
+                self._cache[key] = result
+                self._cache.move_to_end(key)
+            while len(self._cache) > self._config.cache_max_entries:
+                self._cache.popitem(last=False)
+
+
+def _load_pillow() -> None:
+    """
+    Check that Pillow is installed.
+
+    Raises:
+        ImportError: If Pillow is not installed
+    """
+    try:
+        import PIL  # noqa: F401
+    except ImportError as e:
+        raise ImportError(MessageBuilderErrorMessages.PILLOW_REQUIRED) from e
+
+
+def _content_digest(content: ImageInput) -> str:
+    """Get the hex SHA-256 digest of image content without reading local files."""
+    if isinstance(content, FileContentSource):
+        return content.digest
+    return hashlib.sha256(content).hexdigest()
+
+
+def _transform_image(content: bytes, config: ImagePreprocessingConfig) -> PreprocessedImage:
+    """
+    Resize and re-encode an image. Runs in worker processes for batches.
+
+    Args:
+        content: Encoded input image
+        config: Preprocessing settings
+
+    Returns:
+        PreprocessedImage
+
+    Raises:
+        RequestValidationError: If the content is not a decodable image
+    """
+    from PIL import Image, ImageOps
+
+    try:
+        with Image.open(io.BytesIO(content)) as opened:
+            original_width, original_height = opened.size
+            image = ImageOps.exif_transpose(opened)
+            image.load()
+    except (OSError, ValueError, Image.DecompressionBombError) as e:
+        raise RequestValidationError(
+            MessageBuilderErrorMessages.IMAGE_PREPROCESSING_FAILED.format(error=e)
+        ) from e
+
+    width, height = image.size
+    scale = min(
+        1.0,
+        config.max_edge_pixels / max(width, height),
+        (config.max_pixels / (width * height)) ** 0.5,
+    )
+    if scale < 1.0:
+        # Round down so that both limits hold; the epsilon absorbs float error at exact fits
+        size = (max(1, int(width * scale + 1e-6)), max(1, int(height * scale + 1e-6)))
+        image = image.resize(size=size, resample=Image.Resampling.LANCZOS)
+
+    output_format = config.output_format.value
+    has_alpha = image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info)
+    if output_format in ImagePreprocessingDefaults.OPAQUE_FORMATS:
+        if has_alpha:
+            rgba = image.convert("RGBA")
+            background = Image.new("RGB", rgba.size, ImagePreprocessingDefaults.BACKGROUND_COLOR)
+            background.paste(rgba, mask=rgba.getchannel("A"))
+            image = background
+        else:
+            image = image.convert("RGB")
+    elif image.mode not in ("RGB", "RGBA", "L", "LA"):
+        image = image.convert("RGBA" if has_alpha else "RGB")
+
+    # Only pixel data is written: EXIF, ICC profiles and comments are dropped
+    buffer = io.BytesIO()
+    image.save(
+        buffer,
+        format=ImagePreprocessingDefaults.PILLOW_FORMAT_NAMES[output_format],
+        quality=config.quality,
+        optimize=True,
+    )
+    return PreprocessedImage(
+        content=buffer.getvalue(),
+        format=config.output_format,
+        width=image.width,
+        height=image.height,
+        original_width=original_width,
+        original_height=original_height,
+        original_size=len(content),
+    )
@@ -0,0 +1,107 @@
+"""
+Tests for BatchCheckpoint and the JSONL crash-recovery helpers.
+"""
+
+from bestehorn_llmmanager.batch.batch_checkpoint import BatchCheckpoint
+from bestehorn_llmmanager.batch.jsonl_files import read_last_line, truncate_incomplete_tail
+
+
+class TestJSONLFiles:
+    """Test cases for truncate_incomplete_tail and read_last_line."""
+
+    def test_missing_file(self, tmp_path):
+        """Test helpers on a file that does not exist."""
+        path = tmp_path / "missing.jsonl"
+
+        assert truncate_incomplete_tail(path=path) == 0
+        assert read_last_line(path=path) is None
+
+    def test_complete_file_unchanged(self, tmp_path):
+        """Test that a newline-terminated file is left untouched."""
+        path = tmp_path / "out.jsonl"
+        path.write_bytes(b'{"a": 1}\n{"b": 2}\n')
+
+        assert truncate_incomplete_tail(path=path) == 0
+        assert path.read_bytes() == b'{"a": 1}\n{"b": 2}\n'
+        assert read_last_line(path=path) == '{"b": 2}'
+
+    def test_partial_tail_truncated(self, tmp_path):
+        """Test that an unterminated trailing record is removed."""
+        path = tmp_path / "out.jsonl"
+        path.write_bytes(b'{"a": 1}\n{"b": ')
+
+        assert truncate_incomplete_tail(path=path) == len(b'{"b": ')
+        assert path.read_bytes() == b'{"a": 1}\n'
+        assert read_last_line(path=path) == '{"a": 1}'
+
+    def test_single_partial_line(self, tmp_path):
+        """Test that a file holding only a partial record becomes empty."""
+        path = tmp_path / "out.jsonl"
+        path.write_bytes(b'{"a": ')
+
+        truncate_incomplete_tail(path=path)
+
+        assert path.read_bytes() == b""
+        assert read_last_line(path=path) is None
+
+    def test_long_last_line_spanning_blocks(self, tmp_path, monkeypatch):
+        """Test reading a last line longer than the tail read block."""
+        monkeypatch.setattr("bestehorn_llmmanager.batch.jsonl_files.BatchConfig.TAIL_READ_BYTES", 4)
+        path = tmp_path / "out.jsonl"
+        path.write_text("first\n" + "x" * 37 + "\n")
+
+        assert read_last_line(path=path) == "x" * 37
+
+
+class TestBatchCheckpoint:
+    """Test cases for BatchCheckpoint."""
+
+    def test_record_and_reload(self, tmp_path):
+        """Test that recorded outcomes survive a reload."""
+        path = tmp_path / "run.checkpoint"
+        checkpoint = BatchCheckpoint(path=path)
+        checkpoint.record(request_id="a", success=True)
+        checkpoint.record(request_id="b", success=False)
+        checkpoint.close()
+
+        reloaded = BatchCheckpoint(path=path)
+        assert reloaded.load() == 2
+        assert reloaded.is_finished(request_id="a")
+        assert reloaded.is_finished(request_id="b")
+        assert not reloaded.is_finished(request_id="b", include_failed=False)
+        assert not reloaded.is_finished(request_id="c")
+        assert reloaded.get_succeeded_count() == 1
+        assert reloaded.get_failed_count() == 1
+
+    def test_later_entry_wins(self, tmp_path):
+        """Test that a later success overrides an earlier failure."""
+        path = tmp_path / "run.checkpoint"
+        checkpoint = BatchCheckpoint(path=path)
+        checkpoint.record(request_id="a", success=False)
+        checkpoint.record(request_id="a", success=True)
+        checkpoint.close()
+
+        reloaded = BatchCheckpoint(path=path)
+        reloaded.load()
+        assert len(reloaded) == 1
+        assert reloaded.is_finished(request_id="a", include_failed=False)
+
+    def test_partial_entry_discarded(self, tmp_path):
+        """Test that a partially written entry is ignored on load."""
+        path = tmp_path / "run.checkpoint"
+        path.write_text("S\ta\nS\tb")
+
+        checkpoint = BatchCheckpoint(path=path)
+
+        assert checkpoint.load() == 1
+        assert checkpoint.contains(request_id="a")
+        assert not checkpoint.contains(request_id="b")
+
+    def test_load_without_file(self, tmp_path):
+        """Test loading a checkpoint that does not exist yet."""
+        checkpoint = BatchCheckpoint(path=tmp_path / "nested" / "run.checkpoint")
+
+        assert checkpoint.load() == 0
+        checkpoint.record(request_id="a", success=True)
+        checkpoint.close()
+        assert (tmp_path / "nested" / "run.checkpoint").read_text() == "S\ta\n"
@@ -0,0 +1,319 @@
+"""
+Tests for JSONLBatchRunner.
+"""
+
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+from bestehorn_llmmanager.batch.batch_structures import BatchProgress
+from bestehorn_llmmanager.batch.cli import EXIT_REQUEST_FAILURES, EXIT_SUCCESS, main
+from bestehorn_llmmanager.batch.jsonl_batch_runner import JSONLBatchRunner
+from bestehorn_llmmanager.bedrock.exceptions.batch_exceptions import (
+    BatchInputError,
+    BatchProcessingError,
+)
+from bestehorn_llmmanager.bedrock.models.bedrock_response import BedrockResponse
+from bestehorn_llmmanager.parallel_llm_manager import ParallelLLMManager
+
+
+class _FakeParallelManager:
+    """Minimal stand-in for ParallelLLMManager.converse_parallel_iter."""
+
+    def __init__(self, fail_ids=(), crash_after=None):
+        self.fail_ids = set(fail_ids)
+        self.crash_after = crash_after
+        self.executed = []
+
+    def converse_parallel_iter(self, requests, **kwargs):
+        def results():
+            for request in requests:
+                if self.crash_after is not None and len(self.executed) >= self.crash_after:
+                    raise RuntimeError("simulated crash")
+                self.executed.append(request.request_id)
+                yield (
+                    request.request_id,
+                    BedrockResponse(success=request.request_id not in self.fail_ids),
+                )
+
+        return results()
+
+
+def _write_requests(path, count, with_ids=True):
+    lines = []
+    for index in range(count):
+        record = {"messages": [{"role": "user", "content": [{"text": f"Hello {index}"}]}]}
+        if with_ids:
+            record["request_id"] = f"req-{index}"
+        lines.append(json.dumps(record))
+    path.write_text("\n".join(lines) + "\n")
+
+
+def _read_output(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+class TestJSONLBatchRunner:
+    """Test cases for JSONLBatchRunner."""
+
+    def test_run_writes_all_results(self, tmp_path):
+        """Test that every input record produces an output record."""
+        input_path = tmp_path / "requests.jsonl"
+        output_path = tmp_path / "responses.jsonl"
+        _write_requests(path=input_path, count=5)
+        manager = _FakeParallelManager(fail_ids={"req-3"})
+
+        progress = JSONLBatchRunner(
+            parallel_manager=manager, input_path=input_path, output_path=output_path
+        ).run()
+
+        records = _read_output(path=output_path)
+        assert [record["request_id"] for record in records] == [f"req-{i}" for i in range(5)]
+        assert [record["line_number"] for record in records] == [1, 2, 3, 4, 5]
+        assert records[3]["response"]["success"] is False
+        assert progress.completed == 5
+        assert progress.succeeded == 4
+        assert progress.failed == 1
+        assert progress.remaining_estimate == 0
+        assert (tmp_path / "responses.jsonl.checkpoint").exists()
+
+    def test_resume_skips_finished_requests(self, tmp_path):
+        """Test that a crashed run resumes without re-executing finished requests."""
+        input_path = tmp_path / "requests.jsonl"
+        output_path = tmp_path / "responses.jsonl"
+        _write_requests(path=input_path, count=6)
+
+        crashing = _FakeParallelManager(crash_after=4)
+        with pytest.raises(RuntimeError):
+            JSONLBatchRunner(
+                parallel_manager=crashing, input_path=input_path, output_path=output_path
+            ).run()
+
+        resumed = _FakeParallelManager()
+        progress = JSONLBatchRunner(
+            parallel_manager=resumed, input_path=input_path, output_path=output_path
+        ).run()
+
+        assert resumed.executed == ["req-4", "req-5"]
+        assert progress.skipped == 4
+        assert progress.completed == 2
+        assert [r["request_id"] for r in _read_output(path=output_path)] == [
+            f"req-{i}" for i in range(6)
+        ]
+
+    def test_resume_recovers_unrecorded_output(self, tmp_path):
+        """Test that a result written without its checkpoint entry is not re-executed."""
+        input_path = tmp_path / "requests.jsonl"
+        output_path = tmp_path / "responses.jsonl"
+        checkpoint_path = tmp_path / "run.checkpoint"
+        _write_requests(path=input_path, count=3)
+        checkpoint_path.write_text("S\treq-0\n")
+        output_path.write_text(
+            json.dumps({"request_id": "req-0", "response": {"success": True}})
+            + "\n"
+            + json.dumps({"request_id": "req-1", "response": {"success": True}})
+            + "\n"
+            + '{"request_id": "req-2", "resp'
+        )
+
+        manager = _FakeParallelManager()
+        JSONLBatchRunner(
+            parallel_manager=manager,
+            input_path=input_path,
+            output_path=output_path,
+            checkpoint_path=checkpoint_path,
+        ).run()
+
+        assert manager.executed == ["req-2"]
+        records = _read_output(path=output_path)
+        assert [r["request_id"] for r in records] == ["req-0", "req-1", "req-2"]
+
+    def test_retry_failed_on_resume(self, tmp_path):
+        """Test that failed requests are only re-executed when retry_failed is set."""
+        input_path = tmp_path / "requests.jsonl"
+        output_path = tmp_path / "responses.jsonl"
+        _write_requests(path=input_path, count=3)
+        JSONLBatchRunner(
+            parallel_manager=_FakeParallelManager(fail_ids={"req-1"}),
+            input_path=input_path,
+            output_path=output_path,
+        ).run()
+
+        skipping = _FakeParallelManager()
+        JSONLBatchRunner(
+            parallel_manager=skipping, input_path=input_path, output_path=output_path
+        ).run()
+        assert skipping.executed == []
+
+        retrying = _FakeParallelManager()
+        progress = JSONLBatchRunner(
+            parallel_manager=retrying,
+            input_path=input_path,
+            output_path=output_path,
+            retry_failed=True,
+        ).run()
+        assert retrying.executed == ["req-1"]
+        assert progress.succeeded == 1
+
+    def test_generated_request_ids_are_stable(self, tmp_path):
+        """Test that records without IDs get line-based IDs."""
+        input_path = tmp_path / "requests.jsonl"
+        output_path = tmp_path / "responses.jsonl"
+        _write_requests(path=input_path, count=2, with_ids=False)
+
+        JSONLBatchRunner(
+            parallel_manager=_FakeParallelManager(),
+            input_path=input_path,
+            output_path=output_path,
+        ).run()
+
+        assert [r["request_id"] for r in _read_output(path=output_path)] == ["line-1", "line-2"]
+
+    def test_invalid_json_reports_line(self, tmp_path):
+        """Test that malformed input raises BatchInputError with the line number."""
+        input_path = tmp_path / "requests.jsonl"
+        input_path.write_text(
+            '{"messages": [{"role": "user", "content": [{"text": "ok"}]}]}\n\nnot json\n'
+        )
+
+        runner = JSONLBatchRunner(
+            parallel_manager=_FakeParallelManager(),
+            input_path=input_path,
+            output_path=tmp_path / "responses.jsonl",
+        )
+
+        with pytest.raises(BatchInputError) as exc_info:
+            runner.run()
+        assert exc_info.value.line_number == 3
+
+    def test_record_without_messages(self, tmp_path):
+        """Test that a record that is not a request raises BatchInputError."""
+        input_path = tmp_path / "requests.jsonl"
+        input_path.write_text('{"request_id": "x"}\n')
+
+        runner = JSONLBatchRunner(
+            parallel_manager=_FakeParallelManager(),
+            input_path=input_path,
+            output_path=tmp_path / "responses.jsonl",
+        )
+
+        with pytest.raises(BatchInputError):
+            runner.run()
+
+    def test_progress_callback(self, tmp_path):
+        """Test that progress is reported to the callback."""
+        input_path = tmp_path / "requests.jsonl"
+        _write_requests(path=input_path, count=3)
+        reports = []
+
+        JSONLBatchRunner(
+            parallel_manager=_FakeParallelManager(),
+            input_path=input_path,
+            output_path=tmp_path / "responses.jsonl",
+            progress_interval_seconds=0.0,
+            progress_callback=reports.append,
+        ).run()
+
+        # One report per result plus the final report.
+        assert len(reports) == 4
+        assert reports[-1].completed == 3
+
+    def test_missing_input(self, tmp_path):
+        """Test that a missing input file raises BatchProcessingError."""
+        runner = JSONLBatchRunner(
+            parallel_manager=_FakeParallelManager(),
+            input_path=tmp_path / "missing.jsonl",
+            output_path=tmp_path / "responses.jsonl",
+        )
+
+        with pytest.raises(BatchProcessingError):
+            runner.run()
+
+    def test_same_input_and_output_rejected(self, tmp_path):
+        """Test that input and output must differ."""
+        with pytest.raises(BatchProcessingError):
+            JSONLBatchRunner(
+                parallel_manager=_FakeParallelManager(),
+                input_path=tmp_path / "file.jsonl",
+                output_path=tmp_path / "file.jsonl",
+            )
+
+    def test_with_parallel_llm_manager(self, tmp_path):
+        """Test the runner end-to-end with a ParallelLLMManager."""
+        input_path = tmp_path / "requests.jsonl"
+        output_path = tmp_path / "responses.jsonl"
+        _write_requests(path=input_path, count=10)
+
+        with patch("bestehorn_llmmanager.parallel_llm_manager.LLMManager") as mock_class:
+            mock_llm_manager = Mock()
+            mock_llm_manager.converse.return_value = BedrockResponse(success=True)
+            mock_class.return_value = mock_llm_manager
+            manager = ParallelLLMManager(models=["claude-3-haiku"], regions=["us-east-1"])
+
+            progress = JSONLBatchRunner(
+                parallel_manager=manager, input_path=input_path, output_path=output_path
+            ).run()
+
+        assert progress.succeeded == 10
+        assert sorted(r["request_id"] for r in _read_output(path=output_path)) == sorted(
+            f"req-{i}" for i in range(10)
+        )
+
+
+class TestBatchProgress:
+    """Test cases for BatchProgress."""
+
+    def test_throughput_and_eta(self):
+        """Test throughput and ETA derivation."""
+        progress = BatchProgress(completed=10, elapsed_seconds=5.0, remaining_estimate=100)
+
+        assert progress.throughput_per_second == 2.0
+        assert progress.eta_seconds == 50.0
+        assert progress.format_eta() == "0:00:50"
+
+    def test_unknown_eta(self):
+        """Test ETA when nothing has completed or the total is unknown."""
+        assert BatchProgress(remaining_estimate=5).eta_seconds is None
+        assert BatchProgress(completed=1, elapsed_seconds=1.0).format_eta() == "unknown"
+
+
+class TestBatchCli:
+    """Test cases for the batch command-line interface."""
+
+    def test_main_runs_batch(self, tmp_path):
+        """Test that the CLI executes the input file and reports success."""
+        input_path = tmp_path / "requests.jsonl"
+        output_path = tmp_path / "responses.jsonl"
+        _write_requests(path=input_path, count=2)
+
+        with patch("bestehorn_llmmanager.batch.cli.ParallelLLMManager") as mock_class:
+            mock_class.return_value = _FakeParallelManager()
+            exit_code = main(
+                [str(input_path), str(output_path), "--model", "m", "--region", "us-east-1"]
+            )
+
+        assert exit_code == EXIT_SUCCESS
+        assert len(_read_output(path=output_path)) == 2
+        mock_class.assert_called_once()
+        assert mock_class.call_args.kwargs["models"] == ["m"]
+
+    def test_main_reports_request_failures(self, tmp_path):
+        """Test that failed requests produce a non-zero exit status."""
+        input_path = tmp_path / "requests.jsonl"
+        _write_requests(path=input_path, count=2)
+
+        with patch("bestehorn_llmmanager.batch.cli.ParallelLLMManager") as mock_class:
+            mock_class.return_value = _FakeParallelManager(fail_ids={"req-0"})
+            exit_code = main(
+                [
+                    str(input_path),
+                    str(tmp_path / "responses.jsonl"),
+                    "--model",
+                    "m",
+                    "--region",
+                    "us-east-1",
+                ]
+            )
+
+        assert exit_code == EXIT_REQUEST_FAILURES
@@ -0,0 +1,192 @@
+"""
+Tests for TokenEstimator.
+"""
+
+import struct
+from unittest.mock import patch
+
+import pytest
+
+from bestehorn_llmmanager.bedrock.cache.cache_point_manager import CachePointManager
+from bestehorn_llmmanager.bedrock.cache.token_estimator import TokenEstimator
+from bestehorn_llmmanager.bedrock.models.bedrock_response import BedrockResponse
+from bestehorn_llmmanager.bedrock.models.cache_structures import CacheConfig, CacheStrategy
+
+
+def _png(width, height):
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + struct.pack(">I", 13)
+        + b"IHDR"
+        + struct.pack(">II", width, height)
+        + b"\x08\x02\x00\x00\x00"
+    )
+
+
+def _image_block(content):
+    return {"image": {"format": "png", "source": {"bytes": content}}}
+
+
+def _response(model, input_tokens, cache_read=0, cache_write=0):
+    return BedrockResponse(
+        success=True,
+        model_used=model,
+        response_data={
+            "usage": {
+                "inputTokens": input_tokens,
+                "outputTokens": 5,
+                "totalTokens": input_tokens + 5,
+                "cacheReadInputTokens": cache_read,
+                "cacheWriteInputTokens": cache_write,
+            }
+        },
+    )
+
+
+class TestTokenEstimator:
+    """Test cases for TokenEstimator."""
+
+    def test_text_and_fallback_estimates(self):
+        """Test heuristic estimates of text and uninspectable blocks."""
+        estimator = TokenEstimator()
+
+        assert estimator.estimate_block_tokens(block={"text": "x" * 43}) == 10
+        assert estimator.estimate_block_tokens(block=_image_block(content=b"data")) == 450
+        assert estimator.estimate_block_tokens(block={"video": {"format": "mp4"}}) == 2000
+        assert estimator.estimate_block_tokens(block={"unknown": 1}) == 10
+
+    def test_image_estimate_uses_dimensions(self):
+        """Test that image estimates follow pixel dimensions and downscaling."""
+        estimator = TokenEstimator()
+
+        small = estimator.estimate_block_tokens(block=_image_block(content=_png(200, 200)))
+        large = estimator.estimate_block_tokens(block=_image_block(content=_png(1000, 1000)))
+        huge = estimator.estimate_block_tokens(block=_image_block(content=_png(8000, 8000)))
+
+        assert small == 54  # ceil(40000 / 750)
+        assert large == 1334  # ceil(1000000 / 750)
+        assert huge == 1534  # downscaled to ~1.15 megapixels
+
+    def test_document_estimates(self):
+        """Test PDF page counting and text document sizing."""
+        estimator = TokenEstimator()
+        pdf = b"%PDF-1.7\n<< /Type /Pages /Count 3 >>\n" + b"<< /Type /Page >>\n" * 3
+
+        pdf_tokens = estimator.estimate_block_tokens(
+            block={"document": {"format": "pdf", "name": "d", "source": {"bytes": pdf}}}
+        )
+        txt_tokens = estimator.estimate_block_tokens(
+            block={"document": {"format": "txt", "name": "d", "source": {"bytes": b"a" * 400}}}
+        )
+
+        assert pdf_tokens == 3 * 1500
+        assert txt_tokens == 100
+
+    def test_binary_estimates_memoized_by_content(self):
+        """Test that the same image is inspected once."""
+        estimator = TokenEstimator()
+        content = _png(400, 300)
+
+        with patch(
+            "bestehorn_llmmanager.util.file_type_detector.file_type_detector."
+            "FileTypeDetector.detect_image_dimensions",
+            return_value=(400, 300),
+        ) as mock_detect:
+            first = estimator.estimate_block_tokens(block=_image_block(content=content))
+            second = estimator.estimate_block_tokens(block=_image_block(content=bytes(content)))
+
+        assert first == second == 160
+        mock_detect.assert_called_once()
+
+    def test_model_families(self):
+        """Test mapping of model names and IDs to families."""
+        assert TokenEstimator.get_model_family(model="Claude 3 Haiku") == "anthropic"
+        assert (
+            TokenEstimator.get_model_family(model="us.anthropic.claude-3-haiku-20240307-v1:0")
+            == "anthropic"
+        )
+        assert TokenEstimator.get_model_family(model="Nova Pro") == "amazon"
+        assert TokenEstimator.get_model_family(model="something-else") == "default"
+        assert TokenEstimator.get_model_family(model=None) == "default"
+
+    def test_calibration_from_responses(self):
+        """Test that usage reported by responses calibrates the model family."""
+        estimator = TokenEstimator()
+        messages = [{"role": "user", "content": [{"text": "x" * 800}]}]  # 200 estimated
+
+        estimator.record_response(
+            response=_response(model="anthropic.claude-3-haiku", input_tokens=100, cache_write=200),
+            messages=messages,
+        )
+        estimator.record_response(
+            response=_response(model="anthropic.claude-3-haiku", input_tokens=300),
+            messages=messages,
+        )
+
+        calibration = estimator.get_calibration(model="Claude 3 Haiku")
+        assert calibration.sample_count == 2
+        assert calibration.scale == pytest.approx(1.5)
+        assert estimator.estimate_request_tokens(messages=messages, model="Claude 3 Haiku") == 300
+        assert estimator.estimate_request_tokens(messages=messages, model="Nova Pro") == 200
+        assert estimator.estimate_block_tokens(block={"text": "x" * 40}, model="claude") == 15
+
+    def test_calibration_ignores_small_and_failed_requests(self):
+        """Test that overhead-dominated and failed requests are not learned from."""
+        estimator = TokenEstimator()
+
+        estimator.record_response(
+            response=_response(model="claude", input_tokens=100),
+            messages=[{"role": "user", "content": [{"text": "hi"}]}],
+        )
+        estimator.record_response(
+            response=BedrockResponse(success=False, model_used="claude"),
+            messages=[{"role": "user", "content": [{"text": "x" * 800}]}],
+        )
+
+        assert estimator.get_calibrations() == {}
+
+    def test_calibration_ratio_clamped(self):
+        """Test that outlier observations are clamped."""
+        estimator = TokenEstimator()
+
+        estimator.record_observation(model="claude", estimated_tokens=100, observed_tokens=10000)
+
+        assert estimator.get_calibration(model="claude").scale == 4.0
+
+    def test_invalid_parameters(self):
+        """Test constructor validation."""
+        with pytest.raises(ValueError):
+            TokenEstimator(chars_per_token=0)
+        with pytest.raises(ValueError):
+            TokenEstimator(memo_max_entries=0)
+
+
+class TestCachePointManagerCalibration:
+    """Test cache point placement with a calibrated estimator."""
+
+    def test_calibration_moves_cache_point(self):
+        """Test that a calibrated family reaches the threshold earlier."""
+        blocks = [{"text": "x" * 3000}, {"text": "y" * 3000}, {"text": "question"}]
+        config = CacheConfig(
+            enabled=True, strategy=CacheStrategy.AGGRESSIVE, cache_point_threshold=1000
+        )
+        estimator = TokenEstimator()
+        manager = CachePointManager(config, token_estimator=estimator)
+
+        uncalibrated = manager.inject_cache_points(
+            [{"role": "user", "content": blocks}], model="Claude 3 Haiku"
+        )
+        estimator.record_observation(model="claude", estimated_tokens=1000, observed_tokens=2000)
+        calibrated = manager.inject_cache_points(
+            [{"role": "user", "content": blocks}], model="Claude 3 Haiku"
+        )
+
+        assert [("cachePoint" in b) for b in uncalibrated[0]["content"]] == [False] * 3
+        assert [("cachePoint" in b) for b in calibrated[0]["content"]] == [
+            False,
+            True,
+            False,
+            True,
+            False,
+        ]
+        assert manager.get_token_estimator() is estimator
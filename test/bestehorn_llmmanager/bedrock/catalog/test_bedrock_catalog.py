@@ -165,7 +165,8 @@ class TestBedrockModelCatalogInitializationStrategy:
         mock_cache.load_cache.return_value = sample_catalog
         mock_cache_cls.return_value = mock_cache
 
-        catalog = BedrockModelCatalog(cache_mode=CacheMode.FILE)
+        # The cached catalog covers the configured regions, so nothing is fetched
+        catalog = BedrockModelCatalog(cache_mode=CacheMode.FILE, regions=["us-east-1", "us-west-2"])
         result = catalog.ensure_catalog_available()
 
         assert result is sample_catalog
@@ -377,7 +378,8 @@ class TestBedrockModelCatalogInMemoryCaching:
         mock_cache.load_cache.return_value = sample_catalog
         mock_cache_cls.return_value = mock_cache
 
-        catalog = BedrockModelCatalog(cache_mode=CacheMode.FILE)
+        # The cached catalog covers the configured regions, so nothing is fetched
+        catalog = BedrockModelCatalog(cache_mode=CacheMode.FILE, regions=["us-east-1", "us-west-2"])
 
         # First call loads from cache
         result1 = catalog.ensure_catalog_available()
@@ -0,0 +1,219 @@
+"""
+Tests for region-scoped loading of BedrockModelCatalog against the Bedrock stub.
+"""
+
+from bestehorn_llmmanager import LLMManager
+from bestehorn_llmmanager.bedrock.catalog.bedrock_catalog import BedrockModelCatalog
+from bestehorn_llmmanager.bedrock.models.aws_regions import get_commercial_regions
+from bestehorn_llmmanager.bedrock.models.catalog_constants import (
+    CatalogDefaults,
+    CatalogFilePaths,
+)
+from bestehorn_llmmanager.bedrock.models.catalog_structures import CacheMode
+from bestehorn_llmmanager.bedrock.testing import (
+    StubBedrockConfig,
+    StubBedrockEnvironment,
+    StubRegionBehavior,
+)
+
+LIST_MODELS = "ListFoundationModels"
+
+
+def create_catalog(env: StubBedrockEnvironment, **kwargs) -> BedrockModelCatalog:
+    """Create a catalog fetching from the stub without bundled fallback."""
+    kwargs.setdefault("cache_mode", CacheMode.NONE)
+    return BedrockModelCatalog(
+        auth_manager=env.create_auth_manager(), fallback_to_bundled=False, **kwargs
+    )
+
+
+def fetched_regions(env: StubBedrockEnvironment) -> list:
+    """Regions in which ListFoundationModels was called."""
+    return [
+        region
+        for region in get_commercial_regions()
+        if env.service.get_call_count(operation=LIST_MODELS, region=region)
+    ]
+
+
+class TestRegionScopedCatalog:
+    """Test cases for region-scoped and lazily loaded catalogs."""
+
+    def test_unscoped_catalog_fetches_all_regions(self):
+        """Test that a catalog without regions fetches every commercial region."""
+        with StubBedrockEnvironment() as env:
+            create_catalog(env=env).ensure_catalog_available()
+
+            assert fetched_regions(env=env) == get_commercial_regions()
+
+    def test_scoped_catalog_fetches_configured_regions_only(self):
+        """Test that only the configured regions are fetched on load."""
+        with StubBedrockEnvironment() as env:
+            catalog = create_catalog(env=env, regions=["us-east-1", "us-west-2"])
+
+            assert catalog.is_model_available(model_name=env.model_name, region="us-west-2")
+            assert fetched_regions(env=env) == ["us-east-1", "us-west-2"]
+            assert catalog.get_catalog_metadata().api_regions_queried == [
+                "us-east-1",
+                "us-west-2",
+            ]
+
+    def test_unloaded_region_is_fetched_once_and_merged(self):
+        """Test that the first query for another region fetches and merges it."""
+        with StubBedrockEnvironment() as env:
+            catalog = create_catalog(env=env, regions=["us-east-1"])
+            catalog.ensure_catalog_available()
+
+            access_info = catalog.get_model_info(model_name=env.model_name, region="eu-west-1")
+            catalog.get_model_info(model_name=env.model_name, region="eu-west-1")
+            models = catalog.list_models(region="eu-west-1")
+
+            assert access_info is not None and access_info.region == "eu-west-1"
+            assert [model.model_name for model in models] == [env.model_name]
+            assert catalog.is_model_available(model_name=env.model_name, region="us-east-1")
+            assert env.service.get_call_count(operation=LIST_MODELS, region="eu-west-1") == 1
+            assert fetched_regions(env=env) == ["us-east-1", "eu-west-1"]
+
+    def test_failed_region_is_not_retried(self):
+        """Test that a region failing to load is reported unavailable once."""
+        config = StubBedrockConfig(
+            region_behaviors={
+                "eu-west-1": StubRegionBehavior(control_plane_error="AccessDeniedException")
+            }
+        )
+        with StubBedrockEnvironment(config=config) as env:
+            catalog = create_catalog(env=env, regions=["us-east-1"], max_retries=1)
+
+            for _ in range(2):
+                assert not catalog.is_model_available(model_name=env.model_name, region="eu-west-1")
+
+            assert env.service.get_call_count(operation=LIST_MODELS, region="eu-west-1") == 1
+            assert catalog.is_model_available(model_name=env.model_name, region="us-east-1")
+
+    def test_unknown_region_is_not_fetched(self):
+        """Test that regions outside the commercial and configured ones are not fetched."""
+        with StubBedrockEnvironment() as env:
+            catalog = create_catalog(env=env, regions=["us-east-1"])
+
+            assert catalog.get_model_info(model_name=env.model_name, region="xx-nowhere-1") is None
+            assert env.service.get_call_count(operation=LIST_MODELS) == 1
+
+    def test_cached_catalog_is_extended_with_configured_regions(self, tmp_path, monkeypatch):
+        """Test that a cache written for other regions is completed and saved again."""
+        # Keep caches written to the shared fallback location by other tests out of the way
+        fallback_directory = tmp_path / "fallback"
+        monkeypatch.setattr(
+            CatalogFilePaths, "get_fallback_cache_directory", lambda: fallback_directory
+        )
+        with StubBedrockEnvironment() as env:
+            create_catalog(
+                env=env, regions=["us-east-1"], cache_mode=CacheMode.FILE, cache_directory=tmp_path
+            ).ensure_catalog_available()
+            catalog = create_catalog(
+                env=env, regions=["us-west-2"], cache_mode=CacheMode.FILE, cache_directory=tmp_path
+            )
+
+            assert catalog.is_model_available(model_name=env.model_name, region="us-west-2")
+            reloaded = create_catalog(
+                env=env, regions=["us-west-2"], cache_mode=CacheMode.FILE, cache_directory=tmp_path
+            )
+            metadata = reloaded.get_catalog_metadata()
+
+            assert metadata.api_regions_queried == ["us-east-1", "us-west-2"]
+            assert fetched_regions(env=env) == ["us-east-1", "us-west-2"]
+            assert env.service.get_call_count(operation=LIST_MODELS) == 2
+
+    def test_unscoped_reader_completes_scoped_cache(self, tmp_path, monkeypatch):
+        """Test that a default catalog does not serve a cache written for two regions."""
+        fallback_directory = tmp_path / "fallback"
+        monkeypatch.setattr(
+            CatalogFilePaths, "get_fallback_cache_directory", lambda: fallback_directory
+        )
+        with StubBedrockEnvironment() as env:
+            # Written as a region-scoped LLMManager would write it
+            create_catalog(
+                env=env,
+                regions=["us-east-1", "us-west-2"],
+                cache_mode=CacheMode.FILE,
+                cache_directory=tmp_path,
+            ).ensure_catalog_available()
+            catalog = create_catalog(env=env, cache_mode=CacheMode.FILE, cache_directory=tmp_path)
+
+            models = catalog.list_models(region="eu-west-1")
+            access_info = catalog.get_model_info(model_name=env.model_name, region="ap-south-1")
+
+            assert [model.model_name for model in models] == [env.model_name]
+            assert access_info is not None
+            assert sorted(catalog.get_catalog_metadata().api_regions_queried) == sorted(
+                get_commercial_regions()
+            )
+            assert fetched_regions(env=env) == get_commercial_regions()
+            assert env.service.get_call_count(operation=LIST_MODELS, region="us-east-1") == 1
+
+    def test_warm_load_does_not_refetch_failed_regions(self, tmp_path, monkeypatch):
+        """Test that a region failing on the cold load is not fetched by warm loads."""
+        fallback_directory = tmp_path / "fallback"
+        monkeypatch.setattr(
+            CatalogFilePaths, "get_fallback_cache_directory", lambda: fallback_directory
+        )
+        config = StubBedrockConfig(
+            region_behaviors={
+                "ap-southeast-4": StubRegionBehavior(control_plane_error="AccessDeniedException")
+            }
+        )
+        with StubBedrockEnvironment(config=config) as env:
+            create_catalog(
+                env=env, cache_mode=CacheMode.FILE, cache_directory=tmp_path, max_retries=1
+            ).ensure_catalog_available()
+            cold_calls = env.service.get_call_count(operation=LIST_MODELS)
+
+            for _ in range(2):
+                catalog = create_catalog(
+                    env=env, cache_mode=CacheMode.FILE, cache_directory=tmp_path, max_retries=1
+                )
+                catalog.ensure_catalog_available()
+                assert (
+                    catalog.get_model_info(model_name=env.model_name, region="ap-southeast-4")
+                    is None
+                )
+
+            assert env.service.get_call_count(operation=LIST_MODELS) == cold_calls
+            assert "ap-southeast-4" in catalog.get_catalog_metadata().api_regions_failed
+
+    def test_failed_region_is_retried_after_the_retry_interval(self, tmp_path, monkeypatch):
+        """Test that a failure older than the retry interval is fetched again."""
+        fallback_directory = tmp_path / "fallback"
+        monkeypatch.setattr(
+            CatalogFilePaths, "get_fallback_cache_directory", lambda: fallback_directory
+        )
+        config = StubBedrockConfig(
+            region_behaviors={
+                "eu-west-1": StubRegionBehavior(control_plane_error="AccessDeniedException")
+            }
+        )
+        with StubBedrockEnvironment(config=config) as env:
+            catalog = create_catalog(
+                env=env,
+                regions=["us-east-1"],
+                cache_mode=CacheMode.FILE,
+                cache_directory=tmp_path,
+                max_retries=1,
+            )
+            assert not catalog.is_model_available(model_name=env.model_name, region="eu-west-1")
+            monkeypatch.setattr(CatalogDefaults, "FAILED_REGION_RETRY_HOURS", 0.0)
+            config.region_behaviors.clear()
+
+            reloaded = create_catalog(
+                env=env, regions=["us-east-1"], cache_mode=CacheMode.FILE, cache_directory=tmp_path
+            )
+
+            assert reloaded.is_model_available(model_name=env.model_name, region="eu-west-1")
+            assert env.service.get_call_count(operation=LIST_MODELS, region="eu-west-1") == 2
+            assert "eu-west-1" not in reloaded.get_catalog_metadata().api_regions_failed
+
+    def test_llm_manager_scopes_catalog_to_its_regions(self):
+        """Test that LLMManager only fetches the regions it is configured with."""
+        with StubBedrockEnvironment() as env:
+            LLMManager(models=[env.model_name], regions=["us-east-1", "us-west-2"])
+
+            assert fetched_regions(env=env) == ["us-east-1", "us-west-2"]
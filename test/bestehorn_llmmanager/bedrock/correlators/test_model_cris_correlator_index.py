@@ -0,0 +1,204 @@
+"""
+Tests for the reverse indexes used by ModelCRISCorrelator to match models with CRIS data.
+
+The catalogs are rebuilt from the bundled catalog: every model with direct access becomes
+a foundation model and every inference profile a CRIS model, named the way
+CatalogTransformer names them.
+"""
+
+import time
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+from unittest.mock import patch
+
+import pytest
+
+from bestehorn_llmmanager.bedrock.catalog.bundled_loader import BundledDataLoader
+from bestehorn_llmmanager.bedrock.catalog.transformer import CatalogTransformer
+from bestehorn_llmmanager.bedrock.correlators.model_cris_correlator import ModelCRISCorrelator
+from bestehorn_llmmanager.bedrock.models.cris_structures import (
+    CRISCatalog,
+    CRISInferenceProfile,
+    CRISModelInfo,
+)
+from bestehorn_llmmanager.bedrock.models.data_structures import BedrockModelInfo, ModelCatalog
+
+# Correlating the bundled catalog 20 times over (1780 models, 1040 CRIS models) takes
+# about 0.2s with the indexes; scanning all CRIS names per model took about 4.6s.
+SCALE_FACTOR = 20
+SCALED_CORRELATION_BUDGET_SECONDS = 2.0
+
+
+def bundled_catalogs(copies: int = 1) -> Tuple[ModelCatalog, CRISCatalog]:
+    """Build model and CRIS catalogs from the bundled catalog, optionally replicated."""
+    catalog = BundledDataLoader.load_bundled_catalog()
+    transformer = CatalogTransformer()
+    models: Dict[str, BedrockModelInfo] = {}
+    profiles: Dict[str, Dict[str, Dict[str, list]]] = {}
+
+    for copy in range(copies):
+        suffix = f" {copy}" if copy else ""
+        for model_name, model in catalog.models.items():
+            direct_regions = model.get_direct_access_regions()
+            if direct_regions:
+                models[model_name + suffix] = BedrockModelInfo(
+                    provider=model.provider,
+                    model_id=model.model_id,
+                    regions_supported=direct_regions,
+                    input_modalities=model.input_modalities,
+                    output_modalities=model.output_modalities,
+                    streaming_supported=model.streaming_supported,
+                )
+            for region, access in model.region_access.items():
+                for profile_id in (access.regional_cris_profile_id, access.global_cris_profile_id):
+                    if profile_id:
+                        cris_name = transformer._extract_model_name_from_profile(profile_id)
+                        cris_profiles = profiles.setdefault(cris_name + suffix, {})
+                        cris_profiles.setdefault(profile_id, {})[region] = [region]
+
+    cris_models = {
+        cris_name: CRISModelInfo(
+            model_name=cris_name,
+            inference_profiles={
+                profile_id: CRISInferenceProfile(
+                    inference_profile_id=profile_id,
+                    region_mappings=region_mappings,
+                    is_global=profile_id.startswith("global."),
+                )
+                for profile_id, region_mappings in cris_profiles.items()
+            },
+        )
+        for cris_name, cris_profiles in profiles.items()
+    }
+    timestamp = datetime.now()
+    return (
+        ModelCatalog(retrieval_timestamp=timestamp, models=models),
+        CRISCatalog(retrieval_timestamp=timestamp, cris_models=cris_models),
+    )
+
+
+def linear_scan_match(
+    correlator: ModelCRISCorrelator, model_name: str, name_mapping: Dict[str, str]
+) -> Tuple[Optional[str], str]:
+    """Reference matcher scanning all CRIS names, Global variants first."""
+    for global_only in (True, False):
+        for cris_name, standard_name in name_mapping.items():
+            if standard_name == model_name and (cris_name.startswith("Global ") or not global_only):
+                return cris_name, "exact"
+
+    target = correlator._normalize_model_name(model_name=model_name).lower()
+    for global_only in (True, False):
+        for cris_name in name_mapping:
+            if correlator._normalize_model_name(model_name=cris_name).lower() == target and (
+                cris_name.startswith("Global ") or not global_only
+            ):
+                return cris_name, "fuzzy"
+    return None, "none"
+
+
+def cris_model(name: str, profile_id: str) -> CRISModelInfo:
+    """Create a CRIS model with a single profile."""
+    profile = CRISInferenceProfile(
+        inference_profile_id=profile_id,
+        region_mappings={"us-east-1": ["us-east-1"]},
+        is_global=profile_id.startswith("global."),
+    )
+    return CRISModelInfo(model_name=name, inference_profiles={profile_id: profile})
+
+
+class TestCRISNameIndex:
+    """Test cases for the CRIS name reverse indexes."""
+
+    def test_index_orders_global_variants_first(self):
+        """Test that names sharing a key keep catalog order after Global variants."""
+        correlator = ModelCRISCorrelator(enable_fuzzy_matching=True)
+        cris_models = {
+            name: cris_model(name=name, profile_id=profile_id)
+            for name, profile_id in (
+                ("Anthropic Claude Haiku 4.5", "us.anthropic.claude-haiku-4-5"),
+                ("Global Anthropic Claude Haiku 4.5", "global.anthropic.claude-haiku-4-5"),
+                ("Amazon Nova Pro", "us.amazon.nova-pro-v1:0"),
+            )
+        }
+        name_mapping = {name: "Claude Haiku 4.5" for name in cris_models}
+        name_mapping["Amazon Nova Pro"] = "Nova Pro"
+
+        index = correlator._build_cris_name_index(
+            cris_models=cris_models, name_mapping=name_mapping
+        )
+
+        assert index.by_standard_name == {
+            "Claude Haiku 4.5": ["Global Anthropic Claude Haiku 4.5", "Anthropic Claude Haiku 4.5"],
+            "Nova Pro": ["Amazon Nova Pro"],
+        }
+        assert index.by_normalized_name["nova pro"] == ["Amazon Nova Pro"]
+        assert (
+            ModelCRISCorrelator(enable_fuzzy_matching=False)
+            ._build_cris_name_index(cris_models=cris_models, name_mapping=name_mapping)
+            .by_normalized_name
+            == {}
+        )
+
+
+class TestBundledCatalogCorrelation:
+    """Correlation of catalogs built from the bundled data."""
+
+    def test_matches_agree_with_linear_scan(self):
+        """Test that indexed lookups find the same CRIS models as a full scan."""
+        model_catalog, cris_catalog = bundled_catalogs()
+        correlator = ModelCRISCorrelator(enable_fuzzy_matching=True)
+        name_mapping = correlator._create_model_name_mapping(cris_models=cris_catalog.cris_models)
+        index = correlator._build_cris_name_index(
+            cris_models=cris_catalog.cris_models, name_mapping=name_mapping
+        )
+
+        matched = 0
+        for model_name in model_catalog.models:
+            match, match_type = correlator._find_matching_cris_model(
+                model_name=model_name,
+                cris_models=cris_catalog.cris_models,
+                name_mapping=name_mapping,
+                cris_name_index=index,
+            )
+            expected_name, expected_type = linear_scan_match(
+                correlator=correlator, model_name=model_name, name_mapping=name_mapping
+            )
+            expected = cris_catalog.cris_models[expected_name] if expected_name else None
+            assert (match, match_type) == (expected, expected_type)
+            matched += match is not None
+
+        assert matched > 0
+
+    def test_names_normalized_once_per_correlation(self):
+        """Test that normalization cost is linear in the number of models."""
+        model_catalog, cris_catalog = bundled_catalogs()
+        correlator = ModelCRISCorrelator(enable_fuzzy_matching=True)
+
+        with patch.object(
+            correlator, "_normalize_model_name", wraps=correlator._normalize_model_name
+        ) as normalize:
+            unified = correlator.correlate_catalogs(
+                model_catalog=model_catalog, cris_catalog=cris_catalog
+            )
+
+        assert unified.model_count > 0
+        max_calls = 2 * len(cris_catalog.cris_models) + unified.model_count
+        assert normalize.call_count <= max_calls
+
+    @pytest.mark.benchmark
+    def test_scaled_correlation_benchmark(self):
+        """Guard the correlation time of a catalog 20 times the bundled size."""
+        model_catalog, cris_catalog = bundled_catalogs(copies=SCALE_FACTOR)
+        correlator = ModelCRISCorrelator(enable_fuzzy_matching=True)
+
+        start = time.perf_counter()
+        unified = correlator.correlate_catalogs(
+            model_catalog=model_catalog, cris_catalog=cris_catalog
+        )
+        elapsed = time.perf_counter() - start
+
+        assert unified.model_count >= len(model_catalog.models)
+        assert elapsed < SCALED_CORRELATION_BUDGET_SECONDS, (
+            f"Correlating {len(model_catalog.models)} models with "
+            f"{len(cris_catalog.cris_models)} CRIS models took {elapsed:.2f}s"
+        )
@@ -383,3 +383,36 @@ class TestRegionDistributionManager:
                 available_regions=["us-east-1"],
                 target_regions_per_request=2,
             )
+
+    def test_assign_request_matches_batch_distribution(self):
+        """Test that streamed assignment continues the same sequence as batch distribution."""
+        batch_assignments = self.manager.distribute_requests(
+            requests=self.sample_requests,
+            available_regions=self.sample_regions,
+            target_regions_per_request=1,
+        )
+
+        streaming_manager = RegionDistributionManager()
+        streamed_assignments = [
+            streaming_manager.assign_request(
+                request=request,
+                available_regions=self.sample_regions,
+                target_regions_per_request=1,
+            )
+            for request in self.sample_requests
+        ]
+
+        assert [a.assigned_regions for a in streamed_assignments] == [
+            a.assigned_regions for a in batch_assignments
+        ]
+        assert [a.request_id for a in streamed_assignments] == ["req-1", "req-2", "req-3"]
+        assert sum(streaming_manager.get_region_load_distribution().values()) == 3
+
+    def test_assign_request_insufficient_regions(self):
+        """Test that assign_request validates the region count."""
+        with pytest.raises(RegionDistributionError):
+            self.manager.assign_request(
+                request=self.sample_requests[0],
+                available_regions=["us-east-1"],
+                target_regions_per_request=2,
+            )
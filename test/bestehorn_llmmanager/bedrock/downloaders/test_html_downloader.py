@@ -54,7 +54,7 @@ class TestHTMLDocumentationDownloader:
         assert "Mozilla" in downloader._user_agent
         assert "Chrome" in downloader._user_agent
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     @patch("builtins.open", new_callable=mock_open)
     @patch("pathlib.Path.mkdir")
     def test_download_successful(self, mock_mkdir, mock_file, mock_get, downloader):
@@ -83,7 +83,7 @@ class TestHTMLDocumentationDownloader:
         mock_file.assert_called_once_with(output_path, "w", encoding="utf-8")
         mock_file().write.assert_called_once_with(mock_response.text)
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_download_invalid_url(self, mock_get, downloader):
         """Test download with invalid URL."""
         invalid_urls = ["", "   ", "not-a-url", "ftp://example.com", "file:///local/file"]
@@ -98,7 +98,7 @@ class TestHTMLDocumentationDownloader:
         # Ensure no HTTP requests were made for invalid URLs
         mock_get.assert_not_called()
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     @patch("builtins.open", new_callable=mock_open)
     @patch("pathlib.Path.mkdir")
     def test_download_custom_headers(self, mock_mkdir, mock_file, mock_get, custom_downloader):
@@ -117,7 +117,7 @@ class TestHTMLDocumentationDownloader:
         assert kwargs["verify"] is False
         assert kwargs["headers"]["User-Agent"] == "CustomBot/1.0"
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_download_timeout_error(self, mock_get, downloader):
         """Test download with timeout error."""
         mock_get.side_effect = Timeout("Request timed out")
@@ -130,7 +130,7 @@ class TestHTMLDocumentationDownloader:
 
         assert "Request timed out after 30 seconds" in str(exc_info.value)
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_download_connection_error(self, mock_get, downloader):
         """Test download with connection error."""
         mock_get.side_effect = ConnectionError("Connection failed")
@@ -143,7 +143,7 @@ class TestHTMLDocumentationDownloader:
 
         assert "Connection failed" in str(exc_info.value)
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_download_http_error(self, mock_get, downloader):
         """Test download with HTTP error response."""
         mock_response = Mock()
@@ -158,7 +158,7 @@ class TestHTMLDocumentationDownloader:
 
         assert "404 Not Found" in str(exc_info.value)
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     @patch("builtins.open", side_effect=OSError("Permission denied"))
     @patch("pathlib.Path.mkdir")
     def test_download_file_write_error(self, mock_mkdir, mock_file, mock_get, downloader):
@@ -176,7 +176,7 @@ class TestHTMLDocumentationDownloader:
 
         assert "Permission denied" in str(exc_info.value)
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     @patch("builtins.open", new_callable=mock_open)
     @patch("pathlib.Path.mkdir", side_effect=OSError("Cannot create directory"))
     def test_download_directory_creation_error(self, mock_mkdir, mock_file, mock_get, downloader):
@@ -195,7 +195,7 @@ class TestHTMLDocumentationDownloader:
         # File should still be written even if directory creation fails
         mock_file.assert_called_once()
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     @patch("builtins.open", new_callable=mock_open)
     @patch("pathlib.Path.mkdir")
     def test_download_large_content(self, mock_mkdir, mock_file, mock_get, downloader):
@@ -216,7 +216,7 @@ class TestHTMLDocumentationDownloader:
         # Verify large content was written
         mock_file().write.assert_called_once_with(large_content)
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     @patch("builtins.open", new_callable=mock_open)
     @patch("pathlib.Path.mkdir")
     def test_download_unicode_content(self, mock_mkdir, mock_file, mock_get, downloader):
@@ -247,7 +247,7 @@ class TestHTMLDocumentationDownloader:
         assert "Chrome" in user_agent
         assert "Safari" in user_agent
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     @patch("builtins.open", new_callable=mock_open)
     @patch("pathlib.Path.mkdir")
     def test_make_request_headers(self, mock_mkdir, mock_file, mock_get, downloader):
@@ -275,7 +275,7 @@ class TestHTMLDocumentationDownloader:
         assert "gzip" in headers["Accept-Encoding"]
         assert "keep-alive" in headers["Connection"]
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_make_request_stream_disabled(self, mock_get, downloader):
         """Test that streaming is disabled in requests."""
         mock_response = Mock()
@@ -291,7 +291,7 @@ class TestHTMLDocumentationDownloader:
         assert kwargs["stream"] is False
         assert result == mock_response
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_make_request_timeout_exception_handling(self, mock_get, downloader):
         """Test timeout exception handling in _make_request."""
         mock_get.side_effect = Timeout("Original timeout message")
@@ -301,7 +301,7 @@ class TestHTMLDocumentationDownloader:
 
         assert "Request timed out after 30 seconds" in str(exc_info.value)
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_make_request_connection_exception_handling(self, mock_get, downloader):
         """Test connection exception handling in _make_request."""
         original_error = ConnectionError("DNS resolution failed")
@@ -343,7 +343,7 @@ class TestHTMLDocumentationDownloader:
 
         assert isinstance(downloader, BaseDocumentationDownloader)
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     @patch("builtins.open", new_callable=mock_open)
     @patch("pathlib.Path.mkdir")
     def test_download_empty_content(self, mock_mkdir, mock_file, mock_get, downloader):
@@ -361,7 +361,7 @@ class TestHTMLDocumentationDownloader:
         # Should still write empty content
         mock_file().write.assert_called_once_with("")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     @patch("builtins.open", new_callable=mock_open)
     @patch("pathlib.Path.mkdir")
     def test_download_with_nested_directories(self, mock_mkdir, mock_file, mock_get, downloader):
@@ -397,7 +397,7 @@ class TestHTMLDocumentationDownloader:
             except ValueError:
                 pytest.fail(f"Valid URL {url} was rejected")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_request_exception_propagation(self, mock_get, downloader):
         """Test that various request exceptions are properly handled."""
         exceptions_to_test = [
@@ -0,0 +1,254 @@
+"""
+Tests for conditional, pooled downloads against a local HTTP server.
+"""
+
+import threading
+import warnings
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+from unittest.mock import Mock
+
+import pytest
+
+from bestehorn_llmmanager.bedrock.CRISManager import CRISManager
+from bestehorn_llmmanager.bedrock.downloaders.html_downloader import HTMLDocumentationDownloader
+from bestehorn_llmmanager.bedrock.ModelManager import ModelManager, ModelManagerError
+from bestehorn_llmmanager.bedrock.models.cris_structures import (
+    CRISInferenceProfile,
+    CRISModelInfo,
+)
+from bestehorn_llmmanager.bedrock.models.data_structures import BedrockModelInfo
+from bestehorn_llmmanager.bedrock.parsers.base_parser import ParsingError
+
+LAST_MODIFIED = "Wed, 01 Jan 2025 00:00:00 GMT"
+
+
+class DocumentationServer:
+    """Local HTTP server serving one document with optional validators."""
+
+    def __init__(self) -> None:
+        """Start the server on a free local port."""
+        self.body = "<html><body>v1</body></html>"
+        self.etag: Optional[str] = '"v1"'
+        self.last_modified: Optional[str] = LAST_MODIFIED
+        self.requests: List[Dict[str, Any]] = []
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:
+                server.requests.append(
+                    {"headers": dict(self.headers), "client_port": self.client_address[1]}
+                )
+                not_modified = (
+                    server.etag is not None and self.headers.get("If-None-Match") == server.etag
+                ) or (
+                    server.etag is None
+                    and server.last_modified is not None
+                    and self.headers.get("If-Modified-Since") == server.last_modified
+                )
+                body = b"" if not_modified else server.body.encode("utf-8")
+                self.send_response(304 if not_modified else 200)
+                if server.etag is not None:
+                    self.send_header("ETag", server.etag)
+                if server.last_modified is not None:
+                    self.send_header("Last-Modified", server.last_modified)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self._httpd.server_address[1]}/docs.html"
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        """Stop the server."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+@pytest.fixture
+def server() -> Iterator[DocumentationServer]:
+    """Run a local documentation server for one test."""
+    documentation_server = DocumentationServer()
+    yield documentation_server
+    documentation_server.close()
+
+
+class TestConditionalDownload:
+    """Test cases for conditional downloads of HTMLDocumentationDownloader."""
+
+    def test_unchanged_document_is_not_downloaded_again(self, server, tmp_path):
+        """Test that a 304 response keeps the saved file and reports no change."""
+        downloader = HTMLDocumentationDownloader()
+        output_path = tmp_path / "docs.htm"
+
+        assert downloader.download(url=server.url, output_path=output_path) is True
+        assert downloader.download(url=server.url, output_path=output_path) is False
+
+        assert output_path.read_text(encoding="utf-8") == server.body
+        assert "If-None-Match" not in server.requests[0]["headers"]
+        assert server.requests[1]["headers"]["If-None-Match"] == '"v1"'
+        assert server.requests[1]["headers"]["If-Modified-Since"] == LAST_MODIFIED
+        assert (tmp_path / "docs.htm.validators.json").exists()
+
+    def test_changed_document_is_downloaded(self, server, tmp_path):
+        """Test that a changed document replaces the saved file and validators."""
+        downloader = HTMLDocumentationDownloader()
+        output_path = tmp_path / "docs.htm"
+        downloader.download(url=server.url, output_path=output_path)
+
+        server.body, server.etag = "<html><body>v2</body></html>", '"v2"'
+
+        assert downloader.download(url=server.url, output_path=output_path) is True
+        assert downloader.download(url=server.url, output_path=output_path) is False
+        assert output_path.read_text(encoding="utf-8") == server.body
+        assert server.requests[2]["headers"]["If-None-Match"] == '"v2"'
+
+    def test_last_modified_only(self, server, tmp_path):
+        """Test conditional requests for servers sending Last-Modified only."""
+        server.etag = None
+        downloader = HTMLDocumentationDownloader()
+        output_path = tmp_path / "docs.htm"
+
+        downloader.download(url=server.url, output_path=output_path)
+
+        assert downloader.download(url=server.url, output_path=output_path) is False
+        assert "If-None-Match" not in server.requests[1]["headers"]
+
+    def test_missing_file_is_downloaded_unconditionally(self, server, tmp_path):
+        """Test that validators without the saved file do not make a conditional request."""
+        downloader = HTMLDocumentationDownloader()
+        output_path = tmp_path / "docs.htm"
+        downloader.download(url=server.url, output_path=output_path)
+        output_path.unlink()
+
+        assert downloader.download(url=server.url, output_path=output_path) is True
+        assert "If-None-Match" not in server.requests[1]["headers"]
+        assert output_path.exists()
+
+    def test_deferred_validators_are_saved_on_request(self, server, tmp_path):
+        """Test that deferred validators replace the old ones only when saved."""
+        downloader = HTMLDocumentationDownloader()
+        output_path = tmp_path / "docs.htm"
+        validators_path = tmp_path / "docs.htm.validators.json"
+        downloader.download(url=server.url, output_path=output_path)
+
+        server.body, server.etag = "<html><body>v2</body></html>", '"v2"'
+        assert downloader.download(url=server.url, output_path=output_path, defer_validators=True)
+        assert not validators_path.exists()
+
+        downloader.save_validators(output_path=output_path)
+        assert downloader.download(url=server.url, output_path=output_path) is False
+        assert server.requests[2]["headers"]["If-None-Match"] == '"v2"'
+
+    def test_connections_are_pooled(self, server, tmp_path):
+        """Test that consecutive downloads reuse one connection."""
+        downloader = HTMLDocumentationDownloader()
+
+        for index in range(3):
+            downloader.download(url=server.url, output_path=tmp_path / f"docs{index}.htm")
+        downloader.close()
+
+        assert len({request["client_port"] for request in server.requests}) == 1
+
+
+def create_manager(manager_class: type, server: DocumentationServer, tmp_path: Path, **kwargs):
+    """Create a deprecated manager downloading from the local server."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        return manager_class(
+            html_output_path=tmp_path / "docs.htm",
+            json_output_path=tmp_path / "docs.json",
+            documentation_url=server.url,
+            **kwargs,
+        )
+
+
+class TestManagersReuseCatalog:
+    """Test that unchanged documentation skips parsing in the legacy managers."""
+
+    def test_model_manager_reuses_json_catalog(self, server, tmp_path):
+        """Test that ModelManager loads the saved JSON instead of parsing again."""
+        manager = create_manager(manager_class=ModelManager, server=server, tmp_path=tmp_path)
+        model = BedrockModelInfo(
+            provider="Amazon",
+            model_id="amazon.nova-pro-v1:0",
+            regions_supported=["us-east-1"],
+            input_modalities=["Text"],
+            output_modalities=["Text"],
+            streaming_supported=True,
+        )
+        manager._parser = Mock()
+        manager._parser.parse.return_value = {"Nova Pro": model}
+
+        first = manager.refresh_model_data()
+        second = manager.refresh_model_data()
+
+        manager._parser.parse.assert_called_once()
+        assert second.models == first.models
+        assert second.retrieval_timestamp == first.retrieval_timestamp
+        assert manager.get_model_count() == 1
+
+    def test_cris_manager_reuses_json_catalog(self, server, tmp_path):
+        """Test that CRISManager loads the saved JSON instead of parsing again."""
+        manager = create_manager(
+            manager_class=CRISManager, server=server, tmp_path=tmp_path, use_api=False
+        )
+        profile_id = "us.amazon.nova-pro-v1:0"
+        model = CRISModelInfo(
+            model_name="Nova Pro",
+            inference_profiles={
+                profile_id: CRISInferenceProfile(
+                    inference_profile_id=profile_id,
+                    region_mappings={"us-east-1": ["us-east-1", "us-west-2"]},
+                )
+            },
+        )
+        manager._parser = Mock()
+        manager._parser.parse.return_value = {"Nova Pro": model}
+
+        first = manager.refresh_cris_data()
+        second = manager.refresh_cris_data()
+
+        manager._parser.parse.assert_called_once()
+        assert second.to_dict() == first.to_dict()
+        assert isinstance(second.retrieval_timestamp, datetime)
+
+    def test_failed_parse_does_not_validate_stale_json(self, server, tmp_path):
+        """Test that a download whose parse failed is fetched and parsed again."""
+        manager = create_manager(manager_class=ModelManager, server=server, tmp_path=tmp_path)
+        manager._parser = Mock()
+        manager._parser.parse.return_value = {}
+        manager.refresh_model_data()
+
+        server.body, server.etag = "<html><body>v2</body></html>", '"v2"'
+        manager._parser.parse.side_effect = ParsingError("unexpected table layout")
+        with pytest.raises(ModelManagerError):
+            manager.refresh_model_data()
+        manager._parser.parse.side_effect = None
+        manager.refresh_model_data()
+
+        assert manager._parser.parse.call_count == 3
+        assert "If-None-Match" not in server.requests[2]["headers"]
+
+    def test_manager_parses_when_json_is_missing(self, server, tmp_path):
+        """Test that an unchanged document is parsed if no JSON catalog was saved."""
+        manager = create_manager(manager_class=ModelManager, server=server, tmp_path=tmp_path)
+        manager._parser = Mock()
+        manager._parser.parse.return_value = {}
+
+        manager.refresh_model_data()
+        (tmp_path / "docs.json").unlink()
+        manager.refresh_model_data()
+
+        assert manager._parser.parse.call_count == 2
@@ -0,0 +1,282 @@
+"""
+Tests for BatchInferenceExecutor and AnthropicBatchRecordFormatter.
+"""
+
+import json
+
+import pytest
+
+from bestehorn_llmmanager.bedrock.exceptions.parallel_exceptions import (
+    BatchInferenceError,
+    BatchInferenceUnsupportedRequestError,
+)
+from bestehorn_llmmanager.bedrock.executors.batch_inference_executor import (
+    BatchInferenceExecutor,
+    parse_s3_uri,
+)
+from bestehorn_llmmanager.bedrock.executors.batch_record_formatter import (
+    AnthropicBatchRecordFormatter,
+)
+from bestehorn_llmmanager.bedrock.models.batch_inference_constants import BatchJobStatus
+from bestehorn_llmmanager.bedrock.models.batch_inference_structures import BatchInferenceConfig
+from bestehorn_llmmanager.bedrock.models.parallel_structures import BedrockConverseRequest
+from bestehorn_llmmanager.bedrock.testing.batch_inference_stub import (
+    StubBedrockBatchClient,
+    StubS3Client,
+)
+
+MODEL_ID = "anthropic.claude-3-haiku-20240307-v1:0"
+
+
+def _config(**overrides):
+    values = {
+        "role_arn": "arn:aws:iam::123456789012:role/BedrockBatch",
+        "s3_input_uri": "s3://bucket/in",
+        "s3_output_uri": "s3://bucket/out/",
+        "min_batch_size": 2,
+        "max_records_per_job": 4,
+    }
+    values.update(overrides)
+    return BatchInferenceConfig(**values)
+
+
+def _requests(count):
+    return [
+        BedrockConverseRequest(
+            messages=[{"role": "user", "content": [{"text": f"Hello {index}"}]}],
+            request_id=f"req-{index}",
+        )
+        for index in range(count)
+    ]
+
+
+def _executor(config=None, sleeps=None, clock=None, **stub_kwargs):
+    s3_client = StubS3Client()
+    bedrock_client = StubBedrockBatchClient(s3_client=s3_client, **stub_kwargs)
+    executor = BatchInferenceExecutor(
+        config=config or _config(),
+        bedrock_client=bedrock_client,
+        s3_client=s3_client,
+        region="us-east-1",
+        sleep_func=(sleeps.append if sleeps is not None else lambda _: None),
+        clock_func=clock or (lambda: 0.0),
+    )
+    return executor, bedrock_client, s3_client
+
+
+class TestBatchInferenceExecutor:
+    """Test cases for BatchInferenceExecutor."""
+
+    def test_execute_maps_outputs_by_request_id(self):
+        """Test that each request gets the output of its own record."""
+        executor, bedrock_client, s3_client = _executor()
+
+        responses = executor.execute_requests(requests=_requests(count=3), model_id=MODEL_ID)
+
+        assert sorted(responses) == ["req-0", "req-1", "req-2"]
+        for index in range(3):
+            response = responses[f"req-{index}"]
+            assert response.success
+            assert response.get_content() == f"Hello {index}"
+            assert response.get_stop_reason() == "end_turn"
+            assert response.model_used == MODEL_ID
+            assert response.region_used == "us-east-1"
+            assert response.access_method_used == "batch_inference"
+
+        (job,) = bedrock_client.jobs.values()
+        assert job["modelId"] == MODEL_ID
+        assert job["outputDataConfig"]["s3OutputDataConfig"]["s3Uri"].startswith("s3://bucket/out/")
+        input_keys = [key for key in s3_client.objects["bucket"] if key.startswith("in/")]
+        assert len(input_keys) == 1 and input_keys[0].endswith("/input.jsonl")
+
+    def test_large_batches_split_evenly(self):
+        """Test that requests beyond max_records_per_job are split across jobs."""
+        executor, bedrock_client, _ = _executor()
+
+        responses = executor.execute_requests(requests=_requests(count=9), model_id=MODEL_ID)
+
+        assert len(responses) == 9
+        assert all(response.success for response in responses.values())
+        assert [job.record_count for job in executor.get_last_jobs()] == [3, 3, 3]
+        assert len(bedrock_client.jobs) == 3
+
+    def test_polls_with_backoff(self):
+        """Test that the poll delay grows up to the maximum."""
+        sleeps = []
+        config = _config(
+            poll_initial_delay_seconds=10.0,
+            poll_max_delay_seconds=25.0,
+            poll_backoff_multiplier=2.0,
+        )
+        executor, _, _ = _executor(config=config, sleeps=sleeps, polls_until_complete=4)
+
+        executor.execute_requests(requests=_requests(count=2), model_id=MODEL_ID)
+
+        assert sleeps == [10.0, 20.0, 25.0, 25.0]
+        assert executor.get_last_jobs()[0].status == BatchJobStatus.COMPLETED
+
+    def test_failed_and_missing_records(self):
+        """Test that error records and missing records become failed responses."""
+        executor, _, _ = _executor(
+            failing_record_ids={"00000000001"}, dropped_record_ids={"00000000002"}
+        )
+
+        responses = executor.execute_requests(requests=_requests(count=3), model_id=MODEL_ID)
+
+        assert not responses["req-0"].success
+        assert "Stub failure" in responses["req-0"].get_warnings()[0]
+        assert not responses["req-1"].success
+        assert "No output record" in responses["req-1"].get_warnings()[0]
+        assert responses["req-2"].success
+
+    def test_unsuccessful_job_fails_its_requests(self):
+        """Test that a job ending without output fails all of its requests."""
+        executor, _, _ = _executor(final_status=BatchJobStatus.FAILED)
+
+        responses = executor.execute_requests(requests=_requests(count=2), model_id=MODEL_ID)
+
+        assert not any(response.success for response in responses.values())
+        assert "Failed" in responses["req-0"].get_warnings()[0]
+
+    def test_wait_timeout(self):
+        """Test that jobs not finishing within max_wait_seconds raise."""
+        now = [0.0]
+
+        def sleep(seconds):
+            now[0] += seconds
+
+        s3_client = StubS3Client()
+        executor = BatchInferenceExecutor(
+            config=_config(max_wait_seconds=60.0, poll_initial_delay_seconds=30.0),
+            bedrock_client=StubBedrockBatchClient(s3_client=s3_client, polls_until_complete=100),
+            s3_client=s3_client,
+            region="us-east-1",
+            sleep_func=sleep,
+            clock_func=lambda: now[0],
+        )
+
+        with pytest.raises(BatchInferenceError) as exc_info:
+            executor.execute_requests(requests=_requests(count=2), model_id=MODEL_ID)
+        assert exc_info.value.job_arn == executor.get_last_jobs()[0].job_arn
+
+    def test_submission_failure(self):
+        """Test that control-plane errors are wrapped in BatchInferenceError."""
+        executor, bedrock_client, _ = _executor()
+
+        def fail(**kwargs):
+            raise RuntimeError("AccessDenied")
+
+        bedrock_client.create_model_invocation_job = fail
+
+        with pytest.raises(BatchInferenceError, match="AccessDenied"):
+            executor.execute_requests(requests=_requests(count=2), model_id=MODEL_ID)
+
+    def test_unsupported_request_submits_nothing(self):
+        """Test that formatting errors are raised before anything is uploaded."""
+        executor, bedrock_client, s3_client = _executor()
+        requests = _requests(count=2)
+        requests[1].messages[0]["content"].append(
+            {"document": {"format": "pdf", "name": "doc", "source": {"bytes": b"%PDF"}}}
+        )
+
+        with pytest.raises(BatchInferenceUnsupportedRequestError):
+            executor.execute_requests(requests=requests, model_id=MODEL_ID)
+        assert bedrock_client.jobs == {}
+        assert s3_client.objects == {}
+
+    def test_non_anthropic_model_submits_nothing(self):
+        """Test that models the record formatter does not support are rejected up front."""
+        executor, bedrock_client, s3_client = _executor()
+
+        with pytest.raises(BatchInferenceUnsupportedRequestError, match="amazon.nova-pro"):
+            executor.execute_requests(requests=_requests(count=2), model_id="amazon.nova-pro-v1:0")
+        assert bedrock_client.jobs == {}
+        assert s3_client.objects == {}
+
+    def test_parse_s3_uri(self):
+        """Test S3 URI parsing."""
+        assert parse_s3_uri(uri="s3://bucket/a/b/") == ("bucket", "a/b")
+        assert parse_s3_uri(uri="s3://bucket") == ("bucket", "")
+        with pytest.raises(BatchInferenceError):
+            parse_s3_uri(uri="https://bucket/a")
+
+
+class TestAnthropicBatchRecordFormatter:
+    """Test cases for AnthropicBatchRecordFormatter."""
+
+    def test_to_model_input(self):
+        """Test conversion of a Converse request to an Anthropic Messages body."""
+        request = BedrockConverseRequest(
+            messages=[
+                {
+                    "role": "user",
+                    "content": [
+                        {"text": "Describe"},
+                        {"image": {"format": "png", "source": {"bytes": b"\x89PNG"}}},
+                    ],
+                },
+                {
+                    "role": "assistant",
+                    "content": [{"toolUse": {"toolUseId": "t1", "name": "f", "input": {"a": 1}}}],
+                },
+                {
+                    "role": "user",
+                    "content": [
+                        {"toolResult": {"toolUseId": "t1", "content": [{"json": {"ok": True}}]}}
+                    ],
+                },
+            ],
+            system=[{"text": "Be brief"}],
+            inference_config={"maxTokens": 100, "temperature": 0.2},
+            tool_config={
+                "tools": [
+                    {
+                        "toolSpec": {
+                            "name": "f",
+                            "description": "A tool",
+                            "inputSchema": {"json": {"type": "object"}},
+                        }
+                    }
+                ],
+                "toolChoice": {"tool": {"name": "f"}},
+            },
+            additional_model_request_fields={"top_k": 5},
+            request_id="r",
+        )
+
+        body = AnthropicBatchRecordFormatter().to_model_input(request)
+
+        assert body["anthropic_version"] == "bedrock-2023-05-31"
+        assert body["max_tokens"] == 100
+        assert body["temperature"] == 0.2
+        assert body["top_k"] == 5
+        assert body["system"] == [{"type": "text", "text": "Be brief"}]
+        image = body["messages"][0]["content"][1]
+        assert image["source"] == {"type": "base64", "media_type": "image/png", "data": "iVBORw=="}
+        assert body["messages"][1]["content"][0]["type"] == "tool_use"
+        tool_result = body["messages"][2]["content"][0]
+        assert tool_result["content"] == [{"type": "text", "text": json.dumps({"ok": True})}]
+        assert body["tools"] == [
+            {"name": "f", "description": "A tool", "input_schema": {"type": "object"}}
+        ]
+        assert body["tool_choice"] == {"type": "tool", "name": "f"}
+
+    def test_to_response_data(self):
+        """Test conversion of an Anthropic response to Converse-shaped data."""
+        data = AnthropicBatchRecordFormatter().to_response_data(
+            model_output={
+                "role": "assistant",
+                "content": [
+                    {"type": "text", "text": "Hi"},
+                    {"type": "tool_use", "id": "t1", "name": "f", "input": {}},
+                ],
+                "stop_reason": "tool_use",
+                "usage": {"input_tokens": 3, "output_tokens": 4, "cache_read_input_tokens": 2},
+            }
+        )
+
+        assert data["output"]["message"]["content"][0] == {"text": "Hi"}
+        assert data["output"]["message"]["content"][1]["toolUse"]["toolUseId"] == "t1"
+        assert data["stopReason"] == "tool_use"
+        assert data["usage"]["totalTokens"] == 7
+        assert data["usage"]["cacheReadInputTokens"] == 2
@@ -0,0 +1,191 @@
+"""
+Tests for cache-prefix grouping and cache-aware scheduling of parallel requests.
+"""
+
+from typing import Any, Dict, List, Optional
+from unittest.mock import Mock
+
+from bestehorn_llmmanager import ParallelLLMManager
+from bestehorn_llmmanager.bedrock.executors.cache_prefix_grouping import (
+    compute_cache_prefix_keys,
+    group_requests_by_cache_prefix,
+)
+from bestehorn_llmmanager.bedrock.models.llm_manager_structures import RegionOrder, RetryConfig
+from bestehorn_llmmanager.bedrock.models.parallel_structures import (
+    BedrockConverseRequest,
+    ParallelProcessingConfig,
+)
+from bestehorn_llmmanager.bedrock.retry.retry_manager import RetryManager
+from bestehorn_llmmanager.bedrock.testing import (
+    LatencyDistribution,
+    StubBedrockConfig,
+    StubBedrockEnvironment,
+    StubRegionBehavior,
+)
+
+CACHE_POINT = {"cachePoint": {"type": "default"}}
+MIN_TOKENS = 100
+GROUPS = 3
+REQUESTS_PER_GROUP = 8
+REGIONS = ["us-east-1", "us-west-2"]
+
+
+def make_request(
+    system_text: Optional[str], question: str, request_id: Optional[str] = None
+) -> BedrockConverseRequest:
+    """Request with a cached system prompt (if given) and a user question."""
+    system = None if system_text is None else [{"text": system_text}, CACHE_POINT]
+    return BedrockConverseRequest(
+        messages=[{"role": "user", "content": [{"text": question}]}],
+        system=system,
+        request_id=request_id,
+    )
+
+
+def make_batch() -> List[BedrockConverseRequest]:
+    """Interleaved requests of several groups sharing a long system prompt each."""
+    return [
+        make_request(
+            system_text=f"instructions {group} " + "rule " * 200,
+            question=f"question {index}",
+            request_id=f"g{group}-r{index}",
+        )
+        for index in range(REQUESTS_PER_GROUP)
+        for group in range(GROUPS)
+    ]
+
+
+class TestCachePrefixGrouping:
+    """Test cases for the cache-prefix grouping functions."""
+
+    def test_keys_follow_cache_points(self):
+        """Test one key per cache point, equal exactly for equal prefixes."""
+        first = BedrockConverseRequest(
+            messages=[
+                {"role": "user", "content": [{"text": "document"}, CACHE_POINT]},
+                {"role": "assistant", "content": [{"text": "ok"}]},
+                {"role": "user", "content": [{"text": "question"}, CACHE_POINT]},
+            ],
+            system=[{"text": "rules"}, CACHE_POINT],
+        )
+        second = BedrockConverseRequest(
+            messages=[{"role": "user", "content": [{"text": "document"}, CACHE_POINT]}],
+            system=[{"text": "rules"}, CACHE_POINT],
+        )
+        other_role = BedrockConverseRequest(
+            messages=[{"role": "assistant", "content": [{"text": "document"}, CACHE_POINT]}],
+            system=[{"text": "rules"}, CACHE_POINT],
+        )
+
+        first_keys = compute_cache_prefix_keys(request=first)
+        second_keys = compute_cache_prefix_keys(request=second)
+
+        assert len(first_keys) == 3
+        assert second_keys == first_keys[:2]
+        assert compute_cache_prefix_keys(request=other_role)[1] != first_keys[1]
+        assert compute_cache_prefix_keys(request=make_request(None, "q")) == []
+
+    def test_tools_are_part_of_the_prefix(self):
+        """Test that different tool definitions give different prefixes."""
+        requests = [
+            BedrockConverseRequest(
+                messages=[{"role": "user", "content": [{"text": "hi"}]}],
+                system=[{"text": "rules"}, CACHE_POINT],
+                tool_config={"tools": [{"toolSpec": {"name": name}}]},
+            )
+            for name in ("search", "lookup")
+        ]
+
+        keys = [compute_cache_prefix_keys(request=request) for request in requests]
+
+        assert keys[0] != keys[1]
+
+    def test_groups_on_shortest_shared_prefix(self):
+        """Test that requests join the group of the shortest prefix they share."""
+        requests = {
+            "a": make_request(system_text="shared", question="one"),
+            "b": make_request(system_text="shared", question="two"),
+            "c": make_request(system_text="alone", question="three"),
+            "d": make_request(system_text=None, question="four"),
+            "e": make_request(system_text="shared", question="five"),
+        }
+
+        groups = group_requests_by_cache_prefix(requests=requests)
+
+        assert list(groups.values()) == [["a", "b", "e"]]
+
+
+class TestPreferredRegion:
+    """Test that a preferred region is tried first."""
+
+    def test_preferred_region_moves_to_front(self):
+        """Test that the preferred region leads and all other regions stay."""
+        retry_manager = RetryManager(retry_config=RetryConfig())
+        model_manager = Mock()
+        model_manager.get_model_access_info.return_value = Mock()
+        regions = ["us-east-1", "us-west-2", "eu-west-1"]
+
+        targets = retry_manager.generate_retry_targets(
+            models=["Model"],
+            regions=regions,
+            unified_model_manager=model_manager,
+            preferred_region="eu-west-1",
+        )
+        unknown = retry_manager.generate_retry_targets(
+            models=["Model"],
+            regions=regions,
+            unified_model_manager=model_manager,
+            preferred_region="ap-south-1",
+        )
+
+        assert [region for _, region, _ in targets] == ["eu-west-1", "us-east-1", "us-west-2"]
+        assert [region for _, region, _ in unknown] == regions
+
+
+class TestCacheAwareScheduling:
+    """Test cache-aware scheduling through ParallelLLMManager."""
+
+    def run_batch(self, enabled: bool) -> Dict[str, Any]:
+        """Run the batch against a stub with prompt caching and return its metrics."""
+        config = StubBedrockConfig(
+            prompt_cache_min_tokens=MIN_TOKENS,
+            default_behavior=StubRegionBehavior(latency=LatencyDistribution.fixed(value_ms=50.0)),
+        )
+        with StubBedrockEnvironment(config=config) as env:
+            manager = ParallelLLMManager(
+                models=[env.model_name],
+                regions=REGIONS,
+                # Rotating the first region spreads each group over both regions
+                retry_config=RetryConfig(region_order=RegionOrder.ROTATE),
+                parallel_config=ParallelProcessingConfig(
+                    max_concurrent_requests=GROUPS * REQUESTS_PER_GROUP,
+                    enable_cache_aware_scheduling=enabled,
+                ),
+            )
+            response = manager.converse_parallel(requests=make_batch())
+
+        assert response.success
+        responses = response.request_responses
+        return {
+            "hit_ratio": response.get_cache_metrics().cache_hit_ratio,
+            "write_tokens": sum(item.get_cache_write_tokens() for item in responses.values()),
+            "regions": {
+                group: {
+                    responses[f"g{group}-r{index}"].region_used
+                    for index in range(REQUESTS_PER_GROUP)
+                }
+                for group in range(GROUPS)
+            },
+        }
+
+    def test_group_members_read_the_primed_prefix(self):
+        """Test that all but one request per group read the cached prefix."""
+        baseline = self.run_batch(enabled=False)
+        scheduled = self.run_batch(enabled=True)
+
+        # Only each group's primer writes its prefix, in the region all members then use
+        assert scheduled["hit_ratio"] == (REQUESTS_PER_GROUP - 1) / REQUESTS_PER_GROUP
+        assert all(len(regions) == 1 for regions in scheduled["regions"].values())
+        # Without scheduling, requests that start together all miss and write the prefix
+        assert baseline["hit_ratio"] < scheduled["hit_ratio"]
+        assert baseline["write_tokens"] >= 2 * scheduled["write_tokens"]
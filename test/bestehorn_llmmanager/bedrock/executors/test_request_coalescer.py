@@ -0,0 +1,192 @@
+"""
+Tests for single-flight request coalescing.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+
+import pytest
+
+from bestehorn_llmmanager import LLMManager, ParallelLLMManager
+from bestehorn_llmmanager.bedrock.executors.request_coalescer import (
+    RequestCoalescer,
+    compute_request_key,
+)
+from bestehorn_llmmanager.bedrock.models.model_specific_structures import ModelSpecificConfig
+from bestehorn_llmmanager.bedrock.models.parallel_structures import BedrockConverseRequest
+from bestehorn_llmmanager.bedrock.testing import StubBedrockConfig, StubBedrockEnvironment
+
+MESSAGES = [{"role": "user", "content": [{"text": "hello"}]}]
+
+
+def wait_for(condition: Any, timeout: float = 5.0) -> None:
+    """Poll until a condition holds."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.001)
+
+
+class TestComputeRequestKey:
+    """Test cases for compute_request_key."""
+
+    def test_equal_content_gives_equal_key(self):
+        """Test that keys depend on content, not identity or argument order."""
+        first = compute_request_key(
+            request_args={
+                "messages": [{"role": "user", "content": [{"image": {"bytes": b"abc"}}]}],
+                "inferenceConfig": {"maxTokens": 5, "temperature": 0.1},
+                "model_specific_config": ModelSpecificConfig(enable_extended_context=True),
+                "system": None,
+            }
+        )
+        second = compute_request_key(
+            request_args={
+                "model_specific_config": ModelSpecificConfig(enable_extended_context=True),
+                "inferenceConfig": {"temperature": 0.1, "maxTokens": 5},
+                "messages": [{"role": "user", "content": [{"image": {"bytes": b"abc"}}]}],
+            }
+        )
+
+        assert first == second
+
+    def test_different_content_gives_different_key(self):
+        """Test that any differing argument changes the key."""
+        base = {"messages": MESSAGES, "inferenceConfig": {"maxTokens": 5}}
+
+        assert compute_request_key(request_args=base) != compute_request_key(
+            request_args=dict(base, inferenceConfig={"maxTokens": 6})
+        )
+        assert compute_request_key(
+            request_args={"messages": [{"content": [{"image": {"bytes": b"a"}}]}]}
+        ) != compute_request_key(
+            request_args={"messages": [{"content": [{"image": {"bytes": b"b"}}]}]}
+        )
+
+    def test_opaque_objects_match_only_themselves(self):
+        """Test that callables are compared by identity."""
+
+        def validator_a(response: Any) -> None:
+            pass
+
+        def validator_b(response: Any) -> None:
+            pass
+
+        assert compute_request_key(request_args={"v": validator_a}) == compute_request_key(
+            request_args={"v": validator_a}
+        )
+        assert compute_request_key(request_args={"v": validator_a}) != compute_request_key(
+            request_args={"v": validator_b}
+        )
+
+
+class TestRequestCoalescer:
+    """Test cases for RequestCoalescer."""
+
+    def test_concurrent_callers_share_one_execution(self):
+        """Test that followers wait for and receive the leader's result object."""
+        coalescer: RequestCoalescer[Dict[str, int]] = RequestCoalescer()
+        release = threading.Event()
+        calls: List[int] = []
+
+        def operation() -> Dict[str, int]:
+            calls.append(1)
+            release.wait(timeout=5)
+            return {"value": 1}
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [
+                pool.submit(coalescer.execute, key="k", operation=operation) for _ in range(4)
+            ]
+            wait_for(lambda: coalescer.coalesced_count == 3)
+            release.set()
+            results = [future.result() for future in futures]
+
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
+        assert coalescer.executed_count == 1
+        assert coalescer.in_flight_count == 0
+
+    def test_exception_is_shared_and_nothing_is_cached(self):
+        """Test exception propagation and that completed executions are not reused."""
+        coalescer: RequestCoalescer[int] = RequestCoalescer()
+        release = threading.Event()
+
+        def failing() -> int:
+            release.wait(timeout=5)
+            raise ValueError("boom")
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            futures = [pool.submit(coalescer.execute, key="k", operation=failing) for _ in range(2)]
+            wait_for(lambda: coalescer.coalesced_count == 1)
+            release.set()
+            for future in futures:
+                with pytest.raises(ValueError):
+                    future.result()
+
+        assert coalescer.execute(key="k", operation=lambda: 7) == 7
+        assert coalescer.execute(key="k", operation=lambda: 8) == 8
+        assert coalescer.executed_count == 3
+
+
+class TestManagerCoalescing:
+    """Test request coalescing in LLMManager and ParallelLLMManager."""
+
+    def test_llm_manager_coalesces_identical_concurrent_calls(self):
+        """Test that identical concurrent converse calls reach Bedrock once."""
+        release = threading.Event()
+
+        def blocking_responder(request: Dict[str, Any]) -> str:
+            release.wait(timeout=5)
+            return request["messages"][-1]["content"][0]["text"]
+
+        config = StubBedrockConfig(responder=blocking_responder)
+        with StubBedrockEnvironment(config=config) as env:
+            manager = LLMManager(
+                models=[env.model_name],
+                regions=["us-east-1"],
+                coalesce_identical_requests=True,
+            )
+            coalescer = manager.get_request_coalescer()
+            assert coalescer is not None
+
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                identical = [pool.submit(manager.converse, messages=MESSAGES) for _ in range(3)]
+                different = pool.submit(
+                    manager.converse, messages=MESSAGES, inference_config={"maxTokens": 5}
+                )
+                wait_for(lambda: coalescer.coalesced_count == 2 and coalescer.in_flight_count == 2)
+                release.set()
+                responses = [future.result() for future in identical]
+                assert different.result().success
+
+        assert all(response is responses[0] for response in responses)
+        assert responses[0].get_content() == "hello"
+        assert env.service.get_call_count(operation="Converse") == 2
+
+    def test_coalescing_is_disabled_by_default(self):
+        """Test that the default manager has no coalescer."""
+        with StubBedrockEnvironment() as env:
+            manager = LLMManager(models=[env.model_name], regions=["us-east-1"])
+
+        assert manager.get_request_coalescer() is None
+
+    def test_parallel_manager_coalesces_duplicate_ids(self):
+        """Test that converse_parallel accepts identical requests sharing an ID."""
+        with StubBedrockEnvironment() as env:
+            manager = ParallelLLMManager(
+                models=[env.model_name],
+                regions=["us-east-1"],
+                coalesce_identical_requests=True,
+            )
+            response = manager.converse_parallel(
+                requests=[
+                    BedrockConverseRequest(messages=MESSAGES, request_id="same"),
+                    BedrockConverseRequest(messages=MESSAGES, request_id="same"),
+                ]
+            )
+
+        assert response.success and list(response.request_responses) == ["same"]
+        assert env.service.get_call_count(operation="Converse") == 1
@@ -0,0 +1,192 @@
+"""
+Tests for priority and deadline-aware request scheduling.
+"""
+
+import threading
+import time
+from typing import Any, Dict, List
+
+from bestehorn_llmmanager.bedrock.executors.request_scheduler import RequestScheduler
+from bestehorn_llmmanager.bedrock.executors.thread_parallel_executor import ThreadParallelExecutor
+from bestehorn_llmmanager.bedrock.models.bedrock_response import BedrockResponse
+from bestehorn_llmmanager.bedrock.models.llm_manager_structures import RetryConfig
+from bestehorn_llmmanager.bedrock.models.parallel_structures import (
+    BedrockConverseRequest,
+    ParallelProcessingConfig,
+    RegionAssignment,
+)
+
+
+def make_request(request_id: str, **kwargs: Any) -> BedrockConverseRequest:
+    """Create a request whose message text is its ID."""
+    return BedrockConverseRequest(
+        messages=[{"role": "user", "content": [{"text": request_id}]}],
+        request_id=request_id,
+        **kwargs,
+    )
+
+
+def assignment_for(request: BedrockConverseRequest) -> RegionAssignment:
+    """Create a single-region assignment for a request."""
+    return RegionAssignment(request_id=request.request_id or "", assigned_regions=["us-east-1"])
+
+
+class TestRequestScheduler:
+    """Test cases for RequestScheduler ordering."""
+
+    def test_orders_by_priority_then_deadline_then_insertion(self):
+        """Test the dispatch order of mixed requests."""
+        now = time.time()
+        requests = [
+            make_request("background-1"),
+            make_request("late-deadline", deadline=now + 60),
+            make_request("urgent", priority=10),
+            make_request("background-2"),
+            make_request("early-deadline", deadline=now + 5),
+        ]
+        scheduler = RequestScheduler()
+        for request in requests:
+            scheduler.push(assignment=assignment_for(request), request=request)
+
+        order = [scheduler.pop().request_id for _ in range(len(scheduler))]
+
+        assert order == [
+            "urgent",
+            "early-deadline",
+            "late-deadline",
+            "background-1",
+            "background-2",
+        ]
+
+    def test_fifo_when_prioritization_disabled(self):
+        """Test that priority and deadline are ignored when prioritization is off."""
+        scheduler = RequestScheduler(prioritize=False)
+        for request in [make_request("a"), make_request("b", priority=5, deadline=time.time())]:
+            scheduler.push(assignment=assignment_for(request), request=request)
+
+        assert [scheduler.pop().request_id, scheduler.pop().request_id] == ["a", "b"]
+        assert len(scheduler) == 0
+
+
+class TestDeadlineAwareExecution:
+    """Test deadline and priority handling in ThreadParallelExecutor."""
+
+    def test_interactive_request_overtakes_queued_batch(self):
+        """Test that a high-priority request added last is dispatched first."""
+        executor = ThreadParallelExecutor(
+            config=ParallelProcessingConfig(max_concurrent_requests=1)
+        )
+        requests = [make_request(f"batch-{i}") for i in range(5)]
+        requests.append(make_request("interactive", priority=1))
+        dispatched: List[str] = []
+        lock = threading.Lock()
+
+        def execute(converse_args: Dict[str, Any]) -> BedrockResponse:
+            with lock:
+                dispatched.append(converse_args["messages"][0]["content"][0]["text"])
+            return BedrockResponse(success=True)
+
+        executor.execute_requests_parallel(
+            assignments=[assignment_for(request) for request in requests],
+            request_map={request.request_id: request for request in requests},
+            execute_single_request_func=execute,
+        )
+
+        assert dispatched[0] == "interactive"
+        assert len(dispatched) == 6
+
+    def test_expired_requests_are_dropped_and_reported_as_timeouts(self):
+        """Test that requests past their deadline are never executed."""
+        executor = ThreadParallelExecutor(config=ParallelProcessingConfig())
+        requests = [make_request("expired", deadline=time.time() - 1), make_request("fresh")]
+        executed: List[str] = []
+
+        def execute(converse_args: Dict[str, Any]) -> BedrockResponse:
+            executed.append(converse_args["messages"][0]["content"][0]["text"])
+            return BedrockResponse(success=True)
+
+        responses = executor.execute_requests_parallel(
+            assignments=[assignment_for(request) for request in requests],
+            request_map={request.request_id: request for request in requests},
+            execute_single_request_func=execute,
+        )
+
+        assert executed == ["fresh"]
+        assert not responses["expired"].success
+        assert "timed out" in responses["expired"].get_warnings()[0]
+        assert responses["fresh"].success
+
+    def test_retry_skipped_when_backoff_exceeds_deadline(self):
+        """Test that a failed request near its deadline is not retried."""
+        executor = ThreadParallelExecutor(config=ParallelProcessingConfig())
+        request = make_request("near-deadline", deadline=time.time() + 5)
+        attempts: List[int] = []
+
+        def execute(converse_args: Dict[str, Any]) -> BedrockResponse:
+            attempts.append(1)
+            return BedrockResponse(success=False, warnings=["throttled"])
+
+        started = time.monotonic()
+        responses = executor.execute_requests_parallel(
+            assignments=[assignment_for(request)],
+            request_map={request.request_id: request},
+            execute_single_request_func=execute,
+            retry_config=RetryConfig(max_retries=3, retry_delay=10.0),
+        )
+
+        assert len(attempts) == 1
+        assert not responses["near-deadline"].success
+        assert time.monotonic() - started < 2
+
+    def test_request_timeout_is_capped_by_deadline(self):
+        """Test that a running request is abandoned at its deadline."""
+        executor = ThreadParallelExecutor(
+            config=ParallelProcessingConfig(request_timeout_seconds=30)
+        )
+        request = make_request("slow", deadline=time.time() + 0.2)
+        release = threading.Event()
+
+        def execute(converse_args: Dict[str, Any]) -> BedrockResponse:
+            release.wait(timeout=5)
+            return BedrockResponse(success=True)
+
+        try:
+            responses = executor.execute_requests_parallel(
+                assignments=[assignment_for(request)],
+                request_map={request.request_id: request},
+                execute_single_request_func=execute,
+            )
+        finally:
+            release.set()
+
+        assert "timed out" in responses["slow"].get_warnings()[0]
+
+    def test_short_deadline_still_dispatched(self):
+        """Test that only expired deadlines drop requests, not ones shorter than the timeout."""
+        executor = ThreadParallelExecutor(
+            config=ParallelProcessingConfig(request_timeout_seconds=30)
+        )
+        request = make_request("short", deadline=time.time() + 2)
+
+        responses = executor.execute_requests_parallel(
+            assignments=[assignment_for(request)],
+            request_map={request.request_id: request},
+            execute_single_request_func=lambda converse_args: BedrockResponse(success=True),
+        )
+
+        assert responses["short"].success
+
+    def test_iter_drops_expired_requests(self):
+        """Test deadline handling in the streaming executor."""
+        executor = ThreadParallelExecutor(config=ParallelProcessingConfig())
+        requests = [make_request("expired", deadline=time.time() - 1), make_request("fresh")]
+
+        results = dict(
+            executor.execute_requests_iter(
+                request_stream=iter([(assignment_for(r), r) for r in requests]),
+                execute_single_request_func=lambda converse_args: BedrockResponse(success=True),
+            )
+        )
+
+        assert not results["expired"].success
+        assert results["fresh"].success
@@ -2,6 +2,7 @@
 Tests for ThreadParallelExecutor class.
 """
 
+import threading
 import time
 
 import pytest
@@ -12,9 +13,11 @@ from bestehorn_llmmanager.bedrock.executors.thread_parallel_executor import (
     ThreadParallelExecutor,
 )
 from bestehorn_llmmanager.bedrock.models.bedrock_response import BedrockResponse
+from bestehorn_llmmanager.bedrock.models.llm_manager_structures import RetryConfig
 from bestehorn_llmmanager.bedrock.models.parallel_structures import (
     BedrockConverseRequest,
     ParallelProcessingConfig,
+    ParallelStatsAccumulator,
     RegionAssignment,
 )
 
@@ -383,3 +386,227 @@ class TestThreadParallelExecutor:
         assert not complete_responses["req2"].success
         assert not complete_responses["req3"].success
         assert "did not complete" in complete_responses["req3"].get_warnings()[0]
+
+
+def _make_request_stream(count, pulled):
+    """Yield (assignment, request) pairs, recording how many were pulled."""
+    for index in range(count):
+        request_id = f"req{index}"
+        pulled.append(request_id)
+        request = BedrockConverseRequest(
+            messages=[{"role": "user", "content": [{"text": f"Hello {index}"}]}],
+            request_id=request_id,
+        )
+        yield RegionAssignment(request_id=request_id, assigned_regions=["us-east-1"]), request
+
+
+class TestThreadParallelExecutorIter:
+    """Test cases for ThreadParallelExecutor.execute_requests_iter."""
+
+    def test_yields_every_request_once(self):
+        """Test that every streamed request produces exactly one result."""
+        executor = ThreadParallelExecutor(
+            config=ParallelProcessingConfig(max_concurrent_requests=4)
+        )
+        pulled = []
+
+        results = list(
+            executor.execute_requests_iter(
+                request_stream=_make_request_stream(count=25, pulled=pulled),
+                execute_single_request_func=lambda converse_args: BedrockResponse(success=True),
+            )
+        )
+
+        assert sorted(request_id for request_id, _ in results) == sorted(pulled)
+        assert len(results) == 25
+        assert all(response.success for _, response in results)
+
+    def test_pulls_requests_lazily_within_window(self):
+        """Test that at most max_in_flight requests are pulled ahead of consumption."""
+        executor = ThreadParallelExecutor(
+            config=ParallelProcessingConfig(max_concurrent_requests=8)
+        )
+        pulled = []
+
+        results = executor.execute_requests_iter(
+            request_stream=_make_request_stream(count=100, pulled=pulled),
+            execute_single_request_func=lambda converse_args: BedrockResponse(success=True),
+            max_in_flight=3,
+        )
+
+        next(results)
+        # The window is filled once; the first result frees a single slot.
+        assert len(pulled) <= 4
+        results.close()
+        assert len(pulled) <= 4
+
+    def test_concurrency_never_exceeds_window(self):
+        """Test that the in-flight window bounds concurrent executions."""
+        executor = ThreadParallelExecutor(
+            config=ParallelProcessingConfig(max_concurrent_requests=8)
+        )
+        lock = threading.Lock()
+        active = [0]
+        peak = [0]
+
+        def execute_func(converse_args):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.01)
+            with lock:
+                active[0] -= 1
+            return BedrockResponse(success=True)
+
+        stats = ParallelStatsAccumulator()
+        results = list(
+            executor.execute_requests_iter(
+                request_stream=_make_request_stream(count=20, pulled=[]),
+                execute_single_request_func=execute_func,
+                max_in_flight=2,
+                stats=stats,
+            )
+        )
+
+        assert len(results) == 20
+        assert peak[0] <= 2
+        assert 1 <= stats.to_stats().concurrent_executions <= 2
+
+    def test_measured_concurrency_counts_running_requests(self):
+        """Test that finished but uncollected requests do not count as executing."""
+        executor = ThreadParallelExecutor(
+            config=ParallelProcessingConfig(max_concurrent_requests=8)
+        )
+        finished = threading.Semaphore(value=0)
+
+        def sequential_stream():
+            # Each request is only pulled after the previous one has finished
+            for index, pair in enumerate(_make_request_stream(count=8, pulled=[])):
+                if index:
+                    finished.acquire()
+                    # Give the finished request time to leave its call
+                    time.sleep(0.05)
+                yield pair
+
+        def execute_func(converse_args):
+            finished.release()
+            return BedrockResponse(success=True)
+
+        stats = ParallelStatsAccumulator()
+        results = list(
+            executor.execute_requests_iter(
+                request_stream=sequential_stream(),
+                execute_single_request_func=execute_func,
+                max_in_flight=8,
+                stats=stats,
+            )
+        )
+
+        assert len(results) == 8
+        # All eight are submitted before the first is collected, but they ran one by one
+        assert stats.to_stats().concurrent_executions == 1
+        assert stats.latency.peak_concurrency == 1
+
+    def test_yields_in_completion_order(self):
+        """Test that fast requests are yielded before slow ones."""
+        executor = ThreadParallelExecutor(
+            config=ParallelProcessingConfig(max_concurrent_requests=2)
+        )
+
+        def execute_func(converse_args):
+            if converse_args["messages"][0]["content"][0]["text"] == "Hello 0":
+                time.sleep(0.2)
+            return BedrockResponse(success=True)
+
+        results = list(
+            executor.execute_requests_iter(
+                request_stream=_make_request_stream(count=2, pulled=[]),
+                execute_single_request_func=execute_func,
+            )
+        )
+
+        assert [request_id for request_id, _ in results] == ["req1", "req0"]
+
+    def test_retries_failed_requests_without_blocking(self):
+        """Test that failed requests are retried and only the final result is yielded."""
+        executor = ThreadParallelExecutor(
+            config=ParallelProcessingConfig(max_concurrent_requests=2)
+        )
+        attempts = {}
+        lock = threading.Lock()
+
+        def execute_func(converse_args):
+            text = converse_args["messages"][0]["content"][0]["text"]
+            with lock:
+                attempts[text] = attempts.get(text, 0) + 1
+                attempt = attempts[text]
+            if text == "Hello 0" and attempt == 1:
+                raise Exception("Simulated throttling")
+            return BedrockResponse(success=True)
+
+        results = list(
+            executor.execute_requests_iter(
+                request_stream=_make_request_stream(count=3, pulled=[]),
+                execute_single_request_func=execute_func,
+                retry_config=RetryConfig(max_retries=2, retry_delay=0.05, backoff_multiplier=1.0),
+                available_regions=["us-east-1", "us-west-2"],
+            )
+        )
+
+        assert len(results) == 3
+        assert all(response.success for _, response in results)
+        assert attempts["Hello 0"] == 2
+        # The retried request completes last because its backoff is scheduled, not slept.
+        assert results[-1][0] == "req0"
+
+    def test_exhausted_retries_yield_failure(self):
+        """Test that a request failing every attempt is yielded as failed."""
+        executor = ThreadParallelExecutor(
+            config=ParallelProcessingConfig(max_concurrent_requests=2)
+        )
+        calls = []
+
+        def execute_func(converse_args):
+            calls.append(1)
+            raise Exception("Always fails")
+
+        stats = ParallelStatsAccumulator()
+        results = list(
+            executor.execute_requests_iter(
+                request_stream=_make_request_stream(count=1, pulled=[]),
+                execute_single_request_func=execute_func,
+                retry_config=RetryConfig(max_retries=2, retry_delay=0.01, backoff_multiplier=1.0),
+                stats=stats,
+            )
+        )
+
+        assert len(results) == 1
+        assert not results[0][1].success
+        assert len(calls) == 3
+        assert stats.failed_requests_count == 1
+        assert stats.to_stats().total_requests == 1
+
+    def test_records_stats(self):
+        """Test that final responses are recorded in the stats accumulator."""
+        config = ParallelProcessingConfig(max_concurrent_requests=2, enable_automatic_retry=False)
+        executor = ThreadParallelExecutor(config=config)
+
+        def execute_func(converse_args):
+            if converse_args["messages"][0]["content"][0]["text"] == "Hello 1":
+                raise Exception("Simulated failure")
+            return BedrockResponse(success=True)
+
+        stats = ParallelStatsAccumulator()
+        list(
+            executor.execute_requests_iter(
+                request_stream=_make_request_stream(count=4, pulled=[]),
+                execute_single_request_func=execute_func,
+                stats=stats,
+            )
+        )
+
+        execution_stats = stats.to_stats()
+        assert execution_stats.total_requests == 4
+        assert execution_stats.successful_requests == 3
+        assert execution_stats.failed_requests_count == 1
+        assert execution_stats.region_distribution == {"us-east-1": 4}
@@ -0,0 +1,253 @@
+"""
+Tests for running response validation in process and thread pools.
+"""
+
+import os
+import pickle
+import threading
+import time
+from typing import Iterator
+from unittest.mock import patch
+
+import pytest
+
+from bestehorn_llmmanager import LLMManager, ParallelLLMManager
+from bestehorn_llmmanager.bedrock.exceptions.llm_manager_exceptions import ConfigurationError
+from bestehorn_llmmanager.bedrock.executors.validation_executor import ValidationExecutor
+from bestehorn_llmmanager.bedrock.models.bedrock_response import BedrockResponse
+from bestehorn_llmmanager.bedrock.models.llm_manager_structures import (
+    ResponseValidationConfig,
+    ValidationResult,
+    ValidatorSpec,
+)
+from bestehorn_llmmanager.bedrock.models.parallel_structures import (
+    BedrockConverseRequest,
+    ParallelProcessingConfig,
+)
+from bestehorn_llmmanager.bedrock.testing import (
+    LatencyDistribution,
+    StubBedrockConfig,
+    StubBedrockEnvironment,
+    StubRegionBehavior,
+)
+
+MESSAGES = [{"role": "user", "content": [{"text": "hello"}]}]
+VALIDATOR_MODULE = __name__
+BENCHMARK_REQUESTS = 8
+BENCHMARK_VALIDATION_LOOPS = 1_500_000
+# Inline, the validations of 8 requests serialize on the GIL; four validation processes
+# on four or more CPUs finish them in about a third of the time once the pool is warm
+MAX_PROCESS_TO_INLINE_RATIO = 0.8
+BENCHMARK_MIN_CPUS = 2
+
+
+def available_cpus() -> int:
+    """Number of CPUs this process may run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def require_text(response: BedrockResponse, text: str = "hello") -> ValidationResult:
+    """Module-level validator: the content must contain a text."""
+    content = response.get_content() or ""
+    return ValidationResult(
+        success=text in content,
+        error_message=None if text in content else f"missing {text!r}",
+        error_details={"pid": os.getpid(), "thread": threading.get_ident()},
+    )
+
+
+def raise_error(response: BedrockResponse) -> ValidationResult:
+    """Module-level validator that fails with an exception."""
+    raise KeyError("schema")
+
+
+def spin_and_accept(response: BedrockResponse) -> ValidationResult:
+    """CPU-bound validator standing in for JSON-schema and regex checks."""
+    total = 0
+    for index in range(BENCHMARK_VALIDATION_LOOPS):
+        total += index % 7
+    return ValidationResult(success=total > 0)
+
+
+def make_response(text: str = "hello world") -> BedrockResponse:
+    """Create a successful response with text content."""
+    return BedrockResponse(
+        success=True,
+        response_data={"output": {"message": {"role": "assistant", "content": [{"text": text}]}}},
+        model_used="Nova Pro",
+        region_used="us-east-1",
+    )
+
+
+@pytest.fixture(scope="module")
+def process_executor() -> Iterator[ValidationExecutor]:
+    """Process-pool executor shared by the tests of this module."""
+    with ValidationExecutor(mode="process", max_workers=2) as executor:
+        yield executor
+
+
+class TestValidatorSpec:
+    """Test cases for ValidatorSpec."""
+
+    def test_call_passes_options(self):
+        """Test that calling the spec calls the function with its options."""
+        spec = ValidatorSpec(target=f"{VALIDATOR_MODULE}:require_text", options={"text": "bye"})
+
+        result = spec(make_response())
+
+        assert result.success is False
+        assert result.error_message == "missing 'bye'"
+
+    def test_spec_pickles_as_reference(self):
+        """Test that a spec survives pickling unchanged."""
+        spec = ValidatorSpec(target=f"{VALIDATOR_MODULE}:require_text", options={"text": "x"})
+
+        assert pickle.loads(pickle.dumps(spec)) == spec  # noqa: S301 - pickled by this test
+
+    def test_invalid_target(self):
+        """Test that targets without a module and function are rejected."""
+        with pytest.raises(ValueError):
+            ValidatorSpec(target="require_text")
+
+
+class TestValidationExecutor:
+    """Test cases for ValidationExecutor."""
+
+    def test_invalid_arguments(self):
+        """Test that invalid modes and worker counts are rejected."""
+        with pytest.raises(ValueError):
+            ValidationExecutor(mode="inline")
+        with pytest.raises(ValueError):
+            ValidationExecutor(max_workers=0)
+
+    def test_process_mode_validates_in_another_process(self, process_executor):
+        """Test that a process pool runs module-level functions and specs elsewhere."""
+        for function in (require_text, ValidatorSpec(target=f"{VALIDATOR_MODULE}:require_text")):
+            result = process_executor.validate(
+                validation_function=function, response=make_response()
+            )
+
+            assert result.success is True
+            assert result.error_details["pid"] != os.getpid()
+
+    def test_process_mode_propagates_exceptions(self, process_executor):
+        """Test that exceptions of the validator reach the caller."""
+        with pytest.raises(KeyError):
+            process_executor.validate(validation_function=raise_error, response=make_response())
+
+    def test_process_mode_rejects_unpicklable_validators(self, process_executor):
+        """Test that lambdas are reported as a configuration error."""
+        with pytest.raises(ConfigurationError):
+            process_executor.check_validator(
+                validation_function=lambda response: ValidationResult(success=True)
+            )
+
+    def test_validator_is_pickled_once(self):
+        """Test that repeated checks of a validator do not pickle it again."""
+        spec = ValidatorSpec(target=f"{VALIDATOR_MODULE}:require_text")
+        executor = ValidationExecutor(mode="process")
+
+        with patch.object(pickle, "dumps", wraps=pickle.dumps) as dumps:
+            for _ in range(5):
+                executor.check_validator(validation_function=require_text)
+                executor.check_validator(validation_function=spec)
+
+        assert dumps.call_count == 2
+
+    def test_thread_mode_accepts_any_callable(self):
+        """Test that a thread pool runs closures on a pool thread."""
+        seen = []
+
+        def validator(response: BedrockResponse) -> ValidationResult:
+            seen.append(threading.current_thread().name)
+            return ValidationResult(success=True)
+
+        with ValidationExecutor(mode="thread", max_workers=1) as executor:
+            executor.check_validator(validation_function=validator)
+            result = executor.validate(validation_function=validator, response=make_response())
+
+        assert result.success is True
+        assert seen[0].startswith("llm-validation")
+
+    def test_closed_executor(self):
+        """Test that a closed executor refuses work."""
+        executor = ValidationExecutor(mode="thread")
+        executor.close()
+
+        with pytest.raises(RuntimeError):
+            executor.validate(validation_function=require_text, response=make_response())
+
+
+class TestManagerValidationExecutor:
+    """Test validation executors through LLMManager and ParallelLLMManager."""
+
+    def test_converse_validates_in_process_pool(self, process_executor):
+        """Test that converse accepts a response validated in a worker process."""
+        config = ResponseValidationConfig(
+            response_validation_function=ValidatorSpec(target=f"{VALIDATOR_MODULE}:require_text"),
+            validation_executor=process_executor,
+        )
+        with StubBedrockEnvironment() as env:
+            manager = LLMManager(models=[env.model_name], regions=["us-east-1"])
+            response = manager.converse(messages=MESSAGES, response_validation_config=config)
+
+        assert response.success
+        assert response.get_content() == "hello"
+
+    def test_converse_rejects_unpicklable_validator_before_calling(self, process_executor):
+        """Test that an unpicklable validator fails before any Bedrock call."""
+        config = ResponseValidationConfig(
+            response_validation_function=lambda response: ValidationResult(success=True),
+            validation_executor=process_executor,
+        )
+        with StubBedrockEnvironment() as env:
+            manager = LLMManager(models=[env.model_name], regions=["us-east-1"])
+            with pytest.raises(ConfigurationError):
+                manager.converse(messages=MESSAGES, response_validation_config=config)
+
+        assert env.service.get_call_count(operation="Converse") == 0
+
+    @pytest.mark.benchmark
+    @pytest.mark.skipif(
+        available_cpus() < BENCHMARK_MIN_CPUS, reason="validation processes need a spare CPU"
+    )
+    def test_process_pool_overlaps_validation_with_requests(self):
+        """Guard that CPU-bound validation no longer serializes parallel requests."""
+        behavior = StubRegionBehavior(latency=LatencyDistribution.fixed(value_ms=20.0))
+        requests = [
+            BedrockConverseRequest(messages=[{"role": "user", "content": [{"text": f"q{i}"}]}])
+            for i in range(BENCHMARK_REQUESTS)
+        ]
+
+        def run(config: ResponseValidationConfig) -> float:
+            manager = ParallelLLMManager(
+                models=[env.model_name],
+                regions=["us-east-1"],
+                parallel_config=ParallelProcessingConfig(
+                    max_concurrent_requests=BENCHMARK_REQUESTS
+                ),
+            )
+            start = time.perf_counter()
+            response = manager.converse_parallel(
+                requests=requests, response_validation_config=config
+            )
+            elapsed = time.perf_counter() - start
+            assert response.success and len(response.get_successful_responses()) == len(requests)
+            return elapsed
+
+        with StubBedrockEnvironment(config=StubBedrockConfig(default_behavior=behavior)) as env:
+            inline = run(
+                config=ResponseValidationConfig(response_validation_function=spin_and_accept)
+            )
+            with ValidationExecutor(mode="process", max_workers=4) as executor:
+                pooled_config = ResponseValidationConfig(
+                    response_validation_function=spin_and_accept, validation_executor=executor
+                )
+                run(config=pooled_config)  # Start the worker processes
+                pooled = run(config=pooled_config)
+
+        assert pooled < inline * MAX_PROCESS_TO_INLINE_RATIO, (
+            f"process pool {pooled:.2f}s, inline {inline:.2f}s"
+        )
@@ -0,0 +1,263 @@
+"""
+Tests for the instrumentation registry, listeners and request-path hooks.
+"""
+
+from typing import Any, Dict
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from bestehorn_llmmanager.bedrock.instrumentation import (
+    InstrumentationListener,
+    InstrumentationRecorder,
+    InstrumentationRegistry,
+    OpenTelemetryListener,
+    instrument_span,
+    instrumented,
+    is_instrumentation_enabled,
+    record_metric,
+    record_span,
+    register_instrumentation_listener,
+    unregister_instrumentation_listener,
+)
+from bestehorn_llmmanager.bedrock.models.access_method import ModelAccessInfo
+from bestehorn_llmmanager.bedrock.models.instrumentation_constants import (
+    InstrumentationMetricNames,
+    InstrumentationSpanNames,
+)
+from bestehorn_llmmanager.bedrock.models.llm_manager_structures import RetryConfig
+from bestehorn_llmmanager.bedrock.retry.retry_manager import RetryManager
+
+
+@pytest.fixture
+def recorder():
+    """Register an in-memory recorder for the duration of a test."""
+    listener = InstrumentationRecorder()
+    register_instrumentation_listener(listener=listener)
+    yield listener
+    unregister_instrumentation_listener(listener=listener)
+
+
+class TestInstrumentationRegistry:
+    """Test cases for InstrumentationRegistry."""
+
+    def test_disabled_registry_returns_shared_noop_span(self):
+        """Test that spans cost no allocation when nothing is registered."""
+        assert not is_instrumentation_enabled()
+
+        first = instrument_span(name="a")
+        second = instrument_span(name="b", attributes={"k": 1})
+
+        assert first is second
+        with first as span:
+            span.set_attribute(key="k", value=2)
+        record_metric(name="m", value=1.0)
+
+    def test_singleton(self):
+        """Test that the registry is process-wide."""
+        assert InstrumentationRegistry() is InstrumentationRegistry.get_instance()
+
+    def test_spans_nest_and_record_errors(self, recorder):
+        """Test parent linking, attributes, durations and error capture."""
+        with instrument_span(name="outer", attributes={"region": "us-east-1"}) as outer:
+            outer.set_attribute(key="success", value=True)
+            with pytest.raises(ValueError):
+                with instrument_span(name="inner"):
+                    raise ValueError("boom")
+
+        inner_span, outer_span = recorder.get_spans()
+        assert inner_span.name == "inner"
+        assert inner_span.parent_id == outer_span.span_id
+        assert inner_span.error == "ValueError"
+        assert outer_span.parent_id is None
+        assert outer_span.error is None
+        assert outer_span.attributes == {"region": "us-east-1", "success": True}
+        assert outer_span.duration_ms >= inner_span.duration_ms >= 0
+        assert outer_span.end_time_ns >= outer_span.start_time_ns > 0
+
+    def test_record_span_and_metric(self, recorder):
+        """Test reporting of already-finished spans and metric observations."""
+        with instrument_span(name="parent"):
+            record_span(name="done", start_time_ns=10, duration_ms=2.5, error="Timeout")
+        record_metric(name="latency", value=3.0, attributes={"region": "eu-west-1"})
+        record_metric(name="latency", value=4.0)
+
+        done = recorder.get_spans(name="done")[0]
+        assert done.duration_ms == 2.5
+        assert done.error == "Timeout"
+        assert done.parent_id == recorder.get_spans(name="parent")[0].span_id
+        assert recorder.get_metric_values(name="latency") == [3.0, 4.0]
+        assert recorder.get_metrics()[0] == ("latency", 3.0, {"region": "eu-west-1"})
+
+    def test_instrumented_decorator(self, recorder):
+        """Test that decorated functions run inside a span."""
+
+        @instrumented(name="work")
+        def work(value: int) -> int:
+            """Double a value."""
+            return value * 2
+
+        assert work(value=4) == 8
+        assert work.__doc__ == "Double a value."
+        assert [span.name for span in recorder.get_spans()] == ["work"]
+
+    def test_failing_listener_does_not_break_request_path(self, recorder):
+        """Test that listener exceptions are contained."""
+
+        class FailingListener(InstrumentationListener):
+            def on_span_end(self, span):
+                raise RuntimeError("exporter down")
+
+            def on_metric(self, name, value, attributes):
+                raise RuntimeError("exporter down")
+
+        failing = FailingListener()
+        register_instrumentation_listener(listener=failing)
+        try:
+            with instrument_span(name="span"):
+                pass
+            record_metric(name="metric", value=1.0)
+        finally:
+            unregister_instrumentation_listener(listener=failing)
+
+        assert len(recorder.get_spans()) == 1
+        assert recorder.get_metric_values(name="metric") == [1.0]
+
+    def test_register_is_idempotent(self, recorder):
+        """Test that a listener is notified once even if registered twice."""
+        register_instrumentation_listener(listener=recorder)
+
+        with instrument_span(name="span"):
+            pass
+
+        assert len(recorder.get_spans()) == 1
+        assert InstrumentationRegistry.get_instance().get_listeners() == (recorder,)
+
+
+class TestInstrumentationRecorder:
+    """Test cases for InstrumentationRecorder."""
+
+    def test_bounded_buffers(self):
+        """Test that only the most recent entries are kept."""
+        small = InstrumentationRecorder(max_entries=2)
+        for value in range(3):
+            small.on_metric(name="m", value=float(value), attributes={})
+
+        assert small.get_metric_values(name="m") == [1.0, 2.0]
+        small.clear()
+        assert small.get_metrics() == []
+
+    def test_invalid_max_entries(self):
+        """Test constructor validation."""
+        with pytest.raises(ValueError):
+            InstrumentationRecorder(max_entries=0)
+
+
+class TestOpenTelemetryListener:
+    """Test cases for OpenTelemetryListener."""
+
+    def test_spans_and_histograms(self):
+        """Test that spans and metrics are mirrored into the tracer and meter."""
+        tracer = MagicMock()
+        meter = MagicMock()
+        listener = OpenTelemetryListener(tracer=tracer, meter=meter)
+        register_instrumentation_listener(listener=listener)
+        try:
+            with pytest.raises(KeyError):
+                with instrument_span(name="api", attributes={"region": "us-east-1", "x": None}):
+                    raise KeyError("missing")
+            record_metric(name="ttft", value=12.0, attributes={"model": "m"})
+        finally:
+            unregister_instrumentation_listener(listener=listener)
+
+        tracer.start_span.assert_called_once()
+        assert tracer.start_span.call_args.args == ("api",)
+        assert tracer.start_span.call_args.kwargs["attributes"] == {"region": "us-east-1"}
+        otel_span = tracer.start_span.return_value
+        otel_span.set_attribute.assert_called_once_with("error.type", "KeyError")
+        otel_span.end.assert_called_once()
+
+        histogram_names = [call.args[0] for call in meter.create_histogram.call_args_list]
+        assert histogram_names == ["api.duration_ms", "ttft"]
+        meter.create_histogram.return_value.record.assert_any_call(12.0, attributes={"model": "m"})
+
+    def test_requires_tracer_or_meter(self):
+        """Test constructor validation."""
+        with pytest.raises(ValueError):
+            OpenTelemetryListener()
+
+
+class TestRequestPathInstrumentation:
+    """Test that the request path reports spans and metrics."""
+
+    @patch("time.sleep")
+    def test_retry_attempts_and_backoff(self, mock_sleep: MagicMock, recorder):
+        """Test attempt and backoff spans emitted by RetryManager."""
+        retry_manager = RetryManager(retry_config=RetryConfig(max_retries=3, retry_delay=0.5))
+        access_info = ModelAccessInfo(
+            region="us-east-1", has_direct_access=True, model_id="anthropic.claude-v2"
+        )
+        calls = []
+
+        def operation(**kwargs: Any) -> Dict[str, Any]:
+            calls.append(kwargs)
+            if len(calls) == 1:
+                raise Exception("temporary failure")
+            return {"output": {"message": {"content": [{"text": "ok"}]}}}
+
+        retry_manager.execute_with_retry(
+            operation=operation,
+            operation_args={"messages": [{"role": "user", "content": [{"text": "hi"}]}]},
+            retry_targets=[
+                ("Model 1", "us-east-1", access_info),
+                ("Model 2", "us-west-2", access_info),
+            ],
+        )
+
+        attempts = recorder.get_spans(name=InstrumentationSpanNames.RETRY_ATTEMPT)
+        assert [span.attributes["success"] for span in attempts] == [False, True]
+        assert attempts[0].error == "Exception"
+        assert attempts[1].attributes["region"] == "us-west-2"
+        backoff = recorder.get_spans(name=InstrumentationSpanNames.BACKOFF_SLEEP)
+        assert [span.attributes["delay_seconds"] for span in backoff] == [0.5]
+        mock_sleep.assert_called_once_with(0.5)
+
+    def test_client_acquisition_span(self, recorder):
+        """Test that AuthManager reports client acquisition."""
+        from bestehorn_llmmanager.bedrock.auth.auth_manager import AuthManager
+
+        auth_manager = AuthManager()
+        with patch.object(auth_manager, "get_session") as mock_session:
+            mock_session.return_value.client.return_value = MagicMock()
+            auth_manager.get_bedrock_client(region="us-east-1")
+
+        (span,) = recorder.get_spans(name=InstrumentationSpanNames.CLIENT_ACQUISITION)
+        assert span.attributes == {"region": "us-east-1"}
+
+    def test_queue_wait_metric(self, recorder):
+        """Test that the thread executor reports queue wait of submitted requests."""
+        from bestehorn_llmmanager.bedrock.executors.thread_parallel_executor import (
+            ThreadParallelExecutor,
+        )
+        from bestehorn_llmmanager.bedrock.models.parallel_structures import (
+            BedrockConverseRequest,
+            ParallelProcessingConfig,
+            RegionAssignment,
+        )
+
+        executor = ThreadParallelExecutor(config=ParallelProcessingConfig())
+        request = BedrockConverseRequest(
+            messages=[{"role": "user", "content": [{"text": "hi"}]}], request_id="r1"
+        )
+        assignment = RegionAssignment(request_id="r1", assigned_regions=["us-east-1"], priority=0)
+
+        with patch.object(executor, "_execute_request_with_timeout", return_value=MagicMock()):
+            executor._execute_single_request_with_context(
+                request=request,
+                assignment=assignment,
+                execute_single_request_func=MagicMock(),
+                submitted_at=0.0,
+            )
+
+        (value,) = recorder.get_metric_values(name=InstrumentationMetricNames.QUEUE_WAIT_MS)
+        assert value > 0
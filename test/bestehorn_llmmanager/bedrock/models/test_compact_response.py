@@ -0,0 +1,211 @@
+"""
+Tests for compacted responses, attempts and failure entries.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from bestehorn_llmmanager import ParallelLLMManager
+from bestehorn_llmmanager.bedrock.models.bedrock_response import (
+    BedrockResponse,
+    StreamingResponse,
+)
+from bestehorn_llmmanager.bedrock.models.compact_response import CompactError, ResponseSummary
+from bestehorn_llmmanager.bedrock.models.llm_manager_structures import RequestAttempt
+from bestehorn_llmmanager.bedrock.models.parallel_structures import (
+    BedrockConverseRequest,
+    FailureEntry,
+    ParallelProcessingConfig,
+)
+from bestehorn_llmmanager.bedrock.testing import StubBedrockEnvironment
+
+RESPONSE_DATA = {
+    "ResponseMetadata": {"RequestId": "req-1", "HTTPStatusCode": 200},
+    "output": {
+        "message": {
+            "role": "assistant",
+            "content": [
+                {"text": "first"},
+                {"toolUse": {"toolUseId": "t1", "name": "lookup", "input": {}}},
+                {"text": "second"},
+            ],
+        }
+    },
+    "stopReason": "end_turn",
+    "usage": {"inputTokens": 12, "outputTokens": 6, "totalTokens": 18},
+    "metrics": {"latencyMs": 250},
+    "additionalModelResponseFields": {"trace": "x"},
+}
+
+
+def raise_and_catch() -> Exception:
+    """Raise an exception and return it with its traceback."""
+    try:
+        raise ValueError("bad request")
+    except ValueError as e:
+        return e
+
+
+def make_attempt(error=None) -> RequestAttempt:
+    """Create a completed attempt."""
+    now = datetime.now()
+    return RequestAttempt(
+        model_id="model",
+        region="us-east-1",
+        access_method="direct",
+        attempt_number=1,
+        start_time=now,
+        end_time=now,
+        error=error,
+        success=error is None,
+    )
+
+
+def make_response() -> BedrockResponse:
+    """Create a successful response after one failed attempt."""
+    return BedrockResponse(
+        success=True,
+        response_data=RESPONSE_DATA,
+        model_used="model",
+        attempts=[make_attempt(error=raise_and_catch()), make_attempt()],
+    )
+
+
+class TestCompactError:
+    """Test cases for CompactError."""
+
+    def test_from_exception(self):
+        """Test that only the type name and message are kept."""
+        compact = CompactError.from_exception(error=raise_and_catch())
+
+        assert compact.error_type == "ValueError"
+        assert compact.message == str(compact) == "bad request"
+        assert compact.__traceback__ is None
+        assert CompactError.from_exception(error=compact) is compact
+
+
+class TestBedrockResponseCompact:
+    """Test cases for BedrockResponse.compact()."""
+
+    def test_response_objects_are_slotted(self):
+        """Test that responses and attempts have no per-instance __dict__."""
+        response = make_response()
+
+        assert not hasattr(response, "__dict__")
+        assert not hasattr(response.attempts[0], "__dict__")
+        with pytest.raises(AttributeError):
+            response.extra = 1
+
+    def test_accessors_survive_compaction(self):
+        """Test that text, usage, metrics and stop reason are kept."""
+        response = make_response()
+        expected = (
+            response.get_content(),
+            response.get_text_blocks(),
+            response.get_usage(),
+            response.get_metrics(),
+            response.get_stop_reason(),
+        )
+
+        response.compact()
+        response.compact()
+
+        assert response.response_data is None
+        assert response.summary == ResponseSummary(
+            text_blocks=("first", "second"),
+            stop_reason="end_turn",
+            usage=RESPONSE_DATA["usage"],
+            metrics=RESPONSE_DATA["metrics"],
+        )
+        assert (
+            response.get_content(),
+            response.get_text_blocks(),
+            response.get_usage(),
+            response.get_metrics(),
+            response.get_stop_reason(),
+        ) == expected
+        assert response.get_tool_uses() == []
+        assert response.get_additional_model_response_fields() is None
+
+    def test_attempt_errors_are_compacted(self):
+        """Test that attempt errors become traceback-free records."""
+        response = make_response()
+
+        response.compact()
+
+        error = response.get_last_error()
+        assert isinstance(error, CompactError)
+        assert error.error_type == "ValueError" and str(error) == "bad request"
+        assert error.__traceback__ is None
+
+    def test_to_dict_round_trip(self):
+        """Test that a compacted response serializes its summary as response data."""
+        response = make_response()
+        response.compact()
+
+        restored = BedrockResponse.from_dict(data=response.to_dict())
+
+        assert restored.get_text_blocks() == ["first", "second"]
+        assert restored.get_usage() == response.get_usage()
+
+
+class TestStreamingResponseCompact:
+    """Test cases for StreamingResponse.compact()."""
+
+    def test_compact_after_completion_only(self):
+        """Test that content parts are joined and errors compacted once complete."""
+        streaming = StreamingResponse(success=True, content_parts=["Hel", "lo"])
+        streaming.add_stream_error(error=raise_and_catch())
+
+        streaming.compact()
+        assert streaming.get_content_parts() == ["Hel", "lo"]
+
+        list(streaming)
+        streaming.compact()
+
+        assert streaming.get_content_parts() == ["Hello"]
+        assert streaming.get_full_content() == "Hello"
+        assert isinstance(streaming.get_stream_errors()[0], CompactError)
+
+
+class TestFailureEntryCompact:
+    """Test cases for compact failure entries."""
+
+    def test_record_failure_compact(self):
+        """Test that compact failure entries keep type and message only."""
+        request = BedrockConverseRequest(messages=[{"role": "user", "content": []}])
+
+        request.record_failure(exception=raise_and_catch(), region="us-east-1", compact=True)
+
+        entry = request.failure_history[0]
+        assert isinstance(entry, FailureEntry) and not hasattr(entry, "__dict__")
+        assert isinstance(entry.exception, CompactError)
+        assert entry.exception_type == entry.exception.error_type == "ValueError"
+        assert entry.error_message == "bad request"
+
+
+class TestParallelCompactResponses:
+    """Test compact_responses in ParallelLLMManager against the Bedrock stub."""
+
+    def test_parallel_responses_are_compacted(self):
+        """Test that every response of converse_parallel is compacted."""
+        messages = [{"role": "user", "content": [{"text": "hello"}]}]
+        with StubBedrockEnvironment() as env:
+            manager = ParallelLLMManager(
+                models=[env.model_name],
+                regions=["us-east-1"],
+                parallel_config=ParallelProcessingConfig(compact_responses=True),
+            )
+            parallel_response = manager.converse_parallel(
+                requests=[
+                    BedrockConverseRequest(messages=messages, request_id=f"r{i}") for i in range(3)
+                ]
+            )
+
+        assert parallel_response.success
+        for response in parallel_response.request_responses.values():
+            assert response.response_data is None
+            assert response.get_content()
+            assert response.get_output_tokens() > 0
+        assert parallel_response.get_total_tokens_used()["output_tokens"] > 0
@@ -0,0 +1,263 @@
+"""
+Tests for the latency histograms of the parallel execution statistics.
+"""
+
+import math
+import random
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import List
+
+import pytest
+
+from bestehorn_llmmanager import ParallelLLMManager
+from bestehorn_llmmanager.bedrock.models.bedrock_response import BedrockResponse
+from bestehorn_llmmanager.bedrock.models.latency_structures import (
+    LatencyHistogram,
+    ParallelLatencyStats,
+)
+from bestehorn_llmmanager.bedrock.models.llm_manager_structures import RequestAttempt
+from bestehorn_llmmanager.bedrock.models.parallel_constants import ParallelProcessingFields
+from bestehorn_llmmanager.bedrock.models.parallel_structures import (
+    BedrockConverseRequest,
+    ParallelProcessingConfig,
+)
+from bestehorn_llmmanager.bedrock.testing import (
+    LatencyDistribution,
+    StubBedrockConfig,
+    StubBedrockEnvironment,
+    StubRegionBehavior,
+)
+
+PERCENTILES = [0.0, 0.1, 0.5, 0.9, 0.99, 0.999, 1.0]
+BENCHMARK_VALUES = 200_000
+# Recording 200k values takes about 0.35s on an idle machine; the budget leaves room for
+# loaded CI runners and parallel test workers
+BENCHMARK_BUDGET_SECONDS = 4.0
+
+
+def exact_percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of a list of values."""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(round(fraction * len(ordered), 9)))
+    return ordered[rank - 1]
+
+
+def make_response(
+    duration_ms: float, region: str = "us-east-1", model: str = "Nova Pro", success: bool = True
+) -> BedrockResponse:
+    """Create a response with one failed and one final attempt."""
+    start = datetime.now()
+    attempts = [
+        RequestAttempt(
+            model_id=model,
+            region=region,
+            access_method="direct",
+            attempt_number=1,
+            start_time=start,
+            end_time=start + timedelta(milliseconds=5),
+            success=False,
+        ),
+        RequestAttempt(
+            model_id=model,
+            region=region,
+            access_method="direct",
+            attempt_number=2,
+            start_time=start,
+            end_time=start + timedelta(milliseconds=duration_ms / 2),
+            success=success,
+        ),
+    ]
+    return BedrockResponse(
+        success=success,
+        model_used=model,
+        region_used=region,
+        attempts=attempts,
+        total_duration_ms=duration_ms,
+    )
+
+
+class TestLatencyHistogram:
+    """Test cases for LatencyHistogram."""
+
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_percentiles_within_one_percent(self, seed):
+        """Test that percentiles are within 1% of the exact nearest-rank values."""
+        rng = random.Random(seed)
+        values = [rng.lognormvariate(mu=6.0, sigma=1.2) for _ in range(5000)]
+        histogram = LatencyHistogram()
+        for value in values:
+            histogram.record(value_ms=value)
+
+        for fraction in PERCENTILES:
+            expected = exact_percentile(values=values, fraction=fraction)
+            assert histogram.percentile(fraction=fraction) == pytest.approx(expected, rel=0.01)
+        assert histogram.min_ms == min(values)
+        assert histogram.max_ms == max(values)
+        assert histogram.mean_ms == pytest.approx(sum(values) / len(values))
+
+    def test_small_values_are_exact(self):
+        """Test that sub-millisecond resolution holds for small values."""
+        histogram = LatencyHistogram()
+        for value in [0.001, 0.05, 0.1, 0.2]:
+            histogram.record(value_ms=value)
+
+        assert histogram.percentile(fraction=0.5) == pytest.approx(0.05)
+
+    def test_empty_histogram(self):
+        """Test that an empty histogram reports zeros."""
+        histogram = LatencyHistogram()
+
+        assert len(histogram) == 0
+        assert histogram.percentile(fraction=0.99) == 0.0
+        assert histogram.to_dict()["p99_ms"] == 0.0
+
+    def test_invalid_fraction(self):
+        """Test that fractions outside [0, 1] are rejected."""
+        with pytest.raises(ValueError):
+            LatencyHistogram().percentile(fraction=1.5)
+
+    def test_merge_equals_combined_recording(self):
+        """Test that merging histograms equals recording all values into one."""
+        rng = random.Random(4)
+        first, second, combined = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+        for index in range(2000):
+            value = rng.uniform(1, 3000)
+            (first if index % 3 else second).record(value_ms=value)
+            combined.record(value_ms=value)
+
+        first.merge(other=second)
+
+        assert first.to_dict() == pytest.approx(combined.to_dict())
+
+    def test_to_dict_keys(self):
+        """Test the summary keys."""
+        histogram = LatencyHistogram()
+        histogram.record(value_ms=12.5)
+
+        assert set(histogram.to_dict()) == {
+            "count",
+            "min_ms",
+            "mean_ms",
+            "max_ms",
+            "p50_ms",
+            "p90_ms",
+            "p99_ms",
+            "p999_ms",
+        }
+
+    @pytest.mark.benchmark
+    def test_record_benchmark(self):
+        """Guard the per-value recording cost."""
+        rng = random.Random(5)
+        values = [rng.lognormvariate(mu=6.0, sigma=1.2) for _ in range(BENCHMARK_VALUES)]
+        histogram = LatencyHistogram()
+
+        start = time.perf_counter()
+        for value in values:
+            histogram.record(value_ms=value)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < BENCHMARK_BUDGET_SECONDS, (
+            f"Recording {BENCHMARK_VALUES} values took {elapsed:.2f}s"
+        )
+
+
+class TestParallelLatencyStats:
+    """Test cases for ParallelLatencyStats."""
+
+    def test_record_response(self):
+        """Test that successful responses are recorded per region and model."""
+        stats = ParallelLatencyStats()
+        stats.record_response(response=make_response(duration_ms=400.0))
+        stats.record_response(response=make_response(duration_ms=100.0, region="eu-west-1"))
+        stats.record_response(response=make_response(duration_ms=900.0, success=False))
+
+        assert stats.request_duration.count == 2
+        assert stats.request_duration.max_ms == 400.0
+        # Time to first byte is the duration of the successful attempt only
+        assert stats.time_to_first_byte.max_ms == pytest.approx(200.0, rel=0.01)
+        assert set(stats.duration_by_region) == {"us-east-1", "eu-west-1"}
+        assert stats.duration_by_model["Nova Pro"].count == 2
+
+    def test_merge_keeps_both_executions(self):
+        """Test that merging combines histograms and keeps the higher peak."""
+        first, second = ParallelLatencyStats(), ParallelLatencyStats()
+        first.record_response(response=make_response(duration_ms=50.0))
+        first.record_concurrency(in_flight=3)
+        second.record_response(response=make_response(duration_ms=70.0, model="Claude"))
+        second.record_queue_wait(wait_ms=2.0)
+        second.record_concurrency(in_flight=5)
+
+        merged = first.merge(other=second)
+
+        assert merged.request_duration.count == 2
+        assert merged.queue_wait.count == 1
+        assert merged.peak_concurrency == 5
+        assert set(merged.duration_by_model) == {"Nova Pro", "Claude"}
+        assert first.request_duration.count == 1
+
+    def test_concurrent_recording(self):
+        """Test that recording from several threads loses no observations."""
+        stats = ParallelLatencyStats()
+
+        def record() -> None:
+            for index in range(500):
+                stats.record_response(response=make_response(duration_ms=float(index + 1)))
+                stats.record_queue_wait(wait_ms=0.5)
+
+        threads = [threading.Thread(target=record) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert stats.request_duration.count == 4000
+        assert stats.queue_wait.count == 4000
+        assert stats.duration_by_region["us-east-1"].count == 4000
+
+    def test_to_dict(self):
+        """Test the serialized field names."""
+        stats = ParallelLatencyStats()
+        stats.record_response(response=make_response(duration_ms=10.0))
+
+        result = stats.to_dict()
+
+        assert result[ParallelProcessingFields.PEAK_CONCURRENCY] == 0
+        assert result[ParallelProcessingFields.REQUEST_DURATION]["count"] == 1
+        assert "us-east-1" in result[ParallelProcessingFields.DURATION_BY_REGION]
+
+
+class TestParallelManagerLatency:
+    """Test that converse_parallel reports latency statistics."""
+
+    def test_execution_stats_contain_latency(self):
+        """Test histograms and measured concurrency of a stubbed batch."""
+        behavior = StubRegionBehavior(latency=LatencyDistribution.fixed(value_ms=20.0))
+        with StubBedrockEnvironment(config=StubBedrockConfig(default_behavior=behavior)) as env:
+            manager = ParallelLLMManager(
+                models=[env.model_name],
+                regions=["us-east-1", "us-west-2"],
+                parallel_config=ParallelProcessingConfig(max_concurrent_requests=4),
+            )
+            response = manager.converse_parallel(
+                requests=[
+                    BedrockConverseRequest(
+                        messages=[{"role": "user", "content": [{"text": f"hello {index}"}]}]
+                    )
+                    for index in range(12)
+                ]
+            )
+
+        stats = response.parallel_execution_stats
+        assert stats is not None and stats.latency is not None
+        latency = stats.latency
+        assert latency.request_duration.count == 12
+        assert latency.request_duration.percentile(fraction=0.5) >= 20.0
+        assert latency.queue_wait.count >= 12
+        assert 1 <= latency.peak_concurrency <= 4
+        assert stats.concurrent_executions == latency.peak_concurrency
+        assert sum(len(histogram) for histogram in latency.duration_by_region.values()) == 12
+        assert list(latency.duration_by_model) == [env.model_name]
+        assert ParallelProcessingFields.LATENCY in stats.to_dict()
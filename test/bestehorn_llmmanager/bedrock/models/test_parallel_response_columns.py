@@ -0,0 +1,252 @@
+"""
+Tests for the columnar summary behind the ParallelResponse analytics.
+"""
+
+import random
+import time
+from typing import Any, Callable, Dict
+from unittest.mock import patch
+
+import pytest
+
+from bestehorn_llmmanager.bedrock.models.bedrock_response import BedrockResponse
+from bestehorn_llmmanager.bedrock.models.parallel_structures import (
+    CategoricalColumn,
+    ParallelResponse,
+    ParallelResponseColumns,
+)
+
+ACCESS_METHODS = ["direct", "regional_cris", "global_cris", None]
+REGIONS = ["us-east-1", "us-west-2", "eu-west-1"]
+BENCHMARK_RESPONSES = 50_000
+BENCHMARK_ROUNDS = 3
+# Once the columns are built, the analytics calls run about 8x faster than walking the
+# responses; require a clear margin only
+MIN_SPEEDUP = 3.0
+
+
+def make_response(rng: random.Random, index: int) -> BedrockResponse:
+    """Create a random successful or failed response."""
+    access_method = rng.choice(ACCESS_METHODS)
+    profile_used = access_method in ("regional_cris", "global_cris")
+    removed = ["topK"] if index % 7 == 0 else None
+    usage = {
+        "inputTokens": rng.randint(1, 500),
+        "outputTokens": rng.randint(1, 200),
+        "totalTokens": rng.randint(1, 700),
+        "cacheReadInputTokens": rng.choice([0, 0, rng.randint(1, 400)]),
+        "cacheWriteInputTokens": rng.choice([0, rng.randint(1, 400)]),
+    }
+    response_data: Dict[str, Any] = {"usage": usage}
+    if index % 5:
+        response_data["metrics"] = {"latencyMs": rng.randint(50, 2000)}
+    return BedrockResponse(
+        success=index % 9 != 0,
+        response_data=response_data,
+        model_used=rng.choice(["Claude Haiku 4.5", "Nova Pro"]),
+        region_used=rng.choice(REGIONS),
+        access_method_used=access_method,
+        inference_profile_used=profile_used,
+        inference_profile_id=f"us.model-{index % 3}" if profile_used and index % 4 else None,
+        parameters_removed=removed,
+        original_additional_fields={"topK": 5} if index % 3 == 0 else None,
+    )
+
+
+def make_parallel_response(count: int, seed: int = 7) -> ParallelResponse:
+    """Create a parallel response with random responses."""
+    rng = random.Random(seed)
+    return ParallelResponse(
+        success=True,
+        request_responses={f"req-{i}": make_response(rng=rng, index=i) for i in range(count)},
+    )
+
+
+def reference_analytics(parallel_response: ParallelResponse) -> Dict[str, Any]:
+    """Compute the analytics by walking the responses one by one."""
+    successful = parallel_response.get_successful_responses()
+    tokens = dict.fromkeys(
+        [
+            "input_tokens",
+            "output_tokens",
+            "total_tokens",
+            "cache_read_tokens",
+            "cache_write_tokens",
+        ],
+        0,
+    )
+    latencies = []
+    for response in successful.values():
+        for key, value in (response.get_usage() or {}).items():
+            tokens[key] += value
+        metrics = response.get_metrics() or {}
+        if "api_latency_ms" in metrics:
+            latencies.append(metrics["api_latency_ms"])
+    hits = sum(1 for response in successful.values() if response.get_cache_read_tokens() > 0)
+    access_methods: Dict[str, int] = {}
+    for response in parallel_response.request_responses.values():
+        if response.access_method_used:
+            access_methods[response.access_method_used] = (
+                access_methods.get(response.access_method_used, 0) + 1
+            )
+    return {
+        "tokens": tokens,
+        "average_latency": sum(latencies) / len(latencies) if latencies else None,
+        "cache_hits": hits,
+        "access_methods": access_methods,
+        "profile_count": sum(
+            1
+            for response in parallel_response.request_responses.values()
+            if response.access_method_used and response.inference_profile_used
+        ),
+        "profiles": {
+            req_id: response.inference_profile_id
+            for req_id, response in parallel_response.request_responses.items()
+            if response.inference_profile_used and response.inference_profile_id
+        },
+        "removed": {
+            req_id: response.parameters_removed
+            for req_id, response in parallel_response.request_responses.items()
+            if response.parameters_removed
+        },
+    }
+
+
+def best_time(run: Callable[[], object]) -> float:
+    """Shortest wall-clock time of several runs."""
+    timings = []
+    for _ in range(BENCHMARK_ROUNDS):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run_analytics(parallel_response: ParallelResponse) -> None:
+    """Call every columnar analytics method once."""
+    parallel_response.get_total_tokens_used()
+    parallel_response.get_cache_metrics()
+    parallel_response.get_average_latency()
+    parallel_response.get_access_method_statistics()
+    parallel_response.get_parameter_compatibility_summary()
+    parallel_response.get_profile_usage_details()
+
+
+class TestCategoricalColumn:
+    """Test cases for CategoricalColumn."""
+
+    def test_values_are_dictionary_encoded(self):
+        """Test that each distinct value is stored once."""
+        column = CategoricalColumn()
+        for value in ["a", "b", None, "a", "a"]:
+            column.append(value)
+
+        assert column.categories == ["a", "b", None]
+        assert list(column.codes) == [0, 1, 2, 0, 0]
+        assert [column[row] for row in range(len(column))] == ["a", "b", None, "a", "a"]
+        assert column.value_counts() == {"a": 3, "b": 1, None: 1}
+
+
+class TestParallelResponseColumns:
+    """Test cases for the columnar ParallelResponse analytics."""
+
+    def test_columns_match_responses(self):
+        """Test that rows hold the values of their responses."""
+        parallel_response = make_parallel_response(count=30)
+
+        columns = ParallelResponseColumns.from_responses(
+            request_responses=parallel_response.request_responses
+        )
+
+        assert len(columns) == 30
+        for row, (req_id, response) in enumerate(parallel_response.request_responses.items()):
+            usage = response.get_usage() or {}
+            assert columns.request_ids[row] == req_id
+            assert columns.success[row] == response.success
+            assert columns.input_tokens[row] == usage.get("input_tokens", 0)
+            assert columns.regions[row] == response.region_used
+            assert columns.access_methods[row] == response.access_method_used
+
+    def test_analytics_match_reference(self):
+        """Test that columnar analytics equal a per-response computation."""
+        parallel_response = make_parallel_response(count=200)
+        expected = reference_analytics(parallel_response=parallel_response)
+
+        access_stats = parallel_response.get_access_method_statistics()
+        cache_metrics = parallel_response.get_cache_metrics()
+        profile_details = parallel_response.get_profile_usage_details()
+        summary = parallel_response.get_parameter_compatibility_summary()
+
+        assert parallel_response.get_total_tokens_used() == expected["tokens"]
+        assert parallel_response.get_average_latency() == pytest.approx(expected["average_latency"])
+        assert cache_metrics.total_cache_hits == expected["cache_hits"]
+        assert cache_metrics.cache_savings_tokens == expected["tokens"]["cache_read_tokens"]
+        assert access_stats["access_method_breakdown"] == expected["access_methods"]
+        assert access_stats["profile_usage_count"] == expected["profile_count"]
+        assert profile_details["profile_usage_by_request"] == expected["profiles"]
+        assert sorted(profile_details["profile_ids_used"]) == sorted(
+            set(expected["profiles"].values())
+        )
+        assert parallel_response.get_requests_with_removed_parameters() == expected["removed"]
+        assert summary["affected_request_ids"] == list(expected["removed"])
+        assert parallel_response.get_success_rate() == pytest.approx(
+            100.0 * len(parallel_response.get_successful_responses()) / 200
+        )
+
+    def test_responses_are_walked_once(self):
+        """Test that repeated analytics calls reuse the columns."""
+        parallel_response = make_parallel_response(count=50)
+        successful = len(parallel_response.get_successful_responses())
+
+        with patch.object(
+            BedrockResponse, "get_usage", autospec=True, side_effect=BedrockResponse.get_usage
+        ) as get_usage:
+            for _ in range(3):
+                run_analytics(parallel_response=parallel_response)
+
+        assert get_usage.call_count == successful
+
+    def test_columns_are_rebuilt_when_responses_change(self):
+        """Test that added, replaced or invalidated responses are picked up."""
+        parallel_response = make_parallel_response(count=10)
+        columns = parallel_response.get_columns()
+
+        parallel_response.request_responses["extra"] = BedrockResponse(success=False)
+        assert len(parallel_response.get_columns()) == 11
+
+        parallel_response.request_responses = {}
+        assert len(parallel_response.get_columns()) == 0
+        assert parallel_response.get_average_latency() is None
+
+        parallel_response.request_responses = {"a": BedrockResponse(success=False)}
+        rebuilt = parallel_response.get_columns()
+        assert parallel_response.get_columns() is rebuilt is not columns
+
+        parallel_response.request_responses["a"].success = True
+        parallel_response.invalidate_columns()
+        assert parallel_response.get_success_rate() == 100.0
+
+    def test_same_size_replacement_is_picked_up(self):
+        """Test that replacing or renaming responses without changing the size rebuilds."""
+        parallel_response = ParallelResponse(
+            success=True, request_responses={"a": BedrockResponse(success=False)}
+        )
+        assert parallel_response.get_success_rate() == 0.0
+
+        parallel_response.request_responses["a"] = BedrockResponse(success=True)
+        assert parallel_response.get_success_rate() == 100.0
+
+        retried = parallel_response.request_responses.pop("a")
+        parallel_response.request_responses["b"] = retried
+        assert parallel_response.get_columns().request_ids == ["b"]
+
+    @pytest.mark.benchmark
+    def test_repeated_analytics_benchmark(self):
+        """Guard the speedup of the columnar analytics over walking the responses."""
+        parallel_response = make_parallel_response(count=BENCHMARK_RESPONSES)
+        parallel_response.get_columns()
+
+        columnar = best_time(lambda: run_analytics(parallel_response=parallel_response))
+        walk = best_time(lambda: reference_analytics(parallel_response=parallel_response))
+
+        assert walk / columnar >= MIN_SPEEDUP, f"columnar {columnar:.3f}s, walk {walk:.3f}s"
@@ -16,6 +16,8 @@ from bestehorn_llmmanager.bedrock.models.parallel_structures import (
     ParallelExecutionStats,
     ParallelProcessingConfig,
     ParallelResponse,
+    ParallelResponseStream,
+    ParallelStatsAccumulator,
     RegionAssignment,
 )
 
@@ -570,3 +572,80 @@ class TestParallelExecutionContext:
 
         # Should be approximately 10ms (0.01 seconds)
         assert elapsed >= 5.0  # Should be at least 5ms due to our sleep
+
+
+class TestParallelStatsAccumulator:
+    """Test cases for ParallelStatsAccumulator."""
+
+    def test_empty_accumulator(self) -> None:
+        """Test stats of an accumulator with no recorded responses."""
+        stats = ParallelStatsAccumulator().to_stats()
+
+        assert stats.total_requests == 0
+        assert stats.average_request_duration_ms == 0.0
+        assert stats.region_distribution == {}
+
+    def test_record_responses(self) -> None:
+        """Test aggregation of successful and failed responses."""
+        accumulator = ParallelStatsAccumulator()
+        accumulator.record_response(
+            response=BedrockResponse(success=True, total_duration_ms=100.0),
+            assigned_regions=["us-east-1"],
+        )
+        accumulator.record_response(
+            response=BedrockResponse(success=True, total_duration_ms=300.0),
+            assigned_regions=["us-west-2"],
+        )
+        accumulator.record_response(
+            response=BedrockResponse(success=False), assigned_regions=["us-east-1"]
+        )
+        accumulator.record_concurrency(in_flight=3)
+        accumulator.record_concurrency(in_flight=1)
+
+        stats = accumulator.to_stats()
+        assert stats.total_requests == 3
+        assert stats.successful_requests == 2
+        assert stats.failed_requests_count == 1
+        assert stats.average_request_duration_ms == 200.0
+        assert stats.max_request_duration_ms == 300.0
+        assert stats.min_request_duration_ms == 100.0
+        assert stats.concurrent_executions == 3
+        assert stats.region_distribution == {"us-east-1": 2, "us-west-2": 1}
+
+
+class TestParallelResponseStream:
+    """Test cases for ParallelResponseStream."""
+
+    def test_iteration_and_stats(self) -> None:
+        """Test that the stream yields its results and exposes the accumulator's stats."""
+        accumulator = ParallelStatsAccumulator()
+
+        def results():
+            response = BedrockResponse(success=True)
+            accumulator.record_response(response=response, assigned_regions=["us-east-1"])
+            yield "req1", response
+
+        stream = ParallelResponseStream(results=results(), stats=accumulator)
+
+        assert iter(stream) is stream
+        assert [request_id for request_id, _ in stream] == ["req1"]
+        assert stream.get_execution_stats().total_requests == 1
+
+    def test_close_stops_iteration(self) -> None:
+        """Test that closing the stream closes the underlying generator."""
+        closed = []
+
+        def results():
+            try:
+                yield "req1", BedrockResponse(success=True)
+                yield "req2", BedrockResponse(success=True)
+            finally:
+                closed.append(True)
+
+        stream = ParallelResponseStream(results=results(), stats=ParallelStatsAccumulator())
+        next(stream)
+        stream.close()
+
+        assert closed == [True]
+        with pytest.raises(StopIteration):
+            next(stream)
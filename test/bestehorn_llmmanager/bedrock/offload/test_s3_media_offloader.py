@@ -0,0 +1,194 @@
+"""
+Tests for offloading large media payloads to S3.
+"""
+
+import threading
+import time
+from typing import Any, Dict, List
+
+import pytest
+
+from bestehorn_llmmanager import LLMManager
+from bestehorn_llmmanager.bedrock.models.llm_manager_constants import ConverseAPIFields
+from bestehorn_llmmanager.bedrock.models.llm_manager_structures import RetryConfig
+from bestehorn_llmmanager.bedrock.offload import S3MediaOffloader, S3OffloadConfig
+from bestehorn_llmmanager.bedrock.testing import (
+    StubBedrockConfig,
+    StubBedrockEnvironment,
+    StubRegionBehavior,
+    StubS3Client,
+)
+
+LARGE_IMAGE = b"\x89PNG\r\n\x1a\n" + b"\x00" * 4096
+SMALL_IMAGE = b"\x89PNG\r\n\x1a\n" + b"\x00" * 16
+
+
+def image_message(payload: bytes) -> Dict[str, Any]:
+    """Create a user message with a question and a PNG image."""
+    return {
+        ConverseAPIFields.ROLE: ConverseAPIFields.ROLE_USER,
+        ConverseAPIFields.CONTENT: [
+            {ConverseAPIFields.TEXT: "describe"},
+            {
+                ConverseAPIFields.IMAGE: {
+                    ConverseAPIFields.FORMAT: "png",
+                    ConverseAPIFields.SOURCE: {ConverseAPIFields.BYTES: payload},
+                }
+            },
+        ],
+    }
+
+
+def image_source(message: Dict[str, Any]) -> Dict[str, Any]:
+    """Get the image source of a message created by image_message()."""
+    return message[ConverseAPIFields.CONTENT][1][ConverseAPIFields.IMAGE][ConverseAPIFields.SOURCE]
+
+
+def make_offloader(s3_client: Any, **kwargs: Any) -> S3MediaOffloader:
+    """Create an offloader with a 1 KB threshold."""
+    config = S3OffloadConfig(s3_uri="s3://media-bucket/offload/", threshold_bytes=1024, **kwargs)
+    return S3MediaOffloader(config=config, s3_client=s3_client)
+
+
+class TestS3OffloadConfig:
+    """Test cases for S3OffloadConfig."""
+
+    def test_bucket_and_prefix(self):
+        """Test that the URI is split into bucket and key prefix."""
+        assert S3OffloadConfig(s3_uri="s3://b/x/y/").key_prefix == "x/y/"
+        assert S3OffloadConfig(s3_uri="s3://b").key_prefix == ""
+        assert S3OffloadConfig(s3_uri="s3://b/x").bucket == "b"
+
+    def test_validation(self):
+        """Test that invalid settings are rejected."""
+        with pytest.raises(ValueError):
+            S3OffloadConfig(s3_uri="https://b/x")
+        with pytest.raises(ValueError):
+            S3OffloadConfig(s3_uri="s3://b", bucket_owner="123")
+        with pytest.raises(ValueError):
+            S3OffloadConfig(s3_uri="s3://b", media_types=frozenset({"audio"}))
+
+
+class TestS3MediaOffloader:
+    """Test cases for S3MediaOffloader."""
+
+    def test_large_payload_is_uploaded_once_and_rewritten(self):
+        """Test content-addressed upload and block rewriting."""
+        s3 = StubS3Client()
+        offloader = make_offloader(s3_client=s3, bucket_owner="123456789012")
+        messages = [image_message(LARGE_IMAGE)]
+
+        first = offloader.offload_messages(messages=messages)
+        second = offloader.offload_messages(messages=[image_message(LARGE_IMAGE)])
+
+        location = image_source(first[0])[ConverseAPIFields.S3_LOCATION]
+        assert image_source(second[0])[ConverseAPIFields.S3_LOCATION] == location
+        assert location[ConverseAPIFields.BUCKET_OWNER] == "123456789012"
+        key = location[ConverseAPIFields.URI][len("s3://media-bucket/") :]
+        assert key.startswith("offload/") and key.endswith(".png")
+        assert s3.objects["media-bucket"][key] == LARGE_IMAGE
+        assert s3.put_count == 1
+        # The caller's messages are left untouched
+        assert image_source(messages[0])[ConverseAPIFields.BYTES] is LARGE_IMAGE
+        stats = offloader.get_stats()
+        assert stats.blocks_offloaded == 2 and stats.objects_uploaded == 1
+        assert stats.bytes_offloaded == 2 * len(LARGE_IMAGE)
+
+    def test_small_payloads_and_excluded_types_stay_inline(self):
+        """Test that blocks below the threshold or of excluded types are not rewritten."""
+        s3 = StubS3Client()
+        offloader = make_offloader(s3_client=s3, media_types=frozenset({"video"}))
+        messages = [image_message(SMALL_IMAGE), image_message(LARGE_IMAGE)]
+
+        result = offloader.offload_messages(messages=messages)
+
+        assert result[0] is messages[0] and result[1] is messages[1]
+        assert s3.put_count == 0
+
+    def test_existing_object_is_not_uploaded_again(self):
+        """Test that objects stored by an earlier offloader are detected with HeadObject."""
+        s3 = StubS3Client()
+        make_offloader(s3_client=s3).offload_messages(messages=[image_message(LARGE_IMAGE)])
+
+        offloader = make_offloader(s3_client=s3)
+        offloader.offload_messages(messages=[image_message(LARGE_IMAGE)])
+
+        assert s3.put_count == 1
+        assert offloader.get_stats().objects_uploaded == 0
+
+    def test_failed_upload_keeps_payload_inline(self):
+        """Test that requests still go out with inline bytes if S3 is unavailable."""
+
+        class FailingS3Client(StubS3Client):
+            def put_object(self, Bucket: str, Key: str, Body: Any, **kwargs: Any) -> Dict:
+                raise ConnectionError("S3 unreachable")
+
+        offloader = make_offloader(s3_client=FailingS3Client())
+        messages = [image_message(LARGE_IMAGE)]
+
+        assert offloader.offload_messages(messages=messages)[0] is messages[0]
+        assert offloader.get_stats().upload_failures == 1
+
+    def test_concurrent_uploads_of_same_payload_are_coalesced(self):
+        """Test that threads offloading the same payload share one upload."""
+
+        class SlowS3Client(StubS3Client):
+            def put_object(self, Bucket: str, Key: str, Body: Any, **kwargs: Any) -> Dict:
+                time.sleep(0.2)
+                return super().put_object(Bucket, Key, Body, **kwargs)
+
+        s3 = SlowS3Client()
+        offloader = make_offloader(s3_client=s3)
+        threads = [
+            threading.Thread(
+                target=offloader.offload_messages, kwargs={"messages": [image_message(LARGE_IMAGE)]}
+            )
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert s3.put_count == 1
+        assert offloader.get_stats().blocks_offloaded == 4
+
+
+class TestLLMManagerS3Offload:
+    """Test S3 offload in LLMManager against the Bedrock and S3 stubs."""
+
+    def test_requests_and_failover_retries_carry_s3_location(self):
+        """Test that converse sends the S3 location and uploads once across retries."""
+        received: List[Dict[str, Any]] = []
+
+        def responder(request: Dict[str, Any]) -> str:
+            received.append(request)
+            return "a picture"
+
+        config = StubBedrockConfig(
+            responder=responder,
+            region_behaviors={"us-east-1": StubRegionBehavior(throttle_rate=1.0)},
+        )
+        with StubBedrockEnvironment(config=config) as env:
+            manager = LLMManager(
+                models=[env.model_name],
+                regions=["us-east-1", "us-west-2"],
+                retry_config=RetryConfig(retry_delay=0.0, max_retry_delay=0.001),
+                s3_offload_config=S3OffloadConfig(s3_uri="s3://media-bucket", threshold_bytes=1024),
+            )
+            for _ in range(2):
+                response = manager.converse(messages=[image_message(LARGE_IMAGE)])
+                assert response.success and response.region_used == "us-west-2"
+
+        assert env.service.s3.put_count == 1
+        assert len(received) == 2
+        for request in received:
+            assert ConverseAPIFields.S3_LOCATION in image_source(request["messages"][0])
+        assert manager.get_s3_media_offloader().get_stats().blocks_offloaded == 2
+
+    def test_offload_disabled_by_default(self):
+        """Test that no offloader is created without configuration."""
+        with StubBedrockEnvironment() as env:
+            manager = LLMManager(models=[env.model_name], regions=["us-east-1"])
+
+        assert manager.get_s3_media_offloader() is None
@@ -0,0 +1,279 @@
+"""
+Tests for the fast parsing path of the documentation HTML parsers.
+
+The repository ships no saved documentation pages, so the fixtures are rendered from the
+bundled catalog in the layout of the AWS model and CRIS documentation pages, surrounded by
+navigation and prose markup the parsers have to skip.
+"""
+
+import time
+from html import escape
+from pathlib import Path
+from typing import Any, Callable, List
+from unittest.mock import patch
+
+import pytest
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+
+from bestehorn_llmmanager.bedrock.catalog.bundled_loader import BundledDataLoader
+from bestehorn_llmmanager.bedrock.models.cris_constants import CRISGlobalConstants
+from bestehorn_llmmanager.bedrock.parsers.base_parser import create_soup
+from bestehorn_llmmanager.bedrock.parsers.bedrock_parser import BedrockHTMLParser
+from bestehorn_llmmanager.bedrock.parsers.cris_parser import CRISHTMLParser
+from bestehorn_llmmanager.bedrock.parsers.enhanced_bedrock_parser import (
+    EnhancedBedrockHTMLParser,
+)
+
+# Roughly the amount of navigation and prose around the tables on the real pages
+FILLER_SECTIONS = 1500
+BENCHMARK_ROUNDS = 3
+# The fast path parses these fixtures about 3x faster; require a clear margin only
+MIN_SPEEDUP = 1.5
+
+MODEL_COLUMNS = [
+    "Provider",
+    "Model",
+    "Model ID",
+    "Single-region model support",
+    "Cross-region inference profile support",
+    "Input modalities",
+    "Output modalities",
+    "Streaming supported",
+    "Inference parameters",
+    "Hyperparameters",
+]
+
+
+def filler_markup(sections: int) -> str:
+    """Render navigation, prose and an unrelated table the parsers must ignore."""
+    parts = [
+        "<head><title>Supported foundation models</title>"
+        "<script>var awsdocs = {};</script><style>.nav { color: #000; }</style></head>",
+        "<body><div id='left-column'><ul class='nav'>",
+    ]
+    for index in range(sections):
+        parts.append(
+            f"<li><a href='./topic-{index}.html'>Topic {index}</a>"
+            f"<ul><li><a href='./topic-{index}-a.html'>Detail &amp; notes</a></li></ul></li>"
+        )
+    parts.append("</ul></div><div id='main-col-body'>")
+    for index in range(sections // 3):
+        parts.append(
+            f"<h2 id='section-{index}'>Section {index}</h2><p>Prose with <code>code</code>, "
+            f"<b>bold</b> and a <a href='https://aws.amazon.com/'>link</a>.</p>"
+        )
+    parts.append(
+        "<table><tr><th>Quota</th><th>Value</th></tr><tr><td>Requests</td><td>10</td></tr></table>"
+    )
+    return "".join(parts)
+
+
+def regions_cell(regions: List[str]) -> str:
+    """Render a cell with one paragraph per region."""
+    return "<td>" + "".join(f"<p>{region}</p>" for region in regions) + "</td>"
+
+
+def render_model_page(path: Path) -> Path:
+    """Render a model documentation page for the bundled catalog."""
+    catalog = BundledDataLoader.load_bundled_catalog()
+    rows = []
+    for model_name, model in catalog.models.items():
+        cris_regions = [
+            region
+            for region, access in model.region_access.items()
+            if access.has_regional_cris or access.has_global_cris
+        ]
+        rows.append(
+            "<tr>"
+            f"<td>{escape(model.provider)}</td>"
+            f"<td>{escape(model_name)}</td>"
+            f"<td><code>{escape(model.model_id)}</code></td>"
+            + regions_cell(regions=model.get_direct_access_regions())
+            + regions_cell(regions=cris_regions)
+            + f"<td>{', '.join(model.input_modalities)}</td>"
+            f"<td>{', '.join(model.output_modalities)}</td>"
+            f"<td>{'Yes' if model.streaming_supported else 'No'}</td>"
+            "<td><a href='./model-parameters.html'>Link</a></td>"
+            "<td>N/A</td>"
+            "</tr>"
+        )
+    header = "".join(f"<th>{column}</th>" for column in MODEL_COLUMNS)
+    path.write_text(
+        "<!DOCTYPE html><html>"
+        + filler_markup(sections=FILLER_SECTIONS)
+        + f"<div class='table-container'><table><thead><tr>{header}</tr></thead>"
+        + f"<tbody>{''.join(rows)}</tbody></table></div>"
+        + "</div></body></html>",
+        encoding="utf-8",
+    )
+    return path
+
+
+def render_cris_page(path: Path) -> Path:
+    """Render a CRIS documentation page with one section per bundled profile."""
+    catalog = BundledDataLoader.load_bundled_catalog()
+    profiles = {}
+    for model_name, model in catalog.models.items():
+        for region, access in model.region_access.items():
+            for profile_id in (access.regional_cris_profile_id, access.global_cris_profile_id):
+                if profile_id:
+                    profiles.setdefault(profile_id, (model_name, []))[1].append(region)
+
+    sections = []
+    for profile_id, (model_name, regions) in profiles.items():
+        prefix, _, _ = profile_id.partition(".")
+        is_global = prefix == "global"
+        destinations = (
+            f"<td><p>{CRISGlobalConstants.GLOBAL_DESTINATION_MARKER}</p></td>"
+            if is_global
+            else regions_cell(regions=regions)
+        )
+        rows = "".join(f"<tr><td>{region}</td>{destinations}</tr>" for region in regions)
+        sections.append(
+            f"<awsui-expandable-section variant='container' id='cross-region-ip-{profile_id}' "
+            f"header='{prefix.capitalize() if is_global else prefix.upper()} "
+            f"{escape(model_name)}' expanded='false'>"
+            f"<p>To call the profile, use <code>{profile_id}</code>.</p>"
+            "<div class='table-container'><div class='table-contents'><table>"
+            "<tr><th>Source Region</th><th>Destination Regions</th></tr>"
+            f"{rows}</table></div></div></awsui-expandable-section>"
+        )
+    path.write_text(
+        "<!DOCTYPE html><html>"
+        + filler_markup(sections=FILLER_SECTIONS)
+        + "".join(sections)
+        + "</div></body></html>",
+        encoding="utf-8",
+    )
+    return path
+
+
+@pytest.fixture(scope="module")
+def model_page(tmp_path_factory) -> Path:
+    """Model documentation page fixture."""
+    return render_model_page(path=tmp_path_factory.mktemp("html") / "models.htm")
+
+
+@pytest.fixture(scope="module")
+def cris_page(tmp_path_factory) -> Path:
+    """CRIS documentation page fixture."""
+    return render_cris_page(path=tmp_path_factory.mktemp("html") / "cris.htm")
+
+
+def recording_create_soup(soups: List[BeautifulSoup]) -> Callable[..., BeautifulSoup]:
+    """create_soup replacement that keeps the trees it builds."""
+
+    def record(**kwargs: Any) -> BeautifulSoup:
+        soup = create_soup(**kwargs)
+        soups.append(soup)
+        return soup
+
+    return record
+
+
+def top_level_tags(soup: BeautifulSoup) -> List[str]:
+    """Names of the elements directly below the document."""
+    return [child.name for child in soup.children if isinstance(child, Tag)]
+
+
+def best_parse_time(parse: Callable[[], object]) -> float:
+    """Shortest wall-clock time of several parses."""
+    timings = []
+    for _ in range(BENCHMARK_ROUNDS):
+        start = time.perf_counter()
+        parse()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+class TestCreateSoup:
+    """Test cases for the create_soup helper."""
+
+    def test_parse_only_keeps_matching_elements(self):
+        """Test that a strainer drops everything outside the matching elements."""
+        soup = create_soup(
+            markup="<div><p>skip</p><table><tr><td>keep</td></tr></table></div>",
+            parse_only=SoupStrainer(name="table"),
+        )
+
+        assert soup.find("p") is None
+        assert soup.get_text(strip=True) == "keep"
+
+
+class TestFastParsingEquivalence:
+    """The fast path must produce the same models as the full html.parser tree."""
+
+    @pytest.mark.parametrize("parser_class", [BedrockHTMLParser, EnhancedBedrockHTMLParser])
+    def test_model_parsers_agree(self, parser_class, model_page):
+        """Test that model parsers return identical BedrockModelInfo objects."""
+        fast = parser_class().parse(file_path=model_page)
+        full = parser_class(fast_parsing=False).parse(file_path=model_page)
+
+        assert len(fast) == len(BundledDataLoader.load_bundled_catalog().models)
+        assert fast == full
+
+    def test_cris_parser_agrees(self, cris_page):
+        """Test that the CRIS parser returns identical CRISModelInfo objects."""
+        fast = CRISHTMLParser().parse(file_path=cris_page)
+        full = CRISHTMLParser(fast_parsing=False).parse(file_path=cris_page)
+
+        assert fast
+        assert {name: model.to_dict() for name, model in fast.items()} == {
+            name: model.to_dict() for name, model in full.items()
+        }
+
+
+class TestFastParsingTree:
+    """The fast path only builds the elements the parsers read."""
+
+    def test_model_tree_keeps_only_tables(self, model_page):
+        """Test that the model page tree drops navigation and prose."""
+        soups: List[BeautifulSoup] = []
+        with patch(
+            "bestehorn_llmmanager.bedrock.parsers.bedrock_parser.create_soup",
+            side_effect=recording_create_soup(soups=soups),
+        ):
+            BedrockHTMLParser().parse(file_path=model_page)
+
+        assert len(soups) == 1
+        assert set(top_level_tags(soup=soups[0])) == {"table"}
+        assert soups[0].find(name="li") is None
+        assert soups[0].find(name="h2") is None
+
+    def test_cris_tree_keeps_only_profile_sections(self, cris_page):
+        """Test that the CRIS page tree only holds the profile sections."""
+        soups: List[BeautifulSoup] = []
+        with patch(
+            "bestehorn_llmmanager.bedrock.parsers.cris_parser.create_soup",
+            side_effect=recording_create_soup(soups=soups),
+        ):
+            CRISHTMLParser().parse(file_path=cris_page)
+
+        full_tree = BeautifulSoup(cris_page.read_text(encoding="utf-8"), "html.parser")
+        sections = full_tree.find_all(name="awsui-expandable-section")
+        assert len(soups) == 1
+        assert top_level_tags(soup=soups[0]) == ["awsui-expandable-section"] * len(sections)
+        assert soups[0].find(name="li") is None
+
+
+@pytest.mark.benchmark
+class TestFastParsingBenchmark:
+    """Parse-time comparison of the fast and full parsing paths."""
+
+    def test_model_page_benchmark(self, model_page):
+        """Guard the speedup of parsing the model documentation page."""
+        fast = best_parse_time(lambda: BedrockHTMLParser().parse(file_path=model_page))
+        full = best_parse_time(
+            lambda: BedrockHTMLParser(fast_parsing=False).parse(file_path=model_page)
+        )
+
+        assert full / fast >= MIN_SPEEDUP, f"fast {fast:.3f}s, full {full:.3f}s"
+
+    def test_cris_page_benchmark(self, cris_page):
+        """Guard the speedup of parsing the CRIS documentation page."""
+        fast = best_parse_time(lambda: CRISHTMLParser().parse(file_path=cris_page))
+        full = best_parse_time(
+            lambda: CRISHTMLParser(fast_parsing=False).parse(file_path=cris_page)
+        )
+
+        assert full / fast >= MIN_SPEEDUP, f"fast {fast:.3f}s, full {full:.3f}s"
@@ -0,0 +1,187 @@
+"""
+Tests for the client-side RPM/TPM rate limiter.
+"""
+
+from typing import List
+
+import pytest
+
+from bestehorn_llmmanager import LLMManager, ParallelLLMManager
+from bestehorn_llmmanager.bedrock.exceptions import RateLimitExceededError
+from bestehorn_llmmanager.bedrock.models.llm_manager_structures import RetryConfig
+from bestehorn_llmmanager.bedrock.models.parallel_structures import BedrockConverseRequest
+from bestehorn_llmmanager.bedrock.rate_limiting import (
+    RateLimitConfig,
+    RateLimiter,
+    RateLimitRule,
+)
+from bestehorn_llmmanager.bedrock.testing import StubBedrockEnvironment
+
+MESSAGES = [{"role": "user", "content": [{"text": "hello rate limited world"}]}]
+
+
+class FakeClock:
+    """Manually advanced clock whose sleep advances time."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: List[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def make_limiter(rule: RateLimitRule, clock: FakeClock, max_wait: float = 600.0) -> RateLimiter:
+    """Create a limiter with a single rule driven by a fake clock."""
+    return RateLimiter(
+        config=RateLimitConfig(rules=[rule], max_wait_seconds=max_wait),
+        clock=clock,
+        sleep_func=clock.sleep,
+    )
+
+
+class TestRateLimitConfig:
+    """Test cases for rule matching and validation."""
+
+    def test_first_matching_rule_wins(self):
+        """Test that rules match model ID and region patterns in order."""
+        config = RateLimitConfig(
+            rules=[
+                RateLimitRule(model_id="us.anthropic.*", requests_per_minute=10),
+                RateLimitRule(region="eu-*", requests_per_minute=20),
+            ]
+        )
+
+        assert config.find_rule("us.anthropic.claude-x", "eu-west-1").requests_per_minute == 10
+        assert config.find_rule("anthropic.claude-x", "eu-west-1").requests_per_minute == 20
+        assert config.find_rule("anthropic.claude-x", "us-east-1") is None
+
+    def test_validation(self):
+        """Test that non-positive limits are rejected."""
+        with pytest.raises(ValueError):
+            RateLimitRule(requests_per_minute=0)
+        with pytest.raises(ValueError):
+            RateLimitConfig(max_wait_seconds=-1)
+
+
+class TestRateLimiter:
+    """Test cases for RateLimiter admission."""
+
+    def test_requests_per_minute(self):
+        """Test that calls beyond the per-minute burst wait for the bucket to drain."""
+        clock = FakeClock()
+        limiter = make_limiter(rule=RateLimitRule(requests_per_minute=2), clock=clock)
+
+        for _ in range(3):
+            limiter.acquire(model_id="m", region="r")
+
+        assert clock.sleeps == [pytest.approx(30.0)]
+        stats = limiter.get_stats()[0]
+        assert stats.requests_admitted == 3
+        assert stats.total_wait_seconds == pytest.approx(30.0)
+
+    def test_tokens_reconciled_with_actual_usage(self):
+        """Test that refunded over-reservations let the next call through at once."""
+        clock = FakeClock()
+        limiter = make_limiter(rule=RateLimitRule(tokens_per_minute=1000), clock=clock)
+
+        permit = limiter.acquire(model_id="m", region="r", tokens=800)
+        limiter.reconcile(permit=permit, actual_tokens=100)
+        limiter.acquire(model_id="m", region="r", tokens=800)
+        assert clock.sleeps == []
+
+        limiter.acquire(model_id="m", region="r", tokens=500)
+        # 100 + 800 + 500 exceeds the 1000 token bucket by 400 tokens = 24s of quota
+        assert clock.sleeps == [pytest.approx(24.0)]
+        assert limiter.get_stats()[0].tokens_consumed == 1400
+
+    def test_wait_beyond_maximum_is_rejected(self):
+        """Test that calls that would wait too long raise without consuming quota."""
+        clock = FakeClock()
+        limiter = make_limiter(rule=RateLimitRule(requests_per_minute=1), clock=clock, max_wait=5.0)
+        limiter.acquire(model_id="m", region="r")
+
+        with pytest.raises(RateLimitExceededError) as exc_info:
+            limiter.acquire(model_id="m", region="r")
+
+        assert exc_info.value.wait_seconds == pytest.approx(60.0)
+        assert limiter.get_stats()[0].rejected_requests == 1
+        clock.now = 60.0
+        limiter.acquire(model_id="m", region="r")
+        assert clock.sleeps == []
+
+    def test_unmatched_pairs_are_not_limited(self):
+        """Test that calls no rule applies to pass without buckets or statistics."""
+        clock = FakeClock()
+        limiter = make_limiter(
+            rule=RateLimitRule(region="eu-west-1", requests_per_minute=1), clock=clock
+        )
+
+        permits = [limiter.acquire(model_id="m", region="us-east-1") for _ in range(5)]
+
+        assert not any(permit.limited for permit in permits)
+        assert limiter.get_stats() == []
+
+
+class TestLLMManagerRateLimiting:
+    """Test rate limiting in LLMManager against the Bedrock stub."""
+
+    def test_exhausted_region_fails_over_and_usage_is_reconciled(self):
+        """Test that a call over quota moves to the next region and usage is recorded."""
+        config = RateLimitConfig(
+            rules=[RateLimitRule(region="us-east-1", requests_per_minute=2, tokens_per_minute=1e6)],
+            max_wait_seconds=0.0,
+        )
+        with StubBedrockEnvironment() as env:
+            manager = LLMManager(
+                models=[env.model_name],
+                regions=["us-east-1", "us-west-2"],
+                retry_config=RetryConfig(retry_delay=0.0, max_retry_delay=0.001),
+                rate_limit_config=config,
+            )
+            regions = [manager.converse(messages=MESSAGES).region_used for _ in range(3)]
+
+        assert regions == ["us-east-1", "us-east-1", "us-west-2"]
+        stats = manager.get_rate_limiter().get_stats()
+        assert len(stats) == 1 and stats[0].region == "us-east-1"
+        assert stats[0].requests_admitted == 2 and stats[0].rejected_requests == 1
+        # Stub usage: 4 input words echoed back as 4 output words, per call
+        assert stats[0].tokens_consumed == 16
+        assert env.service.get_call_count(operation="Converse", region="us-east-1") == 2
+
+    def test_stream_reservation_is_reconciled_with_metadata_usage(self):
+        """Test that a consumed stream refunds the unused part of its reservation."""
+        config = RateLimitConfig(rules=[RateLimitRule(tokens_per_minute=1e6)])
+        with StubBedrockEnvironment() as env:
+            manager = LLMManager(
+                models=[env.model_name], regions=["us-east-1"], rate_limit_config=config
+            )
+            stream = manager.converse_stream(messages=MESSAGES, inference_config={"maxTokens": 500})
+            streamed = "".join(stream)
+
+        assert streamed == "hello rate limited world"
+        # The reservation covered maxTokens=500; the stub used 4 input and 4 output words
+        stats = manager.get_rate_limiter().get_stats()
+        assert len(stats) == 1 and stats[0].requests_admitted == 1
+        assert stats[0].tokens_consumed == 8
+
+    def test_parallel_manager_shares_limiter_across_workers(self):
+        """Test that converse_parallel worker threads draw from the same buckets."""
+        config = RateLimitConfig(rules=[RateLimitRule(requests_per_minute=600)])
+        with StubBedrockEnvironment() as env:
+            manager = ParallelLLMManager(
+                models=[env.model_name], regions=["us-east-1"], rate_limit_config=config
+            )
+            response = manager.converse_parallel(
+                requests=[
+                    BedrockConverseRequest(messages=MESSAGES, request_id=f"r{i}") for i in range(6)
+                ]
+            )
+
+        assert response.success
+        stats = manager.get_underlying_llm_manager().get_rate_limiter().get_stats()
+        assert [s.requests_admitted for s in stats] == [6]
@@ -0,0 +1,159 @@
+"""
+Tests for IncrementalJSONParser (streamed structured output).
+"""
+
+import json
+
+import pytest
+
+from bestehorn_llmmanager.bedrock.exceptions.llm_manager_exceptions import StreamingError
+from bestehorn_llmmanager.bedrock.models.bedrock_response import StreamingResponse
+from bestehorn_llmmanager.bedrock.streaming.incremental_json_parser import IncrementalJSONParser
+
+
+def _feed_in_chunks(parser, text, size):
+    """Feed ``text`` to ``parser`` in fixed-size chunks and collect completed members."""
+    completed = []
+    for start in range(0, len(text), size):
+        completed.extend(parser.feed(text[start : start + size]))
+    return completed
+
+
+def _text_event(text):
+    """Build a contentBlockDelta text event."""
+    return {"contentBlockDelta": {"delta": {"text": text}, "contentBlockIndex": 0}}
+
+
+class TestIncrementalJSONParser:
+    """IncrementalJSONParser yields top-level members as they close."""
+
+    ARRAY_DOC = [
+        {"id": 1, "text": 'tricky "quoted" ]} \\ chars'},
+        2,
+        "plain",
+        True,
+        None,
+        [1, [2, {"x": "]"}]],
+        {},
+        -1.5e3,
+    ]
+    OBJECT_DOC = {
+        "name": "Eiffel",
+        "height": 330,
+        "tags": ["tower", "paris"],
+        "meta": {"nested": {"deep": [1, 2, "}"]}},
+        "escaped\\key": "v",
+        "flag": False,
+    }
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 1000])
+    def test_array_elements_yielded_in_order(self, chunk_size):
+        parser = IncrementalJSONParser()
+        completed = _feed_in_chunks(parser, json.dumps(self.ARRAY_DOC), chunk_size)
+        assert completed == list(enumerate(self.ARRAY_DOC))
+        assert parser.is_complete()
+        assert parser.finish() == self.ARRAY_DOC
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 5, 1000])
+    def test_object_fields_yielded_in_order(self, chunk_size):
+        parser = IncrementalJSONParser()
+        completed = _feed_in_chunks(parser, json.dumps(self.OBJECT_DOC, indent=2), chunk_size)
+        assert completed == list(self.OBJECT_DOC.items())
+        assert parser.finish() == self.OBJECT_DOC
+
+    def test_container_member_emitted_when_it_closes(self):
+        parser = IncrementalJSONParser()
+        assert parser.feed('[{"a": 1') == []
+        assert parser.feed("}") == [(0, {"a": 1})]
+        assert not parser.is_complete()
+
+    def test_number_member_waits_for_delimiter(self):
+        parser = IncrementalJSONParser()
+        assert parser.feed("[12") == []
+        assert parser.feed("3, ") == [(0, 123)]
+
+    def test_escape_split_across_chunks(self):
+        parser = IncrementalJSONParser()
+        assert parser.feed('["a\\') == []
+        assert parser.feed('"b"]') == [(0, 'a"b')]
+
+    def test_partial_result_available_while_streaming(self):
+        parser = IncrementalJSONParser()
+        parser.feed('{"a": 1, "b": [')
+        assert parser.get_result() == {"a": 1}
+
+    @pytest.mark.parametrize("document", ["[]", "{}", "  [ ]  ", "\n{ }\n"])
+    def test_empty_containers(self, document):
+        parser = IncrementalJSONParser()
+        assert parser.feed(document) == []
+        assert parser.finish() == json.loads(document)
+
+    @pytest.mark.parametrize("document", ['"text"', "42", "true", "null"])
+    def test_scalar_root_available_after_finish(self, document):
+        parser = IncrementalJSONParser()
+        assert parser.feed(document) == []
+        assert not parser.is_complete()
+        assert parser.finish() == json.loads(document)
+
+    @pytest.mark.parametrize("document", ["[1,]", "[1 2]", '{"a" 1}', "{1: 2}", "[tru]", "[,]"])
+    def test_malformed_document_raises(self, document):
+        parser = IncrementalJSONParser()
+        with pytest.raises(StreamingError):
+            parser.feed(document)
+            parser.finish()
+
+    def test_trailing_data_raises(self):
+        parser = IncrementalJSONParser()
+        with pytest.raises(StreamingError):
+            parser.feed("[1] [2]")
+
+    def test_incomplete_document_raises_on_finish(self):
+        parser = IncrementalJSONParser()
+        parser.feed('[{"a": 1}, {"b"')
+        with pytest.raises(StreamingError) as exc_info:
+            parser.finish()
+        assert exc_info.value.stream_position is not None
+
+    def test_empty_stream_raises_on_finish(self):
+        with pytest.raises(StreamingError):
+            IncrementalJSONParser().finish()
+
+
+class TestStreamingResponseStructuredOutput:
+    """StreamingResponse.iter_structured_output drives the stream incrementally."""
+
+    def _make_response(self, chunks):
+        response = StreamingResponse(success=True)
+        events = [_text_event(chunk) for chunk in chunks]
+        events.append({"messageStop": {"stopReason": "end_turn"}})
+        response._set_event_stream(events)
+        return response
+
+    def test_yields_members_and_assembles_document(self):
+        response = self._make_response(['[{"id": 1},', ' {"id"', ": 2}]"])
+        assert list(response.iter_structured_output()) == [(0, {"id": 1}), (1, {"id": 2})]
+        assert response.is_streaming_complete()
+        assert response.get_structured_output() == [{"id": 1}, {"id": 2}]
+        assert response.get_structured_output() is response._json_parser.get_result()
+
+    def test_resumes_after_plain_iteration(self):
+        response = self._make_response(['{"a": 1, ', '"b": 2}'])
+        assert next(response) == '{"a": 1, '
+        assert list(response.iter_structured_output()) == [("a", 1), ("b", 2)]
+
+    def test_incomplete_document_raises(self):
+        response = self._make_response(['[{"id": 1}, {"id"'])
+        iterator = response.iter_structured_output()
+        assert next(iterator) == (0, {"id": 1})
+        with pytest.raises(StreamingError):
+            next(iterator)
+
+    def test_get_structured_output_without_incremental_parsing(self):
+        response = self._make_response(['{"a": ', "[1, 2]}"])
+        list(response)
+        assert response.get_structured_output() == {"a": [1, 2]}
+
+    def test_get_structured_output_non_json(self):
+        response = self._make_response(["not json"])
+        list(response)
+        assert response.get_structured_output() is None
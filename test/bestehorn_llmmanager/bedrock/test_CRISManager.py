@@ -475,7 +475,9 @@ class TestCRISManagerPrivateMethods:
 
         # Verify
         manager._downloader.download.assert_called_once_with(
-            url=manager.documentation_url, output_path=manager.html_output_path
+            url=manager.documentation_url,
+            output_path=manager.html_output_path,
+            defer_validators=True,
         )
 
     def test_parse_documentation(self) -> None:
@@ -346,7 +346,9 @@ class TestModelManager:
         model_manager._download_documentation()
 
         mock_downloader.download.assert_called_once_with(
-            url=model_manager.documentation_url, output_path=model_manager.html_output_path
+            url=model_manager.documentation_url,
+            output_path=model_manager.html_output_path,
+            defer_validators=True,
         )
 
     def test_parse_documentation(self, model_manager: ModelManager, mock_parser: Mock) -> None:
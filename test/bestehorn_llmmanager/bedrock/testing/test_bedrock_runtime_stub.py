@@ -0,0 +1,236 @@
+"""
+Tests for the in-process Bedrock runtime stub and the load-test benchmark suite.
+"""
+
+import random
+
+import pytest
+from botocore.exceptions import ClientError
+
+from bestehorn_llmmanager import LLMManager, ParallelLLMManager
+from bestehorn_llmmanager.bedrock.models.llm_manager_structures import RetryConfig
+from bestehorn_llmmanager.bedrock.models.parallel_structures import BedrockConverseRequest
+from bestehorn_llmmanager.bedrock.testing import (
+    BenchmarkReport,
+    BenchmarkResult,
+    BenchmarkScenario,
+    LatencyDistribution,
+    LoadBenchmark,
+    StubBedrockConfig,
+    StubBedrockEnvironment,
+    StubBedrockRuntimeClient,
+    StubBedrockService,
+    StubRegionBehavior,
+    default_scenarios,
+)
+from bestehorn_llmmanager.bedrock.testing.load_benchmark import percentile
+
+MESSAGES = [{"role": "user", "content": [{"text": "hello stub world"}]}]
+FAST_RETRY = RetryConfig(retry_delay=0.0, max_retry_delay=0.001)
+
+
+def no_sleep(seconds: float) -> None:
+    """Skip simulated latency."""
+
+
+class TestLatencyDistribution:
+    """Test cases for LatencyDistribution."""
+
+    def test_samples_within_bounds(self):
+        """Test that each distribution produces plausible samples."""
+        rng = random.Random(1)
+        assert LatencyDistribution.fixed(value_ms=5).sample_ms(rng=rng) == 5
+        uniform = [LatencyDistribution.uniform(2, 4).sample_ms(rng=rng) for _ in range(100)]
+        assert all(2 <= value <= 4 for value in uniform)
+        lognormal = [LatencyDistribution.lognormal(10, 0.5).sample_ms(rng=rng) for _ in range(500)]
+        assert 8 < sorted(lognormal)[250] < 12
+
+    def test_validation(self):
+        """Test parameter validation."""
+        with pytest.raises(ValueError):
+            LatencyDistribution(kind="normal")
+        with pytest.raises(ValueError):
+            LatencyDistribution.uniform(low_ms=5, high_ms=1)
+        with pytest.raises(ValueError):
+            StubRegionBehavior(throttle_rate=1.5)
+
+
+class TestStubClients:
+    """Test cases for the stub runtime client."""
+
+    def test_converse_response_shape(self):
+        """Test that converse answers with the echoed text and usage."""
+        client = StubBedrockRuntimeClient(service=StubBedrockService(), region="us-east-1")
+
+        response = client.converse(modelId="m", messages=MESSAGES)
+
+        assert response["output"]["message"]["content"] == [{"text": "hello stub world"}]
+        assert response["stopReason"] == "end_turn"
+        assert response["usage"]["outputTokens"] == 3
+
+    def test_stream_events(self):
+        """Test the emitted event sequence and mid-stream interruption."""
+        service = StubBedrockService(
+            config=StubBedrockConfig(
+                stream_chunks=3,
+                region_behaviors={"eu-west-1": StubRegionBehavior(stream_interruption_rate=1.0)},
+            )
+        )
+        events = list(
+            StubBedrockRuntimeClient(service=service, region="us-east-1").converse_stream(
+                messages=MESSAGES
+            )["stream"]
+        )
+
+        assert list(events[0]) == ["messageStart"]
+        deltas = [
+            e["contentBlockDelta"]["delta"]["text"] for e in events if "contentBlockDelta" in e
+        ]
+        assert len(deltas) == 3 and "".join(deltas) == "hello stub world"
+        assert [list(e)[0] for e in events[-3:]] == ["contentBlockStop", "messageStop", "metadata"]
+
+        interrupted = StubBedrockRuntimeClient(service=service, region="eu-west-1")
+        stream = iter(interrupted.converse_stream(messages=MESSAGES)["stream"])
+        next(stream)
+        next(stream)
+        with pytest.raises(ClientError):
+            next(stream)
+        assert service.get_call_count(outcome="ModelStreamErrorException") == 1
+
+    def test_injected_errors_are_reproducible(self):
+        """Test that a seeded service injects the same errors on every run."""
+
+        def outcomes() -> list:
+            service = StubBedrockService(
+                config=StubBedrockConfig(
+                    default_behavior=StubRegionBehavior(throttle_rate=0.3, failure_rate=0.2),
+                    seed=42,
+                )
+            )
+            client = StubBedrockRuntimeClient(service=service, region="us-east-1")
+            result = []
+            for _ in range(50):
+                try:
+                    client.converse(messages=MESSAGES)
+                    result.append("ok")
+                except ClientError as e:
+                    result.append(e.response["Error"]["Code"])
+            return result
+
+        first = outcomes()
+        assert first == outcomes()
+        assert {"ok", "ThrottlingException", "ServiceUnavailableException"} == set(first)
+
+
+class TestStubBedrockEnvironment:
+    """Test cases for running the managers against the stub."""
+
+    def test_llm_manager_fails_over_from_throttled_region(self):
+        """Test converse and streaming failover with per-region throttling."""
+        config = StubBedrockConfig(
+            region_behaviors={"us-east-1": StubRegionBehavior(throttle_rate=1.0)}
+        )
+        with StubBedrockEnvironment(config=config, sleep_func=no_sleep) as env:
+            manager = LLMManager(
+                models=[env.model_name],
+                regions=["us-east-1", "us-west-2"],
+                retry_config=FAST_RETRY,
+            )
+            response = manager.converse(messages=MESSAGES)
+            stream = manager.converse_stream(messages=MESSAGES)
+            streamed = "".join(stream)
+
+        assert response.success and response.region_used == "us-west-2"
+        assert response.get_content() == "hello stub world"
+        assert streamed == "hello stub world"
+        assert env.service.get_call_count(region="us-east-1", outcome="ThrottlingException") == 2
+
+    def test_parallel_manager(self):
+        """Test that ParallelLLMManager runs requests against the stub."""
+        with StubBedrockEnvironment(sleep_func=no_sleep) as env:
+            manager = ParallelLLMManager(
+                models=[env.model_name], regions=["us-east-1"], retry_config=FAST_RETRY
+            )
+            response = manager.converse_parallel(
+                requests=[
+                    BedrockConverseRequest(messages=MESSAGES, request_id=f"r{i}") for i in range(5)
+                ]
+            )
+
+        assert response.success and len(response.get_successful_responses()) == 5
+        assert env.service.get_call_count(operation="Converse") == 5
+
+    def test_control_plane_failure_injection(self):
+        """Test that a region's control-plane error fails its list calls."""
+        config = StubBedrockConfig(
+            region_behaviors={
+                "eu-west-1": StubRegionBehavior(control_plane_error="AccessDeniedException")
+            }
+        )
+        with StubBedrockEnvironment(config=config, sleep_func=no_sleep) as env:
+            LLMManager(models=[env.model_name], regions=["us-east-1", "eu-west-1"])
+
+        assert env.service.get_call_count(region="eu-west-1", outcome="success") == 0
+        assert env.service.get_call_count(region="eu-west-1", outcome="AccessDeniedException") > 0
+        assert env.service.get_call_count(operation="ListFoundationModels", outcome="success") > 0
+
+
+class TestLoadBenchmark:
+    """Test cases for the benchmark suite."""
+
+    def test_run_and_round_trip(self, tmp_path):
+        """Test that every workload produces measurements that survive JSON storage."""
+        benchmark = LoadBenchmark(config=StubBedrockConfig(seed=1), sleep_func=no_sleep)
+
+        report = benchmark.run(scenarios=default_scenarios(concurrency_levels=(2,), requests=6))
+
+        assert [r.scenario for r in report.results] == ["converse-c2", "parallel-c2", "stream-c2"]
+        for result in report.results:
+            assert result.succeeded == 6
+            assert result.throughput_rps > 0
+            assert result.latency_p99_ms >= result.latency_p50_ms >= 0
+            assert result.peak_thread_count >= 2
+            assert result.peak_memory_bytes > 0
+        assert report.results[2].time_to_first_token_p50_ms is not None
+
+        path = tmp_path / "nested" / "report.json"
+        report.save(path=path)
+        assert BenchmarkReport.load(path=path) == report
+
+    def test_compare_flags_regressions_beyond_tolerance(self):
+        """Test regression detection in both directions of 'better'."""
+
+        def report(throughput: float, p99: float) -> BenchmarkReport:
+            return BenchmarkReport(
+                results=[
+                    BenchmarkResult(
+                        scenario="converse-c1",
+                        workload="converse",
+                        concurrency=1,
+                        requests=10,
+                        succeeded=10,
+                        duration_seconds=1.0,
+                        throughput_rps=throughput,
+                        latency_p50_ms=10.0,
+                        latency_p99_ms=p99,
+                        peak_thread_count=3,
+                        peak_memory_bytes=1000,
+                    )
+                ]
+            )
+
+        baseline = report(throughput=100.0, p99=50.0)
+        assert report(throughput=95.0, p99=54.0).compare(baseline=baseline) == []
+        regressions = report(throughput=80.0, p99=70.0).compare(baseline=baseline)
+        assert [r.metric for r in regressions] == ["throughput_rps", "latency_p99_ms"]
+        assert regressions[0].relative_change == pytest.approx(-0.2)
+        assert report(throughput=200.0, p99=10.0).compare(baseline=baseline) == []
+
+    def test_percentile_and_scenario_validation(self):
+        """Test the nearest-rank percentile and scenario validation."""
+        values = [float(v) for v in range(1, 101)]
+        assert percentile(values=values, fraction=0.5) == 50.0
+        assert percentile(values=values, fraction=0.99) == 99.0
+        assert percentile(values=[], fraction=0.5) == 0.0
+        with pytest.raises(ValueError):
+            BenchmarkScenario(name="x", workload="batch", concurrency=1, requests=1)
@@ -156,6 +156,44 @@ class TestValidateRequestIds:
 
         mock_log.assert_called_once()
 
+    def test_validate_request_ids_coalesces_identical_duplicates(self):
+        """Test that identical requests sharing an ID are collapsed when coalescing."""
+        validator = RequestValidator()
+        messages = [{"role": "user", "content": [{"text": "Hello"}]}]
+        requests = [
+            BedrockConverseRequest(messages=messages, request_id="dup"),
+            BedrockConverseRequest(messages=messages, request_id="other"),
+            BedrockConverseRequest(messages=messages, request_id="dup"),
+        ]
+
+        result = validator.validate_request_ids(requests=requests, coalesce_duplicates=True)
+
+        assert [r.request_id for r in result] == ["dup", "other"]
+        assert result[0] is requests[0]
+        with pytest.raises(RequestIdCollisionError):
+            validator.validate_request_ids(requests=requests)
+
+    def test_validate_request_ids_coalescing_rejects_conflicting_duplicates(self):
+        """Test that duplicates with different content still raise when coalescing."""
+        validator = RequestValidator()
+        requests = [
+            BedrockConverseRequest(
+                messages=[{"role": "user", "content": [{"text": "Hello"}]}],
+                request_id="dup",
+                inference_config={"maxTokens": 10},
+            ),
+            BedrockConverseRequest(
+                messages=[{"role": "user", "content": [{"text": "Hello"}]}],
+                request_id="dup",
+                inference_config={"maxTokens": 20},
+            ),
+        ]
+
+        with pytest.raises(RequestIdCollisionError) as exc_info:
+            validator.validate_request_ids(requests=requests, coalesce_duplicates=True)
+
+        assert "dup" in exc_info.value.duplicated_ids
+
 
 class TestGroupRequestsById:
     """Test cases for _group_requests_by_id method."""
@@ -418,6 +456,19 @@ class TestValidateRequestStructure:
 
         assert len(errors) == 0
 
+    def test_validate_request_structure_accepts_system_cache_point(self):
+        """Test that a cache point after the system prompt is accepted."""
+        validator = RequestValidator()
+
+        request = BedrockConverseRequest(
+            messages=[{"role": "user", "content": [{"text": "Hello"}]}],
+            system=[{"text": "You are a helpful assistant"}, {"cachePoint": {"type": "default"}}],
+        )
+
+        errors = validator.validate_request_structure(request=request)
+
+        assert len(errors) == 0
+
 
 class TestValidateMessageStructure:
     """Test cases for _validate_message_structure method."""
@@ -711,3 +762,50 @@ class TestValidateBatchRequests:
             call_args = mock_info.call_args[0][0]
             assert "Batch validation completed successfully" in call_args
             assert "1 requests" in call_args
+
+
+class TestValidateStreamedRequest:
+    """Test cases for validate_streamed_request method."""
+
+    def test_validate_streamed_request_records_id(self):
+        """Test that a valid request's ID is added to the seen set."""
+        validator = RequestValidator()
+        seen_request_ids: set = set()
+
+        validator.validate_streamed_request(
+            request=BedrockConverseRequest(
+                messages=[{"role": "user", "content": [{"text": "Hello"}]}], request_id="req-1"
+            ),
+            seen_request_ids=seen_request_ids,
+        )
+
+        assert seen_request_ids == {"req-1"}
+
+    def test_validate_streamed_request_duplicate_id(self):
+        """Test that a previously seen ID raises RequestIdCollisionError."""
+        validator = RequestValidator()
+        seen_request_ids = {"req-1"}
+
+        with pytest.raises(RequestIdCollisionError) as exc_info:
+            validator.validate_streamed_request(
+                request=BedrockConverseRequest(
+                    messages=[{"role": "user", "content": [{"text": "Hello"}]}],
+                    request_id="req-1",
+                ),
+                seen_request_ids=seen_request_ids,
+            )
+
+        assert "req-1" in exc_info.value.duplicated_ids
+
+    def test_validate_streamed_request_invalid_structure(self):
+        """Test that an invalid request raises RequestValidationError."""
+        validator = RequestValidator()
+        seen_request_ids: set = set()
+
+        with pytest.raises(RequestValidationError):
+            validator.validate_streamed_request(
+                request=BedrockConverseRequest(messages=[], request_id="invalid-1"),
+                seen_request_ids=seen_request_ids,
+            )
+
+        assert seen_request_ids == set()
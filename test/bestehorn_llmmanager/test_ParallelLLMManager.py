@@ -2,13 +2,21 @@
 Tests for ParallelLLMManager class.
 """
 
+import time
 from unittest.mock import Mock, patch
 
 import pytest
 
 from bestehorn_llmmanager.bedrock.exceptions.parallel_exceptions import (
     ParallelConfigurationError,
+    ParallelExecutionError,
     ParallelProcessingError,
+    RequestIdCollisionError,
+)
+from bestehorn_llmmanager.bedrock.executors.batch_inference_executor import BatchInferenceExecutor
+from bestehorn_llmmanager.bedrock.models.batch_inference_structures import (
+    BatchInferenceConfig,
+    ExecutionBackend,
 )
 from bestehorn_llmmanager.bedrock.models.bedrock_response import BedrockResponse
 from bestehorn_llmmanager.bedrock.models.parallel_structures import (
@@ -17,6 +25,10 @@ from bestehorn_llmmanager.bedrock.models.parallel_structures import (
     LoadBalancingStrategy,
     ParallelProcessingConfig,
 )
+from bestehorn_llmmanager.bedrock.testing.batch_inference_stub import (
+    StubBedrockBatchClient,
+    StubS3Client,
+)
 from bestehorn_llmmanager.parallel_llm_manager import ParallelLLMManager
 
 
@@ -450,3 +462,318 @@ class TestParallelLLMManager:
                 assert "not specified, auto-adjusted to 3" in warning_message
                 assert "max_concurrent_requests=3" in warning_message
                 assert "available_regions=3" in warning_message
+
+
+class TestParallelLLMManagerIter:
+    """Test cases for ParallelLLMManager.converse_parallel_iter."""
+
+    @staticmethod
+    def _requests(count):
+        for index in range(count):
+            yield BedrockConverseRequest(
+                messages=[{"role": "user", "content": [{"text": f"Hello {index}"}]}],
+                request_id=f"req{index}",
+            )
+
+    @staticmethod
+    def _manager(mock_llm_manager_class, parallel_config=None):
+        mock_llm_manager = Mock()
+        mock_llm_manager.converse.return_value = BedrockResponse(success=True)
+        mock_llm_manager_class.return_value = mock_llm_manager
+        return ParallelLLMManager(
+            models=["claude-3-haiku"],
+            regions=["us-east-1", "us-west-2"],
+            parallel_config=parallel_config,
+        )
+
+    def test_converse_parallel_iter_yields_all_results(self) -> None:
+        """Test that every request is yielded and stats are aggregated."""
+        with patch("bestehorn_llmmanager.parallel_llm_manager.LLMManager") as mock_class:
+            parallel_manager = self._manager(mock_llm_manager_class=mock_class)
+
+            stream = parallel_manager.converse_parallel_iter(
+                requests=self._requests(count=12), target_regions_per_request=1
+            )
+            results = dict(stream)
+
+            assert sorted(results) == sorted(f"req{index}" for index in range(12))
+            assert all(response.success for response in results.values())
+            stats = stream.get_execution_stats()
+            assert stats.total_requests == 12
+            assert stats.success_rate == 100.0
+            assert sum(stats.region_distribution.values()) == 12
+            assert set(stats.region_distribution) == {"us-east-1", "us-west-2"}
+
+    def test_converse_parallel_iter_consumes_lazily(self) -> None:
+        """Test that requests are pulled from the iterable only as the window allows."""
+        pulled = []
+
+        def requests():
+            for request in self._requests(count=1000):
+                pulled.append(request.request_id)
+                yield request
+
+        with patch("bestehorn_llmmanager.parallel_llm_manager.LLMManager") as mock_class:
+            parallel_manager = self._manager(mock_llm_manager_class=mock_class)
+
+            stream = parallel_manager.converse_parallel_iter(
+                requests=requests(), target_regions_per_request=1, max_in_flight=4
+            )
+            assert pulled == []
+
+            next(stream)
+            stream.close()
+
+            assert len(pulled) <= 5
+
+    def test_converse_parallel_iter_duplicate_request_id(self) -> None:
+        """Test that a duplicate request ID raises when it is pulled."""
+        requests = [
+            BedrockConverseRequest(
+                messages=[{"role": "user", "content": [{"text": "Hello"}]}], request_id="dup"
+            ),
+            BedrockConverseRequest(
+                messages=[{"role": "user", "content": [{"text": "Hello"}]}], request_id="dup"
+            ),
+        ]
+
+        with patch("bestehorn_llmmanager.parallel_llm_manager.LLMManager") as mock_class:
+            parallel_manager = self._manager(mock_llm_manager_class=mock_class)
+
+            with pytest.raises(RequestIdCollisionError):
+                list(parallel_manager.converse_parallel_iter(requests=requests))
+
+    def test_converse_parallel_iter_stop_on_first_failure(self) -> None:
+        """Test that STOP_ON_FIRST_FAILURE raises after yielding the failed response."""
+        config = ParallelProcessingConfig(
+            max_concurrent_requests=1,
+            failure_handling_strategy=FailureHandlingStrategy.STOP_ON_FIRST_FAILURE,
+            enable_automatic_retry=False,
+        )
+
+        with patch("bestehorn_llmmanager.parallel_llm_manager.LLMManager") as mock_class:
+            parallel_manager = self._manager(
+                mock_llm_manager_class=mock_class, parallel_config=config
+            )
+            parallel_manager._llm_manager.converse.return_value = BedrockResponse(success=False)
+
+            stream = parallel_manager.converse_parallel_iter(requests=self._requests(count=5))
+            request_id, response = next(stream)
+
+            assert not response.success
+            with pytest.raises(ParallelExecutionError):
+                next(stream)
+
+    def test_converse_parallel_iter_stop_on_threshold(self) -> None:
+        """Test that STOP_ON_THRESHOLD is evaluated once the stream is exhausted."""
+        config = ParallelProcessingConfig(
+            max_concurrent_requests=2,
+            failure_handling_strategy=FailureHandlingStrategy.STOP_ON_THRESHOLD,
+            failure_threshold=0.5,
+            enable_automatic_retry=False,
+        )
+
+        with patch("bestehorn_llmmanager.parallel_llm_manager.LLMManager") as mock_class:
+            parallel_manager = self._manager(
+                mock_llm_manager_class=mock_class, parallel_config=config
+            )
+            parallel_manager._llm_manager.converse.return_value = BedrockResponse(success=False)
+
+            yielded = []
+            with pytest.raises(ParallelExecutionError):
+                for result in parallel_manager.converse_parallel_iter(
+                    requests=self._requests(count=4)
+                ):
+                    yielded.append(result)
+
+            assert len(yielded) == 4
+
+    def test_converse_parallel_iter_invalid_max_in_flight(self) -> None:
+        """Test that a non-positive max_in_flight is rejected."""
+        with patch("bestehorn_llmmanager.parallel_llm_manager.LLMManager") as mock_class:
+            parallel_manager = self._manager(mock_llm_manager_class=mock_class)
+
+            with pytest.raises(ParallelConfigurationError):
+                parallel_manager.converse_parallel_iter(
+                    requests=self._requests(count=1), max_in_flight=0
+                )
+
+
+class TestParallelLLMManagerBatchInference:
+    """Test cases for routing converse_parallel to Bedrock batch inference."""
+
+    @staticmethod
+    def _requests(count, extra_content=None):
+        requests = []
+        for index in range(count):
+            content = [{"text": f"Hello {index}"}]
+            if extra_content is not None:
+                content.append(extra_content)
+            requests.append(
+                BedrockConverseRequest(
+                    messages=[{"role": "user", "content": content}], request_id=f"req{index}"
+                )
+            )
+        return requests
+
+    @staticmethod
+    def _manager(
+        mock_llm_manager_class,
+        models=("claude-3-haiku",),
+        model_id="anthropic.claude-3-haiku-20240307-v1:0",
+        **kwargs,
+    ):
+        mock_llm_manager = Mock()
+        mock_llm_manager.converse.return_value = BedrockResponse(success=True)
+        mock_llm_manager_class.return_value = mock_llm_manager
+
+        config = BatchInferenceConfig(
+            role_arn="arn:aws:iam::123456789012:role/BedrockBatch",
+            s3_input_uri="s3://bucket/in",
+            s3_output_uri="s3://bucket/out",
+            model_id=model_id,
+            min_batch_size=5,
+            min_deadline_seconds=3600.0,
+        )
+        s3_client = StubS3Client()
+        executor = BatchInferenceExecutor(
+            config=config,
+            bedrock_client=StubBedrockBatchClient(s3_client=s3_client),
+            s3_client=s3_client,
+            region="us-east-1",
+            sleep_func=lambda _: None,
+        )
+        return ParallelLLMManager(
+            models=list(models),
+            regions=["us-east-1", "us-west-2"],
+            batch_inference_config=config,
+            batch_inference_executor=executor,
+            **kwargs,
+        )
+
+    def test_select_execution_backend(self) -> None:
+        """Test routing decisions based on batch size, deadline and call options."""
+        with patch("bestehorn_llmmanager.parallel_llm_manager.LLMManager") as mock_class:
+            parallel_manager = self._manager(mock_llm_manager_class=mock_class)
+
+            assert (
+                parallel_manager.select_execution_backend(request_count=5)
+                == ExecutionBackend.BATCH_INFERENCE
+            )
+            assert (
+                parallel_manager.select_execution_backend(request_count=4)
+                == ExecutionBackend.ON_DEMAND
+            )
+            assert (
+                parallel_manager.select_execution_backend(request_count=5, deadline_seconds=60)
+                == ExecutionBackend.ON_DEMAND
+            )
+            assert (
+                parallel_manager.select_execution_backend(
+                    request_count=5, response_validation_config=Mock()
+                )
+                == ExecutionBackend.ON_DEMAND
+            )
+
+    def test_request_deadline_forces_on_demand(self) -> None:
+        """Test that a request deadline closer than min_deadline_seconds avoids a job."""
+        requests = self._requests(count=6)
+        requests[2].deadline = time.time() + 60
+        with patch("bestehorn_llmmanager.parallel_llm_manager.LLMManager") as mock_class:
+            parallel_manager = self._manager(mock_llm_manager_class=mock_class)
+
+            assert (
+                parallel_manager.select_execution_backend(request_count=6, requests=requests)
+                == ExecutionBackend.ON_DEMAND
+            )
+            response = parallel_manager.converse_parallel(requests=requests)
+
+            assert response.success
+            assert parallel_manager._llm_manager.converse.call_count == 6
+            assert parallel_manager._batch_inference_executor.get_last_jobs() == []
+
+            requests[2].deadline = time.time() + 2 * 3600
+            assert (
+                parallel_manager.select_execution_backend(request_count=6, requests=requests)
+                == ExecutionBackend.BATCH_INFERENCE
+            )
+
+    def test_without_batch_config_always_on_demand(self) -> None:
+        """Test that batch inference is never selected when not configured."""
+        with patch("bestehorn_llmmanager.parallel_llm_manager.LLMManager"):
+            parallel_manager = ParallelLLMManager(models=["claude-3-haiku"], regions=["us-east-1"])
+
+            assert (
+                parallel_manager.select_execution_backend(request_count=100000)
+                == ExecutionBackend.ON_DEMAND
+            )
+
+    def test_converse_parallel_uses_batch_inference(self) -> None:
+        """Test that a large batch runs as a model invocation job."""
+        with patch("bestehorn_llmmanager.parallel_llm_manager.LLMManager") as mock_class:
+            parallel_manager = self._manager(mock_llm_manager_class=mock_class)
+
+            response = parallel_manager.converse_parallel(requests=self._requests(count=6))
+
+            assert response.success
+            assert len(response.request_responses) == 6
+            assert response.request_responses["req3"].get_content() == "Hello 3"
+            assert response.parallel_execution_stats.region_distribution == {"us-east-1": 6}
+            parallel_manager._llm_manager.converse.assert_not_called()
+
+    def test_small_batch_runs_on_demand(self) -> None:
+        """Test that a batch below min_batch_size uses on-demand requests."""
+        with patch("bestehorn_llmmanager.parallel_llm_manager.LLMManager") as mock_class:
+            parallel_manager = self._manager(mock_llm_manager_class=mock_class)
+
+            response = parallel_manager.converse_parallel(requests=self._requests(count=3))
+
+            assert response.success
+            assert parallel_manager._llm_manager.converse.call_count == 3
+
+    def test_unsupported_content_falls_back_to_on_demand(self) -> None:
+        """Test that requests batch inference cannot express run on-demand."""
+        document = {"document": {"format": "pdf", "name": "doc", "source": {"bytes": b"%PDF"}}}
+        with patch("bestehorn_llmmanager.parallel_llm_manager.LLMManager") as mock_class:
+            parallel_manager = self._manager(mock_llm_manager_class=mock_class)
+
+            response = parallel_manager.converse_parallel(
+                requests=self._requests(count=6, extra_content=document)
+            )
+
+            assert response.success
+            assert parallel_manager._llm_manager.converse.call_count == 6
+
+    @pytest.mark.parametrize(
+        "model, resolved_id",
+        [
+            ("Nova Pro", "amazon.nova-pro-v1:0"),
+            ("Llama 3.3 70B", "us.meta.llama3-3-70b-instruct-v1:0"),
+        ],
+    )
+    def test_non_anthropic_model_falls_back_to_on_demand(self, model, resolved_id) -> None:
+        """Test that no job is submitted for a model the record formatter cannot serve."""
+        with patch("bestehorn_llmmanager.parallel_llm_manager.LLMManager") as mock_class:
+            parallel_manager = self._manager(
+                mock_llm_manager_class=mock_class, models=[model], model_id=None
+            )
+            parallel_manager._llm_manager.get_model_access_info.return_value = {
+                "access_methods": ["direct"],
+                "model_id": resolved_id,
+            }
+
+            response = parallel_manager.converse_parallel(requests=self._requests(count=6))
+
+            assert response.success
+            assert parallel_manager._llm_manager.converse.call_count == 6
+            assert parallel_manager._batch_inference_executor.get_last_jobs() == []
+
+    def test_executor_requires_config(self) -> None:
+        """Test that an executor without a configuration is rejected."""
+        with patch("bestehorn_llmmanager.parallel_llm_manager.LLMManager"):
+            with pytest.raises(ParallelConfigurationError):
+                ParallelLLMManager(
+                    models=["claude-3-haiku"],
+                    regions=["us-east-1"],
+                    batch_inference_executor=Mock(),
+                )
@@ -0,0 +1,195 @@
+"""
+Tests for ConversationSession and its rolling prompt-cache management.
+"""
+
+from typing import Any, Dict, List
+
+import pytest
+
+from bestehorn_llmmanager import ConversationSession, LLMManager
+from bestehorn_llmmanager.bedrock.models.cache_structures import CacheConfig, CacheStrategy
+from bestehorn_llmmanager.bedrock.testing import StubBedrockConfig, StubBedrockEnvironment
+
+MIN_TOKENS = 100
+SYSTEM = [{"text": "rules " * 150}]
+
+
+class RecordingResponder:
+    """Stub responder that records requests and can be told to fail."""
+
+    def __init__(self) -> None:
+        """Initialize with no recorded requests."""
+        self.requests: List[Dict[str, Any]] = []
+        self.fail = False
+
+    def __call__(self, request: Dict[str, Any]) -> str:
+        """Record the request and reply with twenty tokens."""
+        if self.fail:
+            raise RuntimeError("responder failure")
+        self.requests.append(request)
+        return "reply " * 20
+
+
+def question(turn: int) -> str:
+    """User message of about sixty tokens."""
+    return f"question {turn} " + "word " * 60
+
+
+def count_cache_points(request: Dict[str, Any]) -> int:
+    """Count the cache points of a converse request."""
+    blocks = list(request.get("system", []))
+    for message in request["messages"]:
+        blocks.extend(message["content"])
+    return sum(1 for block in blocks if "cachePoint" in block)
+
+
+@pytest.fixture
+def responder() -> RecordingResponder:
+    """Responder shared by the stub and the test."""
+    return RecordingResponder()
+
+
+@pytest.fixture
+def manager(responder):
+    """LLMManager backed by a stub that simulates prompt caching."""
+    config = StubBedrockConfig(prompt_cache_min_tokens=MIN_TOKENS, responder=responder)
+    with StubBedrockEnvironment(config=config) as env:
+        yield LLMManager(models=[env.model_name], regions=["us-east-1"])
+
+
+class TestConversationSession:
+    """Test cases for ConversationSession."""
+
+    def test_rolling_cache_points(self, manager, responder):
+        """Test that each turn reads the previous prefix and writes only the new turn."""
+        session = ConversationSession(manager=manager, system=SYSTEM, min_cache_tokens=MIN_TOKENS)
+
+        responses = [session.send(content=question(turn=turn)) for turn in range(8)]
+
+        assert responses[0].get_cache_read_tokens() == 0
+        for previous, response in zip(responses, responses[1:]):
+            # The new prefix extends the previous one by one user and assistant message
+            assert response.get_cache_read_tokens() == (
+                previous.get_cache_read_tokens() + previous.get_cache_write_tokens()
+            )
+            assert response.get_cache_write_tokens() == responses[1].get_cache_write_tokens()
+            assert response.get_input_tokens() == 0
+        assert max(count_cache_points(request=request) for request in responder.requests) == 4
+        assert count_cache_points(request=responder.requests[-1]) == 4
+
+        stats = session.get_cache_stats()
+        assert stats.turns == 8
+        assert stats.cache_points == 4
+        assert stats.cache_hit_ratio > 0.75
+        assert stats.cached_prefix_tokens == responses[-1].get_usage()["total_tokens"] - 20
+
+    def test_history_has_no_cache_points(self, manager):
+        """Test that the caller's view of the conversation carries no cache points."""
+        session = ConversationSession(manager=manager, system=SYSTEM, min_cache_tokens=MIN_TOKENS)
+        session.send(content=question(turn=0))
+        session.send(content=[{"text": question(turn=1)}])
+
+        assert len(session) == 4
+        assert [message["role"] for message in session.messages] == [
+            "user",
+            "assistant",
+            "user",
+            "assistant",
+        ]
+        assert not any(
+            "cachePoint" in block for message in session.messages for block in message["content"]
+        )
+        assert session.system == SYSTEM
+
+    def test_only_new_turn_is_estimated(self, manager, monkeypatch):
+        """Test that the per-turn work does not grow with the history."""
+        estimator = manager.get_token_estimator()
+        calls: List[Dict[str, Any]] = []
+        original = estimator.estimate_block_tokens
+
+        def counting_estimate(block, model=None):
+            calls.append(block)
+            return original(block=block, model=model)
+
+        monkeypatch.setattr(estimator, "estimate_block_tokens", counting_estimate)
+        session = ConversationSession(manager=manager, min_cache_tokens=MIN_TOKENS)
+
+        per_turn = []
+        for turn in range(6):
+            before = len(calls)
+            session.send(content=question(turn=turn))
+            per_turn.append(len(calls) - before)
+
+        assert per_turn == [1] * 6
+
+    def test_short_prefixes_are_not_cached(self, manager, responder):
+        """Test that no cache point is placed before the minimum prefix is reached."""
+        session = ConversationSession(manager=manager, min_cache_tokens=10_000)
+        session.send(content="hello")
+
+        assert count_cache_points(request=responder.requests[0]) == 0
+        assert session.get_cache_stats().cache_points == 0
+
+    def test_caching_disabled(self, manager, responder):
+        """Test that max_cache_points=0 sends no cache points."""
+        session = ConversationSession(
+            manager=manager, system=SYSTEM, max_cache_points=0, min_cache_tokens=MIN_TOKENS
+        )
+        session.send(content=question(turn=0))
+        session.send(content=question(turn=1))
+
+        assert all(count_cache_points(request=request) == 0 for request in responder.requests)
+
+    def test_unwritten_cache_points_are_dropped(self, responder):
+        """Test that cache points the cache did not confirm do not take up slots."""
+        with StubBedrockEnvironment(config=StubBedrockConfig(responder=responder)) as env:
+            manager = LLMManager(models=[env.model_name], regions=["us-east-1"])
+            session = ConversationSession(manager=manager, min_cache_tokens=MIN_TOKENS // 2)
+            for turn in range(4):
+                session.send(content=question(turn=turn))
+
+        assert [count_cache_points(request=request) for request in responder.requests] == [1] * 4
+        assert session.get_cache_stats().cached_prefix_tokens == 0
+
+    def test_failed_turn_is_rolled_back(self, manager, responder):
+        """Test that a failed request leaves the conversation and cache points unchanged."""
+        session = ConversationSession(manager=manager, system=SYSTEM, min_cache_tokens=MIN_TOKENS)
+        for turn in range(5):
+            session.send(content=question(turn=turn))
+        points_before = count_cache_points(request=responder.requests[-1])
+
+        responder.fail = True
+        with pytest.raises(Exception):
+            session.send(content=question(turn=5))
+        responder.fail = False
+
+        assert len(session) == 10
+        response = session.send(content=question(turn=5))
+
+        assert response.get_cache_read_tokens() > 0
+        assert count_cache_points(request=responder.requests[-1]) == points_before
+        assert session.get_cache_stats().turns == 6
+
+    def test_manager_does_not_inject_into_session_requests(self, responder):
+        """Test that the CachePointManager leaves session requests alone."""
+        long_block = {"text": "x" * 4000}
+        cache_config = CacheConfig(enabled=True, strategy=CacheStrategy.AGGRESSIVE)
+        with StubBedrockEnvironment(config=StubBedrockConfig(responder=responder)) as env:
+            manager = LLMManager(
+                models=[env.model_name], regions=["us-east-1"], cache_config=cache_config
+            )
+            manager.converse(messages=[{"role": "user", "content": [long_block, long_block]}])
+            session = ConversationSession(manager=manager, max_cache_points=0)
+            session.send(content=[long_block, long_block])
+
+        assert count_cache_points(request=responder.requests[0]) == 1
+        assert count_cache_points(request=responder.requests[1]) == 0
+
+    def test_invalid_arguments(self, manager):
+        """Test that invalid limits and empty messages are rejected."""
+        with pytest.raises(ValueError):
+            ConversationSession(manager=manager, max_cache_points=5)
+        with pytest.raises(ValueError):
+            ConversationSession(manager=manager, min_cache_tokens=-1)
+        with pytest.raises(ValueError):
+            ConversationSession(manager=manager).send(content="")
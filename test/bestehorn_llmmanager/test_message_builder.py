@@ -25,6 +25,7 @@ from bestehorn_llmmanager.message_builder_enums import (
     RolesEnum,
     VideoFormatEnum,
 )
+from bestehorn_llmmanager.util.file_content_source import FileContentSource
 from bestehorn_llmmanager.util.file_type_detector.base_detector import DetectionResult
 
 
@@ -407,15 +408,17 @@ class TestAddLocalImageMethod:
         try:
             builder = ConverseMessageBuilder(role=RolesEnum.USER)
 
-            with patch.object(builder, "add_image_bytes") as mock_add_image:
-                mock_add_image.return_value = builder
+            result = builder.add_local_image(path_to_local_file=tmp_file_path)
 
-                result = builder.add_local_image(path_to_local_file=tmp_file_path)
-
-                assert result is builder
-                mock_add_image.assert_called_once_with(
-                    bytes=jpeg_data, format=None, filename=Path(tmp_file_path).name
-                )
+            assert result is builder
+            # The builder stores the file by reference and reads it at build time
+            stored = builder._content_blocks[0][ConverseAPIFields.IMAGE]
+            assert isinstance(
+                stored[ConverseAPIFields.SOURCE][ConverseAPIFields.BYTES], FileContentSource
+            )
+            image = builder.build()[ConverseAPIFields.CONTENT][0][ConverseAPIFields.IMAGE]
+            assert image[ConverseAPIFields.FORMAT] == "jpeg"
+            assert image[ConverseAPIFields.SOURCE][ConverseAPIFields.BYTES] == jpeg_data
         finally:
             Path(tmp_file_path).unlink(missing_ok=True)
 
@@ -585,15 +588,12 @@ class TestAddLocalVideoMethod:
         try:
             builder = ConverseMessageBuilder(role=RolesEnum.USER)
 
-            with patch.object(builder, "add_video_bytes") as mock_add_video:
-                mock_add_video.return_value = builder
+            result = builder.add_local_video(path_to_local_file=tmp_file_path)
 
-                result = builder.add_local_video(path_to_local_file=tmp_file_path)
-
-                assert result is builder
-                mock_add_video.assert_called_once_with(
-                    bytes=video_data, format=None, filename=Path(tmp_file_path).name
-                )
+            assert result is builder
+            video = builder.build()[ConverseAPIFields.CONTENT][0][ConverseAPIFields.VIDEO]
+            assert video[ConverseAPIFields.FORMAT] == "mp4"
+            assert video[ConverseAPIFields.SOURCE][ConverseAPIFields.BYTES] == video_data
         finally:
             Path(tmp_file_path).unlink(missing_ok=True)
 
@@ -638,22 +638,15 @@ class TestAddLocalDocumentMethod:
         try:
             builder = ConverseMessageBuilder(role=RolesEnum.USER)
 
-            with patch.object(builder, "add_document_bytes") as mock_add_doc:
-                mock_add_doc.return_value = builder
-
-                result = builder.add_local_document(
-                    path_to_local_file=tmp_file_path, name="Test Document"
-                )
+            result = builder.add_local_document(
+                path_to_local_file=tmp_file_path, name="Test Document"
+            )
 
-                assert result is builder
-                mock_add_doc.assert_called_once_with(
-                    bytes=pdf_data,
-                    format=None,
-                    filename=Path(tmp_file_path).name,
-                    name="Test Document",
-                    citations_enabled=False,
-                    context=None,
-                )
+            assert result is builder
+            document = builder.build()[ConverseAPIFields.CONTENT][0][ConverseAPIFields.DOCUMENT]
+            assert document[ConverseAPIFields.FORMAT] == "pdf"
+            assert document[ConverseAPIFields.NAME] == "Test Document"
+            assert document[ConverseAPIFields.SOURCE][ConverseAPIFields.BYTES] == pdf_data
         finally:
             Path(tmp_file_path).unlink(missing_ok=True)
 
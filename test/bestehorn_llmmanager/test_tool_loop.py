@@ -0,0 +1,262 @@
+"""
+Tests for run_tool_loop and its concurrent tool execution.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+
+import pytest
+
+from bestehorn_llmmanager import LLMManager, create_user_message, run_tool_loop
+from bestehorn_llmmanager.bedrock.catalog.transformer import CatalogTransformer
+from bestehorn_llmmanager.bedrock.models.llm_manager_structures import (
+    RegionOrder,
+    RetryConfig,
+    RetryStrategy,
+)
+from bestehorn_llmmanager.bedrock.testing import StubBedrockConfig, StubBedrockEnvironment
+
+TOOL_CONFIG = {
+    "tools": [
+        {"toolSpec": {"name": name, "inputSchema": {"json": {"type": "object"}}}}
+        for name in ("weather", "time", "slow", "broken")
+    ]
+}
+TOOL_SECONDS = 0.2
+REGIONS = ["us-east-1", "us-west-2"]
+MODEL_IDS = ("anthropic.claude-3-haiku-20240307-v1:0", "amazon.nova-lite-v1:0")
+
+
+def tool_use(tool_use_id: str, name: str, **tool_input: Any) -> Dict[str, Any]:
+    """Build a toolUse content block."""
+    return {"toolUse": {"toolUseId": tool_use_id, "name": name, "input": tool_input}}
+
+
+def tool_results(request: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Tool results of the last message of a request."""
+    return [
+        block["toolResult"] for block in request["messages"][-1]["content"] if "toolResult" in block
+    ]
+
+
+class ScriptedResponder:
+    """Stub responder replying with one scripted assistant turn per call."""
+
+    def __init__(self, turns: List[List[Dict[str, Any]]]) -> None:
+        """Initialize with the content blocks of each turn."""
+        self.turns = turns
+        self.requests: List[Dict[str, Any]] = []
+
+    def __call__(self, request: Dict[str, Any]) -> Any:
+        """Record the request and reply with the next turn (text once exhausted)."""
+        self.requests.append(request)
+        index = len(self.requests) - 1
+        return self.turns[index] if index < len(self.turns) else "done"
+
+
+def sleeping_tool(tool_input: Dict[str, Any]) -> str:
+    """Tool that takes TOOL_SECONDS and echoes its input."""
+    time.sleep(TOOL_SECONDS)
+    return f"sunny in {tool_input.get('city', 'nowhere')}"
+
+
+def run(responder: ScriptedResponder, tools: Dict[str, Any], **kwargs: Any):
+    """Run a tool loop against the stub and return the result and the stub environment."""
+    with StubBedrockEnvironment(config=StubBedrockConfig(responder=responder)) as env:
+        manager = LLMManager(
+            models=[env.model_name],
+            regions=REGIONS,
+            # Rotating the first region moves every call that plans its own targets
+            retry_config=RetryConfig(region_order=RegionOrder.ROTATE),
+        )
+        result = run_tool_loop(
+            manager=manager,
+            messages=[create_user_message().add_text("What is the weather?").build()],
+            tools=tools,
+            tool_config=TOOL_CONFIG,
+            **kwargs,
+        )
+    return result, env
+
+
+class TestRunToolLoop:
+    """Test cases for run_tool_loop."""
+
+    def test_tool_calls_of_a_turn_run_concurrently(self):
+        """Test that three tool calls of one turn take about as long as one."""
+        responder = ScriptedResponder(
+            turns=[[tool_use(f"t{index}", "weather", city=f"city{index}") for index in range(3)]]
+        )
+
+        result, _ = run(responder=responder, tools={"weather": sleeping_tool})
+
+        assert result.completed
+        assert result.model_calls == 2
+        assert result.get_content() == "done"
+        # Run one after another, the last call would finish after 3 * TOOL_SECONDS
+        assert max(call.duration_ms for call in result.tool_calls) < 2 * TOOL_SECONDS * 1000
+        assert [block["toolUseId"] for block in tool_results(responder.requests[1])] == [
+            "t0",
+            "t1",
+            "t2",
+        ]
+        assert tool_results(responder.requests[1])[2]["content"] == [{"text": "sunny in city2"}]
+        assert [message["role"] for message in result.messages] == [
+            "user",
+            "assistant",
+            "user",
+            "assistant",
+        ]
+
+    def test_failures_become_error_results(self):
+        """Test that raising, slow and unknown tools are reported to the model."""
+
+        def broken(tool_input: Dict[str, Any]) -> str:
+            raise RuntimeError("backend down")
+
+        def slow(tool_input: Dict[str, Any]) -> str:
+            time.sleep(2.0)
+            return "too late"
+
+        responder = ScriptedResponder(
+            turns=[
+                [
+                    {"text": "Let me check."},
+                    tool_use("a", "broken"),
+                    tool_use("b", "slow"),
+                    tool_use("c", "missing"),
+                    tool_use("d", "time"),
+                ]
+            ]
+        )
+
+        result, _ = run(
+            responder=responder,
+            tools={"broken": broken, "slow": slow, "time": lambda tool_input: 12},
+            tool_timeouts={"slow": 0.1},
+        )
+
+        assert result.tool_calls[1].duration_ms < 1000
+        results = tool_results(responder.requests[1])
+        assert [block["status"] for block in results] == ["error", "error", "error", "success"]
+        assert "backend down" in results[0]["content"][0]["text"]
+        assert "did not finish" in results[1]["content"][0]["text"]
+        assert "Unknown tool" in results[2]["content"][0]["text"]
+        assert results[3]["content"] == [{"json": {"result": 12}}]
+        assert [call.name for call in result.get_failed_tool_calls()] == [
+            "broken",
+            "slow",
+            "missing",
+        ]
+        # The assistant turn is replayed with its text and tool-use blocks
+        assert responder.requests[1]["messages"][1]["content"][0] == {"text": "Let me check."}
+
+    def test_retry_targets_are_planned_once(self, monkeypatch):
+        """Test that all turns reuse one plan and stay on the first turn's region."""
+        responder = ScriptedResponder(
+            turns=[[tool_use(f"t{turn}", "weather", city="Paris")] for turn in range(3)]
+        )
+        calls = []
+
+        def counting_plan(self, preferred_region=None):
+            calls.append(preferred_region)
+            return original(self, preferred_region=preferred_region)
+
+        original = LLMManager.plan_retry_targets
+        monkeypatch.setattr(LLMManager, "plan_retry_targets", counting_plan)
+
+        result, env = run(responder=responder, tools={"weather": sleeping_tool})
+
+        assert result.model_calls == 4
+        assert calls == [None]
+        assert {call.turn for call in result.tool_calls} == {1, 2, 3}
+        assert env.service.get_call_count(operation="Converse", region=REGIONS[0]) == 4
+
+    def test_max_turns(self):
+        """Test that the loop stops at max_turns without running the last tool calls."""
+        responder = ScriptedResponder(
+            turns=[[tool_use(f"t{turn}", "weather")] for turn in range(5)]
+        )
+
+        result, _ = run(responder=responder, tools={"weather": sleeping_tool}, max_turns=2)
+
+        assert not result.completed
+        assert result.model_calls == 2
+        assert len(result.tool_calls) == 1
+        assert result.messages[-1]["role"] == "assistant"
+
+    def test_shared_executor_and_async_tools(self):
+        """Test a caller-provided executor and coroutine tool functions."""
+        seen = []
+
+        async def async_weather(tool_input: Dict[str, Any]) -> Dict[str, Any]:
+            await asyncio.sleep(0.01)
+            seen.append(threading.current_thread().name)
+            return {"temperature": 21}
+
+        responder = ScriptedResponder(turns=[[tool_use("t0", "weather")]])
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="shared") as executor:
+            result, _ = run(
+                responder=responder, tools={"weather": async_weather}, executor=executor
+            )
+
+        assert result.tool_calls[0].content == {"temperature": 21}
+        assert seen[0].startswith("shared")
+
+    def test_invalid_arguments(self):
+        """Test that non-positive limits are rejected before any call."""
+        responder = ScriptedResponder(turns=[])
+        with pytest.raises(ValueError):
+            run(responder=responder, tools={}, max_turns=0)
+        with pytest.raises(ValueError):
+            run(responder=responder, tools={}, tool_timeouts={"weather": 0})
+
+        assert responder.requests == []
+
+
+class TestPlannedRetryTargets:
+    """Test converse calls with planned retry targets and a preferred region."""
+
+    @pytest.mark.parametrize("strategy", [RetryStrategy.REGION_FIRST, RetryStrategy.MODEL_FIRST])
+    def test_preferred_region_reorders_like_planning(self, monkeypatch, strategy):
+        """Test that preferring a region keeps the order planning with it would give."""
+        with StubBedrockEnvironment(config=StubBedrockConfig(model_ids=MODEL_IDS)):
+            models = [
+                CatalogTransformer()._extract_model_name(model_id=model_id)
+                for model_id in MODEL_IDS
+            ]
+            manager = LLMManager(
+                models=models,
+                regions=REGIONS,
+                retry_config=RetryConfig(retry_strategy=strategy),
+            )
+            used_targets = []
+            original = manager._retry_manager.execute_with_retry
+
+            def recording_execute(**kwargs):
+                used_targets.append(
+                    [(model, region) for model, region, _ in kwargs["retry_targets"]]
+                )
+                return original(**kwargs)
+
+            monkeypatch.setattr(manager._retry_manager, "execute_with_retry", recording_execute)
+
+            manager.converse(
+                messages=[create_user_message().add_text("Hello").build()],
+                retry_targets=manager.plan_retry_targets(),
+                preferred_region=REGIONS[1],
+            )
+            planned = manager.plan_retry_targets(preferred_region=REGIONS[1])
+
+        assert used_targets[0] == [(model, region) for model, region, _ in planned]
+        if strategy == RetryStrategy.REGION_FIRST:
+            # The first model keeps its priority over the second one
+            assert used_targets[0] == [
+                (models[0], REGIONS[1]),
+                (models[0], REGIONS[0]),
+                (models[1], REGIONS[1]),
+                (models[1], REGIONS[0]),
+            ]
@@ -3,16 +3,19 @@ Unit tests for FileTypeDetector.
 Tests the main file type detection functionality with comprehensive coverage.
 """
 
+import struct
 from unittest.mock import patch
 
 from bestehorn_llmmanager.message_builder_enums import DetectionMethodEnum
 from bestehorn_llmmanager.util.file_type_detector.base_detector import DetectionResult
 from bestehorn_llmmanager.util.file_type_detector.detector_constants import (
+    ContentCategories,
     DetectionConstants,
     FileExtensionConstants,
     MagicBytesConstants,
 )
 from bestehorn_llmmanager.util.file_type_detector.file_type_detector import FileTypeDetector
+from bestehorn_llmmanager.util.file_type_detector.signature_trie import DEFAULT_SIGNATURE_TRIE
 
 
 class TestFileTypeDetectorInitialization:
@@ -592,6 +595,7 @@ class TestLoggingAndMetadata:
         detector = FileTypeDetector()
 
         with (
+            patch.object(detector._logger, "isEnabledFor", return_value=True),
             patch.object(detector._logger, "debug") as mock_debug,
             patch.object(detector._logger, "info") as mock_info,
         ):
@@ -602,6 +606,20 @@ class TestLoggingAndMetadata:
             mock_debug.assert_called()
             mock_info.assert_called()
 
+    def test_log_messages_not_formatted_when_disabled(self):
+        """Test that debug and info messages are skipped below the logger's level."""
+        detector = FileTypeDetector()
+
+        with (
+            patch.object(detector._logger, "isEnabledFor", return_value=False),
+            patch.object(detector._logger, "debug") as mock_debug,
+            patch.object(detector._logger, "info") as mock_info,
+        ):
+            detector.detect_image_format(content=b"\xff\xd8\xff\xe0\x00\x10JFIF", filename="a.jpg")
+
+            mock_debug.assert_not_called()
+            mock_info.assert_not_called()
+
     def test_metadata_in_results(self):
         """Test that detection results contain appropriate metadata."""
         detector = FileTypeDetector()
@@ -704,3 +722,133 @@ class TestEdgeCases:
         result = detector.detect_document_format(content=b"unknown", filename="README.markdown")
         assert result.is_successful
         assert result.detected_format == "md"
+
+
+class TestImageDimensions:
+    """Test cases for reading image dimensions from header bytes."""
+
+    def test_png_dimensions(self):
+        """Test reading dimensions from the PNG IHDR chunk."""
+        content = (
+            MagicBytesConstants.PNG_SIGNATURE
+            + struct.pack(">I", 13)
+            + b"IHDR"
+            + struct.pack(">II", 800, 600)
+            + b"\x08\x02\x00\x00\x00"
+        )
+
+        assert FileTypeDetector().detect_image_dimensions(content=content) == (800, 600)
+
+    def test_gif_dimensions(self):
+        """Test reading dimensions from the GIF logical screen descriptor."""
+        content = b"GIF89a" + struct.pack("<HH", 320, 200) + b"\x00" * 8
+
+        assert FileTypeDetector().detect_image_dimensions(content=content) == (320, 200)
+
+    def test_jpeg_dimensions_after_app_segment(self):
+        """Test walking JPEG segments up to the start-of-frame marker."""
+        app0 = b"\xff\xe0" + struct.pack(">H", 16) + b"JFIF\x00" + b"\x00" * 9
+        sof2 = b"\xff\xc2" + struct.pack(">H", 17) + b"\x08" + struct.pack(">HH", 1080, 1920)
+        content = b"\xff\xd8" + app0 + sof2 + b"\x00" * 16
+
+        assert FileTypeDetector().detect_image_dimensions(content=content) == (1920, 1080)
+
+    def test_webp_dimensions(self):
+        """Test reading dimensions from VP8X, VP8L and VP8 chunks."""
+        detector = FileTypeDetector()
+        header = b"RIFF" + b"\x00\x00\x00\x00" + b"WEBP"
+
+        vp8x = (
+            header
+            + b"VP8X"
+            + b"\x00" * 8
+            + (1023).to_bytes(3, "little")
+            + (767).to_bytes(3, "little")
+        )
+        assert detector.detect_image_dimensions(content=vp8x) == (1024, 768)
+
+        bits = (640 - 1) | ((480 - 1) << 14)
+        vp8l = header + b"VP8L" + b"\x00" * 4 + b"\x2f" + struct.pack("<I", bits)
+        assert detector.detect_image_dimensions(content=vp8l) == (640, 480)
+
+        vp8 = header + b"VP8 " + b"\x00" * 10 + struct.pack("<HH", 300, 150)
+        assert detector.detect_image_dimensions(content=vp8) == (300, 150)
+
+    def test_unknown_or_truncated_content(self):
+        """Test that unrecognized or truncated headers yield None."""
+        detector = FileTypeDetector()
+
+        assert detector.detect_image_dimensions(content=b"not an image") is None
+        assert detector.detect_image_dimensions(content=MagicBytesConstants.PNG_SIGNATURE) is None
+        assert detector.detect_image_dimensions(content=b"\xff\xd8\xff\xe0\x00") is None
+
+
+class TestSignatureMatchingAndMemoization:
+    """Test cases for single-pass signature matching and result memoization."""
+
+    def test_trie_matches_categories_in_one_pass(self):
+        """Test that one match call reports every category a header belongs to."""
+        header = MagicBytesConstants.MP4_SIGNATURES[0] + b"\x00" * 4 + b"<html>"
+
+        matches = DEFAULT_SIGNATURE_TRIE.match(content=header)
+
+        assert [s.format for s in matches[ContentCategories.VIDEO]] == ["mp4"]
+        assert [s.format for s in matches[ContentCategories.DOCUMENT]] == ["html"]
+        assert ContentCategories.IMAGE not in matches
+
+    def test_trie_covers_all_signatures(self):
+        """Test that every magic signature constant is matched by the trie."""
+        signatures = (
+            MagicBytesConstants.JPEG_SIGNATURES
+            + MagicBytesConstants.GIF_SIGNATURES
+            + MagicBytesConstants.HTML_SIGNATURES
+            + MagicBytesConstants.MP4_SIGNATURES
+            + [
+                MagicBytesConstants.PNG_SIGNATURE,
+                MagicBytesConstants.WEBP_SIGNATURE,
+                MagicBytesConstants.PDF_SIGNATURE,
+                MagicBytesConstants.ZIP_SIGNATURE,
+                MagicBytesConstants.DOC_SIGNATURE,
+                MagicBytesConstants.MOV_SIGNATURE,
+                MagicBytesConstants.WEBM_SIGNATURE,
+            ]
+        )
+
+        for signature in signatures:
+            matches = DEFAULT_SIGNATURE_TRIE.match(content=signature + b"\x00" * 16)
+            assert any(
+                match.signature == signature for found in matches.values() for match in found
+            ), signature
+
+    def test_results_memoized_by_header_and_extension(self):
+        """Test that repeated detection reuses the result but reports the new filename."""
+        FileTypeDetector.clear_detection_cache()
+        content = MagicBytesConstants.PDF_SIGNATURE + b"1.7 body"
+        first = FileTypeDetector().detect_document_format(content=content, filename="a.pdf")
+
+        with patch.object(
+            FileTypeDetector,
+            "_detect_by_content",
+            autospec=True,
+            side_effect=FileTypeDetector._detect_by_content,
+        ) as mock_content:
+            second = FileTypeDetector().detect_document_format(content=content, filename="b.pdf")
+            other_extension = FileTypeDetector().detect_document_format(
+                content=content, filename="b.xls"
+            )
+
+        assert mock_content.call_count == 1  # only the .xls lookup missed the memo
+        assert second.detected_format == first.detected_format == "pdf"
+        assert second.filename == "b.pdf"
+        assert other_extension.filename == "b.xls"
+
+    def test_failed_detection_is_not_memoized(self):
+        """Test that failures are recomputed so their messages name the right file."""
+        FileTypeDetector.clear_detection_cache()
+        detector = FileTypeDetector()
+
+        detector.detect_image_format(content=b"unknown bytes", filename="a.bin")
+        result = detector.detect_image_format(content=b"unknown bytes", filename="b.bin")
+
+        assert not result.is_successful
+        assert "b.bin" in result.error_message
@@ -0,0 +1,49 @@
+"""
+Tests for the canonical JSON helpers.
+"""
+
+from dataclasses import dataclass
+from enum import Enum
+
+from bestehorn_llmmanager.util.canonical_json import (
+    canonical_json_dumps,
+    canonicalize_json_value,
+)
+
+
+class Color(Enum):
+    """Enum used as a request value."""
+
+    RED = "red"
+
+
+@dataclass
+class Point:
+    """Dataclass used as a request value."""
+
+    x: int
+    y: int
+
+
+class TestCanonicalJson:
+    """Test cases for canonical_json_dumps and canonicalize_json_value."""
+
+    def test_equal_content_gives_equal_text(self):
+        """Test that key order and equal binary content do not change the text."""
+        first = {"b": b"image", "a": {"tags": {"y", "x"}, "color": Color.RED}}
+        second = {"a": {"color": Color.RED, "tags": {"x", "y"}}, "b": bytearray(b"image")}
+
+        assert canonical_json_dumps(obj=first) == canonical_json_dumps(obj=second)
+        assert canonical_json_dumps(obj={"b": b"other"}) != canonical_json_dumps(
+            obj={"b": b"image"}
+        )
+
+    def test_stand_ins(self):
+        """Test the stand-ins of enums, dataclasses, sets and opaque objects."""
+        opaque = object()
+
+        assert canonicalize_json_value(value=Color.RED) == "red"
+        assert canonicalize_json_value(value=Point(x=1, y=2)) == {"x": 1, "y": 2}
+        assert canonicalize_json_value(value=frozenset({2, 1})) == [1, 2]
+        assert canonicalize_json_value(value=opaque) == canonicalize_json_value(value=opaque)
+        assert canonicalize_json_value(value=opaque) != canonicalize_json_value(value=object())
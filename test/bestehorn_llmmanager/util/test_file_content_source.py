@@ -0,0 +1,156 @@
+"""
+Tests for lazily read local file content sources.
+"""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from bestehorn_llmmanager.bedrock.exceptions.llm_manager_exceptions import RequestValidationError
+from bestehorn_llmmanager.bedrock.models.llm_manager_constants import ConverseAPIFields
+from bestehorn_llmmanager.message_builder import create_user_message
+from bestehorn_llmmanager.message_builder_constants import MessageBuilderConfig
+from bestehorn_llmmanager.message_builder_enums import DocumentFormatEnum
+from bestehorn_llmmanager.util.file_content_source import FileContentCache, FileContentSource
+
+PDF_CONTENT = b"%PDF-1.4 " + b"x" * 10_000
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Isolate tests from each other's cached sources and contents."""
+    FileContentCache.get_instance().clear()
+    yield
+    FileContentCache.get_instance().clear()
+
+
+def document_bytes(message):
+    """Get the document bytes of a built single-document message."""
+    document = message[ConverseAPIFields.CONTENT][0][ConverseAPIFields.DOCUMENT]
+    return document[ConverseAPIFields.SOURCE][ConverseAPIFields.BYTES]
+
+
+class TestFileContentSource:
+    """Test cases for FileContentSource hashing and reading."""
+
+    def test_unchanged_file_is_hashed_once(self, tmp_path: Path):
+        """Test that re-attaching an unchanged file reuses its source."""
+        path = tmp_path / "report.pdf"
+        path.write_bytes(PDF_CONTENT)
+
+        first = FileContentSource.from_file(path=path, stat_result=path.stat())
+        with patch("bestehorn_llmmanager.util.file_content_source._hash_file") as mock_hash:
+            second = FileContentSource.from_file(path=path, stat_result=path.stat())
+
+        mock_hash.assert_not_called()
+        assert second is first
+        assert len(first) == len(PDF_CONTENT)
+        assert first.header == PDF_CONTENT[: len(first.header)]
+
+    def test_identical_files_share_one_buffer(self, tmp_path: Path):
+        """Test that sources of identical content materialize the same bytes object."""
+        paths = [tmp_path / "a.pdf", tmp_path / "b.pdf"]
+        for path in paths:
+            path.write_bytes(PDF_CONTENT)
+
+        sources = [FileContentSource.from_file(path=p, stat_result=p.stat()) for p in paths]
+
+        assert sources[0].digest == sources[1].digest
+        assert sources[0].read() is sources[1].read()
+        stats = FileContentCache.get_instance().get_stats()
+        assert stats["contents"] == 1 and stats["hits"] == 1 and stats["misses"] == 1
+
+    def test_modified_file_is_rejected(self, tmp_path: Path):
+        """Test that a file changed between attaching and building is not sent."""
+        path = tmp_path / "report.pdf"
+        path.write_bytes(PDF_CONTENT)
+        source = FileContentSource.from_file(path=path, stat_result=path.stat())
+
+        path.write_bytes(PDF_CONTENT + b"appended")
+
+        with pytest.raises(RequestValidationError, match="changed after it was added"):
+            source.read()
+
+    def test_same_size_rewrite_keeping_mtime_is_rejected(self, tmp_path: Path):
+        """Test that content changed under an unchanged size and mtime is not cached."""
+        path = tmp_path / "report.pdf"
+        path.write_bytes(PDF_CONTENT)
+        stat_result = path.stat()
+        source = FileContentSource.from_file(path=path, stat_result=stat_result)
+
+        path.write_bytes(PDF_CONTENT.replace(b"x", b"y"))
+        os.utime(path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns))
+
+        with pytest.raises(RequestValidationError, match="changed after it was added"):
+            source.read()
+        assert FileContentCache.get_instance().get_stats()["contents"] == 0
+
+    def test_cache_respects_size_budget(self, tmp_path: Path):
+        """Test that contents beyond the budget are read but not retained."""
+        cache = FileContentCache.get_instance()
+        cache.set_max_bytes(max_bytes=len(PDF_CONTENT) - 1)
+        try:
+            path = tmp_path / "report.pdf"
+            path.write_bytes(PDF_CONTENT)
+            source = FileContentSource.from_file(path=path, stat_result=path.stat())
+
+            assert source.read() == PDF_CONTENT
+            assert cache.get_stats()["cached_bytes"] == 0
+        finally:
+            cache.set_max_bytes(max_bytes=MessageBuilderConfig.FILE_CONTENT_CACHE_MAX_BYTES)
+
+
+class TestMessageBuilderLocalFiles:
+    """Test lazy local file ingestion through ConverseMessageBuilder."""
+
+    def test_file_is_read_at_build_time(self, tmp_path: Path):
+        """Test that the builder holds a reference until build()."""
+        path = tmp_path / "report.pdf"
+        path.write_bytes(PDF_CONTENT)
+
+        with patch.object(FileContentSource, "read", autospec=True) as mock_read:
+            mock_read.return_value = PDF_CONTENT
+            builder = create_user_message().add_local_document(path_to_local_file=str(path))
+            mock_read.assert_not_called()
+
+            message = builder.build()
+
+        mock_read.assert_called_once()
+        assert document_bytes(message) == PDF_CONTENT
+
+    def test_repeated_attachments_share_one_buffer(self, tmp_path: Path):
+        """Test that many messages attaching the same file reference one bytes object."""
+        path = tmp_path / "report.pdf"
+        path.write_bytes(PDF_CONTENT)
+
+        messages = [
+            create_user_message()
+            .add_local_document(path_to_local_file=str(path), format=DocumentFormatEnum.PDF)
+            .build()
+            for _ in range(5)
+        ]
+
+        buffers = {id(document_bytes(message)) for message in messages}
+        assert len(buffers) == 1
+        assert document_bytes(messages[0]) == PDF_CONTENT
+
+    def test_empty_file_is_rejected(self, tmp_path: Path):
+        """Test that empty local files are rejected when added."""
+        path = tmp_path / "empty.pdf"
+        path.write_bytes(b"")
+
+        with pytest.raises(RequestValidationError, match="cannot be empty"):
+            create_user_message().add_local_document(path_to_local_file=str(path))
+
+    def test_unreadable_file_at_build_time(self, tmp_path: Path):
+        """Test that a file removed before build() raises RequestValidationError."""
+        path = tmp_path / "report.pdf"
+        path.write_bytes(PDF_CONTENT)
+        builder = create_user_message().add_local_document(path_to_local_file=str(path))
+
+        os.remove(path)
+
+        with pytest.raises(RequestValidationError, match="Failed to read document file"):
+            builder.build()
@@ -0,0 +1,168 @@
+"""
+Tests for the image downscale/transcode stage.
+"""
+
+import io
+from pathlib import Path
+
+import pytest
+
+from bestehorn_llmmanager.bedrock.exceptions.llm_manager_exceptions import RequestValidationError
+from bestehorn_llmmanager.bedrock.models.llm_manager_constants import ConverseAPIFields
+from bestehorn_llmmanager.message_builder import create_user_message
+from bestehorn_llmmanager.message_builder_enums import ImageFormatEnum
+from bestehorn_llmmanager.util.file_content_source import FileContentCache
+from bestehorn_llmmanager.util.image_preprocessor import (
+    ImagePreprocessingConfig,
+    ImagePreprocessor,
+)
+
+Image = pytest.importorskip("PIL.Image")
+
+EXIF_ORIENTATION = 0x0112
+EXIF_MAKE = 0x010F
+
+
+def encode_image(size, mode="RGB", format="JPEG", **save_kwargs) -> bytes:
+    """Encode a solid-color image."""
+    buffer = io.BytesIO()
+    Image.new(mode, size).save(buffer, format=format, **save_kwargs)
+    return buffer.getvalue()
+
+
+def camera_jpeg() -> bytes:
+    """A 4000x3000 JPEG with camera metadata and a 90 degree orientation tag."""
+    exif = Image.Exif()
+    exif[EXIF_ORIENTATION] = 6
+    exif[EXIF_MAKE] = "Camera"
+    return encode_image(size=(4000, 3000), exif=exif)
+
+
+class TestImagePreprocessingConfig:
+    """Test cases for ImagePreprocessingConfig validation."""
+
+    def test_validation(self):
+        """Test that invalid settings are rejected."""
+        with pytest.raises(ValueError):
+            ImagePreprocessingConfig(max_edge_pixels=0)
+        with pytest.raises(ValueError):
+            ImagePreprocessingConfig(output_format=ImageFormatEnum.GIF)
+        with pytest.raises(ValueError):
+            ImagePreprocessingConfig(quality=100)
+
+
+class TestImagePreprocessor:
+    """Test cases for ImagePreprocessor."""
+
+    def test_downscales_rotates_and_strips_metadata(self):
+        """Test that a camera image is oriented, shrunk, re-encoded and stripped."""
+        content = camera_jpeg()
+
+        result = ImagePreprocessor().preprocess(content=content)
+
+        assert (result.original_width, result.original_height) == (4000, 3000)
+        assert (result.width, result.height) == (928, 1238)
+        assert result.width * result.height <= 1_150_000
+        assert result.format == ImageFormatEnum.WEBP
+        assert result.size < len(content)
+        with Image.open(io.BytesIO(result.content)) as decoded:
+            assert decoded.format == "WEBP"
+            assert decoded.size == (928, 1238)
+            assert len(decoded.getexif()) == 0
+
+    def test_long_edge_limit(self):
+        """Test that the longer edge is bounded by max_edge_pixels."""
+        preprocessor = ImagePreprocessor(
+            config=ImagePreprocessingConfig(max_edge_pixels=1000, output_format=ImageFormatEnum.PNG)
+        )
+
+        result = preprocessor.preprocess(content=encode_image(size=(3000, 100), format="PNG"))
+
+        assert (result.width, result.height) == (1000, 33)
+        assert result.format == ImageFormatEnum.PNG
+
+    def test_transparent_image_flattened_for_jpeg(self):
+        """Test that images with alpha are flattened when the output has no alpha."""
+        preprocessor = ImagePreprocessor(
+            config=ImagePreprocessingConfig(output_format=ImageFormatEnum.JPEG)
+        )
+
+        result = preprocessor.preprocess(
+            content=encode_image(size=(64, 64), mode="RGBA", format="PNG")
+        )
+
+        with Image.open(io.BytesIO(result.content)) as decoded:
+            assert decoded.format == "JPEG" and decoded.mode == "RGB"
+            assert decoded.getpixel((0, 0)) == (255, 255, 255)
+
+    def test_results_are_cached_and_idempotent(self):
+        """Test that repeated and already preprocessed inputs are cache hits."""
+        preprocessor = ImagePreprocessor()
+        content = camera_jpeg()
+
+        first = preprocessor.preprocess(content=content)
+
+        assert preprocessor.preprocess(content=content) is first
+        assert preprocessor.preprocess(content=first.content) is first
+        assert preprocessor.get_stats()["hits"] == 2
+
+    def test_batch_uses_process_pool_and_preserves_order(self):
+        """Test batch preprocessing of distinct and duplicate images."""
+        preprocessor = ImagePreprocessor()
+        contents = [
+            encode_image(size=(2000, 1000)),
+            encode_image(size=(100, 200), format="PNG"),
+            encode_image(size=(2000, 1000)),
+            encode_image(size=(300, 300), mode="L", format="GIF"),
+        ]
+
+        results = preprocessor.preprocess_batch(contents=contents, max_workers=2)
+
+        assert [(r.width, r.height) for r in results] == [
+            (1516, 758),
+            (100, 200),
+            (1516, 758),
+            (300, 300),
+        ]
+        assert results[0] is results[2]
+        assert preprocessor.get_stats()["misses"] == 3
+
+    def test_invalid_image(self):
+        """Test that undecodable content raises RequestValidationError."""
+        with pytest.raises(RequestValidationError, match="Failed to preprocess image"):
+            ImagePreprocessor().preprocess(content=b"not an image")
+
+
+class TestMessageBuilderImagePreprocessing:
+    """Test image preprocessing through ConverseMessageBuilder."""
+
+    def test_added_images_are_preprocessed(self, tmp_path: Path):
+        """Test that image bytes and local images are replaced by preprocessed images."""
+        FileContentCache.get_instance().clear()
+        path = tmp_path / "photo.jpg"
+        path.write_bytes(camera_jpeg())
+        preprocessor = ImagePreprocessor()
+
+        message = (
+            create_user_message(image_preprocessor=preprocessor)
+            .add_image_bytes(bytes=camera_jpeg(), format=ImageFormatEnum.JPEG)
+            .add_local_image(path_to_local_file=str(path))
+            .build()
+        )
+
+        images = [block[ConverseAPIFields.IMAGE] for block in message[ConverseAPIFields.CONTENT]]
+        for image in images:
+            assert image[ConverseAPIFields.FORMAT] == "webp"
+        sources = [image[ConverseAPIFields.SOURCE][ConverseAPIFields.BYTES] for image in images]
+        assert sources[0] is sources[1]
+        assert preprocessor.get_stats()["misses"] == 1
+
+    def test_builder_without_preprocessor_keeps_bytes(self):
+        """Test that images are passed through unchanged by default."""
+        content = encode_image(size=(64, 64))
+
+        message = create_user_message().add_image_bytes(bytes=content).build()
+
+        image = message[ConverseAPIFields.CONTENT][0][ConverseAPIFields.IMAGE]
+        assert image[ConverseAPIFields.SOURCE][ConverseAPIFields.BYTES] is content
+        assert image[ConverseAPIFields.FORMAT] == "jpeg"
@@ -95,6 +95,12 @@ def pytest_addoption(parser: Any) -> None:
         default=False,
         help="Run tests that make real AWS Bedrock API calls (may incur costs)",
     )
+    parser.addoption(
+        "--run-benchmarks",
+        action="store_true",
+        default=False,
+        help="Run the wall-clock benchmarks marked with 'benchmark' (deselected by default)",
+    )
 
 
 def pytest_configure(config: Any) -> None:
@@ -116,6 +122,9 @@ def pytest_configure(config: Any) -> None:
     config.addinivalue_line("markers", "unit: Unit tests")
     config.addinivalue_line("markers", "integration: Integration tests")
     config.addinivalue_line("markers", "slow: Slow running tests")
+    config.addinivalue_line(
+        "markers", "benchmark: Wall-clock benchmarks, only run with --run-benchmarks"
+    )
     config.addinivalue_line("markers", "network: Tests requiring network access")
     config.addinivalue_line("markers", "aws: Tests requiring AWS access")
     config.addinivalue_line(
@@ -130,3 +139,14 @@ def pytest_configure(config: Any) -> None:
     config.addinivalue_line("markers", "aws_high_cost: High-cost tests (> $0.10 estimated)")
     config.addinivalue_line("markers", "aws_bedrock_runtime: Tests using Bedrock Runtime API")
     config.addinivalue_line("markers", "aws_streaming: Tests using streaming responses")
+
+
+def pytest_collection_modifyitems(config: Any, items: List[Any]) -> None:
+    """Deselect the timing benchmarks unless --run-benchmarks is given."""
+    if config.getoption("--run-benchmarks"):
+        return
+
+    benchmarks = [item for item in items if item.get_closest_marker("benchmark")]
+    if benchmarks:
+        items[:] = [item for item in items if not item.get_closest_marker("benchmark")]
+        config.hook.pytest_deselected(items=benchmarks)